@@ -3,23 +3,61 @@
 #include <sstream>
 #define min(a,b) ((a)<(b) ? (a) : (b))
 
-SOM::SOM( const SOM& copy ) : C_pools(copy.C_pools),N(copy.N)	, CNmin(15.0), CNmax(40.0)
+double SOM::CNmin = 15.0;
+double SOM::CNmax = 40.0;
+
+void SOM::set_CN_range( double CNmin, double CNmax )
+{
+    if (CNmin >= CNmax)
+        throw std::runtime_error("DECOMP: CNmin needs to be smaller than CNmax");
+    SOM::CNmin = CNmin;
+    SOM::CNmax = CNmax;
+}
+
+void SOM::allocate( int size )
+{
+    n_pools = size;
+    heap_pools = size > DECOMP_INLINE_POOLS ? new double[size] : 0;
+    std::fill(pools(), pools() + size, 0.0);
+}
+
+void SOM::check_size( const SOM& other ) const
+{
+    if (other.n_pools != n_pools)
+        throw std::runtime_error("DECOMP: Pool size arrays of the SOM objects are out of sync!");
+}
+
+SOM::SOM( const SOM& copy ) : N(copy.N)
+{
+    allocate(copy.n_pools);
+    std::copy(copy.pools(), copy.pools() + n_pools, pools());
+}
+
+SOM::~SOM()
 {
+    delete[] heap_pools;
 }
 
 SOM& SOM::operator=( const SOM& copy )
 {
-    C_pools=copy.C_pools;
-    N=copy.N;
-    CNmin=copy.CNmin;
-    CNmax=copy.CNmax;
+    if (this != &copy)
+    {
+        if (copy.n_pools != n_pools)
+        {
+            delete[] heap_pools;
+            allocate(copy.n_pools);
+        }
+        std::copy(copy.pools(), copy.pools() + n_pools, pools());
+        N=copy.N;
+    }
     return *this;
 }
 
 SOM::SOM(double N, double EDC,double CELL, double LIGN, double RC, double DOC )
-: N(N), CNmin(15.0), CNmax(40.0)
+: N(N)
 {
-    C_pools.resize(SOMcomponent::count);
+    allocate(SOMcomponent::count);
+    double* C_pools = pools();
     C_pools[0]=EDC;
     C_pools[1]=LIGN;
     C_pools[2]=CELL;
@@ -27,6 +65,11 @@ SOM::SOM(double N, double EDC,double CELL, double LIGN, double RC, double DOC )
     C_pools[4]=DOC;
 }
 
+size_t SOM::get_nbytes() const
+{
+    return sizeof(SOM) + (heap_pools ? n_pools * sizeof(double) : 0);
+}
+
 SOM SOM::dCdt( double T, double wetness, double pH, double Nsol ) const
 {
     SOM dispatch;
@@ -37,10 +80,10 @@ SOM SOM::dCdt( double T, double wetness, double pH, double Nsol ) const
         const SOMcomponent& comp=*it;
 
         double decomp_comp = self.get_C_pool(comp.Id) > 0 ? self.get_C_pool(comp.Id) * comp.decomp(T,wetness,pH) : 0.0;
-        component_set products=comp.get_products();
-        for(component_set::iterator p_it=products.begin();p_it!=products.end();++p_it)
+        const SOMcomponent::product_map& products=comp.get_product_map();
+        for(SOMcomponent::product_map::const_iterator p_it=products.begin();p_it!=products.end();++p_it)
         {
-            dispatch[*p_it] += decomp_comp * comp.get_product_fraction(*p_it);
+            dispatch.pools()[p_it->first] += decomp_comp * p_it->second;
         }
         decomp[comp] = decomp_comp;
     }
@@ -54,7 +97,7 @@ SOM SOM::dCdt( double T, double wetness, double pH, double Nsol ) const
             net_min = -result.get_C_pool(),
             CN = self.get_CN(),
             grossNmin = net_min/CN,
-            f_Nimmob=min(1,(CN - self.CNmin)/(self.CNmax - self.CNmin)),
+            f_Nimmob=min(1,(CN - CNmin)/(CNmax - CNmin)),
             Nimmob = grossNmin * f_Nimmob;
         result.N = Nimmob - grossNmin;
     }
@@ -68,8 +111,9 @@ SOM SOM::dCdt( double T, double wetness, double pH, double Nsol ) const
 double SOM::get_C_pool() const
 {
     double res=0.0;
-    if (C_pools.size() != pool_types.size())
+    if (size_t(n_pools) != pool_types.size())
         throw std::runtime_error("DECOMP: Pool size array and pool type array out of sync!");
+    const double* C_pools = pools();
     for(component_set::const_iterator it = pool_types.begin(); it != pool_types.end(); ++it)
         if (it->is_stored) res+= C_pools[it->Id];
     return res;
@@ -79,16 +123,16 @@ double SOM::get_C_pool() const
 
 double SOM::get_C_pool( int index ) const
 {
-    if (index>=0 && index < int(C_pools.size()))
-        return C_pools[index];
+    if (index>=0 && index < n_pools)
+        return pools()[index];
     else
         throw std::out_of_range("DECOMP: Invalid component ID");
 
 }
 void SOM::set_C_pool( int index, double pool_size )
 {
-    if (index>=0 && index < int(C_pools.size()))
-        C_pools[index] = pool_size;
+    if (index>=0 && index < n_pools)
+        pools()[index] = pool_size;
     else
         throw std::out_of_range("DECOMP: Invalid component ID");
 
@@ -101,7 +145,9 @@ double SOM::get_CN() const
 
 SOM& SOM::operator*=( double right )
 {
-    C_pools *= right;
+    double* C_pools = pools();
+    for(int i = 0; i < n_pools; ++i)
+        C_pools[i] *= right;
     N*=right;
     return *this;
 }
@@ -115,26 +161,46 @@ SOM SOM::operator*( double right ) const
 
 SOM& SOM::operator+=( const SOM& right )
 {
-    C_pools += right.C_pools;
+    check_size(right);
+    double* C_pools = pools();
+    const double* other = right.pools();
+    for(int i = 0; i < n_pools; ++i)
+        C_pools[i] += other[i];
     N  += right.N;
     return *this;
 }
 
 SOM& SOM::operator-=( const SOM& right )
 {
-    C_pools -= right.C_pools;
+    check_size(right);
+    double* C_pools = pools();
+    const double* other = right.pools();
+    for(int i = 0; i < n_pools; ++i)
+        C_pools[i] -= other[i];
     N  -= right.N;
     return *this;
 }
 
 SOM& SOM::operator/=( double right )
 {
-    C_pools /= right;
+    double* C_pools = pools();
+    for(int i = 0; i < n_pools; ++i)
+        C_pools[i] /= right;
     N  /= right;
     return *this;
 
 }
 
+void SOM::add_scaled( const SOM& som_template, double mass )
+{
+    check_size(som_template);
+    double* C_pools = pools();
+    const double* other = som_template.pools();
+    for(int i = 0; i < n_pools; ++i)
+        C_pools[i] += mass * other[i];
+    N += mass * som_template.N;
+}
+
 SOM SOM::integrate( double dt, double T, double wetness, double pH )
 {
     // Just a shortcut to this
@@ -162,6 +228,77 @@ SOM SOM::integrate( double dt, double T, double wetness, double pH )
     return rate;
 }
 
+SOM SOM::integrate_multirate( double dt, double T, double wetness, double pH, double max_turnover )
+{
+    if (max_turnover <= 0)
+        throw std::runtime_error("DECOMP: max_turnover needs to be positive");
+    const size_t n = pool_types.size();
+    const int max_substeps = 1 << 20;
+    SOM& self=*this;
+    SOM start=*this;
+
+    // Decomposition rates and the number of sub-steps for each component
+    std::vector<double> r(n);
+    std::vector<int> substeps(n);
+    int finesteps = 1;
+    for(size_t i = 0; i < n; ++i)
+    {
+        r[i] = pool_types[i].decomp(T,wetness,pH);
+        int m = 1;
+        while (r[i] * dt / m > max_turnover && m < max_substeps)
+            m *= 2;
+        substeps[i] = m;
+        finesteps = std::max(finesteps, m);
+    }
+
+    std::vector<double> decomposed(n);
+    double* C_pools = pools();
+    for(int s = 0; s < finesteps; ++s)
+    {
+        // Decomposition of all components that take a step now, from the state at the start of the fine step
+        for(size_t i = 0; i < n; ++i)
+        {
+            decomposed[i] = 0.0;
+            if (s % (finesteps / substeps[i]) == 0 && C_pools[i] > 0)
+                decomposed[i] = C_pools[i] * r[i] * dt / substeps[i];
+        }
+        double C_before = self.get_C_pool(), CN = self.get_CN();
+        // Dispatch the decomposed carbon to the products
+        for(size_t i = 0; i < n; ++i)
+        {
+            if (decomposed[i] == 0.0) continue;
+            const SOMcomponent::product_map& products=pool_types[i].get_product_map();
+            for(SOMcomponent::product_map::const_iterator p_it=products.begin();p_it!=products.end();++p_it)
+            {
+                C_pools[p_it->first] += decomposed[i] * p_it->second;
+            }
+            C_pools[i] -= decomposed[i];
+        }
+        // N release or immobilisation from the net mineralisation of this fine step
+        if (C_before>0 && N>0)
+        {
+            double
+                net_min = C_before - self.get_C_pool(),
+                grossNmin = net_min/CN,
+                f_Nimmob=min(1,(CN - CNmin)/(CNmax - CNmin)),
+                Nimmob = grossNmin * f_Nimmob;
+            N += Nimmob - grossNmin;
+        }
+    }
+
+    // The mean change rate of the output components and the N release
+    SOM rate = (self - start) / dt;
+    for(component_set::const_iterator it = pool_types.begin(); it != pool_types.end(); ++it)
+    {
+        if (it->is_stored)
+            rate[*it]=0.0;
+        else
+            self[*it]=0.0;
+    }
+    rate.N *= -1;
+    return rate;
+}
+
 std::string SOM::to_string() const
 {
     std::stringstream sstr;
@@ -230,6 +367,16 @@ component_set init_SOMcomponents()
 
 }
 component_set SOM::pool_types=init_SOMcomponents();
+// The components of the original DECOMP model can not be removed
+static const size_t default_components = SOM::get_pool_types().size();
+
+void SOM::remove_component(std::string name)
+{
+    if (pool_types.size() <= default_components || pool_types.back().Name != name)
+        throw std::runtime_error("DECOMP: Only the last added component can be removed");
+    pool_types.pop_back();
+    --SOMcomponent::count;
+}
 
 SOM wood_litter()
 {
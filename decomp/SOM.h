@@ -2,6 +2,19 @@
 #define SOM_h__
 #include "SOMcomponent.h"
 
+/// Number of C pools stored inside each SOM object. Networks with more components
+/// (see SOM::add_component) store the pools on the heap.
+///
+/// 8 rather than 16: the default network has 6 components. With 16 inline pools the
+/// object has 152 bytes and a SOM with its Python proxy needs as much memory as the
+/// former valarray layout (280 bytes resident per SOM for 500000 objects), with 8 pools
+/// the object has 88 bytes and a SOM 216 bytes. Networks with 9 to 16 components fall
+/// back to the heap storage, which costs one allocation per SOM. For such networks
+/// build with -DDECOMP_INLINE_POOLS=16 (eg. CFLAGS=-DDECOMP_INLINE_POOLS=16)
+#ifndef DECOMP_INLINE_POOLS
+#define DECOMP_INLINE_POOLS 8
+#endif
+
 
 	/// @brief A class representing Soil Organic Matter (SOM) with the decomposition properties from Wallman 2006 (https://doi.org/10.1016/j.envsoft.2004.09.026)
 	///
@@ -33,16 +46,41 @@
 	class SOM
 	{
 	private:
-		std::valarray<double> C_pools;
+		double inline_pools[DECOMP_INLINE_POOLS];
+		double* heap_pools;
+		int n_pools;
+		double* pools() { return heap_pools ? heap_pools : inline_pools; }
+		const double* pools() const { return heap_pools ? heap_pools : inline_pools; }
+		void allocate(int size);
+		void check_size(const SOM& other) const;
 		static component_set pool_types;
 	public:
 		static const component_set& get_pool_types();
 		static SOMcomponent add_component(std::string name, bool is_stored,double k_pot, double E_a, double K_w, double n_w, double K_pH, double m_pH);
+		/// Removes the last component added with add_component, eg. to restore the network after a test.
+		/// SOM objects created before need to be discarded
+		/// @param name The name of the last component, as a check
+		static void remove_component(std::string name);
 
 		double
-            N,     ///< Actual N content in the soil organic matter
-			CNmin, ///< Minimal natural C/N ratio (default 15) (needed for N immobilisation)
-			CNmax; ///< Maximum natural C/N ration (default 40) (needed for N immobilisation)
+            N;     ///< Actual N content in the soil organic matter
+#ifndef SWIG
+		static double
+			CNmin, ///< Minimal natural C/N ratio of all SOM (default 15) (needed for N immobilisation)
+			CNmax; ///< Maximum natural C/N ration of all SOM (default 40) (needed for N immobilisation)
+#endif
+		/// Sets the range of natural C/N ratios for the N immobilisation, shared by all SOM like the components
+		/// @param CNmin Minimal natural C/N ratio (default 15)
+		/// @param CNmax Maximum natural C/N ratio (default 40)
+		static void set_CN_range(double CNmin, double CNmax);
+		/// Minimal natural C/N ratio of all SOM
+		static double get_CNmin() { return CNmin; }
+		/// Maximum natural C/N ratio of all SOM
+		static double get_CNmax() { return CNmax; }
+		/// Number of C pools stored inside a SOM object without heap allocation
+		static int inline_capacity() { return DECOMP_INLINE_POOLS; }
+		/// Memory of this SOM object in bytes, including the heap storage of large networks
+		size_t get_nbytes() const;
 		/// N-content
 		double get_C_pool(int index) const;
 		void set_C_pool(int index, double pool_size);
@@ -50,7 +88,7 @@
 #ifndef SWIG
 		double& operator[](const SOMcomponent& component)
 		{
-			return this->C_pools[component.Id];
+			return this->pools()[component.Id];
 		}
 
 		SOM& operator=(const SOM& copy);
@@ -78,6 +116,10 @@
 			return res;
 		}
 		SOM& operator/=(double right);
+		/// Adds mass times a template to the SOM, without temporary objects (this += mass * template)
+		/// @param som_template The composition to add, eg. leave_litter()
+		/// @param mass The scaling of the template
+		void add_scaled(const SOM& som_template, double mass);
 		SOM operator/(double right)
 		{
 			SOM res= *this;
@@ -96,6 +138,7 @@
 
 		
 		SOM(const SOM& copy);
+		~SOM();
 				
 		/// Creates a new organic matter object
 		/// @param N Nitrogen content (in mass)
@@ -109,6 +152,23 @@
 		
 		SOM integrate(double dt, double T, double wetness, double pH);
 
+		/// Integrates the pools over dt with a multirate scheme
+		///
+		/// Each component is advanced with its own step size, chosen from its current decomposition rate:
+		/// a component with the rate \f$r_i\f$ is sub-stepped \f$m_i = 2^k\f$ times, where
+		/// \f$m_i\f$ is the smallest power of two with \f$r_i \Delta t / m_i \leq\f$ max_turnover.
+		/// Fast components (EDC, CELL) take many small steps, slow components (LIGN, RC) only a few.
+		/// The decomposed carbon is handed to the products directly, hence the carbon balance is closed,
+		/// and the N balance follows the net mineralisation of each sub-step.
+		/// With a large max_turnover, the method is identical to integrate.
+		/// @returns The mean change rate of the non stored components and the N release over dt, like integrate
+		/// @param dt Time step in days
+		/// @param T Temperature in °C
+		/// @param wetness Wetness in m3/m3
+		/// @param pH pH-Value of the soil
+		/// @param max_turnover Maximum fraction of a component decomposed in one of its sub-steps
+		SOM integrate_multirate(double dt, double T, double wetness, double pH, double max_turnover=0.1);
+
 		std::string to_string() const;
 	};
 	SOM operator* (double left, const SOM& right);
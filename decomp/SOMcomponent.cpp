@@ -6,6 +6,7 @@
  */
 
 #include "SOMcomponent.h"
+#include "SOM.h"
 #include <cmath>
 #include <stdexcept>
 
@@ -62,15 +63,16 @@
   component_set SOMcomponent::get_products() const
   {
   	component_set res;
+  	const component_set& pool_types = SOM::get_pool_types();
   	for (product_map::const_iterator it=products.begin();it!=products.end();++it)
   	{
-  		res.push_back(it->first);
+  		res.push_back(pool_types.at(it->first));
   	}
   	return res;
   }
     void SOMcomponent::set_product(const SOMcomponent& product,double fraction) {
         if (fraction<0 || fraction>1) throw std::runtime_error("Fraction is a number in [0..1]");
-        products[product]=fraction;
+        products[product.Id]=fraction;
     }
     SOMcomponent::SOMcomponent() : Id(-1)
     {
@@ -25,8 +25,10 @@ typedef std::vector<SOMcomponent> component_set;
 /// Describes the properties of a component of the Soil Organic Matter
 /// the original DECOMP model has 4 pool types: EDC, CELL, LIGN and RC and 2 flux types: CO2 and DOC
 class SOMcomponent {
+public:
+    /// Fraction of the decomposed mass by the Id of the product
+    typedef std::map<int, double> product_map;
 private:
-    typedef std::map<SOMcomponent, double> product_map;
     product_map products;
     double f_Temp(double T) const;
     double f_wet(double wet) const;
@@ -57,7 +59,7 @@ public:
     void set_product(const SOMcomponent& product,double fraction);
     /// Get the fraction of a product
     double get_product_fraction(const SOMcomponent& product) const {
-        product_map::const_iterator fract=products.find(product);
+        product_map::const_iterator fract=products.find(product.Id);
         if (fract!=this->products.end())
             return fract->second;
         else
@@ -65,6 +67,10 @@ public:
     }
     /// Gets the list of products of this compound
     component_set get_products() const;
+#ifndef SWIG
+    /// The product fractions by Id, without copies of the product components
+    const product_map& get_product_map() const { return products; }
+#endif
     /// Calculates the decomposition rate in 1/day of this component
     double decomp(double T, double wetness, double pH) const;
     SOMcomponent();
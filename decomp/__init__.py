@@ -6,5 +6,7 @@ Created on 09.11.2009
 from __future__ import absolute_import, print_function, division, unicode_literals
 from .decomp import SOM, SOMcomponent, EDC, CELL, LIGN, RC, CO2, DOC
 from .decomp import root_litter, leave_litter, wood_litter, pure_DOC
+from .batch import SOMBatch, Network
+from .inputs import InputSchedule
 
 __version__ = '1.0.0'
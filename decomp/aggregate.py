@@ -0,0 +1,323 @@
+# -*- coding: utf-8 -*-
+"""
+Online temporal aggregation and running statistics
+
+Aggregators reduce a variable of the states or fluxes while a run proceeds.
+At the end of each interval (eg. a day or a month) the reduced value is kept
+and the aggregator starts again, the memory scales with the number of intervals
+and not with the number of time steps:
+
+>>> daily_CO2 = aggregate.Mean('CO_2', interval=1.0)
+>>> monthly_C = aggregate.Max('C', interval=30.0)
+>>> batch.run(1 / 24, T, wetness, pH, aggregate=[daily_CO2, monthly_C])
+>>> daily_CO2.result()   # shape (days,) + batch shape
+
+The variable is the name of a property of the states ('C', 'N', 'CN'), 'N_release'
+for the N flux, the name of a component (pool of stored components, the flux of
+non stored components like 'CO_2' or 'DOC') or a function f(state, flux) returning
+an array. Fluxes are rates in mass per day.
+
+With axis, the aggregator also reduces axes of the batch, eg. the ensemble
+mean and variance of a parameter ensemble as first axis of the batch:
+
+>>> spread = aggregate.Variance('C', interval=365.0, axis=0)
+
+Aggregators work with SOMBatch.run, CmfConnector.aggregators or any loop
+calling update(state, flux, dt) after each time step.
+"""
+from __future__ import division, print_function, absolute_import, unicode_literals
+
+import numpy as np
+
+
+def select(variable):
+    """
+    Returns a function f(state, flux) that selects the variable from the state and the flux
+
+    :param variable: A name or a function f(state, flux), see module documentation
+    """
+    if callable(variable):
+        return variable
+    if variable in ('C', 'N', 'CN'):
+        return lambda state, flux: getattr(state, variable)
+    if variable == 'N_release':
+        return lambda state, flux: flux.N
+
+    def component(state, flux):
+        index = state.network.index(variable)
+        if state.network.is_stored[index]:
+            return state.C_pools[..., index]
+        else:
+            return flux.C_pools[..., index]
+    return component
+
+
+class Aggregator(object):
+    """
+    Base class of the aggregators
+
+    Subclasses implement _reset(value), _add(value, dt) and _value()
+    """
+    def __init__(self, variable, interval=None, axis=None, name=None):
+        """
+        :param variable: The name of the variable or a function f(state, flux), see module documentation
+        :param interval: The length of the aggregation intervals in days. If None,
+            the whole run is aggregated to one value by finish()
+        :param axis: None, int or tuple of int. Axes of the batch to reduce in addition to the time
+        :param name: The name of the result, default is the class and variable name
+        """
+        self.variable = variable
+        self.select = select(variable)
+        self.interval = interval
+        if axis is None:
+            axis = ()
+        self.axis = (axis,) if np.ndim(axis) == 0 else tuple(axis)
+        if name is None:
+            name = '{}_{}'.format(type(self).__name__.lower(),
+                                  variable if not callable(variable) else variable.__name__)
+        self.name = name
+        self.reset()
+
+    def reset(self):
+        """Deletes all results"""
+        self.values = []
+        # The end of each interval in days since the start
+        self.times = []
+        self.time = 0.0
+        self.elapsed = 0.0
+        self.count = 0
+
+    def samples(self, value):
+        """The number of values of a time step reduced to one value"""
+        return int(np.prod([np.shape(value)[a] for a in self.axis]))
+
+    def update(self, state, flux, dt=1.0):
+        """
+        Adds a time step to the actual interval
+
+        :param state: The state after the step, a SOMBatch
+        :param flux: The fluxes of the step, a SOMBatch of rates as returned by the integrators
+        :param dt: The length of the time step in days
+        """
+        value = np.asarray(self.select(state, flux), dtype=np.float64)
+        if self.count == 0:
+            self._reset(value)
+        self._add(value, dt)
+        self.count += 1
+        self.time += dt
+        self.elapsed += dt
+        # A small tolerance for the sum of time steps like 1/24
+        if self.interval is not None and self.elapsed >= self.interval * (1 - 1e-9):
+            self._close()
+
+    def _close(self):
+        self.values.append(self._value())
+        self.times.append(self.time)
+        self.elapsed = 0.0
+        self.count = 0
+
+    def finish(self):
+        """Closes an unfinished interval, eg. the whole run if interval is None"""
+        if self.count:
+            self._close()
+
+    def result(self):
+        """
+        The values of the closed intervals as array with the interval as first axis
+        """
+        return np.array(self.values)
+
+    def _reset(self, value):
+        raise NotImplementedError
+
+    def _add(self, value, dt):
+        raise NotImplementedError
+
+    def _value(self):
+        raise NotImplementedError
+
+    def __repr__(self):
+        return '{}({!r}, interval={})'.format(type(self).__name__, self.variable, self.interval)
+
+
+class Sum(Aggregator):
+    """
+    The sum of value * dt, eg. the mass of a flux in the interval
+    """
+    def _reset(self, value):
+        self.total = np.zeros(np.sum(value, axis=self.axis).shape)
+
+    def _add(self, value, dt):
+        self.total += np.sum(value, axis=self.axis) * dt
+
+    def _value(self):
+        return self.total.copy()
+
+
+class Mean(Aggregator):
+    """
+    The mean weighted by the length of the time steps
+    """
+    def _reset(self, value):
+        self.total = np.zeros(np.sum(value, axis=self.axis).shape)
+        self.weight = 0.0
+
+    def _add(self, value, dt):
+        self.total += np.sum(value, axis=self.axis) * dt
+        self.weight += self.samples(value) * dt
+
+    def _value(self):
+        return self.total / self.weight
+
+
+class Last(Aggregator):
+    """
+    The value at the end of the interval, eg. the state at the end of each day.
+    With axis, the mean over these axes at the end of the interval
+    """
+    def _reset(self, value):
+        self.last = None
+
+    def _add(self, value, dt):
+        self.last = np.mean(value, axis=self.axis) if self.axis else value
+
+    def _value(self):
+        return np.array(self.last, copy=True)
+
+
+class Min(Aggregator):
+    """
+    The minimum
+    """
+    def _reset(self, value):
+        self.extreme = np.full(np.sum(value, axis=self.axis).shape, np.inf)
+
+    def _add(self, value, dt):
+        np.minimum(self.extreme, np.min(value, axis=self.axis), out=self.extreme)
+
+    def _value(self):
+        return self.extreme.copy()
+
+
+class Max(Aggregator):
+    """
+    The maximum
+    """
+    def _reset(self, value):
+        self.extreme = np.full(np.sum(value, axis=self.axis).shape, -np.inf)
+
+    def _add(self, value, dt):
+        np.maximum(self.extreme, np.max(value, axis=self.axis), out=self.extreme)
+
+    def _value(self):
+        return self.extreme.copy()
+
+
+class Variance(Aggregator):
+    """
+    The variance of the values, updated with Welford's algorithm
+
+    The values of the reduced batch axes of a time step are merged as one group
+    (Chan et al.), the time steps are not weighted by their length.
+    """
+    def __init__(self, variable, interval=None, axis=None, name=None, ddof=1):
+        """
+        :param ddof: Delta degrees of freedom, the divisor is n - ddof
+        """
+        self.ddof = ddof
+        Aggregator.__init__(self, variable, interval, axis, name)
+
+    def _reset(self, value):
+        shape = np.sum(value, axis=self.axis).shape
+        self.n = 0
+        self.mean = np.zeros(shape)
+        self.M2 = np.zeros(shape)
+
+    def _add(self, value, dt):
+        m = self.samples(value)
+        mean = np.mean(value, axis=self.axis)
+        M2 = np.sum((value - np.mean(value, axis=self.axis, keepdims=True)) ** 2, axis=self.axis)
+        n = self.n + m
+        delta = mean - self.mean
+        self.mean += delta * (m / n)
+        self.M2 += M2 + delta ** 2 * (self.n * m / n)
+        self.n = n
+
+    def _value(self):
+        if self.n <= self.ddof:
+            return np.full(self.M2.shape, np.nan)
+        return self.M2 / (self.n - self.ddof)
+
+
+class Quantile(Aggregator):
+    """
+    A quantile estimated with the P² algorithm (Jain and Chlamtac, 1985)
+
+    The P² algorithm keeps five markers for every value, the memory does not grow
+    with the number of time steps. Intervals with less than five values return
+    the exact quantile.
+    """
+    def __init__(self, variable, q=0.5, interval=None, axis=None, name=None):
+        """
+        :param q: The quantile, between 0 and 1
+        """
+        if not 0.0 <= q <= 1.0:
+            raise ValueError('The quantile needs to be between 0 and 1')
+        self.q = q
+        if name is None and not callable(variable):
+            name = 'quantile{:g}_{}'.format(100 * q, variable)
+        Aggregator.__init__(self, variable, interval, axis, name)
+
+    def _reset(self, value):
+        shape = np.sum(value, axis=self.axis).shape
+        q = self.q
+        self.n = 0
+        self.heights = np.zeros((5,) + shape)
+        self.positions = np.broadcast_to(np.arange(5.0).reshape((5,) + (1,) * len(shape)), (5,) + shape).copy()
+        self.desired = np.array([0, 2 * q, 4 * q, 2 + 2 * q, 4]).reshape((5,) + (1,) * len(shape))
+        self.increment = np.array([0, q / 2, q, (1 + q) / 2, 1]).reshape((5,) + (1,) * len(shape))
+
+    def _add(self, value, dt):
+        # The reduced axes are moved to the front and fed one by one
+        value = np.moveaxis(value, self.axis, tuple(range(len(self.axis))))
+        for x in value.reshape((-1,) + self.heights.shape[1:]):
+            self._add_one(x)
+
+    def _add_one(self, x):
+        h, pos = self.heights, self.positions
+        if self.n < 5:
+            h[self.n] = x
+            self.n += 1
+            if self.n == 5:
+                h.sort(axis=0)
+            return
+        self.n += 1
+        h[0] = np.minimum(h[0], x)
+        h[4] = np.maximum(h[4], x)
+        # Increment the positions of the markers above x
+        pos[1:] += (x < h[1:]) | (np.arange(1, 5).reshape((4,) + (1,) * x.ndim) == 4)
+        self.desired = self.desired + self.increment
+        for i in (1, 2, 3):
+            d = self.desired[i] - pos[i]
+            move = ((d >= 1) & (pos[i + 1] - pos[i] > 1)) | ((d <= -1) & (pos[i - 1] - pos[i] < -1))
+            if not np.any(move):
+                continue
+            d = np.where(move, np.sign(d), 0.0)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                parabolic = h[i] + d / (pos[i + 1] - pos[i - 1]) * (
+                    (pos[i] - pos[i - 1] + d) * (h[i + 1] - h[i]) / (pos[i + 1] - pos[i]) +
+                    (pos[i + 1] - pos[i] - d) * (h[i] - h[i - 1]) / (pos[i] - pos[i - 1]))
+                neighbour = np.where(d > 0, h[i + 1], h[i - 1])
+                neighbour_pos = np.where(d > 0, pos[i + 1], pos[i - 1])
+                linear = h[i] + d * (neighbour - h[i]) / (neighbour_pos - pos[i])
+            use_parabolic = (h[i - 1] < parabolic) & (parabolic < h[i + 1])
+            h[i] = np.where(move, np.where(use_parabolic, parabolic, linear), h[i])
+            pos[i] += d
+
+    def _value(self):
+        if self.n < 5:
+            return np.quantile(self.heights[:self.n], self.q, axis=0)
+        return self.heights[2].copy()
+
+    def __repr__(self):
+        return 'Quantile({!r}, q={}, interval={})'.format(self.variable, self.q, self.interval)
@@ -0,0 +1,701 @@
+# -*- coding: utf-8 -*-
+"""
+Vectorized decomposition of many soil organic matter states at once
+
+A SOM object holds a single state and every call crosses the Python / C++
+boundary. A SOMBatch holds the C pools and the N content of many states as numpy
+arrays and calculates the decomposition of all states in one call, using the
+same equations as SOM::dCdt, SOM::integrate and SOM::integrate_multirate.
+
+The component parameters are taken from the component network of SOM
+(SOM.get_pool_types()) and copied into a Network object.
+"""
+from __future__ import division, print_function, absolute_import, unicode_literals
+
+import copy
+
+import numpy as np
+
+from .decomp import SOM, SOMcomponent
+
+
+def time_series(T, wetness, pH, inputs=None):
+    """
+    Checks the forcing and inputs of a run for the number of time steps
+
+    :param T, wetness, pH: The forcing, scalars or arrays with the time step as first axis
+    :param inputs: None or a SOMBatch with the time step as first axis
+    :return: The number of time steps and the list of forcing arrays (T, wetness, pH)
+        with the time step as first axis
+    """
+    series = [x for x in (T, wetness, pH) if np.ndim(x)]
+    if inputs is not None:
+        series.append(inputs.N)
+    if not series:
+        raise ValueError('Either the forcing or the inputs need a time axis')
+    steps = len(series[0])
+    if any(len(x) != steps for x in series):
+        raise ValueError('The forcing and the inputs need the same number of time steps')
+    forcing = [np.broadcast_to(np.asarray(x, dtype=float), (steps,) + np.shape(x)[1:] if np.ndim(x) else (steps,))
+               for x in (T, wetness, pH)]
+    return steps, forcing
+
+
+class Network(object):
+    """The parameters of the SOM components as arrays for vectorized calculations
+
+    The parameter arrays have the component as last axis. They may have
+    additional leading axes, eg. to calculate an ensemble of parameter sets
+    in one batch.
+    """
+    # Gas constant in kJ/(mol K) and reference temperature in °C, see SOMcomponent::f_Temp
+    R = 8.314 * 0.001
+    T_R = 5.0
+    parameters = ('k_pot', 'E_a', 'K_w', 'n_w', 'K_pH', 'm_pH')
+
+    def __init__(self, components=None, CNmin=None, CNmax=None):
+        """
+        Creates the network from the SOM components
+
+        :param components: A sequence of SOMcomponent. Default: SOM.get_pool_types()
+        :param CNmin: Minimal natural C/N ratio (needed for N immobilisation). Default: SOM.get_CNmin()
+            at the time of use, ie. the network follows SOM.set_CN_range until CNmin is set
+        :param CNmax: Maximum natural C/N ratio (needed for N immobilisation). Default: SOM.get_CNmax()
+            at the time of use, like CNmin
+        """
+        if components is None:
+            components = SOM.get_pool_types()
+        self.components = list(components)
+        n = len(self.components)
+        for param in self.parameters:
+            setattr(self, param, np.array([getattr(c, param) for c in self.components], dtype=float))
+        self.is_stored = np.array([c.is_stored for c in self.components], dtype=bool)
+        # products[i, j] is the fraction of the decomposed component i that becomes component j
+        self.products = np.zeros((n, n))
+        for c in self.components:
+            for p in c.get_products():
+                self.products[c.Id, p.Id] = c.get_product_fraction(p)
+        # None: the shared C/N range of the SOM objects, see SOM.set_CN_range
+        self._CNmin = CNmin
+        self._CNmax = CNmax
+
+    @property
+    def CNmin(self):
+        """Minimal natural C/N ratio, SOM.get_CNmin() if not set for this network"""
+        return SOM.get_CNmin() if self._CNmin is None else self._CNmin
+
+    @CNmin.setter
+    def CNmin(self, value):
+        self._CNmin = value
+
+    @property
+    def CNmax(self):
+        """Maximum natural C/N ratio, SOM.get_CNmax() if not set for this network"""
+        return SOM.get_CNmax() if self._CNmax is None else self._CNmax
+
+    @CNmax.setter
+    def CNmax(self, value):
+        self._CNmax = value
+
+    def __len__(self):
+        return len(self.components)
+
+    def copy(self):
+        """Returns a copy of the network with copied parameter arrays"""
+        res = copy.copy(self)
+        for param in self.parameters + ('products', 'is_stored'):
+            setattr(res, param, getattr(self, param).copy())
+        # copy.copy uses __getstate__, which fixes the C/N range
+        res._CNmin, res._CNmax = self._CNmin, self._CNmax
+        return res
+
+    def __getstate__(self):
+        """The SOMcomponents can not be pickled, they are stored by name, eg. for worker processes"""
+        state = self.__dict__.copy()
+        state['components'] = self.names
+        # Worker processes may not share the C/N range of this process
+        state['_CNmin'], state['_CNmax'] = self.CNmin, self.CNmax
+        return state
+
+    def __setstate__(self, state):
+        # Components added with SOM.add_component need to exist in the unpickling process
+        components = dict((c.Name, c) for c in SOM.get_pool_types())
+        state['components'] = [components[name] for name in state['components']]
+        self.__dict__.update(state)
+
+    def __repr__(self):
+        return 'Network({})'.format(', '.join(self.names))
+
+    @property
+    def names(self):
+        return [c.Name for c in self.components]
+
+    def index(self, component):
+        """
+        Returns the position of a component in the pool arrays
+
+        :param component: A SOMcomponent or the name of a component
+        """
+        if isinstance(component, SOMcomponent):
+            return component.Id
+        return self.names.index(component)
+
+    def decomp(self, T, wetness, pH):
+        """
+        Calculates the decomposition rate in 1/day of all components, like SOMcomponent::decomp
+
+        :param T: Temperature in °C, scalar or array
+        :param wetness: Wetness in m3/m3, scalar or array
+        :param pH: pH-Value of the soil, scalar or array
+        :return: Array of rates with the components as last axis
+        """
+        T = np.asarray(T, dtype=float)[..., np.newaxis]
+        wetness = np.asarray(wetness, dtype=float)[..., np.newaxis]
+        pH = np.asarray(pH, dtype=float)[..., np.newaxis]
+        arr_gamma = self.E_a / (self.R * (self.T_R + 273.16)) - self.E_a / (self.R * (T + 273.16))
+        f_Temp = np.exp(arr_gamma)
+        x_wet = self.K_w * wetness ** self.n_w
+        f_wet = x_wet / (1.0 + x_wet)
+        f_pH = 1.0 / (1.0 + self.K_pH * (10.0 ** -pH) ** self.m_pH)
+        return self.k_pot / 365.25 * f_Temp * f_wet * f_pH
+
+    def dispatch(self, decomposed):
+        """
+        Distributes the decomposed mass of each component to its products
+
+        :param decomposed: Array of decomposed mass with the components as last axis
+        :return: Array of the created mass with the components as last axis
+        """
+        if self.products.ndim == 2:
+            return np.dot(decomposed, self.products)
+        return np.einsum('...i,...ij->...j', decomposed, self.products)
+
+
+class SOMBatch(object):
+    """Many soil organic matter states, stored as arrays
+
+    C_pools has the shape of the batch plus the components as last axis,
+    N has the shape of the batch. The arrays are used as given (not copied),
+    hence a SOMBatch can work in place on views of larger arrays.
+
+    The pools and N are stored as float64 or, to halve memory and bandwidth for
+    large grids, as float32 (see dtype). The rates and fluxes are always calculated
+    and accumulated in float64, only the storage of the states is rounded.
+    Each step rounds the states to float32 (relative precision 6e-8), and the
+    rounding errors add up over the steps: a 100 year run with daily steps and
+    yearly litter input deviates from the float64 run by about 4e-6 (relative) in
+    the pools and N, and by about 1e-6 in the cumulated CO2 flux (see
+    tests/test_float32.py). The error grows with the number of steps, since changes
+    of a pool within one step get closer to its float32 resolution. Use float64 for
+    hourly steps over centuries.
+
+    Like SOM, a component can be used as index:
+
+    >>> batch[decomp.EDC]  # array of the EDC pools
+    >>> batch[2:5]  # SOMBatch view of the states 2, 3 and 4
+    """
+
+    def __init__(self, C_pools, N, network=None, dtype=None):
+        """
+        Creates a batch from arrays
+
+        :param C_pools: Array of C pools, components as last axis
+        :param N: Array of N content, shape of the batch
+        :param network: The component network, default is Network()
+        :param dtype: The storage type (numpy.float64 or numpy.float32). If None, float32 arrays
+            are kept as float32 and everything else is stored as float64
+        """
+        self.network = network or Network()
+        if dtype is None:
+            dtype = np.float32 if np.asarray(C_pools).dtype == np.float32 else np.float64
+        self.C_pools = np.asarray(C_pools, dtype=dtype)
+        self.N = np.asarray(N, dtype=dtype)
+        # A FluxLedger, see attach_ledger
+        self.ledger = None
+        # An Observer, see attach_observer
+        self.observer = None
+        if self.C_pools.shape != self.N.shape + (len(self.network),):
+            raise ValueError('C_pools needs the shape {} (batch shape + number of components), got {}'
+                             .format(self.N.shape + (len(self.network),), self.C_pools.shape))
+
+    @classmethod
+    def zeros(cls, shape=(), network=None, dtype=np.float64):
+        """Creates an empty batch of the given shape and storage type"""
+        network = network or Network()
+        shape = tuple(shape) if np.ndim(shape) or shape == () else (shape,)
+        return cls(np.zeros(shape + (len(network),), dtype=dtype), np.zeros(shape, dtype=dtype), network)
+
+    @classmethod
+    def from_soms(cls, soms, network=None, dtype=np.float64):
+        """
+        Creates a batch from a single SOM (batch shape ()) or a sequence of SOM objects
+        """
+        network = network or Network()
+        if isinstance(soms, SOM):
+            soms, shape = [soms], ()
+        else:
+            soms = list(soms)
+            shape = (len(soms),)
+        C_pools = np.array([[som.get_C_pool(c.Id) for c in network.components] for som in soms], dtype=float)
+        N = np.array([som.N for som in soms], dtype=float)
+        return cls(C_pools.reshape(shape + (len(network),)), N.reshape(shape), network, dtype)
+
+    def to_som(self, index=()):
+        """
+        Returns a single state of the batch as SOM
+
+        The SOM uses the shared C/N range of SOM.set_CN_range, not the range of the network
+        """
+        som = SOM()
+        for c, value in zip(self.network.components, self.C_pools[index]):
+            som.set_C_pool(c.Id, float(value))
+        som.N = float(self.N[index])
+        return som
+
+    def to_soms(self):
+        """Returns the states of the batch as a flat list of SOM objects"""
+        return [self.to_som(index) for index in np.ndindex(*self.shape)]
+
+    @classmethod
+    def from_array(cls, values, network=None, dtype=np.float64):
+        """
+        Creates a batch from an array with the C pools of all components and N as last column
+
+        The columns are in the order of the network components (like SOM.to_array),
+        the other axes are the batch shape, eg. (n, components + 1) for n states.
+        """
+        network = network or Network()
+        values = np.asarray(values)
+        if values.shape[-1] != len(network) + 1:
+            raise ValueError('The array needs {} columns (pools and N)'.format(len(network) + 1))
+        return cls(np.array(values[..., :-1], dtype=dtype), np.array(values[..., -1], dtype=dtype), network, dtype)
+
+    def to_array(self):
+        """Returns the C pools and N as one array with the shape shape + (components + 1,)"""
+        return np.concatenate([self.C_pools, self.N[..., np.newaxis]], axis=-1)
+
+    @classmethod
+    def from_dataframe(cls, df, network=None, dtype=np.float64):
+        """
+        Creates a batch of the shape (rows,) from a pandas DataFrame
+
+        The columns named like the components (eg. 'EDC', 'CELL') are the C pools,
+        the column 'N' is the N content. Missing components are empty, other
+        columns are ignored.
+        """
+        network = network or Network()
+        if 'N' not in df.columns:
+            raise ValueError('The DataFrame needs a column N')
+        C_pools = np.zeros((len(df), len(network)), dtype=dtype)
+        for c in network.components:
+            if c.Name in df.columns:
+                C_pools[:, c.Id] = df[c.Name].to_numpy(dtype=dtype)
+        return cls(C_pools, df['N'].to_numpy(dtype=dtype), network, dtype)
+
+    def to_dataframe(self, index=None):
+        """
+        Returns the states as pandas DataFrame with a column for each component and N, one row per state
+
+        :param index: The index of the DataFrame, default is a range
+        """
+        import pandas as pd
+        values = self.to_array().reshape((-1, len(self.network) + 1))
+        return pd.DataFrame(values, columns=self.network.names + ['N'], index=index)
+
+    @property
+    def shape(self):
+        return self.N.shape
+
+    @property
+    def dtype(self):
+        """The storage type of the pools and N"""
+        return self.C_pools.dtype
+
+    def astype(self, dtype):
+        """Returns a copy of the batch with another storage type"""
+        return SOMBatch(self.C_pools.astype(dtype), self.N.astype(dtype), self.network, dtype)
+
+    def __len__(self):
+        return len(self.N)
+
+    def __repr__(self):
+        return 'SOMBatch(shape={}, C={:0.5g}, N={:0.5g})'.format(self.shape, self.C.sum(), self.N.sum())
+
+    def __getitem__(self, index):
+        if isinstance(index, SOMcomponent):
+            return self.C_pools[..., index.Id]
+        return SOMBatch(self.C_pools[index], self.N[index], self.network, self.dtype)
+
+    def __setitem__(self, index, value):
+        if isinstance(index, SOMcomponent):
+            self.C_pools[..., index.Id] = value
+        else:
+            value = self._as_batch(value)
+            self.C_pools[index] = value.C_pools
+            self.N[index] = value.N
+
+    def copy(self):
+        return SOMBatch(self.C_pools.copy(), self.N.copy(), self.network, self.dtype)
+
+    @property
+    def nbytes(self):
+        """Memory of the pool and N arrays in bytes"""
+        return self.C_pools.nbytes + self.N.nbytes
+
+    @staticmethod
+    def estimate_nbytes(shape, network=None, dtype=np.float64, steps=None):
+        """
+        The memory in bytes of a batch of the shape, eg. to size a job before it starts
+
+        :param shape: The batch shape
+        :param network: The component network, default Network()
+        :param dtype: The float type of the batch
+        :param steps: If given, the flux array of SOMBatch.run over this number
+            of steps (without aggregators) is included
+        :return: Bytes of the batch (and the flux array)
+        """
+        ncomp = len(network) if network is not None else len(SOM.get_pool_types())
+        states = int(np.prod(shape))
+        nbytes = states * (ncomp + 1) * np.dtype(dtype).itemsize
+        if steps:
+            # The flux of run is stored as float64
+            nbytes += steps * states * (ncomp + 1) * np.dtype(np.float64).itemsize
+        return nbytes
+
+    @property
+    def C(self):
+        """The sum of the stored C pools"""
+        return self.C_pools[..., self.network.is_stored].sum(axis=-1, dtype=np.float64)
+
+    @property
+    def CN(self):
+        """The C/N ratio"""
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return self.C / self.N
+
+    def _as_batch(self, other):
+        if isinstance(other, SOM):
+            return SOMBatch.from_soms(other, self.network)
+        return other
+
+    @staticmethod
+    def _factor(value):
+        """Makes a scalar or an array of the batch shape usable for the C_pools"""
+        value = np.asarray(value, dtype=float)
+        return value[..., np.newaxis] if value.ndim else value
+
+    def __iadd__(self, other):
+        other = self._as_batch(other)
+        self.C_pools += other.C_pools
+        self.N += other.N
+        return self
+
+    def __isub__(self, other):
+        other = self._as_batch(other)
+        self.C_pools -= other.C_pools
+        self.N -= other.N
+        return self
+
+    def __imul__(self, factor):
+        self.C_pools *= self._factor(factor)
+        self.N *= factor
+        return self
+
+    def __itruediv__(self, factor):
+        self.C_pools /= self._factor(factor)
+        self.N /= factor
+        return self
+
+    def attach_ledger(self):
+        """
+        Creates a FluxLedger that accumulates the fluxes of the integrators, see decomp.ledger
+
+        :return: The ledger
+        """
+        from .ledger import FluxLedger
+        self.ledger = FluxLedger(self)
+        return self.ledger
+
+    def attach_observer(self, conditions=(), capacity=100000, sampler=None):
+        """
+        Creates an Observer that tests conditions after each step of the integrators, see decomp.observe
+
+        :param conditions: A sequence of conditions, eg. observe.default_conditions(batch.network)
+        :param capacity: The capacity of the event ring buffer
+        :param sampler: An optional observe.Sampler for the full states
+        :return: The observer
+        """
+        from .observe import Observer
+        self.observer = Observer(conditions, capacity, sampler)
+        return self.observer
+
+    def add_input(self, inputs):
+        """
+        Adds organic matter (SOM or SOMBatch) to the states and records it in the ledger
+        """
+        inputs = self._as_batch(inputs)
+        self += inputs
+        if self.ledger is not None:
+            self.ledger.record_input(inputs.C_pools, inputs.N)
+        return self
+
+    def add_scaled(self, template, mass):
+        """
+        Adds mass times a template to all states in place (self += mass * template)
+
+        Use a view of the batch to depose only to some states, eg. litter to the
+        first layer of a batch of profiles with the shape (cells, layers):
+
+        >>> profiles[:, 0].add_scaled(decomp.leave_litter(), leave_mass)
+        >>> profiles.add_scaled(decomp.root_litter(), root_mass)
+
+        :param template: The composition to add as SOM or SOMBatch, eg. leave_litter()
+        :param mass: Scalar or array (broadcastable to the batch shape) of the scaling of the template
+        """
+        template = self._as_batch(template)
+        mass = np.asarray(mass, dtype=float)
+        self.C_pools += mass[..., np.newaxis] * template.C_pools
+        self.N += mass * template.N
+        return self
+
+    def mix(self, matrix):
+        """
+        Redistributes all pools and N between the layers in place
+
+        The layers are the last axis of the batch shape, see decomp.mixing
+
+        :param matrix: Mixing matrix, shape (layers, layers) or (..., layers, layers).
+            matrix[i, j] is the fraction of the content of layer j moved to layer i
+        """
+        matrix = np.asarray(matrix, dtype=float)
+        self.C_pools[...] = np.matmul(matrix, self.C_pools)
+        self.N[...] = np.matmul(matrix, self.N[..., np.newaxis])[..., 0]
+        return self
+
+    def __add__(self, other):
+        other = self._as_batch(other)
+        return SOMBatch(self.C_pools + other.C_pools, self.N + other.N, self.network)
+
+    def __sub__(self, other):
+        other = self._as_batch(other)
+        return SOMBatch(self.C_pools - other.C_pools, self.N - other.N, self.network)
+
+    def __mul__(self, factor):
+        return SOMBatch(self.C_pools * self._factor(factor), self.N * factor, self.network)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, factor):
+        return SOMBatch(self.C_pools / self._factor(factor), self.N / factor, self.network)
+
+    __div__ = __truediv__
+    __idiv__ = __itruediv__
+
+    def _N_change(self, C_before, CN, net_min):
+        """
+        N release (negative) or immobilisation from the net mineralisation, see SOM::dCdt
+
+        :param C_before: Stored C before the mineralisation
+        :param CN: C/N ratio before the mineralisation
+        :param net_min: Net mineralised C
+        """
+        net = self.network
+        with np.errstate(divide='ignore', invalid='ignore'):
+            grossNmin = net_min / CN
+            f_Nimmob = np.minimum(1, (CN - net.CNmin) / (net.CNmax - net.CNmin))
+            dN = grossNmin * f_Nimmob - grossNmin
+        return np.where((C_before > 0) & (self.N > 0), dN, 0.0)
+
+    def dCdt(self, T, wetness, pH):
+        """
+        Returns the change rate of the pools, like SOM.dCdt
+
+        :param T: Temperature in °C, scalar or array of the batch shape
+        :param wetness: Wetness in m3/m3, scalar or array of the batch shape
+        :param pH: pH-Value of the soil, scalar or array of the batch shape
+        :return: The change rate as SOMBatch
+        """
+        net = self.network
+        r = net.decomp(T, wetness, pH)
+        decomposed = np.where(self.C_pools > 0, self.C_pools * r, 0.0)
+        dC = net.dispatch(decomposed) - decomposed
+        net_min = -dC[..., net.is_stored].sum(axis=-1)
+        dN = self._N_change(self.C, self.CN, net_min)
+        return SOMBatch(dC, dN, net)
+
+    def _finish_step(self, rate, dt):
+        """Removes the non stored components from the states and the stored components from the rate"""
+        stored = self.network.is_stored
+        if self.ledger is not None:
+            self.ledger.record_step(np.where(stored, 0.0, self.C_pools), -rate.N, dt)
+        self.C_pools[..., ~stored] = 0.0
+        rate.C_pools[..., stored] = 0.0
+        rate.N *= -1
+        if self.observer is not None:
+            self.observer.update(self, rate, dt)
+        return rate
+
+    def integrate(self, dt, T, wetness, pH):
+        """
+        Integrates all states over dt with an explicit Euler step, like SOM.integrate
+
+        :param dt: Time step in days
+        :param T: Temperature in °C, scalar or array of the batch shape
+        :param wetness: Wetness in m3/m3, scalar or array of the batch shape
+        :param pH: pH-Value of the soil, scalar or array of the batch shape
+        :return: The change rate of the non stored components and the N release as SOMBatch
+        """
+        rate = self.dCdt(T, wetness, pH)
+        self.C_pools += rate.C_pools * dt
+        self.N += rate.N * dt
+        return self._finish_step(rate, dt)
+
+    def integrate_multirate(self, dt, T, wetness, pH, max_turnover=0.1):
+        """
+        Integrates all states over dt with sub-steps for each component, like SOM.integrate_multirate
+
+        Each component of each state is sub-stepped with the smallest power of two
+        that keeps the decomposed fraction per sub-step below max_turnover.
+
+        :param dt: Time step in days
+        :param T: Temperature in °C, scalar or array of the batch shape
+        :param wetness: Wetness in m3/m3, scalar or array of the batch shape
+        :param pH: pH-Value of the soil, scalar or array of the batch shape
+        :param max_turnover: Maximum fraction of a component decomposed in one of its sub-steps
+        :return: The mean change rate of the non stored components and the N release as SOMBatch
+        """
+        if max_turnover <= 0:
+            raise ValueError('max_turnover needs to be positive')
+        net = self.network
+        r = np.broadcast_to(net.decomp(T, wetness, pH), self.C_pools.shape)
+        substeps = self.substeps(r * dt, max_turnover)
+        finesteps = substeps.max() if substeps.size else 1
+        stride = finesteps // substeps
+        # The sub-steps are accumulated in float64, also for float32 storage
+        start = self.astype(np.float64)
+        work = start.copy()
+        for s in range(finesteps):
+            active = (s % stride == 0) & (work.C_pools > 0)
+            decomposed = np.where(active, work.C_pools * r * dt / substeps, 0.0)
+            C_before, CN = work.C, work.CN
+            work.C_pools += net.dispatch(decomposed) - decomposed
+            work.N += work._N_change(C_before, CN, C_before - work.C)
+        rate = (work - start) / dt
+        self.C_pools[...] = work.C_pools
+        self.N[...] = work.N
+        return self._finish_step(rate, dt)
+
+    @staticmethod
+    def substeps(turnover, max_turnover, max_substeps=2 ** 20):
+        """
+        The smallest powers of two m with turnover / m <= max_turnover
+
+        :param turnover: Decomposed fraction of the pools in a full step (rate * dt)
+        :param max_turnover: Maximum decomposed fraction per sub-step
+        :param max_substeps: Upper limit of sub-steps
+        """
+        turnover = np.asarray(turnover)
+        with np.errstate(divide='ignore'):
+            k = np.ceil(np.log2(turnover / max_turnover))
+        k = np.clip(np.nan_to_num(k, neginf=0.0), 0, np.log2(max_substeps)).astype(int)
+        m = 2 ** k
+        # Correct rounding errors of log2
+        m = np.where((turnover / m > max_turnover) & (m < max_substeps), m * 2, m)
+        m = np.where((m > 1) & (turnover / np.maximum(m // 2, 1) <= max_turnover), m // 2, m)
+        return m
+
+    def integrate_profile(self, dt, T, wetness, pH, percolation, max_turnover=None):
+        """
+        Integrates a batch of profiles with DOC transport between the layers
+
+        The layers are the last axis of the batch shape. Each layer is treated as a
+        continuously stirred tank reactor (Wallman et al. 2006): the DOC is kept in
+        the layer, and after the decomposition step the fraction percolation of the DOC
+        in a layer (including the inflow from above) moves to the layer below.
+        The transport loops over the layers in Python, with numpy operations over
+        all profiles for each layer.
+
+        :param dt: Time step in days
+        :param T: Temperature in °C, scalar or array of the batch shape
+        :param wetness: Wetness in m3/m3, scalar or array of the batch shape
+        :param pH: pH-Value of the soil, scalar or array of the batch shape
+        :param percolation: Fraction of the DOC of a layer moving to the next layer
+            in one time step, scalar or array (broadcastable to the batch shape)
+        :param max_turnover: If given, integrate_multirate is used, otherwise integrate
+        :return: The outflow rates as SOMBatch. Its DOC is the DOC percolating from each layer
+            to the next in kg/day, for the last layer this is the leaching from the profile.
+        """
+        if not self.shape:
+            raise ValueError('integrate_profile needs the layers as the last axis of the batch')
+        DOC = self.network.index('DOC')
+        doc = self.C_pools[..., DOC].astype(np.float64)
+        if max_turnover is None:
+            flux = self.integrate(dt, T, wetness, pH)
+        else:
+            flux = self.integrate_multirate(dt, T, wetness, pH, max_turnover)
+        doc += flux.C_pools[..., DOC] * dt
+        percolation = np.broadcast_to(percolation, self.shape)
+        inflow = np.zeros(self.shape[:-1])
+        for layer in range(self.shape[-1]):
+            available = doc[..., layer] + inflow
+            if self.ledger is not None:
+                # The ledger got all DOC as outflow, but only the percolation leaves the layer
+                self.ledger.C_input[..., layer] += inflow
+                self.ledger.outflow[..., layer, DOC] -= doc[..., layer]
+            inflow = percolation[..., layer] * available
+            self.C_pools[..., layer, DOC] = available - inflow
+            flux.C_pools[..., layer, DOC] = inflow / dt
+            if self.ledger is not None:
+                self.ledger.outflow[..., layer, DOC] += inflow
+        return flux
+
+    def run(self, dt, T, wetness, pH, inputs=None, max_turnover=None, percolation=None, aggregate=None):
+        """
+        Integrates all states over a series of time steps
+
+        The forcing and inputs are arrays with the time step as first axis,
+        scalars are used for all time steps.
+
+        The time loop runs in Python and each step is a few numpy operations on
+        the whole batch. There are no Python calls per state and no user callbacks,
+        but a fixed overhead per time step: use large batches rather than many
+        steps of small batches.
+
+        :param dt: Time step in days
+        :param T: Temperature in °C
+        :param wetness: Wetness in m3/m3
+        :param pH: pH-Value of the soil
+        :param inputs: A SOMBatch with the input of each time step (time as first axis),
+            eg. from InputSchedule.compile. The input is added before each step.
+        :param max_turnover: If given, integrate_multirate is used with this max_turnover,
+            otherwise integrate
+        :param percolation: If given, the batch is integrated as profiles with DOC transport
+            between the layers, see integrate_profile
+        :param aggregate: A sequence of aggregators (see decomp.aggregate), updated after
+            each time step. If given, the outflow of each step is not stored
+        :return: SOMBatch of the outflow rates (time as first axis) or, with aggregate,
+            a dict of the aggregator results by name
+        """
+        steps, forcing = time_series(T, wetness, pH, inputs)
+        if aggregate is None:
+            flux = SOMBatch.zeros((steps,) + self.shape, self.network)
+        for i in range(steps):
+            if inputs is not None:
+                self.add_input(inputs[i])
+            if percolation is not None:
+                step_flux = self.integrate_profile(dt, *(f[i] for f in forcing),
+                                                   percolation=percolation, max_turnover=max_turnover)
+            elif max_turnover is None:
+                step_flux = self.integrate(dt, *(f[i] for f in forcing))
+            else:
+                step_flux = self.integrate_multirate(dt, *(f[i] for f in forcing), max_turnover=max_turnover)
+            if aggregate is None:
+                flux[i] = step_flux
+            else:
+                for aggregator in aggregate:
+                    aggregator.update(self, step_flux, dt)
+        if aggregate is None:
+            return flux
+        for aggregator in aggregate:
+            aggregator.finish()
+        return dict((aggregator.name, aggregator.result()) for aggregator in aggregate)
@@ -0,0 +1,196 @@
+# -*- coding: utf-8 -*-
+"""
+Batched calibration of the SOM component parameters
+
+A Calibration runs a whole population of candidate parameter vectors in one
+SOMBatch, with the population as first and the observed sites (eg. litterbags)
+as second axis of the batch shape. The forcing and the inputs are prepared
+once and shared by all evaluations.
+
+Observations are compared to the simulation by objectives, each returns the
+Gaussian log likelihood of its observations for every member of the population:
+
+- MassRemaining: stored C relative to the initial C, eg. litterbag mass loss
+- CO2Flux: respiration in mass / day
+- CNRatio: C/N ratio of the stored SOM
+
+>>> calib = Calibration(initial, [('k_pot', decomp.EDC), ('k_pot', decomp.CELL)],
+...                     dt=1.0, T=T, wetness=wetness, pH=pH,
+...                     objectives=[MassRemaining(steps, values, sigma=0.05)])
+>>> calib.loglikelihood(population)  # population has the shape (members, parameters)
+
+Population based optimisers work on the whole population at once, eg.:
+
+>>> scipy.optimize.differential_evolution(lambda x: calib.cost(x.T), bounds, vectorized=True)
+"""
+from __future__ import division, print_function, absolute_import, unicode_literals
+
+import numpy as np
+
+from .batch import SOMBatch, Network, time_series
+
+
+class Objective(object):
+    """Base class of the objectives, compares a simulated variable with observations"""
+    variable = None
+
+    def __init__(self, steps, values, sites=0, sigma=1.0):
+        """
+        :param steps: Index of the time step of each observation. The state is taken after the step
+        :param values: The observed values
+        :param sites: Index of the site of each observation
+        :param sigma: Standard deviation of the observation error, scalar or per observation
+        """
+        self.steps = np.asarray(steps, dtype=int)
+        self.values = np.asarray(values, dtype=float)
+        self.sites = np.broadcast_to(np.asarray(sites, dtype=int), self.steps.shape)
+        self.sigma = np.broadcast_to(np.asarray(sigma, dtype=float), self.steps.shape)
+
+    def simulated(self, record):
+        """
+        Returns the simulated values at the observations
+
+        :param record: dict of simulated arrays with the shape (steps, population, sites)
+        :return: Array of the shape (population, observations)
+        """
+        return record[self.variable][self.steps, :, self.sites].T
+
+    def residuals(self, record):
+        return self.simulated(record) - self.values
+
+    def __call__(self, record):
+        """The Gaussian log likelihood of the observations for each member of the population"""
+        sim = self.simulated(record)
+        z = (sim - self.values) / self.sigma
+        loglik = -0.5 * (z ** 2).sum(axis=-1) - np.log(self.sigma * np.sqrt(2 * np.pi)).sum()
+        return np.where(np.isfinite(loglik), loglik, -np.inf)
+
+
+class MassRemaining(Objective):
+    """The stored C relative to the initial stored C of the site"""
+    variable = 'mass_remaining'
+
+
+class CO2Flux(Objective):
+    """The CO2 flux in mass per day"""
+    variable = 'CO2'
+
+
+class CNRatio(Objective):
+    """The C/N ratio of the stored SOM"""
+    variable = 'CN'
+
+
+class Calibration(object):
+    """Evaluates many parameter vectors in one batched run against observations"""
+
+    def __init__(self, initial, parameters, dt, T, wetness, pH, inputs=None, objectives=(), network=None):
+        """
+        :param initial: SOMBatch (or sequence of SOM) with the initial state of each site, shape (sites,)
+        :param parameters: Sequence of the calibrated parameters, as tuple (parameter name, component)
+            for component parameters or 'CNmin' / 'CNmax', like TangentLinear
+        :param dt: Time step in days
+        :param T, wetness, pH: The forcing, scalars or arrays of the shape (steps,) or (steps, sites)
+        :param inputs: None or SOMBatch with the inputs of each time step, shape (steps,) or (steps, sites)
+        :param objectives: Sequence of Objective
+        :param network: The component network with the parameters not calibrated, default Network()
+        """
+        self.network = network or Network()
+        if not isinstance(initial, SOMBatch):
+            initial = SOMBatch.from_soms(initial, self.network)
+        if len(initial.shape) != 1:
+            raise ValueError('The initial states need the shape (sites,)')
+        self.initial = initial
+        self.parameters = []
+        for param in parameters:
+            if param in ('CNmin', 'CNmax'):
+                self.parameters.append((param, None))
+            else:
+                name, component = param
+                if name not in Network.parameters:
+                    raise ValueError('{} is not a parameter of a SOM component'.format(name))
+                self.parameters.append((name, self.network.index(component)))
+        self.dt = dt
+        # The forcing is prepared once for all evaluations, with the shape (steps, 1, sites)
+        self.steps, forcing = time_series(T, wetness, pH, inputs)
+        self.forcing = [np.ascontiguousarray(np.broadcast_to(f.reshape((self.steps, -1))[:, np.newaxis, :],
+                                                             (self.steps, 1) + initial.shape))
+                        for f in forcing]
+        self.inputs = inputs
+        self.objectives = list(objectives)
+
+    def make_network(self, population):
+        """
+        Creates a network with the parameters of each member of the population
+
+        :param population: Array of parameter vectors, shape (members, parameters)
+        :return: Network with parameter arrays of the shape (members, 1, components)
+        """
+        population = np.atleast_2d(np.asarray(population, dtype=float))
+        if population.shape[1] != len(self.parameters):
+            raise ValueError('The population needs {} parameters, got {}'
+                             .format(len(self.parameters), population.shape[1]))
+        members = len(population)
+        net = self.network.copy()
+        for param in Network.parameters:
+            setattr(net, param, np.tile(getattr(net, param), (members, 1, 1)))
+        net.CNmin = np.full((members, 1), self.network.CNmin, dtype=float)
+        net.CNmax = np.full((members, 1), self.network.CNmax, dtype=float)
+        for k, (name, index) in enumerate(self.parameters):
+            if index is None:
+                getattr(net, name)[:, 0] = population[:, k]
+            else:
+                getattr(net, name)[:, 0, index] = population[:, k]
+        return net
+
+    def simulate(self, population):
+        """
+        Runs all members of the population for all sites in one batch
+
+        :param population: Array of parameter vectors, shape (members, parameters)
+        :return: dict of the arrays 'C', 'mass_remaining', 'CO2', 'DOC', 'N' (N release) and 'CN',
+            each of the shape (steps, members, sites)
+        """
+        net = self.make_network(population)
+        members = len(net.CNmin)
+        shape = (members,) + self.initial.shape
+        batch = SOMBatch(np.broadcast_to(self.initial.C_pools, shape + (len(net),)).copy(),
+                         np.broadcast_to(self.initial.N, shape).copy(), net)
+        C0 = batch.C
+        record = dict((name, np.zeros((self.steps,) + shape))
+                      for name in ('C', 'mass_remaining', 'CO2', 'DOC', 'N', 'CN'))
+        CO2, DOC = net.index('CO_2'), net.index('DOC')
+        for i in range(self.steps):
+            if self.inputs is not None:
+                batch += self.inputs[i]
+            flux = batch.integrate(self.dt, *(f[i] for f in self.forcing))
+            record['C'][i] = batch.C
+            record['CN'][i] = batch.CN
+            record['CO2'][i] = flux.C_pools[..., CO2]
+            record['DOC'][i] = flux.C_pools[..., DOC]
+            record['N'][i] = flux.N
+        with np.errstate(divide='ignore', invalid='ignore'):
+            record['mass_remaining'] = record['C'] / C0
+        return record
+
+    def loglikelihood(self, population):
+        """
+        The sum of the log likelihood of all objectives for each member of the population
+
+        :param population: Array of parameter vectors, shape (members, parameters)
+        :return: Array of the shape (members,)
+        """
+        if not self.objectives:
+            raise ValueError('The calibration has no objectives')
+        record = self.simulate(population)
+        return sum(objective(record) for objective in self.objectives)
+
+    def cost(self, population):
+        """
+        The negative log likelihood for minimizers
+
+        A single parameter vector returns a float, a population an array
+        """
+        population = np.asarray(population, dtype=float)
+        cost = -self.loglikelihood(population)
+        return float(cost[0]) if population.ndim == 1 else cost
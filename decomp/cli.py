@@ -0,0 +1,409 @@
+# -*- coding: utf-8 -*-
+"""
+Command line runner for scenario files
+
+The console script decomp (or python -m decomp.cli) runs the scenarios of a
+JSON file in parallel processes and streams the results of each scenario to a
+CSV file in the output directory:
+
+    decomp scenarios.json --output results --jobs 4 --summary results/summary.json
+
+A scenario file contains a list of scenarios and optional defaults for all scenarios.
+Relative file names are relative to the scenario file:
+
+    {
+      "defaults": {"start": "2000-01-01", "end": "2019-01-01", "dt": 1.0,
+                   "forcing": {"file": "weather.csv", "T": "T", "wetness": "wetness", "pH": 5.5}},
+      "scenarios": [
+        {"name": "control",
+         "initial": [{"template": "leave_litter", "mass": 1.0}, {"pools": {"RECALC": 5.0}, "N": 0.2}],
+         "litter": [{"template": "leave_litter", "mass": 1.0, "day": 270},
+                    {"template": "root_litter", "rate": 0.0014},
+                    {"template": "wood_litter", "times": ["2005-03-01"], "masses": [2.0]}],
+         "parameters": {"CNmin": 12.0, "k_pot": {"LIGN": 0.3}}},
+        {"name": "warm", "forcing": {"T": "T_warm"}, "output_every": 30}
+      ]
+    }
+
+Keys of a scenario:
+
+- name: The name of the scenario and of its output file (required)
+- start, end, dt: The first time step (date or day), the end (exclusive) and the time step in days.
+  Instead of end, steps may give the number of time steps
+- initial: The initial state, a list with one entry per state (or a single entry). An entry
+  is a template {"template": "leave_litter", "mass": 1.0}, pools {"pools": {"EDC": 1.0}, "N": 0.02}
+  or a file {"file": "initial.npy"} with an array of the pools and N, see SOMBatch.from_array
+- litter: The litter input, a list of constant inputs (rate per day), periodic events
+  (mass and day of the year) and event tables (times and masses), see decomp.InputSchedule
+- forcing: T, wetness and pH, each a number, a list of values per time step or the name of a
+  column of the forcing file (CSV with a header line, or npz)
+- parameters: CNmin, CNmax and component parameters of the Network by component name
+- max_turnover, percolation: See SOMBatch.run
+- output_every: Number of time steps between the output rows (default 1), the fluxes are
+  the mean over these steps
+
+Nested dictionaries of the defaults are merged with the scenario.
+
+The output file has a row for each output time and state with the stored pools, N, C and
+CN at the end of the interval and the mean fluxes of CO_2, DOC and N_release in mass per day.
+
+Exit status: 0 if all scenarios succeeded, 1 if a scenario failed, 2 for an invalid
+scenario file or command line, 130 if interrupted.
+"""
+from __future__ import division, print_function, absolute_import, unicode_literals
+
+import argparse
+import json
+import os
+import sys
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+from . import decomp, aggregate
+from .batch import SOMBatch, Network
+from .inputs import InputSchedule, as_days
+
+EXIT_OK = 0
+EXIT_FAILED = 1
+EXIT_USAGE = 2
+EXIT_INTERRUPTED = 130
+
+
+class ScenarioError(ValueError):
+    pass
+
+
+def merge(defaults, scenario):
+    """Returns the scenario with the missing keys from defaults, nested dictionaries are merged"""
+    res = dict(defaults)
+    for key, value in scenario.items():
+        if isinstance(value, dict) and isinstance(res.get(key), dict):
+            res[key] = merge(res[key], value)
+        else:
+            res[key] = value
+    return res
+
+
+def load_scenarios(path):
+    """
+    Reads a scenario file
+
+    :param path: The name of the JSON file
+    :return: The list of scenarios, the defaults merged into each and the file names made absolute
+    """
+    with open(path) as f:
+        try:
+            content = json.load(f)
+        except ValueError as e:
+            raise ScenarioError('{} is not valid JSON: {}'.format(path, e))
+    if isinstance(content, list):
+        content = dict(scenarios=content)
+    defaults = content.get('defaults', {})
+    scenarios = [merge(defaults, s) for s in content.get('scenarios', [])]
+    if not scenarios:
+        raise ScenarioError('{} contains no scenarios'.format(path))
+    names = [s.get('name') for s in scenarios]
+    if None in names:
+        raise ScenarioError('Each scenario needs a name')
+    duplicates = sorted(set(n for n in names if names.count(n) > 1))
+    if duplicates:
+        raise ScenarioError('Duplicate scenario names: ' + ', '.join(duplicates))
+    for s in scenarios:
+        s['base'] = os.path.dirname(os.path.abspath(path))
+    return scenarios
+
+
+def _path(scenario, filename):
+    return os.path.join(scenario.get('base', ''), filename)
+
+
+def _time(value):
+    """A date string or a day as float days"""
+    if isinstance(value, str):
+        return float(as_days(np.datetime64(value)))
+    return float(value)
+
+
+def _dates(days):
+    """Days since 1970-01-01 as datetime64 with minute resolution"""
+    return np.datetime64('1970-01-01T00:00') + np.round(np.asarray(days) * 1440).astype('timedelta64[m]')
+
+
+def time_steps(scenario):
+    """The start times of the time steps in days and a flag, if the times are dates"""
+    dt = float(scenario.get('dt', 1.0))
+    start = scenario.get('start', 0.0)
+    first = _time(start)
+    if 'steps' in scenario:
+        steps = int(scenario['steps'])
+    elif 'end' in scenario:
+        steps = int(np.ceil((_time(scenario['end']) - first) / dt - 1e-9))
+    else:
+        raise ScenarioError('{}: needs end or steps'.format(scenario['name']))
+    if steps < 1:
+        raise ScenarioError('{}: no time steps'.format(scenario['name']))
+    return first + np.arange(steps) * dt, isinstance(start, str)
+
+
+def network(scenario):
+    """The Network with the parameter overrides of the scenario"""
+    net = Network()
+    for key, value in scenario.get('parameters', {}).items():
+        if key in ('CNmin', 'CNmax'):
+            setattr(net, key, float(value))
+        elif key in Network.parameters:
+            for component, v in value.items():
+                getattr(net, key)[net.index(component)] = float(v)
+        else:
+            raise ScenarioError('{}: unknown parameter {}'.format(scenario['name'], key))
+    return net
+
+
+def _template(name):
+    templates = dict(leave_litter=decomp.leave_litter, wood_litter=decomp.wood_litter,
+                     root_litter=decomp.root_litter, pure_DOC=decomp.pure_DOC)
+    if name not in templates:
+        raise ScenarioError('Unknown template {}, use one of {}'.format(name, ', '.join(sorted(templates))))
+    return templates[name]()
+
+
+def initial_state(scenario, net):
+    """The initial states as SOMBatch with the shape (states,)"""
+    entries = scenario.get('initial', [])
+    if isinstance(entries, dict):
+        entries = [entries]
+    states = []
+    for entry in entries:
+        if 'file' in entry:
+            values = np.load(_path(scenario, entry['file']))
+            states.append(SOMBatch.from_array(np.atleast_2d(values), net))
+            continue
+        state = SOMBatch.zeros((1,), net)
+        if 'template' in entry:
+            state.add_scaled(_template(entry['template']), entry.get('mass', 1.0))
+        for component, value in entry.get('pools', {}).items():
+            state.C_pools[..., net.index(component)] += value
+        if 'N' in entry:
+            state.N[:] += entry['N']
+        states.append(state)
+    if not states:
+        return SOMBatch.zeros((1,), net)
+    return SOMBatch(np.concatenate([s.C_pools for s in states]), np.concatenate([s.N for s in states]), net)
+
+
+def litter_input(scenario, net, times, dates):
+    """The litter input of each time step as SOMBatch, or None without litter"""
+    litter = scenario.get('litter', [])
+    if not litter:
+        return None
+    schedule = InputSchedule(net)
+    for entry in litter:
+        template = _template(entry['template'])
+        if 'rate' in entry:
+            schedule.add_constant(template, entry['rate'])
+        elif 'day' in entry:
+            schedule.add_periodic(template, entry['mass'], entry['day'], entry.get('period', 365.0))
+        elif 'times' in entry:
+            schedule.add_events(template, np.array([_time(t) for t in entry['times']]), entry['masses'])
+        else:
+            raise ScenarioError('{}: a litter input needs rate, day or times'.format(scenario['name']))
+    if dates:
+        # Periodic inputs need the dates for the day of the year
+        times = _dates(times)
+    return schedule.compile(times, float(scenario.get('dt', 1.0)))
+
+
+def _read_table(filename):
+    if filename.endswith('.npz'):
+        with np.load(filename) as data:
+            return dict((key, data[key]) for key in data.files)
+    table = np.genfromtxt(filename, delimiter=',', names=True, dtype=None, encoding='utf-8')
+    return dict((key, table[key]) for key in table.dtype.names)
+
+
+def forcing(scenario, steps):
+    """The forcing T, wetness, pH as arrays with the time steps as first axis"""
+    spec = dict(scenario.get('forcing', {}))
+    table = _read_table(_path(scenario, spec['file'])) if 'file' in spec else {}
+    res = []
+    for variable in ('T', 'wetness', 'pH'):
+        if variable not in spec:
+            raise ScenarioError('{}: the forcing needs {}'.format(scenario['name'], variable))
+        value = spec[variable]
+        if isinstance(value, str):
+            if value not in table:
+                raise ScenarioError('{}: column {} not in the forcing file'.format(scenario['name'], value))
+            value = table[value]
+        value = np.asarray(value, dtype=float)
+        if value.ndim and len(value) < steps:
+            raise ScenarioError('{}: {} has {} values for {} time steps'
+                                .format(scenario['name'], variable, len(value), steps))
+        res.append(value[:steps] if value.ndim else np.full(steps, value))
+    return res
+
+
+class CSVWriter(object):
+    """Writes the output rows of a scenario, one line per output time and state"""
+
+    def __init__(self, filename, net, dates):
+        self.file = open(filename, 'w')
+        self.net = net
+        self.dates = dates
+        self.stored = [i for i, s in enumerate(net.is_stored) if s]
+        self.fluxes = [i for i, s in enumerate(net.is_stored) if not s]
+        columns = (['time', 'state'] + [net.names[i] for i in self.stored] + ['N', 'C', 'CN'] +
+                   [net.names[i] for i in self.fluxes] + ['N_release'])
+        self.file.write(','.join(columns) + '\n')
+
+    def write(self, ends, states, fluxes):
+        """
+        Writes the states and the mean fluxes of output intervals
+
+        :param ends: The end time of each interval
+        :param states: The states at the end of the intervals, SOMBatch with the shape (intervals, states)
+        :param fluxes: The mean fluxes of the intervals, SOMBatch with the shape (intervals, states)
+        """
+        with np.errstate(divide='ignore', invalid='ignore'):
+            values = np.concatenate([states.C_pools[..., self.stored], states.N[..., np.newaxis],
+                                     states.C[..., np.newaxis], states.CN[..., np.newaxis],
+                                     fluxes.C_pools[..., self.fluxes], fluxes.N[..., np.newaxis]], axis=-1)
+        index = np.arange(values.shape[1])
+        for end, rows in zip(ends, values):
+            label = str(_dates(end)) if self.dates else '{:g}'.format(end)
+            np.savetxt(self.file, np.column_stack([index, rows]), fmt=[label + ',%d'] + ['%.10g'] * rows.shape[1],
+                       delimiter=',')
+        self.file.flush()
+
+    def close(self):
+        self.file.close()
+
+
+def run_scenario(scenario, output, check=False):
+    """
+    Runs a scenario and writes the output file, used by the worker processes
+
+    :param scenario: The scenario as dictionary, see module documentation
+    :param output: The output directory
+    :param check: If True, the mass balance is checked at the end
+    :return: dict with name, status, steps, states, seconds and error
+    """
+    start = time.time()
+    name = scenario.get('name')
+    result = dict(name=name, status='ok', steps=0, states=0, seconds=0.0, error=None)
+    try:
+        times, dates = time_steps(scenario)
+        net = network(scenario)
+        batch = initial_state(scenario, net)
+        inputs = litter_input(scenario, net, times, dates)
+        T, wetness, pH = forcing(scenario, len(times))
+        dt = float(scenario.get('dt', 1.0))
+        every = int(scenario.get('output_every', 1))
+        result.update(steps=len(times), states=batch.shape[0])
+        ledger = batch.attach_ledger() if check else None
+        # The states and mean fluxes of the output intervals are collected for chunks
+        # of about a million values, before they are written
+        interval = every * dt
+        state = aggregate.Last(lambda s, f: s.to_array(), interval)
+        flux = aggregate.Mean(lambda s, f: f.to_array(), interval)
+        chunk = every * max(1, 2 ** 20 // (2 * batch.C_pools.size))
+        writer = CSVWriter(os.path.join(output, name + '.csv'), net, dates)
+        try:
+            for first in range(0, len(times), chunk):
+                part = slice(first, min(first + chunk, len(times)))
+                batch.run(dt, T[part], wetness[part], pH[part],
+                          inputs=None if inputs is None else inputs[part],
+                          max_turnover=scenario.get('max_turnover'),
+                          percolation=scenario.get('percolation'),
+                          aggregate=[state, flux])
+                ends = times[first] + np.array(state.times)
+                writer.write(ends, SOMBatch.from_array(state.result(), net), SOMBatch.from_array(flux.result(), net))
+                state.reset()
+                flux.reset()
+        finally:
+            writer.close()
+        if ledger is not None:
+            ledger.check(batch)
+    except Exception as e:
+        result.update(status='failed', error='{}: {}'.format(type(e).__name__, e),
+                      traceback=traceback.format_exc())
+    result['seconds'] = time.time() - start
+    return result
+
+
+def summary_table(results, wall):
+    """The timing summary as text"""
+    lines = ['{:<24s} {:<7s} {:>8s} {:>7s} {:>10s} {:>14s}'.format('scenario', 'status', 'steps', 'states',
+                                                                     'seconds', 'state steps/s')]
+    for r in results:
+        rate = r['steps'] * r['states'] / r['seconds'] if r['seconds'] > 0 else 0.0
+        lines.append('{:<24s} {:<7s} {:>8d} {:>7d} {:>10.3f} {:>14.4g}'.format(
+            r['name'], r['status'], r['steps'], r['states'], r['seconds'], rate))
+    failed = sum(r['status'] != 'ok' for r in results)
+    lines.append('{} scenarios, {} failed, wall time {:.3f} s, cpu time {:.3f} s'.format(
+        len(results), failed, wall, sum(r['seconds'] for r in results)))
+    return '\n'.join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='decomp', description='Runs the DECOMP scenarios of a JSON file')
+    parser.add_argument('scenarios', help='The scenario file (JSON)')
+    parser.add_argument('-o', '--output', default='.', help='Output directory for the CSV files')
+    parser.add_argument('-j', '--jobs', type=int, default=os.cpu_count() or 1,
+                        help='Number of parallel processes (default: number of CPUs)')
+    parser.add_argument('-s', '--select', nargs='+', metavar='NAME', help='Run only these scenarios')
+    parser.add_argument('--summary', help='Writes the results and timing as JSON to this file')
+    parser.add_argument('--check', action='store_true', help='Check the C and N mass balance of each scenario')
+    parser.add_argument('-q', '--quiet', action='store_true', help='Print only errors')
+    args = parser.parse_args(argv)
+
+    try:
+        scenarios = load_scenarios(args.scenarios)
+        if args.select:
+            missing = set(args.select) - set(s['name'] for s in scenarios)
+            if missing:
+                raise ScenarioError('Unknown scenarios: ' + ', '.join(sorted(missing)))
+            scenarios = [s for s in scenarios if s['name'] in args.select]
+        if not os.path.isdir(args.output):
+            os.makedirs(args.output)
+    except (IOError, OSError, ScenarioError) as e:
+        print('decomp: error: {}'.format(e), file=sys.stderr)
+        return EXIT_USAGE
+
+    start = time.time()
+    results = []
+
+    def report(result):
+        results.append(result)
+        if result['status'] != 'ok':
+            print('{name}: {error}'.format(**result), file=sys.stderr)
+        elif not args.quiet:
+            print('{name}: ok ({seconds:.3f} s)'.format(**result), file=sys.stderr)
+
+    try:
+        if args.jobs <= 1 or len(scenarios) == 1:
+            for scenario in scenarios:
+                report(run_scenario(scenario, args.output, args.check))
+        else:
+            with ProcessPoolExecutor(max_workers=min(args.jobs, len(scenarios))) as executor:
+                futures = [executor.submit(run_scenario, s, args.output, args.check) for s in scenarios]
+                for future in as_completed(futures):
+                    report(future.result())
+    except KeyboardInterrupt:
+        print('decomp: interrupted', file=sys.stderr)
+        return EXIT_INTERRUPTED
+    wall = time.time() - start
+    order = [s['name'] for s in scenarios]
+    results.sort(key=lambda r: order.index(r['name']))
+    if not args.quiet:
+        print(summary_table(results, wall), file=sys.stderr)
+    if args.summary:
+        with open(args.summary, 'w') as f:
+            json.dump(dict(wall=wall, scenarios=results), f, indent=2)
+    return EXIT_OK if all(r['status'] == 'ok' for r in results) else EXIT_FAILED
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -2,6 +2,7 @@
 """ Module for interfacing decomp++ with cmf (Versions of late Oct. 2009) """
 from __future__ import division, print_function, absolute_import, unicode_literals
 import decomp
+from decomp import temperature, mixing
 import numpy as np
 
 
@@ -27,32 +28,47 @@ class CmfConnector(object):
                                if l.upper_boundary < max_Corg_depth]
         self.T_profile = np.ones(c.layer_count()) * T_avg
         self.T_depth = 2.0
+        self.upper_boundary = np.array([l.upper_boundary for l in c.layers][:len(self.__decomplayers)])
+        # If None, the layer temperature is the damped air temperature, see decomp.temperature.damped
+        # Use eg. temperature.HeatConduction for conduction between the layers
+        self.temperature_model = None
         self.pH = 7.0
+        self.leave_litter = decomp.leave_litter()
+        self.wood_litter = decomp.wood_litter()
+        self.root_litter = decomp.root_litter()
+        # Aggregators (see decomp.aggregate), updated by run with the layers as batch
+        self.aggregators = []
+        self.network = decomp.Network()
 
     def depose_litter(self, leave_mass, wood_mass):
         """Deposes leaves and wood at the first layer
         leave_mass = Fallen leaves in g/m2
         wood_mass = Fallen wood in g/m2
         """
-        self.__decomplayers[0] += leave_mass * decomp.leave_litter()
-        self.__decomplayers[0] += wood_mass * decomp.wood_litter()
+        self.__decomplayers[0].add_scaled(self.leave_litter, leave_mass)
+        self.__decomplayers[0].add_scaled(self.wood_litter, wood_mass)
 
     def depose_root(self, root_mass):
-        for i in range(len(self.__decomplayers)):
-            self.__decomplayers[i] += root_mass[i] * decomp.root_litter()
+        """Deposes root litter in the layers
+        root_mass = Root litter of each layer in g/m2, at least one value per decomp layer.
+            Values for the cmf layers below the decomp layers are ignored
+        """
+        root_mass = np.atleast_1d(root_mass)
+        if len(root_mass) < len(self.__decomplayers):
+            raise ValueError('root_mass has {} values, but there are {} decomp layers'
+                             .format(len(root_mass), len(self.__decomplayers)))
+        for l, mass in zip(self.__decomplayers, root_mass):
+            l.add_scaled(self.root_litter, mass)
 
     def plow(self, plowdepth=0.3):
         """Homogenizes the Corg content in all layers where the upper boundary
         is smaller than the plow depth
         """
-        plowlayers = [
-            l for l in self.cmf_cell.layers if l.upper_boundary < plowdepth - 0.01]
-        sumSOM = decomp.SOM()
-        for l in plowlayers:
-            sumSOM += self[l]
-        sumdepth = sum(l.thickness for l in plowlayers)
-        for l in plowlayers:
-            self[l] = sumSOM * (l.thickness / sumdepth)
+        layers = list(self.cmf_cell.layers)[:len(self.__decomplayers)]
+        thickness = np.array([l.thickness for l in layers])
+        state = self.state
+        state.mix(mixing.plow_matrix(thickness, self.upper_boundary, plowdepth))
+        self.state = state
 
     def __getitem__(self, index):
         if hasattr(index, "Position"):
@@ -75,19 +91,39 @@ class CmfConnector(object):
         return [l.C for l in self.__decomplayers]
 
     def __setCpool(self, value):
-        for i, l in enumerate(self.__decomplayers):
-            if (i < len(value)):
-                l[decomp.RC] = value[i]
-                l.N = value[i] / 20.
-            else:
-                l[decomp.RC] = 0.0
+        values = np.array([l.to_array() for l in self.__decomplayers])
+        value = np.asarray(value, dtype=float)[:len(values)]
+        values[:, decomp.RC.Id] = 0.0
+        values[:len(value), decomp.RC.Id] = value
+        values[:len(value), -1] = value / 20.
+        self.state = values
 
     Cpool = property(__getCpool, __setCpool, "Mass of carbon per m²")
 
+    def __getstate(self):
+        return decomp.SOMBatch.from_array(np.array([l.to_array() for l in self.__decomplayers]), self.network)
+
+    def __setstate(self, value):
+        if isinstance(value, decomp.SOMBatch):
+            value = value.to_array()
+        for som, values in zip(self.__decomplayers, np.atleast_2d(value)):
+            som.set_from_array(values)
+
+    state = property(__getstate, __setstate, doc="""The SOM of the layers as SOMBatch (a copy).
+    Set with a SOMBatch or an array of the pools and N of each layer, see SOM.to_array.
+    The SOM objects of the layers are changed in place""")
+
     def run(self, T, dt=1 / 24):
         """Runs the decomp model for time step dt (a float in days)
         """
         N, DOC = self.cmf_cell.project.solutes
+        n = len(self.__decomplayers)
+        # set Temperature of the layers
+        if self.temperature_model is None:
+            self.T_profile[:n] = temperature.damped(T, self.T_profile[:n], self.upper_boundary, self.T_depth)
+        else:
+            self.temperature_model(T, self.T_profile, dt)
+        rates = []
         for i, l in enumerate(self.cmf_cell.layers):
             if i + 1 > len(self.__decomplayers):
                 break
@@ -95,10 +131,6 @@ class CmfConnector(object):
             fieldcapacity = l.soil.Wetness_pF([1.8])[0]
             # set wetness of decomp layer
             wetness = min(1, l.wetness / fieldcapacity)
-            # get T damping factor
-            fT = 365**(-l.upper_boundary / self.T_depth)
-            # set Temperature of layer
-            self.T_profile[i] = fT * T + (1 - fT) * self.T_profile[i]
             # set DOC input
             # DOC precipitation currently disabled
             self.__decomplayers[i][decomp.DOC] = l[DOC].state
@@ -107,5 +139,11 @@ class CmfConnector(object):
             # Update cmf
             l[N].source = decomp_rate.N
             l[DOC].source = decomp_rate[decomp.DOC]
+            rates.append(decomp_rate)
+        if self.aggregators:
+            state = decomp.SOMBatch.from_soms(self.__decomplayers, self.network)
+            flux = decomp.SOMBatch.from_soms(rates, self.network)
+            for aggregator in self.aggregators:
+                aggregator.update(state, flux, dt)
 
 
@@ -0,0 +1,287 @@
+# -*- coding: utf-8 -*-
+"""
+Coupling of the decomposition of a soil profile with a hydrological model
+
+The hydrological model is accessed by a backend with a small protocol
+(see HydrologyBackend):
+
+- advance(dt): advances the hydrology by dt days and returns the LayerState
+  (air temperature, wetness and DOC of each layer)
+- set_sources(N, DOC): sets the N and DOC source of each layer in mass per day
+- upper_boundary: the upper boundary of the layers in m
+
+The CouplingDriver integrates the SOM of the layers between the hydrological
+steps. With pipelined=True, the decomposition of step n is calculated while the
+backend advances step n + 1 in a worker thread, with the sources of step n - 1
+(lagged by one step). Backends that release the GIL (eg. a C solver, I/O or
+another process) overlap with the decomposition.
+
+Two backends are available:
+
+- FakeHydrology: a simple in-process bucket model, eg. for tests and benchmarks without cmf
+- CmfHydrology: a cmf cell with the solutes N and DOC, like CmfConnector
+
+>>> backend = FakeHydrology(layers=20)
+>>> driver = CouplingDriver(backend, decomp.SOMBatch.zeros((20,)), pH=6.0)
+>>> flux = driver.run(steps=24 * 365, dt=1 / 24)
+>>> driver.timing
+"""
+from __future__ import division, print_function, absolute_import, unicode_literals
+
+import collections
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from .batch import SOMBatch
+from .temperature import DampedTemperature
+
+
+LayerState = collections.namedtuple('LayerState', 'T wetness DOC')
+LayerState.__doc__ = """
+The state of the layers after a hydrological step
+
+T: The air temperature in °C
+wetness: The wetness of each layer relative to the field capacity (0..1)
+DOC: The DOC in the soil water of each layer in mass
+"""
+
+
+class HydrologyBackend(object):
+    """The protocol of the hydrology backends of the CouplingDriver"""
+    # The upper boundary of the layers in m
+    upper_boundary = None
+
+    def __len__(self):
+        return len(self.upper_boundary)
+
+    def advance(self, dt):
+        """
+        Advances the hydrology by dt with the actual sources
+
+        :param dt: Time step in days
+        :return: The LayerState at the end of the step
+        """
+        raise NotImplementedError
+
+    def set_sources(self, N, DOC):
+        """
+        Sets the sources of the layers for the next steps
+
+        :param N: N source of each layer in mass per day
+        :param DOC: DOC source of each layer in mass per day
+        """
+        raise NotImplementedError
+
+
+class FakeHydrology(HydrologyBackend):
+    """
+    A simple bucket model of a soil profile as in-process stand-in for a hydrological model
+
+    Rain events fill the top layer, the water percolates downwards with a rate
+    increasing with the wetness and carries the solutes N and DOC with it. The
+    air temperature follows a yearly and a daily cycle. The model is deterministic.
+    """
+
+    def __init__(self, layers=20, thickness=0.05, T_avg=8.0, T_amplitude=10.0, rain_interval=7.0,
+                 rain=25.0, porosity=0.5, percolation=0.2, delay=0.0):
+        """
+        :param layers: Number of layers
+        :param thickness: Thickness of the layers in m
+        :param T_avg: Average air temperature in °C
+        :param T_amplitude: Amplitude of the yearly temperature cycle in K
+        :param rain_interval: Days between the rain events
+        :param rain: Rain per event in mm
+        :param porosity: Pore volume in m3/m3
+        :param percolation: Fraction of the water of a saturated layer draining per day
+        :param delay: Additional time in seconds each step takes, to mimic an expensive model
+        """
+        self.thickness = np.full(layers, thickness, dtype=float)
+        self.upper_boundary = np.r_[0.0, np.cumsum(self.thickness)[:-1]]
+        self.capacity = self.thickness * porosity * 1000.0  # mm
+        self.water = 0.5 * self.capacity
+        self.N = np.zeros(layers)
+        self.DOC = np.zeros(layers)
+        self.N_source = np.zeros(layers)
+        self.DOC_source = np.zeros(layers)
+        self.T_avg = T_avg
+        self.T_amplitude = T_amplitude
+        self.rain_interval = rain_interval
+        self.rain = rain
+        self.percolation = percolation
+        self.delay = delay
+        self.time = 0.0
+        # Water and solutes leaving the profile
+        self.outflow = dict(water=0.0, N=0.0, DOC=0.0)
+
+    def set_sources(self, N, DOC):
+        self.N_source[:] = N
+        self.DOC_source[:] = DOC
+
+    def air_temperature(self, t):
+        return (self.T_avg + self.T_amplitude * np.sin(2 * np.pi * (t - 100.0) / 365.0)
+                + 3.0 * np.sin(2 * np.pi * (t - 0.375)))
+
+    def advance(self, dt):
+        if self.delay:
+            time.sleep(self.delay)
+        # Rain event at the start of an interval
+        if np.floor((self.time + dt) / self.rain_interval) > np.floor(self.time / self.rain_interval):
+            self.water[0] += self.rain
+        self.N = np.maximum(self.N + self.N_source * dt, 0.0)
+        self.DOC = np.maximum(self.DOC + self.DOC_source * dt, 0.0)
+        inflow_water = inflow_N = inflow_DOC = 0.0
+        for i in range(len(self.water)):
+            water = self.water[i] + inflow_water
+            N, DOC = self.N[i] + inflow_N, self.DOC[i] + inflow_DOC
+            # Overflow of a saturated layer and drainage
+            excess = max(water - self.capacity[i], 0.0)
+            drained = excess + min(1.0, self.percolation * dt * (water - excess) / self.capacity[i]) * (water - excess)
+            fraction = drained / water if water > 0 else 0.0
+            inflow_water, inflow_N, inflow_DOC = drained, N * fraction, DOC * fraction
+            self.water[i] = water - drained
+            self.N[i], self.DOC[i] = N - inflow_N, DOC - inflow_DOC
+        for name, value in zip(('water', 'N', 'DOC'), (inflow_water, inflow_N, inflow_DOC)):
+            self.outflow[name] += value
+        self.time += dt
+        # Field capacity is at 60% of the pore volume
+        wetness = np.minimum(1.0, self.water / (0.6 * self.capacity))
+        return LayerState(self.air_temperature(self.time), wetness, self.DOC.copy())
+
+
+class CmfHydrology(HydrologyBackend):
+    """
+    A cmf cell as hydrology backend, the project needs the solutes N and DOC
+
+    requires: cmf
+    """
+
+    def __init__(self, cell, integrator, max_Corg_depth=1e308):
+        """
+        :param cell: A cmf cell with layers
+        :param integrator: A cmf integrator of the project, eg. cmf.SoluteWaterIntegrator
+        :param max_Corg_depth: Only the layers with an upper boundary above this depth are coupled
+        """
+        import cmf
+        self.cmf = cmf
+        self.cell = cell
+        self.integrator = integrator
+        self.layers = [l for l in cell.layers if l.upper_boundary < max_Corg_depth]
+        self.upper_boundary = np.array([l.upper_boundary for l in self.layers])
+        self.solutes = cell.project.solutes
+        self.fieldcapacity = np.array([l.soil.Wetness_pF([1.8])[0] for l in self.layers])
+
+    def set_sources(self, N, DOC):
+        N_solute, DOC_solute = self.solutes
+        for l, n, doc in zip(self.layers, N, DOC):
+            l[N_solute].source = n
+            l[DOC_solute].source = doc
+
+    def advance(self, dt):
+        cmf = self.cmf
+        t = self.integrator.t + dt * cmf.day
+        self.integrator(t)
+        _, DOC_solute = self.solutes
+        wetness = np.minimum(1.0, np.array([l.wetness for l in self.layers]) / self.fieldcapacity)
+        DOC = np.array([l[DOC_solute].state for l in self.layers])
+        return LayerState(self.cell.get_weather(t).T, wetness, DOC)
+
+
+class CouplingDriver(object):
+    """Runs the decomposition of the layers of a profile coupled to a hydrology backend"""
+
+    def __init__(self, backend, batch, pH=7.0, temperature_model=None, max_turnover=None, pipelined=True):
+        """
+        :param backend: A HydrologyBackend
+        :param batch: The SOM of the layers, a SOMBatch with the shape (layers,)
+        :param pH: The pH of the layers, scalar or array
+        :param temperature_model: Callable (T_air, T_profile, dt) updating the layer temperatures in
+            place, default DampedTemperature(backend.upper_boundary), see decomp.temperature
+        :param max_turnover: If given, integrate_multirate is used, otherwise integrate
+        :param pipelined: If True, the backend advances in a worker thread while the
+            decomposition is calculated
+        """
+        if batch.shape != (len(backend),):
+            raise ValueError('The batch needs the shape ({},)'.format(len(backend)))
+        self.backend = backend
+        self.batch = batch
+        self.pH = pH
+        self.temperature_model = temperature_model or DampedTemperature(backend.upper_boundary)
+        self.T_profile = None
+        self.max_turnover = max_turnover
+        self.pipelined = pipelined
+        self.timing = dict(hydrology=0.0, decomp=0.0, wait=0.0, wall=0.0)
+        self.DOC = batch.network.index('DOC')
+
+    def _advance(self, dt):
+        start = time.time()
+        state = self.backend.advance(dt)
+        self.timing['hydrology'] += time.time() - start
+        return state
+
+    def decompose(self, state, dt):
+        """
+        Integrates the SOM of the layers over a step with the state of the hydrology
+
+        :param state: The LayerState of the step
+        :param dt: Time step in days
+        :return: The outflow rates of the layers
+        """
+        start = time.time()
+        if self.T_profile is None:
+            self.T_profile = np.full(self.batch.shape, state.T, dtype=float)
+        self.temperature_model(state.T, self.T_profile, dt)
+        # The DOC of the soil water decomposes with the SOM, like in CmfConnector
+        self.batch.C_pools[..., self.DOC] = state.DOC
+        if self.max_turnover is None:
+            flux = self.batch.integrate(dt, self.T_profile, state.wetness, self.pH)
+        else:
+            flux = self.batch.integrate_multirate(dt, self.T_profile, state.wetness, self.pH,
+                                                  max_turnover=self.max_turnover)
+        self.timing['decomp'] += time.time() - start
+        return flux
+
+    def run(self, steps, dt, aggregate=None):
+        """
+        Runs the coupled models over a number of steps
+
+        :param steps: Number of time steps
+        :param dt: Time step in days
+        :param aggregate: A sequence of aggregators (see decomp.aggregate), updated after
+            each time step. If given, the outflow of each step is not stored
+        :return: SOMBatch of the outflow rates with the shape (steps, layers) or, with
+            aggregate, a dict of the aggregator results by name
+        """
+        start = time.time()
+        if aggregate is None:
+            result = SOMBatch.zeros((steps,) + self.batch.shape, self.batch.network)
+        executor = ThreadPoolExecutor(max_workers=1) if self.pipelined else None
+        try:
+            state = self._advance(dt)
+            for n in range(steps):
+                last = n + 1 == steps
+                # The backend advances step n + 1 with the sources of step n - 1
+                future = executor.submit(self._advance, dt) if executor is not None and not last else None
+                flux = self.decompose(state, dt)
+                if future is not None:
+                    wait = time.time()
+                    state = future.result()
+                    self.timing['wait'] += time.time() - wait
+                self.backend.set_sources(flux.N, flux.C_pools[..., self.DOC])
+                if executor is None and not last:
+                    state = self._advance(dt)
+                if aggregate is None:
+                    result[n] = flux
+                else:
+                    for aggregator in aggregate:
+                        aggregator.update(self.batch, flux, dt)
+        finally:
+            if executor is not None:
+                executor.shutdown()
+        self.timing['wall'] += time.time() - start
+        if aggregate is None:
+            return result
+        for aggregator in aggregate:
+            aggregator.finish()
+        return dict((aggregator.name, aggregator.result()) for aggregator in aggregate)
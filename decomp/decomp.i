@@ -34,6 +34,7 @@ std::string __repr__() {return $self->Name;}
 %template(component_set) std::vector<SOMcomponent>;
 %attribute(SOM, double, C, get_C_pool);
 %attribute(SOM, double, CN, get_CN);
+%attribute(SOM, size_t, nbytes, get_nbytes);
 
 %include "SOM.h"
 
@@ -55,10 +56,77 @@ std::string __repr__() {return $self->Name;}
 	{ return $self->to_string();}
 	%pythoncode
 	{
+    __slots__ = ('this',)
+
+    @property
+    def CNmin(self):
+        """Minimal natural C/N ratio, shared by all SOM, see SOM.set_CN_range"""
+        return SOM.get_CNmin()
+
+    @CNmin.setter
+    def CNmin(self, value):
+        import warnings
+        warnings.warn('SOM.CNmin is shared by all SOM objects, use SOM.set_CN_range', stacklevel=2)
+        SOM.set_CN_range(value, SOM.get_CNmax())
+
+    @property
+    def CNmax(self):
+        """Maximum natural C/N ratio, shared by all SOM, see SOM.set_CN_range"""
+        return SOM.get_CNmax()
+
+    @CNmax.setter
+    def CNmax(self, value):
+        import warnings
+        warnings.warn('SOM.CNmax is shared by all SOM objects, use SOM.set_CN_range', stacklevel=2)
+        SOM.set_CN_range(SOM.get_CNmin(), value)
+
     def __iter__(self):
         pools=SOM.get_pool_types()
         for pool in pools:
             yield pool, self[pool]
+
+    def to_array(self):
+        """
+        Returns the C pools of all components (in the order of SOM.get_pool_types()) and N as last value
+        """
+        import numpy as np
+        values = [self.get_C_pool(pool.Id) for pool in SOM.get_pool_types()]
+        values.append(self.N)
+        return np.array(values, dtype=float)
+
+    @staticmethod
+    def from_array(values):
+        """
+        Creates SOM from an array with the C pools of all components and N as last column, see to_array
+
+        An array of the shape (components + 1,) returns a SOM, an array of the shape
+        (n, components + 1) a list of SOM. For many states use SOMBatch.from_array.
+        """
+        import numpy as np
+        values = np.asarray(values, dtype=float)
+        pools = SOM.get_pool_types()
+        if values.shape[-1] != len(pools) + 1:
+            raise ValueError('The array needs {} columns (pools and N)'.format(len(pools) + 1))
+        if values.ndim > 1:
+            return [SOM.from_array(row) for row in values.reshape(-1, values.shape[-1])]
+        som = SOM()
+        som.set_from_array(values)
+        return som
+
+    def set_from_array(self, values):
+        """
+        Sets the C pools and N in place from an array of the shape (components + 1,), see to_array
+
+        References to the SOM (eg. the layers of a CmfConnector) see the new values.
+        """
+        import numpy as np
+        values = np.asarray(values, dtype=float)
+        pools = SOM.get_pool_types()
+        if values.shape != (len(pools) + 1,):
+            raise ValueError('The array needs the shape ({},) (pools and N)'.format(len(pools) + 1))
+        for pool in pools:
+            self.set_C_pool(pool.Id, float(values[pool.Id]))
+        self.N = float(values[-1])
 	}
 }
 
@@ -1,47 +1,20 @@
 /* ----------------------------------------------------------------------------
- * This file was automatically generated by SWIG (http://www.swig.org).
- * Version 3.0.12
+ * This file was automatically generated by SWIG (https://www.swig.org).
+ * Version 4.5.1
  *
- * This file is not intended to be easily readable and contains a number of
- * coding conventions designed to improve portability and efficiency. Do not make
- * changes to this file unless you know what you are doing--modify the SWIG
- * interface file instead.
+ * Do not make changes to this file unless you know what you are doing - modify
+ * the SWIG interface file instead.
  * ----------------------------------------------------------------------------- */
 
 
-#ifndef SWIGPYTHON
+#define SWIG_VERSION 0x040501
 #define SWIGPYTHON
-#endif
-
-#define SWIG_PYTHON_NO_BUILD_NONE
 #define SWIG_PYTHON_DIRECTOR_NO_VTABLE
 #define SWIG_CASTRANK_MODE
 #define SWIG_PYTHON_CAST_MODE
+#define SWIGPYTHON_FASTPROXY
 
-
-#ifdef __cplusplus
-/* SwigValueWrapper is described in swig.swg */
-template<typename T> class SwigValueWrapper {
-  struct SwigMovePointer {
-    T *ptr;
-    SwigMovePointer(T *p) : ptr(p) { }
-    ~SwigMovePointer() { delete ptr; }
-    SwigMovePointer& operator=(SwigMovePointer& rhs) { T* oldptr = ptr; ptr = 0; delete oldptr; ptr = rhs.ptr; rhs.ptr = 0; return *this; }
-  } pointer;
-  SwigValueWrapper& operator=(const SwigValueWrapper<T>& rhs);
-  SwigValueWrapper(const SwigValueWrapper<T>& rhs);
-public:
-  SwigValueWrapper() : pointer(0) { }
-  SwigValueWrapper& operator=(const T& t) { SwigMovePointer tmp(new T(t)); pointer = tmp; return *this; }
-  operator T&() const { return *pointer.ptr; }
-  T *operator&() { return pointer.ptr; }
-};
-
-template <typename T> T SwigValueInit() {
-  return T();
-}
-#endif
-
+#define SWIG_name    "_decomp"
 /* -----------------------------------------------------------------------------
  *  This section contains generic SWIG labels for method/variable
  *  declarations/attributes, and other compiler dependent labels.
@@ -77,7 +50,7 @@ template <typename T> T SwigValueInit() {
 #   else
 #     define SWIGUNUSED
 #   endif
-# elif defined(__ICC)
+# elif defined(__ICC) || defined (__clang__)
 #   define SWIGUNUSED __attribute__ ((__unused__))
 # else
 #   define SWIGUNUSED
@@ -166,16 +139,84 @@ template <typename T> T SwigValueInit() {
 # pragma warning disable 592
 #endif
 
+#if defined(__cplusplus) && __cplusplus >= 201103L
+# define SWIG_NOEXCEPT noexcept
+#else
+# define SWIG_NOEXCEPT throw()
+#endif 
+
+#define SWIG_QUOTE_STRING(x) #x
+#define SWIG_STRINGIFY(x) SWIG_QUOTE_STRING(x)
+
+/* -----------------------------------------------------------------------------
+ * swigcompat.swg
+ *
+ * Macros to provide support compatibility with older C and C++ standards.
+ *
+ * Note that SWIG expects __cplusplus to be defined to the appropriate C++ standard.
+ * MSVC users are urged to check and examine the /Zc:__cplusplus compiler option.
+ * See https://learn.microsoft.com/en-us/cpp/build/reference/zc-cplusplus.
+ * ----------------------------------------------------------------------------- */
+
+/* C99 and C++11 should provide snprintf, but define SWIG_NO_SNPRINTF
+ * if you're missing it.
+ */
+#if ((defined __STDC_VERSION__ && __STDC_VERSION__ >= 199901L) || \
+     (defined __cplusplus && __cplusplus >= 201103L) || \
+     defined SWIG_HAVE_SNPRINTF) && \
+    !defined SWIG_NO_SNPRINTF
+# define SWIG_snprintf(O,S,F,A) snprintf(O,S,F,A)
+# define SWIG_snprintf2(O,S,F,A,B) snprintf(O,S,F,A,B)
+#else
+/* Fallback versions ignore the buffer size, but most of our uses either have a
+ * fixed maximum possible size or dynamically allocate a buffer that's large
+ * enough.
+ */
+# define SWIG_snprintf(O,S,F,A) sprintf(O,F,A)
+# define SWIG_snprintf2(O,S,F,A,B) sprintf(O,F,A,B)
+#endif
+
+
+#if defined(__GNUC__) && defined(_WIN32) && !defined(SWIG_PYTHON_NO_HYPOT_WORKAROUND)
+/* Workaround for '::hypot' has not been declared', see https://bugs.python.org/issue11566 */
+# include <math.h>
+#endif
+
+#if !defined(PY_SSIZE_T_CLEAN) && !defined(SWIG_NO_PY_SSIZE_T_CLEAN)
+#define PY_SSIZE_T_CLEAN
+#endif
+
+#if __GNUC__ >= 7
+#pragma GCC diagnostic push
+#if defined(__cplusplus) && __cplusplus >= 201703L
+#pragma GCC diagnostic ignored "-Wregister" /* For python-2.7 headers that use register */
+#endif
+#endif
 
 #if defined(_DEBUG) && defined(SWIG_PYTHON_INTERPRETER_NO_DEBUG)
 /* Use debug wrappers with the Python release dll */
+
+#if defined(_MSC_VER) && _MSC_VER >= 1929
+/* Workaround compilation errors when redefining _DEBUG in MSVC 2019 version 16.10 and later
+ * See https://github.com/swig/swig/issues/2090 */
+# include <corecrt.h>
+#endif
+
 # undef _DEBUG
 # include <Python.h>
-# define _DEBUG
+# define _DEBUG 1
 #else
 # include <Python.h>
 #endif
 
+
+#if __GNUC__ >= 7
+#pragma GCC diagnostic pop
+#endif
+
+#include <stdio.h>
+#include <stdlib.h>
+
 /* -----------------------------------------------------------------------------
  * swigrun.swg
  *
@@ -185,13 +226,11 @@ template <typename T> T SwigValueInit() {
 
 /* This should only be incremented when either the layout of swig_type_info changes,
    or for whatever reason, the runtime changes incompatibly */
-#define SWIG_RUNTIME_VERSION "4"
+#define SWIG_RUNTIME_VERSION "5"
 
 /* define SWIG_TYPE_TABLE_NAME as "SWIG_TYPE_TABLE" */
 #ifdef SWIG_TYPE_TABLE
-# define SWIG_QUOTE_STRING(x) #x
-# define SWIG_EXPAND_AND_QUOTE_STRING(x) SWIG_QUOTE_STRING(x)
-# define SWIG_TYPE_TABLE_NAME SWIG_EXPAND_AND_QUOTE_STRING(SWIG_TYPE_TABLE)
+# define SWIG_TYPE_TABLE_NAME SWIG_STRINGIFY(SWIG_TYPE_TABLE)
 #else
 # define SWIG_TYPE_TABLE_NAME
 #endif
@@ -221,6 +260,9 @@ template <typename T> T SwigValueInit() {
 /* Flags for pointer conversions */
 #define SWIG_POINTER_DISOWN        0x1
 #define SWIG_CAST_NEW_MEMORY       0x2
+#define SWIG_POINTER_NO_NULL       0x4
+#define SWIG_POINTER_CLEAR         0x8
+#define SWIG_POINTER_RELEASE       (SWIG_POINTER_CLEAR | SWIG_POINTER_DISOWN)
 
 /* Flags for new pointer objects */
 #define SWIG_POINTER_OWN           0x1
@@ -292,7 +334,7 @@ template <typename T> T SwigValueInit() {
    SWIG errors code.
 
    Finally, if the SWIG_CASTRANK_MODE is enabled, the result code
-   allows to return the 'cast rank', for example, if you have this
+   allows returning the 'cast rank', for example, if you have this
 
        int food(double)
        int fooi(int);
@@ -306,7 +348,13 @@ template <typename T> T SwigValueInit() {
 */
 
 #define SWIG_OK                    (0)
+/* Runtime errors are < 0 */
 #define SWIG_ERROR                 (-1)
+/* Errors in range -1 to -99 are in swigerrors.swg (errors for all languages including those not using the runtime) */
+/* Errors in range -100 to -199 are language specific errors defined in *errors.swg */
+/* Errors < -200 are generic runtime specific errors */
+#define SWIG_ERROR_RELEASE_NOT_OWNED (-200)
+
 #define SWIG_IsOK(r)               (r >= 0)
 #define SWIG_ArgError(r)           ((r != SWIG_ERROR) ? r : SWIG_TypeError)
 
@@ -314,20 +362,26 @@ template <typename T> T SwigValueInit() {
 #define SWIG_CASTRANKLIMIT         (1 << 8)
 /* The NewMask denotes the object was created (using new/malloc) */
 #define SWIG_NEWOBJMASK            (SWIG_CASTRANKLIMIT  << 1)
-/* The TmpMask is for in/out typemaps that use temporal objects */
+/* The TmpMask is for in/out typemaps that use temporary objects */
 #define SWIG_TMPOBJMASK            (SWIG_NEWOBJMASK << 1)
+/* The binary string mask denotes using string without unicode */
+#define SWIG_BINARYSTRMASK         (SWIG_TMPOBJMASK << 1)
 /* Simple returning values */
 #define SWIG_BADOBJ                (SWIG_ERROR)
 #define SWIG_OLDOBJ                (SWIG_OK)
 #define SWIG_NEWOBJ                (SWIG_OK | SWIG_NEWOBJMASK)
 #define SWIG_TMPOBJ                (SWIG_OK | SWIG_TMPOBJMASK)
-/* Check, add and del mask methods */
+#define SWIG_BINARYSTR             (SWIG_OK | SWIG_BINARYSTRMASK)
+/* Check, add and del object mask methods */
 #define SWIG_AddNewMask(r)         (SWIG_IsOK(r) ? (r | SWIG_NEWOBJMASK) : r)
 #define SWIG_DelNewMask(r)         (SWIG_IsOK(r) ? (r & ~SWIG_NEWOBJMASK) : r)
 #define SWIG_IsNewObj(r)           (SWIG_IsOK(r) && (r & SWIG_NEWOBJMASK))
 #define SWIG_AddTmpMask(r)         (SWIG_IsOK(r) ? (r | SWIG_TMPOBJMASK) : r)
 #define SWIG_DelTmpMask(r)         (SWIG_IsOK(r) ? (r & ~SWIG_TMPOBJMASK) : r)
 #define SWIG_IsTmpObj(r)           (SWIG_IsOK(r) && (r & SWIG_TMPOBJMASK))
+#define SWIG_AddBinaryStrMask(r)   (SWIG_IsOK(r) ? (r | SWIG_BINARYSTRMASK) : r)
+#define SWIG_DelBinaryStrMask(r)   (SWIG_IsOK(r) ? (r & ~SWIG_BINARYSTRMASK) : r)
+#define SWIG_IsBinaryStr(r)        (SWIG_IsOK(r) && (r & SWIG_BINARYSTRMASK))
 
 /* Cast-Rank Mode */
 #if defined(SWIG_CASTRANK_MODE)
@@ -374,8 +428,8 @@ typedef struct swig_type_info {
 typedef struct swig_cast_info {
   swig_type_info         *type;			/* pointer to type that is equivalent to this type */
   swig_converter_func     converter;		/* function to cast the void pointers */
-  struct swig_cast_info  *next;			/* pointer to next cast in linked list */
-  struct swig_cast_info  *prev;			/* pointer to the previous cast */
+  struct swig_cast_info  *next;			/* pointer to next array of casts | pointer to cast hashed by value */
+  unsigned int            value;		/* index of the last valid element in the array | typename hash value */
 } swig_cast_info;
 
 /* Structure used to store module information
@@ -436,55 +490,147 @@ SWIG_TypeEquiv(const char *nb, const char *tb) {
   return SWIG_TypeCmp(nb, tb) == 0 ? 1 : 0;
 }
 
+/*
+ * Hash function for type name strings, based on maRushPrime1Hash (http://amsoftware.narod.ru/algo2.html)
+ */
+SWIGRUNTIME unsigned int SWIG_Hash(const char *str, unsigned int len) {
+  const unsigned char *data = (const unsigned char *)str;
+  unsigned int hash = len, i = 0, k;
+  int rem = (int)len;
+
+  while (rem >= (int)sizeof(unsigned int)) {
+    memcpy(&k, data, sizeof(unsigned int));
+    k += i++;
+    hash ^= k;
+    hash *= 171717;
+    data += sizeof(unsigned int);
+    rem -= (int)sizeof(unsigned int);
+  }
+
+  switch (rem) {
+    case 3: k = (unsigned int)(data[2]) << 16;
+            k |= (unsigned int)(data[1]) << 8;
+            k |= (unsigned int)(data[0]);
+            k += i++;
+            hash ^= k;
+            hash *= 171717;
+            break;
+    case 2: k = (unsigned int)(data[1]) << 8;
+            k |= (unsigned int)(data[0]);
+            k += i++;
+            hash ^= k;
+            hash *= 171717;
+            break;
+    case 1: k = (unsigned int)(data[0]);
+            k += i++;
+            hash ^= k;
+            hash *= 171717;
+            break;
+  }
+  return hash;
+}
+
 /*
   Check the typename
 */
 SWIGRUNTIME swig_cast_info *
 SWIG_TypeCheck(const char *c, swig_type_info *ty) {
+  static const unsigned int scan_threshold = 4;
   if (ty) {
-    swig_cast_info *iter = ty->cast;
-    while (iter) {
-      if (strcmp(iter->type->name, c) == 0) {
-        if (iter == ty->cast)
-          return iter;
-        /* Move iter to the top of the linked list */
-        iter->prev->next = iter->next;
-        if (iter->next)
-          iter->next->prev = iter->prev;
-        iter->next = ty->cast;
-        iter->prev = 0;
-        if (ty->cast) ty->cast->prev = iter;
-        ty->cast = iter;
-        return iter;
+    swig_cast_info *head = ty->cast;
+    unsigned int hash_value = 0;
+    int hashed = 0;
+
+    while (head) {
+
+      if (strcmp(head->type->name, c) == 0) {
+        return head;
       }
-      iter = iter->next;
+
+      if (head->value) {
+        swig_cast_info *iter;
+        swig_cast_info *last = head + head->value;
+        swig_cast_info *first = head + 1;
+        int search = 1;
+
+        if (!hashed) {
+          if (head->value < scan_threshold) {
+            for (iter = first; iter <= last; iter++) {
+              if (strcmp(iter->type->name, c) == 0) {
+                return iter;
+              }
+            }
+            search = 0;
+          } else {
+            hashed = 1;
+            hash_value = SWIG_Hash(c, (unsigned int)strlen(c));
+          }
+        }
+
+        if (search) {
+          /* Binary search over sorted <'next'|'value'> pairs */
+          do {
+            iter = first + ((last - first) >> 1);
+            if (iter->value < hash_value) {
+              first = iter + 1;
+            } else if (iter->value == hash_value) {
+
+              if (strcmp(iter->next->type->name, c) == 0) {
+                return iter->next;
+              }
+
+              /* Hash collision check */
+              for (last = iter + 1; last->next && last->value == hash_value; last++) {
+                if (strcmp(last->next->type->name, c) == 0) {
+                  return last->next;
+                }
+              }
+              for (first = iter - 1; first != head && first->value == hash_value; first--) {
+                if (strcmp(first->next->type->name, c) == 0) {
+                  return first->next;
+                }
+              }
+              break;
+            } else
+              last = iter - 1;
+          } while (first <= last);
+        }
+      }
+      head = head->next;
     }
   }
   return 0;
 }
 
 /*
-  Identical to SWIG_TypeCheck, except strcmp is replaced with a pointer comparison
+  Check the type by type address
 */
 SWIGRUNTIME swig_cast_info *
-SWIG_TypeCheckStruct(swig_type_info *from, swig_type_info *ty) {
+SWIG_TypeCheckStruct(const swig_type_info *from, swig_type_info *ty) {
   if (ty) {
-    swig_cast_info *iter = ty->cast;
-    while (iter) {
-      if (iter->type == from) {
-        if (iter == ty->cast)
-          return iter;
-        /* Move iter to the top of the linked list */
-        iter->prev->next = iter->next;
-        if (iter->next)
-          iter->next->prev = iter->prev;
-        iter->next = ty->cast;
-        iter->prev = 0;
-        if (ty->cast) ty->cast->prev = iter;
-        ty->cast = iter;
-        return iter;
+    swig_cast_info *head = ty->cast;
+    while (head) {
+      if (head->type == from) {
+        return head;
       }
-      iter = iter->next;
+
+      if (head->value) {
+        swig_cast_info *iter;
+        swig_cast_info *last = head + head->value;
+        swig_cast_info *first = head + 1;
+
+        /* Binary search over sorted array of casts */
+        do {
+          iter = first + ((last - first) >> 1);
+          if (iter->type < from) {
+            first = iter + 1;
+          } else if (iter->type == from) {
+            return iter;
+          } else
+            last = iter - 1;
+        } while (first <= last);
+      }
+      head = head->next;
     }
   }
   return 0;
@@ -527,9 +673,9 @@ SWIG_TypeName(const swig_type_info *ty) {
 SWIGRUNTIME const char *
 SWIG_TypePrettyName(const swig_type_info *type) {
   /* The "str" field contains the equivalent pretty names of the
-     type, separated by vertical-bar characters.  We choose
-     to print the last name, as it is often (?) the most
-     specific. */
+     type, separated by vertical-bar characters.  Choose the last
+     name. It should be the most specific; a fully resolved name
+     but not necessarily with default template parameters expanded. */
   if (!type) return NULL;
   if (type->str != NULL) {
     const char *last_name = type->str;
@@ -547,20 +693,24 @@ SWIG_TypePrettyName(const swig_type_info *type) {
 */
 SWIGRUNTIME void
 SWIG_TypeClientData(swig_type_info *ti, void *clientdata) {
-  swig_cast_info *cast = ti->cast;
+  swig_cast_info *head = ti->cast;
   /* if (ti->clientdata == clientdata) return; */
   ti->clientdata = clientdata;
 
-  while (cast) {
-    if (!cast->converter) {
-      swig_type_info *tc = cast->type;
-      if (!tc->clientdata) {
-	SWIG_TypeClientData(tc, clientdata);
+  while (head) {
+    swig_cast_info *cast;
+    for (cast = head; (unsigned int)(cast - head) <= head->value; cast++) {
+      if (!cast->converter) {
+        swig_type_info *tc = cast->type;
+        if (!tc->clientdata) {
+          SWIG_TypeClientData(tc, clientdata);
+        }
       }
     }
-    cast = cast->next;
+    head = head->next;
   }
 }
+
 SWIGRUNTIME void
 SWIG_TypeNewClientData(swig_type_info *ti, void *clientdata) {
   SWIG_TypeClientData(ti, clientdata);
@@ -699,7 +849,7 @@ SWIG_PackVoidPtr(char *buff, void *ptr, const char *name, size_t bsz) {
   if ((2*sizeof(void *) + 2) > bsz) return 0;
   *(r++) = '_';
   r = SWIG_PackData(r,&ptr,sizeof(void *));
-  if (strlen(name) + 1 > (bsz - (r - buff))) return 0;
+  if (strlen(name) + 1 > (bsz - (size_t)(r - buff))) return 0;
   strcpy(r,name);
   return buff;
 }
@@ -749,7 +899,7 @@ SWIG_UnpackDataName(const char *c, void *ptr, size_t sz, const char *name) {
 }
 #endif
 
-/*  Errors in SWIG */
+/* SWIG Errors applicable to all language modules, values are reserved from -1 to -99 */
 #define  SWIG_UnknownError    	   -1
 #define  SWIG_IOError        	   -2
 #define  SWIG_RuntimeError   	   -3
@@ -765,221 +915,150 @@ SWIG_UnpackDataName(const char *c, void *ptr, size_t sz, const char *name) {
 #define  SWIG_NullReferenceError   -13
 
 
-
-/* Compatibility macros for Python 3 */
-#if PY_VERSION_HEX >= 0x03000000
-
-#define PyClass_Check(obj) PyObject_IsInstance(obj, (PyObject *)&PyType_Type)
-#define PyInt_Check(x) PyLong_Check(x)
-#define PyInt_AsLong(x) PyLong_AsLong(x)
-#define PyInt_FromLong(x) PyLong_FromLong(x)
-#define PyInt_FromSize_t(x) PyLong_FromSize_t(x)
-#define PyString_Check(name) PyBytes_Check(name)
-#define PyString_FromString(x) PyUnicode_FromString(x)
-#define PyString_Format(fmt, args)  PyUnicode_Format(fmt, args)
-#define PyString_AsString(str) PyBytes_AsString(str)
-#define PyString_Size(str) PyBytes_Size(str)	
-#define PyString_InternFromString(key) PyUnicode_InternFromString(key)
-#define Py_TPFLAGS_HAVE_CLASS Py_TPFLAGS_BASETYPE
-#define PyString_AS_STRING(x) PyUnicode_AS_STRING(x)
-#define _PyLong_FromSsize_t(x) PyLong_FromSsize_t(x)
-
+#if !defined(SWIG_NO_HEAPTYPES)
+#if !defined(SWIG_HEAPTYPES)
+#define SWIG_HEAPTYPES
 #endif
-
-#ifndef Py_TYPE
-#  define Py_TYPE(op) ((op)->ob_type)
 #endif
 
-/* SWIG APIs for compatibility of both Python 2 & 3 */
-
-#if PY_VERSION_HEX >= 0x03000000
-#  define SWIG_Python_str_FromFormat PyUnicode_FromFormat
-#else
-#  define SWIG_Python_str_FromFormat PyString_FromFormat
+#if defined(SWIG_HEAPTYPES)
+#if PY_VERSION_HEX < 0x030c0000
+#include <structmember.h>
+#define Py_READONLY READONLY
+#define Py_T_PYSSIZET T_PYSSIZET
 #endif
-
-
-/* Warning: This function will allocate a new string in Python 3,
- * so please call SWIG_Python_str_DelForPy3(x) to free the space.
- */
-SWIGINTERN char*
-SWIG_Python_str_AsChar(PyObject *str)
-{
-#if PY_VERSION_HEX >= 0x03000000
-  char *cstr;
-  char *newstr;
-  Py_ssize_t len;
-  str = PyUnicode_AsUTF8String(str);
-  PyBytes_AsStringAndSize(str, &cstr, &len);
-  newstr = (char *) malloc(len+1);
-  memcpy(newstr, cstr, len+1);
-  Py_XDECREF(str);
-  return newstr;
-#else
-  return PyString_AsString(str);
 #endif
-}
 
-#if PY_VERSION_HEX >= 0x03000000
-#  define SWIG_Python_str_DelForPy3(x) free( (void*) (x) )
-#else
-#  define SWIG_Python_str_DelForPy3(x) 
-#endif
+#include <stddef.h> /* For offsetof */
 
 
-SWIGINTERN PyObject*
-SWIG_Python_str_FromChar(const char *c)
+/* Wrapper around PyUnicode_AsUTF8AndSize - call Py_XDECREF on the returned pbytes when finished with the returned string */
+SWIGINTERN const char *
+SWIG_PyUnicode_AsUTF8AndSize(PyObject *str, Py_ssize_t *psize, PyObject **pbytes)
 {
-#if PY_VERSION_HEX >= 0x03000000
-  return PyUnicode_FromString(c); 
+#if !defined(Py_LIMITED_API) || Py_LIMITED_API+0 >= 0x030A0000
+  *pbytes = NULL;
+  return PyUnicode_AsUTF8AndSize(str, psize);
 #else
-  return PyString_FromString(c);
-#endif
-}
-
-/* Add PyOS_snprintf for old Pythons */
-#if PY_VERSION_HEX < 0x02020000
-# if defined(_MSC_VER) || defined(__BORLANDC__) || defined(_WATCOM)
-#  define PyOS_snprintf _snprintf
-# else
-#  define PyOS_snprintf snprintf
-# endif
+  const char *chars;
+  *pbytes = PyUnicode_AsUTF8String(str);
+  chars = *pbytes ? PyBytes_AsString(*pbytes) : NULL;
+  if (chars && psize)
+    *psize = PyBytes_Size(*pbytes);
+  return chars;
 #endif
-
-/* A crude PyString_FromFormat implementation for old Pythons */
-#if PY_VERSION_HEX < 0x02020000
-
-#ifndef SWIG_PYBUFFER_SIZE
-# define SWIG_PYBUFFER_SIZE 1024
-#endif
-
-static PyObject *
-PyString_FromFormat(const char *fmt, ...) {
-  va_list ap;
-  char buf[SWIG_PYBUFFER_SIZE * 2];
-  int res;
-  va_start(ap, fmt);
-  res = vsnprintf(buf, sizeof(buf), fmt, ap);
-  va_end(ap);
-  return (res < 0 || res >= (int)sizeof(buf)) ? 0 : PyString_FromString(buf);
 }
-#endif
-
-#ifndef PyObject_DEL
-# define PyObject_DEL PyObject_Del
-#endif
 
-/* A crude PyExc_StopIteration exception for old Pythons */
-#if PY_VERSION_HEX < 0x02020000
-# ifndef PyExc_StopIteration
-#  define PyExc_StopIteration PyExc_RuntimeError
-# endif
-# ifndef PyObject_GenericGetAttr
-#  define PyObject_GenericGetAttr 0
-# endif
-#endif
-
-/* Py_NotImplemented is defined in 2.1 and up. */
-#if PY_VERSION_HEX < 0x02010000
-# ifndef Py_NotImplemented
-#  define Py_NotImplemented PyExc_RuntimeError
-# endif
-#endif
+#define SWIG_RUNTIME_MODULE "swig_runtime_data" SWIG_RUNTIME_VERSION
 
-/* A crude PyString_AsStringAndSize implementation for old Pythons */
-#if PY_VERSION_HEX < 0x02010000
-# ifndef PyString_AsStringAndSize
-#  define PyString_AsStringAndSize(obj, s, len) {*s = PyString_AsString(obj); *len = *s ? strlen(*s) : 0;}
-# endif
+/* SWIGPY_USE_CAPSULE is no longer used within SWIG itself, but some user interface files check for it. */
+# define SWIGPY_USE_CAPSULE
+#ifdef SWIGPYTHON_BUILTIN
+# define SWIGPY_CAPSULE_ATTR_NAME "type_pointer_capsule_builtin" SWIG_TYPE_TABLE_NAME
+#else
+# define SWIGPY_CAPSULE_ATTR_NAME "type_pointer_capsule" SWIG_TYPE_TABLE_NAME
+#endif
+#define SWIGPY_CAPSULE_NAME SWIG_RUNTIME_MODULE "." SWIGPY_CAPSULE_ATTR_NAME
+
+#if defined(Py_LIMITED_API)
+# define PyTuple_GET_ITEM PyTuple_GetItem
+/* Note that PyTuple_SetItem() has different semantics from PyTuple_SET_ITEM as it decref's the original tuple item, so in general they cannot be used
+  interchangeably. However in SWIG-generated code PyTuple_SET_ITEM is only used with newly initialized tuples without any items and for them this does work. */
+# define PyTuple_SET_ITEM PyTuple_SetItem
+# define PyTuple_GET_SIZE PyTuple_Size
+# define PyCFunction_GET_FLAGS PyCFunction_GetFlags
+# define PyCFunction_GET_FUNCTION PyCFunction_GetFunction
+# define PyCFunction_GET_SELF PyCFunction_GetSelf
+# define PyList_GET_ITEM PyList_GetItem
+# define PyList_SET_ITEM PyList_SetItem
+# define PySliceObject PyObject
+#endif
+
+/* Increment and Decrement wrappers - for portability when using the stable abi and for performance otherwise */
+#ifdef Py_LIMITED_API
+# define SWIG_Py_INCREF Py_IncRef
+# define SWIG_Py_XINCREF Py_IncRef
+# define SWIG_Py_DECREF Py_DecRef
+# define SWIG_Py_XDECREF Py_DecRef
+#else
+# define SWIG_Py_INCREF Py_INCREF
+# define SWIG_Py_XINCREF Py_XINCREF
+# define SWIG_Py_DECREF Py_DECREF
+# define SWIG_Py_XDECREF Py_XDECREF
 #endif
 
-/* PySequence_Size for old Pythons */
-#if PY_VERSION_HEX < 0x02000000
-# ifndef PySequence_Size
-#  define PySequence_Size PySequence_Length
-# endif
-#endif
+#if (PY_VERSION_HEX >= 0x030d00a6) && (!defined(Py_LIMITED_API) || Py_LIMITED_API+0 >= 0x030d00a6)
+# define SWIG_PyType_GetFullyQualifiedName PyType_GetFullyQualifiedName
+#else
+SWIGINTERN PyObject *
+SWIG_PyType_GetFullyQualifiedName(PyTypeObject *type) {
+  PyObject *result = NULL;
+  PyObject *qualname = PyObject_GetAttrString((PyObject *)type, "__qualname__");
+  if (qualname) {
+    PyObject *mod = PyObject_GetAttrString((PyObject *)type, "__module__");
+    if (mod) {
+      if (PyUnicode_Check(mod) && PyUnicode_CompareWithASCIIString(mod, "builtins") && PyUnicode_CompareWithASCIIString(mod, "__main__")) {
+        result = PyUnicode_FromFormat("%U%c%U", mod, '.', qualname);
+        SWIG_Py_DECREF(qualname);
+      } else {
+        result = qualname;
+      }
+      SWIG_Py_DECREF(mod);
+    } else {
+      result = qualname;
+    }
+  }
 
-/* PyBool_FromLong for old Pythons */
-#if PY_VERSION_HEX < 0x02030000
-static
-PyObject *PyBool_FromLong(long ok)
-{
-  PyObject *result = ok ? Py_True : Py_False;
-  Py_INCREF(result);
   return result;
 }
 #endif
 
-/* Py_ssize_t for old Pythons */
-/* This code is as recommended by: */
-/* http://www.python.org/dev/peps/pep-0353/#conversion-guidelines */
-#if PY_VERSION_HEX < 0x02050000 && !defined(PY_SSIZE_T_MIN)
-typedef int Py_ssize_t;
-# define PY_SSIZE_T_MAX INT_MAX
-# define PY_SSIZE_T_MIN INT_MIN
-typedef inquiry lenfunc;
-typedef intargfunc ssizeargfunc;
-typedef intintargfunc ssizessizeargfunc;
-typedef intobjargproc ssizeobjargproc;
-typedef intintobjargproc ssizessizeobjargproc;
-typedef getreadbufferproc readbufferproc;
-typedef getwritebufferproc writebufferproc;
-typedef getsegcountproc segcountproc;
-typedef getcharbufferproc charbufferproc;
-static long PyNumber_AsSsize_t (PyObject *x, void *SWIGUNUSEDPARM(exc))
-{
-  long result = 0;
-  PyObject *i = PyNumber_Int(x);
-  if (i) {
-    result = PyInt_AsLong(i);
-    Py_DECREF(i);
-  }
-  return result;
+/* gh-114329 added PyList_GetItemRef() to Python 3.13.0a4 */
+#if (PY_VERSION_HEX >= 0x030d00a4) && (!defined(Py_LIMITED_API) || Py_LIMITED_API+0 >= 0x030d00a4)
+# define SWIG_PyList_GetItemRef PyList_GetItemRef
+#else
+SWIGINTERN PyObject *
+SWIG_PyList_GetItemRef(PyObject *op, Py_ssize_t index) {
+  PyObject *item = PyList_GetItem(op, index);
+  Py_XINCREF(item);
+  return item;
 }
 #endif
 
-#if PY_VERSION_HEX < 0x02050000
-#define PyInt_FromSize_t(x) PyInt_FromLong((long)x)
-#endif
-
-#if PY_VERSION_HEX < 0x02040000
-#define Py_VISIT(op)				\
-  do { 						\
-    if (op) {					\
-      int vret = visit((op), arg);		\
-      if (vret)					\
-        return vret;				\
-    }						\
-  } while (0)
-#endif
-
-#if PY_VERSION_HEX < 0x02030000
-typedef struct {
-  PyTypeObject type;
-  PyNumberMethods as_number;
-  PyMappingMethods as_mapping;
-  PySequenceMethods as_sequence;
-  PyBufferProcs as_buffer;
-  PyObject *name, *slots;
-} PyHeapTypeObject;
-#endif
-
-#if PY_VERSION_HEX < 0x02030000
-typedef destructor freefunc;
-#endif
-
-#if ((PY_MAJOR_VERSION == 2 && PY_MINOR_VERSION > 6) || \
-     (PY_MAJOR_VERSION == 3 && PY_MINOR_VERSION > 0) || \
-     (PY_MAJOR_VERSION > 3))
-# define SWIGPY_USE_CAPSULE
-# define SWIGPY_CAPSULE_NAME ((char*)"swig_runtime_data" SWIG_RUNTIME_VERSION ".type_pointer_capsule" SWIG_TYPE_TABLE_NAME)
-#endif
+/* gh-106004 added PyDict_GetItemRef() and PyDict_GetItemStringRef() to Python 3.13.0a1
+   functions are renamed here for compatibility with abi3audit */
+#if (PY_VERSION_HEX >= 0x030d00a1) && (!defined(Py_LIMITED_API) || Py_LIMITED_API+0 >= 0x030d00a1)
+# define SWIG_PyDict_GetItemRef PyDict_GetItemRef
+# define SWIG_PyDict_GetItemStringRef PyDict_GetItemStringRef
+#else
+SWIGINTERN int
+SWIG_PyDict_GetItemRef(PyObject *mp, PyObject *key, PyObject **result) {
+  PyObject *item = PyDict_GetItemWithError(mp, key);
+  if (item != NULL) {
+    *result = (PyObject *)(item);
+    SWIG_Py_INCREF(*result);
+    return 1;
+  }
+  if (!PyErr_Occurred()) {
+    *result = NULL;
+    return 0;
+  }
+  *result = NULL;
+  return -1;
+}
 
-#if PY_VERSION_HEX < 0x03020000
-#define PyDescr_TYPE(x) (((PyDescrObject *)(x))->d_type)
-#define PyDescr_NAME(x) (((PyDescrObject *)(x))->d_name)
-#define Py_hash_t long
+SWIGINTERN int
+SWIG_PyDict_GetItemStringRef(PyObject *mp, const char *key, PyObject **result) {
+  int res;
+  PyObject *key_obj = PyUnicode_FromString(key);
+  if (key_obj == NULL) {
+    *result = NULL;
+    return -1;
+  }
+  res = SWIG_PyDict_GetItemRef(mp, key_obj, result);
+  Py_DECREF(key_obj);
+  return res;
+}
 #endif
 
 /* -----------------------------------------------------------------------------
@@ -1023,6 +1102,9 @@ SWIG_Python_ErrorType(int code) {
   case SWIG_AttributeError:
     type = PyExc_AttributeError;
     break;
+  case SWIG_NullReferenceError:
+    type = PyExc_TypeError;
+    break;
   default:
     type = PyExc_RuntimeError;
   }
@@ -1037,22 +1119,57 @@ SWIG_Python_AddErrorMsg(const char* mesg)
   PyObject *value = 0;
   PyObject *traceback = 0;
 
-  if (PyErr_Occurred()) PyErr_Fetch(&type, &value, &traceback);
+  if (PyErr_Occurred())
+    PyErr_Fetch(&type, &value, &traceback);
   if (value) {
-    char *tmp;
     PyObject *old_str = PyObject_Str(value);
+    PyObject *bytes = NULL;
+    const char *tmp = SWIG_PyUnicode_AsUTF8AndSize(old_str, NULL, &bytes);
     PyErr_Clear();
-    Py_XINCREF(type);
-
-    PyErr_Format(type, "%s %s", tmp = SWIG_Python_str_AsChar(old_str), mesg);
-    SWIG_Python_str_DelForPy3(tmp);
-    Py_DECREF(old_str);
-    Py_DECREF(value);
+    SWIG_Py_XINCREF(type);
+    if (tmp)
+      PyErr_Format(type, "%s %s", tmp, mesg);
+    else
+      PyErr_Format(type, "%s", mesg);
+    SWIG_Py_XDECREF(bytes);
+    SWIG_Py_DECREF(old_str);
+    SWIG_Py_DECREF(value);
   } else {
     PyErr_SetString(PyExc_RuntimeError, mesg);
   }
 }
 
+SWIGRUNTIME int
+SWIG_Python_TypeErrorOccurred(PyObject *obj)
+{
+  PyObject *error;
+  if (obj)
+    return 0;
+  error = PyErr_Occurred();
+  return error && PyErr_GivenExceptionMatches(error, PyExc_TypeError);
+}
+
+SWIGRUNTIME void
+SWIG_Python_RaiseOrModifyTypeError(const char *message)
+{
+  if (SWIG_Python_TypeErrorOccurred(NULL)) {
+    /* Use existing TypeError to preserve stacktrace and enhance with given message */
+    PyObject *newvalue;
+    PyObject *type = NULL, *value = NULL, *traceback = NULL;
+    PyErr_Fetch(&type, &value, &traceback);
+    newvalue = PyUnicode_FromFormat("%S\nAdditional information:\n%s", value, message);
+    if (newvalue) {
+      SWIG_Py_XDECREF(value);
+      PyErr_Restore(type, newvalue, traceback);
+    } else {
+      PyErr_Restore(type, value, traceback);
+    }
+  } else {
+    /* Raise TypeError using given message */
+    PyErr_SetString(PyExc_TypeError, message);
+  }
+}
+
 #if defined(SWIG_PYTHON_NO_THREADS)
 #  if defined(SWIG_PYTHON_THREADS)
 #    undef SWIG_PYTHON_THREADS
@@ -1060,13 +1177,15 @@ SWIG_Python_AddErrorMsg(const char* mesg)
 #endif
 #if defined(SWIG_PYTHON_THREADS) /* Threading support is enabled */
 #  if !defined(SWIG_PYTHON_USE_GIL) && !defined(SWIG_PYTHON_NO_USE_GIL)
-#    if (PY_VERSION_HEX >= 0x02030000) /* For 2.3 or later, use the PyGILState calls */
-#      define SWIG_PYTHON_USE_GIL
-#    endif
+#    define SWIG_PYTHON_USE_GIL
 #  endif
 #  if defined(SWIG_PYTHON_USE_GIL) /* Use PyGILState threads calls */
-#    ifndef SWIG_PYTHON_INITIALIZE_THREADS
-#     define SWIG_PYTHON_INITIALIZE_THREADS  PyEval_InitThreads() 
+#    if !defined(SWIG_PYTHON_INITIALIZE_THREADS)
+#      if PY_VERSION_HEX < 0x03070000
+#        define SWIG_PYTHON_INITIALIZE_THREADS PyEval_InitThreads()
+#      else
+#        define SWIG_PYTHON_INITIALIZE_THREADS
+#      endif
 #    endif
 #    ifdef __cplusplus /* C++ code */
        class SWIG_Python_Thread_Block {
@@ -1081,7 +1200,7 @@ SWIG_Python_AddErrorMsg(const char* mesg)
          bool status;
          PyThreadState *save;
        public:
-         void end() { if (status) { PyEval_RestoreThread(save); status = false; }}
+         void end() { if (status) { status = false; PyEval_RestoreThread(save); }}
          SWIG_Python_Thread_Allow() : status(true), save(PyEval_SaveThread()) {}
          ~SWIG_Python_Thread_Allow() { end(); }
        };
@@ -1139,30 +1258,13 @@ extern "C" {
 /* Constant information structure */
 typedef struct swig_const_info {
   int type;
-  char *name;
+  const char *name;
   long lvalue;
   double dvalue;
   void   *pvalue;
   swig_type_info **ptype;
 } swig_const_info;
 
-
-/* -----------------------------------------------------------------------------
- * Wrapper of PyInstanceMethod_New() used in Python 3
- * It is exported to the generated module, used for -fastproxy
- * ----------------------------------------------------------------------------- */
-#if PY_VERSION_HEX >= 0x03000000
-SWIGRUNTIME PyObject* SWIG_PyInstanceMethod_New(PyObject *SWIGUNUSEDPARM(self), PyObject *func)
-{
-  return PyInstanceMethod_New(func);
-}
-#else
-SWIGRUNTIME PyObject* SWIG_PyInstanceMethod_New(PyObject *SWIGUNUSEDPARM(self), PyObject *SWIGUNUSEDPARM(func))
-{
-  return NULL;
-}
-#endif
-
 #ifdef __cplusplus
 }
 #endif
@@ -1177,6 +1279,10 @@ SWIGRUNTIME PyObject* SWIG_PyInstanceMethod_New(PyObject *SWIGUNUSEDPARM(self),
  *
  * ----------------------------------------------------------------------------- */
 
+#if PY_VERSION_HEX < 0x03050000
+# error "This version of SWIG only supports Python >= 3.5"
+#endif
+
 /* Common SWIG API */
 
 /* for raw pointers */
@@ -1225,7 +1331,6 @@ SWIGRUNTIME PyObject* SWIG_PyInstanceMethod_New(PyObject *SWIGUNUSEDPARM(self),
 #define SWIG_Error(code, msg)            		SWIG_Python_SetErrorMsg(SWIG_ErrorType(code), msg) 
 #define SWIG_fail                        		goto fail					   
 
-
 /* Runtime API implementation */
 
 /* Error manipulation */
@@ -1234,7 +1339,7 @@ SWIGINTERN void
 SWIG_Python_SetErrorObj(PyObject *errtype, PyObject *obj) {
   SWIG_PYTHON_THREAD_BEGIN_BLOCK; 
   PyErr_SetObject(errtype, obj);
-  Py_DECREF(obj);
+  SWIG_Py_DECREF(obj);
   SWIG_PYTHON_THREAD_END_BLOCK;
 }
 
@@ -1253,19 +1358,15 @@ SWIG_Python_SetErrorMsg(PyObject *errtype, const char *msg) {
 
 SWIGINTERN void
 SwigPyBuiltin_AddPublicSymbol(PyObject *seq, const char *key) {
-  PyObject *s = PyString_InternFromString(key);
+  PyObject *s = PyUnicode_InternFromString(key);
   PyList_Append(seq, s);
-  Py_DECREF(s);
+  SWIG_Py_DECREF(s);
 }
 
 SWIGINTERN void
 SWIG_Python_SetConstant(PyObject *d, PyObject *public_interface, const char *name, PyObject *obj) {   
-#if PY_VERSION_HEX < 0x02030000
-  PyDict_SetItemString(d, (char *)name, obj);
-#else
   PyDict_SetItemString(d, name, obj);
-#endif
-  Py_DECREF(obj);
+  SWIG_Py_DECREF(obj);
   if (public_interface)
     SwigPyBuiltin_AddPublicSymbol(public_interface, name);
 }
@@ -1274,59 +1375,55 @@ SWIG_Python_SetConstant(PyObject *d, PyObject *public_interface, const char *nam
 
 SWIGINTERN void
 SWIG_Python_SetConstant(PyObject *d, const char *name, PyObject *obj) {   
-#if PY_VERSION_HEX < 0x02030000
-  PyDict_SetItemString(d, (char *)name, obj);
-#else
   PyDict_SetItemString(d, name, obj);
-#endif
-  Py_DECREF(obj);                            
+  SWIG_Py_DECREF(obj);
 }
 
 #endif
 
-/* Append a value to the result obj */
+/* SWIG runtime data Python module */
+static PyObject *Swig_runtime_data_module_global = NULL;
+
+/* Create/obtain the single swig_runtime_data module which is used across different SWIG generated modules */
+SWIGINTERN PyObject *
+SWIG_runtime_data_module(void) {
+  if (!Swig_runtime_data_module_global) {
+#if (PY_VERSION_HEX >= 0x030d0000) && (!defined(Py_LIMITED_API) || Py_LIMITED_API+0 >= 0x030d0000)
+    /* free-threading note: the GIL is always enabled when this function is first called
+       by SWIG_init, so there's no risk of race conditions */
+    Swig_runtime_data_module_global = PyImport_AddModuleRef(SWIG_RUNTIME_MODULE);
+#else
+    Swig_runtime_data_module_global = PyImport_AddModule(SWIG_RUNTIME_MODULE);
+    SWIG_Py_XINCREF(Swig_runtime_data_module_global);
+#endif
+  }
+  assert(Swig_runtime_data_module_global);
+  return Swig_runtime_data_module_global;
+}
 
+/* Append a value to the result obj */
 SWIGINTERN PyObject*
-SWIG_Python_AppendOutput(PyObject* result, PyObject* obj) {
-#if !defined(SWIG_PYTHON_OUTPUT_TUPLE)
+SWIG_Python_AppendOutput(PyObject* result, PyObject* obj, int is_void) {
   if (!result) {
     result = obj;
-  } else if (result == Py_None) {
-    Py_DECREF(result);
+  } else if (result == Py_None && is_void) {
+    SWIG_Py_DECREF(result);
     result = obj;
   } else {
     if (!PyList_Check(result)) {
       PyObject *o2 = result;
       result = PyList_New(1);
-      PyList_SetItem(result, 0, o2);
+      if (result) {
+        PyList_SET_ITEM(result, 0, o2);
+      } else {
+        SWIG_Py_DECREF(obj);
+        return o2;
+      }
     }
     PyList_Append(result,obj);
-    Py_DECREF(obj);
-  }
-  return result;
-#else
-  PyObject*   o2;
-  PyObject*   o3;
-  if (!result) {
-    result = obj;
-  } else if (result == Py_None) {
-    Py_DECREF(result);
-    result = obj;
-  } else {
-    if (!PyTuple_Check(result)) {
-      o2 = result;
-      result = PyTuple_New(1);
-      PyTuple_SET_ITEM(result, 0, o2);
-    }
-    o3 = PyTuple_New(1);
-    PyTuple_SET_ITEM(o3, 0, obj);
-    o2 = result;
-    result = PySequence_Concat(o2, o3);
-    Py_DECREF(o2);
-    Py_DECREF(o3);
+    SWIG_Py_DECREF(obj);
   }
   return result;
-#endif
 }
 
 /* Unpack the argument tuple */
@@ -1377,12 +1474,21 @@ SWIG_Python_UnpackTuple(PyObject *args, const char *name, Py_ssize_t min, Py_ssi
   }
 }
 
+SWIGINTERN int
+SWIG_Python_CheckNoKeywords(PyObject *kwargs, const char *name) {
+  int no_kwargs = 1;
+  if (kwargs) {
+    assert(PyDict_Check(kwargs));
+    if (PyDict_Size(kwargs) > 0) {
+      PyErr_Format(PyExc_TypeError, "%s() does not take keyword arguments", name);
+      no_kwargs = 0;
+    }
+  }
+  return no_kwargs;
+}
+
 /* A functor is a function object with one single object argument */
-#if PY_VERSION_HEX >= 0x02020000
 #define SWIG_Python_CallFunctor(functor, obj)	        PyObject_CallFunctionObjArgs(functor, obj, NULL);
-#else
-#define SWIG_Python_CallFunctor(functor, obj)	        PyObject_CallFunction(functor, "O", obj);
-#endif
 
 /*
   Helper for static pointer initialization for both C and C++ code, for example
@@ -1394,50 +1500,271 @@ SWIG_Python_UnpackTuple(PyObject *args, const char *name, Py_ssize_t min, Py_ssi
 #define SWIG_STATIC_POINTER(var)  var = 0; if (!var) var
 #endif
 
-/* -----------------------------------------------------------------------------
- * Pointer declarations
- * ----------------------------------------------------------------------------- */
-
-/* Flags for new pointer objects */
-#define SWIG_POINTER_NOSHADOW       (SWIG_POINTER_OWN      << 1)
-#define SWIG_POINTER_NEW            (SWIG_POINTER_NOSHADOW | SWIG_POINTER_OWN)
-
-#define SWIG_POINTER_IMPLICIT_CONV  (SWIG_POINTER_DISOWN   << 1)
-
-#define SWIG_BUILTIN_TP_INIT	    (SWIG_POINTER_OWN << 2)
-#define SWIG_BUILTIN_INIT	    (SWIG_BUILTIN_TP_INIT | SWIG_POINTER_OWN)
-
 #ifdef __cplusplus
 extern "C" {
 #endif
 
-/*  How to access Py_None */
-#if defined(_WIN32) || defined(__WIN32__) || defined(__CYGWIN__)
-#  ifndef SWIG_PYTHON_NO_BUILD_NONE
-#    ifndef SWIG_PYTHON_BUILD_NONE
-#      define SWIG_PYTHON_BUILD_NONE
-#    endif
-#  endif
-#endif
+/* Python-specific SWIG API */
+#define SWIG_newvarlink()                             SWIG_Python_newvarlink()
+#define SWIG_addvarlink(p, name, get_attr, set_attr)  SWIG_Python_addvarlink(p, name, get_attr, set_attr)
+#define SWIG_InstallConstants(d, constants)           SWIG_Python_InstallConstants(d, constants)
+ 
+/* -----------------------------------------------------------------------------
+ * global variable support code.
+ * ----------------------------------------------------------------------------- */
+ 
+typedef struct swig_globalvar {   
+  char       *name;                  /* Name of global variable */
+  PyObject *(*get_attr)(void);       /* Return the current value */
+  int       (*set_attr)(PyObject *); /* Set the value */
+  struct swig_globalvar *next;
+} swig_globalvar;
+
+typedef struct swig_varlinkobject {
+  PyObject_HEAD
+  swig_globalvar *vars;
+} swig_varlinkobject;
 
-#ifdef SWIG_PYTHON_BUILD_NONE
-#  ifdef Py_None
-#   undef Py_None
-#   define Py_None SWIG_Py_None()
-#  endif
-SWIGRUNTIMEINLINE PyObject * 
-_SWIG_Py_None(void)
-{
-  PyObject *none = Py_BuildValue((char*)"");
-  Py_DECREF(none);
-  return none;
-}
-SWIGRUNTIME PyObject * 
-SWIG_Py_None(void)
-{
-  static PyObject *SWIG_STATIC_POINTER(none) = _SWIG_Py_None();
-  return none;
+SWIGINTERN PyObject *
+SwigVarLink_repr(PyObject *SWIGUNUSEDPARM(v)) {
+  return PyUnicode_InternFromString("<Swig global variables>");
 }
+
+SWIGINTERN PyObject *
+SwigVarLink_str(PyObject *o) {
+  swig_varlinkobject *v = (swig_varlinkobject *) o;
+  PyObject *str = PyUnicode_InternFromString("(");
+  PyObject *tail;
+  PyObject *joined;
+  swig_globalvar *var;
+  for (var = v->vars; var; var=var->next) {
+    tail = PyUnicode_FromString(var->name);
+    joined = PyUnicode_Concat(str, tail);
+    SWIG_Py_DECREF(str);
+    SWIG_Py_DECREF(tail);
+    str = joined;
+    if (var->next) {
+        tail = PyUnicode_InternFromString(", ");
+        joined = PyUnicode_Concat(str, tail);
+        SWIG_Py_DECREF(str);
+        SWIG_Py_DECREF(tail);
+        str = joined;
+    }
+  }
+  tail = PyUnicode_InternFromString(")");
+  joined = PyUnicode_Concat(str, tail);
+  SWIG_Py_DECREF(str);
+  SWIG_Py_DECREF(tail);
+  str = joined;
+  return str;
+}
+
+SWIGINTERN void
+SwigVarLink_dealloc(PyObject *o) {
+  swig_varlinkobject *v = (swig_varlinkobject *) o;
+  swig_globalvar *var = v->vars;
+  while (var) {
+    swig_globalvar *n = var->next;
+    free(var->name);
+    free(var);
+    var = n;
+  }
+}
+
+SWIGINTERN PyObject *
+SwigVarLink_getattr(PyObject *o, char *n) {
+  swig_varlinkobject *v = (swig_varlinkobject *) o;
+  PyObject *res = NULL;
+  swig_globalvar *var = v->vars;
+  while (var) {
+    if (strcmp(var->name,n) == 0) {
+      res = (*var->get_attr)();
+      break;
+    }
+    var = var->next;
+  }
+  if (res == NULL && !PyErr_Occurred()) {
+    PyErr_Format(PyExc_AttributeError, "Unknown C global variable '%s'", n);
+  }
+  return res;
+}
+
+SWIGINTERN int
+SwigVarLink_setattr(PyObject *o, char *n, PyObject *p) {
+  swig_varlinkobject *v = (swig_varlinkobject *) o;
+  int res = 1;
+  swig_globalvar *var = v->vars;
+  while (var) {
+    if (strcmp(var->name,n) == 0) {
+      res = (*var->set_attr)(p);
+      break;
+    }
+    var = var->next;
+  }
+  if (res == 1 && !PyErr_Occurred()) {
+    PyErr_Format(PyExc_AttributeError, "Unknown C global variable '%s'", n);
+  }
+  return res;
+}
+
+SWIGINTERN PyTypeObject*
+SwigVarLink_TypeOnce(void) {
+  static char SwigVarLink_doc[] = "Swig variable link object";
+#ifndef SWIG_HEAPTYPES
+  static PyTypeObject varlink_type;
+  static int type_init = 0;
+  if (!type_init) {
+    const PyTypeObject tmp = {
+      PyVarObject_HEAD_INIT(NULL, 0)
+      SWIG_RUNTIME_MODULE ".SwigVarLink", /* tp_name */
+      sizeof(swig_varlinkobject),         /* tp_basicsize */
+      0,                                  /* tp_itemsize */
+      (destructor) SwigVarLink_dealloc,   /* tp_dealloc */
+#if PY_VERSION_HEX < 0x030800b4
+      (printfunc)0,                       /* tp_print */
+#else
+      (Py_ssize_t)0,                      /* tp_vectorcall_offset */
+#endif
+      (getattrfunc) SwigVarLink_getattr,  /* tp_getattr */
+      (setattrfunc) SwigVarLink_setattr,  /* tp_setattr */
+      0,                                  /* tp_compare */
+      (reprfunc) SwigVarLink_repr,        /* tp_repr */
+      0,                                  /* tp_as_number */
+      0,                                  /* tp_as_sequence */
+      0,                                  /* tp_as_mapping */
+      0,                                  /* tp_hash */
+      0,                                  /* tp_call */
+      (reprfunc) SwigVarLink_str,         /* tp_str */
+      0,                                  /* tp_getattro */
+      0,                                  /* tp_setattro */
+      0,                                  /* tp_as_buffer */
+      0,                                  /* tp_flags */
+      SwigVarLink_doc,                    /* tp_doc */
+      0,                                  /* tp_traverse */
+      0,                                  /* tp_clear */
+      0,                                  /* tp_richcompare */
+      0,                                  /* tp_weaklistoffset */
+      0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0, /* tp_iter -> tp_weaklist */
+      0,                                  /* tp_del */
+      0,                                  /* tp_version_tag */
+      0,                                  /* tp_finalize */
+#if PY_VERSION_HEX >= 0x03080000
+      0,                                  /* tp_vectorcall */
+#endif
+#if (PY_VERSION_HEX >= 0x03080000) && (PY_VERSION_HEX < 0x03090000)
+      0,                                  /* tp_print */
+#endif
+#if PY_VERSION_HEX >= 0x030c0000
+      0,                                  /* tp_watched */
+#endif
+#if PY_VERSION_HEX >= 0x030d00a4
+      0,                                  /* tp_versions_used */
+#endif
+#ifdef COUNT_ALLOCS
+      0,                                  /* tp_allocs */
+      0,                                  /* tp_frees */
+      0,                                  /* tp_maxalloc */
+      0,                                  /* tp_prev */
+      0                                   /* tp_next */
+#endif
+    };
+    PyObject *runtime_data_module = SWIG_runtime_data_module();
+    varlink_type = tmp;
+    type_init = 1;
+    if (PyType_Ready(&varlink_type) < 0)
+      return NULL;
+    if (PyModule_AddObject(runtime_data_module, "SwigVarLink", (PyObject *)&varlink_type) == 0)
+      SWIG_Py_INCREF((PyObject *)&varlink_type);
+  }
+  return &varlink_type;
+#else
+  PyType_Slot slots[] = {
+    { Py_tp_dealloc, (void *)SwigVarLink_dealloc },
+    { Py_tp_repr, (void *)SwigVarLink_repr },
+    { Py_tp_getattr, (void *)SwigVarLink_getattr },
+    { Py_tp_setattr, (void *)SwigVarLink_setattr },
+    { Py_tp_str, (void *)SwigVarLink_str },
+    { Py_tp_doc, (void *)SwigVarLink_doc },
+    { 0, NULL }
+  };
+  PyType_Spec spec = {
+    SWIG_RUNTIME_MODULE ".SwigVarLink",
+    sizeof(swig_varlinkobject),
+    0,
+    Py_TPFLAGS_DEFAULT,
+    slots
+  };
+  PyObject *pytype = PyType_FromSpec(&spec);
+  PyObject *runtime_data_module = SWIG_runtime_data_module();
+  if (pytype && PyModule_AddObject(runtime_data_module, "SwigVarLink", pytype) == 0)
+    SWIG_Py_INCREF(pytype);
+  return (PyTypeObject *)pytype;
+#endif
+}
+
+SWIGRUNTIME PyTypeObject*
+SwigVarLink_Type(void) {
+  static PyTypeObject *SWIG_STATIC_POINTER(type) = SwigVarLink_TypeOnce();
+  return type;
+}
+
+/* Create a variable linking object for use later */
+SWIGINTERN PyObject *
+SWIG_Python_newvarlink(void) {
+  swig_varlinkobject *result = PyObject_New(swig_varlinkobject, SwigVarLink_Type());
+  if (result) {
+    result->vars = 0;
+  }
+  return ((PyObject*) result);
+}
+
+SWIGINTERN void 
+SWIG_Python_addvarlink(PyObject *p, const char *name, PyObject *(*get_attr)(void), int (*set_attr)(PyObject *p)) {
+  swig_varlinkobject *v = (swig_varlinkobject *) p;
+  swig_globalvar *gv = (swig_globalvar *) malloc(sizeof(swig_globalvar));
+  if (gv) {
+    size_t size = strlen(name)+1;
+    gv->name = (char *)malloc(size);
+    if (gv->name) {
+      memcpy(gv->name, name, size);
+      gv->get_attr = get_attr;
+      gv->set_attr = set_attr;
+      gv->next = v->vars;
+    }
+  }
+  v->vars = gv;
+}
+
+
+static PyObject *Swig_Globals_global = NULL;
+  
+SWIGINTERN PyObject *
+SWIG_globals(void) {
+  if (Swig_Globals_global == NULL) {
+    Swig_Globals_global = SWIG_newvarlink();
+  }
+  return Swig_Globals_global;
+}
+
+#ifdef __cplusplus
+}
+#endif
+
+/* -----------------------------------------------------------------------------
+ * Pointer declarations
+ * ----------------------------------------------------------------------------- */
+
+/* Flags for new pointer objects */
+#define SWIG_POINTER_NOSHADOW       (SWIG_POINTER_OWN      << 1)
+#define SWIG_POINTER_NEW            (SWIG_POINTER_NOSHADOW | SWIG_POINTER_OWN)
+
+#define SWIG_POINTER_IMPLICIT_CONV  (SWIG_POINTER_DISOWN   << 1)
+
+#define SWIG_BUILTIN_TP_INIT	    (SWIG_POINTER_OWN << 2)
+#define SWIG_BUILTIN_INIT	    (SWIG_BUILTIN_TP_INIT | SWIG_POINTER_OWN)
+
+#ifdef __cplusplus
+extern "C" {
 #endif
 
 /* The python void return value */
@@ -1446,7 +1773,7 @@ SWIGRUNTIMEINLINE PyObject *
 SWIG_Py_Void(void)
 {
   PyObject *none = Py_None;
-  Py_INCREF(none);
+  SWIG_Py_INCREF(none);
   return none;
 }
 
@@ -1466,7 +1793,10 @@ SWIGRUNTIMEINLINE int
 SWIG_Python_CheckImplicit(swig_type_info *ty)
 {
   SwigPyClientData *data = (SwigPyClientData *)ty->clientdata;
-  return data ? data->implicitconv : 0;
+  int fail = data ? data->implicitconv : 0;
+  if (fail)
+    PyErr_SetString(PyExc_TypeError, "Implicit conversion is prohibited for explicit constructors.");
+  return fail;
 }
 
 SWIGRUNTIMEINLINE PyObject *
@@ -1486,42 +1816,38 @@ SwigPyClientData_New(PyObject* obj)
     SwigPyClientData *data = (SwigPyClientData *)malloc(sizeof(SwigPyClientData));
     /* the klass element */
     data->klass = obj;
-    Py_INCREF(data->klass);
+    SWIG_Py_INCREF(data->klass);
     /* the newraw method and newargs arguments used to create a new raw instance */
-    if (PyClass_Check(obj)) {
+    if (PyObject_IsInstance(obj, (PyObject *)&PyType_Type)) {
       data->newraw = 0;
+      SWIG_Py_INCREF(obj);
       data->newargs = obj;
-      Py_INCREF(obj);
     } else {
-#if (PY_VERSION_HEX < 0x02020000)
-      data->newraw = 0;
-#else
-      data->newraw = PyObject_GetAttrString(data->klass, (char *)"__new__");
-#endif
+      data->newraw = PyObject_GetAttrString(data->klass, "__new__");
       if (data->newraw) {
-	Py_INCREF(data->newraw);
-	data->newargs = PyTuple_New(1);
-	PyTuple_SetItem(data->newargs, 0, obj);
+        data->newargs = PyTuple_New(1);
+        if (data->newargs) {
+          SWIG_Py_INCREF(obj);
+          PyTuple_SET_ITEM(data->newargs, 0, obj);
+        } else {
+          SWIG_Py_DECREF(data->newraw);
+          SWIG_Py_DECREF(data->klass);
+          free(data);
+          return 0;
+        }
       } else {
-	data->newargs = obj;
+        SWIG_Py_INCREF(obj);
+        data->newargs = obj;
       }
-      Py_INCREF(data->newargs);
     }
     /* the destroy method, aka as the C++ delete method */
-    data->destroy = PyObject_GetAttrString(data->klass, (char *)"__swig_destroy__");
+    data->destroy = PyObject_GetAttrString(data->klass, "__swig_destroy__");
     if (PyErr_Occurred()) {
       PyErr_Clear();
       data->destroy = 0;
     }
     if (data->destroy) {
-      int flags;
-      Py_INCREF(data->destroy);
-      flags = PyCFunction_GET_FLAGS(data->destroy);
-#ifdef METH_O
-      data->delargs = !(flags & (METH_O));
-#else
-      data->delargs = 0;
-#endif
+      data->delargs = !(PyCFunction_GET_FLAGS(data->destroy) & METH_O);
     } else {
       data->delargs = 0;
     }
@@ -1532,10 +1858,13 @@ SwigPyClientData_New(PyObject* obj)
 }
 
 SWIGRUNTIME void 
-SwigPyClientData_Del(SwigPyClientData *data) {
-  Py_XDECREF(data->newraw);
-  Py_XDECREF(data->newargs);
-  Py_XDECREF(data->destroy);
+SwigPyClientData_Del(SwigPyClientData *data)
+{
+  SWIG_Py_XDECREF(data->klass);
+  SWIG_Py_XDECREF(data->newraw);
+  SWIG_Py_XDECREF(data->newargs);
+  SWIG_Py_XDECREF(data->destroy);
+  free(data);
 }
 
 /* =============== SwigPyObject =====================*/
@@ -1546,9 +1875,8 @@ typedef struct {
   swig_type_info *ty;
   int own;
   PyObject *next;
-#ifdef SWIGPYTHON_BUILTIN
-  PyObject *dict;
-#endif
+  PyObject *swigdict;
+  PyObject *weakreflist;
 } SwigPyObject;
 
 
@@ -1559,11 +1887,11 @@ SwigPyObject_get___dict__(PyObject *v, PyObject *SWIGUNUSEDPARM(args))
 {
   SwigPyObject *sobj = (SwigPyObject *)v;
 
-  if (!sobj->dict)
-    sobj->dict = PyDict_New();
+  if (!sobj->swigdict)
+    sobj->swigdict = PyDict_New();
 
-  Py_INCREF(sobj->dict);
-  return sobj->dict;
+  SWIG_Py_XINCREF(sobj->swigdict);
+  return sobj->swigdict;
 }
 
 #endif
@@ -1580,18 +1908,17 @@ SwigPyObject_format(const char* fmt, SwigPyObject *v)
   PyObject *res = NULL;
   PyObject *args = PyTuple_New(1);
   if (args) {
-    if (PyTuple_SetItem(args, 0, SwigPyObject_long(v)) == 0) {
-      PyObject *ofmt = SWIG_Python_str_FromChar(fmt);
+    PyObject *val = SwigPyObject_long(v);
+    if (val) {
+      PyObject *ofmt;
+      PyTuple_SET_ITEM(args, 0, val);
+      ofmt = PyUnicode_FromString(fmt);
       if (ofmt) {
-#if PY_VERSION_HEX >= 0x03000000
-	res = PyUnicode_Format(ofmt,args);
-#else
-	res = PyString_Format(ofmt,args);
-#endif
-	Py_DECREF(ofmt);
+        res = PyUnicode_Format(ofmt,args);
+        SWIG_Py_DECREF(ofmt);
       }
-      Py_DECREF(args);
     }
+    SWIG_Py_DECREF(args);
   }
   return res;
 }
@@ -1609,51 +1936,61 @@ SwigPyObject_hex(SwigPyObject *v)
 }
 
 SWIGRUNTIME PyObject *
-#ifdef METH_NOARGS
 SwigPyObject_repr(SwigPyObject *v)
-#else
-SwigPyObject_repr(SwigPyObject *v, PyObject *args)
-#endif
 {
   const char *name = SWIG_TypePrettyName(v->ty);
-  PyObject *repr = SWIG_Python_str_FromFormat("<Swig Object of type '%s' at %p>", (name ? name : "unknown"), (void *)v);
-  if (v->next) {
-# ifdef METH_NOARGS
+  PyObject *repr = PyUnicode_FromFormat("<Swig Object of type '%s' at %p>", (name ? name : "unknown"), (void *)v);
+  if (repr && v->next) {
     PyObject *nrep = SwigPyObject_repr((SwigPyObject *)v->next);
-# else
-    PyObject *nrep = SwigPyObject_repr((SwigPyObject *)v->next, args);
-# endif
-# if PY_VERSION_HEX >= 0x03000000
-    PyObject *joined = PyUnicode_Concat(repr, nrep);
-    Py_DecRef(repr);
-    Py_DecRef(nrep);
-    repr = joined;
-# else
-    PyString_ConcatAndDel(&repr,nrep);
-# endif
+    if (nrep) {
+      PyObject *joined = PyUnicode_Concat(repr, nrep);
+      SWIG_Py_DECREF(repr);
+      SWIG_Py_DECREF(nrep);
+      repr = joined;
+    } else {
+      SWIG_Py_DECREF(repr);
+      repr = NULL;
+    }
   }
-  return repr;  
+  return repr;
+}
+
+/* We need a version taking two PyObject* parameters so it's a valid
+ * PyCFunction to use in SwigPyObject_methods[]. */
+SWIGRUNTIME PyObject *
+SwigPyObject_repr2(PyObject *v, PyObject *SWIGUNUSEDPARM(args))
+{
+  return SwigPyObject_repr((SwigPyObject*)v);
 }
 
 SWIGRUNTIME int
-SwigPyObject_compare(SwigPyObject *v, SwigPyObject *w)
+SwigPyObject_compare(PyObject *v, PyObject *w)
 {
-  void *i = v->ptr;
-  void *j = w->ptr;
+  /* tp_compare is only called when both objects have the same type, so
+   * the casts are guaranteed to be ok. */
+  void *i = ((SwigPyObject *)v)->ptr;
+  void *j = ((SwigPyObject *)w)->ptr;
   return (i < j) ? -1 : ((i > j) ? 1 : 0);
 }
 
-/* Added for Python 3.x, would it also be useful for Python 2.x? */
+SWIGRUNTIMEINLINE int SwigPyObject_Check(PyObject *);
+
+/* Rich comparison support */
 SWIGRUNTIME PyObject*
-SwigPyObject_richcompare(SwigPyObject *v, SwigPyObject *w, int op)
+SwigPyObject_richcompare(PyObject *v, PyObject *w, int op)
 {
-  PyObject* res;
-  if( op != Py_EQ && op != Py_NE ) {
-    Py_INCREF(Py_NotImplemented);
-    return Py_NotImplemented;
+  PyObject* res = NULL;
+  if (!PyErr_Occurred()) {
+    /* Per https://docs.python.org/3/c-api/typeobj.html#c.PyTypeObject.tp_richcompare
+     * the first argument is guaranteed to be an instance of SwigPyObject, but the
+     * second is not, so we typecheck that one. */
+    if ((op != Py_EQ && op != Py_NE) || !SwigPyObject_Check(w)) {
+      SWIG_Py_INCREF(Py_NotImplemented);
+      return Py_NotImplemented;
+    }
+    res = PyBool_FromLong( (SwigPyObject_compare(v, w)==0) == (op == Py_EQ) ? 1 : 0);
   }
-  res = PyBool_FromLong( (SwigPyObject_compare(v, w)==0) == (op == Py_EQ) ? 1 : 0);
-  return res;  
+  return res;
 }
 
 
@@ -1662,7 +1999,7 @@ SWIGRUNTIME PyTypeObject* SwigPyObject_TypeOnce(void);
 #ifdef SWIGPYTHON_BUILTIN
 static swig_type_info *SwigPyObject_stype = 0;
 SWIGRUNTIME PyTypeObject*
-SwigPyObject_type(void) {
+SwigPyObject_Type(void) {
     SwigPyClientData *cd;
     assert(SwigPyObject_stype);
     cd = (SwigPyClientData*) SwigPyObject_stype->clientdata;
@@ -1672,7 +2009,7 @@ SwigPyObject_type(void) {
 }
 #else
 SWIGRUNTIME PyTypeObject*
-SwigPyObject_type(void) {
+SwigPyObject_Type(void) {
   static PyTypeObject *SWIG_STATIC_POINTER(type) = SwigPyObject_TypeOnce();
   return type;
 }
@@ -1680,20 +2017,33 @@ SwigPyObject_type(void) {
 
 SWIGRUNTIMEINLINE int
 SwigPyObject_Check(PyObject *op) {
+  PyTypeObject *target_tp = SwigPyObject_Type();
+  PyTypeObject *op_type = Py_TYPE(op);
 #ifdef SWIGPYTHON_BUILTIN
-  PyTypeObject *target_tp = SwigPyObject_type();
-  if (PyType_IsSubtype(op->ob_type, target_tp))
-    return 1;
-  return (strcmp(op->ob_type->tp_name, "SwigPyObject") == 0);
+  /* Only builtin types have SwigPyObject as a base type */
+  return PyType_IsSubtype(op_type, target_tp);
 #else
-  return (Py_TYPE(op) == SwigPyObject_type())
-    || (strcmp(Py_TYPE(op)->tp_name,"SwigPyObject") == 0);
+  /* Check for an exact match to SwigPyObject */
+  if (op_type == target_tp) {
+    return 1;
+  } else {
+    /* Fallback for multiple modules */
+    int cmp;
+    PyObject *tpname = SWIG_PyType_GetFullyQualifiedName(op_type);
+    if (!tpname)
+      return 0;
+    cmp = PyUnicode_CompareWithASCIIString(tpname, SWIG_RUNTIME_MODULE ".SwigPyObject");
+    SWIG_Py_DECREF(tpname);
+    return cmp == 0;
+  }
 #endif
 }
 
 SWIGRUNTIME PyObject *
 SwigPyObject_New(void *ptr, swig_type_info *ty, int own);
 
+static PyObject* Swig_Capsule_global = NULL;
+
 SWIGRUNTIME void
 SwigPyObject_dealloc(PyObject *v)
 {
@@ -1708,20 +2058,24 @@ SwigPyObject_dealloc(PyObject *v)
       PyObject *res;
 
       /* PyObject_CallFunction() has the potential to silently drop
-         the active active exception.  In cases of unnamed temporary
+         the active exception.  In cases of unnamed temporary
          variable or where we just finished iterating over a generator
          StopIteration will be active right now, and this needs to
          remain true upon return from SwigPyObject_dealloc.  So save
          and restore. */
       
-      PyObject *val = NULL, *type = NULL, *tb = NULL;
-      PyErr_Fetch(&val, &type, &tb);
+      PyObject *type = NULL, *value = NULL, *traceback = NULL;
+      PyErr_Fetch(&type, &value, &traceback);
 
       if (data->delargs) {
         /* we need to create a temporary object to carry the destroy operation */
         PyObject *tmp = SwigPyObject_New(sobj->ptr, ty, 0);
-        res = SWIG_Python_CallFunctor(destroy, tmp);
-        Py_DECREF(tmp);
+        if (tmp) {
+          res = SWIG_Python_CallFunctor(destroy, tmp);
+        } else {
+          res = 0;
+        }
+        SWIG_Py_XDECREF(tmp);
       } else {
         PyCFunction meth = PyCFunction_GET_FUNCTION(destroy);
         PyObject *mself = PyCFunction_GET_SELF(destroy);
@@ -1730,9 +2084,9 @@ SwigPyObject_dealloc(PyObject *v)
       if (!res)
         PyErr_WriteUnraisable(destroy);
 
-      PyErr_Restore(val, type, tb);
+      PyErr_Restore(type, value, traceback);
 
-      Py_XDECREF(res);
+      SWIG_Py_XDECREF(res);
     } 
 #if !defined(SWIG_PYTHON_SILENT_MEMLEAK)
     else {
@@ -1740,39 +2094,33 @@ SwigPyObject_dealloc(PyObject *v)
       printf("swig/python detected a memory leak of type '%s', no destructor found.\n", (name ? name : "unknown"));
     }
 #endif
-  } 
-  Py_XDECREF(next);
-  PyObject_DEL(v);
+    SWIG_Py_XDECREF(Swig_Capsule_global);
+  }
+  SWIG_Py_XDECREF(next);
+  SWIG_Py_XDECREF(sobj->swigdict);
+  PyObject_Free(v);
 }
 
 SWIGRUNTIME PyObject* 
 SwigPyObject_append(PyObject* v, PyObject* next)
 {
   SwigPyObject *sobj = (SwigPyObject *) v;
-#ifndef METH_O
-  PyObject *tmp = 0;
-  if (!PyArg_ParseTuple(next,(char *)"O:append", &tmp)) return NULL;
-  next = tmp;
-#endif
   if (!SwigPyObject_Check(next)) {
     PyErr_SetString(PyExc_TypeError, "Attempt to append a non SwigPyObject");
     return NULL;
   }
+  ((SwigPyObject *)next)->next = sobj->next;
   sobj->next = next;
-  Py_INCREF(next);
+  SWIG_Py_INCREF(next);
   return SWIG_Py_Void();
 }
 
 SWIGRUNTIME PyObject* 
-#ifdef METH_NOARGS
-SwigPyObject_next(PyObject* v)
-#else
 SwigPyObject_next(PyObject* v, PyObject *SWIGUNUSEDPARM(args))
-#endif
 {
   SwigPyObject *sobj = (SwigPyObject *) v;
   if (sobj->next) {    
-    Py_INCREF(sobj->next);
+    SWIG_Py_INCREF(sobj->next);
     return sobj->next;
   } else {
     return SWIG_Py_Void();
@@ -1780,11 +2128,7 @@ SwigPyObject_next(PyObject* v, PyObject *SWIGUNUSEDPARM(args))
 }
 
 SWIGINTERN PyObject*
-#ifdef METH_NOARGS
-SwigPyObject_disown(PyObject *v)
-#else
 SwigPyObject_disown(PyObject* v, PyObject *SWIGUNUSEDPARM(args))
-#endif
 {
   SwigPyObject *sobj = (SwigPyObject *)v;
   sobj->own = 0;
@@ -1792,11 +2136,7 @@ SwigPyObject_disown(PyObject* v, PyObject *SWIGUNUSEDPARM(args))
 }
 
 SWIGINTERN PyObject*
-#ifdef METH_NOARGS
-SwigPyObject_acquire(PyObject *v)
-#else
 SwigPyObject_acquire(PyObject* v, PyObject *SWIGUNUSEDPARM(args))
-#endif
 {
   SwigPyObject *sobj = (SwigPyObject *)v;
   sobj->own = SWIG_POINTER_OWN;
@@ -1807,149 +2147,77 @@ SWIGINTERN PyObject*
 SwigPyObject_own(PyObject *v, PyObject *args)
 {
   PyObject *val = 0;
-#if (PY_VERSION_HEX < 0x02020000)
-  if (!PyArg_ParseTuple(args,(char *)"|O:own",&val))
-#elif (PY_VERSION_HEX < 0x02050000)
-  if (!PyArg_UnpackTuple(args, (char *)"own", 0, 1, &val)) 
-#else
-  if (!PyArg_UnpackTuple(args, "own", 0, 1, &val)) 
-#endif
-    {
-      return NULL;
+  if (!PyArg_UnpackTuple(args, "own", 0, 1, &val)) {
+    return NULL;
+  } else {
+    SwigPyObject *sobj = (SwigPyObject *)v;
+    PyObject *obj = PyBool_FromLong(sobj->own);
+    if (val) {
+      if (PyObject_IsTrue(val)) {
+        SWIG_Py_DECREF(SwigPyObject_acquire(v,args));
+      } else {
+        SWIG_Py_DECREF(SwigPyObject_disown(v,args));
+      }
     } 
-  else
-    {
-      SwigPyObject *sobj = (SwigPyObject *)v;
-      PyObject *obj = PyBool_FromLong(sobj->own);
-      if (val) {
-#ifdef METH_NOARGS
-	if (PyObject_IsTrue(val)) {
-	  SwigPyObject_acquire(v);
-	} else {
-	  SwigPyObject_disown(v);
-	}
-#else
-	if (PyObject_IsTrue(val)) {
-	  SwigPyObject_acquire(v,args);
-	} else {
-	  SwigPyObject_disown(v,args);
-	}
-#endif
-      } 
-      return obj;
-    }
+    return obj;
+  }
 }
 
-#ifdef METH_O
-static PyMethodDef
-swigobject_methods[] = {
-  {(char *)"disown",  (PyCFunction)SwigPyObject_disown,  METH_NOARGS,  (char *)"releases ownership of the pointer"},
-  {(char *)"acquire", (PyCFunction)SwigPyObject_acquire, METH_NOARGS,  (char *)"acquires ownership of the pointer"},
-  {(char *)"own",     (PyCFunction)SwigPyObject_own,     METH_VARARGS, (char *)"returns/sets ownership of the pointer"},
-  {(char *)"append",  (PyCFunction)SwigPyObject_append,  METH_O,       (char *)"appends another 'this' object"},
-  {(char *)"next",    (PyCFunction)SwigPyObject_next,    METH_NOARGS,  (char *)"returns the next 'this' object"},
-  {(char *)"__repr__",(PyCFunction)SwigPyObject_repr,    METH_NOARGS,  (char *)"returns object representation"},
-  {0, 0, 0, 0}  
-};
-#else
 static PyMethodDef
-swigobject_methods[] = {
-  {(char *)"disown",  (PyCFunction)SwigPyObject_disown,  METH_VARARGS,  (char *)"releases ownership of the pointer"},
-  {(char *)"acquire", (PyCFunction)SwigPyObject_acquire, METH_VARARGS,  (char *)"acquires ownership of the pointer"},
-  {(char *)"own",     (PyCFunction)SwigPyObject_own,     METH_VARARGS,  (char *)"returns/sets ownership of the pointer"},
-  {(char *)"append",  (PyCFunction)SwigPyObject_append,  METH_VARARGS,  (char *)"appends another 'this' object"},
-  {(char *)"next",    (PyCFunction)SwigPyObject_next,    METH_VARARGS,  (char *)"returns the next 'this' object"},
-  {(char *)"__repr__",(PyCFunction)SwigPyObject_repr,   METH_VARARGS,  (char *)"returns object representation"},
+SwigPyObject_methods[] = {
+  {"disown",  SwigPyObject_disown,  METH_NOARGS,  "releases ownership of the pointer"},
+  {"acquire", SwigPyObject_acquire, METH_NOARGS,  "acquires ownership of the pointer"},
+  {"own",     SwigPyObject_own,     METH_VARARGS, "returns/sets ownership of the pointer"},
+  {"append",  SwigPyObject_append,  METH_O,       "appends another 'this' object"},
+  {"next",    SwigPyObject_next,    METH_NOARGS,  "returns the next 'this' object"},
+  {"__repr__",SwigPyObject_repr2,   METH_NOARGS,  "returns object representation"},
   {0, 0, 0, 0}  
 };
-#endif
-
-#if PY_VERSION_HEX < 0x02020000
-SWIGINTERN PyObject *
-SwigPyObject_getattr(SwigPyObject *sobj,char *name)
-{
-  return Py_FindMethod(swigobject_methods, (PyObject *)sobj, name);
-}
-#endif
 
 SWIGRUNTIME PyTypeObject*
 SwigPyObject_TypeOnce(void) {
-  static char swigobject_doc[] = "Swig object carries a C/C++ instance pointer";
-
+  static char SwigPyObject_doc[] = "Swig object holding a C/C++ pointer";
+#ifndef SWIG_HEAPTYPES
   static PyNumberMethods SwigPyObject_as_number = {
     (binaryfunc)0, /*nb_add*/
     (binaryfunc)0, /*nb_subtract*/
     (binaryfunc)0, /*nb_multiply*/
-    /* nb_divide removed in Python 3 */
-#if PY_VERSION_HEX < 0x03000000
-    (binaryfunc)0, /*nb_divide*/
-#endif
     (binaryfunc)0, /*nb_remainder*/
     (binaryfunc)0, /*nb_divmod*/
     (ternaryfunc)0,/*nb_power*/
     (unaryfunc)0,  /*nb_negative*/
     (unaryfunc)0,  /*nb_positive*/
     (unaryfunc)0,  /*nb_absolute*/
-    (inquiry)0,    /*nb_nonzero*/
+    (inquiry)0,    /*nb_bool*/
     0,		   /*nb_invert*/
     0,		   /*nb_lshift*/
     0,		   /*nb_rshift*/
     0,		   /*nb_and*/
     0,		   /*nb_xor*/
     0,		   /*nb_or*/
-#if PY_VERSION_HEX < 0x03000000
-    0,   /*nb_coerce*/
-#endif
     (unaryfunc)SwigPyObject_long, /*nb_int*/
-#if PY_VERSION_HEX < 0x03000000
-    (unaryfunc)SwigPyObject_long, /*nb_long*/
-#else
     0, /*nb_reserved*/
-#endif
     (unaryfunc)0,                 /*nb_float*/
-#if PY_VERSION_HEX < 0x03000000
-    (unaryfunc)SwigPyObject_oct,  /*nb_oct*/
-    (unaryfunc)SwigPyObject_hex,  /*nb_hex*/
-#endif
-#if PY_VERSION_HEX >= 0x03050000 /* 3.5 */
     0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0 /* nb_inplace_add -> nb_inplace_matrix_multiply */
-#elif PY_VERSION_HEX >= 0x03000000 /* 3.0 */
-    0,0,0,0,0,0,0,0,0,0,0,0,0,0,0 /* nb_inplace_add -> nb_index, nb_inplace_divide removed */
-#elif PY_VERSION_HEX >= 0x02050000 /* 2.5.0 */
-    0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0 /* nb_inplace_add -> nb_index */
-#elif PY_VERSION_HEX >= 0x02020000 /* 2.2.0 */
-    0,0,0,0,0,0,0,0,0,0,0,0,0,0,0 /* nb_inplace_add -> nb_inplace_true_divide */
-#elif PY_VERSION_HEX >= 0x02000000 /* 2.0.0 */
-    0,0,0,0,0,0,0,0,0,0,0 /* nb_inplace_add -> nb_inplace_or */
-#endif
   };
 
   static PyTypeObject swigpyobject_type;
   static int type_init = 0;
   if (!type_init) {
     const PyTypeObject tmp = {
-#if PY_VERSION_HEX >= 0x03000000
       PyVarObject_HEAD_INIT(NULL, 0)
-#else
-      PyObject_HEAD_INIT(NULL)
-      0,                                    /* ob_size */
-#endif
-      (char *)"SwigPyObject",               /* tp_name */
+      SWIG_RUNTIME_MODULE ".SwigPyObject",  /* tp_name */
       sizeof(SwigPyObject),                 /* tp_basicsize */
       0,                                    /* tp_itemsize */
       (destructor)SwigPyObject_dealloc,     /* tp_dealloc */
-      0,                                    /* tp_print */
-#if PY_VERSION_HEX < 0x02020000
-      (getattrfunc)SwigPyObject_getattr,    /* tp_getattr */
+#if PY_VERSION_HEX < 0x030800b4
+      (printfunc)0,                         /* tp_print */
 #else
-      (getattrfunc)0,                       /* tp_getattr */
+      (Py_ssize_t)0,                        /* tp_vectorcall_offset */
 #endif
+      (getattrfunc)0,                       /* tp_getattr */
       (setattrfunc)0,                       /* tp_setattr */
-#if PY_VERSION_HEX >= 0x03000000
       0, /* tp_reserved in 3.0.1, tp_compare in 3.0.0 but not used */
-#else
-      (cmpfunc)SwigPyObject_compare,        /* tp_compare */
-#endif
       (reprfunc)SwigPyObject_repr,          /* tp_repr */
       &SwigPyObject_as_number,              /* tp_as_number */
       0,                                    /* tp_as_sequence */
@@ -1961,15 +2229,14 @@ SwigPyObject_TypeOnce(void) {
       0,                                    /* tp_setattro */
       0,                                    /* tp_as_buffer */
       Py_TPFLAGS_DEFAULT,                   /* tp_flags */
-      swigobject_doc,                       /* tp_doc */
+      SwigPyObject_doc,                     /* tp_doc */
       0,                                    /* tp_traverse */
       0,                                    /* tp_clear */
       (richcmpfunc)SwigPyObject_richcompare,/* tp_richcompare */
-      0,                                    /* tp_weaklistoffset */
-#if PY_VERSION_HEX >= 0x02020000
+      offsetof(SwigPyObject, weakreflist),  /* tp_weaklistoffset */
       0,                                    /* tp_iter */
       0,                                    /* tp_iternext */
-      swigobject_methods,                   /* tp_methods */
+      SwigPyObject_methods,                 /* tp_methods */
       0,                                    /* tp_members */
       0,                                    /* tp_getset */
       0,                                    /* tp_base */
@@ -1987,47 +2254,98 @@ SwigPyObject_TypeOnce(void) {
       0,                                    /* tp_cache */
       0,                                    /* tp_subclasses */
       0,                                    /* tp_weaklist */
-#endif
-#if PY_VERSION_HEX >= 0x02030000
       0,                                    /* tp_del */
-#endif
-#if PY_VERSION_HEX >= 0x02060000
       0,                                    /* tp_version_tag */
-#endif
-#if PY_VERSION_HEX >= 0x03040000
       0,                                    /* tp_finalize */
+#if PY_VERSION_HEX >= 0x03080000
+      0,                                    /* tp_vectorcall */
+#endif
+#if (PY_VERSION_HEX >= 0x03080000) && (PY_VERSION_HEX < 0x03090000)
+      0,                                    /* tp_print */
+#endif
+#if PY_VERSION_HEX >= 0x030c0000
+      0,                                    /* tp_watched */
+#endif
+#if PY_VERSION_HEX >= 0x030d00a4
+      0,                                    /* tp_versions_used */
 #endif
 #ifdef COUNT_ALLOCS
       0,                                    /* tp_allocs */
       0,                                    /* tp_frees */
       0,                                    /* tp_maxalloc */
-#if PY_VERSION_HEX >= 0x02050000
       0,                                    /* tp_prev */
-#endif
       0                                     /* tp_next */
 #endif
     };
+    PyObject *runtime_data_module = SWIG_runtime_data_module();
     swigpyobject_type = tmp;
     type_init = 1;
-#if PY_VERSION_HEX < 0x02020000
-    swigpyobject_type.ob_type = &PyType_Type;
-#else
-    if (PyType_Ready(&swigpyobject_type) < 0)
+    if (PyType_Ready(&swigpyobject_type) != 0)
       return NULL;
-#endif
+    if (PyModule_AddObject(runtime_data_module, "SwigPyObject", (PyObject *)&swigpyobject_type) == 0)
+      SWIG_Py_INCREF((PyObject *)&swigpyobject_type);
   }
   return &swigpyobject_type;
+#else
+  static PyMemberDef SwigPyObject_members[] = {
+      { (char *)"__dictoffset__", Py_T_PYSSIZET, offsetof(SwigPyObject, swigdict), Py_READONLY, NULL },
+      { (char *)"__weaklistoffset__", Py_T_PYSSIZET, offsetof(SwigPyObject, weakreflist), Py_READONLY, NULL },
+      { NULL, 0, 0, 0, NULL }
+  };
+  PyType_Slot slots[] = {
+    { Py_tp_dealloc, (void *)SwigPyObject_dealloc },
+    { Py_tp_repr, (void *)SwigPyObject_repr },
+    { Py_tp_getattro, (void *)PyObject_GenericGetAttr },
+    { Py_tp_doc, (void *)SwigPyObject_doc },
+    { Py_tp_richcompare, (void *)SwigPyObject_richcompare },
+    { Py_tp_methods, (void *)SwigPyObject_methods },
+    { Py_nb_int, (void *)SwigPyObject_long },
+    { Py_tp_members, (void *)SwigPyObject_members },
+    { 0, NULL }
+  };
+  PyType_Spec spec = {
+    SWIG_RUNTIME_MODULE ".SwigPyObject",
+    sizeof(SwigPyObject),
+    0,
+    Py_TPFLAGS_DEFAULT|Py_TPFLAGS_BASETYPE,
+    slots
+  };
+  PyObject *pytype = PyType_FromSpec(&spec);
+  PyObject *runtime_data_module = SWIG_runtime_data_module();
+#if !defined(Py_LIMITED_API)
+/* While this __dictoffset__ is only used with the builtin wrappers, SwigPyObject ought to be
+   identical when created for use by proxy class wrappers in case it is shared across multiple modules. */
+#if PY_VERSION_HEX < 0x03090000
+    /* Workaround as __dictoffset__ and __weaklistoffset__ above are only supported from python-3.9 */
+  if (pytype) {
+    ((PyTypeObject *)pytype)->tp_dictoffset = offsetof(SwigPyObject, swigdict);
+    ((PyTypeObject *)pytype)->tp_weaklistoffset = offsetof(SwigPyObject, weakreflist);
+  }
+#endif
+#endif
+  if (pytype && PyModule_AddObject(runtime_data_module, "SwigPyObject", pytype) == 0)
+    SWIG_Py_INCREF(pytype);
+  return (PyTypeObject *)pytype;
+#endif
 }
 
 SWIGRUNTIME PyObject *
 SwigPyObject_New(void *ptr, swig_type_info *ty, int own)
 {
-  SwigPyObject *sobj = PyObject_NEW(SwigPyObject, SwigPyObject_type());
+  SwigPyObject *sobj = PyObject_New(SwigPyObject, SwigPyObject_Type());
   if (sobj) {
     sobj->ptr  = ptr;
     sobj->ty   = ty;
     sobj->own  = own;
     sobj->next = 0;
+    sobj->swigdict = 0;
+    sobj->weakreflist = 0;
+    if (own == SWIG_POINTER_OWN) {
+      /* Obtain a reference to the Python capsule wrapping the module information, so that the
+       * module information is correctly destroyed after all SWIG python objects have been freed
+       * by the GC (and corresponding destructors invoked) */
+      SWIG_Py_XINCREF(Swig_Capsule_global);
+    }
   }
   return (PyObject *)sobj;
 }
@@ -2043,28 +2361,14 @@ typedef struct {
   size_t size;
 } SwigPyPacked;
 
-SWIGRUNTIME int
-SwigPyPacked_print(SwigPyPacked *v, FILE *fp, int SWIGUNUSEDPARM(flags))
-{
-  char result[SWIG_BUFFER_SIZE];
-  fputs("<Swig Packed ", fp); 
-  if (SWIG_PackDataName(result, v->pack, v->size, 0, sizeof(result))) {
-    fputs("at ", fp); 
-    fputs(result, fp); 
-  }
-  fputs(v->ty->name,fp); 
-  fputs(">", fp);
-  return 0; 
-}
-  
 SWIGRUNTIME PyObject *
 SwigPyPacked_repr(SwigPyPacked *v)
 {
   char result[SWIG_BUFFER_SIZE];
   if (SWIG_PackDataName(result, v->pack, v->size, 0, sizeof(result))) {
-    return SWIG_Python_str_FromFormat("<Swig Packed at %s%s>", result, v->ty->name);
+    return PyUnicode_FromFormat("<Swig Packed at %s%s>", result, v->ty->name);
   } else {
-    return SWIG_Python_str_FromFormat("<Swig Packed %s>", v->ty->name);
+    return PyUnicode_FromFormat("<Swig Packed %s>", v->ty->name);
   }  
 }
 
@@ -2073,10 +2377,10 @@ SwigPyPacked_str(SwigPyPacked *v)
 {
   char result[SWIG_BUFFER_SIZE];
   if (SWIG_PackDataName(result, v->pack, v->size, 0, sizeof(result))){
-    return SWIG_Python_str_FromFormat("%s%s", result, v->ty->name);
+    return PyUnicode_FromFormat("%s%s", result, v->ty->name);
   } else {
-    return SWIG_Python_str_FromChar(v->ty->name);
-  }  
+    return PyUnicode_FromString(v->ty->name);
+  }
 }
 
 SWIGRUNTIME int
@@ -2085,21 +2389,34 @@ SwigPyPacked_compare(SwigPyPacked *v, SwigPyPacked *w)
   size_t i = v->size;
   size_t j = w->size;
   int s = (i < j) ? -1 : ((i > j) ? 1 : 0);
-  return s ? s : strncmp((char *)v->pack, (char *)w->pack, 2*v->size);
+  return s ? s : strncmp((const char *)v->pack, (const char *)w->pack, 2*v->size);
 }
 
 SWIGRUNTIME PyTypeObject* SwigPyPacked_TypeOnce(void);
 
 SWIGRUNTIME PyTypeObject*
-SwigPyPacked_type(void) {
+SwigPyPacked_Type(void) {
   static PyTypeObject *SWIG_STATIC_POINTER(type) = SwigPyPacked_TypeOnce();
   return type;
 }
 
 SWIGRUNTIMEINLINE int
 SwigPyPacked_Check(PyObject *op) {
-  return ((op)->ob_type == SwigPyPacked_TypeOnce()) 
-    || (strcmp((op)->ob_type->tp_name,"SwigPyPacked") == 0);
+  PyTypeObject *target_tp = SwigPyPacked_Type();
+  PyTypeObject *op_type = Py_TYPE(op);
+  /* Check for an exact match to SwigPyPacked */
+  if (op_type == target_tp) {
+    return 1;
+  } else {
+    /* Fallback for multiple modules */
+    int cmp;
+    PyObject *tpname = SWIG_PyType_GetFullyQualifiedName(op_type);
+    if (!tpname)
+      return 0;
+    cmp = PyUnicode_CompareWithASCIIString(tpname, SWIG_RUNTIME_MODULE ".SwigPyPacked");
+    SWIG_Py_DECREF(tpname);
+    return cmp == 0;
+  }
 }
 
 SWIGRUNTIME void
@@ -2109,34 +2426,30 @@ SwigPyPacked_dealloc(PyObject *v)
     SwigPyPacked *sobj = (SwigPyPacked *) v;
     free(sobj->pack);
   }
-  PyObject_DEL(v);
+  PyObject_Free(v);
 }
 
 SWIGRUNTIME PyTypeObject*
 SwigPyPacked_TypeOnce(void) {
-  static char swigpacked_doc[] = "Swig object carries a C/C++ instance pointer";
+  static char SwigPyPacked_doc[] = "Swig object holding a C/C++ function pointer";
+#ifndef SWIG_HEAPTYPES
   static PyTypeObject swigpypacked_type;
   static int type_init = 0;
   if (!type_init) {
     const PyTypeObject tmp = {
-#if PY_VERSION_HEX>=0x03000000
       PyVarObject_HEAD_INIT(NULL, 0)
-#else
-      PyObject_HEAD_INIT(NULL)
-      0,                                    /* ob_size */
-#endif
-      (char *)"SwigPyPacked",               /* tp_name */
+      SWIG_RUNTIME_MODULE ".SwigPyPacked",  /* tp_name */
       sizeof(SwigPyPacked),                 /* tp_basicsize */
       0,                                    /* tp_itemsize */
       (destructor)SwigPyPacked_dealloc,     /* tp_dealloc */
-      (printfunc)SwigPyPacked_print,        /* tp_print */
+#if PY_VERSION_HEX < 0x030800b4
+      (printfunc)0,                         /* tp_print */
+#else
+      (Py_ssize_t)0,                        /* tp_vectorcall_offset */
+#endif
       (getattrfunc)0,                       /* tp_getattr */
       (setattrfunc)0,                       /* tp_setattr */
-#if PY_VERSION_HEX>=0x03000000
       0, /* tp_reserved in 3.0.1 */
-#else
-      (cmpfunc)SwigPyPacked_compare,        /* tp_compare */
-#endif
       (reprfunc)SwigPyPacked_repr,          /* tp_repr */
       0,                                    /* tp_as_number */
       0,                                    /* tp_as_sequence */
@@ -2148,12 +2461,11 @@ SwigPyPacked_TypeOnce(void) {
       0,                                    /* tp_setattro */
       0,                                    /* tp_as_buffer */
       Py_TPFLAGS_DEFAULT,                   /* tp_flags */
-      swigpacked_doc,                       /* tp_doc */
+      SwigPyPacked_doc,                     /* tp_doc */
       0,                                    /* tp_traverse */
       0,                                    /* tp_clear */
       0,                                    /* tp_richcompare */
       0,                                    /* tp_weaklistoffset */
-#if PY_VERSION_HEX >= 0x02020000
       0,                                    /* tp_iter */
       0,                                    /* tp_iternext */
       0,                                    /* tp_methods */
@@ -2174,42 +2486,66 @@ SwigPyPacked_TypeOnce(void) {
       0,                                    /* tp_cache */
       0,                                    /* tp_subclasses */
       0,                                    /* tp_weaklist */
-#endif
-#if PY_VERSION_HEX >= 0x02030000
       0,                                    /* tp_del */
-#endif
-#if PY_VERSION_HEX >= 0x02060000
       0,                                    /* tp_version_tag */
-#endif
-#if PY_VERSION_HEX >= 0x03040000
       0,                                    /* tp_finalize */
+#if PY_VERSION_HEX >= 0x03080000
+      0,                                    /* tp_vectorcall */
+#endif
+#if (PY_VERSION_HEX >= 0x03080000) && (PY_VERSION_HEX < 0x03090000)
+      0,                                    /* tp_print */
+#endif
+#if PY_VERSION_HEX >= 0x030c0000
+      0,                                    /* tp_watched */
+#endif
+#if PY_VERSION_HEX >= 0x030d00a4
+      0,                                    /* tp_versions_used */
 #endif
 #ifdef COUNT_ALLOCS
       0,                                    /* tp_allocs */
       0,                                    /* tp_frees */
       0,                                    /* tp_maxalloc */
-#if PY_VERSION_HEX >= 0x02050000
       0,                                    /* tp_prev */
-#endif
       0                                     /* tp_next */
 #endif
     };
+    PyObject *runtime_data_module = SWIG_runtime_data_module();
     swigpypacked_type = tmp;
     type_init = 1;
-#if PY_VERSION_HEX < 0x02020000
-    swigpypacked_type.ob_type = &PyType_Type;
-#else
-    if (PyType_Ready(&swigpypacked_type) < 0)
+    if (PyType_Ready(&swigpypacked_type) != 0)
       return NULL;
-#endif
+    if (PyModule_AddObject(runtime_data_module, "SwigPyPacked", (PyObject *)&swigpypacked_type) == 0)
+      SWIG_Py_INCREF((PyObject *)&swigpypacked_type);
   }
   return &swigpypacked_type;
+#else
+  PyType_Slot slots[] = {
+    { Py_tp_dealloc, (void *)SwigPyPacked_dealloc },
+    { Py_tp_repr, (void *)SwigPyPacked_repr },
+    { Py_tp_str, (void *)SwigPyPacked_str },
+    { Py_tp_getattro, (void *)PyObject_GenericGetAttr },
+    { Py_tp_doc, (void *)SwigPyPacked_doc },
+    { 0, NULL }
+  };
+  PyType_Spec spec = {
+    SWIG_RUNTIME_MODULE ".SwigPyPacked",
+    sizeof(SwigPyPacked),
+    0,
+    Py_TPFLAGS_DEFAULT,
+    slots
+  };
+  PyObject *pytype = PyType_FromSpec(&spec);
+  PyObject *runtime_data_module = SWIG_runtime_data_module();
+  if (pytype && PyModule_AddObject(runtime_data_module, "SwigPyPacked", pytype) == 0)
+    SWIG_Py_INCREF(pytype);
+  return (PyTypeObject *)pytype;
+#endif
 }
 
 SWIGRUNTIME PyObject *
 SwigPyPacked_New(void *ptr, size_t size, swig_type_info *ty)
 {
-  SwigPyPacked *sobj = PyObject_NEW(SwigPyPacked, SwigPyPacked_type());
+  SwigPyPacked *sobj = PyObject_New(SwigPyPacked, SwigPyPacked_Type());
   if (sobj) {
     void *pack = malloc(size);
     if (pack) {
@@ -2218,7 +2554,7 @@ SwigPyPacked_New(void *ptr, size_t size, swig_type_info *ty)
       sobj->ty   = ty;
       sobj->size = size;
     } else {
-      PyObject_DEL((PyObject *) sobj);
+      PyObject_Free((PyObject *)sobj);
       sobj = 0;
     }
   }
@@ -2242,29 +2578,17 @@ SwigPyPacked_UnpackData(PyObject *obj, void *ptr, size_t size)
  * pointers/data manipulation
  * ----------------------------------------------------------------------------- */
 
-SWIGRUNTIMEINLINE PyObject *
-_SWIG_This(void)
-{
-    return SWIG_Python_str_FromChar("this");
-}
-
-static PyObject *swig_this = NULL;
+static PyObject *Swig_This_global = NULL;
 
 SWIGRUNTIME PyObject *
 SWIG_This(void)
 {
-  if (swig_this == NULL)
-    swig_this = _SWIG_This();
-  return swig_this;
+  if (Swig_This_global == NULL)
+    Swig_This_global = PyUnicode_FromString("this");
+  return Swig_This_global;
 }
 
-/* #define SWIG_PYTHON_SLOW_GETSET_THIS */
-
-/* TODO: I don't know how to implement the fast getset in Python 3 right now */
-#if PY_VERSION_HEX>=0x03000000
-#define SWIG_PYTHON_SLOW_GETSET_THIS 
-#endif
-
+/* Returns a borrowed reference to the 'this' object */
 SWIGRUNTIME SwigPyObject *
 SWIG_Python_GetSwigThis(PyObject *pyobj) 
 {
@@ -2275,51 +2599,30 @@ SWIG_Python_GetSwigThis(PyObject *pyobj)
 
 #ifdef SWIGPYTHON_BUILTIN
   (void)obj;
-# ifdef PyWeakref_CheckProxy
   if (PyWeakref_CheckProxy(pyobj)) {
-    pyobj = PyWeakref_GET_OBJECT(pyobj);
+#if PY_VERSION_HEX >= 0x030d0000
+    if (PyWeakref_GetRef(pyobj, &pyobj) > 0)
+      Py_DECREF(pyobj);
+    else
+      pyobj = NULL;
+#else
+    pyobj = PyWeakref_GetObject(pyobj);
+#endif
     if (pyobj && SwigPyObject_Check(pyobj))
       return (SwigPyObject*) pyobj;
   }
-# endif
   return NULL;
 #else
 
   obj = 0;
 
-#if (!defined(SWIG_PYTHON_SLOW_GETSET_THIS) && (PY_VERSION_HEX >= 0x02030000))
-  if (PyInstance_Check(pyobj)) {
-    obj = _PyInstance_Lookup(pyobj, SWIG_This());      
-  } else {
-    PyObject **dictptr = _PyObject_GetDictPtr(pyobj);
-    if (dictptr != NULL) {
-      PyObject *dict = *dictptr;
-      obj = dict ? PyDict_GetItem(dict, SWIG_This()) : 0;
-    } else {
-#ifdef PyWeakref_CheckProxy
-      if (PyWeakref_CheckProxy(pyobj)) {
-	PyObject *wobj = PyWeakref_GET_OBJECT(pyobj);
-	return wobj ? SWIG_Python_GetSwigThis(wobj) : 0;
-      }
-#endif
-      obj = PyObject_GetAttr(pyobj,SWIG_This());
-      if (obj) {
-	Py_DECREF(obj);
-      } else {
-	if (PyErr_Occurred()) PyErr_Clear();
-	return 0;
-      }
-    }
-  }
-#else
-  obj = PyObject_GetAttr(pyobj,SWIG_This());
+  obj = PyObject_GetAttr(pyobj, SWIG_This());
   if (obj) {
-    Py_DECREF(obj);
+    SWIG_Py_DECREF(obj);
   } else {
     if (PyErr_Occurred()) PyErr_Clear();
     return 0;
   }
-#endif
   if (obj && !SwigPyObject_Check(obj)) {
     /* a PyObject is called 'this', try to get the 'real this'
        SwigPyObject from it */ 
@@ -2357,7 +2660,7 @@ SWIG_Python_ConvertPtrAndOwn(PyObject *obj, void **ptr, swig_type_info *ty, int
   if (obj == Py_None && !implicit_conv) {
     if (ptr)
       *ptr = 0;
-    return SWIG_OK;
+    return (flags & SWIG_POINTER_NO_NULL) ? SWIG_NullReferenceError : SWIG_OK;
   }
 
   res = SWIG_ERROR;
@@ -2396,13 +2699,20 @@ SWIG_Python_ConvertPtrAndOwn(PyObject *obj, void **ptr, swig_type_info *ty, int
     }
   }
   if (sobj) {
-    if (own)
-      *own = *own | sobj->own;
-    if (flags & SWIG_POINTER_DISOWN) {
-      sobj->own = 0;
-    }
-    res = SWIG_OK;
-  } else {
+    if (((flags & SWIG_POINTER_RELEASE) == SWIG_POINTER_RELEASE) && !sobj->own) {
+      res = SWIG_ERROR_RELEASE_NOT_OWNED;
+    } else {
+      if (own)
+        *own = *own | sobj->own;
+      if (flags & SWIG_POINTER_DISOWN) {
+        sobj->own = 0;
+      }
+      if (flags & SWIG_POINTER_CLEAR) {
+        sobj->ptr = 0;
+      }
+      res = SWIG_OK;
+    }
+  } else {
     if (implicit_conv) {
       SwigPyClientData *data = ty ? (SwigPyClientData *) ty->clientdata : 0;
       if (data && !data->implicitconv) {
@@ -2433,17 +2743,17 @@ SWIG_Python_ConvertPtrAndOwn(PyObject *obj, void **ptr, swig_type_info *ty, int
                 }
               }
             }
-            Py_DECREF(impconv);
+            SWIG_Py_DECREF(impconv);
           }
         }
       }
-    }
-    if (!SWIG_IsOK(res) && obj == Py_None) {
-      if (ptr)
-        *ptr = 0;
-      if (PyErr_Occurred())
-        PyErr_Clear();
-      res = SWIG_OK;
+      if (!SWIG_IsOK(res) && obj == Py_None) {
+        if (ptr)
+          *ptr = 0;
+        if (PyErr_Occurred())
+          PyErr_Clear();
+        res = SWIG_OK;
+      }
     }
   }
   return res;
@@ -2457,31 +2767,38 @@ SWIG_Python_ConvertFunctionPtr(PyObject *obj, void **ptr, swig_type_info *ty) {
     return SWIG_ConvertPtr(obj, ptr, ty, 0);
   } else {
     void *vptr = 0;
-    
+    swig_cast_info *tc;
+
     /* here we get the method pointer for callbacks */
+#ifndef Py_LIMITED_API
     const char *doc = (((PyCFunctionObject *)obj) -> m_ml -> ml_doc);
+#else
+    PyObject* pystr_doc = PyObject_GetAttrString(obj, "__doc__");
+    PyObject *bytes = NULL;
+    const char *doc = pystr_doc ? SWIG_PyUnicode_AsUTF8AndSize(pystr_doc, NULL, &bytes) : 0;
+#endif
     const char *desc = doc ? strstr(doc, "swig_ptr: ") : 0;
     if (desc)
       desc = ty ? SWIG_UnpackVoidPtr(desc + 10, &vptr, ty->name) : 0;
-    if (!desc) 
+#ifdef Py_LIMITED_API
+    SWIG_Py_XDECREF(bytes);
+    SWIG_Py_XDECREF(pystr_doc);
+#endif
+    if (!desc)
       return SWIG_ERROR;
-    if (ty) {
-      swig_cast_info *tc = SWIG_TypeCheck(desc,ty);
-      if (tc) {
-        int newmemory = 0;
-        *ptr = SWIG_TypeCast(tc,vptr,&newmemory);
-        assert(!newmemory); /* newmemory handling not yet implemented */
-      } else {
-        return SWIG_ERROR;
-      }
+    tc = SWIG_TypeCheck(desc,ty);
+    if (tc) {
+      int newmemory = 0;
+      *ptr = SWIG_TypeCast(tc,vptr,&newmemory);
+      assert(!newmemory); /* newmemory handling not yet implemented */
     } else {
-      *ptr = vptr;
+      return SWIG_ERROR;
     }
     return SWIG_OK;
   }
 }
 
-/* Convert a packed value value */
+/* Convert a packed pointer value */
 
 SWIGRUNTIME int
 SWIG_Python_ConvertPacked(PyObject *obj, void *ptr, size_t sz, swig_type_info *ty) {
@@ -2509,97 +2826,47 @@ SWIG_Python_ConvertPacked(PyObject *obj, void *ptr, size_t sz, swig_type_info *t
 SWIGRUNTIME PyObject* 
 SWIG_Python_NewShadowInstance(SwigPyClientData *data, PyObject *swig_this)
 {
-#if (PY_VERSION_HEX >= 0x02020000)
   PyObject *inst = 0;
   PyObject *newraw = data->newraw;
   if (newraw) {
     inst = PyObject_Call(newraw, data->newargs, NULL);
     if (inst) {
-#if !defined(SWIG_PYTHON_SLOW_GETSET_THIS)
-      PyObject **dictptr = _PyObject_GetDictPtr(inst);
-      if (dictptr != NULL) {
-	PyObject *dict = *dictptr;
-	if (dict == NULL) {
-	  dict = PyDict_New();
-	  *dictptr = dict;
-	  PyDict_SetItem(dict, SWIG_This(), swig_this);
-	}
+      if (PyObject_SetAttr(inst, SWIG_This(), swig_this) == -1) {
+        SWIG_Py_DECREF(inst);
+        inst = 0;
       }
-#else
-      PyObject *key = SWIG_This();
-      PyObject_SetAttr(inst, key, swig_this);
-#endif
     }
   } else {
-#if PY_VERSION_HEX >= 0x03000000
-    inst = ((PyTypeObject*) data->newargs)->tp_new((PyTypeObject*) data->newargs, Py_None, Py_None);
-    if (inst) {
-      PyObject_SetAttr(inst, SWIG_This(), swig_this);
-      Py_TYPE(inst)->tp_flags &= ~Py_TPFLAGS_VALID_VERSION_TAG;
-    }
+    PyObject *empty_args = PyTuple_New(0);
+    if (empty_args) {
+      PyObject *empty_kwargs = PyDict_New();
+      if (empty_kwargs) {
+#ifndef Py_LIMITED_API
+        newfunc newfn = ((PyTypeObject *)data->newargs)->tp_new;
 #else
-    PyObject *dict = PyDict_New();
-    if (dict) {
-      PyDict_SetItem(dict, SWIG_This(), swig_this);
-      inst = PyInstance_NewRaw(data->newargs, dict);
-      Py_DECREF(dict);
+        newfunc newfn = (newfunc)PyType_GetSlot((PyTypeObject *)data->newargs, Py_tp_new);
+#endif
+        inst = newfn((PyTypeObject *)data->newargs, empty_args, empty_kwargs);
+        SWIG_Py_DECREF(empty_kwargs);
+        if (inst) {
+          if (PyObject_SetAttr(inst, SWIG_This(), swig_this) == -1) {
+            SWIG_Py_DECREF(inst);
+            inst = 0;
+          } else {
+            PyType_Modified(Py_TYPE(inst));
+          }
+        }
+      }
+      SWIG_Py_DECREF(empty_args);
     }
-#endif
   }
   return inst;
-#else
-#if (PY_VERSION_HEX >= 0x02010000)
-  PyObject *inst = 0;
-  PyObject *dict = PyDict_New();
-  if (dict) {
-    PyDict_SetItem(dict, SWIG_This(), swig_this);
-    inst = PyInstance_NewRaw(data->newargs, dict);
-    Py_DECREF(dict);
-  }
-  return (PyObject *) inst;
-#else
-  PyInstanceObject *inst = PyObject_NEW(PyInstanceObject, &PyInstance_Type);
-  if (inst == NULL) {
-    return NULL;
-  }
-  inst->in_class = (PyClassObject *)data->newargs;
-  Py_INCREF(inst->in_class);
-  inst->in_dict = PyDict_New();
-  if (inst->in_dict == NULL) {
-    Py_DECREF(inst);
-    return NULL;
-  }
-#ifdef Py_TPFLAGS_HAVE_WEAKREFS
-  inst->in_weakreflist = NULL;
-#endif
-#ifdef Py_TPFLAGS_GC
-  PyObject_GC_Init(inst);
-#endif
-  PyDict_SetItem(inst->in_dict, SWIG_This(), swig_this);
-  return (PyObject *) inst;
-#endif
-#endif
 }
 
-SWIGRUNTIME void
+SWIGRUNTIME int
 SWIG_Python_SetSwigThis(PyObject *inst, PyObject *swig_this)
 {
- PyObject *dict;
-#if (PY_VERSION_HEX >= 0x02020000) && !defined(SWIG_PYTHON_SLOW_GETSET_THIS)
- PyObject **dictptr = _PyObject_GetDictPtr(inst);
- if (dictptr != NULL) {
-   dict = *dictptr;
-   if (dict == NULL) {
-     dict = PyDict_New();
-     *dictptr = dict;
-   }
-   PyDict_SetItem(dict, SWIG_This(), swig_this);
-   return;
- }
-#endif
- dict = PyObject_GetAttrString(inst, (char*)"__dict__");
- PyDict_SetItem(dict, SWIG_This(), swig_this);
- Py_DECREF(dict);
+  return PyObject_SetAttr(inst, SWIG_This(), swig_this);
 } 
 
 
@@ -2611,9 +2878,10 @@ SWIG_Python_InitShadowInstance(PyObject *args) {
   } else {
     SwigPyObject *sthis = SWIG_Python_GetSwigThis(obj[0]);
     if (sthis) {
-      SwigPyObject_append((PyObject*) sthis, obj[1]);
+      SWIG_Py_DECREF(SwigPyObject_append((PyObject*) sthis, obj[1]));
     } else {
-      SWIG_Python_SetSwigThis(obj[0], obj[1]);
+      if (SWIG_Python_SetSwigThis(obj[0], obj[1]) != 0)
+        return NULL;
     }
     return SWIG_Py_Void();
   }
@@ -2637,20 +2905,25 @@ SWIG_Python_NewPointerObj(PyObject *self, void *ptr, swig_type_info *type, int f
     if (flags & SWIG_BUILTIN_TP_INIT) {
       newobj = (SwigPyObject*) self;
       if (newobj->ptr) {
-        PyObject *next_self = clientdata->pytype->tp_alloc(clientdata->pytype, 0);
+#ifndef Py_LIMITED_API
+        allocfunc alloc = clientdata->pytype->tp_alloc;
+#else
+        allocfunc alloc = (allocfunc)PyType_GetSlot(clientdata->pytype, Py_tp_alloc);
+#endif
+        PyObject *next_self = alloc(clientdata->pytype, 0);
         while (newobj->next)
 	  newobj = (SwigPyObject *) newobj->next;
         newobj->next = next_self;
         newobj = (SwigPyObject *)next_self;
-#ifdef SWIGPYTHON_BUILTIN
-        newobj->dict = 0;
-#endif
+        newobj->swigdict = 0;
+        newobj->weakreflist = 0;
       }
     } else {
       newobj = PyObject_New(SwigPyObject, clientdata->pytype);
-#ifdef SWIGPYTHON_BUILTIN
-      newobj->dict = 0;
-#endif
+      if (newobj) {
+        newobj->swigdict = 0;
+        newobj->weakreflist = 0;
+      }
     }
     if (newobj) {
       newobj->ptr = ptr;
@@ -2667,7 +2940,7 @@ SWIG_Python_NewPointerObj(PyObject *self, void *ptr, swig_type_info *type, int f
   robj = SwigPyObject_New(ptr, type, own);
   if (robj && clientdata && !(flags & SWIG_POINTER_NOSHADOW)) {
     PyObject *inst = SWIG_Python_NewShadowInstance(clientdata, robj);
-    Py_DECREF(robj);
+    SWIG_Py_DECREF(robj);
     robj = inst;
   }
   return robj;
@@ -2688,144 +2961,114 @@ SWIG_Python_NewPackedObj(void *ptr, size_t sz, swig_type_info *type) {
 void *SWIG_ReturnGlobalTypeList(void *);
 #endif
 
+static PyObject *Swig_TypeCache_global = NULL;
+
+/* The python cached type query */
+SWIGRUNTIME PyObject *
+SWIG_Python_TypeCache(void) {
+  if (Swig_TypeCache_global == NULL) {
+    Swig_TypeCache_global = PyDict_New();
+  }
+  return Swig_TypeCache_global;
+}
+
 SWIGRUNTIME swig_module_info *
 SWIG_Python_GetModule(void *SWIGUNUSEDPARM(clientdata)) {
+#ifdef SWIG_LINK_RUNTIME
   static void *type_pointer = (void *)0;
   /* first check if module already created */
   if (!type_pointer) {
-#ifdef SWIG_LINK_RUNTIME
     type_pointer = SWIG_ReturnGlobalTypeList((void *)0);
+  }
 #else
-# ifdef SWIGPY_USE_CAPSULE
-    type_pointer = PyCapsule_Import(SWIGPY_CAPSULE_NAME, 0);
-# else
-    type_pointer = PyCObject_Import((char*)"swig_runtime_data" SWIG_RUNTIME_VERSION,
-				    (char*)"type_pointer" SWIG_TYPE_TABLE_NAME);
-# endif
-    if (PyErr_Occurred()) {
-      PyErr_Clear();
-      type_pointer = (void *)0;
-    }
-#endif
+  void *type_pointer = PyCapsule_Import(SWIGPY_CAPSULE_NAME, 0);
+  if (PyErr_Occurred()) {
+    PyErr_Clear();
+    type_pointer = (void *)0;
   }
+#endif
   return (swig_module_info *) type_pointer;
 }
 
-#if PY_MAJOR_VERSION < 2
-/* PyModule_AddObject function was introduced in Python 2.0.  The following function
-   is copied out of Python/modsupport.c in python version 2.3.4 */
-SWIGINTERN int
-PyModule_AddObject(PyObject *m, char *name, PyObject *o)
-{
-  PyObject *dict;
-  if (!PyModule_Check(m)) {
-    PyErr_SetString(PyExc_TypeError, "PyModule_AddObject() needs module as first arg");
-    return SWIG_ERROR;
-  }
-  if (!o) {
-    PyErr_SetString(PyExc_TypeError, "PyModule_AddObject() needs non-NULL value");
-    return SWIG_ERROR;
-  }
-  
-  dict = PyModule_GetDict(m);
-  if (dict == NULL) {
-    /* Internal error -- modules must have a dict! */
-    PyErr_Format(PyExc_SystemError, "module '%s' has no __dict__",
-		 PyModule_GetName(m));
-    return SWIG_ERROR;
-  }
-  if (PyDict_SetItemString(dict, name, o))
-    return SWIG_ERROR;
-  Py_DECREF(o);
-  return SWIG_OK;
-}
+
+#if defined(SWIG_REFCNT_DEBUG)
+#define SWIG_PYOBJ_REFCNT(OBJ) fprintf(stdout, "" #OBJ " count %ld\n", (OBJ ? Py_REFCNT(OBJ) : 0))
+#else
+#define SWIG_PYOBJ_REFCNT(OBJ)
 #endif
 
+static int interpreter_counter = 0; /* how many (sub-)interpreters are using swig_module's types */
+
 SWIGRUNTIME void
-#ifdef SWIGPY_USE_CAPSULE
 SWIG_Python_DestroyModule(PyObject *obj)
-#else
-SWIG_Python_DestroyModule(void *vptr)
-#endif
 {
-#ifdef SWIGPY_USE_CAPSULE
   swig_module_info *swig_module = (swig_module_info *) PyCapsule_GetPointer(obj, SWIGPY_CAPSULE_NAME);
-#else
-  swig_module_info *swig_module = (swig_module_info *) vptr;
-#endif
   swig_type_info **types = swig_module->types;
   size_t i;
-  for (i =0; i < swig_module->size; ++i) {
+  if (--interpreter_counter != 0) /* another sub-interpreter may still be using the swig_module's types */
+    return;
+  for (i = 0; i < swig_module->size; ++i) {
     swig_type_info *ty = types[i];
     if (ty->owndata) {
       SwigPyClientData *data = (SwigPyClientData *) ty->clientdata;
+      ty->clientdata = 0;
       if (data) SwigPyClientData_Del(data);
     }
   }
-  Py_DECREF(SWIG_This());
-  swig_this = NULL;
+  SWIG_PYOBJ_REFCNT(Swig_This_global);
+  SWIG_Py_XDECREF(Swig_This_global);
+  Swig_This_global = NULL;
+
+  SWIG_PYOBJ_REFCNT(Swig_Globals_global);
+  SWIG_Py_XDECREF(Swig_Globals_global);
+  Swig_Globals_global = NULL;
+
+  SWIG_PYOBJ_REFCNT(Swig_TypeCache_global);
+  SWIG_Py_XDECREF(Swig_TypeCache_global);
+  Swig_TypeCache_global = NULL;
+
+  SWIG_PYOBJ_REFCNT(Swig_Capsule_global);
+  Swig_Capsule_global = NULL;
+
+  SWIG_PYOBJ_REFCNT(Swig_runtime_data_module_global);
+  SWIG_Py_XDECREF(Swig_runtime_data_module_global);
+  Swig_runtime_data_module_global = NULL;
 }
 
 SWIGRUNTIME void
 SWIG_Python_SetModule(swig_module_info *swig_module) {
-#if PY_VERSION_HEX >= 0x03000000
- /* Add a dummy module object into sys.modules */
-  PyObject *module = PyImport_AddModule((char*)"swig_runtime_data" SWIG_RUNTIME_VERSION);
-#else
-  static PyMethodDef swig_empty_runtime_method_table[] = { {NULL, NULL, 0, NULL} }; /* Sentinel */
-  PyObject *module = Py_InitModule((char*)"swig_runtime_data" SWIG_RUNTIME_VERSION, swig_empty_runtime_method_table);
-#endif
-#ifdef SWIGPY_USE_CAPSULE
+  PyObject *runtime_data_module = SWIG_runtime_data_module();
   PyObject *pointer = PyCapsule_New((void *) swig_module, SWIGPY_CAPSULE_NAME, SWIG_Python_DestroyModule);
-  if (pointer && module) {
-    PyModule_AddObject(module, (char*)"type_pointer_capsule" SWIG_TYPE_TABLE_NAME, pointer);
-  } else {
-    Py_XDECREF(pointer);
-  }
-#else
-  PyObject *pointer = PyCObject_FromVoidPtr((void *) swig_module, SWIG_Python_DestroyModule);
-  if (pointer && module) {
-    PyModule_AddObject(module, (char*)"type_pointer" SWIG_TYPE_TABLE_NAME, pointer);
+  if (pointer && runtime_data_module) {
+    if (PyModule_AddObject(runtime_data_module, SWIGPY_CAPSULE_ATTR_NAME, pointer) == 0) {
+      ++interpreter_counter;
+      Swig_Capsule_global = pointer;
+    } else {
+      SWIG_Py_DECREF(pointer);
+    }
   } else {
-    Py_XDECREF(pointer);
+    SWIG_Py_XDECREF(pointer);
   }
-#endif
-}
-
-/* The python cached type query */
-SWIGRUNTIME PyObject *
-SWIG_Python_TypeCache(void) {
-  static PyObject *SWIG_STATIC_POINTER(cache) = PyDict_New();
-  return cache;
 }
 
 SWIGRUNTIME swig_type_info *
 SWIG_Python_TypeQuery(const char *type)
 {
-  PyObject *cache = SWIG_Python_TypeCache();
-  PyObject *key = SWIG_Python_str_FromChar(type); 
-  PyObject *obj = PyDict_GetItem(cache, key);
   swig_type_info *descriptor;
+  PyObject *cache = SWIG_Python_TypeCache();
+  PyObject *obj;
+  SWIG_PyDict_GetItemStringRef(cache, type, &obj);
   if (obj) {
-#ifdef SWIGPY_USE_CAPSULE
     descriptor = (swig_type_info *) PyCapsule_GetPointer(obj, NULL);
-#else
-    descriptor = (swig_type_info *) PyCObject_AsVoidPtr(obj);
-#endif
   } else {
     swig_module_info *swig_module = SWIG_GetModule(0);
     descriptor = SWIG_TypeQueryModule(swig_module, swig_module, type);
     if (descriptor) {
-#ifdef SWIGPY_USE_CAPSULE
       obj = PyCapsule_New((void*) descriptor, NULL, NULL);
-#else
-      obj = PyCObject_FromVoidPtr(descriptor, NULL);
-#endif
-      PyDict_SetItem(cache, key, obj);
-      Py_DECREF(obj);
+      if (obj) PyDict_SetItemString(cache, type, obj);
     }
   }
-  Py_DECREF(key);
+  SWIG_Py_XDECREF(obj);
   return descriptor;
 }
 
@@ -2845,17 +3088,19 @@ SWIG_Python_AddErrMesg(const char* mesg, int infront)
     PyObject *traceback = 0;
     PyErr_Fetch(&type, &value, &traceback);
     if (value) {
-      char *tmp;
       PyObject *old_str = PyObject_Str(value);
-      Py_XINCREF(type);
+      PyObject *bytes = NULL;
+      const char *tmp = SWIG_PyUnicode_AsUTF8AndSize(old_str, NULL, &bytes);
+      const char *errmesg = tmp ? tmp : "Invalid error message";
+      SWIG_Py_XINCREF(type);
       PyErr_Clear();
       if (infront) {
-	PyErr_Format(type, "%s %s", mesg, tmp = SWIG_Python_str_AsChar(old_str));
+	PyErr_Format(type, "%s %s", mesg, errmesg);
       } else {
-	PyErr_Format(type, "%s %s", tmp = SWIG_Python_str_AsChar(old_str), mesg);
+	PyErr_Format(type, "%s %s", errmesg, mesg);
       }
-      SWIG_Python_str_DelForPy3(tmp);
-      Py_DECREF(old_str);
+      SWIG_Py_XDECREF(bytes);
+      SWIG_Py_DECREF(old_str);
     }
     return 1;
   } else {
@@ -2884,56 +3129,12 @@ SwigPyObject_GetDesc(PyObject *self)
   return ty ? ty->str : "";
 }
 
-SWIGRUNTIME void
-SWIG_Python_TypeError(const char *type, PyObject *obj)
-{
-  if (type) {
-#if defined(SWIG_COBJECT_TYPES)
-    if (obj && SwigPyObject_Check(obj)) {
-      const char *otype = (const char *) SwigPyObject_GetDesc(obj);
-      if (otype) {
-	PyErr_Format(PyExc_TypeError, "a '%s' is expected, 'SwigPyObject(%s)' is received",
-		     type, otype);
-	return;
-      }
-    } else 
-#endif      
-    {
-      const char *otype = (obj ? obj->ob_type->tp_name : 0); 
-      if (otype) {
-	PyObject *str = PyObject_Str(obj);
-	const char *cstr = str ? SWIG_Python_str_AsChar(str) : 0;
-	if (cstr) {
-	  PyErr_Format(PyExc_TypeError, "a '%s' is expected, '%s(%s)' is received",
-		       type, otype, cstr);
-          SWIG_Python_str_DelForPy3(cstr);
-	} else {
-	  PyErr_Format(PyExc_TypeError, "a '%s' is expected, '%s' is received",
-		       type, otype);
-	}
-	Py_XDECREF(str);
-	return;
-      }
-    }   
-    PyErr_Format(PyExc_TypeError, "a '%s' is expected", type);
-  } else {
-    PyErr_Format(PyExc_TypeError, "unexpected type is received");
-  }
-}
-
-
 /* Convert a pointer value, signal an exception on a type mismatch */
 SWIGRUNTIME void *
 SWIG_Python_MustGetPtr(PyObject *obj, swig_type_info *ty, int SWIGUNUSEDPARM(argnum), int flags) {
   void *result;
   if (SWIG_Python_ConvertPtr(obj, &result, ty, flags) == -1) {
     PyErr_Clear();
-#if SWIG_POINTER_EXCEPTION
-    if (flags) {
-      SWIG_Python_TypeError(SWIG_TypePrettyName(ty), obj);
-      SWIG_Python_ArgFail(argnum);
-    }
-#endif
   }
   return result;
 }
@@ -2941,52 +3142,56 @@ SWIG_Python_MustGetPtr(PyObject *obj, swig_type_info *ty, int SWIGUNUSEDPARM(arg
 #ifdef SWIGPYTHON_BUILTIN
 SWIGRUNTIME int
 SWIG_Python_NonDynamicSetAttr(PyObject *obj, PyObject *name, PyObject *value) {
-  PyTypeObject *tp = obj->ob_type;
+  PyTypeObject *tp = Py_TYPE(obj);
   PyObject *descr;
   PyObject *encoded_name;
   descrsetfunc f;
   int res = -1;
 
 # ifdef Py_USING_UNICODE
-  if (PyString_Check(name)) {
-    name = PyUnicode_Decode(PyString_AsString(name), PyString_Size(name), NULL, NULL);
+  if (PyBytes_Check(name)) {
+    name = PyUnicode_Decode(PyBytes_AsString(name), PyBytes_Size(name), NULL, NULL);
     if (!name)
       return -1;
   } else if (!PyUnicode_Check(name))
 # else
-  if (!PyString_Check(name))
+  if (!PyBytes_Check(name))
 # endif
   {
-    PyErr_Format(PyExc_TypeError, "attribute name must be string, not '%.200s'", name->ob_type->tp_name);
+    PyObject *tpname = SWIG_PyType_GetFullyQualifiedName(Py_TYPE(name));
+    PyErr_Format(PyExc_TypeError, "attribute name must be string, not '%S'", tpname);
+    SWIG_Py_DECREF(tpname);
     return -1;
   } else {
-    Py_INCREF(name);
+    SWIG_Py_INCREF(name);
   }
 
   if (!tp->tp_dict) {
-    if (PyType_Ready(tp) < 0)
+    if (PyType_Ready(tp) != 0)
       goto done;
   }
 
   descr = _PyType_Lookup(tp, name);
   f = NULL;
   if (descr != NULL)
-    f = descr->ob_type->tp_descr_set;
+    f = Py_TYPE(descr)->tp_descr_set;
   if (!f) {
-    if (PyString_Check(name)) {
+    if (PyBytes_Check(name)) {
       encoded_name = name;
-      Py_INCREF(name);
+      SWIG_Py_INCREF(name);
     } else {
       encoded_name = PyUnicode_AsUTF8String(name);
+      if (!encoded_name)
+        goto done;
     }
-    PyErr_Format(PyExc_AttributeError, "'%.100s' object has no attribute '%.200s'", tp->tp_name, PyString_AsString(encoded_name));
-    Py_DECREF(encoded_name);
+    PyErr_Format(PyExc_AttributeError, "'%s' object has no attribute '%s'", tp->tp_name, PyBytes_AsString(encoded_name));
+    SWIG_Py_DECREF(encoded_name);
   } else {
     res = f(descr, obj, value);
   }
   
   done:
-  Py_DECREF(name);
+  SWIG_Py_DECREF(name);
   return res;
 }
 #endif
@@ -3000,8 +3205,23 @@ SWIG_Python_NonDynamicSetAttr(PyObject *obj, PyObject *name, PyObject *value) {
 
 #define SWIG_exception_fail(code, msg) do { SWIG_Error(code, msg); SWIG_fail; } while(0) 
 
-#define SWIG_contract_assert(expr, msg) if (!(expr)) { SWIG_Error(SWIG_RuntimeError, msg); SWIG_fail; } else 
+#define SWIG_contract_assert(expr, msg) do { if (!(expr)) { SWIG_Error(SWIG_RuntimeError, msg); SWIG_fail; } } while (0) 
+
+
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/* Method creation and docstring support functions */
 
+SWIGINTERN PyMethodDef *SWIG_PythonGetProxyDoc(const char *name);
+SWIGINTERN PyObject *SWIG_PyInstanceMethod_New(PyObject *SWIGUNUSEDPARM(self), PyObject *func);
+SWIGINTERN PyObject *SWIG_PyStaticMethod_New(PyObject *SWIGUNUSEDPARM(self), PyObject *func);
+
+#ifdef __cplusplus
+}
+#endif
 
 
   #define SWIG_exception(code, msg) do { SWIG_Error(code, msg); SWIG_fail;; } while(0) 
@@ -3015,33 +3235,20 @@ SWIG_Python_NonDynamicSetAttr(PyObject *obj, PyObject *name, PyObject *value) {
 #define SWIGTYPE_p_char swig_types[3]
 #define SWIGTYPE_p_difference_type swig_types[4]
 #define SWIGTYPE_p_p_PyObject swig_types[5]
-#define SWIGTYPE_p_size_type swig_types[6]
-#define SWIGTYPE_p_std__allocatorT_SOMcomponent_t swig_types[7]
-#define SWIGTYPE_p_std__invalid_argument swig_types[8]
-#define SWIGTYPE_p_std__vectorT_SOMcomponent_std__allocatorT_SOMcomponent_t_t swig_types[9]
-#define SWIGTYPE_p_swig__SwigPyIterator swig_types[10]
-#define SWIGTYPE_p_value_type swig_types[11]
-static swig_type_info *swig_types[13];
-static swig_module_info swig_module = {swig_types, 12, 0, 0, 0, 0};
+#define SWIGTYPE_p_product_map swig_types[6]
+#define SWIGTYPE_p_size_type swig_types[7]
+#define SWIGTYPE_p_std__allocatorT_SOMcomponent_t swig_types[8]
+#define SWIGTYPE_p_std__invalid_argument swig_types[9]
+#define SWIGTYPE_p_std__vectorT_SOMcomponent_t swig_types[10]
+#define SWIGTYPE_p_swig__SwigPyIterator swig_types[11]
+#define SWIGTYPE_p_value_type swig_types[12]
+static swig_type_info *swig_types[14];
+static swig_module_info swig_module = {swig_types, 13, 0, 0, 0, 0};
 #define SWIG_TypeQuery(name) SWIG_TypeQueryModule(&swig_module, &swig_module, name)
 #define SWIG_MangledTypeQuery(name) SWIG_MangledTypeQueryModule(&swig_module, &swig_module, name)
 
 /* -------- TYPES TABLE (END) -------- */
 
-#if (PY_VERSION_HEX <= 0x02000000)
-# if !defined(SWIG_PYTHON_CLASSIC)
-#  error "This python version requires swig to be run with the '-classic' option"
-# endif
-#endif
-#if (PY_VERSION_HEX <= 0x02020000)
-# error "This python version requires swig to be run with the '-nomodern' option"
-#endif
-#if (PY_VERSION_HEX <= 0x02020000)
-# error "This python version requires swig to be run with the '-nomodernargs' option"
-#endif
-#ifndef METH_O
-# error "This python version requires swig to be run with the '-nofastunpack' option"
-#endif
 #ifdef SWIG_TypeQuery
 # undef SWIG_TypeQuery
 #endif
@@ -3050,17 +3257,61 @@ static swig_module_info swig_module = {swig_types, 12, 0, 0, 0, 0};
 /*-----------------------------------------------
               @(target):= _decomp.so
   ------------------------------------------------*/
-#if PY_VERSION_HEX >= 0x03000000
-#  define SWIG_init    PyInit__decomp
+#define SWIG_init    PyInit__decomp
+
+
+#ifdef __cplusplus
+#include <utility>
+/* SwigValueWrapper is described in swig.swg */
+template<typename T> class SwigValueWrapper {
+  struct SwigSmartPointer {
+    T *ptr;
+    SwigSmartPointer(T *p) : ptr(p) { }
+    ~SwigSmartPointer() { delete ptr; }
+    SwigSmartPointer& operator=(SwigSmartPointer& rhs) { T* oldptr = ptr; ptr = 0; delete oldptr; ptr = rhs.ptr; rhs.ptr = 0; return *this; }
+    void reset(T *p) { T* oldptr = ptr; ptr = 0; delete oldptr; ptr = p; }
+  } pointer;
+  SwigValueWrapper& operator=(const SwigValueWrapper<T>& rhs);
+  SwigValueWrapper(const SwigValueWrapper<T>& rhs);
+public:
+  SwigValueWrapper() : pointer(0) { }
+  SwigValueWrapper& operator=(const T& t) { SwigSmartPointer tmp(new T(t)); pointer = tmp; return *this; }
+#if __cplusplus >= 201103L
+  SwigValueWrapper& operator=(T&& t) { SwigSmartPointer tmp(new T(std::move(t))); pointer = tmp; return *this; }
+  operator T&&() const { return std::move(*pointer.ptr); }
+#else
+  operator T&() const { return *pointer.ptr; }
+#endif
+  T *operator&() const { return pointer.ptr; }
+  static void reset(SwigValueWrapper& t, T *p) { t.pointer.reset(p); }
+};
 
+/*
+ * SwigValueInit() is a generic initialisation solution as the following approach:
+ * 
+ *       T c_result = T();
+ * 
+ * doesn't compile for all types for example:
+ * 
+ *       unsigned int c_result = unsigned int();
+ */
+template <typename T> T SwigValueInit() {
+  return T();
+}
+
+#if __cplusplus >= 201103L
+# define SWIG_STD_MOVE(OBJ) std::move(OBJ)
 #else
-#  define SWIG_init    init_decomp
+# define SWIG_STD_MOVE(OBJ) OBJ
+#endif
 
+#if __cplusplus >= 201103L
+# define SWIG_OVERRIDE override
+#else
+# define SWIG_OVERRIDE
 #endif
-#define SWIG_name    "_decomp"
 
-#define SWIGVERSION 0x030012 
-#define SWIG_VERSION SWIGVERSION
+#endif
 
 
 #define SWIG_as_voidptr(a) const_cast< void * >(static_cast< const void * >(a)) 
@@ -3083,7 +3334,7 @@ namespace swig {
     SwigPtr_PyObject(const SwigPtr_PyObject& item) : _obj(item._obj)
     {
       SWIG_PYTHON_THREAD_BEGIN_BLOCK;
-      Py_XINCREF(_obj);      
+      SWIG_Py_XINCREF(_obj);
       SWIG_PYTHON_THREAD_END_BLOCK;
     }
     
@@ -3091,7 +3342,7 @@ namespace swig {
     {
       if (initial_ref) {
         SWIG_PYTHON_THREAD_BEGIN_BLOCK;
-        Py_XINCREF(_obj);
+        SWIG_Py_XINCREF(_obj);
         SWIG_PYTHON_THREAD_END_BLOCK;
       }
     }
@@ -3099,8 +3350,8 @@ namespace swig {
     SwigPtr_PyObject & operator=(const SwigPtr_PyObject& item) 
     {
       SWIG_PYTHON_THREAD_BEGIN_BLOCK;
-      Py_XINCREF(item._obj);
-      Py_XDECREF(_obj);
+      SWIG_Py_XINCREF(item._obj);
+      SWIG_Py_XDECREF(_obj);
       _obj = item._obj;
       SWIG_PYTHON_THREAD_END_BLOCK;
       return *this;      
@@ -3109,7 +3360,7 @@ namespace swig {
     ~SwigPtr_PyObject() 
     {
       SWIG_PYTHON_THREAD_BEGIN_BLOCK;
-      Py_XDECREF(_obj);
+      SWIG_Py_XDECREF(_obj);
       SWIG_PYTHON_THREAD_END_BLOCK;
     }
     
@@ -3132,7 +3383,7 @@ namespace swig {
     
     SwigVar_PyObject & operator = (PyObject* obj)
     {
-      Py_XDECREF(_obj);
+      SWIG_Py_XDECREF(_obj);
       _obj = obj;
       return *this;      
     }
@@ -3145,12 +3396,6 @@ namespace swig {
 
 #include <iostream>
 
-#if PY_VERSION_HEX >= 0x03020000
-# define SWIGPY_SLICE_ARG(obj) ((PyObject*) (obj))
-#else
-# define SWIGPY_SLICE_ARG(obj) ((PySliceObject*) (obj))
-#endif
-
 
 #include <typeinfo>
 #include <stdexcept>
@@ -3167,9 +3412,6 @@ namespace swig {
 
 
 namespace swig {
-  struct stop_iteration {
-  };
-
   struct SwigPyIterator {
   private:
     SwigPtr_PyObject _seq;
@@ -3178,7 +3420,12 @@ namespace swig {
     SwigPyIterator(PyObject *seq) : _seq(seq)
     {
     }
-      
+
+    void raise_stop_iteration() const
+    {
+      SWIG_SetErrorObj(PyExc_StopIteration, SWIG_Py_Void());
+    }
+
   public:
     virtual ~SwigPyIterator() {}
 
@@ -3189,9 +3436,11 @@ namespace swig {
     virtual SwigPyIterator *incr(size_t n = 1) = 0;
     
     // Backward iterator method, very common in C++, but not required in Python
+    // This default probably ought to instead raise some sort of unsupported exception
     virtual SwigPyIterator *decr(size_t /*n*/ = 1)
     {
-      throw stop_iteration();
+      raise_stop_iteration();
+      return NULL;
     }
 
     // Random access iterator methods, but not required in Python
@@ -3208,25 +3457,22 @@ namespace swig {
     // C++ common/needed methods
     virtual SwigPyIterator *copy() const = 0;
 
-    PyObject *next()     
+    PyObject *__next__()
     {
       SWIG_PYTHON_THREAD_BEGIN_BLOCK; // disable threads       
       PyObject *obj = value();
-      incr();       
+      if (obj)
+        if (!incr())
+          obj = NULL;
       SWIG_PYTHON_THREAD_END_BLOCK; // re-enable threads
       return obj;     
     }
 
-    /* Make an alias for Python 3.x */
-    PyObject *__next__()
-    {
-      return next();
-    }
-
     PyObject *previous()
     {
       SWIG_PYTHON_THREAD_BEGIN_BLOCK; // disable threads       
-      decr();
+      if (!decr())
+        return NULL;
       PyObject *obj = value();
       SWIG_PYTHON_THREAD_END_BLOCK; // re-enable threads       
       return obj;
@@ -3234,7 +3480,7 @@ namespace swig {
 
     SwigPyIterator *advance(ptrdiff_t n)
     {
-      return  (n > 0) ?  incr(n) : decr(-n);
+      return  (n > 0) ?  incr((size_t)n) : decr((size_t)(-n));
     }
       
     bool operator == (const SwigPyIterator& x)  const
@@ -3249,12 +3495,14 @@ namespace swig {
       
     SwigPyIterator& operator += (ptrdiff_t n)
     {
-      return *advance(n);
+      SwigPyIterator *ret = advance(n);
+      return ret ? *ret : *this;
     }
 
     SwigPyIterator& operator -= (ptrdiff_t n)
     {
-      return *advance(-n);
+      SwigPyIterator *ret = advance(-n);
+      return ret ? *ret : *this;
     }
       
     SwigPyIterator* operator + (ptrdiff_t n) const
@@ -3273,20 +3521,15 @@ namespace swig {
     }
       
     static swig_type_info* descriptor() {
-      static int init = 0;
-      static swig_type_info* desc = 0;
-      if (!init) {
-	desc = SWIG_TypeQuery("swig::SwigPyIterator *");
-	init = 1;
-      }	
+      static swig_type_info* desc = SWIG_TypeQuery("swig::" SWIG_STRINGIFY(SwigPyIterator) " *");
       return desc;
-    }    
+    }
   };
 
 #if defined(SWIGPYTHON_BUILTIN)
   inline PyObject* make_output_iterator_builtin (PyObject *pyself)
   {
-    Py_INCREF(pyself);
+    SWIG_Py_INCREF(pyself);
     return pyself;
   }
 #endif
@@ -3300,11 +3543,6 @@ SWIG_AsVal_double (PyObject *obj, double *val)
   if (PyFloat_Check(obj)) {
     if (val) *val = PyFloat_AsDouble(obj);
     return SWIG_OK;
-#if PY_VERSION_HEX < 0x03000000
-  } else if (PyInt_Check(obj)) {
-    if (val) *val = (double) PyInt_AsLong(obj);
-    return SWIG_OK;
-#endif
   } else if (PyLong_Check(obj)) {
     double v = PyLong_AsDouble(obj);
     if (!PyErr_Occurred()) {
@@ -3339,6 +3577,9 @@ SWIG_AsVal_double (PyObject *obj, double *val)
 }
 
 
+#include <errno.h>
+
+
 #include <float.h>
 
 
@@ -3349,9 +3590,11 @@ SWIGINTERNINLINE int
 SWIG_CanCastAsInteger(double *d, double min, double max) {
   double x = *d;
   if ((min <= x && x <= max)) {
-   double fx = floor(x);
-   double cx = ceil(x);
-   double rd =  ((x - fx) < 0.5) ? fx : cx; /* simple rint */
+   double fx, cx, rd;
+   errno = 0;
+   fx = floor(x);
+   cx = ceil(x);
+   rd =  ((x - fx) < 0.5) ? fx : cx; /* simple rint */
    if ((errno == EDOM) || (errno == ERANGE)) {
      errno = 0;
    } else {
@@ -3378,17 +3621,6 @@ SWIG_CanCastAsInteger(double *d, double min, double max) {
 SWIGINTERN int
 SWIG_AsVal_unsigned_SS_long (PyObject *obj, unsigned long *val) 
 {
-#if PY_VERSION_HEX < 0x03000000
-  if (PyInt_Check(obj)) {
-    long v = PyInt_AsLong(obj);
-    if (v >= 0) {
-      if (val) *val = v;
-      return SWIG_OK;
-    } else {
-      return SWIG_OverflowError;
-    }
-  } else
-#endif
   if (PyLong_Check(obj)) {
     unsigned long v = PyLong_AsUnsignedLong(obj);
     if (!PyErr_Occurred()) {
@@ -3412,7 +3644,11 @@ SWIG_AsVal_unsigned_SS_long (PyObject *obj, unsigned long *val)
     if (!dispatch) {
       double d;
       int res = SWIG_AddCast(SWIG_AsVal_double (obj,&d));
-      if (SWIG_IsOK(res) && SWIG_CanCastAsInteger(&d, 0, ULONG_MAX)) {
+      // Largest double not larger than ULONG_MAX (not portably calculated easily)
+      // Note that double(ULONG_MAX) is stored in a double rounded up by one (for 64-bit unsigned long)
+      // 0xfffffffffffff800ULL == (uint64_t)std::nextafter(double(__uint128_t(ULONG_MAX)+1), double(0))
+      const double ulong_max = sizeof(unsigned long) == 8 ? 0xfffffffffffff800ULL : ULONG_MAX;
+      if (SWIG_IsOK(res) && SWIG_CanCastAsInteger(&d, 0, ulong_max)) {
 	if (val) *val = (unsigned long)(d);
 	return res;
       }
@@ -3500,7 +3736,7 @@ SWIG_AsVal_size_t (PyObject * obj, size_t *val)
 }
 
 
-  #define SWIG_From_long   PyInt_FromLong 
+  #define SWIG_From_long   PyLong_FromLong 
 
 
 #ifdef SWIG_LONG_LONG_AVAILABLE
@@ -3508,7 +3744,7 @@ SWIGINTERNINLINE PyObject*
 SWIG_From_long_SS_long  (long long value)
 {
   return ((value < LONG_MIN) || (value > LONG_MAX)) ?
-    PyLong_FromLongLong(value) : PyInt_FromLong(static_cast< long >(value));
+    PyLong_FromLongLong(value) : PyLong_FromLong(static_cast< long >(value));
 }
 #endif
 
@@ -3539,12 +3775,6 @@ SWIGINTERNINLINE PyObject*
 SWIGINTERN int
 SWIG_AsVal_long (PyObject *obj, long* val)
 {
-#if PY_VERSION_HEX < 0x03000000
-  if (PyInt_Check(obj)) {
-    if (val) *val = PyInt_AsLong(obj);
-    return SWIG_OK;
-  } else
-#endif
   if (PyLong_Check(obj)) {
     long v = PyLong_AsLong(obj);
     if (!PyErr_Occurred()) {
@@ -3558,7 +3788,7 @@ SWIG_AsVal_long (PyObject *obj, long* val)
 #ifdef SWIG_PYTHON_CAST_MODE
   {
     int dispatch = 0;
-    long v = PyInt_AsLong(obj);
+    long v = PyLong_AsLong(obj);
     if (!PyErr_Occurred()) {
       if (val) *val = v;
       return SWIG_AddCast(SWIG_OK);
@@ -3568,7 +3798,12 @@ SWIG_AsVal_long (PyObject *obj, long* val)
     if (!dispatch) {
       double d;
       int res = SWIG_AddCast(SWIG_AsVal_double (obj,&d));
-      if (SWIG_IsOK(res) && SWIG_CanCastAsInteger(&d, LONG_MIN, LONG_MAX)) {
+      // Largest double not larger than LONG_MAX (not portably calculated easily)
+      // Note that double(LONG_MAX) is stored in a double rounded up by one (for 64-bit long)
+      // 0x7ffffffffffffc00LL == (int64_t)std::nextafter(double(__uint128_t(LONG_MAX)+1), double(0))
+      const double long_max = sizeof(long) == 8 ? 0x7ffffffffffffc00LL : LONG_MAX;
+      // No equivalent needed for 64-bit double(LONG_MIN) is exactly LONG_MIN
+      if (SWIG_IsOK(res) && SWIG_CanCastAsInteger(&d, LONG_MIN, long_max)) {
 	if (val) *val = (long)(d);
 	return res;
       }
@@ -3655,113 +3890,68 @@ SWIG_AsVal_ptrdiff_t (PyObject * obj, ptrdiff_t *val)
 SWIGINTERN swig_type_info*
 SWIG_pchar_descriptor(void)
 {
-  static int init = 0;
   static swig_type_info* info = 0;
-  if (!init) {
+  if (!info) {
     info = SWIG_TypeQuery("_p_char");
-    init = 1;
   }
   return info;
 }
 
 
+/* Return string from Python obj. NOTE: obj must remain in scope in order
+   to use the returned cptr (but only when alloc is set to SWIG_OLDOBJ) */
 SWIGINTERN int
-SWIG_AsCharPtrAndSize(PyObject *obj, char** cptr, size_t* psize, int *alloc)
+SWIG_AsCharPtrAndSize(PyObject *obj, char **cptr, size_t *psize, int *alloc)
 {
-#if PY_VERSION_HEX>=0x03000000
-#if defined(SWIG_PYTHON_STRICT_BYTE_CHAR)
-  if (PyBytes_Check(obj))
-#else
-  if (PyUnicode_Check(obj))
-#endif
-#else  
-  if (PyString_Check(obj))
-#endif
-  {
-    char *cstr; Py_ssize_t len;
-#if PY_VERSION_HEX>=0x03000000
-#if !defined(SWIG_PYTHON_STRICT_BYTE_CHAR)
-    if (!alloc && cptr) {
-        /* We can't allow converting without allocation, since the internal
-           representation of string in Python 3 is UCS-2/UCS-4 but we require
-           a UTF-8 representation.
-           TODO(bhy) More detailed explanation */
-        return SWIG_RuntimeError;
-    }
-    obj = PyUnicode_AsUTF8String(obj);
-    if(alloc) *alloc = SWIG_NEWOBJ;
-#endif
-    PyBytes_AsStringAndSize(obj, &cstr, &len);
-#else
-    PyString_AsStringAndSize(obj, &cstr, &len);
-#endif
-    if (cptr) {
-      if (alloc) {
-	/* 
-	   In python the user should not be able to modify the inner
-	   string representation. To warranty that, if you define
-	   SWIG_PYTHON_SAFE_CSTRINGS, a new/copy of the python string
-	   buffer is always returned.
-
-	   The default behavior is just to return the pointer value,
-	   so, be careful.
-	*/ 
-#if defined(SWIG_PYTHON_SAFE_CSTRINGS)
-	if (*alloc != SWIG_OLDOBJ) 
-#else
-	if (*alloc == SWIG_NEWOBJ) 
-#endif
-	{
-	  *cptr = reinterpret_cast< char* >(memcpy(new char[len + 1], cstr, sizeof(char)*(len + 1)));
-	  *alloc = SWIG_NEWOBJ;
-	} else {
-	  *cptr = cstr;
-	  *alloc = SWIG_OLDOBJ;
-	}
-      } else {
-#if PY_VERSION_HEX>=0x03000000
-#if defined(SWIG_PYTHON_STRICT_BYTE_CHAR)
-	*cptr = PyBytes_AsString(obj);
-#else
-	assert(0); /* Should never reach here with Unicode strings in Python 3 */
-#endif
-#else
-	*cptr = SWIG_Python_str_AsChar(obj);
-#endif
-      }
-    }
-    if (psize) *psize = len + 1;
-#if PY_VERSION_HEX>=0x03000000 && !defined(SWIG_PYTHON_STRICT_BYTE_CHAR)
-    Py_XDECREF(obj);
-#endif
-    return SWIG_OK;
-  } else {
-#if defined(SWIG_PYTHON_2_UNICODE)
+  int use_binary = 0;       /* extract the value as raw bytes rather than as UTF-8 text */
+  int is_binary = 0;        /* SWIG_BINARYSTR was passed: report the exact byte count */
+  if (alloc != NULL) {
+    is_binary = SWIG_IsBinaryStr(*alloc);
+    use_binary = is_binary;
+    *alloc = 0;
+  }
 #if defined(SWIG_PYTHON_STRICT_BYTE_CHAR)
-#error "Cannot use both SWIG_PYTHON_2_UNICODE and SWIG_PYTHON_STRICT_BYTE_CHAR at once"
-#endif
-#if PY_VERSION_HEX<0x03000000
-    if (PyUnicode_Check(obj)) {
-      char *cstr; Py_ssize_t len;
-      if (!alloc && cptr) {
-        return SWIG_RuntimeError;
-      }
-      obj = PyUnicode_AsUTF8String(obj);
-      if (PyString_AsStringAndSize(obj, &cstr, &len) != -1) {
-        if (cptr) {
-          if (alloc) *alloc = SWIG_NEWOBJ;
-          *cptr = reinterpret_cast< char* >(memcpy(new char[len + 1], cstr, sizeof(char)*(len + 1)));
+  use_binary = 1;
+#endif
+  if (use_binary ? PyBytes_Check(obj) : PyUnicode_Check(obj))
+  {
+    char *cstr = NULL;
+    Py_ssize_t len = 0;
+    PyObject *bytes = NULL;
+    int ret = SWIG_OK;
+    if (alloc)
+      *alloc = SWIG_OLDOBJ;
+    if (use_binary) {
+      if (PyBytes_AsStringAndSize(obj, &cstr, &len) == -1)
+        return SWIG_TypeError;
+    } else {
+      cstr = (char *)SWIG_PyUnicode_AsUTF8AndSize(obj, &len, &bytes);
+      if (!cstr)
+        return SWIG_TypeError;
+      /* The returned string is only duplicated if the char * returned is not owned and memory managed by obj */
+      if (bytes && cptr) {
+        if (alloc) {
+          size_t alen = (size_t)(len + 1);
+          char *p = (new char[alen]());
+          if (p == NULL) {
+            SWIG_Py_XDECREF(bytes);
+            return SWIG_MemoryError;
+          }
+          memcpy(p, cstr, alen);
+          cstr = p;
+          *alloc = SWIG_NEWOBJ;
+        } else {
+          /* alloc must be set in order to clean up allocated memory */
+          SWIG_Py_XDECREF(bytes);
+          return SWIG_RuntimeError;
         }
-        if (psize) *psize = len + 1;
-
-        Py_XDECREF(obj);
-        return SWIG_OK;
-      } else {
-        Py_XDECREF(obj);
       }
     }
-#endif
-#endif
+    if (cptr) *cptr = cstr;
+    if (psize) *psize = is_binary ? (size_t)len : (size_t)(len + 1);
+    SWIG_Py_XDECREF(bytes);
+    return ret;
+  } else {
 
     swig_type_info* pchar_descriptor = SWIG_pchar_descriptor();
     if (pchar_descriptor) {
@@ -3792,12 +3982,8 @@ SWIG_AsPtr_std_string (PyObject * obj, std::string **val)
       return SWIG_OLDOBJ;
     }
   } else {
-    static int init = 0;
-    static swig_type_info* descriptor = 0;
-    if (!init) {
-      descriptor = SWIG_TypeQuery("std::string" " *");
-      init = 1;
-    }
+    PyErr_Clear();
+    static swig_type_info *descriptor = SWIG_TypeQuery("std::string" " *");
     if (descriptor) {
       std::string *vptr;
       int res = SWIG_ConvertPtr(obj, (void**)&vptr, descriptor, 0);
@@ -3842,31 +4028,26 @@ SWIG_AsVal_int (PyObject * obj, int *val)
 SWIGINTERNINLINE PyObject*
   SWIG_From_int  (int value)
 {
-  return PyInt_FromLong((long) value);
+  return PyLong_FromLong((long) value);
 }
 
 
+#define SWIG_FromCharPtrAndSize(carray, size) SWIG_FromBinaryCharPtrAndSize(carray, size, 0)
 SWIGINTERNINLINE PyObject *
-SWIG_FromCharPtrAndSize(const char* carray, size_t size)
+SWIG_FromBinaryCharPtrAndSize(const char* carray, size_t size, int flags)
 {
   if (carray) {
-    if (size > INT_MAX) {
+    if (size > (size_t)PY_SSIZE_T_MAX) {
       swig_type_info* pchar_descriptor = SWIG_pchar_descriptor();
       return pchar_descriptor ? 
 	SWIG_InternalNewPointerObj(const_cast< char * >(carray), pchar_descriptor, 0) : SWIG_Py_Void();
     } else {
-#if PY_VERSION_HEX >= 0x03000000
 #if defined(SWIG_PYTHON_STRICT_BYTE_CHAR)
       return PyBytes_FromStringAndSize(carray, static_cast< Py_ssize_t >(size));
 #else
-#if PY_VERSION_HEX >= 0x03010000
+      if (SWIG_IsBinaryStr(flags))
+        return PyBytes_FromStringAndSize(carray, static_cast< Py_ssize_t >(size));
       return PyUnicode_DecodeUTF8(carray, static_cast< Py_ssize_t >(size), "surrogateescape");
-#else
-      return PyUnicode_FromStringAndSize(carray, static_cast< Py_ssize_t >(size));
-#endif
-#endif
-#else
-      return PyString_FromStringAndSize(carray, static_cast< Py_ssize_t >(size));
 #endif
     }
   } else {
@@ -4013,11 +4194,20 @@ namespace swig {
   template <class Type>
   struct traits_asptr {   
     static int asptr(PyObject *obj, Type **val) {
-      Type *p;
+      int res = SWIG_ERROR;
       swig_type_info *descriptor = type_info<Type>();
-      int res = descriptor ? SWIG_ConvertPtr(obj, (void **)&p, descriptor, 0) : SWIG_ERROR;
-      if (SWIG_IsOK(res)) {
-	if (val) *val = p;
+      if (val) {
+        Type *p = 0;
+        int newmem = 0;
+        res = descriptor ? SWIG_ConvertPtrAndOwn(obj, (void **)&p, descriptor, 0, &newmem) : SWIG_ERROR;
+        if (SWIG_IsOK(res)) {
+          if (newmem & SWIG_CAST_NEW_MEMORY) {
+            res |= SWIG_NEWOBJMASK;
+          }
+          *val = p;
+        }
+      } else {
+        res = descriptor ? SWIG_ConvertPtr(obj, 0, descriptor, 0) : SWIG_ERROR;
       }
       return res;
     }
@@ -4075,14 +4265,14 @@ namespace swig {
 
   template <class Type> 
   struct traits_as<Type, value_category> {
-    static Type as(PyObject *obj, bool throw_error) {
+    static Type as(PyObject *obj) {
       Type v;
       int res = asval(obj, &v);
       if (!obj || !SWIG_IsOK(res)) {
 	if (!PyErr_Occurred()) {
 	  ::SWIG_Error(SWIG_TypeError,  swig::type_name<Type>());
 	}
-	if (throw_error) throw std::invalid_argument("bad type");
+	throw std::invalid_argument("bad type");
       }
       return v;
     }
@@ -4090,7 +4280,7 @@ namespace swig {
 
   template <class Type> 
   struct traits_as<Type, pointer_category> {
-    static Type as(PyObject *obj, bool throw_error) {
+    static Type as(PyObject *obj) {
       Type *v = 0;      
       int res = (obj ? traits_asptr<Type>::asptr(obj, &v) : SWIG_ERROR);
       if (SWIG_IsOK(res) && v) {
@@ -4102,21 +4292,17 @@ namespace swig {
 	  return *v;
 	}
       } else {
-	// Uninitialized return value, no Type() constructor required.
-	static Type *v_def = (Type*) malloc(sizeof(Type));
 	if (!PyErr_Occurred()) {
 	  SWIG_Error(SWIG_TypeError,  swig::type_name<Type>());
 	}
-	if (throw_error) throw std::invalid_argument("bad type");
-	memset(v_def,0,sizeof(Type));
-	return *v_def;
+	throw std::invalid_argument("bad type");
       }
     }
   };
 
   template <class Type> 
   struct traits_as<Type*, pointer_category> {
-    static Type* as(PyObject *obj, bool throw_error) {
+    static Type* as(PyObject *obj) {
       Type *v = 0;      
       int res = (obj ? traits_asptr<Type>::asptr(obj, &v) : SWIG_ERROR);
       if (SWIG_IsOK(res)) {
@@ -4125,15 +4311,14 @@ namespace swig {
 	if (!PyErr_Occurred()) {
 	  SWIG_Error(SWIG_TypeError,  swig::type_name<Type>());
 	}
-	if (throw_error) throw std::invalid_argument("bad type");
-	return 0;
+	throw std::invalid_argument("bad type");
       }
     }
   };
     
   template <class Type>
-  inline Type as(PyObject *obj, bool te = false) {
-    return traits_as<Type, typename traits<Type>::category>::as(obj, te);
+  inline Type as(PyObject *obj) {
+    return traits_as<Type, typename traits<Type>::category>::as(obj);
   }
 
   template <class Type> 
@@ -4159,9 +4344,291 @@ namespace swig {
 }
 
 
-#include <functional>
+#if defined(__SUNPRO_CC) && defined(_RWSTD_VER)
+#  if !defined(SWIG_NO_STD_NOITERATOR_TRAITS_STL)
+#    define SWIG_STD_NOITERATOR_TRAITS_STL
+#  endif
+#endif
 
-namespace std {
+#if !defined(SWIG_STD_NOITERATOR_TRAITS_STL)
+#include <iterator>
+#else
+namespace std {
+  template <class Iterator>
+  struct iterator_traits {
+    typedef ptrdiff_t difference_type;
+    typedef typename Iterator::value_type value_type;
+  };
+
+  template <class Iterator, class Category,class T, class Reference, class Pointer, class Distance>
+  struct iterator_traits<__reverse_bi_iterator<Iterator,Category,T,Reference,Pointer,Distance> > {
+    typedef Distance difference_type;
+    typedef T value_type;
+  };
+
+  template <class T>
+  struct iterator_traits<T*> {
+    typedef T value_type;
+    typedef ptrdiff_t difference_type;
+  };
+
+  template<typename _InputIterator>
+  inline typename iterator_traits<_InputIterator>::difference_type
+  distance(_InputIterator __first, _InputIterator __last)
+  {
+    typename iterator_traits<_InputIterator>::difference_type __n = 0;
+    while (__first != __last) {
+      ++__first; ++__n;
+    }
+    return __n;
+  }
+}
+#endif
+
+
+namespace swig {
+  template<typename OutIterator>
+  class SwigPyIterator_T :  public SwigPyIterator
+  {
+  public:
+    typedef OutIterator out_iterator;
+    typedef typename std::iterator_traits<out_iterator>::value_type value_type;    
+    typedef SwigPyIterator_T<out_iterator> self_type;
+
+    SwigPyIterator_T(out_iterator curr, PyObject *seq)
+      : SwigPyIterator(seq), current(curr)
+    {
+    }
+
+    const out_iterator& get_current() const
+    {
+      return current;
+    }
+
+    
+    bool equal (const SwigPyIterator &iter) const SWIG_OVERRIDE
+    {
+      const self_type *iters = dynamic_cast<const self_type *>(&iter);
+      if (iters) {
+	return (current == iters->get_current());
+      } else {
+	throw std::invalid_argument("bad iterator type");
+      }
+    }
+    
+    ptrdiff_t distance(const SwigPyIterator &iter) const SWIG_OVERRIDE
+    {
+      const self_type *iters = dynamic_cast<const self_type *>(&iter);
+      if (iters) {
+	return std::distance(current, iters->get_current());
+      } else {
+	throw std::invalid_argument("bad iterator type");
+      }
+    }    
+    
+  protected:
+    out_iterator current;
+  };
+  
+  template <class ValueType>
+  struct from_oper 
+  {
+    typedef const ValueType& argument_type;
+    typedef PyObject *result_type;
+    result_type operator()(argument_type v) const
+    {
+      return swig::from(v);
+    }
+  };
+
+  template<typename OutIterator, 
+	   typename ValueType = typename std::iterator_traits<OutIterator>::value_type,
+	   typename FromOper = from_oper<ValueType> >
+  class SwigPyForwardIteratorOpen_T :  public SwigPyIterator_T<OutIterator>
+  {
+  public:
+    FromOper from;
+    typedef OutIterator out_iterator;
+    typedef ValueType value_type;
+    typedef SwigPyIterator_T<out_iterator>  base;
+    typedef SwigPyForwardIteratorOpen_T<OutIterator, ValueType, FromOper> self_type;
+    
+    SwigPyForwardIteratorOpen_T(out_iterator curr, PyObject *seq)
+      : SwigPyIterator_T<OutIterator>(curr, seq)
+    {
+    }
+    
+    PyObject *value() const SWIG_OVERRIDE {
+      return from(static_cast<const value_type&>(*(base::current)));
+    }
+    
+    SwigPyIterator *copy() const SWIG_OVERRIDE
+    {
+      return new self_type(*this);
+    }
+
+    SwigPyIterator *incr(size_t n = 1) SWIG_OVERRIDE
+    {
+      // Open iterator does not raise StopIteration
+      while (n--) {
+	++base::current;
+      }
+      return this;
+    }
+
+  };
+
+  template<typename OutIterator, 
+	   typename ValueType = typename std::iterator_traits<OutIterator>::value_type,
+	   typename FromOper = from_oper<ValueType> >
+  class SwigPyIteratorOpen_T :  public SwigPyForwardIteratorOpen_T<OutIterator, ValueType, FromOper>
+  {
+  public:
+    FromOper from;
+    typedef OutIterator out_iterator;
+    typedef ValueType value_type;
+    typedef SwigPyIterator_T<out_iterator>  base;
+    typedef SwigPyIteratorOpen_T<OutIterator, ValueType, FromOper> self_type;
+    
+    SwigPyIteratorOpen_T(out_iterator curr, PyObject *seq)
+      : SwigPyForwardIteratorOpen_T<OutIterator>(curr, seq)
+    {
+    }
+
+    SwigPyIterator *decr(size_t n = 1) SWIG_OVERRIDE
+    {
+      // Open iterator does not raise StopIteration
+      while (n--) {
+	--base::current;
+      }
+      return this;
+    }
+  };
+
+  template<typename OutIterator, 
+	   typename ValueType = typename std::iterator_traits<OutIterator>::value_type,
+	   typename FromOper = from_oper<ValueType> >
+  class SwigPyForwardIteratorClosed_T :  public SwigPyIterator_T<OutIterator>
+  {
+  public:
+    FromOper from;
+    typedef OutIterator out_iterator;
+    typedef ValueType value_type;
+    typedef SwigPyIterator_T<out_iterator>  base;    
+    typedef SwigPyForwardIteratorClosed_T<OutIterator, ValueType, FromOper> self_type;
+    
+    SwigPyForwardIteratorClosed_T(out_iterator curr, out_iterator first, out_iterator last, PyObject *seq)
+      : SwigPyIterator_T<OutIterator>(curr, seq), begin(first), end(last)
+    {
+    }
+    
+    PyObject *value() const SWIG_OVERRIDE {
+      if (base::current == end) {
+	base::raise_stop_iteration();
+	return NULL;
+      } else {
+	return from(static_cast<const value_type&>(*(base::current)));
+      }
+    }
+    
+    SwigPyIterator *copy() const SWIG_OVERRIDE
+    {
+      return new self_type(*this);
+    }
+
+    SwigPyIterator *incr(size_t n = 1) SWIG_OVERRIDE
+    {
+      while (n--) {
+	if (base::current == end) {
+	  base::raise_stop_iteration();
+	  return NULL;
+	} else {
+	  ++base::current;
+	}
+      }
+      return this;
+    }
+
+  protected:
+    out_iterator begin;
+    out_iterator end;
+  };
+
+  template<typename OutIterator, 
+	   typename ValueType = typename std::iterator_traits<OutIterator>::value_type,
+	   typename FromOper = from_oper<ValueType> >
+  class SwigPyIteratorClosed_T :  public SwigPyForwardIteratorClosed_T<OutIterator,ValueType,FromOper>
+  {
+  public:
+    FromOper from;
+    typedef OutIterator out_iterator;
+    typedef ValueType value_type;
+    typedef SwigPyIterator_T<out_iterator>  base;
+    typedef SwigPyForwardIteratorClosed_T<OutIterator, ValueType, FromOper> base0;
+    typedef SwigPyIteratorClosed_T<OutIterator, ValueType, FromOper> self_type;
+    
+    SwigPyIteratorClosed_T(out_iterator curr, out_iterator first, out_iterator last, PyObject *seq)
+      : SwigPyForwardIteratorClosed_T<OutIterator,ValueType,FromOper>(curr, first, last, seq)
+    {
+    }
+
+    SwigPyIterator *decr(size_t n = 1) SWIG_OVERRIDE
+    {
+      while (n--) {
+	if (base::current == base0::begin) {
+	  base0::raise_stop_iteration();
+	  return NULL;
+	} else {
+	  --base::current;
+	}
+      }
+      return this;
+    }
+  };
+
+
+  template<typename OutIter>
+  inline SwigPyIterator*
+  make_output_forward_iterator(const OutIter& current, const OutIter& begin,const OutIter& end, PyObject *seq = 0)
+  {
+    return new SwigPyForwardIteratorClosed_T<OutIter>(current, begin, end, seq);
+  }
+
+  template<typename OutIter>
+  inline SwigPyIterator*
+  make_output_iterator(const OutIter& current, const OutIter& begin,const OutIter& end, PyObject *seq = 0)
+  {
+    return new SwigPyIteratorClosed_T<OutIter>(current, begin, end, seq);
+  }
+
+  template<typename OutIter>
+  inline SwigPyIterator*
+  make_output_forward_iterator(const OutIter& current, PyObject *seq = 0)
+  {
+    return new SwigPyForwardIteratorOpen_T<OutIter>(current, seq);
+  }
+
+  template<typename OutIter>
+  inline SwigPyIterator*
+  make_output_iterator(const OutIter& current, PyObject *seq = 0)
+  {
+    return new SwigPyIteratorOpen_T<OutIter>(current, seq);
+  }
+
+}
+
+
+  namespace swig {
+    template <>  struct traits< SOMcomponent > {
+      typedef pointer_category category;
+      static const char* type_name() { return"SOMcomponent"; }
+    };
+  }
+
+
+#include <functional>
+
+namespace std {
   template <>
   struct less <PyObject *>
   {
@@ -4233,7 +4700,7 @@ namespace swig {
   template <>  struct traits_from<PyObject *> {
     typedef PyObject * value_type;
     static PyObject *from(const value_type& val) {
-      Py_XINCREF(val);
+      SWIG_Py_XINCREF(val);
       return val;
     }
   };
@@ -4400,13 +4867,13 @@ namespace swig {
         size_t replacecount = (jj - ii + step - 1) / step;
         if (is.size() != replacecount) {
           char msg[1024];
-          sprintf(msg, "attempt to assign sequence of size %lu to extended slice of size %lu", (unsigned long)is.size(), (unsigned long)replacecount);
+          PyOS_snprintf(msg, sizeof(msg), "attempt to assign sequence of size %lu to extended slice of size %lu", (unsigned long)is.size(), (unsigned long)replacecount);
           throw std::invalid_argument(msg);
         }
         typename Sequence::const_iterator isit = is.begin();
         typename Sequence::iterator it = self->begin();
         std::advance(it,ii);
-        for (size_t rc=0; rc<replacecount; ++rc) {
+        for (size_t rc=0; rc<replacecount && it != self->end(); ++rc) {
           *it++ = *isit++;
           for (Py_ssize_t c=0; c<(step-1) && it != self->end(); ++c)
             it++;
@@ -4416,536 +4883,102 @@ namespace swig {
       size_t replacecount = (ii - jj - step - 1) / -step;
       if (is.size() != replacecount) {
         char msg[1024];
-        sprintf(msg, "attempt to assign sequence of size %lu to extended slice of size %lu", (unsigned long)is.size(), (unsigned long)replacecount);
+        PyOS_snprintf(msg, sizeof(msg), "attempt to assign sequence of size %lu to extended slice of size %lu", (unsigned long)is.size(), (unsigned long)replacecount);
         throw std::invalid_argument(msg);
       }
       typename Sequence::const_iterator isit = is.begin();
       typename Sequence::reverse_iterator it = self->rbegin();
       std::advance(it,size-ii-1);
-      for (size_t rc=0; rc<replacecount; ++rc) {
+      for (size_t rc=0; rc<replacecount && it != self->rend(); ++rc) {
         *it++ = *isit++;
         for (Py_ssize_t c=0; c<(-step-1) && it != self->rend(); ++c)
           it++;
-      }
-    }
-  }
-
-  template <class Sequence, class Difference>
-  inline void
-  delslice(Sequence* self, Difference i, Difference j, Py_ssize_t step) {
-    typename Sequence::size_type size = self->size();
-    Difference ii = 0;
-    Difference jj = 0;
-    swig::slice_adjust(i, j, step, size, ii, jj, true);
-    if (step > 0) {
-      typename Sequence::iterator sb = self->begin();
-      std::advance(sb,ii);
-      if (step == 1) {
-        typename Sequence::iterator se = self->begin();
-        std::advance(se,jj);
-        self->erase(sb,se);
-      } else {
-        typename Sequence::iterator it = sb;
-        size_t delcount = (jj - ii + step - 1) / step;
-        while (delcount) {
-          it = self->erase(it);
-          for (Py_ssize_t c=0; c<(step-1) && it != self->end(); ++c)
-            it++;
-          delcount--;
-        }
-      }
-    } else {
-      typename Sequence::reverse_iterator sb = self->rbegin();
-      std::advance(sb,size-ii-1);
-      typename Sequence::reverse_iterator it = sb;
-      size_t delcount = (ii - jj - step - 1) / -step;
-      while (delcount) {
-        it = typename Sequence::reverse_iterator(self->erase((++it).base()));
-        for (Py_ssize_t c=0; c<(-step-1) && it != self->rend(); ++c)
-          it++;
-        delcount--;
-      }
-    }
-  }
-}
-
-
-#if defined(__SUNPRO_CC) && defined(_RWSTD_VER)
-#  if !defined(SWIG_NO_STD_NOITERATOR_TRAITS_STL)
-#    define SWIG_STD_NOITERATOR_TRAITS_STL
-#  endif
-#endif
-
-#if !defined(SWIG_STD_NOITERATOR_TRAITS_STL)
-#include <iterator>
-#else
-namespace std {
-  template <class Iterator>
-  struct iterator_traits {
-    typedef ptrdiff_t difference_type;
-    typedef typename Iterator::value_type value_type;
-  };
-
-  template <class Iterator, class Category,class T, class Reference, class Pointer, class Distance>
-  struct iterator_traits<__reverse_bi_iterator<Iterator,Category,T,Reference,Pointer,Distance> > {
-    typedef Distance difference_type;
-    typedef T value_type;
-  };
-
-  template <class T>
-  struct iterator_traits<T*> {
-    typedef T value_type;
-    typedef ptrdiff_t difference_type;
-  };
-
-  template<typename _InputIterator>
-  inline typename iterator_traits<_InputIterator>::difference_type
-  distance(_InputIterator __first, _InputIterator __last)
-  {
-    typename iterator_traits<_InputIterator>::difference_type __n = 0;
-    while (__first != __last) {
-      ++__first; ++__n;
-    }
-    return __n;
-  }
-}
-#endif
-
-
-namespace swig {
-  template<typename OutIterator>
-  class SwigPyIterator_T :  public SwigPyIterator
-  {
-  public:
-    typedef OutIterator out_iterator;
-    typedef typename std::iterator_traits<out_iterator>::value_type value_type;    
-    typedef SwigPyIterator_T<out_iterator> self_type;
-
-    SwigPyIterator_T(out_iterator curr, PyObject *seq)
-      : SwigPyIterator(seq), current(curr)
-    {
-    }
-
-    const out_iterator& get_current() const
-    {
-      return current;
-    }
-
-    
-    bool equal (const SwigPyIterator &iter) const
-    {
-      const self_type *iters = dynamic_cast<const self_type *>(&iter);
-      if (iters) {
-	return (current == iters->get_current());
-      } else {
-	throw std::invalid_argument("bad iterator type");
-      }
-    }
-    
-    ptrdiff_t distance(const SwigPyIterator &iter) const
-    {
-      const self_type *iters = dynamic_cast<const self_type *>(&iter);
-      if (iters) {
-	return std::distance(current, iters->get_current());
-      } else {
-	throw std::invalid_argument("bad iterator type");
-      }
-    }    
-    
-  protected:
-    out_iterator current;
-  };
-  
-  template <class ValueType>
-  struct from_oper 
-  {
-    typedef const ValueType& argument_type;
-    typedef PyObject *result_type;
-    result_type operator()(argument_type v) const
-    {
-      return swig::from(v);
-    }
-  };
-
-  template<typename OutIterator, 
-	   typename ValueType = typename std::iterator_traits<OutIterator>::value_type,
-	   typename FromOper = from_oper<ValueType> >
-  class SwigPyIteratorOpen_T :  public SwigPyIterator_T<OutIterator>
-  {
-  public:
-    FromOper from;
-    typedef OutIterator out_iterator;
-    typedef ValueType value_type;
-    typedef SwigPyIterator_T<out_iterator>  base;
-    typedef SwigPyIteratorOpen_T<OutIterator, ValueType, FromOper> self_type;
-    
-    SwigPyIteratorOpen_T(out_iterator curr, PyObject *seq)
-      : SwigPyIterator_T<OutIterator>(curr, seq)
-    {
-    }
-    
-    PyObject *value() const {
-      return from(static_cast<const value_type&>(*(base::current)));
-    }
-    
-    SwigPyIterator *copy() const
-    {
-      return new self_type(*this);
-    }
-
-    SwigPyIterator *incr(size_t n = 1)
-    {
-      while (n--) {
-	++base::current;
-      }
-      return this;
-    }
-
-    SwigPyIterator *decr(size_t n = 1)
-    {
-      while (n--) {
-	--base::current;
-      }
-      return this;
-    }
-  };
-
-  template<typename OutIterator, 
-	   typename ValueType = typename std::iterator_traits<OutIterator>::value_type,
-	   typename FromOper = from_oper<ValueType> >
-  class SwigPyIteratorClosed_T :  public SwigPyIterator_T<OutIterator>
-  {
-  public:
-    FromOper from;
-    typedef OutIterator out_iterator;
-    typedef ValueType value_type;
-    typedef SwigPyIterator_T<out_iterator>  base;    
-    typedef SwigPyIteratorClosed_T<OutIterator, ValueType, FromOper> self_type;
-    
-    SwigPyIteratorClosed_T(out_iterator curr, out_iterator first, out_iterator last, PyObject *seq)
-      : SwigPyIterator_T<OutIterator>(curr, seq), begin(first), end(last)
-    {
-    }
-    
-    PyObject *value() const {
-      if (base::current == end) {
-	throw stop_iteration();
-      } else {
-	return from(static_cast<const value_type&>(*(base::current)));
-      }
-    }
-    
-    SwigPyIterator *copy() const
-    {
-      return new self_type(*this);
-    }
-
-    SwigPyIterator *incr(size_t n = 1)
-    {
-      while (n--) {
-	if (base::current == end) {
-	  throw stop_iteration();
-	} else {
-	  ++base::current;
-	}
-      }
-      return this;
-    }
-
-    SwigPyIterator *decr(size_t n = 1)
-    {
-      while (n--) {
-	if (base::current == begin) {
-	  throw stop_iteration();
-	} else {
-	  --base::current;
-	}
-      }
-      return this;
-    }
-
-  private:
-    out_iterator begin;
-    out_iterator end;
-  };
-
-  template<typename OutIter>
-  inline SwigPyIterator*
-  make_output_iterator(const OutIter& current, const OutIter& begin,const OutIter& end, PyObject *seq = 0)
-  {
-    return new SwigPyIteratorClosed_T<OutIter>(current, begin, end, seq);
-  }
-
-  template<typename OutIter>
-  inline SwigPyIterator*
-  make_output_iterator(const OutIter& current, PyObject *seq = 0)
-  {
-    return new SwigPyIteratorOpen_T<OutIter>(current, seq);
-  }
-
-}
-
-
-namespace swig
-{
-  template <class T>
-  struct SwigPySequence_Ref
-  {
-    SwigPySequence_Ref(PyObject* seq, Py_ssize_t index)
-      : _seq(seq), _index(index)
-    {
-    }
-    
-    operator T () const
-    {
-      swig::SwigVar_PyObject item = PySequence_GetItem(_seq, _index);
-      try {
-	return swig::as<T>(item, true);
-      } catch (std::exception& e) {
-	char msg[1024];
-	sprintf(msg, "in sequence element %d ", (int)_index);
-	if (!PyErr_Occurred()) {
-	  ::SWIG_Error(SWIG_TypeError,  swig::type_name<T>());
-	}
-	SWIG_Python_AddErrorMsg(msg);
-	SWIG_Python_AddErrorMsg(e.what());
-	throw;
-      }
-    }
-
-    SwigPySequence_Ref& operator=(const T& v)
-    {
-      PySequence_SetItem(_seq, _index, swig::from<T>(v));
-      return *this;
-    }
-
-  private:
-    PyObject* _seq;
-    Py_ssize_t _index;
-  };
-
-  template <class T>
-  struct SwigPySequence_ArrowProxy
-  {
-    SwigPySequence_ArrowProxy(const T& x): m_value(x) {}
-    const T* operator->() const { return &m_value; }
-    operator const T*() const { return &m_value; }
-    T m_value;
-  };
-
-  template <class T, class Reference >
-  struct SwigPySequence_InputIterator
-  {
-    typedef SwigPySequence_InputIterator<T, Reference > self;
-
-    typedef std::random_access_iterator_tag iterator_category;
-    typedef Reference reference;
-    typedef T value_type;
-    typedef T* pointer;
-    typedef Py_ssize_t difference_type;
-
-    SwigPySequence_InputIterator()
-    {
-    }
-
-    SwigPySequence_InputIterator(PyObject* seq, Py_ssize_t index)
-      : _seq(seq), _index(index)
-    {
-    }
-
-    reference operator*() const
-    {
-      return reference(_seq, _index);
-    }
-
-    SwigPySequence_ArrowProxy<T>
-    operator->() const {
-      return SwigPySequence_ArrowProxy<T>(operator*());
-    }
-
-    bool operator==(const self& ri) const
-    {
-      return (_index == ri._index) && (_seq == ri._seq);
-    }
-
-    bool operator!=(const self& ri) const
-    {
-      return !(operator==(ri));
-    }
-
-    self& operator ++ ()
-    {
-      ++_index;
-      return *this;
-    }
-
-    self& operator -- ()
-    {
-      --_index;
-      return *this;
-    }
-
-    self& operator += (difference_type n)
-    {
-      _index += n;
-      return *this;
-    }
-
-    self operator +(difference_type n) const
-    {
-      return self(_seq, _index + n);
-    }
-
-    self& operator -= (difference_type n)
-    {
-      _index -= n;
-      return *this;
-    }
-
-    self operator -(difference_type n) const
-    {
-      return self(_seq, _index - n);
-    }
-
-    difference_type operator - (const self& ri) const
-    {
-      return _index - ri._index;
-    }
-
-    bool operator < (const self& ri) const
-    {
-      return _index < ri._index;
-    }
-
-    reference
-    operator[](difference_type n) const
-    {
-      return reference(_seq, _index + n);
-    }
-
-  private:
-    PyObject* _seq;
-    difference_type _index;
-  };
-
-  // STL container wrapper around a Python sequence
-  template <class T>
-  struct SwigPySequence_Cont
-  {
-    typedef SwigPySequence_Ref<T> reference;
-    typedef const SwigPySequence_Ref<T> const_reference;
-    typedef T value_type;
-    typedef T* pointer;
-    typedef Py_ssize_t difference_type;
-    typedef size_t size_type;
-    typedef const pointer const_pointer;
-    typedef SwigPySequence_InputIterator<T, reference> iterator;
-    typedef SwigPySequence_InputIterator<T, const_reference> const_iterator;
-
-    SwigPySequence_Cont(PyObject* seq) : _seq(0)
-    {
-      if (!PySequence_Check(seq)) {
-	throw std::invalid_argument("a sequence is expected");
-      }
-      _seq = seq;
-      Py_INCREF(_seq);
-    }
-
-    ~SwigPySequence_Cont()
-    {
-      Py_XDECREF(_seq);
-    }
-
-    size_type size() const
-    {
-      return static_cast<size_type>(PySequence_Size(_seq));
-    }
-
-    bool empty() const
-    {
-      return size() == 0;
-    }
-
-    iterator begin()
-    {
-      return iterator(_seq, 0);
-    }
-
-    const_iterator begin() const
-    {
-      return const_iterator(_seq, 0);
-    }
-
-    iterator end()
-    {
-      return iterator(_seq, size());
-    }
-
-    const_iterator end() const
-    {
-      return const_iterator(_seq, size());
-    }
-
-    reference operator[](difference_type n)
-    {
-      return reference(_seq, n);
-    }
-
-    const_reference operator[](difference_type n)  const
-    {
-      return const_reference(_seq, n);
+      }
     }
+  }
 
-    bool check(bool set_err = true) const
-    {
-      Py_ssize_t s = size();
-      for (Py_ssize_t i = 0; i < s; ++i) {
-	swig::SwigVar_PyObject item = PySequence_GetItem(_seq, i);
-	if (!swig::check<value_type>(item)) {
-	  if (set_err) {
-	    char msg[1024];
-	    sprintf(msg, "in sequence element %d", (int)i);
-	    SWIG_Error(SWIG_RuntimeError, msg);
-	  }
-	  return false;
-	}
+  template <class Sequence, class Difference>
+  inline void
+  delslice(Sequence* self, Difference i, Difference j, Py_ssize_t step) {
+    typename Sequence::size_type size = self->size();
+    Difference ii = 0;
+    Difference jj = 0;
+    swig::slice_adjust(i, j, step, size, ii, jj, true);
+    if (step > 0) {
+      typename Sequence::iterator sb = self->begin();
+      std::advance(sb,ii);
+      if (step == 1) {
+        typename Sequence::iterator se = self->begin();
+        std::advance(se,jj);
+        self->erase(sb,se);
+      } else {
+        typename Sequence::iterator it = sb;
+        size_t delcount = (jj - ii + step - 1) / step;
+        while (delcount) {
+          it = self->erase(it);
+          for (Py_ssize_t c=0; c<(step-1) && it != self->end(); ++c)
+            it++;
+          delcount--;
+        }
+      }
+    } else {
+      typename Sequence::reverse_iterator sb = self->rbegin();
+      std::advance(sb,size-ii-1);
+      typename Sequence::reverse_iterator it = sb;
+      size_t delcount = (ii - jj - step - 1) / -step;
+      while (delcount) {
+        it = typename Sequence::reverse_iterator(self->erase((++it).base()));
+        for (Py_ssize_t c=0; c<(-step-1) && it != self->rend(); ++c)
+          it++;
+        delcount--;
       }
-      return true;
     }
-
-  private:
-    PyObject* _seq;
-  };
-
-}
-
-
-  namespace swig {
-    template <>  struct traits< SOMcomponent > {
-      typedef pointer_category category;
-      static const char* type_name() { return"SOMcomponent"; }
-    };
   }
+}
 
 
 namespace swig {
-  template <class SwigPySeq, class Seq>
-  inline void
-  assign(const SwigPySeq& swigpyseq, Seq* seq) {
-    // seq->assign(swigpyseq.begin(), swigpyseq.end()); // not used as not always implemented
-    typedef typename SwigPySeq::value_type value_type;
-    typename SwigPySeq::const_iterator it = swigpyseq.begin();
-    for (;it != swigpyseq.end(); ++it) {
-      seq->insert(seq->end(),(value_type)(*it));
+  template <class Seq, class T = typename Seq::value_type >
+  struct IteratorProtocol {
+    static void assign(PyObject *obj, Seq *seq) {
+      SwigVar_PyObject iter = PyObject_GetIter(obj);
+      if (iter) {
+        SwigVar_PyObject item = PyIter_Next(iter);
+        while (item) {
+          seq->insert(seq->end(), swig::as<T>(item));
+          item = PyIter_Next(iter);
+        }
+      }
     }
-  }
+
+    static bool check(PyObject *obj) {
+      bool ret = false;
+      SwigVar_PyObject iter = PyObject_GetIter(obj);
+      if (iter) {
+        SwigVar_PyObject item = PyIter_Next(iter);
+        ret = true;
+        while (item) {
+          ret = swig::check<T>(item);
+          item = ret ? PyIter_Next(iter) : 0;
+        }
+      }
+      return ret;
+    }
+  };
 
   template <class Seq, class T = typename Seq::value_type >
   struct traits_asptr_stdseq {
     typedef Seq sequence;
     typedef T value_type;
 
+    static bool is_iterable(PyObject *obj) {
+      SwigVar_PyObject iter = PyObject_GetIter(obj);
+      PyErr_Clear();
+      return iter != 0;
+    }
+
     static int asptr(PyObject *obj, sequence **seq) {
+      int ret = SWIG_ERROR;
       if (obj == Py_None || SWIG_Python_GetSwigThis(obj)) {
 	sequence *p;
 	swig_type_info *descriptor = swig::type_info<sequence>();
@@ -4953,27 +4986,25 @@ namespace swig {
 	  if (seq) *seq = p;
 	  return SWIG_OLDOBJ;
 	}
-      } else if (PySequence_Check(obj)) {
+      } else if (is_iterable(obj)) {
 	try {
-	  SwigPySequence_Cont<value_type> swigpyseq(obj);
 	  if (seq) {
-	    sequence *pseq = new sequence();
-	    assign(swigpyseq, pseq);
-	    *seq = pseq;
-	    return SWIG_NEWOBJ;
+	    *seq = new sequence();
+            IteratorProtocol<Seq, T>::assign(obj, *seq);
+            if (!PyErr_Occurred())
+              return SWIG_NEWOBJ;
 	  } else {
-	    return swigpyseq.check() ? SWIG_OK : SWIG_ERROR;
+	    return IteratorProtocol<Seq, T>::check(obj) ? SWIG_OK : SWIG_ERROR;
 	  }
 	} catch (std::exception& e) {
-	  if (seq) {
-	    if (!PyErr_Occurred()) {
-	      PyErr_SetString(PyExc_TypeError, e.what());
-	    }
-	  }
-	  return SWIG_ERROR;
+          if (seq && !PyErr_Occurred())
+            PyErr_SetString(PyExc_TypeError, e.what());
 	}
+        if (seq)
+          delete *seq;
+	return SWIG_ERROR;
       }
-      return SWIG_ERROR;
+      return ret;
     }
   };
 
@@ -4992,7 +5023,7 @@ namespace swig {
       }
 #endif
       size_type size = seq.size();
-      if (size <= (size_type)INT_MAX) {
+      if (size <= (size_type)PY_SSIZE_T_MAX) {
 	PyObject *obj = PyTuple_New((Py_ssize_t)size);
 	Py_ssize_t i = 0;
 	for (const_iterator it = seq.begin(); it != seq.end(); ++it, ++i) {
@@ -5044,9 +5075,6 @@ namespace swig {
 SWIGINTERN swig::SwigPyIterator *std_vector_Sl_SOMcomponent_Sg__iterator(std::vector< SOMcomponent > *self,PyObject **PYTHON_SELF){
       return swig::make_output_iterator(self->begin(), self->begin(), self->end(), *PYTHON_SELF);
     }
-SWIGINTERN bool std_vector_Sl_SOMcomponent_Sg____nonzero__(std::vector< SOMcomponent > const *self){
-      return !(self->empty());
-    }
 SWIGINTERN bool std_vector_Sl_SOMcomponent_Sg____bool__(std::vector< SOMcomponent > const *self){
       return !(self->empty());
     }
@@ -5058,7 +5086,7 @@ SWIGINTERNINLINE PyObject*
 SWIG_From_unsigned_SS_long  (unsigned long value)
 {
   return (value > LONG_MAX) ?
-    PyLong_FromUnsignedLong(value) : PyInt_FromLong(static_cast< long >(value));
+    PyLong_FromUnsignedLong(value) : PyLong_FromLong(static_cast< long >(value));
 }
 
 
@@ -5067,7 +5095,7 @@ SWIGINTERNINLINE PyObject*
 SWIG_From_unsigned_SS_long_SS_long  (unsigned long long value)
 {
   return (value > LONG_MAX) ?
-    PyLong_FromUnsignedLongLong(value) : PyInt_FromLong(static_cast< long >(value));
+    PyLong_FromUnsignedLongLong(value) : PyLong_FromLong(static_cast< long >(value));
 }
 #endif
 
@@ -5087,61 +5115,52 @@ SWIG_From_size_t  (size_t value)
 #endif
 }
 
-SWIGINTERN std::vector< SOMcomponent,std::allocator< SOMcomponent > > *std_vector_Sl_SOMcomponent_Sg____getslice__(std::vector< SOMcomponent > *self,std::vector< SOMcomponent >::difference_type i,std::vector< SOMcomponent >::difference_type j){
-      return swig::getslice(self, i, j, 1);
-    }
-SWIGINTERN void std_vector_Sl_SOMcomponent_Sg____setslice____SWIG_0(std::vector< SOMcomponent > *self,std::vector< SOMcomponent >::difference_type i,std::vector< SOMcomponent >::difference_type j){
-      swig::setslice(self, i, j, 1, std::vector< SOMcomponent,std::allocator< SOMcomponent > >());
-    }
-SWIGINTERN void std_vector_Sl_SOMcomponent_Sg____setslice____SWIG_1(std::vector< SOMcomponent > *self,std::vector< SOMcomponent >::difference_type i,std::vector< SOMcomponent >::difference_type j,std::vector< SOMcomponent,std::allocator< SOMcomponent > > const &v){
-      swig::setslice(self, i, j, 1, v);
-    }
-SWIGINTERN void std_vector_Sl_SOMcomponent_Sg____delslice__(std::vector< SOMcomponent > *self,std::vector< SOMcomponent >::difference_type i,std::vector< SOMcomponent >::difference_type j){
-      swig::delslice(self, i, j, 1);
-    }
+
+#define SWIGPY_SLICEOBJECT PyObject
+
 SWIGINTERN void std_vector_Sl_SOMcomponent_Sg____delitem____SWIG_0(std::vector< SOMcomponent > *self,std::vector< SOMcomponent >::difference_type i){
       swig::erase(self, swig::getpos(self, i));
     }
-SWIGINTERN std::vector< SOMcomponent,std::allocator< SOMcomponent > > *std_vector_Sl_SOMcomponent_Sg____getitem____SWIG_0(std::vector< SOMcomponent > *self,PySliceObject *slice){
+SWIGINTERN std::vector< SOMcomponent,std::allocator< SOMcomponent > > *std_vector_Sl_SOMcomponent_Sg____getitem____SWIG_0(std::vector< SOMcomponent > *self,SWIGPY_SLICEOBJECT *slice){
       Py_ssize_t i, j, step;
       if( !PySlice_Check(slice) ) {
         SWIG_Error(SWIG_TypeError, "Slice object expected.");
         return NULL;
       }
-      PySlice_GetIndices(SWIGPY_SLICE_ARG(slice), (Py_ssize_t)self->size(), &i, &j, &step);
+      PySlice_GetIndices(slice, (Py_ssize_t)self->size(), &i, &j, &step);
       std::vector< SOMcomponent,std::allocator< SOMcomponent > >::difference_type id = i;
       std::vector< SOMcomponent,std::allocator< SOMcomponent > >::difference_type jd = j;
       return swig::getslice(self, id, jd, step);
     }
-SWIGINTERN void std_vector_Sl_SOMcomponent_Sg____setitem____SWIG_0(std::vector< SOMcomponent > *self,PySliceObject *slice,std::vector< SOMcomponent,std::allocator< SOMcomponent > > const &v){
+SWIGINTERN void std_vector_Sl_SOMcomponent_Sg____setitem____SWIG_0(std::vector< SOMcomponent > *self,SWIGPY_SLICEOBJECT *slice,std::vector< SOMcomponent,std::allocator< SOMcomponent > > const &v){
       Py_ssize_t i, j, step;
       if( !PySlice_Check(slice) ) {
         SWIG_Error(SWIG_TypeError, "Slice object expected.");
         return;
       }
-      PySlice_GetIndices(SWIGPY_SLICE_ARG(slice), (Py_ssize_t)self->size(), &i, &j, &step);
+      PySlice_GetIndices(slice, (Py_ssize_t)self->size(), &i, &j, &step);
       std::vector< SOMcomponent,std::allocator< SOMcomponent > >::difference_type id = i;
       std::vector< SOMcomponent,std::allocator< SOMcomponent > >::difference_type jd = j;
       swig::setslice(self, id, jd, step, v);
     }
-SWIGINTERN void std_vector_Sl_SOMcomponent_Sg____setitem____SWIG_1(std::vector< SOMcomponent > *self,PySliceObject *slice){
+SWIGINTERN void std_vector_Sl_SOMcomponent_Sg____setitem____SWIG_1(std::vector< SOMcomponent > *self,SWIGPY_SLICEOBJECT *slice){
       Py_ssize_t i, j, step;
       if( !PySlice_Check(slice) ) {
         SWIG_Error(SWIG_TypeError, "Slice object expected.");
         return;
       }
-      PySlice_GetIndices(SWIGPY_SLICE_ARG(slice), (Py_ssize_t)self->size(), &i, &j, &step);
+      PySlice_GetIndices(slice, (Py_ssize_t)self->size(), &i, &j, &step);
       std::vector< SOMcomponent,std::allocator< SOMcomponent > >::difference_type id = i;
       std::vector< SOMcomponent,std::allocator< SOMcomponent > >::difference_type jd = j;
       swig::delslice(self, id, jd, step);
     }
-SWIGINTERN void std_vector_Sl_SOMcomponent_Sg____delitem____SWIG_1(std::vector< SOMcomponent > *self,PySliceObject *slice){
+SWIGINTERN void std_vector_Sl_SOMcomponent_Sg____delitem____SWIG_1(std::vector< SOMcomponent > *self,SWIGPY_SLICEOBJECT *slice){
       Py_ssize_t i, j, step;
       if( !PySlice_Check(slice) ) {
         SWIG_Error(SWIG_TypeError, "Slice object expected.");
         return;
       }
-      PySlice_GetIndices(SWIGPY_SLICE_ARG(slice), (Py_ssize_t)self->size(), &i, &j, &step);
+      PySlice_GetIndices(slice, (Py_ssize_t)self->size(), &i, &j, &step);
       std::vector< SOMcomponent,std::allocator< SOMcomponent > >::difference_type id = i;
       std::vector< SOMcomponent,std::allocator< SOMcomponent > >::difference_type jd = j;
       swig::delslice(self, id, jd, step);
@@ -5149,6 +5168,41 @@ SWIGINTERN void std_vector_Sl_SOMcomponent_Sg____delitem____SWIG_1(std::vector<
 SWIGINTERN std::vector< SOMcomponent >::value_type const &std_vector_Sl_SOMcomponent_Sg____getitem____SWIG_1(std::vector< SOMcomponent > const *self,std::vector< SOMcomponent >::difference_type i){
       return *(swig::cgetpos(self, i));
     }
+
+namespace swig {
+  static PyObject* container_owner_attribute() {
+    static PyObject* attr = PyUnicode_FromString("__swig_container");
+    return attr;
+  }
+
+  template <typename T>
+  struct container_owner {
+    // By default, do not add the back-reference (for value types)
+    // Specialization below will check the reference for pointer types.
+    static bool back_reference(PyObject* /*child*/, PyObject* /*owner*/) {
+      return false;
+    }
+  };
+
+  template <>
+  struct container_owner<swig::pointer_category> {  
+    /*
+     * Call to add a back-reference to the owning object when returning a 
+     * reference from a container.  Will only set the reference if child
+     * is a SWIG wrapper object that does not own the pointer.
+     *
+     * returns whether the reference was set or not
+     */
+    static bool back_reference(PyObject* child, PyObject* owner) {
+      SwigPyObject* swigThis = SWIG_Python_GetSwigThis(child);
+      if (swigThis && (swigThis->own & SWIG_POINTER_OWN) != SWIG_POINTER_OWN) {
+        return PyObject_SetAttr(child, container_owner_attribute(), owner) != -1;
+      }
+      return false;
+    }
+  };
+}
+
 SWIGINTERN void std_vector_Sl_SOMcomponent_Sg____setitem____SWIG_2(std::vector< SOMcomponent > *self,std::vector< SOMcomponent >::difference_type i,std::vector< SOMcomponent >::value_type const &x){
       *(swig::getpos(self,i)) = x;
     }
@@ -5172,6 +5226,9 @@ SWIGINTERN void std_vector_Sl_SOMcomponent_Sg__insert__SWIG_1(std::vector< SOMco
 
 #define SOM_CN_get(self_) self_->get_CN()
   
+
+#define SOM_nbytes_get(self_) self_->get_nbytes()
+  
 SWIGINTERN double SOM___getitem__(SOM *self,SOMcomponent const &comp){
 		return self->get_C_pool(comp.Id);
 	}
@@ -5185,13 +5242,14 @@ SWIGINTERN std::string SOM___repr__(SOM *self){ return self->to_string();}
 #ifdef __cplusplus
 extern "C" {
 #endif
-SWIGINTERN PyObject *_wrap_delete_SwigPyIterator(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_delete_SwigPyIterator(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  swig::SwigPyIterator *arg1 = (swig::SwigPyIterator *) 0 ;
+  swig::SwigPyIterator *arg1 = 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   PyObject *swig_obj[1] ;
   
+  (void)self;
   if (!args) SWIG_fail;
   swig_obj[0] = args;
   res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_swig__SwigPyIterator, SWIG_POINTER_DISOWN |  0 );
@@ -5207,14 +5265,15 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_SwigPyIterator_value(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_SwigPyIterator_value(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  swig::SwigPyIterator *arg1 = (swig::SwigPyIterator *) 0 ;
+  swig::SwigPyIterator *arg1 = 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   PyObject *swig_obj[1] ;
   PyObject *result = 0 ;
   
+  (void)self;
   if (!args) SWIG_fail;
   swig_obj[0] = args;
   res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_swig__SwigPyIterator, 0 |  0 );
@@ -5222,40 +5281,32 @@ SWIGINTERN PyObject *_wrap_SwigPyIterator_value(PyObject *SWIGUNUSEDPARM(self),
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "SwigPyIterator_value" "', argument " "1"" of type '" "swig::SwigPyIterator const *""'"); 
   }
   arg1 = reinterpret_cast< swig::SwigPyIterator * >(argp1);
-  try {
-    result = (PyObject *)((swig::SwigPyIterator const *)arg1)->value();
-  }
-  catch(swig::stop_iteration &_e) {
-    {
-      (void)_e;
-      SWIG_SetErrorObj(PyExc_StopIteration, SWIG_Py_Void());
-      SWIG_fail;
-    }
-  }
-  
+  result = (PyObject *)((swig::SwigPyIterator const *)arg1)->value();
   resultobj = result;
+  if (!resultobj) SWIG_fail;
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_SwigPyIterator_incr(PyObject *SWIGUNUSEDPARM(self), PyObject *args, PyObject *kwargs) {
+SWIGINTERN PyObject *_wrap_SwigPyIterator_incr(PyObject *self, PyObject *args, PyObject *kwargs) {
   PyObject *resultobj = 0;
-  swig::SwigPyIterator *arg1 = (swig::SwigPyIterator *) 0 ;
-  size_t arg2 = (size_t) 1 ;
+  swig::SwigPyIterator *arg1 = 0 ;
+  size_t arg2 = 1 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   size_t val2 ;
   int ecode2 = 0 ;
   PyObject * obj0 = 0 ;
   PyObject * obj1 = 0 ;
-  char *  kwnames[] = {
-    (char *) "self",(char *) "n", NULL 
+  char * kwnames[] = {
+    (char *)"self",  (char *)"n",  NULL 
   };
   swig::SwigPyIterator *result = 0 ;
   
-  if (!PyArg_ParseTupleAndKeywords(args,kwargs,(char *)"O|O:SwigPyIterator_incr",kwnames,&obj0,&obj1)) SWIG_fail;
+  (void)self;
+  if (!PyArg_ParseTupleAndKeywords(args, kwargs, "O|O:SwigPyIterator_incr", kwnames, &obj0, &obj1)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_swig__SwigPyIterator, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "SwigPyIterator_incr" "', argument " "1"" of type '" "swig::SwigPyIterator *""'"); 
@@ -5268,40 +5319,32 @@ SWIGINTERN PyObject *_wrap_SwigPyIterator_incr(PyObject *SWIGUNUSEDPARM(self), P
     } 
     arg2 = static_cast< size_t >(val2);
   }
-  try {
-    result = (swig::SwigPyIterator *)(arg1)->incr(arg2);
-  }
-  catch(swig::stop_iteration &_e) {
-    {
-      (void)_e;
-      SWIG_SetErrorObj(PyExc_StopIteration, SWIG_Py_Void());
-      SWIG_fail;
-    }
-  }
-  
-  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_swig__SwigPyIterator, 0 |  0 );
+  result = (swig::SwigPyIterator *)(arg1)->incr(SWIG_STD_MOVE(*(&arg2)));
+  if (!result) SWIG_fail;
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_swig__SwigPyIterator, 0);
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_SwigPyIterator_decr(PyObject *SWIGUNUSEDPARM(self), PyObject *args, PyObject *kwargs) {
+SWIGINTERN PyObject *_wrap_SwigPyIterator_decr(PyObject *self, PyObject *args, PyObject *kwargs) {
   PyObject *resultobj = 0;
-  swig::SwigPyIterator *arg1 = (swig::SwigPyIterator *) 0 ;
-  size_t arg2 = (size_t) 1 ;
+  swig::SwigPyIterator *arg1 = 0 ;
+  size_t arg2 = 1 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   size_t val2 ;
   int ecode2 = 0 ;
   PyObject * obj0 = 0 ;
   PyObject * obj1 = 0 ;
-  char *  kwnames[] = {
-    (char *) "self",(char *) "n", NULL 
+  char * kwnames[] = {
+    (char *)"self",  (char *)"n",  NULL 
   };
   swig::SwigPyIterator *result = 0 ;
   
-  if (!PyArg_ParseTupleAndKeywords(args,kwargs,(char *)"O|O:SwigPyIterator_decr",kwnames,&obj0,&obj1)) SWIG_fail;
+  (void)self;
+  if (!PyArg_ParseTupleAndKeywords(args, kwargs, "O|O:SwigPyIterator_decr", kwnames, &obj0, &obj1)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_swig__SwigPyIterator, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "SwigPyIterator_decr" "', argument " "1"" of type '" "swig::SwigPyIterator *""'"); 
@@ -5314,27 +5357,18 @@ SWIGINTERN PyObject *_wrap_SwigPyIterator_decr(PyObject *SWIGUNUSEDPARM(self), P
     } 
     arg2 = static_cast< size_t >(val2);
   }
-  try {
-    result = (swig::SwigPyIterator *)(arg1)->decr(arg2);
-  }
-  catch(swig::stop_iteration &_e) {
-    {
-      (void)_e;
-      SWIG_SetErrorObj(PyExc_StopIteration, SWIG_Py_Void());
-      SWIG_fail;
-    }
-  }
-  
-  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_swig__SwigPyIterator, 0 |  0 );
+  result = (swig::SwigPyIterator *)(arg1)->decr(SWIG_STD_MOVE(*(&arg2)));
+  if (!result) SWIG_fail;
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_swig__SwigPyIterator, 0);
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_SwigPyIterator_distance(PyObject *SWIGUNUSEDPARM(self), PyObject *args, PyObject *kwargs) {
+SWIGINTERN PyObject *_wrap_SwigPyIterator_distance(PyObject *self, PyObject *args, PyObject *kwargs) {
   PyObject *resultobj = 0;
-  swig::SwigPyIterator *arg1 = (swig::SwigPyIterator *) 0 ;
+  swig::SwigPyIterator *arg1 = 0 ;
   swig::SwigPyIterator *arg2 = 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
@@ -5342,12 +5376,13 @@ SWIGINTERN PyObject *_wrap_SwigPyIterator_distance(PyObject *SWIGUNUSEDPARM(self
   int res2 = 0 ;
   PyObject * obj0 = 0 ;
   PyObject * obj1 = 0 ;
-  char *  kwnames[] = {
-    (char *) "self",(char *) "x", NULL 
+  char * kwnames[] = {
+    (char *)"self",  (char *)"x",  NULL 
   };
   ptrdiff_t result;
   
-  if (!PyArg_ParseTupleAndKeywords(args,kwargs,(char *)"OO:SwigPyIterator_distance",kwnames,&obj0,&obj1)) SWIG_fail;
+  (void)self;
+  if (!PyArg_ParseTupleAndKeywords(args, kwargs, "OO:SwigPyIterator_distance", kwnames, &obj0, &obj1)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_swig__SwigPyIterator, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "SwigPyIterator_distance" "', argument " "1"" of type '" "swig::SwigPyIterator const *""'"); 
@@ -5358,16 +5393,14 @@ SWIGINTERN PyObject *_wrap_SwigPyIterator_distance(PyObject *SWIGUNUSEDPARM(self
     SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "SwigPyIterator_distance" "', argument " "2"" of type '" "swig::SwigPyIterator const &""'"); 
   }
   if (!argp2) {
-    SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "SwigPyIterator_distance" "', argument " "2"" of type '" "swig::SwigPyIterator const &""'"); 
+    SWIG_exception_fail(SWIG_NullReferenceError, "invalid null reference " "in method '" "SwigPyIterator_distance" "', argument " "2"" of type '" "swig::SwigPyIterator const &""'"); 
   }
   arg2 = reinterpret_cast< swig::SwigPyIterator * >(argp2);
   try {
     result = ((swig::SwigPyIterator const *)arg1)->distance((swig::SwigPyIterator const &)*arg2);
-  }
-  catch(std::invalid_argument &_e) {
+  } catch(std::invalid_argument &_e) {
     SWIG_Python_Raise(SWIG_NewPointerObj((new std::invalid_argument(static_cast< const std::invalid_argument& >(_e))),SWIGTYPE_p_std__invalid_argument,SWIG_POINTER_OWN), "std::invalid_argument", SWIGTYPE_p_std__invalid_argument); SWIG_fail;
   }
-  
   resultobj = SWIG_From_ptrdiff_t(static_cast< ptrdiff_t >(result));
   return resultobj;
 fail:
@@ -5375,9 +5408,9 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_SwigPyIterator_equal(PyObject *SWIGUNUSEDPARM(self), PyObject *args, PyObject *kwargs) {
+SWIGINTERN PyObject *_wrap_SwigPyIterator_equal(PyObject *self, PyObject *args, PyObject *kwargs) {
   PyObject *resultobj = 0;
-  swig::SwigPyIterator *arg1 = (swig::SwigPyIterator *) 0 ;
+  swig::SwigPyIterator *arg1 = 0 ;
   swig::SwigPyIterator *arg2 = 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
@@ -5385,12 +5418,13 @@ SWIGINTERN PyObject *_wrap_SwigPyIterator_equal(PyObject *SWIGUNUSEDPARM(self),
   int res2 = 0 ;
   PyObject * obj0 = 0 ;
   PyObject * obj1 = 0 ;
-  char *  kwnames[] = {
-    (char *) "self",(char *) "x", NULL 
+  char * kwnames[] = {
+    (char *)"self",  (char *)"x",  NULL 
   };
   bool result;
   
-  if (!PyArg_ParseTupleAndKeywords(args,kwargs,(char *)"OO:SwigPyIterator_equal",kwnames,&obj0,&obj1)) SWIG_fail;
+  (void)self;
+  if (!PyArg_ParseTupleAndKeywords(args, kwargs, "OO:SwigPyIterator_equal", kwnames, &obj0, &obj1)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_swig__SwigPyIterator, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "SwigPyIterator_equal" "', argument " "1"" of type '" "swig::SwigPyIterator const *""'"); 
@@ -5401,16 +5435,14 @@ SWIGINTERN PyObject *_wrap_SwigPyIterator_equal(PyObject *SWIGUNUSEDPARM(self),
     SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "SwigPyIterator_equal" "', argument " "2"" of type '" "swig::SwigPyIterator const &""'"); 
   }
   if (!argp2) {
-    SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "SwigPyIterator_equal" "', argument " "2"" of type '" "swig::SwigPyIterator const &""'"); 
+    SWIG_exception_fail(SWIG_NullReferenceError, "invalid null reference " "in method '" "SwigPyIterator_equal" "', argument " "2"" of type '" "swig::SwigPyIterator const &""'"); 
   }
   arg2 = reinterpret_cast< swig::SwigPyIterator * >(argp2);
   try {
     result = (bool)((swig::SwigPyIterator const *)arg1)->equal((swig::SwigPyIterator const &)*arg2);
-  }
-  catch(std::invalid_argument &_e) {
+  } catch(std::invalid_argument &_e) {
     SWIG_Python_Raise(SWIG_NewPointerObj((new std::invalid_argument(static_cast< const std::invalid_argument& >(_e))),SWIGTYPE_p_std__invalid_argument,SWIG_POINTER_OWN), "std::invalid_argument", SWIGTYPE_p_std__invalid_argument); SWIG_fail;
   }
-  
   resultobj = SWIG_From_bool(static_cast< bool >(result));
   return resultobj;
 fail:
@@ -5418,14 +5450,15 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_SwigPyIterator_copy(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_SwigPyIterator_copy(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  swig::SwigPyIterator *arg1 = (swig::SwigPyIterator *) 0 ;
+  swig::SwigPyIterator *arg1 = 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   PyObject *swig_obj[1] ;
   swig::SwigPyIterator *result = 0 ;
   
+  (void)self;
   if (!args) SWIG_fail;
   swig_obj[0] = args;
   res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_swig__SwigPyIterator, 0 |  0 );
@@ -5434,54 +5467,23 @@ SWIGINTERN PyObject *_wrap_SwigPyIterator_copy(PyObject *SWIGUNUSEDPARM(self), P
   }
   arg1 = reinterpret_cast< swig::SwigPyIterator * >(argp1);
   result = (swig::SwigPyIterator *)((swig::SwigPyIterator const *)arg1)->copy();
-  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_swig__SwigPyIterator, SWIG_POINTER_OWN |  0 );
-  return resultobj;
-fail:
-  return NULL;
-}
-
-
-SWIGINTERN PyObject *_wrap_SwigPyIterator_next(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
-  PyObject *resultobj = 0;
-  swig::SwigPyIterator *arg1 = (swig::SwigPyIterator *) 0 ;
-  void *argp1 = 0 ;
-  int res1 = 0 ;
-  PyObject *swig_obj[1] ;
-  PyObject *result = 0 ;
-  
-  if (!args) SWIG_fail;
-  swig_obj[0] = args;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_swig__SwigPyIterator, 0 |  0 );
-  if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "SwigPyIterator_next" "', argument " "1"" of type '" "swig::SwigPyIterator *""'"); 
-  }
-  arg1 = reinterpret_cast< swig::SwigPyIterator * >(argp1);
-  try {
-    result = (PyObject *)(arg1)->next();
-  }
-  catch(swig::stop_iteration &_e) {
-    {
-      (void)_e;
-      SWIG_SetErrorObj(PyExc_StopIteration, SWIG_Py_Void());
-      SWIG_fail;
-    }
-  }
-  
-  resultobj = result;
+  if (!result) SWIG_fail;
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_swig__SwigPyIterator, SWIG_POINTER_OWN);
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_SwigPyIterator___next__(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_SwigPyIterator___next__(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  swig::SwigPyIterator *arg1 = (swig::SwigPyIterator *) 0 ;
+  swig::SwigPyIterator *arg1 = 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   PyObject *swig_obj[1] ;
   PyObject *result = 0 ;
   
+  (void)self;
   if (!args) SWIG_fail;
   swig_obj[0] = args;
   res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_swig__SwigPyIterator, 0 |  0 );
@@ -5489,32 +5491,24 @@ SWIGINTERN PyObject *_wrap_SwigPyIterator___next__(PyObject *SWIGUNUSEDPARM(self
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "SwigPyIterator___next__" "', argument " "1"" of type '" "swig::SwigPyIterator *""'"); 
   }
   arg1 = reinterpret_cast< swig::SwigPyIterator * >(argp1);
-  try {
-    result = (PyObject *)(arg1)->__next__();
-  }
-  catch(swig::stop_iteration &_e) {
-    {
-      (void)_e;
-      SWIG_SetErrorObj(PyExc_StopIteration, SWIG_Py_Void());
-      SWIG_fail;
-    }
-  }
-  
+  result = (PyObject *)(arg1)->__next__();
   resultobj = result;
+  if (!resultobj) SWIG_fail;
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_SwigPyIterator_previous(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_SwigPyIterator_previous(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  swig::SwigPyIterator *arg1 = (swig::SwigPyIterator *) 0 ;
+  swig::SwigPyIterator *arg1 = 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   PyObject *swig_obj[1] ;
   PyObject *result = 0 ;
   
+  (void)self;
   if (!args) SWIG_fail;
   swig_obj[0] = args;
   res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_swig__SwigPyIterator, 0 |  0 );
@@ -5522,27 +5516,18 @@ SWIGINTERN PyObject *_wrap_SwigPyIterator_previous(PyObject *SWIGUNUSEDPARM(self
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "SwigPyIterator_previous" "', argument " "1"" of type '" "swig::SwigPyIterator *""'"); 
   }
   arg1 = reinterpret_cast< swig::SwigPyIterator * >(argp1);
-  try {
-    result = (PyObject *)(arg1)->previous();
-  }
-  catch(swig::stop_iteration &_e) {
-    {
-      (void)_e;
-      SWIG_SetErrorObj(PyExc_StopIteration, SWIG_Py_Void());
-      SWIG_fail;
-    }
-  }
-  
+  result = (PyObject *)(arg1)->previous();
   resultobj = result;
+  if (!resultobj) SWIG_fail;
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_SwigPyIterator_advance(PyObject *SWIGUNUSEDPARM(self), PyObject *args, PyObject *kwargs) {
+SWIGINTERN PyObject *_wrap_SwigPyIterator_advance(PyObject *self, PyObject *args, PyObject *kwargs) {
   PyObject *resultobj = 0;
-  swig::SwigPyIterator *arg1 = (swig::SwigPyIterator *) 0 ;
+  swig::SwigPyIterator *arg1 = 0 ;
   ptrdiff_t arg2 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
@@ -5550,12 +5535,13 @@ SWIGINTERN PyObject *_wrap_SwigPyIterator_advance(PyObject *SWIGUNUSEDPARM(self)
   int ecode2 = 0 ;
   PyObject * obj0 = 0 ;
   PyObject * obj1 = 0 ;
-  char *  kwnames[] = {
-    (char *) "self",(char *) "n", NULL 
+  char * kwnames[] = {
+    (char *)"self",  (char *)"n",  NULL 
   };
   swig::SwigPyIterator *result = 0 ;
   
-  if (!PyArg_ParseTupleAndKeywords(args,kwargs,(char *)"OO:SwigPyIterator_advance",kwnames,&obj0,&obj1)) SWIG_fail;
+  (void)self;
+  if (!PyArg_ParseTupleAndKeywords(args, kwargs, "OO:SwigPyIterator_advance", kwnames, &obj0, &obj1)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_swig__SwigPyIterator, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "SwigPyIterator_advance" "', argument " "1"" of type '" "swig::SwigPyIterator *""'"); 
@@ -5566,27 +5552,18 @@ SWIGINTERN PyObject *_wrap_SwigPyIterator_advance(PyObject *SWIGUNUSEDPARM(self)
     SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "SwigPyIterator_advance" "', argument " "2"" of type '" "ptrdiff_t""'");
   } 
   arg2 = static_cast< ptrdiff_t >(val2);
-  try {
-    result = (swig::SwigPyIterator *)(arg1)->advance(arg2);
-  }
-  catch(swig::stop_iteration &_e) {
-    {
-      (void)_e;
-      SWIG_SetErrorObj(PyExc_StopIteration, SWIG_Py_Void());
-      SWIG_fail;
-    }
-  }
-  
-  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_swig__SwigPyIterator, 0 |  0 );
+  result = (swig::SwigPyIterator *)(arg1)->advance(SWIG_STD_MOVE(*(&arg2)));
+  if (!result) SWIG_fail;
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_swig__SwigPyIterator, 0);
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_SwigPyIterator___eq__(PyObject *SWIGUNUSEDPARM(self), PyObject *args, PyObject *kwargs) {
+SWIGINTERN PyObject *_wrap_SwigPyIterator___eq__(PyObject *self, PyObject *args, PyObject *kwargs) {
   PyObject *resultobj = 0;
-  swig::SwigPyIterator *arg1 = (swig::SwigPyIterator *) 0 ;
+  swig::SwigPyIterator *arg1 = 0 ;
   swig::SwigPyIterator *arg2 = 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
@@ -5594,12 +5571,13 @@ SWIGINTERN PyObject *_wrap_SwigPyIterator___eq__(PyObject *SWIGUNUSEDPARM(self),
   int res2 = 0 ;
   PyObject * obj0 = 0 ;
   PyObject * obj1 = 0 ;
-  char *  kwnames[] = {
-    (char *) "self",(char *) "x", NULL 
+  char * kwnames[] = {
+    (char *)"self",  (char *)"x",  NULL 
   };
   bool result;
   
-  if (!PyArg_ParseTupleAndKeywords(args,kwargs,(char *)"OO:SwigPyIterator___eq__",kwnames,&obj0,&obj1)) SWIG_fail;
+  (void)self;
+  if (!PyArg_ParseTupleAndKeywords(args, kwargs, "OO:SwigPyIterator___eq__", kwnames, &obj0, &obj1)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_swig__SwigPyIterator, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "SwigPyIterator___eq__" "', argument " "1"" of type '" "swig::SwigPyIterator const *""'"); 
@@ -5610,20 +5588,25 @@ SWIGINTERN PyObject *_wrap_SwigPyIterator___eq__(PyObject *SWIGUNUSEDPARM(self),
     SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "SwigPyIterator___eq__" "', argument " "2"" of type '" "swig::SwigPyIterator const &""'"); 
   }
   if (!argp2) {
-    SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "SwigPyIterator___eq__" "', argument " "2"" of type '" "swig::SwigPyIterator const &""'"); 
+    SWIG_exception_fail(SWIG_NullReferenceError, "invalid null reference " "in method '" "SwigPyIterator___eq__" "', argument " "2"" of type '" "swig::SwigPyIterator const &""'"); 
   }
   arg2 = reinterpret_cast< swig::SwigPyIterator * >(argp2);
   result = (bool)((swig::SwigPyIterator const *)arg1)->operator ==((swig::SwigPyIterator const &)*arg2);
   resultobj = SWIG_From_bool(static_cast< bool >(result));
   return resultobj;
 fail:
-  return NULL;
+  if (PyErr_Occurred() && !PyErr_ExceptionMatches(PyExc_TypeError)) {
+    return NULL;
+  }
+  PyErr_Clear();
+  SWIG_Py_INCREF(Py_NotImplemented);
+  return Py_NotImplemented;
 }
 
 
-SWIGINTERN PyObject *_wrap_SwigPyIterator___ne__(PyObject *SWIGUNUSEDPARM(self), PyObject *args, PyObject *kwargs) {
+SWIGINTERN PyObject *_wrap_SwigPyIterator___ne__(PyObject *self, PyObject *args, PyObject *kwargs) {
   PyObject *resultobj = 0;
-  swig::SwigPyIterator *arg1 = (swig::SwigPyIterator *) 0 ;
+  swig::SwigPyIterator *arg1 = 0 ;
   swig::SwigPyIterator *arg2 = 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
@@ -5631,12 +5614,13 @@ SWIGINTERN PyObject *_wrap_SwigPyIterator___ne__(PyObject *SWIGUNUSEDPARM(self),
   int res2 = 0 ;
   PyObject * obj0 = 0 ;
   PyObject * obj1 = 0 ;
-  char *  kwnames[] = {
-    (char *) "self",(char *) "x", NULL 
+  char * kwnames[] = {
+    (char *)"self",  (char *)"x",  NULL 
   };
   bool result;
   
-  if (!PyArg_ParseTupleAndKeywords(args,kwargs,(char *)"OO:SwigPyIterator___ne__",kwnames,&obj0,&obj1)) SWIG_fail;
+  (void)self;
+  if (!PyArg_ParseTupleAndKeywords(args, kwargs, "OO:SwigPyIterator___ne__", kwnames, &obj0, &obj1)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_swig__SwigPyIterator, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "SwigPyIterator___ne__" "', argument " "1"" of type '" "swig::SwigPyIterator const *""'"); 
@@ -5647,20 +5631,25 @@ SWIGINTERN PyObject *_wrap_SwigPyIterator___ne__(PyObject *SWIGUNUSEDPARM(self),
     SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "SwigPyIterator___ne__" "', argument " "2"" of type '" "swig::SwigPyIterator const &""'"); 
   }
   if (!argp2) {
-    SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "SwigPyIterator___ne__" "', argument " "2"" of type '" "swig::SwigPyIterator const &""'"); 
+    SWIG_exception_fail(SWIG_NullReferenceError, "invalid null reference " "in method '" "SwigPyIterator___ne__" "', argument " "2"" of type '" "swig::SwigPyIterator const &""'"); 
   }
   arg2 = reinterpret_cast< swig::SwigPyIterator * >(argp2);
   result = (bool)((swig::SwigPyIterator const *)arg1)->operator !=((swig::SwigPyIterator const &)*arg2);
   resultobj = SWIG_From_bool(static_cast< bool >(result));
   return resultobj;
 fail:
-  return NULL;
+  if (PyErr_Occurred() && !PyErr_ExceptionMatches(PyExc_TypeError)) {
+    return NULL;
+  }
+  PyErr_Clear();
+  SWIG_Py_INCREF(Py_NotImplemented);
+  return Py_NotImplemented;
 }
 
 
-SWIGINTERN PyObject *_wrap_SwigPyIterator___iadd__(PyObject *SWIGUNUSEDPARM(self), PyObject *args, PyObject *kwargs) {
+SWIGINTERN PyObject *_wrap_SwigPyIterator___iadd__(PyObject *self, PyObject *args, PyObject *kwargs) {
   PyObject *resultobj = 0;
-  swig::SwigPyIterator *arg1 = (swig::SwigPyIterator *) 0 ;
+  swig::SwigPyIterator *arg1 = 0 ;
   ptrdiff_t arg2 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
@@ -5668,12 +5657,13 @@ SWIGINTERN PyObject *_wrap_SwigPyIterator___iadd__(PyObject *SWIGUNUSEDPARM(self
   int ecode2 = 0 ;
   PyObject * obj0 = 0 ;
   PyObject * obj1 = 0 ;
-  char *  kwnames[] = {
-    (char *) "self",(char *) "n", NULL 
+  char * kwnames[] = {
+    (char *)"self",  (char *)"n",  NULL 
   };
   swig::SwigPyIterator *result = 0 ;
   
-  if (!PyArg_ParseTupleAndKeywords(args,kwargs,(char *)"OO:SwigPyIterator___iadd__",kwnames,&obj0,&obj1)) SWIG_fail;
+  (void)self;
+  if (!PyArg_ParseTupleAndKeywords(args, kwargs, "OO:SwigPyIterator___iadd__", kwnames, &obj0, &obj1)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_swig__SwigPyIterator, SWIG_POINTER_DISOWN |  0 );
   if (!SWIG_IsOK(res1)) {
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "SwigPyIterator___iadd__" "', argument " "1"" of type '" "swig::SwigPyIterator *""'"); 
@@ -5684,27 +5674,18 @@ SWIGINTERN PyObject *_wrap_SwigPyIterator___iadd__(PyObject *SWIGUNUSEDPARM(self
     SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "SwigPyIterator___iadd__" "', argument " "2"" of type '" "ptrdiff_t""'");
   } 
   arg2 = static_cast< ptrdiff_t >(val2);
-  try {
-    result = (swig::SwigPyIterator *) &(arg1)->operator +=(arg2);
-  }
-  catch(swig::stop_iteration &_e) {
-    {
-      (void)_e;
-      SWIG_SetErrorObj(PyExc_StopIteration, SWIG_Py_Void());
-      SWIG_fail;
-    }
-  }
-  
-  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_swig__SwigPyIterator, SWIG_POINTER_OWN |  0 );
+  result = (swig::SwigPyIterator *) &(arg1)->operator +=(SWIG_STD_MOVE(*(&arg2)));
+  if (PyErr_Occurred()) SWIG_fail;
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_swig__SwigPyIterator, SWIG_POINTER_OWN);
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_SwigPyIterator___isub__(PyObject *SWIGUNUSEDPARM(self), PyObject *args, PyObject *kwargs) {
+SWIGINTERN PyObject *_wrap_SwigPyIterator___isub__(PyObject *self, PyObject *args, PyObject *kwargs) {
   PyObject *resultobj = 0;
-  swig::SwigPyIterator *arg1 = (swig::SwigPyIterator *) 0 ;
+  swig::SwigPyIterator *arg1 = 0 ;
   ptrdiff_t arg2 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
@@ -5712,12 +5693,13 @@ SWIGINTERN PyObject *_wrap_SwigPyIterator___isub__(PyObject *SWIGUNUSEDPARM(self
   int ecode2 = 0 ;
   PyObject * obj0 = 0 ;
   PyObject * obj1 = 0 ;
-  char *  kwnames[] = {
-    (char *) "self",(char *) "n", NULL 
+  char * kwnames[] = {
+    (char *)"self",  (char *)"n",  NULL 
   };
   swig::SwigPyIterator *result = 0 ;
   
-  if (!PyArg_ParseTupleAndKeywords(args,kwargs,(char *)"OO:SwigPyIterator___isub__",kwnames,&obj0,&obj1)) SWIG_fail;
+  (void)self;
+  if (!PyArg_ParseTupleAndKeywords(args, kwargs, "OO:SwigPyIterator___isub__", kwnames, &obj0, &obj1)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_swig__SwigPyIterator, SWIG_POINTER_DISOWN |  0 );
   if (!SWIG_IsOK(res1)) {
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "SwigPyIterator___isub__" "', argument " "1"" of type '" "swig::SwigPyIterator *""'"); 
@@ -5728,27 +5710,18 @@ SWIGINTERN PyObject *_wrap_SwigPyIterator___isub__(PyObject *SWIGUNUSEDPARM(self
     SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "SwigPyIterator___isub__" "', argument " "2"" of type '" "ptrdiff_t""'");
   } 
   arg2 = static_cast< ptrdiff_t >(val2);
-  try {
-    result = (swig::SwigPyIterator *) &(arg1)->operator -=(arg2);
-  }
-  catch(swig::stop_iteration &_e) {
-    {
-      (void)_e;
-      SWIG_SetErrorObj(PyExc_StopIteration, SWIG_Py_Void());
-      SWIG_fail;
-    }
-  }
-  
-  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_swig__SwigPyIterator, SWIG_POINTER_OWN |  0 );
+  result = (swig::SwigPyIterator *) &(arg1)->operator -=(SWIG_STD_MOVE(*(&arg2)));
+  if (PyErr_Occurred()) SWIG_fail;
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_swig__SwigPyIterator, SWIG_POINTER_OWN);
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_SwigPyIterator___add__(PyObject *SWIGUNUSEDPARM(self), PyObject *args, PyObject *kwargs) {
+SWIGINTERN PyObject *_wrap_SwigPyIterator___add__(PyObject *self, PyObject *args, PyObject *kwargs) {
   PyObject *resultobj = 0;
-  swig::SwigPyIterator *arg1 = (swig::SwigPyIterator *) 0 ;
+  swig::SwigPyIterator *arg1 = 0 ;
   ptrdiff_t arg2 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
@@ -5756,12 +5729,13 @@ SWIGINTERN PyObject *_wrap_SwigPyIterator___add__(PyObject *SWIGUNUSEDPARM(self)
   int ecode2 = 0 ;
   PyObject * obj0 = 0 ;
   PyObject * obj1 = 0 ;
-  char *  kwnames[] = {
-    (char *) "self",(char *) "n", NULL 
+  char * kwnames[] = {
+    (char *)"self",  (char *)"n",  NULL 
   };
   swig::SwigPyIterator *result = 0 ;
   
-  if (!PyArg_ParseTupleAndKeywords(args,kwargs,(char *)"OO:SwigPyIterator___add__",kwnames,&obj0,&obj1)) SWIG_fail;
+  (void)self;
+  if (!PyArg_ParseTupleAndKeywords(args, kwargs, "OO:SwigPyIterator___add__", kwnames, &obj0, &obj1)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_swig__SwigPyIterator, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "SwigPyIterator___add__" "', argument " "1"" of type '" "swig::SwigPyIterator const *""'"); 
@@ -5772,27 +5746,23 @@ SWIGINTERN PyObject *_wrap_SwigPyIterator___add__(PyObject *SWIGUNUSEDPARM(self)
     SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "SwigPyIterator___add__" "', argument " "2"" of type '" "ptrdiff_t""'");
   } 
   arg2 = static_cast< ptrdiff_t >(val2);
-  try {
-    result = (swig::SwigPyIterator *)((swig::SwigPyIterator const *)arg1)->operator +(arg2);
-  }
-  catch(swig::stop_iteration &_e) {
-    {
-      (void)_e;
-      SWIG_SetErrorObj(PyExc_StopIteration, SWIG_Py_Void());
-      SWIG_fail;
-    }
-  }
-  
-  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_swig__SwigPyIterator, SWIG_POINTER_OWN |  0 );
+  result = (swig::SwigPyIterator *)((swig::SwigPyIterator const *)arg1)->operator +(SWIG_STD_MOVE(*(&arg2)));
+  if (!result) SWIG_fail;
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_swig__SwigPyIterator, SWIG_POINTER_OWN);
   return resultobj;
 fail:
-  return NULL;
+  if (PyErr_Occurred() && !PyErr_ExceptionMatches(PyExc_TypeError)) {
+    return NULL;
+  }
+  PyErr_Clear();
+  SWIG_Py_INCREF(Py_NotImplemented);
+  return Py_NotImplemented;
 }
 
 
-SWIGINTERN PyObject *_wrap_SwigPyIterator___sub____SWIG_0(PyObject *SWIGUNUSEDPARM(self), int nobjs, PyObject **swig_obj) {
+SWIGINTERN PyObject *_wrap_SwigPyIterator___sub____SWIG_0(PyObject *self, Py_ssize_t nobjs, PyObject **swig_obj) {
   PyObject *resultobj = 0;
-  swig::SwigPyIterator *arg1 = (swig::SwigPyIterator *) 0 ;
+  swig::SwigPyIterator *arg1 = 0 ;
   ptrdiff_t arg2 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
@@ -5800,6 +5770,7 @@ SWIGINTERN PyObject *_wrap_SwigPyIterator___sub____SWIG_0(PyObject *SWIGUNUSEDPA
   int ecode2 = 0 ;
   swig::SwigPyIterator *result = 0 ;
   
+  (void)self;
   if ((nobjs < 2) || (nobjs > 2)) SWIG_fail;
   res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_swig__SwigPyIterator, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
@@ -5811,27 +5782,23 @@ SWIGINTERN PyObject *_wrap_SwigPyIterator___sub____SWIG_0(PyObject *SWIGUNUSEDPA
     SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "SwigPyIterator___sub__" "', argument " "2"" of type '" "ptrdiff_t""'");
   } 
   arg2 = static_cast< ptrdiff_t >(val2);
-  try {
-    result = (swig::SwigPyIterator *)((swig::SwigPyIterator const *)arg1)->operator -(arg2);
-  }
-  catch(swig::stop_iteration &_e) {
-    {
-      (void)_e;
-      SWIG_SetErrorObj(PyExc_StopIteration, SWIG_Py_Void());
-      SWIG_fail;
-    }
-  }
-  
-  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_swig__SwigPyIterator, SWIG_POINTER_OWN |  0 );
+  result = (swig::SwigPyIterator *)((swig::SwigPyIterator const *)arg1)->operator -(SWIG_STD_MOVE(*(&arg2)));
+  if (!result) SWIG_fail;
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_swig__SwigPyIterator, SWIG_POINTER_OWN);
   return resultobj;
 fail:
-  return NULL;
+  if (PyErr_Occurred() && !PyErr_ExceptionMatches(PyExc_TypeError)) {
+    return NULL;
+  }
+  PyErr_Clear();
+  SWIG_Py_INCREF(Py_NotImplemented);
+  return Py_NotImplemented;
 }
 
 
-SWIGINTERN PyObject *_wrap_SwigPyIterator___sub____SWIG_1(PyObject *SWIGUNUSEDPARM(self), int nobjs, PyObject **swig_obj) {
+SWIGINTERN PyObject *_wrap_SwigPyIterator___sub____SWIG_1(PyObject *self, Py_ssize_t nobjs, PyObject **swig_obj) {
   PyObject *resultobj = 0;
-  swig::SwigPyIterator *arg1 = (swig::SwigPyIterator *) 0 ;
+  swig::SwigPyIterator *arg1 = 0 ;
   swig::SwigPyIterator *arg2 = 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
@@ -5839,6 +5806,7 @@ SWIGINTERN PyObject *_wrap_SwigPyIterator___sub____SWIG_1(PyObject *SWIGUNUSEDPA
   int res2 = 0 ;
   ptrdiff_t result;
   
+  (void)self;
   if ((nobjs < 2) || (nobjs > 2)) SWIG_fail;
   res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_swig__SwigPyIterator, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
@@ -5850,14 +5818,19 @@ SWIGINTERN PyObject *_wrap_SwigPyIterator___sub____SWIG_1(PyObject *SWIGUNUSEDPA
     SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "SwigPyIterator___sub__" "', argument " "2"" of type '" "swig::SwigPyIterator const &""'"); 
   }
   if (!argp2) {
-    SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "SwigPyIterator___sub__" "', argument " "2"" of type '" "swig::SwigPyIterator const &""'"); 
+    SWIG_exception_fail(SWIG_NullReferenceError, "invalid null reference " "in method '" "SwigPyIterator___sub__" "', argument " "2"" of type '" "swig::SwigPyIterator const &""'"); 
   }
   arg2 = reinterpret_cast< swig::SwigPyIterator * >(argp2);
   result = ((swig::SwigPyIterator const *)arg1)->operator -((swig::SwigPyIterator const &)*arg2);
   resultobj = SWIG_From_ptrdiff_t(static_cast< ptrdiff_t >(result));
   return resultobj;
 fail:
-  return NULL;
+  if (PyErr_Occurred() && !PyErr_ExceptionMatches(PyExc_TypeError)) {
+    return NULL;
+  }
+  PyErr_Clear();
+  SWIG_Py_INCREF(Py_NotImplemented);
+  return Py_NotImplemented;
 }
 
 
@@ -5867,7 +5840,7 @@ SWIGINTERN PyObject *_wrap_SwigPyIterator___sub__(PyObject *self, PyObject *args
     0
   };
   
-  if (!(argc = SWIG_Python_UnpackTuple(args,"SwigPyIterator___sub__",0,2,argv))) SWIG_fail;
+  if (!(argc = SWIG_Python_UnpackTuple(args, "SwigPyIterator___sub__", 0, 2, argv))) SWIG_fail;
   --argc;
   {
     unsigned long _index = 0;
@@ -5887,7 +5860,7 @@ SWIGINTERN PyObject *_wrap_SwigPyIterator___sub__(PyObject *self, PyObject *args
       _rankm += _pi;
       _pi *= SWIG_MAXCASTRANK;
       {
-        int res = SWIG_ConvertPtr(argv[1], 0, SWIGTYPE_p_swig__SwigPyIterator, 0);
+        int res = SWIG_ConvertPtr(argv[1], 0, SWIGTYPE_p_swig__SwigPyIterator, SWIG_POINTER_NO_NULL | 0);
         _v = SWIG_CheckState(res);
       }
       if (!_v) goto check_1;
@@ -5942,19 +5915,19 @@ SWIGINTERN PyObject *_wrap_SwigPyIterator___sub__(PyObject *self, PyObject *args
   }
   
 fail:
-  Py_INCREF(Py_NotImplemented);
+  SWIG_Py_INCREF(Py_NotImplemented);
   return Py_NotImplemented;
 }
 
 
 SWIGINTERN PyObject *SwigPyIterator_swigregister(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
-  PyObject *obj;
-  if (!SWIG_Python_UnpackTuple(args,(char *)"swigregister", 1, 1,&obj)) return NULL;
+  PyObject *obj = NULL;
+  if (!SWIG_Python_UnpackTuple(args, "swigregister", 1, 1, &obj)) return NULL;
   SWIG_TypeNewClientData(SWIGTYPE_p_swig__SwigPyIterator, SWIG_NewClientData(obj));
   return SWIG_Py_Void();
 }
 
-SWIGINTERN PyObject *_wrap_new_SOMcomponent__SWIG_0(PyObject *SWIGUNUSEDPARM(self), int nobjs, PyObject **swig_obj) {
+SWIGINTERN PyObject *_wrap_new_SOMcomponent__SWIG_0(PyObject *self, Py_ssize_t nobjs, PyObject **swig_obj) {
   PyObject *resultobj = 0;
   std::string arg1 ;
   bool arg2 ;
@@ -5963,7 +5936,7 @@ SWIGINTERN PyObject *_wrap_new_SOMcomponent__SWIG_0(PyObject *SWIGUNUSEDPARM(sel
   double arg5 ;
   double arg6 ;
   double arg7 ;
-  double arg8 = (double) 1.0 ;
+  double arg8 = 1.0 ;
   bool val2 ;
   int ecode2 = 0 ;
   double val3 ;
@@ -5980,6 +5953,7 @@ SWIGINTERN PyObject *_wrap_new_SOMcomponent__SWIG_0(PyObject *SWIGUNUSEDPARM(sel
   int ecode8 = 0 ;
   SOMcomponent *result = 0 ;
   
+  (void)self;
   if ((nobjs < 7) || (nobjs > 8)) SWIG_fail;
   {
     std::string *ptr = (std::string *)0;
@@ -6029,9 +6003,9 @@ SWIGINTERN PyObject *_wrap_new_SOMcomponent__SWIG_0(PyObject *SWIGUNUSEDPARM(sel
   }
   {
     try {
-      result = (SOMcomponent *)new SOMcomponent(arg1,arg2,arg3,arg4,arg5,arg6,arg7,arg8);
+      result = (SOMcomponent *)new SOMcomponent(SWIG_STD_MOVE(*(&arg1)),arg2,arg3,arg4,arg5,arg6,arg7,arg8);
     } 
-    /*@SWIG:C:\Apps\swigwin-3.0.12\Lib\typemaps\exception.swg,58,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
+    /*@SWIG:/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/swig/data/share/swig/4.5.1/typemaps/exception.swg,59,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
     catch (std::invalid_argument& e) {
       SWIG_exception_fail(SWIG_ValueError, e.what() );
     } catch (std::domain_error& e) {
@@ -6092,14 +6066,15 @@ SWIGINTERN PyObject *_wrap_SOMcomponent_count_set(PyObject *SWIGUNUSEDPARM(self)
 }
 
 
-SWIGINTERN PyObject *_wrap_SOMcomponent_Id_get(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_SOMcomponent_Id_get(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  SOMcomponent *arg1 = (SOMcomponent *) 0 ;
+  SOMcomponent *arg1 = 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   PyObject *swig_obj[1] ;
   int result;
   
+  (void)self;
   if (!args) SWIG_fail;
   swig_obj[0] = args;
   res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_SOMcomponent, 0 |  0 );
@@ -6115,16 +6090,17 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_SOMcomponent_Name_set(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_SOMcomponent_Name_set(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  SOMcomponent *arg1 = (SOMcomponent *) 0 ;
+  SOMcomponent *arg1 = 0 ;
   std::string *arg2 = 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   int res2 = SWIG_OLDOBJ ;
   PyObject *swig_obj[2] ;
   
-  if (!SWIG_Python_UnpackTuple(args,"SOMcomponent_Name_set",2,2,swig_obj)) SWIG_fail;
+  (void)self;
+  if (!SWIG_Python_UnpackTuple(args, "SOMcomponent_Name_set", 2, 2, swig_obj)) SWIG_fail;
   res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_SOMcomponent, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "SOMcomponent_Name_set" "', argument " "1"" of type '" "SOMcomponent *""'"); 
@@ -6137,7 +6113,7 @@ SWIGINTERN PyObject *_wrap_SOMcomponent_Name_set(PyObject *SWIGUNUSEDPARM(self),
       SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "SOMcomponent_Name_set" "', argument " "2"" of type '" "std::string const &""'"); 
     }
     if (!ptr) {
-      SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "SOMcomponent_Name_set" "', argument " "2"" of type '" "std::string const &""'"); 
+      SWIG_exception_fail(SWIG_NullReferenceError, "invalid null reference " "in method '" "SOMcomponent_Name_set" "', argument " "2"" of type '" "std::string const &""'"); 
     }
     arg2 = ptr;
   }
@@ -6151,14 +6127,15 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_SOMcomponent_Name_get(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_SOMcomponent_Name_get(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  SOMcomponent *arg1 = (SOMcomponent *) 0 ;
+  SOMcomponent *arg1 = 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   PyObject *swig_obj[1] ;
   std::string *result = 0 ;
   
+  (void)self;
   if (!args) SWIG_fail;
   swig_obj[0] = args;
   res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_SOMcomponent, 0 |  0 );
@@ -6174,9 +6151,9 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_SOMcomponent_is_stored_set(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_SOMcomponent_is_stored_set(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  SOMcomponent *arg1 = (SOMcomponent *) 0 ;
+  SOMcomponent *arg1 = 0 ;
   bool arg2 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
@@ -6184,7 +6161,8 @@ SWIGINTERN PyObject *_wrap_SOMcomponent_is_stored_set(PyObject *SWIGUNUSEDPARM(s
   int ecode2 = 0 ;
   PyObject *swig_obj[2] ;
   
-  if (!SWIG_Python_UnpackTuple(args,"SOMcomponent_is_stored_set",2,2,swig_obj)) SWIG_fail;
+  (void)self;
+  if (!SWIG_Python_UnpackTuple(args, "SOMcomponent_is_stored_set", 2, 2, swig_obj)) SWIG_fail;
   res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_SOMcomponent, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "SOMcomponent_is_stored_set" "', argument " "1"" of type '" "SOMcomponent *""'"); 
@@ -6203,14 +6181,15 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_SOMcomponent_is_stored_get(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_SOMcomponent_is_stored_get(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  SOMcomponent *arg1 = (SOMcomponent *) 0 ;
+  SOMcomponent *arg1 = 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   PyObject *swig_obj[1] ;
   bool result;
   
+  (void)self;
   if (!args) SWIG_fail;
   swig_obj[0] = args;
   res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_SOMcomponent, 0 |  0 );
@@ -6226,9 +6205,9 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_SOMcomponent_k_pot_set(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_SOMcomponent_k_pot_set(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  SOMcomponent *arg1 = (SOMcomponent *) 0 ;
+  SOMcomponent *arg1 = 0 ;
   double arg2 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
@@ -6236,7 +6215,8 @@ SWIGINTERN PyObject *_wrap_SOMcomponent_k_pot_set(PyObject *SWIGUNUSEDPARM(self)
   int ecode2 = 0 ;
   PyObject *swig_obj[2] ;
   
-  if (!SWIG_Python_UnpackTuple(args,"SOMcomponent_k_pot_set",2,2,swig_obj)) SWIG_fail;
+  (void)self;
+  if (!SWIG_Python_UnpackTuple(args, "SOMcomponent_k_pot_set", 2, 2, swig_obj)) SWIG_fail;
   res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_SOMcomponent, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "SOMcomponent_k_pot_set" "', argument " "1"" of type '" "SOMcomponent *""'"); 
@@ -6255,14 +6235,15 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_SOMcomponent_k_pot_get(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_SOMcomponent_k_pot_get(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  SOMcomponent *arg1 = (SOMcomponent *) 0 ;
+  SOMcomponent *arg1 = 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   PyObject *swig_obj[1] ;
   double result;
   
+  (void)self;
   if (!args) SWIG_fail;
   swig_obj[0] = args;
   res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_SOMcomponent, 0 |  0 );
@@ -6278,9 +6259,9 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_SOMcomponent_E_a_set(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_SOMcomponent_E_a_set(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  SOMcomponent *arg1 = (SOMcomponent *) 0 ;
+  SOMcomponent *arg1 = 0 ;
   double arg2 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
@@ -6288,7 +6269,8 @@ SWIGINTERN PyObject *_wrap_SOMcomponent_E_a_set(PyObject *SWIGUNUSEDPARM(self),
   int ecode2 = 0 ;
   PyObject *swig_obj[2] ;
   
-  if (!SWIG_Python_UnpackTuple(args,"SOMcomponent_E_a_set",2,2,swig_obj)) SWIG_fail;
+  (void)self;
+  if (!SWIG_Python_UnpackTuple(args, "SOMcomponent_E_a_set", 2, 2, swig_obj)) SWIG_fail;
   res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_SOMcomponent, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "SOMcomponent_E_a_set" "', argument " "1"" of type '" "SOMcomponent *""'"); 
@@ -6307,14 +6289,15 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_SOMcomponent_E_a_get(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_SOMcomponent_E_a_get(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  SOMcomponent *arg1 = (SOMcomponent *) 0 ;
+  SOMcomponent *arg1 = 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   PyObject *swig_obj[1] ;
   double result;
   
+  (void)self;
   if (!args) SWIG_fail;
   swig_obj[0] = args;
   res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_SOMcomponent, 0 |  0 );
@@ -6330,9 +6313,9 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_SOMcomponent_K_w_set(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_SOMcomponent_K_w_set(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  SOMcomponent *arg1 = (SOMcomponent *) 0 ;
+  SOMcomponent *arg1 = 0 ;
   double arg2 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
@@ -6340,7 +6323,8 @@ SWIGINTERN PyObject *_wrap_SOMcomponent_K_w_set(PyObject *SWIGUNUSEDPARM(self),
   int ecode2 = 0 ;
   PyObject *swig_obj[2] ;
   
-  if (!SWIG_Python_UnpackTuple(args,"SOMcomponent_K_w_set",2,2,swig_obj)) SWIG_fail;
+  (void)self;
+  if (!SWIG_Python_UnpackTuple(args, "SOMcomponent_K_w_set", 2, 2, swig_obj)) SWIG_fail;
   res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_SOMcomponent, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "SOMcomponent_K_w_set" "', argument " "1"" of type '" "SOMcomponent *""'"); 
@@ -6359,14 +6343,15 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_SOMcomponent_K_w_get(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_SOMcomponent_K_w_get(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  SOMcomponent *arg1 = (SOMcomponent *) 0 ;
+  SOMcomponent *arg1 = 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   PyObject *swig_obj[1] ;
   double result;
   
+  (void)self;
   if (!args) SWIG_fail;
   swig_obj[0] = args;
   res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_SOMcomponent, 0 |  0 );
@@ -6382,9 +6367,9 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_SOMcomponent_n_w_set(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_SOMcomponent_n_w_set(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  SOMcomponent *arg1 = (SOMcomponent *) 0 ;
+  SOMcomponent *arg1 = 0 ;
   double arg2 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
@@ -6392,7 +6377,8 @@ SWIGINTERN PyObject *_wrap_SOMcomponent_n_w_set(PyObject *SWIGUNUSEDPARM(self),
   int ecode2 = 0 ;
   PyObject *swig_obj[2] ;
   
-  if (!SWIG_Python_UnpackTuple(args,"SOMcomponent_n_w_set",2,2,swig_obj)) SWIG_fail;
+  (void)self;
+  if (!SWIG_Python_UnpackTuple(args, "SOMcomponent_n_w_set", 2, 2, swig_obj)) SWIG_fail;
   res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_SOMcomponent, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "SOMcomponent_n_w_set" "', argument " "1"" of type '" "SOMcomponent *""'"); 
@@ -6411,14 +6397,15 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_SOMcomponent_n_w_get(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_SOMcomponent_n_w_get(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  SOMcomponent *arg1 = (SOMcomponent *) 0 ;
+  SOMcomponent *arg1 = 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   PyObject *swig_obj[1] ;
   double result;
   
+  (void)self;
   if (!args) SWIG_fail;
   swig_obj[0] = args;
   res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_SOMcomponent, 0 |  0 );
@@ -6434,9 +6421,9 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_SOMcomponent_K_pH_set(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_SOMcomponent_K_pH_set(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  SOMcomponent *arg1 = (SOMcomponent *) 0 ;
+  SOMcomponent *arg1 = 0 ;
   double arg2 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
@@ -6444,7 +6431,8 @@ SWIGINTERN PyObject *_wrap_SOMcomponent_K_pH_set(PyObject *SWIGUNUSEDPARM(self),
   int ecode2 = 0 ;
   PyObject *swig_obj[2] ;
   
-  if (!SWIG_Python_UnpackTuple(args,"SOMcomponent_K_pH_set",2,2,swig_obj)) SWIG_fail;
+  (void)self;
+  if (!SWIG_Python_UnpackTuple(args, "SOMcomponent_K_pH_set", 2, 2, swig_obj)) SWIG_fail;
   res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_SOMcomponent, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "SOMcomponent_K_pH_set" "', argument " "1"" of type '" "SOMcomponent *""'"); 
@@ -6463,14 +6451,15 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_SOMcomponent_K_pH_get(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_SOMcomponent_K_pH_get(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  SOMcomponent *arg1 = (SOMcomponent *) 0 ;
+  SOMcomponent *arg1 = 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   PyObject *swig_obj[1] ;
   double result;
   
+  (void)self;
   if (!args) SWIG_fail;
   swig_obj[0] = args;
   res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_SOMcomponent, 0 |  0 );
@@ -6486,9 +6475,9 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_SOMcomponent_m_pH_set(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_SOMcomponent_m_pH_set(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  SOMcomponent *arg1 = (SOMcomponent *) 0 ;
+  SOMcomponent *arg1 = 0 ;
   double arg2 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
@@ -6496,7 +6485,8 @@ SWIGINTERN PyObject *_wrap_SOMcomponent_m_pH_set(PyObject *SWIGUNUSEDPARM(self),
   int ecode2 = 0 ;
   PyObject *swig_obj[2] ;
   
-  if (!SWIG_Python_UnpackTuple(args,"SOMcomponent_m_pH_set",2,2,swig_obj)) SWIG_fail;
+  (void)self;
+  if (!SWIG_Python_UnpackTuple(args, "SOMcomponent_m_pH_set", 2, 2, swig_obj)) SWIG_fail;
   res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_SOMcomponent, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "SOMcomponent_m_pH_set" "', argument " "1"" of type '" "SOMcomponent *""'"); 
@@ -6515,14 +6505,15 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_SOMcomponent_m_pH_get(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_SOMcomponent_m_pH_get(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  SOMcomponent *arg1 = (SOMcomponent *) 0 ;
+  SOMcomponent *arg1 = 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   PyObject *swig_obj[1] ;
   double result;
   
+  (void)self;
   if (!args) SWIG_fail;
   swig_obj[0] = args;
   res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_SOMcomponent, 0 |  0 );
@@ -6538,9 +6529,9 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_SOMcomponent_set_product(PyObject *SWIGUNUSEDPARM(self), PyObject *args, PyObject *kwargs) {
+SWIGINTERN PyObject *_wrap_SOMcomponent_set_product(PyObject *self, PyObject *args, PyObject *kwargs) {
   PyObject *resultobj = 0;
-  SOMcomponent *arg1 = (SOMcomponent *) 0 ;
+  SOMcomponent *arg1 = 0 ;
   SOMcomponent *arg2 = 0 ;
   double arg3 ;
   void *argp1 = 0 ;
@@ -6552,11 +6543,12 @@ SWIGINTERN PyObject *_wrap_SOMcomponent_set_product(PyObject *SWIGUNUSEDPARM(sel
   PyObject * obj0 = 0 ;
   PyObject * obj1 = 0 ;
   PyObject * obj2 = 0 ;
-  char *  kwnames[] = {
-    (char *) "self",(char *) "product",(char *) "fraction", NULL 
+  char * kwnames[] = {
+    (char *)"self",  (char *)"product",  (char *)"fraction",  NULL 
   };
   
-  if (!PyArg_ParseTupleAndKeywords(args,kwargs,(char *)"OOO:SOMcomponent_set_product",kwnames,&obj0,&obj1,&obj2)) SWIG_fail;
+  (void)self;
+  if (!PyArg_ParseTupleAndKeywords(args, kwargs, "OOO:SOMcomponent_set_product", kwnames, &obj0, &obj1, &obj2)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_SOMcomponent, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "SOMcomponent_set_product" "', argument " "1"" of type '" "SOMcomponent *""'"); 
@@ -6567,7 +6559,7 @@ SWIGINTERN PyObject *_wrap_SOMcomponent_set_product(PyObject *SWIGUNUSEDPARM(sel
     SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "SOMcomponent_set_product" "', argument " "2"" of type '" "SOMcomponent const &""'"); 
   }
   if (!argp2) {
-    SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "SOMcomponent_set_product" "', argument " "2"" of type '" "SOMcomponent const &""'"); 
+    SWIG_exception_fail(SWIG_NullReferenceError, "invalid null reference " "in method '" "SOMcomponent_set_product" "', argument " "2"" of type '" "SOMcomponent const &""'"); 
   }
   arg2 = reinterpret_cast< SOMcomponent * >(argp2);
   ecode3 = SWIG_AsVal_double(obj2, &val3);
@@ -6579,7 +6571,7 @@ SWIGINTERN PyObject *_wrap_SOMcomponent_set_product(PyObject *SWIGUNUSEDPARM(sel
     try {
       (arg1)->set_product((SOMcomponent const &)*arg2,arg3);
     } 
-    /*@SWIG:C:\Apps\swigwin-3.0.12\Lib\typemaps\exception.swg,58,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
+    /*@SWIG:/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/swig/data/share/swig/4.5.1/typemaps/exception.swg,59,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
     catch (std::invalid_argument& e) {
       SWIG_exception_fail(SWIG_ValueError, e.what() );
     } catch (std::domain_error& e) {
@@ -6604,9 +6596,9 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_SOMcomponent_get_product_fraction(PyObject *SWIGUNUSEDPARM(self), PyObject *args, PyObject *kwargs) {
+SWIGINTERN PyObject *_wrap_SOMcomponent_get_product_fraction(PyObject *self, PyObject *args, PyObject *kwargs) {
   PyObject *resultobj = 0;
-  SOMcomponent *arg1 = (SOMcomponent *) 0 ;
+  SOMcomponent *arg1 = 0 ;
   SOMcomponent *arg2 = 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
@@ -6614,12 +6606,13 @@ SWIGINTERN PyObject *_wrap_SOMcomponent_get_product_fraction(PyObject *SWIGUNUSE
   int res2 = 0 ;
   PyObject * obj0 = 0 ;
   PyObject * obj1 = 0 ;
-  char *  kwnames[] = {
-    (char *) "self",(char *) "product", NULL 
+  char * kwnames[] = {
+    (char *)"self",  (char *)"product",  NULL 
   };
   double result;
   
-  if (!PyArg_ParseTupleAndKeywords(args,kwargs,(char *)"OO:SOMcomponent_get_product_fraction",kwnames,&obj0,&obj1)) SWIG_fail;
+  (void)self;
+  if (!PyArg_ParseTupleAndKeywords(args, kwargs, "OO:SOMcomponent_get_product_fraction", kwnames, &obj0, &obj1)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_SOMcomponent, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "SOMcomponent_get_product_fraction" "', argument " "1"" of type '" "SOMcomponent const *""'"); 
@@ -6630,14 +6623,14 @@ SWIGINTERN PyObject *_wrap_SOMcomponent_get_product_fraction(PyObject *SWIGUNUSE
     SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "SOMcomponent_get_product_fraction" "', argument " "2"" of type '" "SOMcomponent const &""'"); 
   }
   if (!argp2) {
-    SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "SOMcomponent_get_product_fraction" "', argument " "2"" of type '" "SOMcomponent const &""'"); 
+    SWIG_exception_fail(SWIG_NullReferenceError, "invalid null reference " "in method '" "SOMcomponent_get_product_fraction" "', argument " "2"" of type '" "SOMcomponent const &""'"); 
   }
   arg2 = reinterpret_cast< SOMcomponent * >(argp2);
   {
     try {
       result = (double)((SOMcomponent const *)arg1)->get_product_fraction((SOMcomponent const &)*arg2);
     } 
-    /*@SWIG:C:\Apps\swigwin-3.0.12\Lib\typemaps\exception.swg,58,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
+    /*@SWIG:/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/swig/data/share/swig/4.5.1/typemaps/exception.swg,59,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
     catch (std::invalid_argument& e) {
       SWIG_exception_fail(SWIG_ValueError, e.what() );
     } catch (std::domain_error& e) {
@@ -6662,14 +6655,15 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_SOMcomponent_get_products(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_SOMcomponent_get_products(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  SOMcomponent *arg1 = (SOMcomponent *) 0 ;
+  SOMcomponent *arg1 = 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   PyObject *swig_obj[1] ;
   component_set result;
   
+  (void)self;
   if (!args) SWIG_fail;
   swig_obj[0] = args;
   res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_SOMcomponent, 0 |  0 );
@@ -6681,7 +6675,7 @@ SWIGINTERN PyObject *_wrap_SOMcomponent_get_products(PyObject *SWIGUNUSEDPARM(se
     try {
       result = ((SOMcomponent const *)arg1)->get_products();
     } 
-    /*@SWIG:C:\Apps\swigwin-3.0.12\Lib\typemaps\exception.swg,58,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
+    /*@SWIG:/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/swig/data/share/swig/4.5.1/typemaps/exception.swg,59,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
     catch (std::invalid_argument& e) {
       SWIG_exception_fail(SWIG_ValueError, e.what() );
     } catch (std::domain_error& e) {
@@ -6699,16 +6693,16 @@ SWIGINTERN PyObject *_wrap_SOMcomponent_get_products(PyObject *SWIGUNUSEDPARM(se
     }
     /*@SWIG@*/
   }
-  resultobj = SWIG_NewPointerObj((new component_set(static_cast< const component_set& >(result))), SWIGTYPE_p_std__vectorT_SOMcomponent_std__allocatorT_SOMcomponent_t_t, SWIG_POINTER_OWN |  0 );
+  resultobj = SWIG_NewPointerObj((new component_set(result)), SWIGTYPE_p_std__vectorT_SOMcomponent_t, SWIG_POINTER_OWN |  0 );
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_SOMcomponent_decomp(PyObject *SWIGUNUSEDPARM(self), PyObject *args, PyObject *kwargs) {
+SWIGINTERN PyObject *_wrap_SOMcomponent_decomp(PyObject *self, PyObject *args, PyObject *kwargs) {
   PyObject *resultobj = 0;
-  SOMcomponent *arg1 = (SOMcomponent *) 0 ;
+  SOMcomponent *arg1 = 0 ;
   double arg2 ;
   double arg3 ;
   double arg4 ;
@@ -6724,12 +6718,13 @@ SWIGINTERN PyObject *_wrap_SOMcomponent_decomp(PyObject *SWIGUNUSEDPARM(self), P
   PyObject * obj1 = 0 ;
   PyObject * obj2 = 0 ;
   PyObject * obj3 = 0 ;
-  char *  kwnames[] = {
-    (char *) "self",(char *) "T",(char *) "wetness",(char *) "pH", NULL 
+  char * kwnames[] = {
+    (char *)"self",  (char *)"T",  (char *)"wetness",  (char *)"pH",  NULL 
   };
   double result;
   
-  if (!PyArg_ParseTupleAndKeywords(args,kwargs,(char *)"OOOO:SOMcomponent_decomp",kwnames,&obj0,&obj1,&obj2,&obj3)) SWIG_fail;
+  (void)self;
+  if (!PyArg_ParseTupleAndKeywords(args, kwargs, "OOOO:SOMcomponent_decomp", kwnames, &obj0, &obj1, &obj2, &obj3)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_SOMcomponent, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "SOMcomponent_decomp" "', argument " "1"" of type '" "SOMcomponent const *""'"); 
@@ -6754,7 +6749,7 @@ SWIGINTERN PyObject *_wrap_SOMcomponent_decomp(PyObject *SWIGUNUSEDPARM(self), P
     try {
       result = (double)((SOMcomponent const *)arg1)->decomp(arg2,arg3,arg4);
     } 
-    /*@SWIG:C:\Apps\swigwin-3.0.12\Lib\typemaps\exception.swg,58,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
+    /*@SWIG:/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/swig/data/share/swig/4.5.1/typemaps/exception.swg,59,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
     catch (std::invalid_argument& e) {
       SWIG_exception_fail(SWIG_ValueError, e.what() );
     } catch (std::domain_error& e) {
@@ -6779,16 +6774,17 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_new_SOMcomponent__SWIG_1(PyObject *SWIGUNUSEDPARM(self), int nobjs, PyObject **SWIGUNUSEDPARM(swig_obj)) {
+SWIGINTERN PyObject *_wrap_new_SOMcomponent__SWIG_1(PyObject *self, Py_ssize_t nobjs, PyObject **SWIGUNUSEDPARM(swig_obj)) {
   PyObject *resultobj = 0;
   SOMcomponent *result = 0 ;
   
+  (void)self;
   if ((nobjs < 0) || (nobjs > 0)) SWIG_fail;
   {
     try {
       result = (SOMcomponent *)new SOMcomponent();
     } 
-    /*@SWIG:C:\Apps\swigwin-3.0.12\Lib\typemaps\exception.swg,58,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
+    /*@SWIG:/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/swig/data/share/swig/4.5.1/typemaps/exception.swg,59,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
     catch (std::invalid_argument& e) {
       SWIG_exception_fail(SWIG_ValueError, e.what() );
     } catch (std::domain_error& e) {
@@ -6813,9 +6809,9 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_SOMcomponent___lt__(PyObject *SWIGUNUSEDPARM(self), PyObject *args, PyObject *kwargs) {
+SWIGINTERN PyObject *_wrap_SOMcomponent___lt__(PyObject *self, PyObject *args, PyObject *kwargs) {
   PyObject *resultobj = 0;
-  SOMcomponent *arg1 = (SOMcomponent *) 0 ;
+  SOMcomponent *arg1 = 0 ;
   SOMcomponent *arg2 = 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
@@ -6823,12 +6819,13 @@ SWIGINTERN PyObject *_wrap_SOMcomponent___lt__(PyObject *SWIGUNUSEDPARM(self), P
   int res2 = 0 ;
   PyObject * obj0 = 0 ;
   PyObject * obj1 = 0 ;
-  char *  kwnames[] = {
-    (char *) "self",(char *) "cmp", NULL 
+  char * kwnames[] = {
+    (char *)"self",  (char *)"cmp",  NULL 
   };
   bool result;
   
-  if (!PyArg_ParseTupleAndKeywords(args,kwargs,(char *)"OO:SOMcomponent___lt__",kwnames,&obj0,&obj1)) SWIG_fail;
+  (void)self;
+  if (!PyArg_ParseTupleAndKeywords(args, kwargs, "OO:SOMcomponent___lt__", kwnames, &obj0, &obj1)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_SOMcomponent, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "SOMcomponent___lt__" "', argument " "1"" of type '" "SOMcomponent const *""'"); 
@@ -6839,14 +6836,14 @@ SWIGINTERN PyObject *_wrap_SOMcomponent___lt__(PyObject *SWIGUNUSEDPARM(self), P
     SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "SOMcomponent___lt__" "', argument " "2"" of type '" "SOMcomponent const &""'"); 
   }
   if (!argp2) {
-    SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "SOMcomponent___lt__" "', argument " "2"" of type '" "SOMcomponent const &""'"); 
+    SWIG_exception_fail(SWIG_NullReferenceError, "invalid null reference " "in method '" "SOMcomponent___lt__" "', argument " "2"" of type '" "SOMcomponent const &""'"); 
   }
   arg2 = reinterpret_cast< SOMcomponent * >(argp2);
   {
     try {
       result = (bool)((SOMcomponent const *)arg1)->operator <((SOMcomponent const &)*arg2);
     } 
-    /*@SWIG:C:\Apps\swigwin-3.0.12\Lib\typemaps\exception.swg,58,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
+    /*@SWIG:/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/swig/data/share/swig/4.5.1/typemaps/exception.swg,59,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
     catch (std::invalid_argument& e) {
       SWIG_exception_fail(SWIG_ValueError, e.what() );
     } catch (std::domain_error& e) {
@@ -6867,13 +6864,18 @@ SWIGINTERN PyObject *_wrap_SOMcomponent___lt__(PyObject *SWIGUNUSEDPARM(self), P
   resultobj = SWIG_From_bool(static_cast< bool >(result));
   return resultobj;
 fail:
-  return NULL;
+  if (PyErr_Occurred() && !PyErr_ExceptionMatches(PyExc_TypeError)) {
+    return NULL;
+  }
+  PyErr_Clear();
+  SWIG_Py_INCREF(Py_NotImplemented);
+  return Py_NotImplemented;
 }
 
 
-SWIGINTERN PyObject *_wrap_SOMcomponent___eq__(PyObject *SWIGUNUSEDPARM(self), PyObject *args, PyObject *kwargs) {
+SWIGINTERN PyObject *_wrap_SOMcomponent___eq__(PyObject *self, PyObject *args, PyObject *kwargs) {
   PyObject *resultobj = 0;
-  SOMcomponent *arg1 = (SOMcomponent *) 0 ;
+  SOMcomponent *arg1 = 0 ;
   SOMcomponent *arg2 = 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
@@ -6881,12 +6883,13 @@ SWIGINTERN PyObject *_wrap_SOMcomponent___eq__(PyObject *SWIGUNUSEDPARM(self), P
   int res2 = 0 ;
   PyObject * obj0 = 0 ;
   PyObject * obj1 = 0 ;
-  char *  kwnames[] = {
-    (char *) "self",(char *) "cmp", NULL 
+  char * kwnames[] = {
+    (char *)"self",  (char *)"cmp",  NULL 
   };
   bool result;
   
-  if (!PyArg_ParseTupleAndKeywords(args,kwargs,(char *)"OO:SOMcomponent___eq__",kwnames,&obj0,&obj1)) SWIG_fail;
+  (void)self;
+  if (!PyArg_ParseTupleAndKeywords(args, kwargs, "OO:SOMcomponent___eq__", kwnames, &obj0, &obj1)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_SOMcomponent, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "SOMcomponent___eq__" "', argument " "1"" of type '" "SOMcomponent *""'"); 
@@ -6897,14 +6900,14 @@ SWIGINTERN PyObject *_wrap_SOMcomponent___eq__(PyObject *SWIGUNUSEDPARM(self), P
     SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "SOMcomponent___eq__" "', argument " "2"" of type '" "SOMcomponent const &""'"); 
   }
   if (!argp2) {
-    SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "SOMcomponent___eq__" "', argument " "2"" of type '" "SOMcomponent const &""'"); 
+    SWIG_exception_fail(SWIG_NullReferenceError, "invalid null reference " "in method '" "SOMcomponent___eq__" "', argument " "2"" of type '" "SOMcomponent const &""'"); 
   }
   arg2 = reinterpret_cast< SOMcomponent * >(argp2);
   {
     try {
       result = (bool)(arg1)->operator ==((SOMcomponent const &)*arg2);
     } 
-    /*@SWIG:C:\Apps\swigwin-3.0.12\Lib\typemaps\exception.swg,58,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
+    /*@SWIG:/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/swig/data/share/swig/4.5.1/typemaps/exception.swg,59,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
     catch (std::invalid_argument& e) {
       SWIG_exception_fail(SWIG_ValueError, e.what() );
     } catch (std::domain_error& e) {
@@ -6925,13 +6928,18 @@ SWIGINTERN PyObject *_wrap_SOMcomponent___eq__(PyObject *SWIGUNUSEDPARM(self), P
   resultobj = SWIG_From_bool(static_cast< bool >(result));
   return resultobj;
 fail:
-  return NULL;
+  if (PyErr_Occurred() && !PyErr_ExceptionMatches(PyExc_TypeError)) {
+    return NULL;
+  }
+  PyErr_Clear();
+  SWIG_Py_INCREF(Py_NotImplemented);
+  return Py_NotImplemented;
 }
 
 
-SWIGINTERN PyObject *_wrap_SOMcomponent___ne__(PyObject *SWIGUNUSEDPARM(self), PyObject *args, PyObject *kwargs) {
+SWIGINTERN PyObject *_wrap_SOMcomponent___ne__(PyObject *self, PyObject *args, PyObject *kwargs) {
   PyObject *resultobj = 0;
-  SOMcomponent *arg1 = (SOMcomponent *) 0 ;
+  SOMcomponent *arg1 = 0 ;
   SOMcomponent *arg2 = 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
@@ -6939,12 +6947,13 @@ SWIGINTERN PyObject *_wrap_SOMcomponent___ne__(PyObject *SWIGUNUSEDPARM(self), P
   int res2 = 0 ;
   PyObject * obj0 = 0 ;
   PyObject * obj1 = 0 ;
-  char *  kwnames[] = {
-    (char *) "self",(char *) "cmp", NULL 
+  char * kwnames[] = {
+    (char *)"self",  (char *)"cmp",  NULL 
   };
   bool result;
   
-  if (!PyArg_ParseTupleAndKeywords(args,kwargs,(char *)"OO:SOMcomponent___ne__",kwnames,&obj0,&obj1)) SWIG_fail;
+  (void)self;
+  if (!PyArg_ParseTupleAndKeywords(args, kwargs, "OO:SOMcomponent___ne__", kwnames, &obj0, &obj1)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_SOMcomponent, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "SOMcomponent___ne__" "', argument " "1"" of type '" "SOMcomponent *""'"); 
@@ -6955,14 +6964,14 @@ SWIGINTERN PyObject *_wrap_SOMcomponent___ne__(PyObject *SWIGUNUSEDPARM(self), P
     SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "SOMcomponent___ne__" "', argument " "2"" of type '" "SOMcomponent const &""'"); 
   }
   if (!argp2) {
-    SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "SOMcomponent___ne__" "', argument " "2"" of type '" "SOMcomponent const &""'"); 
+    SWIG_exception_fail(SWIG_NullReferenceError, "invalid null reference " "in method '" "SOMcomponent___ne__" "', argument " "2"" of type '" "SOMcomponent const &""'"); 
   }
   arg2 = reinterpret_cast< SOMcomponent * >(argp2);
   {
     try {
       result = (bool)(arg1)->operator !=((SOMcomponent const &)*arg2);
     } 
-    /*@SWIG:C:\Apps\swigwin-3.0.12\Lib\typemaps\exception.swg,58,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
+    /*@SWIG:/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/swig/data/share/swig/4.5.1/typemaps/exception.swg,59,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
     catch (std::invalid_argument& e) {
       SWIG_exception_fail(SWIG_ValueError, e.what() );
     } catch (std::domain_error& e) {
@@ -6983,31 +6992,37 @@ SWIGINTERN PyObject *_wrap_SOMcomponent___ne__(PyObject *SWIGUNUSEDPARM(self), P
   resultobj = SWIG_From_bool(static_cast< bool >(result));
   return resultobj;
 fail:
-  return NULL;
+  if (PyErr_Occurred() && !PyErr_ExceptionMatches(PyExc_TypeError)) {
+    return NULL;
+  }
+  PyErr_Clear();
+  SWIG_Py_INCREF(Py_NotImplemented);
+  return Py_NotImplemented;
 }
 
 
-SWIGINTERN PyObject *_wrap_new_SOMcomponent__SWIG_2(PyObject *SWIGUNUSEDPARM(self), int nobjs, PyObject **swig_obj) {
+SWIGINTERN PyObject *_wrap_new_SOMcomponent__SWIG_2(PyObject *self, Py_ssize_t nobjs, PyObject **swig_obj) {
   PyObject *resultobj = 0;
   SOMcomponent *arg1 = 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   SOMcomponent *result = 0 ;
   
+  (void)self;
   if ((nobjs < 1) || (nobjs > 1)) SWIG_fail;
   res1 = SWIG_ConvertPtr(swig_obj[0], &argp1, SWIGTYPE_p_SOMcomponent,  0  | 0);
   if (!SWIG_IsOK(res1)) {
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "new_SOMcomponent" "', argument " "1"" of type '" "SOMcomponent const &""'"); 
   }
   if (!argp1) {
-    SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "new_SOMcomponent" "', argument " "1"" of type '" "SOMcomponent const &""'"); 
+    SWIG_exception_fail(SWIG_NullReferenceError, "invalid null reference " "in method '" "new_SOMcomponent" "', argument " "1"" of type '" "SOMcomponent const &""'"); 
   }
   arg1 = reinterpret_cast< SOMcomponent * >(argp1);
   {
     try {
       result = (SOMcomponent *)new SOMcomponent((SOMcomponent const &)*arg1);
     } 
-    /*@SWIG:C:\Apps\swigwin-3.0.12\Lib\typemaps\exception.swg,58,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
+    /*@SWIG:/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/swig/data/share/swig/4.5.1/typemaps/exception.swg,59,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
     catch (std::invalid_argument& e) {
       SWIG_exception_fail(SWIG_ValueError, e.what() );
     } catch (std::domain_error& e) {
@@ -7038,7 +7053,7 @@ SWIGINTERN PyObject *_wrap_new_SOMcomponent(PyObject *self, PyObject *args) {
     0
   };
   
-  if (!(argc = SWIG_Python_UnpackTuple(args,"new_SOMcomponent",0,8,argv))) SWIG_fail;
+  if (!(argc = SWIG_Python_UnpackTuple(args, "new_SOMcomponent", 0, 8, argv))) SWIG_fail;
   --argc;
   {
     unsigned long _index = 0;
@@ -7057,7 +7072,7 @@ SWIGINTERN PyObject *_wrap_new_SOMcomponent(PyObject *self, PyObject *args) {
       SWIG_TypeRank _pi = 1;
       int _v = 0;
       {
-        int res = SWIG_ConvertPtr(argv[0], 0, SWIGTYPE_p_SOMcomponent, 0);
+        int res = SWIG_ConvertPtr(argv[0], 0, SWIGTYPE_p_SOMcomponent, SWIG_POINTER_NO_NULL | 0);
         _v = SWIG_CheckState(res);
       }
       if (!_v) goto check_2;
@@ -7175,7 +7190,7 @@ SWIGINTERN PyObject *_wrap_new_SOMcomponent(PyObject *self, PyObject *args) {
   }
   
 fail:
-  SWIG_SetErrorMsg(PyExc_NotImplementedError,"Wrong number or type of arguments for overloaded function 'new_SOMcomponent'.\n"
+  SWIG_Python_RaiseOrModifyTypeError("Wrong number or type of arguments for overloaded function 'new_SOMcomponent'.\n"
     "  Possible C/C++ prototypes are:\n"
     "    SOMcomponent::SOMcomponent(std::string,bool,double,double,double,double,double,double)\n"
     "    SOMcomponent::SOMcomponent()\n"
@@ -7184,13 +7199,14 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_delete_SOMcomponent(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_delete_SOMcomponent(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  SOMcomponent *arg1 = (SOMcomponent *) 0 ;
+  SOMcomponent *arg1 = 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   PyObject *swig_obj[1] ;
   
+  (void)self;
   if (!args) SWIG_fail;
   swig_obj[0] = args;
   res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_SOMcomponent, SWIG_POINTER_DISOWN |  0 );
@@ -7202,7 +7218,7 @@ SWIGINTERN PyObject *_wrap_delete_SOMcomponent(PyObject *SWIGUNUSEDPARM(self), P
     try {
       delete arg1;
     } 
-    /*@SWIG:C:\Apps\swigwin-3.0.12\Lib\typemaps\exception.swg,58,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
+    /*@SWIG:/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/swig/data/share/swig/4.5.1/typemaps/exception.swg,59,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
     catch (std::invalid_argument& e) {
       SWIG_exception_fail(SWIG_ValueError, e.what() );
     } catch (std::domain_error& e) {
@@ -7227,288 +7243,27 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_SOMcomponent___repr__(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_SOMcomponent___repr__(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  SOMcomponent *arg1 = (SOMcomponent *) 0 ;
+  SOMcomponent *arg1 = 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   PyObject *swig_obj[1] ;
   std::string result;
   
+  (void)self;
   if (!args) SWIG_fail;
   swig_obj[0] = args;
   res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_SOMcomponent, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "SOMcomponent___repr__" "', argument " "1"" of type '" "SOMcomponent *""'"); 
-  }
-  arg1 = reinterpret_cast< SOMcomponent * >(argp1);
-  {
-    try {
-      result = SOMcomponent___repr__(arg1);
-    } 
-    /*@SWIG:C:\Apps\swigwin-3.0.12\Lib\typemaps\exception.swg,58,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
-    catch (std::invalid_argument& e) {
-      SWIG_exception_fail(SWIG_ValueError, e.what() );
-    } catch (std::domain_error& e) {
-      SWIG_exception_fail(SWIG_ValueError, e.what() );
-    } catch (std::overflow_error& e) {
-      SWIG_exception_fail(SWIG_OverflowError, e.what() );
-    } catch (std::out_of_range& e) {
-      SWIG_exception_fail(SWIG_IndexError, e.what() );
-    } catch (std::length_error& e) {
-      SWIG_exception_fail(SWIG_IndexError, e.what() );
-    } catch (std::runtime_error& e) {
-      SWIG_exception_fail(SWIG_RuntimeError, e.what() );
-    } catch (std::exception& e) {
-      SWIG_exception_fail(SWIG_SystemError, e.what() );
-    }
-    /*@SWIG@*/
-  }
-  resultobj = SWIG_From_std_string(static_cast< std::string >(result));
-  return resultobj;
-fail:
-  return NULL;
-}
-
-
-SWIGINTERN PyObject *SOMcomponent_swigregister(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
-  PyObject *obj;
-  if (!SWIG_Python_UnpackTuple(args,(char *)"swigregister", 1, 1,&obj)) return NULL;
-  SWIG_TypeNewClientData(SWIGTYPE_p_SOMcomponent, SWIG_NewClientData(obj));
-  return SWIG_Py_Void();
-}
-
-SWIGINTERN PyObject *SOMcomponent_swiginit(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
-  return SWIG_Python_InitShadowInstance(args);
-}
-
-SWIGINTERN PyObject *_wrap_component_set_iterator(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
-  PyObject *resultobj = 0;
-  std::vector< SOMcomponent > *arg1 = (std::vector< SOMcomponent > *) 0 ;
-  PyObject **arg2 = (PyObject **) 0 ;
-  void *argp1 = 0 ;
-  int res1 = 0 ;
-  PyObject *swig_obj[1] ;
-  swig::SwigPyIterator *result = 0 ;
-  
-  arg2 = &swig_obj[0];
-  if (!args) SWIG_fail;
-  swig_obj[0] = args;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_std__vectorT_SOMcomponent_std__allocatorT_SOMcomponent_t_t, 0 |  0 );
-  if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "component_set_iterator" "', argument " "1"" of type '" "std::vector< SOMcomponent > *""'"); 
-  }
-  arg1 = reinterpret_cast< std::vector< SOMcomponent > * >(argp1);
-  {
-    try {
-      result = (swig::SwigPyIterator *)std_vector_Sl_SOMcomponent_Sg__iterator(arg1,arg2);
-    } 
-    /*@SWIG:C:\Apps\swigwin-3.0.12\Lib\typemaps\exception.swg,58,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
-    catch (std::invalid_argument& e) {
-      SWIG_exception_fail(SWIG_ValueError, e.what() );
-    } catch (std::domain_error& e) {
-      SWIG_exception_fail(SWIG_ValueError, e.what() );
-    } catch (std::overflow_error& e) {
-      SWIG_exception_fail(SWIG_OverflowError, e.what() );
-    } catch (std::out_of_range& e) {
-      SWIG_exception_fail(SWIG_IndexError, e.what() );
-    } catch (std::length_error& e) {
-      SWIG_exception_fail(SWIG_IndexError, e.what() );
-    } catch (std::runtime_error& e) {
-      SWIG_exception_fail(SWIG_RuntimeError, e.what() );
-    } catch (std::exception& e) {
-      SWIG_exception_fail(SWIG_SystemError, e.what() );
-    }
-    /*@SWIG@*/
-  }
-  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_swig__SwigPyIterator, SWIG_POINTER_OWN |  0 );
-  return resultobj;
-fail:
-  return NULL;
-}
-
-
-SWIGINTERN PyObject *_wrap_component_set___nonzero__(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
-  PyObject *resultobj = 0;
-  std::vector< SOMcomponent > *arg1 = (std::vector< SOMcomponent > *) 0 ;
-  void *argp1 = 0 ;
-  int res1 = 0 ;
-  PyObject *swig_obj[1] ;
-  bool result;
-  
-  if (!args) SWIG_fail;
-  swig_obj[0] = args;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_std__vectorT_SOMcomponent_std__allocatorT_SOMcomponent_t_t, 0 |  0 );
-  if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "component_set___nonzero__" "', argument " "1"" of type '" "std::vector< SOMcomponent > const *""'"); 
-  }
-  arg1 = reinterpret_cast< std::vector< SOMcomponent > * >(argp1);
-  {
-    try {
-      result = (bool)std_vector_Sl_SOMcomponent_Sg____nonzero__((std::vector< SOMcomponent > const *)arg1);
-    } 
-    /*@SWIG:C:\Apps\swigwin-3.0.12\Lib\typemaps\exception.swg,58,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
-    catch (std::invalid_argument& e) {
-      SWIG_exception_fail(SWIG_ValueError, e.what() );
-    } catch (std::domain_error& e) {
-      SWIG_exception_fail(SWIG_ValueError, e.what() );
-    } catch (std::overflow_error& e) {
-      SWIG_exception_fail(SWIG_OverflowError, e.what() );
-    } catch (std::out_of_range& e) {
-      SWIG_exception_fail(SWIG_IndexError, e.what() );
-    } catch (std::length_error& e) {
-      SWIG_exception_fail(SWIG_IndexError, e.what() );
-    } catch (std::runtime_error& e) {
-      SWIG_exception_fail(SWIG_RuntimeError, e.what() );
-    } catch (std::exception& e) {
-      SWIG_exception_fail(SWIG_SystemError, e.what() );
-    }
-    /*@SWIG@*/
-  }
-  resultobj = SWIG_From_bool(static_cast< bool >(result));
-  return resultobj;
-fail:
-  return NULL;
-}
-
-
-SWIGINTERN PyObject *_wrap_component_set___bool__(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
-  PyObject *resultobj = 0;
-  std::vector< SOMcomponent > *arg1 = (std::vector< SOMcomponent > *) 0 ;
-  void *argp1 = 0 ;
-  int res1 = 0 ;
-  PyObject *swig_obj[1] ;
-  bool result;
-  
-  if (!args) SWIG_fail;
-  swig_obj[0] = args;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_std__vectorT_SOMcomponent_std__allocatorT_SOMcomponent_t_t, 0 |  0 );
-  if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "component_set___bool__" "', argument " "1"" of type '" "std::vector< SOMcomponent > const *""'"); 
-  }
-  arg1 = reinterpret_cast< std::vector< SOMcomponent > * >(argp1);
-  {
-    try {
-      result = (bool)std_vector_Sl_SOMcomponent_Sg____bool__((std::vector< SOMcomponent > const *)arg1);
-    } 
-    /*@SWIG:C:\Apps\swigwin-3.0.12\Lib\typemaps\exception.swg,58,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
-    catch (std::invalid_argument& e) {
-      SWIG_exception_fail(SWIG_ValueError, e.what() );
-    } catch (std::domain_error& e) {
-      SWIG_exception_fail(SWIG_ValueError, e.what() );
-    } catch (std::overflow_error& e) {
-      SWIG_exception_fail(SWIG_OverflowError, e.what() );
-    } catch (std::out_of_range& e) {
-      SWIG_exception_fail(SWIG_IndexError, e.what() );
-    } catch (std::length_error& e) {
-      SWIG_exception_fail(SWIG_IndexError, e.what() );
-    } catch (std::runtime_error& e) {
-      SWIG_exception_fail(SWIG_RuntimeError, e.what() );
-    } catch (std::exception& e) {
-      SWIG_exception_fail(SWIG_SystemError, e.what() );
-    }
-    /*@SWIG@*/
-  }
-  resultobj = SWIG_From_bool(static_cast< bool >(result));
-  return resultobj;
-fail:
-  return NULL;
-}
-
-
-SWIGINTERN PyObject *_wrap_component_set___len__(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
-  PyObject *resultobj = 0;
-  std::vector< SOMcomponent > *arg1 = (std::vector< SOMcomponent > *) 0 ;
-  void *argp1 = 0 ;
-  int res1 = 0 ;
-  PyObject *swig_obj[1] ;
-  std::vector< SOMcomponent >::size_type result;
-  
-  if (!args) SWIG_fail;
-  swig_obj[0] = args;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_std__vectorT_SOMcomponent_std__allocatorT_SOMcomponent_t_t, 0 |  0 );
-  if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "component_set___len__" "', argument " "1"" of type '" "std::vector< SOMcomponent > const *""'"); 
-  }
-  arg1 = reinterpret_cast< std::vector< SOMcomponent > * >(argp1);
-  {
-    try {
-      result = std_vector_Sl_SOMcomponent_Sg____len__((std::vector< SOMcomponent > const *)arg1);
-    } 
-    /*@SWIG:C:\Apps\swigwin-3.0.12\Lib\typemaps\exception.swg,58,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
-    catch (std::invalid_argument& e) {
-      SWIG_exception_fail(SWIG_ValueError, e.what() );
-    } catch (std::domain_error& e) {
-      SWIG_exception_fail(SWIG_ValueError, e.what() );
-    } catch (std::overflow_error& e) {
-      SWIG_exception_fail(SWIG_OverflowError, e.what() );
-    } catch (std::out_of_range& e) {
-      SWIG_exception_fail(SWIG_IndexError, e.what() );
-    } catch (std::length_error& e) {
-      SWIG_exception_fail(SWIG_IndexError, e.what() );
-    } catch (std::runtime_error& e) {
-      SWIG_exception_fail(SWIG_RuntimeError, e.what() );
-    } catch (std::exception& e) {
-      SWIG_exception_fail(SWIG_SystemError, e.what() );
-    }
-    /*@SWIG@*/
-  }
-  resultobj = SWIG_From_size_t(static_cast< size_t >(result));
-  return resultobj;
-fail:
-  return NULL;
-}
-
-
-SWIGINTERN PyObject *_wrap_component_set___getslice__(PyObject *SWIGUNUSEDPARM(self), PyObject *args, PyObject *kwargs) {
-  PyObject *resultobj = 0;
-  std::vector< SOMcomponent > *arg1 = (std::vector< SOMcomponent > *) 0 ;
-  std::vector< SOMcomponent >::difference_type arg2 ;
-  std::vector< SOMcomponent >::difference_type arg3 ;
-  void *argp1 = 0 ;
-  int res1 = 0 ;
-  ptrdiff_t val2 ;
-  int ecode2 = 0 ;
-  ptrdiff_t val3 ;
-  int ecode3 = 0 ;
-  PyObject * obj0 = 0 ;
-  PyObject * obj1 = 0 ;
-  PyObject * obj2 = 0 ;
-  char *  kwnames[] = {
-    (char *) "self",(char *) "i",(char *) "j", NULL 
-  };
-  std::vector< SOMcomponent,std::allocator< SOMcomponent > > *result = 0 ;
-  
-  if (!PyArg_ParseTupleAndKeywords(args,kwargs,(char *)"OOO:component_set___getslice__",kwnames,&obj0,&obj1,&obj2)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_std__vectorT_SOMcomponent_std__allocatorT_SOMcomponent_t_t, 0 |  0 );
-  if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "component_set___getslice__" "', argument " "1"" of type '" "std::vector< SOMcomponent > *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "SOMcomponent___repr__" "', argument " "1"" of type '" "SOMcomponent *""'"); 
   }
-  arg1 = reinterpret_cast< std::vector< SOMcomponent > * >(argp1);
-  ecode2 = SWIG_AsVal_ptrdiff_t(obj1, &val2);
-  if (!SWIG_IsOK(ecode2)) {
-    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "component_set___getslice__" "', argument " "2"" of type '" "std::vector< SOMcomponent >::difference_type""'");
-  } 
-  arg2 = static_cast< std::vector< SOMcomponent >::difference_type >(val2);
-  ecode3 = SWIG_AsVal_ptrdiff_t(obj2, &val3);
-  if (!SWIG_IsOK(ecode3)) {
-    SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "component_set___getslice__" "', argument " "3"" of type '" "std::vector< SOMcomponent >::difference_type""'");
-  } 
-  arg3 = static_cast< std::vector< SOMcomponent >::difference_type >(val3);
+  arg1 = reinterpret_cast< SOMcomponent * >(argp1);
   {
     try {
-      try {
-        result = (std::vector< SOMcomponent,std::allocator< SOMcomponent > > *)std_vector_Sl_SOMcomponent_Sg____getslice__(arg1,arg2,arg3);
-      }
-      catch(std::out_of_range &_e) {
-        SWIG_exception_fail(SWIG_IndexError, (&_e)->what());
-      }
-      catch(std::invalid_argument &_e) {
-        SWIG_exception_fail(SWIG_ValueError, (&_e)->what());
-      }
-      
+      result = SOMcomponent___repr__(arg1);
     } 
-    /*@SWIG:C:\Apps\swigwin-3.0.12\Lib\typemaps\exception.swg,58,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
+    /*@SWIG:/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/swig/data/share/swig/4.5.1/typemaps/exception.swg,59,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
     catch (std::invalid_argument& e) {
       SWIG_exception_fail(SWIG_ValueError, e.what() );
     } catch (std::domain_error& e) {
@@ -7526,55 +7281,47 @@ SWIGINTERN PyObject *_wrap_component_set___getslice__(PyObject *SWIGUNUSEDPARM(s
     }
     /*@SWIG@*/
   }
-  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_std__vectorT_SOMcomponent_std__allocatorT_SOMcomponent_t_t, SWIG_POINTER_OWN |  0 );
+  resultobj = SWIG_From_std_string(static_cast< std::string >(result));
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_component_set___setslice____SWIG_0(PyObject *SWIGUNUSEDPARM(self), int nobjs, PyObject **swig_obj) {
+SWIGINTERN PyObject *SOMcomponent_swigregister(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *obj = NULL;
+  if (!SWIG_Python_UnpackTuple(args, "swigregister", 1, 1, &obj)) return NULL;
+  SWIG_TypeNewClientData(SWIGTYPE_p_SOMcomponent, SWIG_NewClientData(obj));
+  return SWIG_Py_Void();
+}
+
+SWIGINTERN PyObject *SOMcomponent_swiginit(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  return SWIG_Python_InitShadowInstance(args);
+}
+
+SWIGINTERN PyObject *_wrap_component_set_iterator(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  std::vector< SOMcomponent > *arg1 = (std::vector< SOMcomponent > *) 0 ;
-  std::vector< SOMcomponent >::difference_type arg2 ;
-  std::vector< SOMcomponent >::difference_type arg3 ;
+  std::vector< SOMcomponent > *arg1 = 0 ;
+  PyObject **arg2 = 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  ptrdiff_t val2 ;
-  int ecode2 = 0 ;
-  ptrdiff_t val3 ;
-  int ecode3 = 0 ;
+  PyObject *swig_obj[1] ;
+  swig::SwigPyIterator *result = 0 ;
   
-  if ((nobjs < 3) || (nobjs > 3)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_std__vectorT_SOMcomponent_std__allocatorT_SOMcomponent_t_t, 0 |  0 );
+  arg2 = &swig_obj[0];
+  (void)self;
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_std__vectorT_SOMcomponent_t, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "component_set___setslice__" "', argument " "1"" of type '" "std::vector< SOMcomponent > *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "component_set_iterator" "', argument " "1"" of type '" "std::vector< SOMcomponent > *""'"); 
   }
   arg1 = reinterpret_cast< std::vector< SOMcomponent > * >(argp1);
-  ecode2 = SWIG_AsVal_ptrdiff_t(swig_obj[1], &val2);
-  if (!SWIG_IsOK(ecode2)) {
-    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "component_set___setslice__" "', argument " "2"" of type '" "std::vector< SOMcomponent >::difference_type""'");
-  } 
-  arg2 = static_cast< std::vector< SOMcomponent >::difference_type >(val2);
-  ecode3 = SWIG_AsVal_ptrdiff_t(swig_obj[2], &val3);
-  if (!SWIG_IsOK(ecode3)) {
-    SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "component_set___setslice__" "', argument " "3"" of type '" "std::vector< SOMcomponent >::difference_type""'");
-  } 
-  arg3 = static_cast< std::vector< SOMcomponent >::difference_type >(val3);
   {
     try {
-      try {
-        std_vector_Sl_SOMcomponent_Sg____setslice____SWIG_0(arg1,arg2,arg3);
-      }
-      catch(std::out_of_range &_e) {
-        SWIG_exception_fail(SWIG_IndexError, (&_e)->what());
-      }
-      catch(std::invalid_argument &_e) {
-        SWIG_exception_fail(SWIG_ValueError, (&_e)->what());
-      }
-      
+      result = (swig::SwigPyIterator *)std_vector_Sl_SOMcomponent_Sg__iterator(arg1,arg2);
     } 
-    /*@SWIG:C:\Apps\swigwin-3.0.12\Lib\typemaps\exception.swg,58,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
+    /*@SWIG:/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/swig/data/share/swig/4.5.1/typemaps/exception.swg,59,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
     catch (std::invalid_argument& e) {
       SWIG_exception_fail(SWIG_ValueError, e.what() );
     } catch (std::domain_error& e) {
@@ -7592,68 +7339,35 @@ SWIGINTERN PyObject *_wrap_component_set___setslice____SWIG_0(PyObject *SWIGUNUS
     }
     /*@SWIG@*/
   }
-  resultobj = SWIG_Py_Void();
+  if (!result) SWIG_fail;
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_swig__SwigPyIterator, SWIG_POINTER_OWN);
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_component_set___setslice____SWIG_1(PyObject *SWIGUNUSEDPARM(self), int nobjs, PyObject **swig_obj) {
+SWIGINTERN PyObject *_wrap_component_set___bool__(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  std::vector< SOMcomponent > *arg1 = (std::vector< SOMcomponent > *) 0 ;
-  std::vector< SOMcomponent >::difference_type arg2 ;
-  std::vector< SOMcomponent >::difference_type arg3 ;
-  std::vector< SOMcomponent,std::allocator< SOMcomponent > > *arg4 = 0 ;
+  std::vector< SOMcomponent > *arg1 = 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  ptrdiff_t val2 ;
-  int ecode2 = 0 ;
-  ptrdiff_t val3 ;
-  int ecode3 = 0 ;
-  int res4 = SWIG_OLDOBJ ;
+  PyObject *swig_obj[1] ;
+  bool result;
   
-  if ((nobjs < 4) || (nobjs > 4)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_std__vectorT_SOMcomponent_std__allocatorT_SOMcomponent_t_t, 0 |  0 );
+  (void)self;
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_std__vectorT_SOMcomponent_t, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "component_set___setslice__" "', argument " "1"" of type '" "std::vector< SOMcomponent > *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "component_set___bool__" "', argument " "1"" of type '" "std::vector< SOMcomponent > const *""'"); 
   }
   arg1 = reinterpret_cast< std::vector< SOMcomponent > * >(argp1);
-  ecode2 = SWIG_AsVal_ptrdiff_t(swig_obj[1], &val2);
-  if (!SWIG_IsOK(ecode2)) {
-    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "component_set___setslice__" "', argument " "2"" of type '" "std::vector< SOMcomponent >::difference_type""'");
-  } 
-  arg2 = static_cast< std::vector< SOMcomponent >::difference_type >(val2);
-  ecode3 = SWIG_AsVal_ptrdiff_t(swig_obj[2], &val3);
-  if (!SWIG_IsOK(ecode3)) {
-    SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "component_set___setslice__" "', argument " "3"" of type '" "std::vector< SOMcomponent >::difference_type""'");
-  } 
-  arg3 = static_cast< std::vector< SOMcomponent >::difference_type >(val3);
-  {
-    std::vector< SOMcomponent,std::allocator< SOMcomponent > > *ptr = (std::vector< SOMcomponent,std::allocator< SOMcomponent > > *)0;
-    res4 = swig::asptr(swig_obj[3], &ptr);
-    if (!SWIG_IsOK(res4)) {
-      SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "component_set___setslice__" "', argument " "4"" of type '" "std::vector< SOMcomponent,std::allocator< SOMcomponent > > const &""'"); 
-    }
-    if (!ptr) {
-      SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "component_set___setslice__" "', argument " "4"" of type '" "std::vector< SOMcomponent,std::allocator< SOMcomponent > > const &""'"); 
-    }
-    arg4 = ptr;
-  }
   {
     try {
-      try {
-        std_vector_Sl_SOMcomponent_Sg____setslice____SWIG_1(arg1,arg2,arg3,(std::vector< SOMcomponent,std::allocator< SOMcomponent > > const &)*arg4);
-      }
-      catch(std::out_of_range &_e) {
-        SWIG_exception_fail(SWIG_IndexError, (&_e)->what());
-      }
-      catch(std::invalid_argument &_e) {
-        SWIG_exception_fail(SWIG_ValueError, (&_e)->what());
-      }
-      
+      result = (bool)std_vector_Sl_SOMcomponent_Sg____bool__((std::vector< SOMcomponent > const *)arg1);
     } 
-    /*@SWIG:C:\Apps\swigwin-3.0.12\Lib\typemaps\exception.swg,58,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
+    /*@SWIG:/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/swig/data/share/swig/4.5.1/typemaps/exception.swg,59,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
     catch (std::invalid_argument& e) {
       SWIG_exception_fail(SWIG_ValueError, e.what() );
     } catch (std::domain_error& e) {
@@ -7671,180 +7385,34 @@ SWIGINTERN PyObject *_wrap_component_set___setslice____SWIG_1(PyObject *SWIGUNUS
     }
     /*@SWIG@*/
   }
-  resultobj = SWIG_Py_Void();
-  if (SWIG_IsNewObj(res4)) delete arg4;
+  resultobj = SWIG_From_bool(static_cast< bool >(result));
   return resultobj;
 fail:
-  if (SWIG_IsNewObj(res4)) delete arg4;
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_component_set___setslice__(PyObject *self, PyObject *args) {
-  Py_ssize_t argc;
-  PyObject *argv[5] = {
-    0
-  };
-  
-  if (!(argc = SWIG_Python_UnpackTuple(args,"component_set___setslice__",0,4,argv))) SWIG_fail;
-  --argc;
-  {
-    unsigned long _index = 0;
-    SWIG_TypeRank _rank = 0; 
-    if (argc == 3) {
-      SWIG_TypeRank _ranki = 0;
-      SWIG_TypeRank _rankm = 0;
-      SWIG_TypeRank _pi = 1;
-      int _v = 0;
-      {
-        int res = swig::asptr(argv[0], (std::vector< SOMcomponent,std::allocator< SOMcomponent > >**)(0));
-        _v = SWIG_CheckState(res);
-      }
-      if (!_v) goto check_1;
-      _ranki += _v*_pi;
-      _rankm += _pi;
-      _pi *= SWIG_MAXCASTRANK;
-      {
-        {
-          int res = SWIG_AsVal_ptrdiff_t(argv[1], NULL);
-          _v = SWIG_CheckState(res);
-        }
-      }
-      if (!_v) goto check_1;
-      _ranki += _v*_pi;
-      _rankm += _pi;
-      _pi *= SWIG_MAXCASTRANK;
-      {
-        {
-          int res = SWIG_AsVal_ptrdiff_t(argv[2], NULL);
-          _v = SWIG_CheckState(res);
-        }
-      }
-      if (!_v) goto check_1;
-      _ranki += _v*_pi;
-      _rankm += _pi;
-      _pi *= SWIG_MAXCASTRANK;
-      if (!_index || (_ranki < _rank)) {
-        _rank = _ranki; _index = 1;
-        if (_rank == _rankm) goto dispatch;
-      }
-    }
-  check_1:
-    
-    if (argc == 4) {
-      SWIG_TypeRank _ranki = 0;
-      SWIG_TypeRank _rankm = 0;
-      SWIG_TypeRank _pi = 1;
-      int _v = 0;
-      {
-        int res = swig::asptr(argv[0], (std::vector< SOMcomponent,std::allocator< SOMcomponent > >**)(0));
-        _v = SWIG_CheckState(res);
-      }
-      if (!_v) goto check_2;
-      _ranki += _v*_pi;
-      _rankm += _pi;
-      _pi *= SWIG_MAXCASTRANK;
-      {
-        {
-          int res = SWIG_AsVal_ptrdiff_t(argv[1], NULL);
-          _v = SWIG_CheckState(res);
-        }
-      }
-      if (!_v) goto check_2;
-      _ranki += _v*_pi;
-      _rankm += _pi;
-      _pi *= SWIG_MAXCASTRANK;
-      {
-        {
-          int res = SWIG_AsVal_ptrdiff_t(argv[2], NULL);
-          _v = SWIG_CheckState(res);
-        }
-      }
-      if (!_v) goto check_2;
-      _ranki += _v*_pi;
-      _rankm += _pi;
-      _pi *= SWIG_MAXCASTRANK;
-      {
-        int res = swig::asptr(argv[3], (std::vector< SOMcomponent,std::allocator< SOMcomponent > >**)(0));
-        _v = SWIG_CheckState(res);
-      }
-      if (!_v) goto check_2;
-      _ranki += _v*_pi;
-      _rankm += _pi;
-      _pi *= SWIG_MAXCASTRANK;
-      if (!_index || (_ranki < _rank)) {
-        _rank = _ranki; _index = 2;
-        if (_rank == _rankm) goto dispatch;
-      }
-    }
-  check_2:
-    
-  dispatch:
-    switch(_index) {
-    case 1:
-      return _wrap_component_set___setslice____SWIG_0(self, argc, argv);
-    case 2:
-      return _wrap_component_set___setslice____SWIG_1(self, argc, argv);
-    }
-  }
-  
-fail:
-  SWIG_SetErrorMsg(PyExc_NotImplementedError,"Wrong number or type of arguments for overloaded function 'component_set___setslice__'.\n"
-    "  Possible C/C++ prototypes are:\n"
-    "    std::vector< SOMcomponent >::__setslice__(std::vector< SOMcomponent >::difference_type,std::vector< SOMcomponent >::difference_type)\n"
-    "    std::vector< SOMcomponent >::__setslice__(std::vector< SOMcomponent >::difference_type,std::vector< SOMcomponent >::difference_type,std::vector< SOMcomponent,std::allocator< SOMcomponent > > const &)\n");
-  return 0;
-}
-
-
-SWIGINTERN PyObject *_wrap_component_set___delslice__(PyObject *SWIGUNUSEDPARM(self), PyObject *args, PyObject *kwargs) {
+SWIGINTERN PyObject *_wrap_component_set___len__(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  std::vector< SOMcomponent > *arg1 = (std::vector< SOMcomponent > *) 0 ;
-  std::vector< SOMcomponent >::difference_type arg2 ;
-  std::vector< SOMcomponent >::difference_type arg3 ;
+  std::vector< SOMcomponent > *arg1 = 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  ptrdiff_t val2 ;
-  int ecode2 = 0 ;
-  ptrdiff_t val3 ;
-  int ecode3 = 0 ;
-  PyObject * obj0 = 0 ;
-  PyObject * obj1 = 0 ;
-  PyObject * obj2 = 0 ;
-  char *  kwnames[] = {
-    (char *) "self",(char *) "i",(char *) "j", NULL 
-  };
+  PyObject *swig_obj[1] ;
+  std::vector< SOMcomponent >::size_type result;
   
-  if (!PyArg_ParseTupleAndKeywords(args,kwargs,(char *)"OOO:component_set___delslice__",kwnames,&obj0,&obj1,&obj2)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_std__vectorT_SOMcomponent_std__allocatorT_SOMcomponent_t_t, 0 |  0 );
+  (void)self;
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_std__vectorT_SOMcomponent_t, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "component_set___delslice__" "', argument " "1"" of type '" "std::vector< SOMcomponent > *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "component_set___len__" "', argument " "1"" of type '" "std::vector< SOMcomponent > const *""'"); 
   }
   arg1 = reinterpret_cast< std::vector< SOMcomponent > * >(argp1);
-  ecode2 = SWIG_AsVal_ptrdiff_t(obj1, &val2);
-  if (!SWIG_IsOK(ecode2)) {
-    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "component_set___delslice__" "', argument " "2"" of type '" "std::vector< SOMcomponent >::difference_type""'");
-  } 
-  arg2 = static_cast< std::vector< SOMcomponent >::difference_type >(val2);
-  ecode3 = SWIG_AsVal_ptrdiff_t(obj2, &val3);
-  if (!SWIG_IsOK(ecode3)) {
-    SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "component_set___delslice__" "', argument " "3"" of type '" "std::vector< SOMcomponent >::difference_type""'");
-  } 
-  arg3 = static_cast< std::vector< SOMcomponent >::difference_type >(val3);
   {
     try {
-      try {
-        std_vector_Sl_SOMcomponent_Sg____delslice__(arg1,arg2,arg3);
-      }
-      catch(std::out_of_range &_e) {
-        SWIG_exception_fail(SWIG_IndexError, (&_e)->what());
-      }
-      catch(std::invalid_argument &_e) {
-        SWIG_exception_fail(SWIG_ValueError, (&_e)->what());
-      }
-      
+      result = std_vector_Sl_SOMcomponent_Sg____len__((std::vector< SOMcomponent > const *)arg1);
     } 
-    /*@SWIG:C:\Apps\swigwin-3.0.12\Lib\typemaps\exception.swg,58,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
+    /*@SWIG:/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/swig/data/share/swig/4.5.1/typemaps/exception.swg,59,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
     catch (std::invalid_argument& e) {
       SWIG_exception_fail(SWIG_ValueError, e.what() );
     } catch (std::domain_error& e) {
@@ -7862,24 +7430,25 @@ SWIGINTERN PyObject *_wrap_component_set___delslice__(PyObject *SWIGUNUSEDPARM(s
     }
     /*@SWIG@*/
   }
-  resultobj = SWIG_Py_Void();
+  resultobj = SWIG_From_size_t(static_cast< size_t >(result));
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_component_set___delitem____SWIG_0(PyObject *SWIGUNUSEDPARM(self), int nobjs, PyObject **swig_obj) {
+SWIGINTERN PyObject *_wrap_component_set___delitem____SWIG_0(PyObject *self, Py_ssize_t nobjs, PyObject **swig_obj) {
   PyObject *resultobj = 0;
-  std::vector< SOMcomponent > *arg1 = (std::vector< SOMcomponent > *) 0 ;
+  std::vector< SOMcomponent > *arg1 = 0 ;
   std::vector< SOMcomponent >::difference_type arg2 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   ptrdiff_t val2 ;
   int ecode2 = 0 ;
   
+  (void)self;
   if ((nobjs < 2) || (nobjs > 2)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_std__vectorT_SOMcomponent_std__allocatorT_SOMcomponent_t_t, 0 |  0 );
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_std__vectorT_SOMcomponent_t, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "component_set___delitem__" "', argument " "1"" of type '" "std::vector< SOMcomponent > *""'"); 
   }
@@ -7892,17 +7461,14 @@ SWIGINTERN PyObject *_wrap_component_set___delitem____SWIG_0(PyObject *SWIGUNUSE
   {
     try {
       try {
-        std_vector_Sl_SOMcomponent_Sg____delitem____SWIG_0(arg1,arg2);
-      }
-      catch(std::out_of_range &_e) {
+        std_vector_Sl_SOMcomponent_Sg____delitem____SWIG_0(arg1,SWIG_STD_MOVE(*(&arg2)));
+      } catch(std::out_of_range &_e) {
         SWIG_exception_fail(SWIG_IndexError, (&_e)->what());
-      }
-      catch(std::invalid_argument &_e) {
+      } catch(std::invalid_argument &_e) {
         SWIG_exception_fail(SWIG_ValueError, (&_e)->what());
       }
-      
     } 
-    /*@SWIG:C:\Apps\swigwin-3.0.12\Lib\typemaps\exception.swg,58,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
+    /*@SWIG:/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/swig/data/share/swig/4.5.1/typemaps/exception.swg,59,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
     catch (std::invalid_argument& e) {
       SWIG_exception_fail(SWIG_ValueError, e.what() );
     } catch (std::domain_error& e) {
@@ -7927,40 +7493,38 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_component_set___getitem____SWIG_0(PyObject *SWIGUNUSEDPARM(self), int nobjs, PyObject **swig_obj) {
+SWIGINTERN PyObject *_wrap_component_set___getitem____SWIG_0(PyObject *self, Py_ssize_t nobjs, PyObject **swig_obj) {
   PyObject *resultobj = 0;
-  std::vector< SOMcomponent > *arg1 = (std::vector< SOMcomponent > *) 0 ;
-  PySliceObject *arg2 = (PySliceObject *) 0 ;
+  std::vector< SOMcomponent > *arg1 = 0 ;
+  SWIGPY_SLICEOBJECT *arg2 = 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   std::vector< SOMcomponent,std::allocator< SOMcomponent > > *result = 0 ;
   
+  (void)self;
   if ((nobjs < 2) || (nobjs > 2)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_std__vectorT_SOMcomponent_std__allocatorT_SOMcomponent_t_t, 0 |  0 );
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_std__vectorT_SOMcomponent_t, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "component_set___getitem__" "', argument " "1"" of type '" "std::vector< SOMcomponent > *""'"); 
   }
   arg1 = reinterpret_cast< std::vector< SOMcomponent > * >(argp1);
   {
     if (!PySlice_Check(swig_obj[1])) {
-      SWIG_exception_fail(SWIG_ArgError(SWIG_TypeError), "in method '" "component_set___getitem__" "', argument " "2"" of type '" "PySliceObject *""'");
+      SWIG_exception_fail(SWIG_ArgError(SWIG_TypeError), "in method '" "component_set___getitem__" "', argument " "2"" of type '" "SWIGPY_SLICEOBJECT *""'");
     }
-    arg2 = (PySliceObject *) swig_obj[1];
+    arg2 = (SWIGPY_SLICEOBJECT *) swig_obj[1];
   }
   {
     try {
       try {
         result = (std::vector< SOMcomponent,std::allocator< SOMcomponent > > *)std_vector_Sl_SOMcomponent_Sg____getitem____SWIG_0(arg1,arg2);
-      }
-      catch(std::out_of_range &_e) {
+      } catch(std::out_of_range &_e) {
         SWIG_exception_fail(SWIG_IndexError, (&_e)->what());
-      }
-      catch(std::invalid_argument &_e) {
+      } catch(std::invalid_argument &_e) {
         SWIG_exception_fail(SWIG_ValueError, (&_e)->what());
       }
-      
     } 
-    /*@SWIG:C:\Apps\swigwin-3.0.12\Lib\typemaps\exception.swg,58,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
+    /*@SWIG:/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/swig/data/share/swig/4.5.1/typemaps/exception.swg,59,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
     catch (std::invalid_argument& e) {
       SWIG_exception_fail(SWIG_ValueError, e.what() );
     } catch (std::domain_error& e) {
@@ -7978,33 +7542,34 @@ SWIGINTERN PyObject *_wrap_component_set___getitem____SWIG_0(PyObject *SWIGUNUSE
     }
     /*@SWIG@*/
   }
-  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_std__vectorT_SOMcomponent_std__allocatorT_SOMcomponent_t_t, SWIG_POINTER_OWN |  0 );
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_std__vectorT_SOMcomponent_t, SWIG_POINTER_OWN |  0 );
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_component_set___setitem____SWIG_0(PyObject *SWIGUNUSEDPARM(self), int nobjs, PyObject **swig_obj) {
+SWIGINTERN PyObject *_wrap_component_set___setitem____SWIG_0(PyObject *self, Py_ssize_t nobjs, PyObject **swig_obj) {
   PyObject *resultobj = 0;
-  std::vector< SOMcomponent > *arg1 = (std::vector< SOMcomponent > *) 0 ;
-  PySliceObject *arg2 = (PySliceObject *) 0 ;
+  std::vector< SOMcomponent > *arg1 = 0 ;
+  SWIGPY_SLICEOBJECT *arg2 = 0 ;
   std::vector< SOMcomponent,std::allocator< SOMcomponent > > *arg3 = 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   int res3 = SWIG_OLDOBJ ;
   
+  (void)self;
   if ((nobjs < 3) || (nobjs > 3)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_std__vectorT_SOMcomponent_std__allocatorT_SOMcomponent_t_t, 0 |  0 );
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_std__vectorT_SOMcomponent_t, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "component_set___setitem__" "', argument " "1"" of type '" "std::vector< SOMcomponent > *""'"); 
   }
   arg1 = reinterpret_cast< std::vector< SOMcomponent > * >(argp1);
   {
     if (!PySlice_Check(swig_obj[1])) {
-      SWIG_exception_fail(SWIG_ArgError(SWIG_TypeError), "in method '" "component_set___setitem__" "', argument " "2"" of type '" "PySliceObject *""'");
+      SWIG_exception_fail(SWIG_ArgError(SWIG_TypeError), "in method '" "component_set___setitem__" "', argument " "2"" of type '" "SWIGPY_SLICEOBJECT *""'");
     }
-    arg2 = (PySliceObject *) swig_obj[1];
+    arg2 = (SWIGPY_SLICEOBJECT *) swig_obj[1];
   }
   {
     std::vector< SOMcomponent,std::allocator< SOMcomponent > > *ptr = (std::vector< SOMcomponent,std::allocator< SOMcomponent > > *)0;
@@ -8013,7 +7578,7 @@ SWIGINTERN PyObject *_wrap_component_set___setitem____SWIG_0(PyObject *SWIGUNUSE
       SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "component_set___setitem__" "', argument " "3"" of type '" "std::vector< SOMcomponent,std::allocator< SOMcomponent > > const &""'"); 
     }
     if (!ptr) {
-      SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "component_set___setitem__" "', argument " "3"" of type '" "std::vector< SOMcomponent,std::allocator< SOMcomponent > > const &""'"); 
+      SWIG_exception_fail(SWIG_NullReferenceError, "invalid null reference " "in method '" "component_set___setitem__" "', argument " "3"" of type '" "std::vector< SOMcomponent,std::allocator< SOMcomponent > > const &""'"); 
     }
     arg3 = ptr;
   }
@@ -8021,16 +7586,13 @@ SWIGINTERN PyObject *_wrap_component_set___setitem____SWIG_0(PyObject *SWIGUNUSE
     try {
       try {
         std_vector_Sl_SOMcomponent_Sg____setitem____SWIG_0(arg1,arg2,(std::vector< SOMcomponent,std::allocator< SOMcomponent > > const &)*arg3);
-      }
-      catch(std::out_of_range &_e) {
+      } catch(std::out_of_range &_e) {
         SWIG_exception_fail(SWIG_IndexError, (&_e)->what());
-      }
-      catch(std::invalid_argument &_e) {
+      } catch(std::invalid_argument &_e) {
         SWIG_exception_fail(SWIG_ValueError, (&_e)->what());
       }
-      
     } 
-    /*@SWIG:C:\Apps\swigwin-3.0.12\Lib\typemaps\exception.swg,58,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
+    /*@SWIG:/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/swig/data/share/swig/4.5.1/typemaps/exception.swg,59,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
     catch (std::invalid_argument& e) {
       SWIG_exception_fail(SWIG_ValueError, e.what() );
     } catch (std::domain_error& e) {
@@ -8057,39 +7619,37 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_component_set___setitem____SWIG_1(PyObject *SWIGUNUSEDPARM(self), int nobjs, PyObject **swig_obj) {
+SWIGINTERN PyObject *_wrap_component_set___setitem____SWIG_1(PyObject *self, Py_ssize_t nobjs, PyObject **swig_obj) {
   PyObject *resultobj = 0;
-  std::vector< SOMcomponent > *arg1 = (std::vector< SOMcomponent > *) 0 ;
-  PySliceObject *arg2 = (PySliceObject *) 0 ;
+  std::vector< SOMcomponent > *arg1 = 0 ;
+  SWIGPY_SLICEOBJECT *arg2 = 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   
+  (void)self;
   if ((nobjs < 2) || (nobjs > 2)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_std__vectorT_SOMcomponent_std__allocatorT_SOMcomponent_t_t, 0 |  0 );
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_std__vectorT_SOMcomponent_t, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "component_set___setitem__" "', argument " "1"" of type '" "std::vector< SOMcomponent > *""'"); 
   }
   arg1 = reinterpret_cast< std::vector< SOMcomponent > * >(argp1);
   {
     if (!PySlice_Check(swig_obj[1])) {
-      SWIG_exception_fail(SWIG_ArgError(SWIG_TypeError), "in method '" "component_set___setitem__" "', argument " "2"" of type '" "PySliceObject *""'");
+      SWIG_exception_fail(SWIG_ArgError(SWIG_TypeError), "in method '" "component_set___setitem__" "', argument " "2"" of type '" "SWIGPY_SLICEOBJECT *""'");
     }
-    arg2 = (PySliceObject *) swig_obj[1];
+    arg2 = (SWIGPY_SLICEOBJECT *) swig_obj[1];
   }
   {
     try {
       try {
         std_vector_Sl_SOMcomponent_Sg____setitem____SWIG_1(arg1,arg2);
-      }
-      catch(std::out_of_range &_e) {
+      } catch(std::out_of_range &_e) {
         SWIG_exception_fail(SWIG_IndexError, (&_e)->what());
-      }
-      catch(std::invalid_argument &_e) {
+      } catch(std::invalid_argument &_e) {
         SWIG_exception_fail(SWIG_ValueError, (&_e)->what());
       }
-      
     } 
-    /*@SWIG:C:\Apps\swigwin-3.0.12\Lib\typemaps\exception.swg,58,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
+    /*@SWIG:/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/swig/data/share/swig/4.5.1/typemaps/exception.swg,59,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
     catch (std::invalid_argument& e) {
       SWIG_exception_fail(SWIG_ValueError, e.what() );
     } catch (std::domain_error& e) {
@@ -8114,39 +7674,37 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_component_set___delitem____SWIG_1(PyObject *SWIGUNUSEDPARM(self), int nobjs, PyObject **swig_obj) {
+SWIGINTERN PyObject *_wrap_component_set___delitem____SWIG_1(PyObject *self, Py_ssize_t nobjs, PyObject **swig_obj) {
   PyObject *resultobj = 0;
-  std::vector< SOMcomponent > *arg1 = (std::vector< SOMcomponent > *) 0 ;
-  PySliceObject *arg2 = (PySliceObject *) 0 ;
+  std::vector< SOMcomponent > *arg1 = 0 ;
+  SWIGPY_SLICEOBJECT *arg2 = 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   
+  (void)self;
   if ((nobjs < 2) || (nobjs > 2)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_std__vectorT_SOMcomponent_std__allocatorT_SOMcomponent_t_t, 0 |  0 );
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_std__vectorT_SOMcomponent_t, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "component_set___delitem__" "', argument " "1"" of type '" "std::vector< SOMcomponent > *""'"); 
   }
   arg1 = reinterpret_cast< std::vector< SOMcomponent > * >(argp1);
   {
     if (!PySlice_Check(swig_obj[1])) {
-      SWIG_exception_fail(SWIG_ArgError(SWIG_TypeError), "in method '" "component_set___delitem__" "', argument " "2"" of type '" "PySliceObject *""'");
+      SWIG_exception_fail(SWIG_ArgError(SWIG_TypeError), "in method '" "component_set___delitem__" "', argument " "2"" of type '" "SWIGPY_SLICEOBJECT *""'");
     }
-    arg2 = (PySliceObject *) swig_obj[1];
+    arg2 = (SWIGPY_SLICEOBJECT *) swig_obj[1];
   }
   {
     try {
       try {
         std_vector_Sl_SOMcomponent_Sg____delitem____SWIG_1(arg1,arg2);
-      }
-      catch(std::out_of_range &_e) {
+      } catch(std::out_of_range &_e) {
         SWIG_exception_fail(SWIG_IndexError, (&_e)->what());
-      }
-      catch(std::invalid_argument &_e) {
+      } catch(std::invalid_argument &_e) {
         SWIG_exception_fail(SWIG_ValueError, (&_e)->what());
       }
-      
     } 
-    /*@SWIG:C:\Apps\swigwin-3.0.12\Lib\typemaps\exception.swg,58,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
+    /*@SWIG:/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/swig/data/share/swig/4.5.1/typemaps/exception.swg,59,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
     catch (std::invalid_argument& e) {
       SWIG_exception_fail(SWIG_ValueError, e.what() );
     } catch (std::domain_error& e) {
@@ -8177,7 +7735,7 @@ SWIGINTERN PyObject *_wrap_component_set___delitem__(PyObject *self, PyObject *a
     0
   };
   
-  if (!(argc = SWIG_Python_UnpackTuple(args,"component_set___delitem__",0,2,argv))) SWIG_fail;
+  if (!(argc = SWIG_Python_UnpackTuple(args, "component_set___delitem__", 0, 2, argv))) SWIG_fail;
   --argc;
   {
     unsigned long _index = 0;
@@ -8251,17 +7809,17 @@ SWIGINTERN PyObject *_wrap_component_set___delitem__(PyObject *self, PyObject *a
   }
   
 fail:
-  SWIG_SetErrorMsg(PyExc_NotImplementedError,"Wrong number or type of arguments for overloaded function 'component_set___delitem__'.\n"
+  SWIG_Python_RaiseOrModifyTypeError("Wrong number or type of arguments for overloaded function 'component_set___delitem__'.\n"
     "  Possible C/C++ prototypes are:\n"
     "    std::vector< SOMcomponent >::__delitem__(std::vector< SOMcomponent >::difference_type)\n"
-    "    std::vector< SOMcomponent >::__delitem__(PySliceObject *)\n");
+    "    std::vector< SOMcomponent >::__delitem__(SWIGPY_SLICEOBJECT *)\n");
   return 0;
 }
 
 
-SWIGINTERN PyObject *_wrap_component_set___getitem____SWIG_1(PyObject *SWIGUNUSEDPARM(self), int nobjs, PyObject **swig_obj) {
+SWIGINTERN PyObject *_wrap_component_set___getitem____SWIG_1(PyObject *self, Py_ssize_t nobjs, PyObject **swig_obj) {
   PyObject *resultobj = 0;
-  std::vector< SOMcomponent > *arg1 = (std::vector< SOMcomponent > *) 0 ;
+  std::vector< SOMcomponent > *arg1 = 0 ;
   std::vector< SOMcomponent >::difference_type arg2 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
@@ -8269,8 +7827,9 @@ SWIGINTERN PyObject *_wrap_component_set___getitem____SWIG_1(PyObject *SWIGUNUSE
   int ecode2 = 0 ;
   std::vector< SOMcomponent >::value_type *result = 0 ;
   
+  (void)self;
   if ((nobjs < 2) || (nobjs > 2)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_std__vectorT_SOMcomponent_std__allocatorT_SOMcomponent_t_t, 0 |  0 );
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_std__vectorT_SOMcomponent_t, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "component_set___getitem__" "', argument " "1"" of type '" "std::vector< SOMcomponent > const *""'"); 
   }
@@ -8283,14 +7842,12 @@ SWIGINTERN PyObject *_wrap_component_set___getitem____SWIG_1(PyObject *SWIGUNUSE
   {
     try {
       try {
-        result = (std::vector< SOMcomponent >::value_type *) &std_vector_Sl_SOMcomponent_Sg____getitem____SWIG_1((std::vector< SOMcomponent > const *)arg1,arg2);
-      }
-      catch(std::out_of_range &_e) {
+        result = (std::vector< SOMcomponent >::value_type *) &std_vector_Sl_SOMcomponent_Sg____getitem____SWIG_1((std::vector< SOMcomponent > const *)arg1,SWIG_STD_MOVE(*(&arg2)));
+      } catch(std::out_of_range &_e) {
         SWIG_exception_fail(SWIG_IndexError, (&_e)->what());
       }
-      
     } 
-    /*@SWIG:C:\Apps\swigwin-3.0.12\Lib\typemaps\exception.swg,58,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
+    /*@SWIG:/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/swig/data/share/swig/4.5.1/typemaps/exception.swg,59,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
     catch (std::invalid_argument& e) {
       SWIG_exception_fail(SWIG_ValueError, e.what() );
     } catch (std::domain_error& e) {
@@ -8309,6 +7866,9 @@ SWIGINTERN PyObject *_wrap_component_set___getitem____SWIG_1(PyObject *SWIGUNUSE
     /*@SWIG@*/
   }
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_SOMcomponent, 0 |  0 );
+  if (!swig::container_owner<swig::traits<std::vector< SOMcomponent >::value_type>::category>::back_reference(resultobj, swig_obj[0]) && PyErr_Occurred()) {
+    SWIG_fail;
+  }
   return resultobj;
 fail:
   return NULL;
@@ -8321,7 +7881,7 @@ SWIGINTERN PyObject *_wrap_component_set___getitem__(PyObject *self, PyObject *a
     0
   };
   
-  if (!(argc = SWIG_Python_UnpackTuple(args,"component_set___getitem__",0,2,argv))) SWIG_fail;
+  if (!(argc = SWIG_Python_UnpackTuple(args, "component_set___getitem__", 0, 2, argv))) SWIG_fail;
   --argc;
   {
     unsigned long _index = 0;
@@ -8395,17 +7955,17 @@ SWIGINTERN PyObject *_wrap_component_set___getitem__(PyObject *self, PyObject *a
   }
   
 fail:
-  SWIG_SetErrorMsg(PyExc_NotImplementedError,"Wrong number or type of arguments for overloaded function 'component_set___getitem__'.\n"
+  SWIG_Python_RaiseOrModifyTypeError("Wrong number or type of arguments for overloaded function 'component_set___getitem__'.\n"
     "  Possible C/C++ prototypes are:\n"
-    "    std::vector< SOMcomponent >::__getitem__(PySliceObject *)\n"
+    "    std::vector< SOMcomponent >::__getitem__(SWIGPY_SLICEOBJECT *)\n"
     "    std::vector< SOMcomponent >::__getitem__(std::vector< SOMcomponent >::difference_type) const\n");
   return 0;
 }
 
 
-SWIGINTERN PyObject *_wrap_component_set___setitem____SWIG_2(PyObject *SWIGUNUSEDPARM(self), int nobjs, PyObject **swig_obj) {
+SWIGINTERN PyObject *_wrap_component_set___setitem____SWIG_2(PyObject *self, Py_ssize_t nobjs, PyObject **swig_obj) {
   PyObject *resultobj = 0;
-  std::vector< SOMcomponent > *arg1 = (std::vector< SOMcomponent > *) 0 ;
+  std::vector< SOMcomponent > *arg1 = 0 ;
   std::vector< SOMcomponent >::difference_type arg2 ;
   std::vector< SOMcomponent >::value_type *arg3 = 0 ;
   void *argp1 = 0 ;
@@ -8415,8 +7975,9 @@ SWIGINTERN PyObject *_wrap_component_set___setitem____SWIG_2(PyObject *SWIGUNUSE
   void *argp3 = 0 ;
   int res3 = 0 ;
   
+  (void)self;
   if ((nobjs < 3) || (nobjs > 3)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_std__vectorT_SOMcomponent_std__allocatorT_SOMcomponent_t_t, 0 |  0 );
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_std__vectorT_SOMcomponent_t, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "component_set___setitem__" "', argument " "1"" of type '" "std::vector< SOMcomponent > *""'"); 
   }
@@ -8431,20 +7992,18 @@ SWIGINTERN PyObject *_wrap_component_set___setitem____SWIG_2(PyObject *SWIGUNUSE
     SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "component_set___setitem__" "', argument " "3"" of type '" "std::vector< SOMcomponent >::value_type const &""'"); 
   }
   if (!argp3) {
-    SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "component_set___setitem__" "', argument " "3"" of type '" "std::vector< SOMcomponent >::value_type const &""'"); 
+    SWIG_exception_fail(SWIG_NullReferenceError, "invalid null reference " "in method '" "component_set___setitem__" "', argument " "3"" of type '" "std::vector< SOMcomponent >::value_type const &""'"); 
   }
   arg3 = reinterpret_cast< std::vector< SOMcomponent >::value_type * >(argp3);
   {
     try {
       try {
-        std_vector_Sl_SOMcomponent_Sg____setitem____SWIG_2(arg1,arg2,(SOMcomponent const &)*arg3);
-      }
-      catch(std::out_of_range &_e) {
+        std_vector_Sl_SOMcomponent_Sg____setitem____SWIG_2(arg1,SWIG_STD_MOVE(*(&arg2)),(SOMcomponent const &)*arg3);
+      } catch(std::out_of_range &_e) {
         SWIG_exception_fail(SWIG_IndexError, (&_e)->what());
       }
-      
     } 
-    /*@SWIG:C:\Apps\swigwin-3.0.12\Lib\typemaps\exception.swg,58,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
+    /*@SWIG:/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/swig/data/share/swig/4.5.1/typemaps/exception.swg,59,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
     catch (std::invalid_argument& e) {
       SWIG_exception_fail(SWIG_ValueError, e.what() );
     } catch (std::domain_error& e) {
@@ -8475,7 +8034,7 @@ SWIGINTERN PyObject *_wrap_component_set___setitem__(PyObject *self, PyObject *a
     0
   };
   
-  if (!(argc = SWIG_Python_UnpackTuple(args,"component_set___setitem__",0,3,argv))) SWIG_fail;
+  if (!(argc = SWIG_Python_UnpackTuple(args, "component_set___setitem__", 0, 3, argv))) SWIG_fail;
   --argc;
   {
     unsigned long _index = 0;
@@ -8570,7 +8129,7 @@ SWIGINTERN PyObject *_wrap_component_set___setitem__(PyObject *self, PyObject *a
       _rankm += _pi;
       _pi *= SWIG_MAXCASTRANK;
       {
-        int res = SWIG_ConvertPtr(argv[2], 0, SWIGTYPE_p_SOMcomponent, 0);
+        int res = SWIG_ConvertPtr(argv[2], 0, SWIGTYPE_p_SOMcomponent, SWIG_POINTER_NO_NULL | 0);
         _v = SWIG_CheckState(res);
       }
       if (!_v) goto check_3;
@@ -8596,26 +8155,27 @@ SWIGINTERN PyObject *_wrap_component_set___setitem__(PyObject *self, PyObject *a
   }
   
 fail:
-  SWIG_SetErrorMsg(PyExc_NotImplementedError,"Wrong number or type of arguments for overloaded function 'component_set___setitem__'.\n"
+  SWIG_Python_RaiseOrModifyTypeError("Wrong number or type of arguments for overloaded function 'component_set___setitem__'.\n"
     "  Possible C/C++ prototypes are:\n"
-    "    std::vector< SOMcomponent >::__setitem__(PySliceObject *,std::vector< SOMcomponent,std::allocator< SOMcomponent > > const &)\n"
-    "    std::vector< SOMcomponent >::__setitem__(PySliceObject *)\n"
+    "    std::vector< SOMcomponent >::__setitem__(SWIGPY_SLICEOBJECT *,std::vector< SOMcomponent,std::allocator< SOMcomponent > > const &)\n"
+    "    std::vector< SOMcomponent >::__setitem__(SWIGPY_SLICEOBJECT *)\n"
     "    std::vector< SOMcomponent >::__setitem__(std::vector< SOMcomponent >::difference_type,std::vector< SOMcomponent >::value_type const &)\n");
   return 0;
 }
 
 
-SWIGINTERN PyObject *_wrap_component_set_pop(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_component_set_pop(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  std::vector< SOMcomponent > *arg1 = (std::vector< SOMcomponent > *) 0 ;
+  std::vector< SOMcomponent > *arg1 = 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   PyObject *swig_obj[1] ;
-  std::vector< SOMcomponent >::value_type result;
+  SwigValueWrapper< SOMcomponent > result;
   
+  (void)self;
   if (!args) SWIG_fail;
   swig_obj[0] = args;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_std__vectorT_SOMcomponent_std__allocatorT_SOMcomponent_t_t, 0 |  0 );
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_std__vectorT_SOMcomponent_t, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "component_set_pop" "', argument " "1"" of type '" "std::vector< SOMcomponent > *""'"); 
   }
@@ -8624,13 +8184,11 @@ SWIGINTERN PyObject *_wrap_component_set_pop(PyObject *SWIGUNUSEDPARM(self), PyO
     try {
       try {
         result = std_vector_Sl_SOMcomponent_Sg__pop(arg1);
-      }
-      catch(std::out_of_range &_e) {
+      } catch(std::out_of_range &_e) {
         SWIG_exception_fail(SWIG_IndexError, (&_e)->what());
       }
-      
     } 
-    /*@SWIG:C:\Apps\swigwin-3.0.12\Lib\typemaps\exception.swg,58,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
+    /*@SWIG:/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/swig/data/share/swig/4.5.1/typemaps/exception.swg,59,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
     catch (std::invalid_argument& e) {
       SWIG_exception_fail(SWIG_ValueError, e.what() );
     } catch (std::domain_error& e) {
@@ -8648,16 +8206,16 @@ SWIGINTERN PyObject *_wrap_component_set_pop(PyObject *SWIGUNUSEDPARM(self), PyO
     }
     /*@SWIG@*/
   }
-  resultobj = SWIG_NewPointerObj((new std::vector< SOMcomponent >::value_type(static_cast< const std::vector< SOMcomponent >::value_type& >(result))), SWIGTYPE_p_SOMcomponent, SWIG_POINTER_OWN |  0 );
+  resultobj = SWIG_NewPointerObj((new std::vector< SOMcomponent >::value_type(result)), SWIGTYPE_p_SOMcomponent, SWIG_POINTER_OWN |  0 );
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_component_set_append(PyObject *SWIGUNUSEDPARM(self), PyObject *args, PyObject *kwargs) {
+SWIGINTERN PyObject *_wrap_component_set_append(PyObject *self, PyObject *args, PyObject *kwargs) {
   PyObject *resultobj = 0;
-  std::vector< SOMcomponent > *arg1 = (std::vector< SOMcomponent > *) 0 ;
+  std::vector< SOMcomponent > *arg1 = 0 ;
   std::vector< SOMcomponent >::value_type *arg2 = 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
@@ -8665,12 +8223,13 @@ SWIGINTERN PyObject *_wrap_component_set_append(PyObject *SWIGUNUSEDPARM(self),
   int res2 = 0 ;
   PyObject * obj0 = 0 ;
   PyObject * obj1 = 0 ;
-  char *  kwnames[] = {
-    (char *) "self",(char *) "x", NULL 
+  char * kwnames[] = {
+    (char *)"self",  (char *)"x",  NULL 
   };
   
-  if (!PyArg_ParseTupleAndKeywords(args,kwargs,(char *)"OO:component_set_append",kwnames,&obj0,&obj1)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_std__vectorT_SOMcomponent_std__allocatorT_SOMcomponent_t_t, 0 |  0 );
+  (void)self;
+  if (!PyArg_ParseTupleAndKeywords(args, kwargs, "OO:component_set_append", kwnames, &obj0, &obj1)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_std__vectorT_SOMcomponent_t, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "component_set_append" "', argument " "1"" of type '" "std::vector< SOMcomponent > *""'"); 
   }
@@ -8680,14 +8239,14 @@ SWIGINTERN PyObject *_wrap_component_set_append(PyObject *SWIGUNUSEDPARM(self),
     SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "component_set_append" "', argument " "2"" of type '" "std::vector< SOMcomponent >::value_type const &""'"); 
   }
   if (!argp2) {
-    SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "component_set_append" "', argument " "2"" of type '" "std::vector< SOMcomponent >::value_type const &""'"); 
+    SWIG_exception_fail(SWIG_NullReferenceError, "invalid null reference " "in method '" "component_set_append" "', argument " "2"" of type '" "std::vector< SOMcomponent >::value_type const &""'"); 
   }
   arg2 = reinterpret_cast< std::vector< SOMcomponent >::value_type * >(argp2);
   {
     try {
       std_vector_Sl_SOMcomponent_Sg__append(arg1,(SOMcomponent const &)*arg2);
     } 
-    /*@SWIG:C:\Apps\swigwin-3.0.12\Lib\typemaps\exception.swg,58,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
+    /*@SWIG:/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/swig/data/share/swig/4.5.1/typemaps/exception.swg,59,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
     catch (std::invalid_argument& e) {
       SWIG_exception_fail(SWIG_ValueError, e.what() );
     } catch (std::domain_error& e) {
@@ -8712,16 +8271,17 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_new_component_set__SWIG_0(PyObject *SWIGUNUSEDPARM(self), int nobjs, PyObject **SWIGUNUSEDPARM(swig_obj)) {
+SWIGINTERN PyObject *_wrap_new_component_set__SWIG_0(PyObject *self, Py_ssize_t nobjs, PyObject **SWIGUNUSEDPARM(swig_obj)) {
   PyObject *resultobj = 0;
   std::vector< SOMcomponent > *result = 0 ;
   
+  (void)self;
   if ((nobjs < 0) || (nobjs > 0)) SWIG_fail;
   {
     try {
       result = (std::vector< SOMcomponent > *)new std::vector< SOMcomponent >();
     } 
-    /*@SWIG:C:\Apps\swigwin-3.0.12\Lib\typemaps\exception.swg,58,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
+    /*@SWIG:/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/swig/data/share/swig/4.5.1/typemaps/exception.swg,59,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
     catch (std::invalid_argument& e) {
       SWIG_exception_fail(SWIG_ValueError, e.what() );
     } catch (std::domain_error& e) {
@@ -8739,19 +8299,20 @@ SWIGINTERN PyObject *_wrap_new_component_set__SWIG_0(PyObject *SWIGUNUSEDPARM(se
     }
     /*@SWIG@*/
   }
-  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_std__vectorT_SOMcomponent_std__allocatorT_SOMcomponent_t_t, SWIG_POINTER_NEW |  0 );
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_std__vectorT_SOMcomponent_t, SWIG_POINTER_NEW |  0 );
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_new_component_set__SWIG_1(PyObject *SWIGUNUSEDPARM(self), int nobjs, PyObject **swig_obj) {
+SWIGINTERN PyObject *_wrap_new_component_set__SWIG_1(PyObject *self, Py_ssize_t nobjs, PyObject **swig_obj) {
   PyObject *resultobj = 0;
   std::vector< SOMcomponent > *arg1 = 0 ;
   int res1 = SWIG_OLDOBJ ;
   std::vector< SOMcomponent > *result = 0 ;
   
+  (void)self;
   if ((nobjs < 1) || (nobjs > 1)) SWIG_fail;
   {
     std::vector< SOMcomponent,std::allocator< SOMcomponent > > *ptr = (std::vector< SOMcomponent,std::allocator< SOMcomponent > > *)0;
@@ -8760,7 +8321,7 @@ SWIGINTERN PyObject *_wrap_new_component_set__SWIG_1(PyObject *SWIGUNUSEDPARM(se
       SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "new_component_set" "', argument " "1"" of type '" "std::vector< SOMcomponent > const &""'"); 
     }
     if (!ptr) {
-      SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "new_component_set" "', argument " "1"" of type '" "std::vector< SOMcomponent > const &""'"); 
+      SWIG_exception_fail(SWIG_NullReferenceError, "invalid null reference " "in method '" "new_component_set" "', argument " "1"" of type '" "std::vector< SOMcomponent > const &""'"); 
     }
     arg1 = ptr;
   }
@@ -8768,7 +8329,7 @@ SWIGINTERN PyObject *_wrap_new_component_set__SWIG_1(PyObject *SWIGUNUSEDPARM(se
     try {
       result = (std::vector< SOMcomponent > *)new std::vector< SOMcomponent >((std::vector< SOMcomponent > const &)*arg1);
     } 
-    /*@SWIG:C:\Apps\swigwin-3.0.12\Lib\typemaps\exception.swg,58,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
+    /*@SWIG:/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/swig/data/share/swig/4.5.1/typemaps/exception.swg,59,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
     catch (std::invalid_argument& e) {
       SWIG_exception_fail(SWIG_ValueError, e.what() );
     } catch (std::domain_error& e) {
@@ -8786,7 +8347,7 @@ SWIGINTERN PyObject *_wrap_new_component_set__SWIG_1(PyObject *SWIGUNUSEDPARM(se
     }
     /*@SWIG@*/
   }
-  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_std__vectorT_SOMcomponent_std__allocatorT_SOMcomponent_t_t, SWIG_POINTER_NEW |  0 );
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_std__vectorT_SOMcomponent_t, SWIG_POINTER_NEW |  0 );
   if (SWIG_IsNewObj(res1)) delete arg1;
   return resultobj;
 fail:
@@ -8795,17 +8356,18 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_component_set_empty(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_component_set_empty(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  std::vector< SOMcomponent > *arg1 = (std::vector< SOMcomponent > *) 0 ;
+  std::vector< SOMcomponent > *arg1 = 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   PyObject *swig_obj[1] ;
   bool result;
   
+  (void)self;
   if (!args) SWIG_fail;
   swig_obj[0] = args;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_std__vectorT_SOMcomponent_std__allocatorT_SOMcomponent_t_t, 0 |  0 );
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_std__vectorT_SOMcomponent_t, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "component_set_empty" "', argument " "1"" of type '" "std::vector< SOMcomponent > const *""'"); 
   }
@@ -8814,7 +8376,7 @@ SWIGINTERN PyObject *_wrap_component_set_empty(PyObject *SWIGUNUSEDPARM(self), P
     try {
       result = (bool)((std::vector< SOMcomponent > const *)arg1)->empty();
     } 
-    /*@SWIG:C:\Apps\swigwin-3.0.12\Lib\typemaps\exception.swg,58,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
+    /*@SWIG:/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/swig/data/share/swig/4.5.1/typemaps/exception.swg,59,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
     catch (std::invalid_argument& e) {
       SWIG_exception_fail(SWIG_ValueError, e.what() );
     } catch (std::domain_error& e) {
@@ -8839,17 +8401,18 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_component_set_size(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_component_set_size(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  std::vector< SOMcomponent > *arg1 = (std::vector< SOMcomponent > *) 0 ;
+  std::vector< SOMcomponent > *arg1 = 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   PyObject *swig_obj[1] ;
   std::vector< SOMcomponent >::size_type result;
   
+  (void)self;
   if (!args) SWIG_fail;
   swig_obj[0] = args;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_std__vectorT_SOMcomponent_std__allocatorT_SOMcomponent_t_t, 0 |  0 );
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_std__vectorT_SOMcomponent_t, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "component_set_size" "', argument " "1"" of type '" "std::vector< SOMcomponent > const *""'"); 
   }
@@ -8858,7 +8421,7 @@ SWIGINTERN PyObject *_wrap_component_set_size(PyObject *SWIGUNUSEDPARM(self), Py
     try {
       result = ((std::vector< SOMcomponent > const *)arg1)->size();
     } 
-    /*@SWIG:C:\Apps\swigwin-3.0.12\Lib\typemaps\exception.swg,58,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
+    /*@SWIG:/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/swig/data/share/swig/4.5.1/typemaps/exception.swg,59,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
     catch (std::invalid_argument& e) {
       SWIG_exception_fail(SWIG_ValueError, e.what() );
     } catch (std::domain_error& e) {
@@ -8883,9 +8446,9 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_component_set_swap(PyObject *SWIGUNUSEDPARM(self), PyObject *args, PyObject *kwargs) {
+SWIGINTERN PyObject *_wrap_component_set_swap(PyObject *self, PyObject *args, PyObject *kwargs) {
   PyObject *resultobj = 0;
-  std::vector< SOMcomponent > *arg1 = (std::vector< SOMcomponent > *) 0 ;
+  std::vector< SOMcomponent > *arg1 = 0 ;
   std::vector< SOMcomponent > *arg2 = 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
@@ -8893,29 +8456,30 @@ SWIGINTERN PyObject *_wrap_component_set_swap(PyObject *SWIGUNUSEDPARM(self), Py
   int res2 = 0 ;
   PyObject * obj0 = 0 ;
   PyObject * obj1 = 0 ;
-  char *  kwnames[] = {
-    (char *) "self",(char *) "v", NULL 
+  char * kwnames[] = {
+    (char *)"self",  (char *)"v",  NULL 
   };
   
-  if (!PyArg_ParseTupleAndKeywords(args,kwargs,(char *)"OO:component_set_swap",kwnames,&obj0,&obj1)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_std__vectorT_SOMcomponent_std__allocatorT_SOMcomponent_t_t, 0 |  0 );
+  (void)self;
+  if (!PyArg_ParseTupleAndKeywords(args, kwargs, "OO:component_set_swap", kwnames, &obj0, &obj1)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_std__vectorT_SOMcomponent_t, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "component_set_swap" "', argument " "1"" of type '" "std::vector< SOMcomponent > *""'"); 
   }
   arg1 = reinterpret_cast< std::vector< SOMcomponent > * >(argp1);
-  res2 = SWIG_ConvertPtr(obj1, &argp2, SWIGTYPE_p_std__vectorT_SOMcomponent_std__allocatorT_SOMcomponent_t_t,  0 );
+  res2 = SWIG_ConvertPtr(obj1, &argp2, SWIGTYPE_p_std__vectorT_SOMcomponent_t,  0 );
   if (!SWIG_IsOK(res2)) {
     SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "component_set_swap" "', argument " "2"" of type '" "std::vector< SOMcomponent > &""'"); 
   }
   if (!argp2) {
-    SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "component_set_swap" "', argument " "2"" of type '" "std::vector< SOMcomponent > &""'"); 
+    SWIG_exception_fail(SWIG_NullReferenceError, "invalid null reference " "in method '" "component_set_swap" "', argument " "2"" of type '" "std::vector< SOMcomponent > &""'"); 
   }
   arg2 = reinterpret_cast< std::vector< SOMcomponent > * >(argp2);
   {
     try {
       (arg1)->swap(*arg2);
     } 
-    /*@SWIG:C:\Apps\swigwin-3.0.12\Lib\typemaps\exception.swg,58,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
+    /*@SWIG:/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/swig/data/share/swig/4.5.1/typemaps/exception.swg,59,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
     catch (std::invalid_argument& e) {
       SWIG_exception_fail(SWIG_ValueError, e.what() );
     } catch (std::domain_error& e) {
@@ -8940,17 +8504,18 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_component_set_begin(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_component_set_begin(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  std::vector< SOMcomponent > *arg1 = (std::vector< SOMcomponent > *) 0 ;
+  std::vector< SOMcomponent > *arg1 = 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   PyObject *swig_obj[1] ;
   std::vector< SOMcomponent >::iterator result;
   
+  (void)self;
   if (!args) SWIG_fail;
   swig_obj[0] = args;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_std__vectorT_SOMcomponent_std__allocatorT_SOMcomponent_t_t, 0 |  0 );
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_std__vectorT_SOMcomponent_t, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "component_set_begin" "', argument " "1"" of type '" "std::vector< SOMcomponent > *""'"); 
   }
@@ -8959,7 +8524,7 @@ SWIGINTERN PyObject *_wrap_component_set_begin(PyObject *SWIGUNUSEDPARM(self), P
     try {
       result = (arg1)->begin();
     } 
-    /*@SWIG:C:\Apps\swigwin-3.0.12\Lib\typemaps\exception.swg,58,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
+    /*@SWIG:/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/swig/data/share/swig/4.5.1/typemaps/exception.swg,59,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
     catch (std::invalid_argument& e) {
       SWIG_exception_fail(SWIG_ValueError, e.what() );
     } catch (std::domain_error& e) {
@@ -8985,17 +8550,18 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_component_set_end(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_component_set_end(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  std::vector< SOMcomponent > *arg1 = (std::vector< SOMcomponent > *) 0 ;
+  std::vector< SOMcomponent > *arg1 = 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   PyObject *swig_obj[1] ;
   std::vector< SOMcomponent >::iterator result;
   
+  (void)self;
   if (!args) SWIG_fail;
   swig_obj[0] = args;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_std__vectorT_SOMcomponent_std__allocatorT_SOMcomponent_t_t, 0 |  0 );
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_std__vectorT_SOMcomponent_t, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "component_set_end" "', argument " "1"" of type '" "std::vector< SOMcomponent > *""'"); 
   }
@@ -9004,7 +8570,7 @@ SWIGINTERN PyObject *_wrap_component_set_end(PyObject *SWIGUNUSEDPARM(self), PyO
     try {
       result = (arg1)->end();
     } 
-    /*@SWIG:C:\Apps\swigwin-3.0.12\Lib\typemaps\exception.swg,58,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
+    /*@SWIG:/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/swig/data/share/swig/4.5.1/typemaps/exception.swg,59,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
     catch (std::invalid_argument& e) {
       SWIG_exception_fail(SWIG_ValueError, e.what() );
     } catch (std::domain_error& e) {
@@ -9030,17 +8596,18 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_component_set_rbegin(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_component_set_rbegin(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  std::vector< SOMcomponent > *arg1 = (std::vector< SOMcomponent > *) 0 ;
+  std::vector< SOMcomponent > *arg1 = 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   PyObject *swig_obj[1] ;
   std::vector< SOMcomponent >::reverse_iterator result;
   
+  (void)self;
   if (!args) SWIG_fail;
   swig_obj[0] = args;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_std__vectorT_SOMcomponent_std__allocatorT_SOMcomponent_t_t, 0 |  0 );
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_std__vectorT_SOMcomponent_t, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "component_set_rbegin" "', argument " "1"" of type '" "std::vector< SOMcomponent > *""'"); 
   }
@@ -9049,7 +8616,7 @@ SWIGINTERN PyObject *_wrap_component_set_rbegin(PyObject *SWIGUNUSEDPARM(self),
     try {
       result = (arg1)->rbegin();
     } 
-    /*@SWIG:C:\Apps\swigwin-3.0.12\Lib\typemaps\exception.swg,58,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
+    /*@SWIG:/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/swig/data/share/swig/4.5.1/typemaps/exception.swg,59,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
     catch (std::invalid_argument& e) {
       SWIG_exception_fail(SWIG_ValueError, e.what() );
     } catch (std::domain_error& e) {
@@ -9075,17 +8642,18 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_component_set_rend(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_component_set_rend(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  std::vector< SOMcomponent > *arg1 = (std::vector< SOMcomponent > *) 0 ;
+  std::vector< SOMcomponent > *arg1 = 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   PyObject *swig_obj[1] ;
   std::vector< SOMcomponent >::reverse_iterator result;
   
+  (void)self;
   if (!args) SWIG_fail;
   swig_obj[0] = args;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_std__vectorT_SOMcomponent_std__allocatorT_SOMcomponent_t_t, 0 |  0 );
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_std__vectorT_SOMcomponent_t, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "component_set_rend" "', argument " "1"" of type '" "std::vector< SOMcomponent > *""'"); 
   }
@@ -9094,7 +8662,7 @@ SWIGINTERN PyObject *_wrap_component_set_rend(PyObject *SWIGUNUSEDPARM(self), Py
     try {
       result = (arg1)->rend();
     } 
-    /*@SWIG:C:\Apps\swigwin-3.0.12\Lib\typemaps\exception.swg,58,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
+    /*@SWIG:/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/swig/data/share/swig/4.5.1/typemaps/exception.swg,59,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
     catch (std::invalid_argument& e) {
       SWIG_exception_fail(SWIG_ValueError, e.what() );
     } catch (std::domain_error& e) {
@@ -9120,16 +8688,17 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_component_set_clear(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_component_set_clear(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  std::vector< SOMcomponent > *arg1 = (std::vector< SOMcomponent > *) 0 ;
+  std::vector< SOMcomponent > *arg1 = 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   PyObject *swig_obj[1] ;
   
+  (void)self;
   if (!args) SWIG_fail;
   swig_obj[0] = args;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_std__vectorT_SOMcomponent_std__allocatorT_SOMcomponent_t_t, 0 |  0 );
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_std__vectorT_SOMcomponent_t, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "component_set_clear" "', argument " "1"" of type '" "std::vector< SOMcomponent > *""'"); 
   }
@@ -9138,7 +8707,7 @@ SWIGINTERN PyObject *_wrap_component_set_clear(PyObject *SWIGUNUSEDPARM(self), P
     try {
       (arg1)->clear();
     } 
-    /*@SWIG:C:\Apps\swigwin-3.0.12\Lib\typemaps\exception.swg,58,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
+    /*@SWIG:/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/swig/data/share/swig/4.5.1/typemaps/exception.swg,59,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
     catch (std::invalid_argument& e) {
       SWIG_exception_fail(SWIG_ValueError, e.what() );
     } catch (std::domain_error& e) {
@@ -9163,17 +8732,18 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_component_set_get_allocator(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_component_set_get_allocator(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  std::vector< SOMcomponent > *arg1 = (std::vector< SOMcomponent > *) 0 ;
+  std::vector< SOMcomponent > *arg1 = 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   PyObject *swig_obj[1] ;
   SwigValueWrapper< std::allocator< SOMcomponent > > result;
   
+  (void)self;
   if (!args) SWIG_fail;
   swig_obj[0] = args;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_std__vectorT_SOMcomponent_std__allocatorT_SOMcomponent_t_t, 0 |  0 );
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_std__vectorT_SOMcomponent_t, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "component_set_get_allocator" "', argument " "1"" of type '" "std::vector< SOMcomponent > const *""'"); 
   }
@@ -9182,7 +8752,7 @@ SWIGINTERN PyObject *_wrap_component_set_get_allocator(PyObject *SWIGUNUSEDPARM(
     try {
       result = ((std::vector< SOMcomponent > const *)arg1)->get_allocator();
     } 
-    /*@SWIG:C:\Apps\swigwin-3.0.12\Lib\typemaps\exception.swg,58,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
+    /*@SWIG:/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/swig/data/share/swig/4.5.1/typemaps/exception.swg,59,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
     catch (std::invalid_argument& e) {
       SWIG_exception_fail(SWIG_ValueError, e.what() );
     } catch (std::domain_error& e) {
@@ -9200,20 +8770,21 @@ SWIGINTERN PyObject *_wrap_component_set_get_allocator(PyObject *SWIGUNUSEDPARM(
     }
     /*@SWIG@*/
   }
-  resultobj = SWIG_NewPointerObj((new std::vector< SOMcomponent >::allocator_type(static_cast< const std::vector< SOMcomponent >::allocator_type& >(result))), SWIGTYPE_p_std__allocatorT_SOMcomponent_t, SWIG_POINTER_OWN |  0 );
+  resultobj = SWIG_NewPointerObj((new std::vector< SOMcomponent >::allocator_type(result)), SWIGTYPE_p_std__allocatorT_SOMcomponent_t, SWIG_POINTER_OWN |  0 );
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_new_component_set__SWIG_2(PyObject *SWIGUNUSEDPARM(self), int nobjs, PyObject **swig_obj) {
+SWIGINTERN PyObject *_wrap_new_component_set__SWIG_2(PyObject *self, Py_ssize_t nobjs, PyObject **swig_obj) {
   PyObject *resultobj = 0;
   std::vector< SOMcomponent >::size_type arg1 ;
   size_t val1 ;
   int ecode1 = 0 ;
   std::vector< SOMcomponent > *result = 0 ;
   
+  (void)self;
   if ((nobjs < 1) || (nobjs > 1)) SWIG_fail;
   ecode1 = SWIG_AsVal_size_t(swig_obj[0], &val1);
   if (!SWIG_IsOK(ecode1)) {
@@ -9222,9 +8793,9 @@ SWIGINTERN PyObject *_wrap_new_component_set__SWIG_2(PyObject *SWIGUNUSEDPARM(se
   arg1 = static_cast< std::vector< SOMcomponent >::size_type >(val1);
   {
     try {
-      result = (std::vector< SOMcomponent > *)new std::vector< SOMcomponent >(arg1);
+      result = (std::vector< SOMcomponent > *)new std::vector< SOMcomponent >(SWIG_STD_MOVE(*(&arg1)));
     } 
-    /*@SWIG:C:\Apps\swigwin-3.0.12\Lib\typemaps\exception.swg,58,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
+    /*@SWIG:/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/swig/data/share/swig/4.5.1/typemaps/exception.swg,59,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
     catch (std::invalid_argument& e) {
       SWIG_exception_fail(SWIG_ValueError, e.what() );
     } catch (std::domain_error& e) {
@@ -9242,23 +8813,24 @@ SWIGINTERN PyObject *_wrap_new_component_set__SWIG_2(PyObject *SWIGUNUSEDPARM(se
     }
     /*@SWIG@*/
   }
-  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_std__vectorT_SOMcomponent_std__allocatorT_SOMcomponent_t_t, SWIG_POINTER_NEW |  0 );
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_std__vectorT_SOMcomponent_t, SWIG_POINTER_NEW |  0 );
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_component_set_pop_back(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_component_set_pop_back(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  std::vector< SOMcomponent > *arg1 = (std::vector< SOMcomponent > *) 0 ;
+  std::vector< SOMcomponent > *arg1 = 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   PyObject *swig_obj[1] ;
   
+  (void)self;
   if (!args) SWIG_fail;
   swig_obj[0] = args;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_std__vectorT_SOMcomponent_std__allocatorT_SOMcomponent_t_t, 0 |  0 );
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_std__vectorT_SOMcomponent_t, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "component_set_pop_back" "', argument " "1"" of type '" "std::vector< SOMcomponent > *""'"); 
   }
@@ -9267,7 +8839,7 @@ SWIGINTERN PyObject *_wrap_component_set_pop_back(PyObject *SWIGUNUSEDPARM(self)
     try {
       (arg1)->pop_back();
     } 
-    /*@SWIG:C:\Apps\swigwin-3.0.12\Lib\typemaps\exception.swg,58,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
+    /*@SWIG:/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/swig/data/share/swig/4.5.1/typemaps/exception.swg,59,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
     catch (std::invalid_argument& e) {
       SWIG_exception_fail(SWIG_ValueError, e.what() );
     } catch (std::domain_error& e) {
@@ -9292,17 +8864,18 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_component_set_resize__SWIG_0(PyObject *SWIGUNUSEDPARM(self), int nobjs, PyObject **swig_obj) {
+SWIGINTERN PyObject *_wrap_component_set_resize__SWIG_0(PyObject *self, Py_ssize_t nobjs, PyObject **swig_obj) {
   PyObject *resultobj = 0;
-  std::vector< SOMcomponent > *arg1 = (std::vector< SOMcomponent > *) 0 ;
+  std::vector< SOMcomponent > *arg1 = 0 ;
   std::vector< SOMcomponent >::size_type arg2 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   size_t val2 ;
   int ecode2 = 0 ;
   
+  (void)self;
   if ((nobjs < 2) || (nobjs > 2)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_std__vectorT_SOMcomponent_std__allocatorT_SOMcomponent_t_t, 0 |  0 );
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_std__vectorT_SOMcomponent_t, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "component_set_resize" "', argument " "1"" of type '" "std::vector< SOMcomponent > *""'"); 
   }
@@ -9314,9 +8887,9 @@ SWIGINTERN PyObject *_wrap_component_set_resize__SWIG_0(PyObject *SWIGUNUSEDPARM
   arg2 = static_cast< std::vector< SOMcomponent >::size_type >(val2);
   {
     try {
-      (arg1)->resize(arg2);
+      (arg1)->resize(SWIG_STD_MOVE(*(&arg2)));
     } 
-    /*@SWIG:C:\Apps\swigwin-3.0.12\Lib\typemaps\exception.swg,58,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
+    /*@SWIG:/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/swig/data/share/swig/4.5.1/typemaps/exception.swg,59,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
     catch (std::invalid_argument& e) {
       SWIG_exception_fail(SWIG_ValueError, e.what() );
     } catch (std::domain_error& e) {
@@ -9341,9 +8914,9 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_component_set_erase__SWIG_0(PyObject *SWIGUNUSEDPARM(self), int nobjs, PyObject **swig_obj) {
+SWIGINTERN PyObject *_wrap_component_set_erase__SWIG_0(PyObject *self, Py_ssize_t nobjs, PyObject **swig_obj) {
   PyObject *resultobj = 0;
-  std::vector< SOMcomponent > *arg1 = (std::vector< SOMcomponent > *) 0 ;
+  std::vector< SOMcomponent > *arg1 = 0 ;
   std::vector< SOMcomponent >::iterator arg2 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
@@ -9351,8 +8924,9 @@ SWIGINTERN PyObject *_wrap_component_set_erase__SWIG_0(PyObject *SWIGUNUSEDPARM(
   int res2 ;
   std::vector< SOMcomponent >::iterator result;
   
+  (void)self;
   if ((nobjs < 2) || (nobjs > 2)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_std__vectorT_SOMcomponent_std__allocatorT_SOMcomponent_t_t, 0 |  0 );
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_std__vectorT_SOMcomponent_t, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "component_set_erase" "', argument " "1"" of type '" "std::vector< SOMcomponent > *""'"); 
   }
@@ -9370,9 +8944,9 @@ SWIGINTERN PyObject *_wrap_component_set_erase__SWIG_0(PyObject *SWIGUNUSEDPARM(
   }
   {
     try {
-      result = std_vector_Sl_SOMcomponent_Sg__erase__SWIG_0(arg1,arg2);
+      result = std_vector_Sl_SOMcomponent_Sg__erase__SWIG_0(arg1,SWIG_STD_MOVE(*(&arg2)));
     } 
-    /*@SWIG:C:\Apps\swigwin-3.0.12\Lib\typemaps\exception.swg,58,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
+    /*@SWIG:/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/swig/data/share/swig/4.5.1/typemaps/exception.swg,59,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
     catch (std::invalid_argument& e) {
       SWIG_exception_fail(SWIG_ValueError, e.what() );
     } catch (std::domain_error& e) {
@@ -9398,9 +8972,9 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_component_set_erase__SWIG_1(PyObject *SWIGUNUSEDPARM(self), int nobjs, PyObject **swig_obj) {
+SWIGINTERN PyObject *_wrap_component_set_erase__SWIG_1(PyObject *self, Py_ssize_t nobjs, PyObject **swig_obj) {
   PyObject *resultobj = 0;
-  std::vector< SOMcomponent > *arg1 = (std::vector< SOMcomponent > *) 0 ;
+  std::vector< SOMcomponent > *arg1 = 0 ;
   std::vector< SOMcomponent >::iterator arg2 ;
   std::vector< SOMcomponent >::iterator arg3 ;
   void *argp1 = 0 ;
@@ -9411,8 +8985,9 @@ SWIGINTERN PyObject *_wrap_component_set_erase__SWIG_1(PyObject *SWIGUNUSEDPARM(
   int res3 ;
   std::vector< SOMcomponent >::iterator result;
   
+  (void)self;
   if ((nobjs < 3) || (nobjs > 3)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_std__vectorT_SOMcomponent_std__allocatorT_SOMcomponent_t_t, 0 |  0 );
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_std__vectorT_SOMcomponent_t, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "component_set_erase" "', argument " "1"" of type '" "std::vector< SOMcomponent > *""'"); 
   }
@@ -9441,9 +9016,9 @@ SWIGINTERN PyObject *_wrap_component_set_erase__SWIG_1(PyObject *SWIGUNUSEDPARM(
   }
   {
     try {
-      result = std_vector_Sl_SOMcomponent_Sg__erase__SWIG_1(arg1,arg2,arg3);
+      result = std_vector_Sl_SOMcomponent_Sg__erase__SWIG_1(arg1,SWIG_STD_MOVE(*(&arg2)),SWIG_STD_MOVE(*(&arg3)));
     } 
-    /*@SWIG:C:\Apps\swigwin-3.0.12\Lib\typemaps\exception.swg,58,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
+    /*@SWIG:/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/swig/data/share/swig/4.5.1/typemaps/exception.swg,59,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
     catch (std::invalid_argument& e) {
       SWIG_exception_fail(SWIG_ValueError, e.what() );
     } catch (std::domain_error& e) {
@@ -9475,7 +9050,7 @@ SWIGINTERN PyObject *_wrap_component_set_erase(PyObject *self, PyObject *args) {
     0
   };
   
-  if (!(argc = SWIG_Python_UnpackTuple(args,"component_set_erase",0,3,argv))) SWIG_fail;
+  if (!(argc = SWIG_Python_UnpackTuple(args, "component_set_erase", 0, 3, argv))) SWIG_fail;
   --argc;
   {
     unsigned long _index = 0;
@@ -9557,7 +9132,7 @@ SWIGINTERN PyObject *_wrap_component_set_erase(PyObject *self, PyObject *args) {
   }
   
 fail:
-  SWIG_SetErrorMsg(PyExc_NotImplementedError,"Wrong number or type of arguments for overloaded function 'component_set_erase'.\n"
+  SWIG_Python_RaiseOrModifyTypeError("Wrong number or type of arguments for overloaded function 'component_set_erase'.\n"
     "  Possible C/C++ prototypes are:\n"
     "    std::vector< SOMcomponent >::erase(std::vector< SOMcomponent >::iterator)\n"
     "    std::vector< SOMcomponent >::erase(std::vector< SOMcomponent >::iterator,std::vector< SOMcomponent >::iterator)\n");
@@ -9565,7 +9140,7 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_new_component_set__SWIG_3(PyObject *SWIGUNUSEDPARM(self), int nobjs, PyObject **swig_obj) {
+SWIGINTERN PyObject *_wrap_new_component_set__SWIG_3(PyObject *self, Py_ssize_t nobjs, PyObject **swig_obj) {
   PyObject *resultobj = 0;
   std::vector< SOMcomponent >::size_type arg1 ;
   std::vector< SOMcomponent >::value_type *arg2 = 0 ;
@@ -9575,6 +9150,7 @@ SWIGINTERN PyObject *_wrap_new_component_set__SWIG_3(PyObject *SWIGUNUSEDPARM(se
   int res2 = 0 ;
   std::vector< SOMcomponent > *result = 0 ;
   
+  (void)self;
   if ((nobjs < 2) || (nobjs > 2)) SWIG_fail;
   ecode1 = SWIG_AsVal_size_t(swig_obj[0], &val1);
   if (!SWIG_IsOK(ecode1)) {
@@ -9586,14 +9162,14 @@ SWIGINTERN PyObject *_wrap_new_component_set__SWIG_3(PyObject *SWIGUNUSEDPARM(se
     SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "new_component_set" "', argument " "2"" of type '" "std::vector< SOMcomponent >::value_type const &""'"); 
   }
   if (!argp2) {
-    SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "new_component_set" "', argument " "2"" of type '" "std::vector< SOMcomponent >::value_type const &""'"); 
+    SWIG_exception_fail(SWIG_NullReferenceError, "invalid null reference " "in method '" "new_component_set" "', argument " "2"" of type '" "std::vector< SOMcomponent >::value_type const &""'"); 
   }
   arg2 = reinterpret_cast< std::vector< SOMcomponent >::value_type * >(argp2);
   {
     try {
-      result = (std::vector< SOMcomponent > *)new std::vector< SOMcomponent >(arg1,(std::vector< SOMcomponent >::value_type const &)*arg2);
+      result = (std::vector< SOMcomponent > *)new std::vector< SOMcomponent >(SWIG_STD_MOVE(*(&arg1)),(std::vector< SOMcomponent >::value_type const &)*arg2);
     } 
-    /*@SWIG:C:\Apps\swigwin-3.0.12\Lib\typemaps\exception.swg,58,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
+    /*@SWIG:/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/swig/data/share/swig/4.5.1/typemaps/exception.swg,59,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
     catch (std::invalid_argument& e) {
       SWIG_exception_fail(SWIG_ValueError, e.what() );
     } catch (std::domain_error& e) {
@@ -9611,7 +9187,7 @@ SWIGINTERN PyObject *_wrap_new_component_set__SWIG_3(PyObject *SWIGUNUSEDPARM(se
     }
     /*@SWIG@*/
   }
-  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_std__vectorT_SOMcomponent_std__allocatorT_SOMcomponent_t_t, SWIG_POINTER_NEW |  0 );
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_std__vectorT_SOMcomponent_t, SWIG_POINTER_NEW |  0 );
   return resultobj;
 fail:
   return NULL;
@@ -9624,7 +9200,7 @@ SWIGINTERN PyObject *_wrap_new_component_set(PyObject *self, PyObject *args) {
     0
   };
   
-  if (!(argc = SWIG_Python_UnpackTuple(args,"new_component_set",0,2,argv))) SWIG_fail;
+  if (!(argc = SWIG_Python_UnpackTuple(args, "new_component_set", 0, 2, argv))) SWIG_fail;
   --argc;
   {
     unsigned long _index = 0;
@@ -9695,7 +9271,7 @@ SWIGINTERN PyObject *_wrap_new_component_set(PyObject *self, PyObject *args) {
       _rankm += _pi;
       _pi *= SWIG_MAXCASTRANK;
       {
-        int res = SWIG_ConvertPtr(argv[1], 0, SWIGTYPE_p_SOMcomponent, 0);
+        int res = SWIG_ConvertPtr(argv[1], 0, SWIGTYPE_p_SOMcomponent, SWIG_POINTER_NO_NULL | 0);
         _v = SWIG_CheckState(res);
       }
       if (!_v) goto check_4;
@@ -9723,7 +9299,7 @@ SWIGINTERN PyObject *_wrap_new_component_set(PyObject *self, PyObject *args) {
   }
   
 fail:
-  SWIG_SetErrorMsg(PyExc_NotImplementedError,"Wrong number or type of arguments for overloaded function 'new_component_set'.\n"
+  SWIG_Python_RaiseOrModifyTypeError("Wrong number or type of arguments for overloaded function 'new_component_set'.\n"
     "  Possible C/C++ prototypes are:\n"
     "    std::vector< SOMcomponent >::vector()\n"
     "    std::vector< SOMcomponent >::vector(std::vector< SOMcomponent > const &)\n"
@@ -9733,9 +9309,9 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_component_set_push_back(PyObject *SWIGUNUSEDPARM(self), PyObject *args, PyObject *kwargs) {
+SWIGINTERN PyObject *_wrap_component_set_push_back(PyObject *self, PyObject *args, PyObject *kwargs) {
   PyObject *resultobj = 0;
-  std::vector< SOMcomponent > *arg1 = (std::vector< SOMcomponent > *) 0 ;
+  std::vector< SOMcomponent > *arg1 = 0 ;
   std::vector< SOMcomponent >::value_type *arg2 = 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
@@ -9743,12 +9319,13 @@ SWIGINTERN PyObject *_wrap_component_set_push_back(PyObject *SWIGUNUSEDPARM(self
   int res2 = 0 ;
   PyObject * obj0 = 0 ;
   PyObject * obj1 = 0 ;
-  char *  kwnames[] = {
-    (char *) "self",(char *) "x", NULL 
+  char * kwnames[] = {
+    (char *)"self",  (char *)"x",  NULL 
   };
   
-  if (!PyArg_ParseTupleAndKeywords(args,kwargs,(char *)"OO:component_set_push_back",kwnames,&obj0,&obj1)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_std__vectorT_SOMcomponent_std__allocatorT_SOMcomponent_t_t, 0 |  0 );
+  (void)self;
+  if (!PyArg_ParseTupleAndKeywords(args, kwargs, "OO:component_set_push_back", kwnames, &obj0, &obj1)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_std__vectorT_SOMcomponent_t, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "component_set_push_back" "', argument " "1"" of type '" "std::vector< SOMcomponent > *""'"); 
   }
@@ -9758,14 +9335,14 @@ SWIGINTERN PyObject *_wrap_component_set_push_back(PyObject *SWIGUNUSEDPARM(self
     SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "component_set_push_back" "', argument " "2"" of type '" "std::vector< SOMcomponent >::value_type const &""'"); 
   }
   if (!argp2) {
-    SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "component_set_push_back" "', argument " "2"" of type '" "std::vector< SOMcomponent >::value_type const &""'"); 
+    SWIG_exception_fail(SWIG_NullReferenceError, "invalid null reference " "in method '" "component_set_push_back" "', argument " "2"" of type '" "std::vector< SOMcomponent >::value_type const &""'"); 
   }
   arg2 = reinterpret_cast< std::vector< SOMcomponent >::value_type * >(argp2);
   {
     try {
       (arg1)->push_back((std::vector< SOMcomponent >::value_type const &)*arg2);
     } 
-    /*@SWIG:C:\Apps\swigwin-3.0.12\Lib\typemaps\exception.swg,58,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
+    /*@SWIG:/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/swig/data/share/swig/4.5.1/typemaps/exception.swg,59,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
     catch (std::invalid_argument& e) {
       SWIG_exception_fail(SWIG_ValueError, e.what() );
     } catch (std::domain_error& e) {
@@ -9790,17 +9367,18 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_component_set_front(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_component_set_front(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  std::vector< SOMcomponent > *arg1 = (std::vector< SOMcomponent > *) 0 ;
+  std::vector< SOMcomponent > *arg1 = 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   PyObject *swig_obj[1] ;
   std::vector< SOMcomponent >::value_type *result = 0 ;
   
+  (void)self;
   if (!args) SWIG_fail;
   swig_obj[0] = args;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_std__vectorT_SOMcomponent_std__allocatorT_SOMcomponent_t_t, 0 |  0 );
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_std__vectorT_SOMcomponent_t, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "component_set_front" "', argument " "1"" of type '" "std::vector< SOMcomponent > const *""'"); 
   }
@@ -9809,7 +9387,7 @@ SWIGINTERN PyObject *_wrap_component_set_front(PyObject *SWIGUNUSEDPARM(self), P
     try {
       result = (std::vector< SOMcomponent >::value_type *) &((std::vector< SOMcomponent > const *)arg1)->front();
     } 
-    /*@SWIG:C:\Apps\swigwin-3.0.12\Lib\typemaps\exception.swg,58,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
+    /*@SWIG:/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/swig/data/share/swig/4.5.1/typemaps/exception.swg,59,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
     catch (std::invalid_argument& e) {
       SWIG_exception_fail(SWIG_ValueError, e.what() );
     } catch (std::domain_error& e) {
@@ -9828,23 +9406,27 @@ SWIGINTERN PyObject *_wrap_component_set_front(PyObject *SWIGUNUSEDPARM(self), P
     /*@SWIG@*/
   }
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_SOMcomponent, 0 |  0 );
+  if (!swig::container_owner<swig::traits<std::vector< SOMcomponent >::value_type>::category>::back_reference(resultobj, swig_obj[0]) && PyErr_Occurred()) {
+    SWIG_fail;
+  }
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_component_set_back(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_component_set_back(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  std::vector< SOMcomponent > *arg1 = (std::vector< SOMcomponent > *) 0 ;
+  std::vector< SOMcomponent > *arg1 = 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   PyObject *swig_obj[1] ;
   std::vector< SOMcomponent >::value_type *result = 0 ;
   
+  (void)self;
   if (!args) SWIG_fail;
   swig_obj[0] = args;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_std__vectorT_SOMcomponent_std__allocatorT_SOMcomponent_t_t, 0 |  0 );
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_std__vectorT_SOMcomponent_t, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "component_set_back" "', argument " "1"" of type '" "std::vector< SOMcomponent > const *""'"); 
   }
@@ -9853,7 +9435,7 @@ SWIGINTERN PyObject *_wrap_component_set_back(PyObject *SWIGUNUSEDPARM(self), Py
     try {
       result = (std::vector< SOMcomponent >::value_type *) &((std::vector< SOMcomponent > const *)arg1)->back();
     } 
-    /*@SWIG:C:\Apps\swigwin-3.0.12\Lib\typemaps\exception.swg,58,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
+    /*@SWIG:/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/swig/data/share/swig/4.5.1/typemaps/exception.swg,59,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
     catch (std::invalid_argument& e) {
       SWIG_exception_fail(SWIG_ValueError, e.what() );
     } catch (std::domain_error& e) {
@@ -9872,15 +9454,18 @@ SWIGINTERN PyObject *_wrap_component_set_back(PyObject *SWIGUNUSEDPARM(self), Py
     /*@SWIG@*/
   }
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_SOMcomponent, 0 |  0 );
+  if (!swig::container_owner<swig::traits<std::vector< SOMcomponent >::value_type>::category>::back_reference(resultobj, swig_obj[0]) && PyErr_Occurred()) {
+    SWIG_fail;
+  }
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_component_set_assign(PyObject *SWIGUNUSEDPARM(self), PyObject *args, PyObject *kwargs) {
+SWIGINTERN PyObject *_wrap_component_set_assign(PyObject *self, PyObject *args, PyObject *kwargs) {
   PyObject *resultobj = 0;
-  std::vector< SOMcomponent > *arg1 = (std::vector< SOMcomponent > *) 0 ;
+  std::vector< SOMcomponent > *arg1 = 0 ;
   std::vector< SOMcomponent >::size_type arg2 ;
   std::vector< SOMcomponent >::value_type *arg3 = 0 ;
   void *argp1 = 0 ;
@@ -9892,12 +9477,13 @@ SWIGINTERN PyObject *_wrap_component_set_assign(PyObject *SWIGUNUSEDPARM(self),
   PyObject * obj0 = 0 ;
   PyObject * obj1 = 0 ;
   PyObject * obj2 = 0 ;
-  char *  kwnames[] = {
-    (char *) "self",(char *) "n",(char *) "x", NULL 
+  char * kwnames[] = {
+    (char *)"self",  (char *)"n",  (char *)"x",  NULL 
   };
   
-  if (!PyArg_ParseTupleAndKeywords(args,kwargs,(char *)"OOO:component_set_assign",kwnames,&obj0,&obj1,&obj2)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_std__vectorT_SOMcomponent_std__allocatorT_SOMcomponent_t_t, 0 |  0 );
+  (void)self;
+  if (!PyArg_ParseTupleAndKeywords(args, kwargs, "OOO:component_set_assign", kwnames, &obj0, &obj1, &obj2)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_std__vectorT_SOMcomponent_t, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "component_set_assign" "', argument " "1"" of type '" "std::vector< SOMcomponent > *""'"); 
   }
@@ -9912,14 +9498,14 @@ SWIGINTERN PyObject *_wrap_component_set_assign(PyObject *SWIGUNUSEDPARM(self),
     SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "component_set_assign" "', argument " "3"" of type '" "std::vector< SOMcomponent >::value_type const &""'"); 
   }
   if (!argp3) {
-    SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "component_set_assign" "', argument " "3"" of type '" "std::vector< SOMcomponent >::value_type const &""'"); 
+    SWIG_exception_fail(SWIG_NullReferenceError, "invalid null reference " "in method '" "component_set_assign" "', argument " "3"" of type '" "std::vector< SOMcomponent >::value_type const &""'"); 
   }
   arg3 = reinterpret_cast< std::vector< SOMcomponent >::value_type * >(argp3);
   {
     try {
-      (arg1)->assign(arg2,(std::vector< SOMcomponent >::value_type const &)*arg3);
+      (arg1)->assign(SWIG_STD_MOVE(*(&arg2)),(std::vector< SOMcomponent >::value_type const &)*arg3);
     } 
-    /*@SWIG:C:\Apps\swigwin-3.0.12\Lib\typemaps\exception.swg,58,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
+    /*@SWIG:/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/swig/data/share/swig/4.5.1/typemaps/exception.swg,59,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
     catch (std::invalid_argument& e) {
       SWIG_exception_fail(SWIG_ValueError, e.what() );
     } catch (std::domain_error& e) {
@@ -9944,9 +9530,9 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_component_set_resize__SWIG_1(PyObject *SWIGUNUSEDPARM(self), int nobjs, PyObject **swig_obj) {
+SWIGINTERN PyObject *_wrap_component_set_resize__SWIG_1(PyObject *self, Py_ssize_t nobjs, PyObject **swig_obj) {
   PyObject *resultobj = 0;
-  std::vector< SOMcomponent > *arg1 = (std::vector< SOMcomponent > *) 0 ;
+  std::vector< SOMcomponent > *arg1 = 0 ;
   std::vector< SOMcomponent >::size_type arg2 ;
   std::vector< SOMcomponent >::value_type *arg3 = 0 ;
   void *argp1 = 0 ;
@@ -9956,8 +9542,9 @@ SWIGINTERN PyObject *_wrap_component_set_resize__SWIG_1(PyObject *SWIGUNUSEDPARM
   void *argp3 = 0 ;
   int res3 = 0 ;
   
+  (void)self;
   if ((nobjs < 3) || (nobjs > 3)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_std__vectorT_SOMcomponent_std__allocatorT_SOMcomponent_t_t, 0 |  0 );
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_std__vectorT_SOMcomponent_t, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "component_set_resize" "', argument " "1"" of type '" "std::vector< SOMcomponent > *""'"); 
   }
@@ -9972,14 +9559,14 @@ SWIGINTERN PyObject *_wrap_component_set_resize__SWIG_1(PyObject *SWIGUNUSEDPARM
     SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "component_set_resize" "', argument " "3"" of type '" "std::vector< SOMcomponent >::value_type const &""'"); 
   }
   if (!argp3) {
-    SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "component_set_resize" "', argument " "3"" of type '" "std::vector< SOMcomponent >::value_type const &""'"); 
+    SWIG_exception_fail(SWIG_NullReferenceError, "invalid null reference " "in method '" "component_set_resize" "', argument " "3"" of type '" "std::vector< SOMcomponent >::value_type const &""'"); 
   }
   arg3 = reinterpret_cast< std::vector< SOMcomponent >::value_type * >(argp3);
   {
     try {
-      (arg1)->resize(arg2,(std::vector< SOMcomponent >::value_type const &)*arg3);
+      (arg1)->resize(SWIG_STD_MOVE(*(&arg2)),(std::vector< SOMcomponent >::value_type const &)*arg3);
     } 
-    /*@SWIG:C:\Apps\swigwin-3.0.12\Lib\typemaps\exception.swg,58,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
+    /*@SWIG:/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/swig/data/share/swig/4.5.1/typemaps/exception.swg,59,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
     catch (std::invalid_argument& e) {
       SWIG_exception_fail(SWIG_ValueError, e.what() );
     } catch (std::domain_error& e) {
@@ -10010,7 +9597,7 @@ SWIGINTERN PyObject *_wrap_component_set_resize(PyObject *self, PyObject *args)
     0
   };
   
-  if (!(argc = SWIG_Python_UnpackTuple(args,"component_set_resize",0,3,argv))) SWIG_fail;
+  if (!(argc = SWIG_Python_UnpackTuple(args, "component_set_resize", 0, 3, argv))) SWIG_fail;
   --argc;
   {
     unsigned long _index = 0;
@@ -10069,7 +9656,7 @@ SWIGINTERN PyObject *_wrap_component_set_resize(PyObject *self, PyObject *args)
       _rankm += _pi;
       _pi *= SWIG_MAXCASTRANK;
       {
-        int res = SWIG_ConvertPtr(argv[2], 0, SWIGTYPE_p_SOMcomponent, 0);
+        int res = SWIG_ConvertPtr(argv[2], 0, SWIGTYPE_p_SOMcomponent, SWIG_POINTER_NO_NULL | 0);
         _v = SWIG_CheckState(res);
       }
       if (!_v) goto check_2;
@@ -10093,7 +9680,7 @@ SWIGINTERN PyObject *_wrap_component_set_resize(PyObject *self, PyObject *args)
   }
   
 fail:
-  SWIG_SetErrorMsg(PyExc_NotImplementedError,"Wrong number or type of arguments for overloaded function 'component_set_resize'.\n"
+  SWIG_Python_RaiseOrModifyTypeError("Wrong number or type of arguments for overloaded function 'component_set_resize'.\n"
     "  Possible C/C++ prototypes are:\n"
     "    std::vector< SOMcomponent >::resize(std::vector< SOMcomponent >::size_type)\n"
     "    std::vector< SOMcomponent >::resize(std::vector< SOMcomponent >::size_type,std::vector< SOMcomponent >::value_type const &)\n");
@@ -10101,9 +9688,9 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_component_set_insert__SWIG_0(PyObject *SWIGUNUSEDPARM(self), int nobjs, PyObject **swig_obj) {
+SWIGINTERN PyObject *_wrap_component_set_insert__SWIG_0(PyObject *self, Py_ssize_t nobjs, PyObject **swig_obj) {
   PyObject *resultobj = 0;
-  std::vector< SOMcomponent > *arg1 = (std::vector< SOMcomponent > *) 0 ;
+  std::vector< SOMcomponent > *arg1 = 0 ;
   std::vector< SOMcomponent >::iterator arg2 ;
   std::vector< SOMcomponent >::value_type *arg3 = 0 ;
   void *argp1 = 0 ;
@@ -10114,8 +9701,9 @@ SWIGINTERN PyObject *_wrap_component_set_insert__SWIG_0(PyObject *SWIGUNUSEDPARM
   int res3 = 0 ;
   std::vector< SOMcomponent >::iterator result;
   
+  (void)self;
   if ((nobjs < 3) || (nobjs > 3)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_std__vectorT_SOMcomponent_std__allocatorT_SOMcomponent_t_t, 0 |  0 );
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_std__vectorT_SOMcomponent_t, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "component_set_insert" "', argument " "1"" of type '" "std::vector< SOMcomponent > *""'"); 
   }
@@ -10136,14 +9724,14 @@ SWIGINTERN PyObject *_wrap_component_set_insert__SWIG_0(PyObject *SWIGUNUSEDPARM
     SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "component_set_insert" "', argument " "3"" of type '" "std::vector< SOMcomponent >::value_type const &""'"); 
   }
   if (!argp3) {
-    SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "component_set_insert" "', argument " "3"" of type '" "std::vector< SOMcomponent >::value_type const &""'"); 
+    SWIG_exception_fail(SWIG_NullReferenceError, "invalid null reference " "in method '" "component_set_insert" "', argument " "3"" of type '" "std::vector< SOMcomponent >::value_type const &""'"); 
   }
   arg3 = reinterpret_cast< std::vector< SOMcomponent >::value_type * >(argp3);
   {
     try {
-      result = std_vector_Sl_SOMcomponent_Sg__insert__SWIG_0(arg1,arg2,(SOMcomponent const &)*arg3);
+      result = std_vector_Sl_SOMcomponent_Sg__insert__SWIG_0(arg1,SWIG_STD_MOVE(*(&arg2)),(SOMcomponent const &)*arg3);
     } 
-    /*@SWIG:C:\Apps\swigwin-3.0.12\Lib\typemaps\exception.swg,58,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
+    /*@SWIG:/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/swig/data/share/swig/4.5.1/typemaps/exception.swg,59,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
     catch (std::invalid_argument& e) {
       SWIG_exception_fail(SWIG_ValueError, e.what() );
     } catch (std::domain_error& e) {
@@ -10169,9 +9757,9 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_component_set_insert__SWIG_1(PyObject *SWIGUNUSEDPARM(self), int nobjs, PyObject **swig_obj) {
+SWIGINTERN PyObject *_wrap_component_set_insert__SWIG_1(PyObject *self, Py_ssize_t nobjs, PyObject **swig_obj) {
   PyObject *resultobj = 0;
-  std::vector< SOMcomponent > *arg1 = (std::vector< SOMcomponent > *) 0 ;
+  std::vector< SOMcomponent > *arg1 = 0 ;
   std::vector< SOMcomponent >::iterator arg2 ;
   std::vector< SOMcomponent >::size_type arg3 ;
   std::vector< SOMcomponent >::value_type *arg4 = 0 ;
@@ -10184,8 +9772,9 @@ SWIGINTERN PyObject *_wrap_component_set_insert__SWIG_1(PyObject *SWIGUNUSEDPARM
   void *argp4 = 0 ;
   int res4 = 0 ;
   
+  (void)self;
   if ((nobjs < 4) || (nobjs > 4)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_std__vectorT_SOMcomponent_std__allocatorT_SOMcomponent_t_t, 0 |  0 );
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_std__vectorT_SOMcomponent_t, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "component_set_insert" "', argument " "1"" of type '" "std::vector< SOMcomponent > *""'"); 
   }
@@ -10211,14 +9800,14 @@ SWIGINTERN PyObject *_wrap_component_set_insert__SWIG_1(PyObject *SWIGUNUSEDPARM
     SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "component_set_insert" "', argument " "4"" of type '" "std::vector< SOMcomponent >::value_type const &""'"); 
   }
   if (!argp4) {
-    SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "component_set_insert" "', argument " "4"" of type '" "std::vector< SOMcomponent >::value_type const &""'"); 
+    SWIG_exception_fail(SWIG_NullReferenceError, "invalid null reference " "in method '" "component_set_insert" "', argument " "4"" of type '" "std::vector< SOMcomponent >::value_type const &""'"); 
   }
   arg4 = reinterpret_cast< std::vector< SOMcomponent >::value_type * >(argp4);
   {
     try {
-      std_vector_Sl_SOMcomponent_Sg__insert__SWIG_1(arg1,arg2,arg3,(SOMcomponent const &)*arg4);
+      std_vector_Sl_SOMcomponent_Sg__insert__SWIG_1(arg1,SWIG_STD_MOVE(*(&arg2)),SWIG_STD_MOVE(*(&arg3)),(SOMcomponent const &)*arg4);
     } 
-    /*@SWIG:C:\Apps\swigwin-3.0.12\Lib\typemaps\exception.swg,58,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
+    /*@SWIG:/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/swig/data/share/swig/4.5.1/typemaps/exception.swg,59,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
     catch (std::invalid_argument& e) {
       SWIG_exception_fail(SWIG_ValueError, e.what() );
     } catch (std::domain_error& e) {
@@ -10249,7 +9838,7 @@ SWIGINTERN PyObject *_wrap_component_set_insert(PyObject *self, PyObject *args)
     0
   };
   
-  if (!(argc = SWIG_Python_UnpackTuple(args,"component_set_insert",0,4,argv))) SWIG_fail;
+  if (!(argc = SWIG_Python_UnpackTuple(args, "component_set_insert", 0, 4, argv))) SWIG_fail;
   --argc;
   {
     unsigned long _index = 0;
@@ -10277,7 +9866,7 @@ SWIGINTERN PyObject *_wrap_component_set_insert(PyObject *self, PyObject *args)
       _rankm += _pi;
       _pi *= SWIG_MAXCASTRANK;
       {
-        int res = SWIG_ConvertPtr(argv[2], 0, SWIGTYPE_p_SOMcomponent, 0);
+        int res = SWIG_ConvertPtr(argv[2], 0, SWIGTYPE_p_SOMcomponent, SWIG_POINTER_NO_NULL | 0);
         _v = SWIG_CheckState(res);
       }
       if (!_v) goto check_1;
@@ -10324,7 +9913,7 @@ SWIGINTERN PyObject *_wrap_component_set_insert(PyObject *self, PyObject *args)
       _rankm += _pi;
       _pi *= SWIG_MAXCASTRANK;
       {
-        int res = SWIG_ConvertPtr(argv[3], 0, SWIGTYPE_p_SOMcomponent, 0);
+        int res = SWIG_ConvertPtr(argv[3], 0, SWIGTYPE_p_SOMcomponent, SWIG_POINTER_NO_NULL | 0);
         _v = SWIG_CheckState(res);
       }
       if (!_v) goto check_2;
@@ -10348,7 +9937,7 @@ SWIGINTERN PyObject *_wrap_component_set_insert(PyObject *self, PyObject *args)
   }
   
 fail:
-  SWIG_SetErrorMsg(PyExc_NotImplementedError,"Wrong number or type of arguments for overloaded function 'component_set_insert'.\n"
+  SWIG_Python_RaiseOrModifyTypeError("Wrong number or type of arguments for overloaded function 'component_set_insert'.\n"
     "  Possible C/C++ prototypes are:\n"
     "    std::vector< SOMcomponent >::insert(std::vector< SOMcomponent >::iterator,std::vector< SOMcomponent >::value_type const &)\n"
     "    std::vector< SOMcomponent >::insert(std::vector< SOMcomponent >::iterator,std::vector< SOMcomponent >::size_type,std::vector< SOMcomponent >::value_type const &)\n");
@@ -10356,9 +9945,9 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_component_set_reserve(PyObject *SWIGUNUSEDPARM(self), PyObject *args, PyObject *kwargs) {
+SWIGINTERN PyObject *_wrap_component_set_reserve(PyObject *self, PyObject *args, PyObject *kwargs) {
   PyObject *resultobj = 0;
-  std::vector< SOMcomponent > *arg1 = (std::vector< SOMcomponent > *) 0 ;
+  std::vector< SOMcomponent > *arg1 = 0 ;
   std::vector< SOMcomponent >::size_type arg2 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
@@ -10366,12 +9955,13 @@ SWIGINTERN PyObject *_wrap_component_set_reserve(PyObject *SWIGUNUSEDPARM(self),
   int ecode2 = 0 ;
   PyObject * obj0 = 0 ;
   PyObject * obj1 = 0 ;
-  char *  kwnames[] = {
-    (char *) "self",(char *) "n", NULL 
+  char * kwnames[] = {
+    (char *)"self",  (char *)"n",  NULL 
   };
   
-  if (!PyArg_ParseTupleAndKeywords(args,kwargs,(char *)"OO:component_set_reserve",kwnames,&obj0,&obj1)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_std__vectorT_SOMcomponent_std__allocatorT_SOMcomponent_t_t, 0 |  0 );
+  (void)self;
+  if (!PyArg_ParseTupleAndKeywords(args, kwargs, "OO:component_set_reserve", kwnames, &obj0, &obj1)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_std__vectorT_SOMcomponent_t, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "component_set_reserve" "', argument " "1"" of type '" "std::vector< SOMcomponent > *""'"); 
   }
@@ -10383,9 +9973,9 @@ SWIGINTERN PyObject *_wrap_component_set_reserve(PyObject *SWIGUNUSEDPARM(self),
   arg2 = static_cast< std::vector< SOMcomponent >::size_type >(val2);
   {
     try {
-      (arg1)->reserve(arg2);
+      (arg1)->reserve(SWIG_STD_MOVE(*(&arg2)));
     } 
-    /*@SWIG:C:\Apps\swigwin-3.0.12\Lib\typemaps\exception.swg,58,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
+    /*@SWIG:/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/swig/data/share/swig/4.5.1/typemaps/exception.swg,59,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
     catch (std::invalid_argument& e) {
       SWIG_exception_fail(SWIG_ValueError, e.what() );
     } catch (std::domain_error& e) {
@@ -10410,17 +10000,18 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_component_set_capacity(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_component_set_capacity(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  std::vector< SOMcomponent > *arg1 = (std::vector< SOMcomponent > *) 0 ;
+  std::vector< SOMcomponent > *arg1 = 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   PyObject *swig_obj[1] ;
   std::vector< SOMcomponent >::size_type result;
   
+  (void)self;
   if (!args) SWIG_fail;
   swig_obj[0] = args;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_std__vectorT_SOMcomponent_std__allocatorT_SOMcomponent_t_t, 0 |  0 );
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_std__vectorT_SOMcomponent_t, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "component_set_capacity" "', argument " "1"" of type '" "std::vector< SOMcomponent > const *""'"); 
   }
@@ -10429,7 +10020,7 @@ SWIGINTERN PyObject *_wrap_component_set_capacity(PyObject *SWIGUNUSEDPARM(self)
     try {
       result = ((std::vector< SOMcomponent > const *)arg1)->capacity();
     } 
-    /*@SWIG:C:\Apps\swigwin-3.0.12\Lib\typemaps\exception.swg,58,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
+    /*@SWIG:/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/swig/data/share/swig/4.5.1/typemaps/exception.swg,59,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
     catch (std::invalid_argument& e) {
       SWIG_exception_fail(SWIG_ValueError, e.what() );
     } catch (std::domain_error& e) {
@@ -10454,16 +10045,17 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_delete_component_set(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_delete_component_set(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  std::vector< SOMcomponent > *arg1 = (std::vector< SOMcomponent > *) 0 ;
+  std::vector< SOMcomponent > *arg1 = 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   PyObject *swig_obj[1] ;
   
+  (void)self;
   if (!args) SWIG_fail;
   swig_obj[0] = args;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_std__vectorT_SOMcomponent_std__allocatorT_SOMcomponent_t_t, SWIG_POINTER_DISOWN |  0 );
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_std__vectorT_SOMcomponent_t, SWIG_POINTER_DISOWN |  0 );
   if (!SWIG_IsOK(res1)) {
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "delete_component_set" "', argument " "1"" of type '" "std::vector< SOMcomponent > *""'"); 
   }
@@ -10472,7 +10064,7 @@ SWIGINTERN PyObject *_wrap_delete_component_set(PyObject *SWIGUNUSEDPARM(self),
     try {
       delete arg1;
     } 
-    /*@SWIG:C:\Apps\swigwin-3.0.12\Lib\typemaps\exception.swg,58,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
+    /*@SWIG:/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/swig/data/share/swig/4.5.1/typemaps/exception.swg,59,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
     catch (std::invalid_argument& e) {
       SWIG_exception_fail(SWIG_ValueError, e.what() );
     } catch (std::domain_error& e) {
@@ -10498,9 +10090,9 @@ fail:
 
 
 SWIGINTERN PyObject *component_set_swigregister(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
-  PyObject *obj;
-  if (!SWIG_Python_UnpackTuple(args,(char *)"swigregister", 1, 1,&obj)) return NULL;
-  SWIG_TypeNewClientData(SWIGTYPE_p_std__vectorT_SOMcomponent_std__allocatorT_SOMcomponent_t_t, SWIG_NewClientData(obj));
+  PyObject *obj = NULL;
+  if (!SWIG_Python_UnpackTuple(args, "swigregister", 1, 1, &obj)) return NULL;
+  SWIG_TypeNewClientData(SWIGTYPE_p_std__vectorT_SOMcomponent_t, SWIG_NewClientData(obj));
   return SWIG_Py_Void();
 }
 
@@ -10508,16 +10100,17 @@ SWIGINTERN PyObject *component_set_swiginit(PyObject *SWIGUNUSEDPARM(self), PyOb
   return SWIG_Python_InitShadowInstance(args);
 }
 
-SWIGINTERN PyObject *_wrap_SOM_get_pool_types(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_SOM_get_pool_types(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
   component_set *result = 0 ;
   
-  if (!SWIG_Python_UnpackTuple(args,"SOM_get_pool_types",0,0,0)) SWIG_fail;
+  (void)self;
+  if (!SWIG_Python_UnpackTuple(args, "SOM_get_pool_types", 0, 0, 0)) SWIG_fail;
   {
     try {
       result = (component_set *) &SOM::get_pool_types();
     } 
-    /*@SWIG:C:\Apps\swigwin-3.0.12\Lib\typemaps\exception.swg,58,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
+    /*@SWIG:/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/swig/data/share/swig/4.5.1/typemaps/exception.swg,59,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
     catch (std::invalid_argument& e) {
       SWIG_exception_fail(SWIG_ValueError, e.what() );
     } catch (std::domain_error& e) {
@@ -10542,7 +10135,7 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_SOM_add_component(PyObject *SWIGUNUSEDPARM(self), PyObject *args, PyObject *kwargs) {
+SWIGINTERN PyObject *_wrap_SOM_add_component(PyObject *self, PyObject *args, PyObject *kwargs) {
   PyObject *resultobj = 0;
   std::string arg1 ;
   bool arg2 ;
@@ -10574,12 +10167,13 @@ SWIGINTERN PyObject *_wrap_SOM_add_component(PyObject *SWIGUNUSEDPARM(self), PyO
   PyObject * obj5 = 0 ;
   PyObject * obj6 = 0 ;
   PyObject * obj7 = 0 ;
-  char *  kwnames[] = {
-    (char *) "name",(char *) "is_stored",(char *) "k_pot",(char *) "E_a",(char *) "K_w",(char *) "n_w",(char *) "K_pH",(char *) "m_pH", NULL 
+  char * kwnames[] = {
+    (char *)"name",  (char *)"is_stored",  (char *)"k_pot",  (char *)"E_a",  (char *)"K_w",  (char *)"n_w",  (char *)"K_pH",  (char *)"m_pH",  NULL 
   };
-  SOMcomponent result;
+  SwigValueWrapper< SOMcomponent > result;
   
-  if (!PyArg_ParseTupleAndKeywords(args,kwargs,(char *)"OOOOOOOO:SOM_add_component",kwnames,&obj0,&obj1,&obj2,&obj3,&obj4,&obj5,&obj6,&obj7)) SWIG_fail;
+  (void)self;
+  if (!PyArg_ParseTupleAndKeywords(args, kwargs, "OOOOOOOO:SOM_add_component", kwnames, &obj0, &obj1, &obj2, &obj3, &obj4, &obj5, &obj6, &obj7)) SWIG_fail;
   {
     std::string *ptr = (std::string *)0;
     int res = SWIG_AsPtr_std_string(obj0, &ptr);
@@ -10626,9 +10220,57 @@ SWIGINTERN PyObject *_wrap_SOM_add_component(PyObject *SWIGUNUSEDPARM(self), PyO
   arg8 = static_cast< double >(val8);
   {
     try {
-      result = SOM::add_component(arg1,arg2,arg3,arg4,arg5,arg6,arg7,arg8);
+      result = SOM::add_component(SWIG_STD_MOVE(*(&arg1)),arg2,arg3,arg4,arg5,arg6,arg7,arg8);
+    } 
+    /*@SWIG:/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/swig/data/share/swig/4.5.1/typemaps/exception.swg,59,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
+    catch (std::invalid_argument& e) {
+      SWIG_exception_fail(SWIG_ValueError, e.what() );
+    } catch (std::domain_error& e) {
+      SWIG_exception_fail(SWIG_ValueError, e.what() );
+    } catch (std::overflow_error& e) {
+      SWIG_exception_fail(SWIG_OverflowError, e.what() );
+    } catch (std::out_of_range& e) {
+      SWIG_exception_fail(SWIG_IndexError, e.what() );
+    } catch (std::length_error& e) {
+      SWIG_exception_fail(SWIG_IndexError, e.what() );
+    } catch (std::runtime_error& e) {
+      SWIG_exception_fail(SWIG_RuntimeError, e.what() );
+    } catch (std::exception& e) {
+      SWIG_exception_fail(SWIG_SystemError, e.what() );
+    }
+    /*@SWIG@*/
+  }
+  resultobj = SWIG_NewPointerObj((new SOMcomponent(result)), SWIGTYPE_p_SOMcomponent, SWIG_POINTER_OWN |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_SOM_remove_component(PyObject *self, PyObject *args, PyObject *kwargs) {
+  PyObject *resultobj = 0;
+  std::string arg1 ;
+  PyObject * obj0 = 0 ;
+  char * kwnames[] = {
+    (char *)"name",  NULL 
+  };
+  
+  (void)self;
+  if (!PyArg_ParseTupleAndKeywords(args, kwargs, "O:SOM_remove_component", kwnames, &obj0)) SWIG_fail;
+  {
+    std::string *ptr = (std::string *)0;
+    int res = SWIG_AsPtr_std_string(obj0, &ptr);
+    if (!SWIG_IsOK(res) || !ptr) {
+      SWIG_exception_fail(SWIG_ArgError((ptr ? res : SWIG_TypeError)), "in method '" "SOM_remove_component" "', argument " "1"" of type '" "std::string""'"); 
+    }
+    arg1 = *ptr;
+    if (SWIG_IsNewObj(res)) delete ptr;
+  }
+  {
+    try {
+      SOM::remove_component(SWIG_STD_MOVE(*(&arg1)));
     } 
-    /*@SWIG:C:\Apps\swigwin-3.0.12\Lib\typemaps\exception.swg,58,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
+    /*@SWIG:/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/swig/data/share/swig/4.5.1/typemaps/exception.swg,59,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
     catch (std::invalid_argument& e) {
       SWIG_exception_fail(SWIG_ValueError, e.what() );
     } catch (std::domain_error& e) {
@@ -10646,16 +10288,16 @@ SWIGINTERN PyObject *_wrap_SOM_add_component(PyObject *SWIGUNUSEDPARM(self), PyO
     }
     /*@SWIG@*/
   }
-  resultobj = SWIG_NewPointerObj((new SOMcomponent(static_cast< const SOMcomponent& >(result))), SWIGTYPE_p_SOMcomponent, SWIG_POINTER_OWN |  0 );
+  resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_SOM_N_set(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_SOM_N_set(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  SOM *arg1 = (SOM *) 0 ;
+  SOM *arg1 = 0 ;
   double arg2 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
@@ -10663,7 +10305,8 @@ SWIGINTERN PyObject *_wrap_SOM_N_set(PyObject *SWIGUNUSEDPARM(self), PyObject *a
   int ecode2 = 0 ;
   PyObject *swig_obj[2] ;
   
-  if (!SWIG_Python_UnpackTuple(args,"SOM_N_set",2,2,swig_obj)) SWIG_fail;
+  (void)self;
+  if (!SWIG_Python_UnpackTuple(args, "SOM_N_set", 2, 2, swig_obj)) SWIG_fail;
   res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_SOM, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "SOM_N_set" "', argument " "1"" of type '" "SOM *""'"); 
@@ -10682,14 +10325,15 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_SOM_N_get(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_SOM_N_get(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  SOM *arg1 = (SOM *) 0 ;
+  SOM *arg1 = 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   PyObject *swig_obj[1] ;
   double result;
   
+  (void)self;
   if (!args) SWIG_fail;
   swig_obj[0] = args;
   res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_SOM, 0 |  0 );
@@ -10705,28 +10349,54 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_SOM_CNmin_set(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_SOM_set_CN_range(PyObject *self, PyObject *args, PyObject *kwargs) {
   PyObject *resultobj = 0;
-  SOM *arg1 = (SOM *) 0 ;
+  double arg1 ;
   double arg2 ;
-  void *argp1 = 0 ;
-  int res1 = 0 ;
+  double val1 ;
+  int ecode1 = 0 ;
   double val2 ;
   int ecode2 = 0 ;
-  PyObject *swig_obj[2] ;
+  PyObject * obj0 = 0 ;
+  PyObject * obj1 = 0 ;
+  char * kwnames[] = {
+    (char *)"CNmin",  (char *)"CNmax",  NULL 
+  };
   
-  if (!SWIG_Python_UnpackTuple(args,"SOM_CNmin_set",2,2,swig_obj)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_SOM, 0 |  0 );
-  if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "SOM_CNmin_set" "', argument " "1"" of type '" "SOM *""'"); 
-  }
-  arg1 = reinterpret_cast< SOM * >(argp1);
-  ecode2 = SWIG_AsVal_double(swig_obj[1], &val2);
+  (void)self;
+  if (!PyArg_ParseTupleAndKeywords(args, kwargs, "OO:SOM_set_CN_range", kwnames, &obj0, &obj1)) SWIG_fail;
+  ecode1 = SWIG_AsVal_double(obj0, &val1);
+  if (!SWIG_IsOK(ecode1)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode1), "in method '" "SOM_set_CN_range" "', argument " "1"" of type '" "double""'");
+  } 
+  arg1 = static_cast< double >(val1);
+  ecode2 = SWIG_AsVal_double(obj1, &val2);
   if (!SWIG_IsOK(ecode2)) {
-    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "SOM_CNmin_set" "', argument " "2"" of type '" "double""'");
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "SOM_set_CN_range" "', argument " "2"" of type '" "double""'");
   } 
   arg2 = static_cast< double >(val2);
-  if (arg1) (arg1)->CNmin = arg2;
+  {
+    try {
+      SOM::set_CN_range(arg1,arg2);
+    } 
+    /*@SWIG:/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/swig/data/share/swig/4.5.1/typemaps/exception.swg,59,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
+    catch (std::invalid_argument& e) {
+      SWIG_exception_fail(SWIG_ValueError, e.what() );
+    } catch (std::domain_error& e) {
+      SWIG_exception_fail(SWIG_ValueError, e.what() );
+    } catch (std::overflow_error& e) {
+      SWIG_exception_fail(SWIG_OverflowError, e.what() );
+    } catch (std::out_of_range& e) {
+      SWIG_exception_fail(SWIG_IndexError, e.what() );
+    } catch (std::length_error& e) {
+      SWIG_exception_fail(SWIG_IndexError, e.what() );
+    } catch (std::runtime_error& e) {
+      SWIG_exception_fail(SWIG_RuntimeError, e.what() );
+    } catch (std::exception& e) {
+      SWIG_exception_fail(SWIG_SystemError, e.what() );
+    }
+    /*@SWIG@*/
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -10734,22 +10404,34 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_SOM_CNmin_get(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_SOM_get_CNmin(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  SOM *arg1 = (SOM *) 0 ;
-  void *argp1 = 0 ;
-  int res1 = 0 ;
-  PyObject *swig_obj[1] ;
   double result;
   
-  if (!args) SWIG_fail;
-  swig_obj[0] = args;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_SOM, 0 |  0 );
-  if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "SOM_CNmin_get" "', argument " "1"" of type '" "SOM *""'"); 
+  (void)self;
+  if (!SWIG_Python_UnpackTuple(args, "SOM_get_CNmin", 0, 0, 0)) SWIG_fail;
+  {
+    try {
+      result = (double)SOM::get_CNmin();
+    } 
+    /*@SWIG:/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/swig/data/share/swig/4.5.1/typemaps/exception.swg,59,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
+    catch (std::invalid_argument& e) {
+      SWIG_exception_fail(SWIG_ValueError, e.what() );
+    } catch (std::domain_error& e) {
+      SWIG_exception_fail(SWIG_ValueError, e.what() );
+    } catch (std::overflow_error& e) {
+      SWIG_exception_fail(SWIG_OverflowError, e.what() );
+    } catch (std::out_of_range& e) {
+      SWIG_exception_fail(SWIG_IndexError, e.what() );
+    } catch (std::length_error& e) {
+      SWIG_exception_fail(SWIG_IndexError, e.what() );
+    } catch (std::runtime_error& e) {
+      SWIG_exception_fail(SWIG_RuntimeError, e.what() );
+    } catch (std::exception& e) {
+      SWIG_exception_fail(SWIG_SystemError, e.what() );
+    }
+    /*@SWIG@*/
   }
-  arg1 = reinterpret_cast< SOM * >(argp1);
-  result = (double) ((arg1)->CNmin);
   resultobj = SWIG_From_double(static_cast< double >(result));
   return resultobj;
 fail:
@@ -10757,61 +10439,79 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_SOM_CNmax_set(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_SOM_get_CNmax(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  SOM *arg1 = (SOM *) 0 ;
-  double arg2 ;
-  void *argp1 = 0 ;
-  int res1 = 0 ;
-  double val2 ;
-  int ecode2 = 0 ;
-  PyObject *swig_obj[2] ;
+  double result;
   
-  if (!SWIG_Python_UnpackTuple(args,"SOM_CNmax_set",2,2,swig_obj)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_SOM, 0 |  0 );
-  if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "SOM_CNmax_set" "', argument " "1"" of type '" "SOM *""'"); 
+  (void)self;
+  if (!SWIG_Python_UnpackTuple(args, "SOM_get_CNmax", 0, 0, 0)) SWIG_fail;
+  {
+    try {
+      result = (double)SOM::get_CNmax();
+    } 
+    /*@SWIG:/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/swig/data/share/swig/4.5.1/typemaps/exception.swg,59,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
+    catch (std::invalid_argument& e) {
+      SWIG_exception_fail(SWIG_ValueError, e.what() );
+    } catch (std::domain_error& e) {
+      SWIG_exception_fail(SWIG_ValueError, e.what() );
+    } catch (std::overflow_error& e) {
+      SWIG_exception_fail(SWIG_OverflowError, e.what() );
+    } catch (std::out_of_range& e) {
+      SWIG_exception_fail(SWIG_IndexError, e.what() );
+    } catch (std::length_error& e) {
+      SWIG_exception_fail(SWIG_IndexError, e.what() );
+    } catch (std::runtime_error& e) {
+      SWIG_exception_fail(SWIG_RuntimeError, e.what() );
+    } catch (std::exception& e) {
+      SWIG_exception_fail(SWIG_SystemError, e.what() );
+    }
+    /*@SWIG@*/
   }
-  arg1 = reinterpret_cast< SOM * >(argp1);
-  ecode2 = SWIG_AsVal_double(swig_obj[1], &val2);
-  if (!SWIG_IsOK(ecode2)) {
-    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "SOM_CNmax_set" "', argument " "2"" of type '" "double""'");
-  } 
-  arg2 = static_cast< double >(val2);
-  if (arg1) (arg1)->CNmax = arg2;
-  resultobj = SWIG_Py_Void();
+  resultobj = SWIG_From_double(static_cast< double >(result));
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_SOM_CNmax_get(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_SOM_inline_capacity(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  SOM *arg1 = (SOM *) 0 ;
-  void *argp1 = 0 ;
-  int res1 = 0 ;
-  PyObject *swig_obj[1] ;
-  double result;
+  int result;
   
-  if (!args) SWIG_fail;
-  swig_obj[0] = args;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_SOM, 0 |  0 );
-  if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "SOM_CNmax_get" "', argument " "1"" of type '" "SOM *""'"); 
+  (void)self;
+  if (!SWIG_Python_UnpackTuple(args, "SOM_inline_capacity", 0, 0, 0)) SWIG_fail;
+  {
+    try {
+      result = (int)SOM::inline_capacity();
+    } 
+    /*@SWIG:/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/swig/data/share/swig/4.5.1/typemaps/exception.swg,59,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
+    catch (std::invalid_argument& e) {
+      SWIG_exception_fail(SWIG_ValueError, e.what() );
+    } catch (std::domain_error& e) {
+      SWIG_exception_fail(SWIG_ValueError, e.what() );
+    } catch (std::overflow_error& e) {
+      SWIG_exception_fail(SWIG_OverflowError, e.what() );
+    } catch (std::out_of_range& e) {
+      SWIG_exception_fail(SWIG_IndexError, e.what() );
+    } catch (std::length_error& e) {
+      SWIG_exception_fail(SWIG_IndexError, e.what() );
+    } catch (std::runtime_error& e) {
+      SWIG_exception_fail(SWIG_RuntimeError, e.what() );
+    } catch (std::exception& e) {
+      SWIG_exception_fail(SWIG_SystemError, e.what() );
+    }
+    /*@SWIG@*/
   }
-  arg1 = reinterpret_cast< SOM * >(argp1);
-  result = (double) ((arg1)->CNmax);
-  resultobj = SWIG_From_double(static_cast< double >(result));
+  resultobj = SWIG_From_int(static_cast< int >(result));
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_SOM_get_C_pool(PyObject *SWIGUNUSEDPARM(self), PyObject *args, PyObject *kwargs) {
+SWIGINTERN PyObject *_wrap_SOM_get_C_pool(PyObject *self, PyObject *args, PyObject *kwargs) {
   PyObject *resultobj = 0;
-  SOM *arg1 = (SOM *) 0 ;
+  SOM *arg1 = 0 ;
   int arg2 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
@@ -10819,12 +10519,13 @@ SWIGINTERN PyObject *_wrap_SOM_get_C_pool(PyObject *SWIGUNUSEDPARM(self), PyObje
   int ecode2 = 0 ;
   PyObject * obj0 = 0 ;
   PyObject * obj1 = 0 ;
-  char *  kwnames[] = {
-    (char *) "self",(char *) "index", NULL 
+  char * kwnames[] = {
+    (char *)"self",  (char *)"index",  NULL 
   };
   double result;
   
-  if (!PyArg_ParseTupleAndKeywords(args,kwargs,(char *)"OO:SOM_get_C_pool",kwnames,&obj0,&obj1)) SWIG_fail;
+  (void)self;
+  if (!PyArg_ParseTupleAndKeywords(args, kwargs, "OO:SOM_get_C_pool", kwnames, &obj0, &obj1)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_SOM, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "SOM_get_C_pool" "', argument " "1"" of type '" "SOM const *""'"); 
@@ -10839,7 +10540,7 @@ SWIGINTERN PyObject *_wrap_SOM_get_C_pool(PyObject *SWIGUNUSEDPARM(self), PyObje
     try {
       result = (double)((SOM const *)arg1)->get_C_pool(arg2);
     } 
-    /*@SWIG:C:\Apps\swigwin-3.0.12\Lib\typemaps\exception.swg,58,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
+    /*@SWIG:/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/swig/data/share/swig/4.5.1/typemaps/exception.swg,59,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
     catch (std::invalid_argument& e) {
       SWIG_exception_fail(SWIG_ValueError, e.what() );
     } catch (std::domain_error& e) {
@@ -10864,9 +10565,9 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_SOM_set_C_pool(PyObject *SWIGUNUSEDPARM(self), PyObject *args, PyObject *kwargs) {
+SWIGINTERN PyObject *_wrap_SOM_set_C_pool(PyObject *self, PyObject *args, PyObject *kwargs) {
   PyObject *resultobj = 0;
-  SOM *arg1 = (SOM *) 0 ;
+  SOM *arg1 = 0 ;
   int arg2 ;
   double arg3 ;
   void *argp1 = 0 ;
@@ -10878,11 +10579,12 @@ SWIGINTERN PyObject *_wrap_SOM_set_C_pool(PyObject *SWIGUNUSEDPARM(self), PyObje
   PyObject * obj0 = 0 ;
   PyObject * obj1 = 0 ;
   PyObject * obj2 = 0 ;
-  char *  kwnames[] = {
-    (char *) "self",(char *) "index",(char *) "pool_size", NULL 
+  char * kwnames[] = {
+    (char *)"self",  (char *)"index",  (char *)"pool_size",  NULL 
   };
   
-  if (!PyArg_ParseTupleAndKeywords(args,kwargs,(char *)"OOO:SOM_set_C_pool",kwnames,&obj0,&obj1,&obj2)) SWIG_fail;
+  (void)self;
+  if (!PyArg_ParseTupleAndKeywords(args, kwargs, "OOO:SOM_set_C_pool", kwnames, &obj0, &obj1, &obj2)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_SOM, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "SOM_set_C_pool" "', argument " "1"" of type '" "SOM *""'"); 
@@ -10902,7 +10604,7 @@ SWIGINTERN PyObject *_wrap_SOM_set_C_pool(PyObject *SWIGUNUSEDPARM(self), PyObje
     try {
       (arg1)->set_C_pool(arg2,arg3);
     } 
-    /*@SWIG:C:\Apps\swigwin-3.0.12\Lib\typemaps\exception.swg,58,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
+    /*@SWIG:/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/swig/data/share/swig/4.5.1/typemaps/exception.swg,59,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
     catch (std::invalid_argument& e) {
       SWIG_exception_fail(SWIG_ValueError, e.what() );
     } catch (std::domain_error& e) {
@@ -10927,9 +10629,9 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_SOM___imul__(PyObject *SWIGUNUSEDPARM(self), PyObject *args, PyObject *kwargs) {
+SWIGINTERN PyObject *_wrap_SOM___imul__(PyObject *self, PyObject *args, PyObject *kwargs) {
   PyObject *resultobj = 0;
-  SOM *arg1 = (SOM *) 0 ;
+  SOM *arg1 = 0 ;
   double arg2 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
@@ -10937,12 +10639,13 @@ SWIGINTERN PyObject *_wrap_SOM___imul__(PyObject *SWIGUNUSEDPARM(self), PyObject
   int ecode2 = 0 ;
   PyObject * obj0 = 0 ;
   PyObject * obj1 = 0 ;
-  char *  kwnames[] = {
-    (char *) "self",(char *) "right", NULL 
+  char * kwnames[] = {
+    (char *)"self",  (char *)"right",  NULL 
   };
   SOM *result = 0 ;
   
-  if (!PyArg_ParseTupleAndKeywords(args,kwargs,(char *)"OO:SOM___imul__",kwnames,&obj0,&obj1)) SWIG_fail;
+  (void)self;
+  if (!PyArg_ParseTupleAndKeywords(args, kwargs, "OO:SOM___imul__", kwnames, &obj0, &obj1)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_SOM, SWIG_POINTER_DISOWN |  0 );
   if (!SWIG_IsOK(res1)) {
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "SOM___imul__" "', argument " "1"" of type '" "SOM *""'"); 
@@ -10957,7 +10660,7 @@ SWIGINTERN PyObject *_wrap_SOM___imul__(PyObject *SWIGUNUSEDPARM(self), PyObject
     try {
       result = (SOM *) &(arg1)->operator *=(arg2);
     } 
-    /*@SWIG:C:\Apps\swigwin-3.0.12\Lib\typemaps\exception.swg,58,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
+    /*@SWIG:/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/swig/data/share/swig/4.5.1/typemaps/exception.swg,59,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
     catch (std::invalid_argument& e) {
       SWIG_exception_fail(SWIG_ValueError, e.what() );
     } catch (std::domain_error& e) {
@@ -10982,9 +10685,9 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_SOM___mul__(PyObject *SWIGUNUSEDPARM(self), PyObject *args, PyObject *kwargs) {
+SWIGINTERN PyObject *_wrap_SOM___mul__(PyObject *self, PyObject *args, PyObject *kwargs) {
   PyObject *resultobj = 0;
-  SOM *arg1 = (SOM *) 0 ;
+  SOM *arg1 = 0 ;
   double arg2 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
@@ -10992,12 +10695,13 @@ SWIGINTERN PyObject *_wrap_SOM___mul__(PyObject *SWIGUNUSEDPARM(self), PyObject
   int ecode2 = 0 ;
   PyObject * obj0 = 0 ;
   PyObject * obj1 = 0 ;
-  char *  kwnames[] = {
-    (char *) "self",(char *) "right", NULL 
+  char * kwnames[] = {
+    (char *)"self",  (char *)"right",  NULL 
   };
   SOM result;
   
-  if (!PyArg_ParseTupleAndKeywords(args,kwargs,(char *)"OO:SOM___mul__",kwnames,&obj0,&obj1)) SWIG_fail;
+  (void)self;
+  if (!PyArg_ParseTupleAndKeywords(args, kwargs, "OO:SOM___mul__", kwnames, &obj0, &obj1)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_SOM, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "SOM___mul__" "', argument " "1"" of type '" "SOM const *""'"); 
@@ -11012,7 +10716,7 @@ SWIGINTERN PyObject *_wrap_SOM___mul__(PyObject *SWIGUNUSEDPARM(self), PyObject
     try {
       result = ((SOM const *)arg1)->operator *(arg2);
     } 
-    /*@SWIG:C:\Apps\swigwin-3.0.12\Lib\typemaps\exception.swg,58,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
+    /*@SWIG:/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/swig/data/share/swig/4.5.1/typemaps/exception.swg,59,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
     catch (std::invalid_argument& e) {
       SWIG_exception_fail(SWIG_ValueError, e.what() );
     } catch (std::domain_error& e) {
@@ -11030,16 +10734,21 @@ SWIGINTERN PyObject *_wrap_SOM___mul__(PyObject *SWIGUNUSEDPARM(self), PyObject
     }
     /*@SWIG@*/
   }
-  resultobj = SWIG_NewPointerObj((new SOM(static_cast< const SOM& >(result))), SWIGTYPE_p_SOM, SWIG_POINTER_OWN |  0 );
+  resultobj = SWIG_NewPointerObj((new SOM(result)), SWIGTYPE_p_SOM, SWIG_POINTER_OWN |  0 );
   return resultobj;
 fail:
-  return NULL;
+  if (PyErr_Occurred() && !PyErr_ExceptionMatches(PyExc_TypeError)) {
+    return NULL;
+  }
+  PyErr_Clear();
+  SWIG_Py_INCREF(Py_NotImplemented);
+  return Py_NotImplemented;
 }
 
 
-SWIGINTERN PyObject *_wrap_SOM___iadd__(PyObject *SWIGUNUSEDPARM(self), PyObject *args, PyObject *kwargs) {
+SWIGINTERN PyObject *_wrap_SOM___iadd__(PyObject *self, PyObject *args, PyObject *kwargs) {
   PyObject *resultobj = 0;
-  SOM *arg1 = (SOM *) 0 ;
+  SOM *arg1 = 0 ;
   SOM *arg2 = 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
@@ -11047,12 +10756,13 @@ SWIGINTERN PyObject *_wrap_SOM___iadd__(PyObject *SWIGUNUSEDPARM(self), PyObject
   int res2 = 0 ;
   PyObject * obj0 = 0 ;
   PyObject * obj1 = 0 ;
-  char *  kwnames[] = {
-    (char *) "self",(char *) "right", NULL 
+  char * kwnames[] = {
+    (char *)"self",  (char *)"right",  NULL 
   };
   SOM *result = 0 ;
   
-  if (!PyArg_ParseTupleAndKeywords(args,kwargs,(char *)"OO:SOM___iadd__",kwnames,&obj0,&obj1)) SWIG_fail;
+  (void)self;
+  if (!PyArg_ParseTupleAndKeywords(args, kwargs, "OO:SOM___iadd__", kwnames, &obj0, &obj1)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_SOM, SWIG_POINTER_DISOWN |  0 );
   if (!SWIG_IsOK(res1)) {
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "SOM___iadd__" "', argument " "1"" of type '" "SOM *""'"); 
@@ -11063,14 +10773,14 @@ SWIGINTERN PyObject *_wrap_SOM___iadd__(PyObject *SWIGUNUSEDPARM(self), PyObject
     SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "SOM___iadd__" "', argument " "2"" of type '" "SOM const &""'"); 
   }
   if (!argp2) {
-    SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "SOM___iadd__" "', argument " "2"" of type '" "SOM const &""'"); 
+    SWIG_exception_fail(SWIG_NullReferenceError, "invalid null reference " "in method '" "SOM___iadd__" "', argument " "2"" of type '" "SOM const &""'"); 
   }
   arg2 = reinterpret_cast< SOM * >(argp2);
   {
     try {
       result = (SOM *) &(arg1)->operator +=((SOM const &)*arg2);
     } 
-    /*@SWIG:C:\Apps\swigwin-3.0.12\Lib\typemaps\exception.swg,58,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
+    /*@SWIG:/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/swig/data/share/swig/4.5.1/typemaps/exception.swg,59,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
     catch (std::invalid_argument& e) {
       SWIG_exception_fail(SWIG_ValueError, e.what() );
     } catch (std::domain_error& e) {
@@ -11095,9 +10805,9 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_SOM___isub__(PyObject *SWIGUNUSEDPARM(self), PyObject *args, PyObject *kwargs) {
+SWIGINTERN PyObject *_wrap_SOM___isub__(PyObject *self, PyObject *args, PyObject *kwargs) {
   PyObject *resultobj = 0;
-  SOM *arg1 = (SOM *) 0 ;
+  SOM *arg1 = 0 ;
   SOM *arg2 = 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
@@ -11105,12 +10815,13 @@ SWIGINTERN PyObject *_wrap_SOM___isub__(PyObject *SWIGUNUSEDPARM(self), PyObject
   int res2 = 0 ;
   PyObject * obj0 = 0 ;
   PyObject * obj1 = 0 ;
-  char *  kwnames[] = {
-    (char *) "self",(char *) "right", NULL 
+  char * kwnames[] = {
+    (char *)"self",  (char *)"right",  NULL 
   };
   SOM *result = 0 ;
   
-  if (!PyArg_ParseTupleAndKeywords(args,kwargs,(char *)"OO:SOM___isub__",kwnames,&obj0,&obj1)) SWIG_fail;
+  (void)self;
+  if (!PyArg_ParseTupleAndKeywords(args, kwargs, "OO:SOM___isub__", kwnames, &obj0, &obj1)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_SOM, SWIG_POINTER_DISOWN |  0 );
   if (!SWIG_IsOK(res1)) {
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "SOM___isub__" "', argument " "1"" of type '" "SOM *""'"); 
@@ -11121,14 +10832,14 @@ SWIGINTERN PyObject *_wrap_SOM___isub__(PyObject *SWIGUNUSEDPARM(self), PyObject
     SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "SOM___isub__" "', argument " "2"" of type '" "SOM const &""'"); 
   }
   if (!argp2) {
-    SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "SOM___isub__" "', argument " "2"" of type '" "SOM const &""'"); 
+    SWIG_exception_fail(SWIG_NullReferenceError, "invalid null reference " "in method '" "SOM___isub__" "', argument " "2"" of type '" "SOM const &""'"); 
   }
   arg2 = reinterpret_cast< SOM * >(argp2);
   {
     try {
       result = (SOM *) &(arg1)->operator -=((SOM const &)*arg2);
     } 
-    /*@SWIG:C:\Apps\swigwin-3.0.12\Lib\typemaps\exception.swg,58,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
+    /*@SWIG:/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/swig/data/share/swig/4.5.1/typemaps/exception.swg,59,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
     catch (std::invalid_argument& e) {
       SWIG_exception_fail(SWIG_ValueError, e.what() );
     } catch (std::domain_error& e) {
@@ -11153,9 +10864,9 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_SOM___add__(PyObject *SWIGUNUSEDPARM(self), PyObject *args, PyObject *kwargs) {
+SWIGINTERN PyObject *_wrap_SOM___add__(PyObject *self, PyObject *args, PyObject *kwargs) {
   PyObject *resultobj = 0;
-  SOM *arg1 = (SOM *) 0 ;
+  SOM *arg1 = 0 ;
   SOM *arg2 = 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
@@ -11163,12 +10874,13 @@ SWIGINTERN PyObject *_wrap_SOM___add__(PyObject *SWIGUNUSEDPARM(self), PyObject
   int res2 = 0 ;
   PyObject * obj0 = 0 ;
   PyObject * obj1 = 0 ;
-  char *  kwnames[] = {
-    (char *) "self",(char *) "right", NULL 
+  char * kwnames[] = {
+    (char *)"self",  (char *)"right",  NULL 
   };
   SOM result;
   
-  if (!PyArg_ParseTupleAndKeywords(args,kwargs,(char *)"OO:SOM___add__",kwnames,&obj0,&obj1)) SWIG_fail;
+  (void)self;
+  if (!PyArg_ParseTupleAndKeywords(args, kwargs, "OO:SOM___add__", kwnames, &obj0, &obj1)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_SOM, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "SOM___add__" "', argument " "1"" of type '" "SOM const *""'"); 
@@ -11179,14 +10891,14 @@ SWIGINTERN PyObject *_wrap_SOM___add__(PyObject *SWIGUNUSEDPARM(self), PyObject
     SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "SOM___add__" "', argument " "2"" of type '" "SOM const &""'"); 
   }
   if (!argp2) {
-    SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "SOM___add__" "', argument " "2"" of type '" "SOM const &""'"); 
+    SWIG_exception_fail(SWIG_NullReferenceError, "invalid null reference " "in method '" "SOM___add__" "', argument " "2"" of type '" "SOM const &""'"); 
   }
   arg2 = reinterpret_cast< SOM * >(argp2);
   {
     try {
       result = ((SOM const *)arg1)->operator +((SOM const &)*arg2);
     } 
-    /*@SWIG:C:\Apps\swigwin-3.0.12\Lib\typemaps\exception.swg,58,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
+    /*@SWIG:/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/swig/data/share/swig/4.5.1/typemaps/exception.swg,59,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
     catch (std::invalid_argument& e) {
       SWIG_exception_fail(SWIG_ValueError, e.what() );
     } catch (std::domain_error& e) {
@@ -11204,16 +10916,21 @@ SWIGINTERN PyObject *_wrap_SOM___add__(PyObject *SWIGUNUSEDPARM(self), PyObject
     }
     /*@SWIG@*/
   }
-  resultobj = SWIG_NewPointerObj((new SOM(static_cast< const SOM& >(result))), SWIGTYPE_p_SOM, SWIG_POINTER_OWN |  0 );
+  resultobj = SWIG_NewPointerObj((new SOM(result)), SWIGTYPE_p_SOM, SWIG_POINTER_OWN |  0 );
   return resultobj;
 fail:
-  return NULL;
+  if (PyErr_Occurred() && !PyErr_ExceptionMatches(PyExc_TypeError)) {
+    return NULL;
+  }
+  PyErr_Clear();
+  SWIG_Py_INCREF(Py_NotImplemented);
+  return Py_NotImplemented;
 }
 
 
-SWIGINTERN PyObject *_wrap_SOM___sub__(PyObject *SWIGUNUSEDPARM(self), PyObject *args, PyObject *kwargs) {
+SWIGINTERN PyObject *_wrap_SOM___sub__(PyObject *self, PyObject *args, PyObject *kwargs) {
   PyObject *resultobj = 0;
-  SOM *arg1 = (SOM *) 0 ;
+  SOM *arg1 = 0 ;
   SOM *arg2 = 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
@@ -11221,12 +10938,13 @@ SWIGINTERN PyObject *_wrap_SOM___sub__(PyObject *SWIGUNUSEDPARM(self), PyObject
   int res2 = 0 ;
   PyObject * obj0 = 0 ;
   PyObject * obj1 = 0 ;
-  char *  kwnames[] = {
-    (char *) "self",(char *) "right", NULL 
+  char * kwnames[] = {
+    (char *)"self",  (char *)"right",  NULL 
   };
   SOM result;
   
-  if (!PyArg_ParseTupleAndKeywords(args,kwargs,(char *)"OO:SOM___sub__",kwnames,&obj0,&obj1)) SWIG_fail;
+  (void)self;
+  if (!PyArg_ParseTupleAndKeywords(args, kwargs, "OO:SOM___sub__", kwnames, &obj0, &obj1)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_SOM, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "SOM___sub__" "', argument " "1"" of type '" "SOM const *""'"); 
@@ -11237,14 +10955,14 @@ SWIGINTERN PyObject *_wrap_SOM___sub__(PyObject *SWIGUNUSEDPARM(self), PyObject
     SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "SOM___sub__" "', argument " "2"" of type '" "SOM const &""'"); 
   }
   if (!argp2) {
-    SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "SOM___sub__" "', argument " "2"" of type '" "SOM const &""'"); 
+    SWIG_exception_fail(SWIG_NullReferenceError, "invalid null reference " "in method '" "SOM___sub__" "', argument " "2"" of type '" "SOM const &""'"); 
   }
   arg2 = reinterpret_cast< SOM * >(argp2);
   {
     try {
       result = ((SOM const *)arg1)->operator -((SOM const &)*arg2);
     } 
-    /*@SWIG:C:\Apps\swigwin-3.0.12\Lib\typemaps\exception.swg,58,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
+    /*@SWIG:/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/swig/data/share/swig/4.5.1/typemaps/exception.swg,59,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
     catch (std::invalid_argument& e) {
       SWIG_exception_fail(SWIG_ValueError, e.what() );
     } catch (std::domain_error& e) {
@@ -11262,16 +10980,21 @@ SWIGINTERN PyObject *_wrap_SOM___sub__(PyObject *SWIGUNUSEDPARM(self), PyObject
     }
     /*@SWIG@*/
   }
-  resultobj = SWIG_NewPointerObj((new SOM(static_cast< const SOM& >(result))), SWIGTYPE_p_SOM, SWIG_POINTER_OWN |  0 );
+  resultobj = SWIG_NewPointerObj((new SOM(result)), SWIGTYPE_p_SOM, SWIG_POINTER_OWN |  0 );
   return resultobj;
 fail:
-  return NULL;
+  if (PyErr_Occurred() && !PyErr_ExceptionMatches(PyExc_TypeError)) {
+    return NULL;
+  }
+  PyErr_Clear();
+  SWIG_Py_INCREF(Py_NotImplemented);
+  return Py_NotImplemented;
 }
 
 
-SWIGINTERN PyObject *_wrap_SOM___itruediv__(PyObject *SWIGUNUSEDPARM(self), PyObject *args, PyObject *kwargs) {
+SWIGINTERN PyObject *_wrap_SOM___itruediv__(PyObject *self, PyObject *args, PyObject *kwargs) {
   PyObject *resultobj = 0;
-  SOM *arg1 = (SOM *) 0 ;
+  SOM *arg1 = 0 ;
   double arg2 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
@@ -11279,12 +11002,13 @@ SWIGINTERN PyObject *_wrap_SOM___itruediv__(PyObject *SWIGUNUSEDPARM(self), PyOb
   int ecode2 = 0 ;
   PyObject * obj0 = 0 ;
   PyObject * obj1 = 0 ;
-  char *  kwnames[] = {
-    (char *) "self",(char *) "right", NULL 
+  char * kwnames[] = {
+    (char *)"self",  (char *)"right",  NULL 
   };
   SOM *result = 0 ;
   
-  if (!PyArg_ParseTupleAndKeywords(args,kwargs,(char *)"OO:SOM___itruediv__",kwnames,&obj0,&obj1)) SWIG_fail;
+  (void)self;
+  if (!PyArg_ParseTupleAndKeywords(args, kwargs, "OO:SOM___itruediv__", kwnames, &obj0, &obj1)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_SOM, SWIG_POINTER_DISOWN |  0 );
   if (!SWIG_IsOK(res1)) {
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "SOM___itruediv__" "', argument " "1"" of type '" "SOM *""'"); 
@@ -11299,7 +11023,7 @@ SWIGINTERN PyObject *_wrap_SOM___itruediv__(PyObject *SWIGUNUSEDPARM(self), PyOb
     try {
       result = (SOM *) &(arg1)->operator /=(arg2);
     } 
-    /*@SWIG:C:\Apps\swigwin-3.0.12\Lib\typemaps\exception.swg,58,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
+    /*@SWIG:/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/swig/data/share/swig/4.5.1/typemaps/exception.swg,59,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
     catch (std::invalid_argument& e) {
       SWIG_exception_fail(SWIG_ValueError, e.what() );
     } catch (std::domain_error& e) {
@@ -11324,9 +11048,76 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_SOM___truediv__(PyObject *SWIGUNUSEDPARM(self), PyObject *args, PyObject *kwargs) {
+SWIGINTERN PyObject *_wrap_SOM_add_scaled(PyObject *self, PyObject *args, PyObject *kwargs) {
+  PyObject *resultobj = 0;
+  SOM *arg1 = 0 ;
+  SOM *arg2 = 0 ;
+  double arg3 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  double val3 ;
+  int ecode3 = 0 ;
+  PyObject * obj0 = 0 ;
+  PyObject * obj1 = 0 ;
+  PyObject * obj2 = 0 ;
+  char * kwnames[] = {
+    (char *)"self",  (char *)"som_template",  (char *)"mass",  NULL 
+  };
+  
+  (void)self;
+  if (!PyArg_ParseTupleAndKeywords(args, kwargs, "OOO:SOM_add_scaled", kwnames, &obj0, &obj1, &obj2)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_SOM, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "SOM_add_scaled" "', argument " "1"" of type '" "SOM *""'"); 
+  }
+  arg1 = reinterpret_cast< SOM * >(argp1);
+  res2 = SWIG_ConvertPtr(obj1, &argp2, SWIGTYPE_p_SOM,  0  | 0);
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "SOM_add_scaled" "', argument " "2"" of type '" "SOM const &""'"); 
+  }
+  if (!argp2) {
+    SWIG_exception_fail(SWIG_NullReferenceError, "invalid null reference " "in method '" "SOM_add_scaled" "', argument " "2"" of type '" "SOM const &""'"); 
+  }
+  arg2 = reinterpret_cast< SOM * >(argp2);
+  ecode3 = SWIG_AsVal_double(obj2, &val3);
+  if (!SWIG_IsOK(ecode3)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "SOM_add_scaled" "', argument " "3"" of type '" "double""'");
+  } 
+  arg3 = static_cast< double >(val3);
+  {
+    try {
+      (arg1)->add_scaled((SOM const &)*arg2,arg3);
+    } 
+    /*@SWIG:/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/swig/data/share/swig/4.5.1/typemaps/exception.swg,59,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
+    catch (std::invalid_argument& e) {
+      SWIG_exception_fail(SWIG_ValueError, e.what() );
+    } catch (std::domain_error& e) {
+      SWIG_exception_fail(SWIG_ValueError, e.what() );
+    } catch (std::overflow_error& e) {
+      SWIG_exception_fail(SWIG_OverflowError, e.what() );
+    } catch (std::out_of_range& e) {
+      SWIG_exception_fail(SWIG_IndexError, e.what() );
+    } catch (std::length_error& e) {
+      SWIG_exception_fail(SWIG_IndexError, e.what() );
+    } catch (std::runtime_error& e) {
+      SWIG_exception_fail(SWIG_RuntimeError, e.what() );
+    } catch (std::exception& e) {
+      SWIG_exception_fail(SWIG_SystemError, e.what() );
+    }
+    /*@SWIG@*/
+  }
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_SOM___truediv__(PyObject *self, PyObject *args, PyObject *kwargs) {
   PyObject *resultobj = 0;
-  SOM *arg1 = (SOM *) 0 ;
+  SOM *arg1 = 0 ;
   double arg2 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
@@ -11334,12 +11125,13 @@ SWIGINTERN PyObject *_wrap_SOM___truediv__(PyObject *SWIGUNUSEDPARM(self), PyObj
   int ecode2 = 0 ;
   PyObject * obj0 = 0 ;
   PyObject * obj1 = 0 ;
-  char *  kwnames[] = {
-    (char *) "self",(char *) "right", NULL 
+  char * kwnames[] = {
+    (char *)"self",  (char *)"right",  NULL 
   };
   SOM result;
   
-  if (!PyArg_ParseTupleAndKeywords(args,kwargs,(char *)"OO:SOM___truediv__",kwnames,&obj0,&obj1)) SWIG_fail;
+  (void)self;
+  if (!PyArg_ParseTupleAndKeywords(args, kwargs, "OO:SOM___truediv__", kwnames, &obj0, &obj1)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_SOM, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "SOM___truediv__" "', argument " "1"" of type '" "SOM *""'"); 
@@ -11354,7 +11146,7 @@ SWIGINTERN PyObject *_wrap_SOM___truediv__(PyObject *SWIGUNUSEDPARM(self), PyObj
     try {
       result = (arg1)->operator /(arg2);
     } 
-    /*@SWIG:C:\Apps\swigwin-3.0.12\Lib\typemaps\exception.swg,58,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
+    /*@SWIG:/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/swig/data/share/swig/4.5.1/typemaps/exception.swg,59,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
     catch (std::invalid_argument& e) {
       SWIG_exception_fail(SWIG_ValueError, e.what() );
     } catch (std::domain_error& e) {
@@ -11372,20 +11164,25 @@ SWIGINTERN PyObject *_wrap_SOM___truediv__(PyObject *SWIGUNUSEDPARM(self), PyObj
     }
     /*@SWIG@*/
   }
-  resultobj = SWIG_NewPointerObj((new SOM(static_cast< const SOM& >(result))), SWIGTYPE_p_SOM, SWIG_POINTER_OWN |  0 );
+  resultobj = SWIG_NewPointerObj((new SOM(result)), SWIGTYPE_p_SOM, SWIG_POINTER_OWN |  0 );
   return resultobj;
 fail:
-  return NULL;
+  if (PyErr_Occurred() && !PyErr_ExceptionMatches(PyExc_TypeError)) {
+    return NULL;
+  }
+  PyErr_Clear();
+  SWIG_Py_INCREF(Py_NotImplemented);
+  return Py_NotImplemented;
 }
 
 
-SWIGINTERN PyObject *_wrap_SOM_dCdt(PyObject *SWIGUNUSEDPARM(self), PyObject *args, PyObject *kwargs) {
+SWIGINTERN PyObject *_wrap_SOM_dCdt(PyObject *self, PyObject *args, PyObject *kwargs) {
   PyObject *resultobj = 0;
-  SOM *arg1 = (SOM *) 0 ;
+  SOM *arg1 = 0 ;
   double arg2 ;
   double arg3 ;
   double arg4 ;
-  double arg5 = (double) 0 ;
+  double arg5 = 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   double val2 ;
@@ -11401,12 +11198,13 @@ SWIGINTERN PyObject *_wrap_SOM_dCdt(PyObject *SWIGUNUSEDPARM(self), PyObject *ar
   PyObject * obj2 = 0 ;
   PyObject * obj3 = 0 ;
   PyObject * obj4 = 0 ;
-  char *  kwnames[] = {
-    (char *) "self",(char *) "T",(char *) "wetness",(char *) "pH",(char *) "Nsol", NULL 
+  char * kwnames[] = {
+    (char *)"self",  (char *)"T",  (char *)"wetness",  (char *)"pH",  (char *)"Nsol",  NULL 
   };
   SOM result;
   
-  if (!PyArg_ParseTupleAndKeywords(args,kwargs,(char *)"OOOO|O:SOM_dCdt",kwnames,&obj0,&obj1,&obj2,&obj3,&obj4)) SWIG_fail;
+  (void)self;
+  if (!PyArg_ParseTupleAndKeywords(args, kwargs, "OOOO|O:SOM_dCdt", kwnames, &obj0, &obj1, &obj2, &obj3, &obj4)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_SOM, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "SOM_dCdt" "', argument " "1"" of type '" "SOM const *""'"); 
@@ -11438,7 +11236,7 @@ SWIGINTERN PyObject *_wrap_SOM_dCdt(PyObject *SWIGUNUSEDPARM(self), PyObject *ar
     try {
       result = ((SOM const *)arg1)->dCdt(arg2,arg3,arg4,arg5);
     } 
-    /*@SWIG:C:\Apps\swigwin-3.0.12\Lib\typemaps\exception.swg,58,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
+    /*@SWIG:/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/swig/data/share/swig/4.5.1/typemaps/exception.swg,59,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
     catch (std::invalid_argument& e) {
       SWIG_exception_fail(SWIG_ValueError, e.what() );
     } catch (std::domain_error& e) {
@@ -11456,34 +11254,35 @@ SWIGINTERN PyObject *_wrap_SOM_dCdt(PyObject *SWIGUNUSEDPARM(self), PyObject *ar
     }
     /*@SWIG@*/
   }
-  resultobj = SWIG_NewPointerObj((new SOM(static_cast< const SOM& >(result))), SWIGTYPE_p_SOM, SWIG_POINTER_OWN |  0 );
+  resultobj = SWIG_NewPointerObj((new SOM(result)), SWIGTYPE_p_SOM, SWIG_POINTER_OWN |  0 );
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_new_SOM__SWIG_0(PyObject *SWIGUNUSEDPARM(self), int nobjs, PyObject **swig_obj) {
+SWIGINTERN PyObject *_wrap_new_SOM__SWIG_0(PyObject *self, Py_ssize_t nobjs, PyObject **swig_obj) {
   PyObject *resultobj = 0;
   SOM *arg1 = 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   SOM *result = 0 ;
   
+  (void)self;
   if ((nobjs < 1) || (nobjs > 1)) SWIG_fail;
   res1 = SWIG_ConvertPtr(swig_obj[0], &argp1, SWIGTYPE_p_SOM,  0  | 0);
   if (!SWIG_IsOK(res1)) {
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "new_SOM" "', argument " "1"" of type '" "SOM const &""'"); 
   }
   if (!argp1) {
-    SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "new_SOM" "', argument " "1"" of type '" "SOM const &""'"); 
+    SWIG_exception_fail(SWIG_NullReferenceError, "invalid null reference " "in method '" "new_SOM" "', argument " "1"" of type '" "SOM const &""'"); 
   }
   arg1 = reinterpret_cast< SOM * >(argp1);
   {
     try {
       result = (SOM *)new SOM((SOM const &)*arg1);
     } 
-    /*@SWIG:C:\Apps\swigwin-3.0.12\Lib\typemaps\exception.swg,58,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
+    /*@SWIG:/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/swig/data/share/swig/4.5.1/typemaps/exception.swg,59,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
     catch (std::invalid_argument& e) {
       SWIG_exception_fail(SWIG_ValueError, e.what() );
     } catch (std::domain_error& e) {
@@ -11508,14 +11307,58 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_new_SOM__SWIG_1(PyObject *SWIGUNUSEDPARM(self), int nobjs, PyObject **swig_obj) {
+SWIGINTERN PyObject *_wrap_delete_SOM(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  SOM *arg1 = 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  
+  (void)self;
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_SOM, SWIG_POINTER_DISOWN |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "delete_SOM" "', argument " "1"" of type '" "SOM *""'"); 
+  }
+  arg1 = reinterpret_cast< SOM * >(argp1);
+  {
+    try {
+      delete arg1;
+    } 
+    /*@SWIG:/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/swig/data/share/swig/4.5.1/typemaps/exception.swg,59,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
+    catch (std::invalid_argument& e) {
+      SWIG_exception_fail(SWIG_ValueError, e.what() );
+    } catch (std::domain_error& e) {
+      SWIG_exception_fail(SWIG_ValueError, e.what() );
+    } catch (std::overflow_error& e) {
+      SWIG_exception_fail(SWIG_OverflowError, e.what() );
+    } catch (std::out_of_range& e) {
+      SWIG_exception_fail(SWIG_IndexError, e.what() );
+    } catch (std::length_error& e) {
+      SWIG_exception_fail(SWIG_IndexError, e.what() );
+    } catch (std::runtime_error& e) {
+      SWIG_exception_fail(SWIG_RuntimeError, e.what() );
+    } catch (std::exception& e) {
+      SWIG_exception_fail(SWIG_SystemError, e.what() );
+    }
+    /*@SWIG@*/
+  }
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_new_SOM__SWIG_1(PyObject *self, Py_ssize_t nobjs, PyObject **swig_obj) {
   PyObject *resultobj = 0;
-  double arg1 = (double) 0.0 ;
-  double arg2 = (double) 0.0 ;
-  double arg3 = (double) 0.0 ;
-  double arg4 = (double) 0.0 ;
-  double arg5 = (double) 0.0 ;
-  double arg6 = (double) 0.0 ;
+  double arg1 = 0.0 ;
+  double arg2 = 0.0 ;
+  double arg3 = 0.0 ;
+  double arg4 = 0.0 ;
+  double arg5 = 0.0 ;
+  double arg6 = 0.0 ;
   double val1 ;
   int ecode1 = 0 ;
   double val2 ;
@@ -11530,6 +11373,7 @@ SWIGINTERN PyObject *_wrap_new_SOM__SWIG_1(PyObject *SWIGUNUSEDPARM(self), int n
   int ecode6 = 0 ;
   SOM *result = 0 ;
   
+  (void)self;
   if ((nobjs < 0) || (nobjs > 6)) SWIG_fail;
   if (swig_obj[0]) {
     ecode1 = SWIG_AsVal_double(swig_obj[0], &val1);
@@ -11577,7 +11421,7 @@ SWIGINTERN PyObject *_wrap_new_SOM__SWIG_1(PyObject *SWIGUNUSEDPARM(self), int n
     try {
       result = (SOM *)new SOM(arg1,arg2,arg3,arg4,arg5,arg6);
     } 
-    /*@SWIG:C:\Apps\swigwin-3.0.12\Lib\typemaps\exception.swg,58,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
+    /*@SWIG:/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/swig/data/share/swig/4.5.1/typemaps/exception.swg,59,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
     catch (std::invalid_argument& e) {
       SWIG_exception_fail(SWIG_ValueError, e.what() );
     } catch (std::domain_error& e) {
@@ -11608,7 +11452,7 @@ SWIGINTERN PyObject *_wrap_new_SOM(PyObject *self, PyObject *args) {
     0
   };
   
-  if (!(argc = SWIG_Python_UnpackTuple(args,"new_SOM",0,6,argv))) SWIG_fail;
+  if (!(argc = SWIG_Python_UnpackTuple(args, "new_SOM", 0, 6, argv))) SWIG_fail;
   --argc;
   {
     unsigned long _index = 0;
@@ -11703,7 +11547,7 @@ SWIGINTERN PyObject *_wrap_new_SOM(PyObject *self, PyObject *args) {
       SWIG_TypeRank _pi = 1;
       int _v = 0;
       {
-        int res = SWIG_ConvertPtr(argv[0], 0, SWIGTYPE_p_SOM, 0);
+        int res = SWIG_ConvertPtr(argv[0], 0, SWIGTYPE_p_SOM, SWIG_POINTER_NO_NULL | 0);
         _v = SWIG_CheckState(res);
       }
       if (!_v) goto check_2;
@@ -11727,7 +11571,7 @@ SWIGINTERN PyObject *_wrap_new_SOM(PyObject *self, PyObject *args) {
   }
   
 fail:
-  SWIG_SetErrorMsg(PyExc_NotImplementedError,"Wrong number or type of arguments for overloaded function 'new_SOM'.\n"
+  SWIG_Python_RaiseOrModifyTypeError("Wrong number or type of arguments for overloaded function 'new_SOM'.\n"
     "  Possible C/C++ prototypes are:\n"
     "    SOM::SOM(SOM const &)\n"
     "    SOM::SOM(double,double,double,double,double,double)\n");
@@ -11735,9 +11579,9 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_SOM_integrate(PyObject *SWIGUNUSEDPARM(self), PyObject *args, PyObject *kwargs) {
+SWIGINTERN PyObject *_wrap_SOM_integrate(PyObject *self, PyObject *args, PyObject *kwargs) {
   PyObject *resultobj = 0;
-  SOM *arg1 = (SOM *) 0 ;
+  SOM *arg1 = 0 ;
   double arg2 ;
   double arg3 ;
   double arg4 ;
@@ -11757,12 +11601,13 @@ SWIGINTERN PyObject *_wrap_SOM_integrate(PyObject *SWIGUNUSEDPARM(self), PyObjec
   PyObject * obj2 = 0 ;
   PyObject * obj3 = 0 ;
   PyObject * obj4 = 0 ;
-  char *  kwnames[] = {
-    (char *) "self",(char *) "dt",(char *) "T",(char *) "wetness",(char *) "pH", NULL 
+  char * kwnames[] = {
+    (char *)"self",  (char *)"dt",  (char *)"T",  (char *)"wetness",  (char *)"pH",  NULL 
   };
   SOM result;
   
-  if (!PyArg_ParseTupleAndKeywords(args,kwargs,(char *)"OOOOO:SOM_integrate",kwnames,&obj0,&obj1,&obj2,&obj3,&obj4)) SWIG_fail;
+  (void)self;
+  if (!PyArg_ParseTupleAndKeywords(args, kwargs, "OOOOO:SOM_integrate", kwnames, &obj0, &obj1, &obj2, &obj3, &obj4)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_SOM, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "SOM_integrate" "', argument " "1"" of type '" "SOM *""'"); 
@@ -11792,7 +11637,101 @@ SWIGINTERN PyObject *_wrap_SOM_integrate(PyObject *SWIGUNUSEDPARM(self), PyObjec
     try {
       result = (arg1)->integrate(arg2,arg3,arg4,arg5);
     } 
-    /*@SWIG:C:\Apps\swigwin-3.0.12\Lib\typemaps\exception.swg,58,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
+    /*@SWIG:/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/swig/data/share/swig/4.5.1/typemaps/exception.swg,59,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
+    catch (std::invalid_argument& e) {
+      SWIG_exception_fail(SWIG_ValueError, e.what() );
+    } catch (std::domain_error& e) {
+      SWIG_exception_fail(SWIG_ValueError, e.what() );
+    } catch (std::overflow_error& e) {
+      SWIG_exception_fail(SWIG_OverflowError, e.what() );
+    } catch (std::out_of_range& e) {
+      SWIG_exception_fail(SWIG_IndexError, e.what() );
+    } catch (std::length_error& e) {
+      SWIG_exception_fail(SWIG_IndexError, e.what() );
+    } catch (std::runtime_error& e) {
+      SWIG_exception_fail(SWIG_RuntimeError, e.what() );
+    } catch (std::exception& e) {
+      SWIG_exception_fail(SWIG_SystemError, e.what() );
+    }
+    /*@SWIG@*/
+  }
+  resultobj = SWIG_NewPointerObj((new SOM(result)), SWIGTYPE_p_SOM, SWIG_POINTER_OWN |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_SOM_integrate_multirate(PyObject *self, PyObject *args, PyObject *kwargs) {
+  PyObject *resultobj = 0;
+  SOM *arg1 = 0 ;
+  double arg2 ;
+  double arg3 ;
+  double arg4 ;
+  double arg5 ;
+  double arg6 = 0.1 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  double val2 ;
+  int ecode2 = 0 ;
+  double val3 ;
+  int ecode3 = 0 ;
+  double val4 ;
+  int ecode4 = 0 ;
+  double val5 ;
+  int ecode5 = 0 ;
+  double val6 ;
+  int ecode6 = 0 ;
+  PyObject * obj0 = 0 ;
+  PyObject * obj1 = 0 ;
+  PyObject * obj2 = 0 ;
+  PyObject * obj3 = 0 ;
+  PyObject * obj4 = 0 ;
+  PyObject * obj5 = 0 ;
+  char * kwnames[] = {
+    (char *)"self",  (char *)"dt",  (char *)"T",  (char *)"wetness",  (char *)"pH",  (char *)"max_turnover",  NULL 
+  };
+  SOM result;
+  
+  (void)self;
+  if (!PyArg_ParseTupleAndKeywords(args, kwargs, "OOOOO|O:SOM_integrate_multirate", kwnames, &obj0, &obj1, &obj2, &obj3, &obj4, &obj5)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_SOM, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "SOM_integrate_multirate" "', argument " "1"" of type '" "SOM *""'"); 
+  }
+  arg1 = reinterpret_cast< SOM * >(argp1);
+  ecode2 = SWIG_AsVal_double(obj1, &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "SOM_integrate_multirate" "', argument " "2"" of type '" "double""'");
+  } 
+  arg2 = static_cast< double >(val2);
+  ecode3 = SWIG_AsVal_double(obj2, &val3);
+  if (!SWIG_IsOK(ecode3)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "SOM_integrate_multirate" "', argument " "3"" of type '" "double""'");
+  } 
+  arg3 = static_cast< double >(val3);
+  ecode4 = SWIG_AsVal_double(obj3, &val4);
+  if (!SWIG_IsOK(ecode4)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode4), "in method '" "SOM_integrate_multirate" "', argument " "4"" of type '" "double""'");
+  } 
+  arg4 = static_cast< double >(val4);
+  ecode5 = SWIG_AsVal_double(obj4, &val5);
+  if (!SWIG_IsOK(ecode5)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode5), "in method '" "SOM_integrate_multirate" "', argument " "5"" of type '" "double""'");
+  } 
+  arg5 = static_cast< double >(val5);
+  if (obj5) {
+    ecode6 = SWIG_AsVal_double(obj5, &val6);
+    if (!SWIG_IsOK(ecode6)) {
+      SWIG_exception_fail(SWIG_ArgError(ecode6), "in method '" "SOM_integrate_multirate" "', argument " "6"" of type '" "double""'");
+    } 
+    arg6 = static_cast< double >(val6);
+  }
+  {
+    try {
+      result = (arg1)->integrate_multirate(arg2,arg3,arg4,arg5,arg6);
+    } 
+    /*@SWIG:/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/swig/data/share/swig/4.5.1/typemaps/exception.swg,59,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
     catch (std::invalid_argument& e) {
       SWIG_exception_fail(SWIG_ValueError, e.what() );
     } catch (std::domain_error& e) {
@@ -11810,21 +11749,22 @@ SWIGINTERN PyObject *_wrap_SOM_integrate(PyObject *SWIGUNUSEDPARM(self), PyObjec
     }
     /*@SWIG@*/
   }
-  resultobj = SWIG_NewPointerObj((new SOM(static_cast< const SOM& >(result))), SWIGTYPE_p_SOM, SWIG_POINTER_OWN |  0 );
+  resultobj = SWIG_NewPointerObj((new SOM(result)), SWIGTYPE_p_SOM, SWIG_POINTER_OWN |  0 );
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_SOM_to_string(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_SOM_to_string(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  SOM *arg1 = (SOM *) 0 ;
+  SOM *arg1 = 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   PyObject *swig_obj[1] ;
   std::string result;
   
+  (void)self;
   if (!args) SWIG_fail;
   swig_obj[0] = args;
   res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_SOM, 0 |  0 );
@@ -11836,7 +11776,7 @@ SWIGINTERN PyObject *_wrap_SOM_to_string(PyObject *SWIGUNUSEDPARM(self), PyObjec
     try {
       result = ((SOM const *)arg1)->to_string();
     } 
-    /*@SWIG:C:\Apps\swigwin-3.0.12\Lib\typemaps\exception.swg,58,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
+    /*@SWIG:/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/swig/data/share/swig/4.5.1/typemaps/exception.swg,59,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
     catch (std::invalid_argument& e) {
       SWIG_exception_fail(SWIG_ValueError, e.what() );
     } catch (std::domain_error& e) {
@@ -11861,14 +11801,15 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_SOM_C_get(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_SOM_C_get(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  SOM *arg1 = (SOM *) 0 ;
+  SOM *arg1 = 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   PyObject *swig_obj[1] ;
   double result;
   
+  (void)self;
   if (!args) SWIG_fail;
   swig_obj[0] = args;
   res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_SOM, 0 |  0 );
@@ -11880,7 +11821,7 @@ SWIGINTERN PyObject *_wrap_SOM_C_get(PyObject *SWIGUNUSEDPARM(self), PyObject *a
     try {
       result = (double)SOM_C_get(arg1);
     } 
-    /*@SWIG:C:\Apps\swigwin-3.0.12\Lib\typemaps\exception.swg,58,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
+    /*@SWIG:/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/swig/data/share/swig/4.5.1/typemaps/exception.swg,59,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
     catch (std::invalid_argument& e) {
       SWIG_exception_fail(SWIG_ValueError, e.what() );
     } catch (std::domain_error& e) {
@@ -11905,14 +11846,15 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_SOM_CN_get(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_SOM_CN_get(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  SOM *arg1 = (SOM *) 0 ;
+  SOM *arg1 = 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   PyObject *swig_obj[1] ;
   double result;
   
+  (void)self;
   if (!args) SWIG_fail;
   swig_obj[0] = args;
   res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_SOM, 0 |  0 );
@@ -11924,7 +11866,7 @@ SWIGINTERN PyObject *_wrap_SOM_CN_get(PyObject *SWIGUNUSEDPARM(self), PyObject *
     try {
       result = (double)SOM_CN_get(arg1);
     } 
-    /*@SWIG:C:\Apps\swigwin-3.0.12\Lib\typemaps\exception.swg,58,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
+    /*@SWIG:/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/swig/data/share/swig/4.5.1/typemaps/exception.swg,59,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
     catch (std::invalid_argument& e) {
       SWIG_exception_fail(SWIG_ValueError, e.what() );
     } catch (std::domain_error& e) {
@@ -11949,9 +11891,54 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_SOM___getitem__(PyObject *SWIGUNUSEDPARM(self), PyObject *args, PyObject *kwargs) {
+SWIGINTERN PyObject *_wrap_SOM_nbytes_get(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  SOM *arg1 = 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  size_t result;
+  
+  (void)self;
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_SOM, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "SOM_nbytes_get" "', argument " "1"" of type '" "SOM *""'"); 
+  }
+  arg1 = reinterpret_cast< SOM * >(argp1);
+  {
+    try {
+      result = SOM_nbytes_get(arg1);
+    } 
+    /*@SWIG:/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/swig/data/share/swig/4.5.1/typemaps/exception.swg,59,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
+    catch (std::invalid_argument& e) {
+      SWIG_exception_fail(SWIG_ValueError, e.what() );
+    } catch (std::domain_error& e) {
+      SWIG_exception_fail(SWIG_ValueError, e.what() );
+    } catch (std::overflow_error& e) {
+      SWIG_exception_fail(SWIG_OverflowError, e.what() );
+    } catch (std::out_of_range& e) {
+      SWIG_exception_fail(SWIG_IndexError, e.what() );
+    } catch (std::length_error& e) {
+      SWIG_exception_fail(SWIG_IndexError, e.what() );
+    } catch (std::runtime_error& e) {
+      SWIG_exception_fail(SWIG_RuntimeError, e.what() );
+    } catch (std::exception& e) {
+      SWIG_exception_fail(SWIG_SystemError, e.what() );
+    }
+    /*@SWIG@*/
+  }
+  resultobj = SWIG_From_size_t(static_cast< size_t >(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_SOM___getitem__(PyObject *self, PyObject *args, PyObject *kwargs) {
   PyObject *resultobj = 0;
-  SOM *arg1 = (SOM *) 0 ;
+  SOM *arg1 = 0 ;
   SOMcomponent *arg2 = 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
@@ -11959,12 +11946,13 @@ SWIGINTERN PyObject *_wrap_SOM___getitem__(PyObject *SWIGUNUSEDPARM(self), PyObj
   int res2 = 0 ;
   PyObject * obj0 = 0 ;
   PyObject * obj1 = 0 ;
-  char *  kwnames[] = {
-    (char *) "self",(char *) "comp", NULL 
+  char * kwnames[] = {
+    (char *)"self",  (char *)"comp",  NULL 
   };
   double result;
   
-  if (!PyArg_ParseTupleAndKeywords(args,kwargs,(char *)"OO:SOM___getitem__",kwnames,&obj0,&obj1)) SWIG_fail;
+  (void)self;
+  if (!PyArg_ParseTupleAndKeywords(args, kwargs, "OO:SOM___getitem__", kwnames, &obj0, &obj1)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_SOM, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "SOM___getitem__" "', argument " "1"" of type '" "SOM *""'"); 
@@ -11975,14 +11963,14 @@ SWIGINTERN PyObject *_wrap_SOM___getitem__(PyObject *SWIGUNUSEDPARM(self), PyObj
     SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "SOM___getitem__" "', argument " "2"" of type '" "SOMcomponent const &""'"); 
   }
   if (!argp2) {
-    SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "SOM___getitem__" "', argument " "2"" of type '" "SOMcomponent const &""'"); 
+    SWIG_exception_fail(SWIG_NullReferenceError, "invalid null reference " "in method '" "SOM___getitem__" "', argument " "2"" of type '" "SOMcomponent const &""'"); 
   }
   arg2 = reinterpret_cast< SOMcomponent * >(argp2);
   {
     try {
       result = (double)SOM___getitem__(arg1,(SOMcomponent const &)*arg2);
     } 
-    /*@SWIG:C:\Apps\swigwin-3.0.12\Lib\typemaps\exception.swg,58,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
+    /*@SWIG:/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/swig/data/share/swig/4.5.1/typemaps/exception.swg,59,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
     catch (std::invalid_argument& e) {
       SWIG_exception_fail(SWIG_ValueError, e.what() );
     } catch (std::domain_error& e) {
@@ -12007,9 +11995,9 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_SOM___setitem__(PyObject *SWIGUNUSEDPARM(self), PyObject *args, PyObject *kwargs) {
+SWIGINTERN PyObject *_wrap_SOM___setitem__(PyObject *self, PyObject *args, PyObject *kwargs) {
   PyObject *resultobj = 0;
-  SOM *arg1 = (SOM *) 0 ;
+  SOM *arg1 = 0 ;
   SOMcomponent *arg2 = 0 ;
   double arg3 ;
   void *argp1 = 0 ;
@@ -12021,11 +12009,12 @@ SWIGINTERN PyObject *_wrap_SOM___setitem__(PyObject *SWIGUNUSEDPARM(self), PyObj
   PyObject * obj0 = 0 ;
   PyObject * obj1 = 0 ;
   PyObject * obj2 = 0 ;
-  char *  kwnames[] = {
-    (char *) "self",(char *) "comp",(char *) "pool_size", NULL 
+  char * kwnames[] = {
+    (char *)"self",  (char *)"comp",  (char *)"pool_size",  NULL 
   };
   
-  if (!PyArg_ParseTupleAndKeywords(args,kwargs,(char *)"OOO:SOM___setitem__",kwnames,&obj0,&obj1,&obj2)) SWIG_fail;
+  (void)self;
+  if (!PyArg_ParseTupleAndKeywords(args, kwargs, "OOO:SOM___setitem__", kwnames, &obj0, &obj1, &obj2)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_SOM, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "SOM___setitem__" "', argument " "1"" of type '" "SOM *""'"); 
@@ -12036,7 +12025,7 @@ SWIGINTERN PyObject *_wrap_SOM___setitem__(PyObject *SWIGUNUSEDPARM(self), PyObj
     SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "SOM___setitem__" "', argument " "2"" of type '" "SOMcomponent const &""'"); 
   }
   if (!argp2) {
-    SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "SOM___setitem__" "', argument " "2"" of type '" "SOMcomponent const &""'"); 
+    SWIG_exception_fail(SWIG_NullReferenceError, "invalid null reference " "in method '" "SOM___setitem__" "', argument " "2"" of type '" "SOMcomponent const &""'"); 
   }
   arg2 = reinterpret_cast< SOMcomponent * >(argp2);
   ecode3 = SWIG_AsVal_double(obj2, &val3);
@@ -12048,7 +12037,7 @@ SWIGINTERN PyObject *_wrap_SOM___setitem__(PyObject *SWIGUNUSEDPARM(self), PyObj
     try {
       SOM___setitem__(arg1,(SOMcomponent const &)*arg2,arg3);
     } 
-    /*@SWIG:C:\Apps\swigwin-3.0.12\Lib\typemaps\exception.swg,58,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
+    /*@SWIG:/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/swig/data/share/swig/4.5.1/typemaps/exception.swg,59,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
     catch (std::invalid_argument& e) {
       SWIG_exception_fail(SWIG_ValueError, e.what() );
     } catch (std::domain_error& e) {
@@ -12073,9 +12062,9 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_SOM___rmul__(PyObject *SWIGUNUSEDPARM(self), PyObject *args, PyObject *kwargs) {
+SWIGINTERN PyObject *_wrap_SOM___rmul__(PyObject *self, PyObject *args, PyObject *kwargs) {
   PyObject *resultobj = 0;
-  SOM *arg1 = (SOM *) 0 ;
+  SOM *arg1 = 0 ;
   double arg2 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
@@ -12083,12 +12072,13 @@ SWIGINTERN PyObject *_wrap_SOM___rmul__(PyObject *SWIGUNUSEDPARM(self), PyObject
   int ecode2 = 0 ;
   PyObject * obj0 = 0 ;
   PyObject * obj1 = 0 ;
-  char *  kwnames[] = {
-    (char *) "self",(char *) "right", NULL 
+  char * kwnames[] = {
+    (char *)"self",  (char *)"right",  NULL 
   };
   SOM result;
   
-  if (!PyArg_ParseTupleAndKeywords(args,kwargs,(char *)"OO:SOM___rmul__",kwnames,&obj0,&obj1)) SWIG_fail;
+  (void)self;
+  if (!PyArg_ParseTupleAndKeywords(args, kwargs, "OO:SOM___rmul__", kwnames, &obj0, &obj1)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_SOM, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "SOM___rmul__" "', argument " "1"" of type '" "SOM *""'"); 
@@ -12103,7 +12093,7 @@ SWIGINTERN PyObject *_wrap_SOM___rmul__(PyObject *SWIGUNUSEDPARM(self), PyObject
     try {
       result = SOM___rmul__(arg1,arg2);
     } 
-    /*@SWIG:C:\Apps\swigwin-3.0.12\Lib\typemaps\exception.swg,58,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
+    /*@SWIG:/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/swig/data/share/swig/4.5.1/typemaps/exception.swg,59,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
     catch (std::invalid_argument& e) {
       SWIG_exception_fail(SWIG_ValueError, e.what() );
     } catch (std::domain_error& e) {
@@ -12121,21 +12111,27 @@ SWIGINTERN PyObject *_wrap_SOM___rmul__(PyObject *SWIGUNUSEDPARM(self), PyObject
     }
     /*@SWIG@*/
   }
-  resultobj = SWIG_NewPointerObj((new SOM(static_cast< const SOM& >(result))), SWIGTYPE_p_SOM, SWIG_POINTER_OWN |  0 );
+  resultobj = SWIG_NewPointerObj((new SOM(result)), SWIGTYPE_p_SOM, SWIG_POINTER_OWN |  0 );
   return resultobj;
 fail:
-  return NULL;
+  if (PyErr_Occurred() && !PyErr_ExceptionMatches(PyExc_TypeError)) {
+    return NULL;
+  }
+  PyErr_Clear();
+  SWIG_Py_INCREF(Py_NotImplemented);
+  return Py_NotImplemented;
 }
 
 
-SWIGINTERN PyObject *_wrap_SOM___repr__(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_SOM___repr__(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  SOM *arg1 = (SOM *) 0 ;
+  SOM *arg1 = 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   PyObject *swig_obj[1] ;
   std::string result;
   
+  (void)self;
   if (!args) SWIG_fail;
   swig_obj[0] = args;
   res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_SOM, 0 |  0 );
@@ -12147,7 +12143,7 @@ SWIGINTERN PyObject *_wrap_SOM___repr__(PyObject *SWIGUNUSEDPARM(self), PyObject
     try {
       result = SOM___repr__(arg1);
     } 
-    /*@SWIG:C:\Apps\swigwin-3.0.12\Lib\typemaps\exception.swg,58,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
+    /*@SWIG:/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/swig/data/share/swig/4.5.1/typemaps/exception.swg,59,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
     catch (std::invalid_argument& e) {
       SWIG_exception_fail(SWIG_ValueError, e.what() );
     } catch (std::domain_error& e) {
@@ -12172,52 +12168,9 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_delete_SOM(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
-  PyObject *resultobj = 0;
-  SOM *arg1 = (SOM *) 0 ;
-  void *argp1 = 0 ;
-  int res1 = 0 ;
-  PyObject *swig_obj[1] ;
-  
-  if (!args) SWIG_fail;
-  swig_obj[0] = args;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_SOM, SWIG_POINTER_DISOWN |  0 );
-  if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "delete_SOM" "', argument " "1"" of type '" "SOM *""'"); 
-  }
-  arg1 = reinterpret_cast< SOM * >(argp1);
-  {
-    try {
-      delete arg1;
-    } 
-    /*@SWIG:C:\Apps\swigwin-3.0.12\Lib\typemaps\exception.swg,58,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
-    catch (std::invalid_argument& e) {
-      SWIG_exception_fail(SWIG_ValueError, e.what() );
-    } catch (std::domain_error& e) {
-      SWIG_exception_fail(SWIG_ValueError, e.what() );
-    } catch (std::overflow_error& e) {
-      SWIG_exception_fail(SWIG_OverflowError, e.what() );
-    } catch (std::out_of_range& e) {
-      SWIG_exception_fail(SWIG_IndexError, e.what() );
-    } catch (std::length_error& e) {
-      SWIG_exception_fail(SWIG_IndexError, e.what() );
-    } catch (std::runtime_error& e) {
-      SWIG_exception_fail(SWIG_RuntimeError, e.what() );
-    } catch (std::exception& e) {
-      SWIG_exception_fail(SWIG_SystemError, e.what() );
-    }
-    /*@SWIG@*/
-  }
-  resultobj = SWIG_Py_Void();
-  return resultobj;
-fail:
-  return NULL;
-}
-
-
 SWIGINTERN PyObject *SOM_swigregister(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
-  PyObject *obj;
-  if (!SWIG_Python_UnpackTuple(args,(char *)"swigregister", 1, 1,&obj)) return NULL;
+  PyObject *obj = NULL;
+  if (!SWIG_Python_UnpackTuple(args, "swigregister", 1, 1, &obj)) return NULL;
   SWIG_TypeNewClientData(SWIGTYPE_p_SOM, SWIG_NewClientData(obj));
   return SWIG_Py_Void();
 }
@@ -12226,16 +12179,17 @@ SWIGINTERN PyObject *SOM_swiginit(PyObject *SWIGUNUSEDPARM(self), PyObject *args
   return SWIG_Python_InitShadowInstance(args);
 }
 
-SWIGINTERN PyObject *_wrap_wood_litter(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_wood_litter(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
   SOM result;
   
-  if (!SWIG_Python_UnpackTuple(args,"wood_litter",0,0,0)) SWIG_fail;
+  (void)self;
+  if (!SWIG_Python_UnpackTuple(args, "wood_litter", 0, 0, 0)) SWIG_fail;
   {
     try {
       result = wood_litter();
     } 
-    /*@SWIG:C:\Apps\swigwin-3.0.12\Lib\typemaps\exception.swg,58,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
+    /*@SWIG:/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/swig/data/share/swig/4.5.1/typemaps/exception.swg,59,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
     catch (std::invalid_argument& e) {
       SWIG_exception_fail(SWIG_ValueError, e.what() );
     } catch (std::domain_error& e) {
@@ -12253,23 +12207,24 @@ SWIGINTERN PyObject *_wrap_wood_litter(PyObject *SWIGUNUSEDPARM(self), PyObject
     }
     /*@SWIG@*/
   }
-  resultobj = SWIG_NewPointerObj((new SOM(static_cast< const SOM& >(result))), SWIGTYPE_p_SOM, SWIG_POINTER_OWN |  0 );
+  resultobj = SWIG_NewPointerObj((new SOM(result)), SWIGTYPE_p_SOM, SWIG_POINTER_OWN |  0 );
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_leave_litter(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_leave_litter(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
   SOM result;
   
-  if (!SWIG_Python_UnpackTuple(args,"leave_litter",0,0,0)) SWIG_fail;
+  (void)self;
+  if (!SWIG_Python_UnpackTuple(args, "leave_litter", 0, 0, 0)) SWIG_fail;
   {
     try {
       result = leave_litter();
     } 
-    /*@SWIG:C:\Apps\swigwin-3.0.12\Lib\typemaps\exception.swg,58,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
+    /*@SWIG:/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/swig/data/share/swig/4.5.1/typemaps/exception.swg,59,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
     catch (std::invalid_argument& e) {
       SWIG_exception_fail(SWIG_ValueError, e.what() );
     } catch (std::domain_error& e) {
@@ -12287,23 +12242,24 @@ SWIGINTERN PyObject *_wrap_leave_litter(PyObject *SWIGUNUSEDPARM(self), PyObject
     }
     /*@SWIG@*/
   }
-  resultobj = SWIG_NewPointerObj((new SOM(static_cast< const SOM& >(result))), SWIGTYPE_p_SOM, SWIG_POINTER_OWN |  0 );
+  resultobj = SWIG_NewPointerObj((new SOM(result)), SWIGTYPE_p_SOM, SWIG_POINTER_OWN |  0 );
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_root_litter(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_root_litter(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
   SOM result;
   
-  if (!SWIG_Python_UnpackTuple(args,"root_litter",0,0,0)) SWIG_fail;
+  (void)self;
+  if (!SWIG_Python_UnpackTuple(args, "root_litter", 0, 0, 0)) SWIG_fail;
   {
     try {
       result = root_litter();
     } 
-    /*@SWIG:C:\Apps\swigwin-3.0.12\Lib\typemaps\exception.swg,58,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
+    /*@SWIG:/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/swig/data/share/swig/4.5.1/typemaps/exception.swg,59,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
     catch (std::invalid_argument& e) {
       SWIG_exception_fail(SWIG_ValueError, e.what() );
     } catch (std::domain_error& e) {
@@ -12321,23 +12277,24 @@ SWIGINTERN PyObject *_wrap_root_litter(PyObject *SWIGUNUSEDPARM(self), PyObject
     }
     /*@SWIG@*/
   }
-  resultobj = SWIG_NewPointerObj((new SOM(static_cast< const SOM& >(result))), SWIGTYPE_p_SOM, SWIG_POINTER_OWN |  0 );
+  resultobj = SWIG_NewPointerObj((new SOM(result)), SWIGTYPE_p_SOM, SWIG_POINTER_OWN |  0 );
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_pure_DOC(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_pure_DOC(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
   SOM result;
   
-  if (!SWIG_Python_UnpackTuple(args,"pure_DOC",0,0,0)) SWIG_fail;
+  (void)self;
+  if (!SWIG_Python_UnpackTuple(args, "pure_DOC", 0, 0, 0)) SWIG_fail;
   {
     try {
       result = pure_DOC();
     } 
-    /*@SWIG:C:\Apps\swigwin-3.0.12\Lib\typemaps\exception.swg,58,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
+    /*@SWIG:/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/swig/data/share/swig/4.5.1/typemaps/exception.swg,59,SWIG_CATCH_STDEXCEPT@*/  /* catching std::exception  */
     catch (std::invalid_argument& e) {
       SWIG_exception_fail(SWIG_ValueError, e.what() );
     } catch (std::domain_error& e) {
@@ -12355,7 +12312,7 @@ SWIGINTERN PyObject *_wrap_pure_DOC(PyObject *SWIGUNUSEDPARM(self), PyObject *ar
     }
     /*@SWIG@*/
   }
-  resultobj = SWIG_NewPointerObj((new SOM(static_cast< const SOM& >(result))), SWIGTYPE_p_SOM, SWIG_POINTER_OWN |  0 );
+  resultobj = SWIG_NewPointerObj((new SOM(result)), SWIGTYPE_p_SOM, SWIG_POINTER_OWN |  0 );
   return resultobj;
 fail:
   return NULL;
@@ -12363,163 +12320,318 @@ fail:
 
 
 static PyMethodDef SwigMethods[] = {
-	 { (char *)"SWIG_PyInstanceMethod_New", (PyCFunction)SWIG_PyInstanceMethod_New, METH_O, NULL},
-	 { (char *)"delete_SwigPyIterator", (PyCFunction)_wrap_delete_SwigPyIterator, METH_O, (char *)"delete_SwigPyIterator(SwigPyIterator self)"},
-	 { (char *)"SwigPyIterator_value", (PyCFunction)_wrap_SwigPyIterator_value, METH_O, (char *)"SwigPyIterator_value(SwigPyIterator self) -> PyObject *"},
-	 { (char *)"SwigPyIterator_incr", (PyCFunction) _wrap_SwigPyIterator_incr, METH_VARARGS | METH_KEYWORDS, (char *)"SwigPyIterator_incr(SwigPyIterator self, size_t n=1) -> SwigPyIterator"},
-	 { (char *)"SwigPyIterator_decr", (PyCFunction) _wrap_SwigPyIterator_decr, METH_VARARGS | METH_KEYWORDS, (char *)"SwigPyIterator_decr(SwigPyIterator self, size_t n=1) -> SwigPyIterator"},
-	 { (char *)"SwigPyIterator_distance", (PyCFunction) _wrap_SwigPyIterator_distance, METH_VARARGS | METH_KEYWORDS, (char *)"SwigPyIterator_distance(SwigPyIterator self, SwigPyIterator x) -> ptrdiff_t"},
-	 { (char *)"SwigPyIterator_equal", (PyCFunction) _wrap_SwigPyIterator_equal, METH_VARARGS | METH_KEYWORDS, (char *)"SwigPyIterator_equal(SwigPyIterator self, SwigPyIterator x) -> bool"},
-	 { (char *)"SwigPyIterator_copy", (PyCFunction)_wrap_SwigPyIterator_copy, METH_O, (char *)"SwigPyIterator_copy(SwigPyIterator self) -> SwigPyIterator"},
-	 { (char *)"SwigPyIterator_next", (PyCFunction)_wrap_SwigPyIterator_next, METH_O, (char *)"SwigPyIterator_next(SwigPyIterator self) -> PyObject *"},
-	 { (char *)"SwigPyIterator___next__", (PyCFunction)_wrap_SwigPyIterator___next__, METH_O, (char *)"SwigPyIterator___next__(SwigPyIterator self) -> PyObject *"},
-	 { (char *)"SwigPyIterator_previous", (PyCFunction)_wrap_SwigPyIterator_previous, METH_O, (char *)"SwigPyIterator_previous(SwigPyIterator self) -> PyObject *"},
-	 { (char *)"SwigPyIterator_advance", (PyCFunction) _wrap_SwigPyIterator_advance, METH_VARARGS | METH_KEYWORDS, (char *)"SwigPyIterator_advance(SwigPyIterator self, ptrdiff_t n) -> SwigPyIterator"},
-	 { (char *)"SwigPyIterator___eq__", (PyCFunction) _wrap_SwigPyIterator___eq__, METH_VARARGS | METH_KEYWORDS, (char *)"SwigPyIterator___eq__(SwigPyIterator self, SwigPyIterator x) -> bool"},
-	 { (char *)"SwigPyIterator___ne__", (PyCFunction) _wrap_SwigPyIterator___ne__, METH_VARARGS | METH_KEYWORDS, (char *)"SwigPyIterator___ne__(SwigPyIterator self, SwigPyIterator x) -> bool"},
-	 { (char *)"SwigPyIterator___iadd__", (PyCFunction) _wrap_SwigPyIterator___iadd__, METH_VARARGS | METH_KEYWORDS, (char *)"SwigPyIterator___iadd__(SwigPyIterator self, ptrdiff_t n) -> SwigPyIterator"},
-	 { (char *)"SwigPyIterator___isub__", (PyCFunction) _wrap_SwigPyIterator___isub__, METH_VARARGS | METH_KEYWORDS, (char *)"SwigPyIterator___isub__(SwigPyIterator self, ptrdiff_t n) -> SwigPyIterator"},
-	 { (char *)"SwigPyIterator___add__", (PyCFunction) _wrap_SwigPyIterator___add__, METH_VARARGS | METH_KEYWORDS, (char *)"SwigPyIterator___add__(SwigPyIterator self, ptrdiff_t n) -> SwigPyIterator"},
-	 { (char *)"SwigPyIterator___sub__", _wrap_SwigPyIterator___sub__, METH_VARARGS, (char *)"\n"
-		"__sub__(ptrdiff_t n) -> SwigPyIterator\n"
+	 { "SWIG_PyInstanceMethod_New", SWIG_PyInstanceMethod_New, METH_O, NULL},
+	 { "SWIG_PyStaticMethod_New", SWIG_PyStaticMethod_New, METH_O, NULL},
+	 { "delete_SwigPyIterator", _wrap_delete_SwigPyIterator, METH_O, "delete_SwigPyIterator(SwigPyIterator self)"},
+	 { "SwigPyIterator_value", _wrap_SwigPyIterator_value, METH_O, "SwigPyIterator_value(SwigPyIterator self) -> PyObject *"},
+	 { "SwigPyIterator_incr", (PyCFunction)(void(*)(void))_wrap_SwigPyIterator_incr, METH_VARARGS|METH_KEYWORDS, "SwigPyIterator_incr(SwigPyIterator self, size_t n=1) -> SwigPyIterator"},
+	 { "SwigPyIterator_decr", (PyCFunction)(void(*)(void))_wrap_SwigPyIterator_decr, METH_VARARGS|METH_KEYWORDS, "SwigPyIterator_decr(SwigPyIterator self, size_t n=1) -> SwigPyIterator"},
+	 { "SwigPyIterator_distance", (PyCFunction)(void(*)(void))_wrap_SwigPyIterator_distance, METH_VARARGS|METH_KEYWORDS, "SwigPyIterator_distance(SwigPyIterator self, SwigPyIterator x) -> ptrdiff_t"},
+	 { "SwigPyIterator_equal", (PyCFunction)(void(*)(void))_wrap_SwigPyIterator_equal, METH_VARARGS|METH_KEYWORDS, "SwigPyIterator_equal(SwigPyIterator self, SwigPyIterator x) -> bool"},
+	 { "SwigPyIterator_copy", _wrap_SwigPyIterator_copy, METH_O, "SwigPyIterator_copy(SwigPyIterator self) -> SwigPyIterator"},
+	 { "SwigPyIterator___next__", _wrap_SwigPyIterator___next__, METH_O, "SwigPyIterator___next__(SwigPyIterator self) -> PyObject *"},
+	 { "SwigPyIterator_previous", _wrap_SwigPyIterator_previous, METH_O, "SwigPyIterator_previous(SwigPyIterator self) -> PyObject *"},
+	 { "SwigPyIterator_advance", (PyCFunction)(void(*)(void))_wrap_SwigPyIterator_advance, METH_VARARGS|METH_KEYWORDS, "SwigPyIterator_advance(SwigPyIterator self, ptrdiff_t n) -> SwigPyIterator"},
+	 { "SwigPyIterator___eq__", (PyCFunction)(void(*)(void))_wrap_SwigPyIterator___eq__, METH_VARARGS|METH_KEYWORDS, "SwigPyIterator___eq__(SwigPyIterator self, SwigPyIterator x) -> bool"},
+	 { "SwigPyIterator___ne__", (PyCFunction)(void(*)(void))_wrap_SwigPyIterator___ne__, METH_VARARGS|METH_KEYWORDS, "SwigPyIterator___ne__(SwigPyIterator self, SwigPyIterator x) -> bool"},
+	 { "SwigPyIterator___iadd__", (PyCFunction)(void(*)(void))_wrap_SwigPyIterator___iadd__, METH_VARARGS|METH_KEYWORDS, "SwigPyIterator___iadd__(SwigPyIterator self, ptrdiff_t n) -> SwigPyIterator"},
+	 { "SwigPyIterator___isub__", (PyCFunction)(void(*)(void))_wrap_SwigPyIterator___isub__, METH_VARARGS|METH_KEYWORDS, "SwigPyIterator___isub__(SwigPyIterator self, ptrdiff_t n) -> SwigPyIterator"},
+	 { "SwigPyIterator___add__", (PyCFunction)(void(*)(void))_wrap_SwigPyIterator___add__, METH_VARARGS|METH_KEYWORDS, "SwigPyIterator___add__(SwigPyIterator self, ptrdiff_t n) -> SwigPyIterator"},
+	 { "SwigPyIterator___sub__", _wrap_SwigPyIterator___sub__, METH_VARARGS, "\n"
+		"SwigPyIterator___sub__(SwigPyIterator self, ptrdiff_t n) -> SwigPyIterator\n"
 		"SwigPyIterator___sub__(SwigPyIterator self, SwigPyIterator x) -> ptrdiff_t\n"
 		""},
-	 { (char *)"SwigPyIterator_swigregister", SwigPyIterator_swigregister, METH_VARARGS, NULL},
-	 { (char *)"SOMcomponent_count_get", _wrap_SOMcomponent_count_get, METH_VARARGS, NULL},
-	 { (char *)"SOMcomponent_count_set", _wrap_SOMcomponent_count_set, METH_VARARGS, NULL},
-	 { (char *)"SOMcomponent_Id_get", (PyCFunction)_wrap_SOMcomponent_Id_get, METH_O, (char *)"SOMcomponent_Id_get(SOMcomponent self) -> int const"},
-	 { (char *)"SOMcomponent_Name_set", _wrap_SOMcomponent_Name_set, METH_VARARGS, (char *)"SOMcomponent_Name_set(SOMcomponent self, std::string const & Name)"},
-	 { (char *)"SOMcomponent_Name_get", (PyCFunction)_wrap_SOMcomponent_Name_get, METH_O, (char *)"SOMcomponent_Name_get(SOMcomponent self) -> std::string const &"},
-	 { (char *)"SOMcomponent_is_stored_set", _wrap_SOMcomponent_is_stored_set, METH_VARARGS, (char *)"SOMcomponent_is_stored_set(SOMcomponent self, bool is_stored)"},
-	 { (char *)"SOMcomponent_is_stored_get", (PyCFunction)_wrap_SOMcomponent_is_stored_get, METH_O, (char *)"SOMcomponent_is_stored_get(SOMcomponent self) -> bool"},
-	 { (char *)"SOMcomponent_k_pot_set", _wrap_SOMcomponent_k_pot_set, METH_VARARGS, (char *)"SOMcomponent_k_pot_set(SOMcomponent self, double k_pot)"},
-	 { (char *)"SOMcomponent_k_pot_get", (PyCFunction)_wrap_SOMcomponent_k_pot_get, METH_O, (char *)"SOMcomponent_k_pot_get(SOMcomponent self) -> double"},
-	 { (char *)"SOMcomponent_E_a_set", _wrap_SOMcomponent_E_a_set, METH_VARARGS, (char *)"SOMcomponent_E_a_set(SOMcomponent self, double E_a)"},
-	 { (char *)"SOMcomponent_E_a_get", (PyCFunction)_wrap_SOMcomponent_E_a_get, METH_O, (char *)"SOMcomponent_E_a_get(SOMcomponent self) -> double"},
-	 { (char *)"SOMcomponent_K_w_set", _wrap_SOMcomponent_K_w_set, METH_VARARGS, (char *)"SOMcomponent_K_w_set(SOMcomponent self, double K_w)"},
-	 { (char *)"SOMcomponent_K_w_get", (PyCFunction)_wrap_SOMcomponent_K_w_get, METH_O, (char *)"SOMcomponent_K_w_get(SOMcomponent self) -> double"},
-	 { (char *)"SOMcomponent_n_w_set", _wrap_SOMcomponent_n_w_set, METH_VARARGS, (char *)"SOMcomponent_n_w_set(SOMcomponent self, double n_w)"},
-	 { (char *)"SOMcomponent_n_w_get", (PyCFunction)_wrap_SOMcomponent_n_w_get, METH_O, (char *)"SOMcomponent_n_w_get(SOMcomponent self) -> double"},
-	 { (char *)"SOMcomponent_K_pH_set", _wrap_SOMcomponent_K_pH_set, METH_VARARGS, (char *)"SOMcomponent_K_pH_set(SOMcomponent self, double K_pH)"},
-	 { (char *)"SOMcomponent_K_pH_get", (PyCFunction)_wrap_SOMcomponent_K_pH_get, METH_O, (char *)"SOMcomponent_K_pH_get(SOMcomponent self) -> double"},
-	 { (char *)"SOMcomponent_m_pH_set", _wrap_SOMcomponent_m_pH_set, METH_VARARGS, (char *)"SOMcomponent_m_pH_set(SOMcomponent self, double m_pH)"},
-	 { (char *)"SOMcomponent_m_pH_get", (PyCFunction)_wrap_SOMcomponent_m_pH_get, METH_O, (char *)"SOMcomponent_m_pH_get(SOMcomponent self) -> double"},
-	 { (char *)"SOMcomponent_set_product", (PyCFunction) _wrap_SOMcomponent_set_product, METH_VARARGS | METH_KEYWORDS, (char *)"SOMcomponent_set_product(SOMcomponent self, SOMcomponent product, double fraction)"},
-	 { (char *)"SOMcomponent_get_product_fraction", (PyCFunction) _wrap_SOMcomponent_get_product_fraction, METH_VARARGS | METH_KEYWORDS, (char *)"SOMcomponent_get_product_fraction(SOMcomponent self, SOMcomponent product) -> double"},
-	 { (char *)"SOMcomponent_get_products", (PyCFunction)_wrap_SOMcomponent_get_products, METH_O, (char *)"SOMcomponent_get_products(SOMcomponent self) -> component_set"},
-	 { (char *)"SOMcomponent_decomp", (PyCFunction) _wrap_SOMcomponent_decomp, METH_VARARGS | METH_KEYWORDS, (char *)"SOMcomponent_decomp(SOMcomponent self, double T, double wetness, double pH) -> double"},
-	 { (char *)"SOMcomponent___lt__", (PyCFunction) _wrap_SOMcomponent___lt__, METH_VARARGS | METH_KEYWORDS, (char *)"SOMcomponent___lt__(SOMcomponent self, SOMcomponent cmp) -> bool"},
-	 { (char *)"SOMcomponent___eq__", (PyCFunction) _wrap_SOMcomponent___eq__, METH_VARARGS | METH_KEYWORDS, (char *)"SOMcomponent___eq__(SOMcomponent self, SOMcomponent cmp) -> bool"},
-	 { (char *)"SOMcomponent___ne__", (PyCFunction) _wrap_SOMcomponent___ne__, METH_VARARGS | METH_KEYWORDS, (char *)"SOMcomponent___ne__(SOMcomponent self, SOMcomponent cmp) -> bool"},
-	 { (char *)"new_SOMcomponent", _wrap_new_SOMcomponent, METH_VARARGS, (char *)"\n"
+	 { "SwigPyIterator_swigregister", SwigPyIterator_swigregister, METH_O, NULL},
+	 { "SOMcomponent_count_get", _wrap_SOMcomponent_count_get, METH_VARARGS, NULL},
+	 { "SOMcomponent_count_set", _wrap_SOMcomponent_count_set, METH_O, NULL},
+	 { "SOMcomponent_Id_get", _wrap_SOMcomponent_Id_get, METH_O, "SOMcomponent_Id_get(SOMcomponent self) -> int const"},
+	 { "SOMcomponent_Name_set", _wrap_SOMcomponent_Name_set, METH_VARARGS, "SOMcomponent_Name_set(SOMcomponent self, std::string const & Name)"},
+	 { "SOMcomponent_Name_get", _wrap_SOMcomponent_Name_get, METH_O, "SOMcomponent_Name_get(SOMcomponent self) -> std::string const &"},
+	 { "SOMcomponent_is_stored_set", _wrap_SOMcomponent_is_stored_set, METH_VARARGS, "SOMcomponent_is_stored_set(SOMcomponent self, bool is_stored)"},
+	 { "SOMcomponent_is_stored_get", _wrap_SOMcomponent_is_stored_get, METH_O, "SOMcomponent_is_stored_get(SOMcomponent self) -> bool"},
+	 { "SOMcomponent_k_pot_set", _wrap_SOMcomponent_k_pot_set, METH_VARARGS, "SOMcomponent_k_pot_set(SOMcomponent self, double k_pot)"},
+	 { "SOMcomponent_k_pot_get", _wrap_SOMcomponent_k_pot_get, METH_O, "SOMcomponent_k_pot_get(SOMcomponent self) -> double"},
+	 { "SOMcomponent_E_a_set", _wrap_SOMcomponent_E_a_set, METH_VARARGS, "SOMcomponent_E_a_set(SOMcomponent self, double E_a)"},
+	 { "SOMcomponent_E_a_get", _wrap_SOMcomponent_E_a_get, METH_O, "SOMcomponent_E_a_get(SOMcomponent self) -> double"},
+	 { "SOMcomponent_K_w_set", _wrap_SOMcomponent_K_w_set, METH_VARARGS, "SOMcomponent_K_w_set(SOMcomponent self, double K_w)"},
+	 { "SOMcomponent_K_w_get", _wrap_SOMcomponent_K_w_get, METH_O, "SOMcomponent_K_w_get(SOMcomponent self) -> double"},
+	 { "SOMcomponent_n_w_set", _wrap_SOMcomponent_n_w_set, METH_VARARGS, "SOMcomponent_n_w_set(SOMcomponent self, double n_w)"},
+	 { "SOMcomponent_n_w_get", _wrap_SOMcomponent_n_w_get, METH_O, "SOMcomponent_n_w_get(SOMcomponent self) -> double"},
+	 { "SOMcomponent_K_pH_set", _wrap_SOMcomponent_K_pH_set, METH_VARARGS, "SOMcomponent_K_pH_set(SOMcomponent self, double K_pH)"},
+	 { "SOMcomponent_K_pH_get", _wrap_SOMcomponent_K_pH_get, METH_O, "SOMcomponent_K_pH_get(SOMcomponent self) -> double"},
+	 { "SOMcomponent_m_pH_set", _wrap_SOMcomponent_m_pH_set, METH_VARARGS, "SOMcomponent_m_pH_set(SOMcomponent self, double m_pH)"},
+	 { "SOMcomponent_m_pH_get", _wrap_SOMcomponent_m_pH_get, METH_O, "SOMcomponent_m_pH_get(SOMcomponent self) -> double"},
+	 { "SOMcomponent_set_product", (PyCFunction)(void(*)(void))_wrap_SOMcomponent_set_product, METH_VARARGS|METH_KEYWORDS, "SOMcomponent_set_product(SOMcomponent self, SOMcomponent product, double fraction)"},
+	 { "SOMcomponent_get_product_fraction", (PyCFunction)(void(*)(void))_wrap_SOMcomponent_get_product_fraction, METH_VARARGS|METH_KEYWORDS, "SOMcomponent_get_product_fraction(SOMcomponent self, SOMcomponent product) -> double"},
+	 { "SOMcomponent_get_products", _wrap_SOMcomponent_get_products, METH_O, "SOMcomponent_get_products(SOMcomponent self) -> component_set"},
+	 { "SOMcomponent_decomp", (PyCFunction)(void(*)(void))_wrap_SOMcomponent_decomp, METH_VARARGS|METH_KEYWORDS, "SOMcomponent_decomp(SOMcomponent self, double T, double wetness, double pH) -> double"},
+	 { "SOMcomponent___lt__", (PyCFunction)(void(*)(void))_wrap_SOMcomponent___lt__, METH_VARARGS|METH_KEYWORDS, "SOMcomponent___lt__(SOMcomponent self, SOMcomponent cmp) -> bool"},
+	 { "SOMcomponent___eq__", (PyCFunction)(void(*)(void))_wrap_SOMcomponent___eq__, METH_VARARGS|METH_KEYWORDS, "SOMcomponent___eq__(SOMcomponent self, SOMcomponent cmp) -> bool"},
+	 { "SOMcomponent___ne__", (PyCFunction)(void(*)(void))_wrap_SOMcomponent___ne__, METH_VARARGS|METH_KEYWORDS, "SOMcomponent___ne__(SOMcomponent self, SOMcomponent cmp) -> bool"},
+	 { "new_SOMcomponent", _wrap_new_SOMcomponent, METH_VARARGS, "\n"
 		"SOMcomponent(std::string name, bool is_stored, double k_pot, double E_a, double K_w, double n_w, double K_pH, double m_pH=1.0)\n"
 		"SOMcomponent()\n"
 		"new_SOMcomponent(SOMcomponent copy) -> SOMcomponent\n"
 		""},
-	 { (char *)"delete_SOMcomponent", (PyCFunction)_wrap_delete_SOMcomponent, METH_O, (char *)"delete_SOMcomponent(SOMcomponent self)"},
-	 { (char *)"SOMcomponent___repr__", (PyCFunction)_wrap_SOMcomponent___repr__, METH_O, (char *)"SOMcomponent___repr__(SOMcomponent self) -> std::string"},
-	 { (char *)"SOMcomponent_swigregister", SOMcomponent_swigregister, METH_VARARGS, NULL},
-	 { (char *)"SOMcomponent_swiginit", SOMcomponent_swiginit, METH_VARARGS, NULL},
-	 { (char *)"component_set_iterator", (PyCFunction)_wrap_component_set_iterator, METH_O, (char *)"component_set_iterator(component_set self) -> SwigPyIterator"},
-	 { (char *)"component_set___nonzero__", (PyCFunction)_wrap_component_set___nonzero__, METH_O, (char *)"component_set___nonzero__(component_set self) -> bool"},
-	 { (char *)"component_set___bool__", (PyCFunction)_wrap_component_set___bool__, METH_O, (char *)"component_set___bool__(component_set self) -> bool"},
-	 { (char *)"component_set___len__", (PyCFunction)_wrap_component_set___len__, METH_O, (char *)"component_set___len__(component_set self) -> std::vector< SOMcomponent >::size_type"},
-	 { (char *)"component_set___getslice__", (PyCFunction) _wrap_component_set___getslice__, METH_VARARGS | METH_KEYWORDS, (char *)"component_set___getslice__(component_set self, std::vector< SOMcomponent >::difference_type i, std::vector< SOMcomponent >::difference_type j) -> component_set"},
-	 { (char *)"component_set___setslice__", _wrap_component_set___setslice__, METH_VARARGS, (char *)"\n"
-		"__setslice__(std::vector< SOMcomponent >::difference_type i, std::vector< SOMcomponent >::difference_type j)\n"
-		"component_set___setslice__(component_set self, std::vector< SOMcomponent >::difference_type i, std::vector< SOMcomponent >::difference_type j, component_set v)\n"
+	 { "delete_SOMcomponent", _wrap_delete_SOMcomponent, METH_O, "delete_SOMcomponent(SOMcomponent self)"},
+	 { "SOMcomponent___repr__", _wrap_SOMcomponent___repr__, METH_O, "SOMcomponent___repr__(SOMcomponent self) -> std::string"},
+	 { "SOMcomponent_swigregister", SOMcomponent_swigregister, METH_O, NULL},
+	 { "SOMcomponent_swiginit", SOMcomponent_swiginit, METH_VARARGS, NULL},
+	 { "component_set_iterator", _wrap_component_set_iterator, METH_O, "component_set_iterator(component_set self) -> SwigPyIterator"},
+	 { "component_set___bool__", _wrap_component_set___bool__, METH_O, "component_set___bool__(component_set self) -> bool"},
+	 { "component_set___len__", _wrap_component_set___len__, METH_O, "component_set___len__(component_set self) -> std::vector< SOMcomponent >::size_type"},
+	 { "component_set___delitem__", _wrap_component_set___delitem__, METH_VARARGS, "\n"
+		"component_set___delitem__(component_set self, std::vector< SOMcomponent >::difference_type i)\n"
+		"component_set___delitem__(component_set self, SWIGPY_SLICEOBJECT * slice)\n"
 		""},
-	 { (char *)"component_set___delslice__", (PyCFunction) _wrap_component_set___delslice__, METH_VARARGS | METH_KEYWORDS, (char *)"component_set___delslice__(component_set self, std::vector< SOMcomponent >::difference_type i, std::vector< SOMcomponent >::difference_type j)"},
-	 { (char *)"component_set___delitem__", _wrap_component_set___delitem__, METH_VARARGS, (char *)"\n"
-		"__delitem__(std::vector< SOMcomponent >::difference_type i)\n"
-		"component_set___delitem__(component_set self, PySliceObject * slice)\n"
-		""},
-	 { (char *)"component_set___getitem__", _wrap_component_set___getitem__, METH_VARARGS, (char *)"\n"
-		"__getitem__(PySliceObject * slice) -> component_set\n"
+	 { "component_set___getitem__", _wrap_component_set___getitem__, METH_VARARGS, "\n"
+		"component_set___getitem__(component_set self, SWIGPY_SLICEOBJECT * slice) -> component_set\n"
 		"component_set___getitem__(component_set self, std::vector< SOMcomponent >::difference_type i) -> SOMcomponent\n"
 		""},
-	 { (char *)"component_set___setitem__", _wrap_component_set___setitem__, METH_VARARGS, (char *)"\n"
-		"__setitem__(PySliceObject * slice, component_set v)\n"
-		"__setitem__(PySliceObject * slice)\n"
+	 { "component_set___setitem__", _wrap_component_set___setitem__, METH_VARARGS, "\n"
+		"component_set___setitem__(component_set self, SWIGPY_SLICEOBJECT * slice, component_set v)\n"
+		"component_set___setitem__(component_set self, SWIGPY_SLICEOBJECT * slice)\n"
 		"component_set___setitem__(component_set self, std::vector< SOMcomponent >::difference_type i, SOMcomponent x)\n"
 		""},
-	 { (char *)"component_set_pop", (PyCFunction)_wrap_component_set_pop, METH_O, (char *)"component_set_pop(component_set self) -> SOMcomponent"},
-	 { (char *)"component_set_append", (PyCFunction) _wrap_component_set_append, METH_VARARGS | METH_KEYWORDS, (char *)"component_set_append(component_set self, SOMcomponent x)"},
-	 { (char *)"component_set_empty", (PyCFunction)_wrap_component_set_empty, METH_O, (char *)"component_set_empty(component_set self) -> bool"},
-	 { (char *)"component_set_size", (PyCFunction)_wrap_component_set_size, METH_O, (char *)"component_set_size(component_set self) -> std::vector< SOMcomponent >::size_type"},
-	 { (char *)"component_set_swap", (PyCFunction) _wrap_component_set_swap, METH_VARARGS | METH_KEYWORDS, (char *)"component_set_swap(component_set self, component_set v)"},
-	 { (char *)"component_set_begin", (PyCFunction)_wrap_component_set_begin, METH_O, (char *)"component_set_begin(component_set self) -> std::vector< SOMcomponent >::iterator"},
-	 { (char *)"component_set_end", (PyCFunction)_wrap_component_set_end, METH_O, (char *)"component_set_end(component_set self) -> std::vector< SOMcomponent >::iterator"},
-	 { (char *)"component_set_rbegin", (PyCFunction)_wrap_component_set_rbegin, METH_O, (char *)"component_set_rbegin(component_set self) -> std::vector< SOMcomponent >::reverse_iterator"},
-	 { (char *)"component_set_rend", (PyCFunction)_wrap_component_set_rend, METH_O, (char *)"component_set_rend(component_set self) -> std::vector< SOMcomponent >::reverse_iterator"},
-	 { (char *)"component_set_clear", (PyCFunction)_wrap_component_set_clear, METH_O, (char *)"component_set_clear(component_set self)"},
-	 { (char *)"component_set_get_allocator", (PyCFunction)_wrap_component_set_get_allocator, METH_O, (char *)"component_set_get_allocator(component_set self) -> std::vector< SOMcomponent >::allocator_type"},
-	 { (char *)"component_set_pop_back", (PyCFunction)_wrap_component_set_pop_back, METH_O, (char *)"component_set_pop_back(component_set self)"},
-	 { (char *)"component_set_erase", _wrap_component_set_erase, METH_VARARGS, (char *)"\n"
-		"erase(std::vector< SOMcomponent >::iterator pos) -> std::vector< SOMcomponent >::iterator\n"
+	 { "component_set_pop", _wrap_component_set_pop, METH_O, "component_set_pop(component_set self) -> SOMcomponent"},
+	 { "component_set_append", (PyCFunction)(void(*)(void))_wrap_component_set_append, METH_VARARGS|METH_KEYWORDS, "component_set_append(component_set self, SOMcomponent x)"},
+	 { "component_set_empty", _wrap_component_set_empty, METH_O, "component_set_empty(component_set self) -> bool"},
+	 { "component_set_size", _wrap_component_set_size, METH_O, "component_set_size(component_set self) -> std::vector< SOMcomponent >::size_type"},
+	 { "component_set_swap", (PyCFunction)(void(*)(void))_wrap_component_set_swap, METH_VARARGS|METH_KEYWORDS, "component_set_swap(component_set self, component_set v)"},
+	 { "component_set_begin", _wrap_component_set_begin, METH_O, "component_set_begin(component_set self) -> std::vector< SOMcomponent >::iterator"},
+	 { "component_set_end", _wrap_component_set_end, METH_O, "component_set_end(component_set self) -> std::vector< SOMcomponent >::iterator"},
+	 { "component_set_rbegin", _wrap_component_set_rbegin, METH_O, "component_set_rbegin(component_set self) -> std::vector< SOMcomponent >::reverse_iterator"},
+	 { "component_set_rend", _wrap_component_set_rend, METH_O, "component_set_rend(component_set self) -> std::vector< SOMcomponent >::reverse_iterator"},
+	 { "component_set_clear", _wrap_component_set_clear, METH_O, "component_set_clear(component_set self)"},
+	 { "component_set_get_allocator", _wrap_component_set_get_allocator, METH_O, "component_set_get_allocator(component_set self) -> std::vector< SOMcomponent >::allocator_type"},
+	 { "component_set_pop_back", _wrap_component_set_pop_back, METH_O, "component_set_pop_back(component_set self)"},
+	 { "component_set_erase", _wrap_component_set_erase, METH_VARARGS, "\n"
+		"component_set_erase(component_set self, std::vector< SOMcomponent >::iterator pos) -> std::vector< SOMcomponent >::iterator\n"
 		"component_set_erase(component_set self, std::vector< SOMcomponent >::iterator first, std::vector< SOMcomponent >::iterator last) -> std::vector< SOMcomponent >::iterator\n"
 		""},
-	 { (char *)"new_component_set", _wrap_new_component_set, METH_VARARGS, (char *)"\n"
+	 { "new_component_set", _wrap_new_component_set, METH_VARARGS, "\n"
 		"component_set()\n"
-		"component_set(component_set arg2)\n"
+		"component_set(component_set other)\n"
 		"component_set(std::vector< SOMcomponent >::size_type size)\n"
 		"new_component_set(std::vector< SOMcomponent >::size_type size, SOMcomponent value) -> component_set\n"
 		""},
-	 { (char *)"component_set_push_back", (PyCFunction) _wrap_component_set_push_back, METH_VARARGS | METH_KEYWORDS, (char *)"component_set_push_back(component_set self, SOMcomponent x)"},
-	 { (char *)"component_set_front", (PyCFunction)_wrap_component_set_front, METH_O, (char *)"component_set_front(component_set self) -> SOMcomponent"},
-	 { (char *)"component_set_back", (PyCFunction)_wrap_component_set_back, METH_O, (char *)"component_set_back(component_set self) -> SOMcomponent"},
-	 { (char *)"component_set_assign", (PyCFunction) _wrap_component_set_assign, METH_VARARGS | METH_KEYWORDS, (char *)"component_set_assign(component_set self, std::vector< SOMcomponent >::size_type n, SOMcomponent x)"},
-	 { (char *)"component_set_resize", _wrap_component_set_resize, METH_VARARGS, (char *)"\n"
-		"resize(std::vector< SOMcomponent >::size_type new_size)\n"
+	 { "component_set_push_back", (PyCFunction)(void(*)(void))_wrap_component_set_push_back, METH_VARARGS|METH_KEYWORDS, "component_set_push_back(component_set self, SOMcomponent x)"},
+	 { "component_set_front", _wrap_component_set_front, METH_O, "component_set_front(component_set self) -> SOMcomponent"},
+	 { "component_set_back", _wrap_component_set_back, METH_O, "component_set_back(component_set self) -> SOMcomponent"},
+	 { "component_set_assign", (PyCFunction)(void(*)(void))_wrap_component_set_assign, METH_VARARGS|METH_KEYWORDS, "component_set_assign(component_set self, std::vector< SOMcomponent >::size_type n, SOMcomponent x)"},
+	 { "component_set_resize", _wrap_component_set_resize, METH_VARARGS, "\n"
+		"component_set_resize(component_set self, std::vector< SOMcomponent >::size_type new_size)\n"
 		"component_set_resize(component_set self, std::vector< SOMcomponent >::size_type new_size, SOMcomponent x)\n"
 		""},
-	 { (char *)"component_set_insert", _wrap_component_set_insert, METH_VARARGS, (char *)"\n"
-		"insert(std::vector< SOMcomponent >::iterator pos, SOMcomponent x) -> std::vector< SOMcomponent >::iterator\n"
+	 { "component_set_insert", _wrap_component_set_insert, METH_VARARGS, "\n"
+		"component_set_insert(component_set self, std::vector< SOMcomponent >::iterator pos, SOMcomponent x) -> std::vector< SOMcomponent >::iterator\n"
 		"component_set_insert(component_set self, std::vector< SOMcomponent >::iterator pos, std::vector< SOMcomponent >::size_type n, SOMcomponent x)\n"
 		""},
-	 { (char *)"component_set_reserve", (PyCFunction) _wrap_component_set_reserve, METH_VARARGS | METH_KEYWORDS, (char *)"component_set_reserve(component_set self, std::vector< SOMcomponent >::size_type n)"},
-	 { (char *)"component_set_capacity", (PyCFunction)_wrap_component_set_capacity, METH_O, (char *)"component_set_capacity(component_set self) -> std::vector< SOMcomponent >::size_type"},
-	 { (char *)"delete_component_set", (PyCFunction)_wrap_delete_component_set, METH_O, (char *)"delete_component_set(component_set self)"},
-	 { (char *)"component_set_swigregister", component_set_swigregister, METH_VARARGS, NULL},
-	 { (char *)"component_set_swiginit", component_set_swiginit, METH_VARARGS, NULL},
-	 { (char *)"SOM_get_pool_types", (PyCFunction)_wrap_SOM_get_pool_types, METH_NOARGS, (char *)"SOM_get_pool_types() -> component_set"},
-	 { (char *)"SOM_add_component", (PyCFunction) _wrap_SOM_add_component, METH_VARARGS | METH_KEYWORDS, (char *)"SOM_add_component(std::string name, bool is_stored, double k_pot, double E_a, double K_w, double n_w, double K_pH, double m_pH) -> SOMcomponent"},
-	 { (char *)"SOM_N_set", _wrap_SOM_N_set, METH_VARARGS, (char *)"SOM_N_set(SOM self, double N)"},
-	 { (char *)"SOM_N_get", (PyCFunction)_wrap_SOM_N_get, METH_O, (char *)"SOM_N_get(SOM self) -> double"},
-	 { (char *)"SOM_CNmin_set", _wrap_SOM_CNmin_set, METH_VARARGS, (char *)"SOM_CNmin_set(SOM self, double CNmin)"},
-	 { (char *)"SOM_CNmin_get", (PyCFunction)_wrap_SOM_CNmin_get, METH_O, (char *)"SOM_CNmin_get(SOM self) -> double"},
-	 { (char *)"SOM_CNmax_set", _wrap_SOM_CNmax_set, METH_VARARGS, (char *)"SOM_CNmax_set(SOM self, double CNmax)"},
-	 { (char *)"SOM_CNmax_get", (PyCFunction)_wrap_SOM_CNmax_get, METH_O, (char *)"SOM_CNmax_get(SOM self) -> double"},
-	 { (char *)"SOM_get_C_pool", (PyCFunction) _wrap_SOM_get_C_pool, METH_VARARGS | METH_KEYWORDS, (char *)"SOM_get_C_pool(SOM self, int index) -> double"},
-	 { (char *)"SOM_set_C_pool", (PyCFunction) _wrap_SOM_set_C_pool, METH_VARARGS | METH_KEYWORDS, (char *)"SOM_set_C_pool(SOM self, int index, double pool_size)"},
-	 { (char *)"SOM___imul__", (PyCFunction) _wrap_SOM___imul__, METH_VARARGS | METH_KEYWORDS, (char *)"SOM___imul__(SOM self, double right) -> SOM"},
-	 { (char *)"SOM___mul__", (PyCFunction) _wrap_SOM___mul__, METH_VARARGS | METH_KEYWORDS, (char *)"SOM___mul__(SOM self, double right) -> SOM"},
-	 { (char *)"SOM___iadd__", (PyCFunction) _wrap_SOM___iadd__, METH_VARARGS | METH_KEYWORDS, (char *)"SOM___iadd__(SOM self, SOM right) -> SOM"},
-	 { (char *)"SOM___isub__", (PyCFunction) _wrap_SOM___isub__, METH_VARARGS | METH_KEYWORDS, (char *)"SOM___isub__(SOM self, SOM right) -> SOM"},
-	 { (char *)"SOM___add__", (PyCFunction) _wrap_SOM___add__, METH_VARARGS | METH_KEYWORDS, (char *)"SOM___add__(SOM self, SOM right) -> SOM"},
-	 { (char *)"SOM___sub__", (PyCFunction) _wrap_SOM___sub__, METH_VARARGS | METH_KEYWORDS, (char *)"SOM___sub__(SOM self, SOM right) -> SOM"},
-	 { (char *)"SOM___itruediv__", (PyCFunction) _wrap_SOM___itruediv__, METH_VARARGS | METH_KEYWORDS, (char *)"SOM___itruediv__(SOM self, double right) -> SOM"},
-	 { (char *)"SOM___truediv__", (PyCFunction) _wrap_SOM___truediv__, METH_VARARGS | METH_KEYWORDS, (char *)"SOM___truediv__(SOM self, double right) -> SOM"},
-	 { (char *)"SOM_dCdt", (PyCFunction) _wrap_SOM_dCdt, METH_VARARGS | METH_KEYWORDS, (char *)"SOM_dCdt(SOM self, double T, double wetness, double pH, double Nsol=0) -> SOM"},
-	 { (char *)"new_SOM", _wrap_new_SOM, METH_VARARGS, (char *)"\n"
+	 { "component_set_reserve", (PyCFunction)(void(*)(void))_wrap_component_set_reserve, METH_VARARGS|METH_KEYWORDS, "component_set_reserve(component_set self, std::vector< SOMcomponent >::size_type n)"},
+	 { "component_set_capacity", _wrap_component_set_capacity, METH_O, "component_set_capacity(component_set self) -> std::vector< SOMcomponent >::size_type"},
+	 { "delete_component_set", _wrap_delete_component_set, METH_O, "delete_component_set(component_set self)"},
+	 { "component_set_swigregister", component_set_swigregister, METH_O, NULL},
+	 { "component_set_swiginit", component_set_swiginit, METH_VARARGS, NULL},
+	 { "SOM_get_pool_types", _wrap_SOM_get_pool_types, METH_NOARGS, "SOM_get_pool_types() -> component_set"},
+	 { "SOM_add_component", (PyCFunction)(void(*)(void))_wrap_SOM_add_component, METH_VARARGS|METH_KEYWORDS, "SOM_add_component(std::string name, bool is_stored, double k_pot, double E_a, double K_w, double n_w, double K_pH, double m_pH) -> SOMcomponent"},
+	 { "SOM_remove_component", (PyCFunction)(void(*)(void))_wrap_SOM_remove_component, METH_VARARGS|METH_KEYWORDS, "SOM_remove_component(std::string name)"},
+	 { "SOM_N_set", _wrap_SOM_N_set, METH_VARARGS, "SOM_N_set(SOM self, double N)"},
+	 { "SOM_N_get", _wrap_SOM_N_get, METH_O, "SOM_N_get(SOM self) -> double"},
+	 { "SOM_set_CN_range", (PyCFunction)(void(*)(void))_wrap_SOM_set_CN_range, METH_VARARGS|METH_KEYWORDS, "SOM_set_CN_range(double CNmin, double CNmax)"},
+	 { "SOM_get_CNmin", _wrap_SOM_get_CNmin, METH_NOARGS, "SOM_get_CNmin() -> double"},
+	 { "SOM_get_CNmax", _wrap_SOM_get_CNmax, METH_NOARGS, "SOM_get_CNmax() -> double"},
+	 { "SOM_inline_capacity", _wrap_SOM_inline_capacity, METH_NOARGS, "SOM_inline_capacity() -> int"},
+	 { "SOM_get_C_pool", (PyCFunction)(void(*)(void))_wrap_SOM_get_C_pool, METH_VARARGS|METH_KEYWORDS, "SOM_get_C_pool(SOM self, int index) -> double"},
+	 { "SOM_set_C_pool", (PyCFunction)(void(*)(void))_wrap_SOM_set_C_pool, METH_VARARGS|METH_KEYWORDS, "SOM_set_C_pool(SOM self, int index, double pool_size)"},
+	 { "SOM___imul__", (PyCFunction)(void(*)(void))_wrap_SOM___imul__, METH_VARARGS|METH_KEYWORDS, "SOM___imul__(SOM self, double right) -> SOM"},
+	 { "SOM___mul__", (PyCFunction)(void(*)(void))_wrap_SOM___mul__, METH_VARARGS|METH_KEYWORDS, "SOM___mul__(SOM self, double right) -> SOM"},
+	 { "SOM___iadd__", (PyCFunction)(void(*)(void))_wrap_SOM___iadd__, METH_VARARGS|METH_KEYWORDS, "SOM___iadd__(SOM self, SOM right) -> SOM"},
+	 { "SOM___isub__", (PyCFunction)(void(*)(void))_wrap_SOM___isub__, METH_VARARGS|METH_KEYWORDS, "SOM___isub__(SOM self, SOM right) -> SOM"},
+	 { "SOM___add__", (PyCFunction)(void(*)(void))_wrap_SOM___add__, METH_VARARGS|METH_KEYWORDS, "SOM___add__(SOM self, SOM right) -> SOM"},
+	 { "SOM___sub__", (PyCFunction)(void(*)(void))_wrap_SOM___sub__, METH_VARARGS|METH_KEYWORDS, "SOM___sub__(SOM self, SOM right) -> SOM"},
+	 { "SOM___itruediv__", (PyCFunction)(void(*)(void))_wrap_SOM___itruediv__, METH_VARARGS|METH_KEYWORDS, "SOM___itruediv__(SOM self, double right) -> SOM"},
+	 { "SOM_add_scaled", (PyCFunction)(void(*)(void))_wrap_SOM_add_scaled, METH_VARARGS|METH_KEYWORDS, "SOM_add_scaled(SOM self, SOM som_template, double mass)"},
+	 { "SOM___truediv__", (PyCFunction)(void(*)(void))_wrap_SOM___truediv__, METH_VARARGS|METH_KEYWORDS, "SOM___truediv__(SOM self, double right) -> SOM"},
+	 { "SOM_dCdt", (PyCFunction)(void(*)(void))_wrap_SOM_dCdt, METH_VARARGS|METH_KEYWORDS, "SOM_dCdt(SOM self, double T, double wetness, double pH, double Nsol=0) -> SOM"},
+	 { "delete_SOM", _wrap_delete_SOM, METH_O, "delete_SOM(SOM self)"},
+	 { "new_SOM", _wrap_new_SOM, METH_VARARGS, "\n"
+		"SOM(SOM copy)\n"
+		"new_SOM(double N=0.0, double EDC=0.0, double CELL=0.0, double LIGN=0.0, double RC=0.0, double DOC=0.0) -> SOM\n"
+		""},
+	 { "SOM_integrate", (PyCFunction)(void(*)(void))_wrap_SOM_integrate, METH_VARARGS|METH_KEYWORDS, "SOM_integrate(SOM self, double dt, double T, double wetness, double pH) -> SOM"},
+	 { "SOM_integrate_multirate", (PyCFunction)(void(*)(void))_wrap_SOM_integrate_multirate, METH_VARARGS|METH_KEYWORDS, "SOM_integrate_multirate(SOM self, double dt, double T, double wetness, double pH, double max_turnover=0.1) -> SOM"},
+	 { "SOM_to_string", _wrap_SOM_to_string, METH_O, "SOM_to_string(SOM self) -> std::string"},
+	 { "SOM_C_get", _wrap_SOM_C_get, METH_O, "SOM_C_get(SOM self) -> double"},
+	 { "SOM_CN_get", _wrap_SOM_CN_get, METH_O, "SOM_CN_get(SOM self) -> double"},
+	 { "SOM_nbytes_get", _wrap_SOM_nbytes_get, METH_O, "SOM_nbytes_get(SOM self) -> size_t"},
+	 { "SOM___getitem__", (PyCFunction)(void(*)(void))_wrap_SOM___getitem__, METH_VARARGS|METH_KEYWORDS, "SOM___getitem__(SOM self, SOMcomponent comp) -> double"},
+	 { "SOM___setitem__", (PyCFunction)(void(*)(void))_wrap_SOM___setitem__, METH_VARARGS|METH_KEYWORDS, "SOM___setitem__(SOM self, SOMcomponent comp, double pool_size)"},
+	 { "SOM___rmul__", (PyCFunction)(void(*)(void))_wrap_SOM___rmul__, METH_VARARGS|METH_KEYWORDS, "SOM___rmul__(SOM self, double right) -> SOM"},
+	 { "SOM___repr__", _wrap_SOM___repr__, METH_O, "SOM___repr__(SOM self) -> std::string"},
+	 { "SOM_swigregister", SOM_swigregister, METH_O, NULL},
+	 { "SOM_swiginit", SOM_swiginit, METH_VARARGS, NULL},
+	 { "wood_litter", _wrap_wood_litter, METH_NOARGS, "wood_litter() -> SOM"},
+	 { "leave_litter", _wrap_leave_litter, METH_NOARGS, "leave_litter() -> SOM"},
+	 { "root_litter", _wrap_root_litter, METH_NOARGS, "root_litter() -> SOM"},
+	 { "pure_DOC", _wrap_pure_DOC, METH_NOARGS, "pure_DOC() -> SOM"},
+	 { NULL, NULL, 0, NULL }
+};
+
+static PyMethodDef SwigMethods_proxydocs[] = {
+	 { "SWIG_PyInstanceMethod_New", SWIG_PyInstanceMethod_New, METH_O, NULL},
+	 { "SWIG_PyStaticMethod_New", SWIG_PyStaticMethod_New, METH_O, NULL},
+	 { "delete_SwigPyIterator", _wrap_delete_SwigPyIterator, METH_O, "delete_SwigPyIterator(SwigPyIterator self)"},
+	 { "SwigPyIterator_value", _wrap_SwigPyIterator_value, METH_O, "value(SwigPyIterator self) -> PyObject *"},
+	 { "SwigPyIterator_incr", (PyCFunction)(void(*)(void))_wrap_SwigPyIterator_incr, METH_VARARGS|METH_KEYWORDS, "incr(SwigPyIterator self, size_t n=1) -> SwigPyIterator"},
+	 { "SwigPyIterator_decr", (PyCFunction)(void(*)(void))_wrap_SwigPyIterator_decr, METH_VARARGS|METH_KEYWORDS, "decr(SwigPyIterator self, size_t n=1) -> SwigPyIterator"},
+	 { "SwigPyIterator_distance", (PyCFunction)(void(*)(void))_wrap_SwigPyIterator_distance, METH_VARARGS|METH_KEYWORDS, "distance(SwigPyIterator self, SwigPyIterator x) -> ptrdiff_t"},
+	 { "SwigPyIterator_equal", (PyCFunction)(void(*)(void))_wrap_SwigPyIterator_equal, METH_VARARGS|METH_KEYWORDS, "equal(SwigPyIterator self, SwigPyIterator x) -> bool"},
+	 { "SwigPyIterator_copy", _wrap_SwigPyIterator_copy, METH_O, "copy(SwigPyIterator self) -> SwigPyIterator"},
+	 { "SwigPyIterator___next__", _wrap_SwigPyIterator___next__, METH_O, "__next__(SwigPyIterator self) -> PyObject *"},
+	 { "SwigPyIterator_previous", _wrap_SwigPyIterator_previous, METH_O, "previous(SwigPyIterator self) -> PyObject *"},
+	 { "SwigPyIterator_advance", (PyCFunction)(void(*)(void))_wrap_SwigPyIterator_advance, METH_VARARGS|METH_KEYWORDS, "advance(SwigPyIterator self, ptrdiff_t n) -> SwigPyIterator"},
+	 { "SwigPyIterator___eq__", (PyCFunction)(void(*)(void))_wrap_SwigPyIterator___eq__, METH_VARARGS|METH_KEYWORDS, "__eq__(SwigPyIterator self, SwigPyIterator x) -> bool"},
+	 { "SwigPyIterator___ne__", (PyCFunction)(void(*)(void))_wrap_SwigPyIterator___ne__, METH_VARARGS|METH_KEYWORDS, "__ne__(SwigPyIterator self, SwigPyIterator x) -> bool"},
+	 { "SwigPyIterator___iadd__", (PyCFunction)(void(*)(void))_wrap_SwigPyIterator___iadd__, METH_VARARGS|METH_KEYWORDS, "__iadd__(SwigPyIterator self, ptrdiff_t n) -> SwigPyIterator"},
+	 { "SwigPyIterator___isub__", (PyCFunction)(void(*)(void))_wrap_SwigPyIterator___isub__, METH_VARARGS|METH_KEYWORDS, "__isub__(SwigPyIterator self, ptrdiff_t n) -> SwigPyIterator"},
+	 { "SwigPyIterator___add__", (PyCFunction)(void(*)(void))_wrap_SwigPyIterator___add__, METH_VARARGS|METH_KEYWORDS, "__add__(SwigPyIterator self, ptrdiff_t n) -> SwigPyIterator"},
+	 { "SwigPyIterator___sub__", _wrap_SwigPyIterator___sub__, METH_VARARGS, "\n"
+		"__sub__(SwigPyIterator self, ptrdiff_t n) -> SwigPyIterator\n"
+		"__sub__(SwigPyIterator self, SwigPyIterator x) -> ptrdiff_t\n"
+		""},
+	 { "SwigPyIterator_swigregister", SwigPyIterator_swigregister, METH_O, NULL},
+	 { "SOMcomponent_count_get", _wrap_SOMcomponent_count_get, METH_VARARGS, NULL},
+	 { "SOMcomponent_count_set", _wrap_SOMcomponent_count_set, METH_O, NULL},
+	 { "SOMcomponent_Id_get", _wrap_SOMcomponent_Id_get, METH_O, "SOMcomponent_Id_get(SOMcomponent self) -> int const"},
+	 { "SOMcomponent_Name_set", _wrap_SOMcomponent_Name_set, METH_VARARGS, "SOMcomponent_Name_set(SOMcomponent self, std::string const & Name)"},
+	 { "SOMcomponent_Name_get", _wrap_SOMcomponent_Name_get, METH_O, "SOMcomponent_Name_get(SOMcomponent self) -> std::string const &"},
+	 { "SOMcomponent_is_stored_set", _wrap_SOMcomponent_is_stored_set, METH_VARARGS, "SOMcomponent_is_stored_set(SOMcomponent self, bool is_stored)"},
+	 { "SOMcomponent_is_stored_get", _wrap_SOMcomponent_is_stored_get, METH_O, "SOMcomponent_is_stored_get(SOMcomponent self) -> bool"},
+	 { "SOMcomponent_k_pot_set", _wrap_SOMcomponent_k_pot_set, METH_VARARGS, "SOMcomponent_k_pot_set(SOMcomponent self, double k_pot)"},
+	 { "SOMcomponent_k_pot_get", _wrap_SOMcomponent_k_pot_get, METH_O, "SOMcomponent_k_pot_get(SOMcomponent self) -> double"},
+	 { "SOMcomponent_E_a_set", _wrap_SOMcomponent_E_a_set, METH_VARARGS, "SOMcomponent_E_a_set(SOMcomponent self, double E_a)"},
+	 { "SOMcomponent_E_a_get", _wrap_SOMcomponent_E_a_get, METH_O, "SOMcomponent_E_a_get(SOMcomponent self) -> double"},
+	 { "SOMcomponent_K_w_set", _wrap_SOMcomponent_K_w_set, METH_VARARGS, "SOMcomponent_K_w_set(SOMcomponent self, double K_w)"},
+	 { "SOMcomponent_K_w_get", _wrap_SOMcomponent_K_w_get, METH_O, "SOMcomponent_K_w_get(SOMcomponent self) -> double"},
+	 { "SOMcomponent_n_w_set", _wrap_SOMcomponent_n_w_set, METH_VARARGS, "SOMcomponent_n_w_set(SOMcomponent self, double n_w)"},
+	 { "SOMcomponent_n_w_get", _wrap_SOMcomponent_n_w_get, METH_O, "SOMcomponent_n_w_get(SOMcomponent self) -> double"},
+	 { "SOMcomponent_K_pH_set", _wrap_SOMcomponent_K_pH_set, METH_VARARGS, "SOMcomponent_K_pH_set(SOMcomponent self, double K_pH)"},
+	 { "SOMcomponent_K_pH_get", _wrap_SOMcomponent_K_pH_get, METH_O, "SOMcomponent_K_pH_get(SOMcomponent self) -> double"},
+	 { "SOMcomponent_m_pH_set", _wrap_SOMcomponent_m_pH_set, METH_VARARGS, "SOMcomponent_m_pH_set(SOMcomponent self, double m_pH)"},
+	 { "SOMcomponent_m_pH_get", _wrap_SOMcomponent_m_pH_get, METH_O, "SOMcomponent_m_pH_get(SOMcomponent self) -> double"},
+	 { "SOMcomponent_set_product", (PyCFunction)(void(*)(void))_wrap_SOMcomponent_set_product, METH_VARARGS|METH_KEYWORDS, "set_product(SOMcomponent self, SOMcomponent product, double fraction)"},
+	 { "SOMcomponent_get_product_fraction", (PyCFunction)(void(*)(void))_wrap_SOMcomponent_get_product_fraction, METH_VARARGS|METH_KEYWORDS, "get_product_fraction(SOMcomponent self, SOMcomponent product) -> double"},
+	 { "SOMcomponent_get_products", _wrap_SOMcomponent_get_products, METH_O, "get_products(SOMcomponent self) -> component_set"},
+	 { "SOMcomponent_decomp", (PyCFunction)(void(*)(void))_wrap_SOMcomponent_decomp, METH_VARARGS|METH_KEYWORDS, "decomp(SOMcomponent self, double T, double wetness, double pH) -> double"},
+	 { "SOMcomponent___lt__", (PyCFunction)(void(*)(void))_wrap_SOMcomponent___lt__, METH_VARARGS|METH_KEYWORDS, "__lt__(SOMcomponent self, SOMcomponent cmp) -> bool"},
+	 { "SOMcomponent___eq__", (PyCFunction)(void(*)(void))_wrap_SOMcomponent___eq__, METH_VARARGS|METH_KEYWORDS, "__eq__(SOMcomponent self, SOMcomponent cmp) -> bool"},
+	 { "SOMcomponent___ne__", (PyCFunction)(void(*)(void))_wrap_SOMcomponent___ne__, METH_VARARGS|METH_KEYWORDS, "__ne__(SOMcomponent self, SOMcomponent cmp) -> bool"},
+	 { "new_SOMcomponent", _wrap_new_SOMcomponent, METH_VARARGS, "\n"
+		"SOMcomponent(std::string name, bool is_stored, double k_pot, double E_a, double K_w, double n_w, double K_pH, double m_pH=1.0)\n"
+		"SOMcomponent()\n"
+		"new_SOMcomponent(SOMcomponent copy) -> SOMcomponent\n"
+		""},
+	 { "delete_SOMcomponent", _wrap_delete_SOMcomponent, METH_O, "delete_SOMcomponent(SOMcomponent self)"},
+	 { "SOMcomponent___repr__", _wrap_SOMcomponent___repr__, METH_O, "__repr__(SOMcomponent self) -> std::string"},
+	 { "SOMcomponent_swigregister", SOMcomponent_swigregister, METH_O, NULL},
+	 { "SOMcomponent_swiginit", SOMcomponent_swiginit, METH_VARARGS, NULL},
+	 { "component_set_iterator", _wrap_component_set_iterator, METH_O, "iterator(component_set self) -> SwigPyIterator"},
+	 { "component_set___bool__", _wrap_component_set___bool__, METH_O, "__bool__(component_set self) -> bool"},
+	 { "component_set___len__", _wrap_component_set___len__, METH_O, "__len__(component_set self) -> std::vector< SOMcomponent >::size_type"},
+	 { "component_set___delitem__", _wrap_component_set___delitem__, METH_VARARGS, "\n"
+		"__delitem__(component_set self, std::vector< SOMcomponent >::difference_type i)\n"
+		"__delitem__(component_set self, SWIGPY_SLICEOBJECT * slice)\n"
+		""},
+	 { "component_set___getitem__", _wrap_component_set___getitem__, METH_VARARGS, "\n"
+		"__getitem__(component_set self, SWIGPY_SLICEOBJECT * slice) -> component_set\n"
+		"__getitem__(component_set self, std::vector< SOMcomponent >::difference_type i) -> SOMcomponent\n"
+		""},
+	 { "component_set___setitem__", _wrap_component_set___setitem__, METH_VARARGS, "\n"
+		"__setitem__(component_set self, SWIGPY_SLICEOBJECT * slice, component_set v)\n"
+		"__setitem__(component_set self, SWIGPY_SLICEOBJECT * slice)\n"
+		"__setitem__(component_set self, std::vector< SOMcomponent >::difference_type i, SOMcomponent x)\n"
+		""},
+	 { "component_set_pop", _wrap_component_set_pop, METH_O, "pop(component_set self) -> SOMcomponent"},
+	 { "component_set_append", (PyCFunction)(void(*)(void))_wrap_component_set_append, METH_VARARGS|METH_KEYWORDS, "append(component_set self, SOMcomponent x)"},
+	 { "component_set_empty", _wrap_component_set_empty, METH_O, "empty(component_set self) -> bool"},
+	 { "component_set_size", _wrap_component_set_size, METH_O, "size(component_set self) -> std::vector< SOMcomponent >::size_type"},
+	 { "component_set_swap", (PyCFunction)(void(*)(void))_wrap_component_set_swap, METH_VARARGS|METH_KEYWORDS, "swap(component_set self, component_set v)"},
+	 { "component_set_begin", _wrap_component_set_begin, METH_O, "begin(component_set self) -> std::vector< SOMcomponent >::iterator"},
+	 { "component_set_end", _wrap_component_set_end, METH_O, "end(component_set self) -> std::vector< SOMcomponent >::iterator"},
+	 { "component_set_rbegin", _wrap_component_set_rbegin, METH_O, "rbegin(component_set self) -> std::vector< SOMcomponent >::reverse_iterator"},
+	 { "component_set_rend", _wrap_component_set_rend, METH_O, "rend(component_set self) -> std::vector< SOMcomponent >::reverse_iterator"},
+	 { "component_set_clear", _wrap_component_set_clear, METH_O, "clear(component_set self)"},
+	 { "component_set_get_allocator", _wrap_component_set_get_allocator, METH_O, "get_allocator(component_set self) -> std::vector< SOMcomponent >::allocator_type"},
+	 { "component_set_pop_back", _wrap_component_set_pop_back, METH_O, "pop_back(component_set self)"},
+	 { "component_set_erase", _wrap_component_set_erase, METH_VARARGS, "\n"
+		"erase(component_set self, std::vector< SOMcomponent >::iterator pos) -> std::vector< SOMcomponent >::iterator\n"
+		"erase(component_set self, std::vector< SOMcomponent >::iterator first, std::vector< SOMcomponent >::iterator last) -> std::vector< SOMcomponent >::iterator\n"
+		""},
+	 { "new_component_set", _wrap_new_component_set, METH_VARARGS, "\n"
+		"component_set()\n"
+		"component_set(component_set other)\n"
+		"component_set(std::vector< SOMcomponent >::size_type size)\n"
+		"new_component_set(std::vector< SOMcomponent >::size_type size, SOMcomponent value) -> component_set\n"
+		""},
+	 { "component_set_push_back", (PyCFunction)(void(*)(void))_wrap_component_set_push_back, METH_VARARGS|METH_KEYWORDS, "push_back(component_set self, SOMcomponent x)"},
+	 { "component_set_front", _wrap_component_set_front, METH_O, "front(component_set self) -> SOMcomponent"},
+	 { "component_set_back", _wrap_component_set_back, METH_O, "back(component_set self) -> SOMcomponent"},
+	 { "component_set_assign", (PyCFunction)(void(*)(void))_wrap_component_set_assign, METH_VARARGS|METH_KEYWORDS, "assign(component_set self, std::vector< SOMcomponent >::size_type n, SOMcomponent x)"},
+	 { "component_set_resize", _wrap_component_set_resize, METH_VARARGS, "\n"
+		"resize(component_set self, std::vector< SOMcomponent >::size_type new_size)\n"
+		"resize(component_set self, std::vector< SOMcomponent >::size_type new_size, SOMcomponent x)\n"
+		""},
+	 { "component_set_insert", _wrap_component_set_insert, METH_VARARGS, "\n"
+		"insert(component_set self, std::vector< SOMcomponent >::iterator pos, SOMcomponent x) -> std::vector< SOMcomponent >::iterator\n"
+		"insert(component_set self, std::vector< SOMcomponent >::iterator pos, std::vector< SOMcomponent >::size_type n, SOMcomponent x)\n"
+		""},
+	 { "component_set_reserve", (PyCFunction)(void(*)(void))_wrap_component_set_reserve, METH_VARARGS|METH_KEYWORDS, "reserve(component_set self, std::vector< SOMcomponent >::size_type n)"},
+	 { "component_set_capacity", _wrap_component_set_capacity, METH_O, "capacity(component_set self) -> std::vector< SOMcomponent >::size_type"},
+	 { "delete_component_set", _wrap_delete_component_set, METH_O, "delete_component_set(component_set self)"},
+	 { "component_set_swigregister", component_set_swigregister, METH_O, NULL},
+	 { "component_set_swiginit", component_set_swiginit, METH_VARARGS, NULL},
+	 { "SOM_get_pool_types", _wrap_SOM_get_pool_types, METH_NOARGS, "get_pool_types() -> component_set"},
+	 { "SOM_add_component", (PyCFunction)(void(*)(void))_wrap_SOM_add_component, METH_VARARGS|METH_KEYWORDS, "add_component(std::string name, bool is_stored, double k_pot, double E_a, double K_w, double n_w, double K_pH, double m_pH) -> SOMcomponent"},
+	 { "SOM_remove_component", (PyCFunction)(void(*)(void))_wrap_SOM_remove_component, METH_VARARGS|METH_KEYWORDS, "remove_component(std::string name)"},
+	 { "SOM_N_set", _wrap_SOM_N_set, METH_VARARGS, "SOM_N_set(SOM self, double N)"},
+	 { "SOM_N_get", _wrap_SOM_N_get, METH_O, "SOM_N_get(SOM self) -> double"},
+	 { "SOM_set_CN_range", (PyCFunction)(void(*)(void))_wrap_SOM_set_CN_range, METH_VARARGS|METH_KEYWORDS, "set_CN_range(double CNmin, double CNmax)"},
+	 { "SOM_get_CNmin", _wrap_SOM_get_CNmin, METH_NOARGS, "get_CNmin() -> double"},
+	 { "SOM_get_CNmax", _wrap_SOM_get_CNmax, METH_NOARGS, "get_CNmax() -> double"},
+	 { "SOM_inline_capacity", _wrap_SOM_inline_capacity, METH_NOARGS, "inline_capacity() -> int"},
+	 { "SOM_get_C_pool", (PyCFunction)(void(*)(void))_wrap_SOM_get_C_pool, METH_VARARGS|METH_KEYWORDS, "get_C_pool(SOM self, int index) -> double"},
+	 { "SOM_set_C_pool", (PyCFunction)(void(*)(void))_wrap_SOM_set_C_pool, METH_VARARGS|METH_KEYWORDS, "set_C_pool(SOM self, int index, double pool_size)"},
+	 { "SOM___imul__", (PyCFunction)(void(*)(void))_wrap_SOM___imul__, METH_VARARGS|METH_KEYWORDS, "__imul__(SOM self, double right) -> SOM"},
+	 { "SOM___mul__", (PyCFunction)(void(*)(void))_wrap_SOM___mul__, METH_VARARGS|METH_KEYWORDS, "__mul__(SOM self, double right) -> SOM"},
+	 { "SOM___iadd__", (PyCFunction)(void(*)(void))_wrap_SOM___iadd__, METH_VARARGS|METH_KEYWORDS, "__iadd__(SOM self, SOM right) -> SOM"},
+	 { "SOM___isub__", (PyCFunction)(void(*)(void))_wrap_SOM___isub__, METH_VARARGS|METH_KEYWORDS, "__isub__(SOM self, SOM right) -> SOM"},
+	 { "SOM___add__", (PyCFunction)(void(*)(void))_wrap_SOM___add__, METH_VARARGS|METH_KEYWORDS, "__add__(SOM self, SOM right) -> SOM"},
+	 { "SOM___sub__", (PyCFunction)(void(*)(void))_wrap_SOM___sub__, METH_VARARGS|METH_KEYWORDS, "__sub__(SOM self, SOM right) -> SOM"},
+	 { "SOM___itruediv__", (PyCFunction)(void(*)(void))_wrap_SOM___itruediv__, METH_VARARGS|METH_KEYWORDS, "__itruediv__(SOM self, double right) -> SOM"},
+	 { "SOM_add_scaled", (PyCFunction)(void(*)(void))_wrap_SOM_add_scaled, METH_VARARGS|METH_KEYWORDS, "add_scaled(SOM self, SOM som_template, double mass)"},
+	 { "SOM___truediv__", (PyCFunction)(void(*)(void))_wrap_SOM___truediv__, METH_VARARGS|METH_KEYWORDS, "__truediv__(SOM self, double right) -> SOM"},
+	 { "SOM_dCdt", (PyCFunction)(void(*)(void))_wrap_SOM_dCdt, METH_VARARGS|METH_KEYWORDS, "dCdt(SOM self, double T, double wetness, double pH, double Nsol=0) -> SOM"},
+	 { "delete_SOM", _wrap_delete_SOM, METH_O, "delete_SOM(SOM self)"},
+	 { "new_SOM", _wrap_new_SOM, METH_VARARGS, "\n"
 		"SOM(SOM copy)\n"
 		"new_SOM(double N=0.0, double EDC=0.0, double CELL=0.0, double LIGN=0.0, double RC=0.0, double DOC=0.0) -> SOM\n"
 		""},
-	 { (char *)"SOM_integrate", (PyCFunction) _wrap_SOM_integrate, METH_VARARGS | METH_KEYWORDS, (char *)"SOM_integrate(SOM self, double dt, double T, double wetness, double pH) -> SOM"},
-	 { (char *)"SOM_to_string", (PyCFunction)_wrap_SOM_to_string, METH_O, (char *)"SOM_to_string(SOM self) -> std::string"},
-	 { (char *)"SOM_C_get", (PyCFunction)_wrap_SOM_C_get, METH_O, (char *)"SOM_C_get(SOM self) -> double"},
-	 { (char *)"SOM_CN_get", (PyCFunction)_wrap_SOM_CN_get, METH_O, (char *)"SOM_CN_get(SOM self) -> double"},
-	 { (char *)"SOM___getitem__", (PyCFunction) _wrap_SOM___getitem__, METH_VARARGS | METH_KEYWORDS, (char *)"SOM___getitem__(SOM self, SOMcomponent comp) -> double"},
-	 { (char *)"SOM___setitem__", (PyCFunction) _wrap_SOM___setitem__, METH_VARARGS | METH_KEYWORDS, (char *)"SOM___setitem__(SOM self, SOMcomponent comp, double pool_size)"},
-	 { (char *)"SOM___rmul__", (PyCFunction) _wrap_SOM___rmul__, METH_VARARGS | METH_KEYWORDS, (char *)"SOM___rmul__(SOM self, double right) -> SOM"},
-	 { (char *)"SOM___repr__", (PyCFunction)_wrap_SOM___repr__, METH_O, (char *)"SOM___repr__(SOM self) -> std::string"},
-	 { (char *)"delete_SOM", (PyCFunction)_wrap_delete_SOM, METH_O, (char *)"delete_SOM(SOM self)"},
-	 { (char *)"SOM_swigregister", SOM_swigregister, METH_VARARGS, NULL},
-	 { (char *)"SOM_swiginit", SOM_swiginit, METH_VARARGS, NULL},
-	 { (char *)"wood_litter", (PyCFunction)_wrap_wood_litter, METH_NOARGS, (char *)"wood_litter() -> SOM"},
-	 { (char *)"leave_litter", (PyCFunction)_wrap_leave_litter, METH_NOARGS, (char *)"leave_litter() -> SOM"},
-	 { (char *)"root_litter", (PyCFunction)_wrap_root_litter, METH_NOARGS, (char *)"root_litter() -> SOM"},
-	 { (char *)"pure_DOC", (PyCFunction)_wrap_pure_DOC, METH_NOARGS, (char *)"pure_DOC() -> SOM"},
+	 { "SOM_integrate", (PyCFunction)(void(*)(void))_wrap_SOM_integrate, METH_VARARGS|METH_KEYWORDS, "integrate(SOM self, double dt, double T, double wetness, double pH) -> SOM"},
+	 { "SOM_integrate_multirate", (PyCFunction)(void(*)(void))_wrap_SOM_integrate_multirate, METH_VARARGS|METH_KEYWORDS, "integrate_multirate(SOM self, double dt, double T, double wetness, double pH, double max_turnover=0.1) -> SOM"},
+	 { "SOM_to_string", _wrap_SOM_to_string, METH_O, "to_string(SOM self) -> std::string"},
+	 { "SOM_C_get", _wrap_SOM_C_get, METH_O, "SOM_C_get(SOM self) -> double"},
+	 { "SOM_CN_get", _wrap_SOM_CN_get, METH_O, "SOM_CN_get(SOM self) -> double"},
+	 { "SOM_nbytes_get", _wrap_SOM_nbytes_get, METH_O, "SOM_nbytes_get(SOM self) -> size_t"},
+	 { "SOM___getitem__", (PyCFunction)(void(*)(void))_wrap_SOM___getitem__, METH_VARARGS|METH_KEYWORDS, "__getitem__(SOM self, SOMcomponent comp) -> double"},
+	 { "SOM___setitem__", (PyCFunction)(void(*)(void))_wrap_SOM___setitem__, METH_VARARGS|METH_KEYWORDS, "__setitem__(SOM self, SOMcomponent comp, double pool_size)"},
+	 { "SOM___rmul__", (PyCFunction)(void(*)(void))_wrap_SOM___rmul__, METH_VARARGS|METH_KEYWORDS, "__rmul__(SOM self, double right) -> SOM"},
+	 { "SOM___repr__", _wrap_SOM___repr__, METH_O, "__repr__(SOM self) -> std::string"},
+	 { "SOM_swigregister", SOM_swigregister, METH_O, NULL},
+	 { "SOM_swiginit", SOM_swiginit, METH_VARARGS, NULL},
+	 { "wood_litter", _wrap_wood_litter, METH_NOARGS, "wood_litter() -> SOM"},
+	 { "leave_litter", _wrap_leave_litter, METH_NOARGS, "leave_litter() -> SOM"},
+	 { "root_litter", _wrap_root_litter, METH_NOARGS, "root_litter() -> SOM"},
+	 { "pure_DOC", _wrap_pure_DOC, METH_NOARGS, "pure_DOC() -> SOM"},
 	 { NULL, NULL, 0, NULL }
 };
 
@@ -12532,10 +12644,11 @@ static swig_type_info _swigt__p_allocator_type = {"_p_allocator_type", "allocato
 static swig_type_info _swigt__p_char = {"_p_char", "char *", 0, 0, (void*)0, 0};
 static swig_type_info _swigt__p_difference_type = {"_p_difference_type", "difference_type *", 0, 0, (void*)0, 0};
 static swig_type_info _swigt__p_p_PyObject = {"_p_p_PyObject", "PyObject **", 0, 0, (void*)0, 0};
+static swig_type_info _swigt__p_product_map = {"_p_product_map", "product_map *", 0, 0, (void*)0, 0};
 static swig_type_info _swigt__p_size_type = {"_p_size_type", "size_type *", 0, 0, (void*)0, 0};
 static swig_type_info _swigt__p_std__allocatorT_SOMcomponent_t = {"_p_std__allocatorT_SOMcomponent_t", "std::vector< SOMcomponent >::allocator_type *|std::allocator< SOMcomponent > *", 0, 0, (void*)0, 0};
 static swig_type_info _swigt__p_std__invalid_argument = {"_p_std__invalid_argument", "std::invalid_argument *", 0, 0, (void*)0, 0};
-static swig_type_info _swigt__p_std__vectorT_SOMcomponent_std__allocatorT_SOMcomponent_t_t = {"_p_std__vectorT_SOMcomponent_std__allocatorT_SOMcomponent_t_t", "std::vector< SOMcomponent,std::allocator< SOMcomponent > > *|component_set *|std::vector< SOMcomponent > *", 0, 0, (void*)0, 0};
+static swig_type_info _swigt__p_std__vectorT_SOMcomponent_t = {"_p_std__vectorT_SOMcomponent_t", "component_set *|std::vector< SOMcomponent,std::allocator< SOMcomponent > > *|std::vector< SOMcomponent > *", 0, 0, (void*)0, 0};
 static swig_type_info _swigt__p_swig__SwigPyIterator = {"_p_swig__SwigPyIterator", "swig::SwigPyIterator *", 0, 0, (void*)0, 0};
 static swig_type_info _swigt__p_value_type = {"_p_value_type", "value_type *", 0, 0, (void*)0, 0};
 
@@ -12546,10 +12659,11 @@ static swig_type_info *swig_type_initial[] = {
   &_swigt__p_char,
   &_swigt__p_difference_type,
   &_swigt__p_p_PyObject,
+  &_swigt__p_product_map,
   &_swigt__p_size_type,
   &_swigt__p_std__allocatorT_SOMcomponent_t,
   &_swigt__p_std__invalid_argument,
-  &_swigt__p_std__vectorT_SOMcomponent_std__allocatorT_SOMcomponent_t_t,
+  &_swigt__p_std__vectorT_SOMcomponent_t,
   &_swigt__p_swig__SwigPyIterator,
   &_swigt__p_value_type,
 };
@@ -12560,10 +12674,11 @@ static swig_cast_info _swigc__p_allocator_type[] = {  {&_swigt__p_allocator_type
 static swig_cast_info _swigc__p_char[] = {  {&_swigt__p_char, 0, 0, 0},{0, 0, 0, 0}};
 static swig_cast_info _swigc__p_difference_type[] = {  {&_swigt__p_difference_type, 0, 0, 0},{0, 0, 0, 0}};
 static swig_cast_info _swigc__p_p_PyObject[] = {  {&_swigt__p_p_PyObject, 0, 0, 0},{0, 0, 0, 0}};
+static swig_cast_info _swigc__p_product_map[] = {  {&_swigt__p_product_map, 0, 0, 0},{0, 0, 0, 0}};
 static swig_cast_info _swigc__p_size_type[] = {  {&_swigt__p_size_type, 0, 0, 0},{0, 0, 0, 0}};
 static swig_cast_info _swigc__p_std__allocatorT_SOMcomponent_t[] = {  {&_swigt__p_std__allocatorT_SOMcomponent_t, 0, 0, 0},{0, 0, 0, 0}};
 static swig_cast_info _swigc__p_std__invalid_argument[] = {  {&_swigt__p_std__invalid_argument, 0, 0, 0},{0, 0, 0, 0}};
-static swig_cast_info _swigc__p_std__vectorT_SOMcomponent_std__allocatorT_SOMcomponent_t_t[] = {  {&_swigt__p_std__vectorT_SOMcomponent_std__allocatorT_SOMcomponent_t_t, 0, 0, 0},{0, 0, 0, 0}};
+static swig_cast_info _swigc__p_std__vectorT_SOMcomponent_t[] = {  {&_swigt__p_std__vectorT_SOMcomponent_t, 0, 0, 0},{0, 0, 0, 0}};
 static swig_cast_info _swigc__p_swig__SwigPyIterator[] = {  {&_swigt__p_swig__SwigPyIterator, 0, 0, 0},{0, 0, 0, 0}};
 static swig_cast_info _swigc__p_value_type[] = {  {&_swigt__p_value_type, 0, 0, 0},{0, 0, 0, 0}};
 
@@ -12574,10 +12689,11 @@ static swig_cast_info *swig_cast_initial[] = {
   _swigc__p_char,
   _swigc__p_difference_type,
   _swigc__p_p_PyObject,
+  _swigc__p_product_map,
   _swigc__p_size_type,
   _swigc__p_std__allocatorT_SOMcomponent_t,
   _swigc__p_std__invalid_argument,
-  _swigc__p_std__vectorT_SOMcomponent_std__allocatorT_SOMcomponent_t_t,
+  _swigc__p_std__vectorT_SOMcomponent_t,
   _swigc__p_swig__SwigPyIterator,
   _swigc__p_value_type,
 };
@@ -12593,7 +12709,7 @@ static swig_const_info swig_const_table[] = {
 #endif
 /* -----------------------------------------------------------------------------
  * Type initialization:
- * This problem is tough by the requirement that no dynamic
+ * This problem is made tough by the requirement that no dynamic
  * memory is used. Also, since swig_type_info structures store pointers to
  * swig_cast_info structures and swig_cast_info structures store pointers back
  * to swig_type_info structures, we need some lookup code at initialization.
@@ -12608,15 +12724,20 @@ static swig_const_info swig_const_table[] = {
  * array. We just loop through that array, and handle each type individually.
  * First we lookup if this type has been already loaded, and if so, use the
  * loaded structure instead of the generated one. Then we have to fill in the
- * cast linked list. The cast data is initially stored in something like a
+ * cast dependencies. The cast data is initially stored in something like a
  * two-dimensional array. Each row corresponds to a type (there are the same
  * number of rows as there are in the swig_type_initial array). Each entry in
  * a column is one of the swig_cast_info structures for that type.
  * The cast_initial array is actually an array of arrays, because each row has
- * a variable number of columns. So to actually build the cast linked list,
- * we find the array of casts associated with the type, and loop through it
- * adding the casts to the list. The one last trick we need to do is making
- * sure the type pointer in the swig_cast_info struct is correct.
+ * a variable number of columns.
+ *
+ * We loop through the cast[] array associated with the type and mark casts
+ * which have not been defined in previously loaded modules by assigning
+ * cast pointer value to cast->next. We also hash cast->type->name string
+ * and store the value in the cast->value field. If we encounter swig_cast_info
+ * structure that represents a cast to self we move it to the beginning
+ * of the cast array. One trick we need to do is making sure the type pointer
+ * in the swig_cast_info struct is correct.
  *
  * First off, we lookup the cast->type name to see if it is already loaded.
  * There are three cases to handle:
@@ -12628,8 +12749,71 @@ static swig_const_info swig_const_table[] = {
  *     cast->type) are loaded, THEN the cast info has already been loaded by
  *     the previous module so we just ignore it.
  *  3) Finally, if cast->type has not already been loaded, then we add that
- *     swig_cast_info to the linked list (because the cast->type) pointer will
+ *     swig_cast_info to the list (because the cast->type) pointer will
  *     be correct.
+ *
+ * Once the cast array has been set up AND it does have new casts that need
+ * to be added we sort non-self cast entries to move filtered out entries
+ * to the end of the array and to arrange the rest in the increasing order
+ * of their type pointer values. We store the index of the last added entry
+ * in the cast->value field of the entry[0] (overwriting the name hash). Then
+ * we sort <next|value> fields of the remaining entries to arrange hash values
+ * in the increasing order. This way cast->next->type->name field matches
+ * the cast->value hash.
+ *
+ * Example:
+ * Array of casts for type stored at 0x5000, cast to type stored at 0x3000
+ * has already been loaded
+ *
+ *      After sweep-and-hash:   After sort-by-type:    After sort-by-hash:
+ *        ________________       ________________       ________________
+ *       |                |     |                |     |                |
+ * Entry |  type = 0x5000 |     |  type = 0x5000 |     |  type = 0x5000 |
+ *   0   |                |     |                |     |                |
+ *       |  next = Entry0 |     |  next = Entry0 |     |  next = Entry0 |
+ *       | value = 1212   |     | value = 3      |     | value = 3      |
+ *       |                |     |                |     |                |
+ *       |================|     |================|     |================|
+ *       |                |     |                |     |                |
+ * Entry |  type = 0x2000 |     |  type = 0x1000 |     |  type = 0x1000 |
+ *   1   |                |     |                |     |                |
+ *       |  next = Entry1 |     |  next = Entry1 |     |  next = Entry3 |
+ *       | value = 3434   |     | value = 4545   |     | value = 2323   |
+ *       |________________|     |________________|     |________________|
+ *       |                |     |                |     |                |
+ * Entry |  type = 0x3000 |     |  type = 0x2000 |     |  type = 0x2000 |
+ *   2   |                |     |                |     |                |
+ *       |  next = 0      |     |  next = Entry2 |     |  next = Entry2 |
+ *       | value = 0      |     | value = 3434   |     | value = 3434   |
+ *       |________________|     |________________|     |________________|
+ *       |                |     |                |     |                |
+ * Entry |  type = 0x1000 |     |  type = 0x4000 |     |  type = 0x4000 |
+ *   3   |                |     |                |     |                |
+ *       |  next = Entry3 |     |  next = Entry3 |     |  next = Entry1 |
+ *       | value = 4545   |     | value = 2323   |     | value = 4545   |
+ *       |________________|     |________________|     |________________|
+ *       |                |     |                |     |                |
+ * Entry |  type = 0x4000 |     |  type = 0x3000 |     |  type = 0x3000 |
+ *   4   |                |     |                |     |                |
+ *       |  next = Entry4 |     |  next = 0      |     |  next = 0      |
+ *       | value = 2323   |     | value = 0      |     | value = 0      |
+ *       |________________|     |________________|     |________________|
+ *
+ * Once the cast array has been initialized, we use cast[0]->next field to link
+ * it into the list of cast arrays for the type.
+ *              ____    ____    ____
+ * type->cast->|next|->|next|->|next|->0
+ *             |----|  |----|  |----|
+ *             |----|  |----|  |----|
+ *             |----|  |----|  |----|
+ *
+ * Subsequent cast resolution works as follows:
+ *
+ * 1. Check whether the type matches the first entry in the current cast array.
+ * 2. If not, then do a binary search over the (0:cast->value] interval using
+ *    either type address or the hash value of the type name.
+ * 3. If not found, then move over to the next cast array (cast[0]->next).
+ *
  * ----------------------------------------------------------------------------- */
 
 #ifdef __cplusplus
@@ -12643,9 +12827,54 @@ extern "C" {
 #define SWIGRUNTIME_DEBUG
 #endif
 
+#ifndef SWIG_INIT_CLIENT_DATA_TYPE
+#define SWIG_INIT_CLIENT_DATA_TYPE void *
+#endif
+
+/*
+ * Sort function that puts cast entries with nonzero 'next' at the front
+ * of the array while ordering them by addresses of their 'type' structs.
+ */
+SWIGINTERN int SWIG_CastCmpStruct(const void *pa, const void *pb) {
+  swig_cast_info *pca = (swig_cast_info *)pa;
+  swig_cast_info *pcb = (swig_cast_info *)pb;
+  /* Entries with next != 0 (newly mapped) come before entries with next == 0 (already loaded) */
+  if (!pca->next && pcb->next) return 1;
+  if (pca->next && !pcb->next) return -1;
+  /* Within the same group, sort by type pointer for binary search */
+  if (pca->type < pcb->type) return -1;
+  if (pca->type > pcb->type) return 1;
+  return 0;
+}
+
+/*
+ * Shell-sort 'next' and 'value' field pairs to order them by 'value'.
+ */
+SWIGINTERN void SWIG_CastHashSort(swig_cast_info *cast, int size) {
+  const int hmax = size/9;
+  int h, i;
+  for(h = 1; h <= hmax; h = 3*h+1);
+  for(; h > 0; h /= 3)
+  {
+    for(i = h; i < size; ++i)
+    {
+      swig_cast_info *p = cast[i].next;
+      unsigned int hash = cast[i].value;
+      int j = i;
+      while(j >= h && hash < cast[j-h].value)
+      {
+        cast[j].next = cast[j-h].next;
+        cast[j].value = cast[j-h].value;
+        j -= h;
+      }
+      cast[j].next = p;
+      cast[j].value = hash;
+    }
+  }
+}
 
 SWIGRUNTIME void
-SWIG_InitializeModule(void *clientdata) {
+SWIG_InitializeModule(SWIG_INIT_CLIENT_DATA_TYPE clientdata) {
   size_t i;
   swig_module_info *module_head, *iter;
   int init;
@@ -12691,15 +12920,16 @@ SWIG_InitializeModule(void *clientdata) {
   
   /* Now work on filling in swig_module.types */
 #ifdef SWIGRUNTIME_DEBUG
-  printf("SWIG_InitializeModule: size %d\n", swig_module.size);
+  printf("SWIG_InitializeModule: size %lu\n", (unsigned long)swig_module.size);
 #endif
   for (i = 0; i < swig_module.size; ++i) {
     swig_type_info *type = 0;
-    swig_type_info *ret;
-    swig_cast_info *cast;
+    swig_type_info *target_type;
+    swig_cast_info *cast, *first;
+    int num_mapped = 0;
     
 #ifdef SWIGRUNTIME_DEBUG
-    printf("SWIG_InitializeModule: type %d %s\n", i, swig_module.type_initial[i]->name);
+    printf("SWIG_InitializeModule: type %lu %s\n", (unsigned long)i, swig_module.type_initial[i]->name);
 #endif
     
     /* if there is another module already loaded */
@@ -12722,48 +12952,104 @@ SWIG_InitializeModule(void *clientdata) {
     }
     
     /* Insert casting types */
-    cast = swig_module.cast_initial[i];
+    cast = first = swig_module.cast_initial[i];
     while (cast->type) {
       /* Don't need to add information already in the list */
-      ret = 0;
+      target_type = 0;
 #ifdef SWIGRUNTIME_DEBUG
       printf("SWIG_InitializeModule: look cast %s\n", cast->type->name);
 #endif
       if (swig_module.next != &swig_module) {
-        ret = SWIG_MangledTypeQueryModule(swig_module.next, &swig_module, cast->type->name);
+        target_type = SWIG_MangledTypeQueryModule(swig_module.next, &swig_module, cast->type->name);
+        if (target_type) {
+          /* Target type already defined in another module */
 #ifdef SWIGRUNTIME_DEBUG
-        if (ret) printf("SWIG_InitializeModule: found cast %s\n", ret->name);
+          printf("SWIG_InitializeModule: found cast %s\n", target_type->name);
 #endif
-      }
-      if (ret) {
-        if (type == swig_module.type_initial[i]) {
+          if (type == swig_module.type_initial[i]) {
 #ifdef SWIGRUNTIME_DEBUG
-          printf("SWIG_InitializeModule: skip old type %s\n", ret->name);
+            printf("SWIG_InitializeModule: skip old type %s\n", target_type->name);
 #endif
-          cast->type = ret;
-          ret = 0;
-        } else {
-          /* Check for casting already in the list */
-          swig_cast_info *ocast = SWIG_TypeCheck(ret->name, type);
+            cast->type = target_type;
+            target_type = 0;
+          } else {
+            /* Check if this cast is already in the list */
+            swig_cast_info *ocast = SWIG_TypeCheck(target_type->name, type);
 #ifdef SWIGRUNTIME_DEBUG
-          if (ocast) printf("SWIG_InitializeModule: skip old cast %s\n", ret->name);
+            if (ocast) printf("SWIG_InitializeModule: skip old cast %s\n", target_type->name);
 #endif
-          if (!ocast) ret = 0;
+            if (!ocast) {
+              cast->type = target_type;
+              target_type = 0;
+            }
+          }
         }
       }
       
-      if (!ret) {
+      if (!target_type) {
 #ifdef SWIGRUNTIME_DEBUG
         printf("SWIG_InitializeModule: adding cast %s\n", cast->type->name);
 #endif
-        if (type->cast) {
-          type->cast->prev = cast;
-          cast->next = type->cast;
+        /* Set inclusion mark for sorting */
+        cast->next = cast;
+        num_mapped++;
+        
+        if (type == cast->type) {
+#ifdef SWIGRUNTIME_DEBUG
+          printf("%s : self cast at pos [%li]\n", type->name, cast - first);
+#endif
+          if (cast - first) {
+            /* Move cast to itself to the first entry in the array */
+            
+            swig_cast_info tmp = *cast;
+            *cast = *first;
+            *first = tmp;
+          }
+          first++;
+          
+        } else {
+          cast->value = SWIG_Hash(cast->type->name, (unsigned int)strlen(cast->type->name));
         }
-        type->cast = cast;
       }
       cast++;
     }
+    
+    if (num_mapped) {
+      if (cast - first) {
+        swig_cast_info *tmp;
+        
+        /* Sort casts by type address for binary search in SWIG_TypeCheckStruct */
+        qsort(first, (size_t)(cast - first), sizeof(swig_cast_info), SWIG_CastCmpStruct);
+        
+        /* Remap back links for added entries */
+        cast = swig_module.cast_initial[i] + num_mapped;
+        for (tmp = first; tmp < cast; tmp++) {
+          tmp->next = tmp;
+        }
+      }
+      
+      /* Set the value field of the first entry to the index of the last added entry */
+      cast = swig_module.cast_initial[i];
+      cast->value = (unsigned int)(num_mapped - 1);
+      
+      num_mapped -= (int)(first - cast);
+      if (num_mapped > 1) {
+        /* Sort <'next','value'> pairs by 'value' for binary search in SWIG_TypeCheck */
+        
+        SWIG_CastHashSort(first, num_mapped);
+      }
+      
+      first = type->cast;
+      if (first) {
+        /* Link the current set into the list of cast arrays */
+        cast->next = first->next;
+        first->next = cast;
+      } else {
+        cast->next = 0;
+        type->cast = cast;
+      }
+    }
+    
     /* Set entry in modules->types array equal to the type */
     swig_module.types[i] = type;
   }
@@ -12774,7 +13060,7 @@ SWIG_InitializeModule(void *clientdata) {
   for (i = 0; i < swig_module.size; ++i) {
     int j = 0;
     swig_cast_info *cast = swig_module.cast_initial[i];
-    printf("SWIG_InitializeModule: type %d %s\n", i, swig_module.type_initial[i]->name);
+    printf("SWIG_InitializeModule: type %lu %s\n", (unsigned long)i, swig_module.type_initial[i]->name);
     while (cast->type) {
       printf("SWIG_InitializeModule: cast type %s\n", cast->type->name);
       cast++;
@@ -12794,7 +13080,6 @@ SWIG_InitializeModule(void *clientdata) {
 SWIGRUNTIME void
 SWIG_PropagateClientData(void) {
   size_t i;
-  swig_cast_info *equiv;
   static int init_run = 0;
   
   if (init_run) return;
@@ -12802,13 +13087,16 @@ SWIG_PropagateClientData(void) {
   
   for (i = 0; i < swig_module.size; i++) {
     if (swig_module.types[i]->clientdata) {
-      equiv = swig_module.types[i]->cast;
-      while (equiv) {
-        if (!equiv->converter) {
-          if (equiv->type && !equiv->type->clientdata)
-          SWIG_TypeClientData(equiv->type, swig_module.types[i]->clientdata);
+      swig_cast_info *head, *cast;
+      head = swig_module.types[i]->cast;
+      while (head) {
+        for (cast = head; (cast - head) <= head->value; cast++) {
+          if (!cast->converter) {
+            if (cast->type && !cast->type->clientdata)
+            SWIG_TypeClientData(cast->type, swig_module.types[i]->clientdata);
+          }
         }
-        equiv = equiv->next;
+        head = head->next;
       }
     }
   }
@@ -12828,235 +13116,6 @@ SWIG_PropagateClientData(void) {
 extern "C" {
 #endif
   
-  /* Python-specific SWIG API */
-#define SWIG_newvarlink()                             SWIG_Python_newvarlink()
-#define SWIG_addvarlink(p, name, get_attr, set_attr)  SWIG_Python_addvarlink(p, name, get_attr, set_attr)
-#define SWIG_InstallConstants(d, constants)           SWIG_Python_InstallConstants(d, constants)
-  
-  /* -----------------------------------------------------------------------------
-   * global variable support code.
-   * ----------------------------------------------------------------------------- */
-  
-  typedef struct swig_globalvar {
-    char       *name;                  /* Name of global variable */
-    PyObject *(*get_attr)(void);       /* Return the current value */
-    int       (*set_attr)(PyObject *); /* Set the value */
-    struct swig_globalvar *next;
-  } swig_globalvar;
-  
-  typedef struct swig_varlinkobject {
-    PyObject_HEAD
-    swig_globalvar *vars;
-  } swig_varlinkobject;
-  
-  SWIGINTERN PyObject *
-  swig_varlink_repr(swig_varlinkobject *SWIGUNUSEDPARM(v)) {
-#if PY_VERSION_HEX >= 0x03000000
-    return PyUnicode_InternFromString("<Swig global variables>");
-#else
-    return PyString_FromString("<Swig global variables>");
-#endif
-  }
-  
-  SWIGINTERN PyObject *
-  swig_varlink_str(swig_varlinkobject *v) {
-#if PY_VERSION_HEX >= 0x03000000
-    PyObject *str = PyUnicode_InternFromString("(");
-    PyObject *tail;
-    PyObject *joined;
-    swig_globalvar *var;
-    for (var = v->vars; var; var=var->next) {
-      tail = PyUnicode_FromString(var->name);
-      joined = PyUnicode_Concat(str, tail);
-      Py_DecRef(str);
-      Py_DecRef(tail);
-      str = joined;
-      if (var->next) {
-        tail = PyUnicode_InternFromString(", ");
-        joined = PyUnicode_Concat(str, tail);
-        Py_DecRef(str);
-        Py_DecRef(tail);
-        str = joined;
-      }
-    }
-    tail = PyUnicode_InternFromString(")");
-    joined = PyUnicode_Concat(str, tail);
-    Py_DecRef(str);
-    Py_DecRef(tail);
-    str = joined;
-#else
-    PyObject *str = PyString_FromString("(");
-    swig_globalvar *var;
-    for (var = v->vars; var; var=var->next) {
-      PyString_ConcatAndDel(&str,PyString_FromString(var->name));
-      if (var->next) PyString_ConcatAndDel(&str,PyString_FromString(", "));
-    }
-    PyString_ConcatAndDel(&str,PyString_FromString(")"));
-#endif
-    return str;
-  }
-  
-  SWIGINTERN int
-  swig_varlink_print(swig_varlinkobject *v, FILE *fp, int SWIGUNUSEDPARM(flags)) {
-    char *tmp;
-    PyObject *str = swig_varlink_str(v);
-    fprintf(fp,"Swig global variables ");
-    fprintf(fp,"%s\n", tmp = SWIG_Python_str_AsChar(str));
-    SWIG_Python_str_DelForPy3(tmp);
-    Py_DECREF(str);
-    return 0;
-  }
-  
-  SWIGINTERN void
-  swig_varlink_dealloc(swig_varlinkobject *v) {
-    swig_globalvar *var = v->vars;
-    while (var) {
-      swig_globalvar *n = var->next;
-      free(var->name);
-      free(var);
-      var = n;
-    }
-  }
-  
-  SWIGINTERN PyObject *
-  swig_varlink_getattr(swig_varlinkobject *v, char *n) {
-    PyObject *res = NULL;
-    swig_globalvar *var = v->vars;
-    while (var) {
-      if (strcmp(var->name,n) == 0) {
-        res = (*var->get_attr)();
-        break;
-      }
-      var = var->next;
-    }
-    if (res == NULL && !PyErr_Occurred()) {
-      PyErr_Format(PyExc_AttributeError, "Unknown C global variable '%s'", n);
-    }
-    return res;
-  }
-  
-  SWIGINTERN int
-  swig_varlink_setattr(swig_varlinkobject *v, char *n, PyObject *p) {
-    int res = 1;
-    swig_globalvar *var = v->vars;
-    while (var) {
-      if (strcmp(var->name,n) == 0) {
-        res = (*var->set_attr)(p);
-        break;
-      }
-      var = var->next;
-    }
-    if (res == 1 && !PyErr_Occurred()) {
-      PyErr_Format(PyExc_AttributeError, "Unknown C global variable '%s'", n);
-    }
-    return res;
-  }
-  
-  SWIGINTERN PyTypeObject*
-  swig_varlink_type(void) {
-    static char varlink__doc__[] = "Swig var link object";
-    static PyTypeObject varlink_type;
-    static int type_init = 0;
-    if (!type_init) {
-      const PyTypeObject tmp = {
-#if PY_VERSION_HEX >= 0x03000000
-        PyVarObject_HEAD_INIT(NULL, 0)
-#else
-        PyObject_HEAD_INIT(NULL)
-        0,                                  /* ob_size */
-#endif
-        (char *)"swigvarlink",              /* tp_name */
-        sizeof(swig_varlinkobject),         /* tp_basicsize */
-        0,                                  /* tp_itemsize */
-        (destructor) swig_varlink_dealloc,  /* tp_dealloc */
-        (printfunc) swig_varlink_print,     /* tp_print */
-        (getattrfunc) swig_varlink_getattr, /* tp_getattr */
-        (setattrfunc) swig_varlink_setattr, /* tp_setattr */
-        0,                                  /* tp_compare */
-        (reprfunc) swig_varlink_repr,       /* tp_repr */
-        0,                                  /* tp_as_number */
-        0,                                  /* tp_as_sequence */
-        0,                                  /* tp_as_mapping */
-        0,                                  /* tp_hash */
-        0,                                  /* tp_call */
-        (reprfunc) swig_varlink_str,        /* tp_str */
-        0,                                  /* tp_getattro */
-        0,                                  /* tp_setattro */
-        0,                                  /* tp_as_buffer */
-        0,                                  /* tp_flags */
-        varlink__doc__,                     /* tp_doc */
-        0,                                  /* tp_traverse */
-        0,                                  /* tp_clear */
-        0,                                  /* tp_richcompare */
-        0,                                  /* tp_weaklistoffset */
-#if PY_VERSION_HEX >= 0x02020000
-        0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0, /* tp_iter -> tp_weaklist */
-#endif
-#if PY_VERSION_HEX >= 0x02030000
-        0,                                  /* tp_del */
-#endif
-#if PY_VERSION_HEX >= 0x02060000
-        0,                                  /* tp_version_tag */
-#endif
-#if PY_VERSION_HEX >= 0x03040000
-        0,                                  /* tp_finalize */
-#endif
-#ifdef COUNT_ALLOCS
-        0,                                  /* tp_allocs */
-        0,                                  /* tp_frees */
-        0,                                  /* tp_maxalloc */
-#if PY_VERSION_HEX >= 0x02050000
-        0,                                  /* tp_prev */
-#endif
-        0                                   /* tp_next */
-#endif
-      };
-      varlink_type = tmp;
-      type_init = 1;
-#if PY_VERSION_HEX < 0x02020000
-      varlink_type.ob_type = &PyType_Type;
-#else
-      if (PyType_Ready(&varlink_type) < 0)
-      return NULL;
-#endif
-    }
-    return &varlink_type;
-  }
-  
-  /* Create a variable linking object for use later */
-  SWIGINTERN PyObject *
-  SWIG_Python_newvarlink(void) {
-    swig_varlinkobject *result = PyObject_NEW(swig_varlinkobject, swig_varlink_type());
-    if (result) {
-      result->vars = 0;
-    }
-    return ((PyObject*) result);
-  }
-  
-  SWIGINTERN void 
-  SWIG_Python_addvarlink(PyObject *p, char *name, PyObject *(*get_attr)(void), int (*set_attr)(PyObject *p)) {
-    swig_varlinkobject *v = (swig_varlinkobject *) p;
-    swig_globalvar *gv = (swig_globalvar *) malloc(sizeof(swig_globalvar));
-    if (gv) {
-      size_t size = strlen(name)+1;
-      gv->name = (char *)malloc(size);
-      if (gv->name) {
-        strncpy(gv->name,name,size);
-        gv->get_attr = get_attr;
-        gv->set_attr = set_attr;
-        gv->next = v->vars;
-      }
-    }
-    v->vars = gv;
-  }
-  
-  SWIGINTERN PyObject *
-  SWIG_globals(void) {
-    static PyObject *_SWIG_globals = 0; 
-    if (!_SWIG_globals) _SWIG_globals = SWIG_newvarlink();  
-    return _SWIG_globals;
-  }
-  
   /* -----------------------------------------------------------------------------
    * constants/methods manipulation
    * ----------------------------------------------------------------------------- */
@@ -13072,7 +13131,7 @@ extern "C" {
         obj = SWIG_InternalNewPointerObj(constants[i].pvalue, *(constants[i]).ptype,0);
         break;
       case SWIG_PY_BINARY:
-        obj = SWIG_NewPackedObj(constants[i].pvalue, constants[i].lvalue, *(constants[i].ptype));
+        obj = SWIG_NewPackedObj(constants[i].pvalue, (size_t)constants[i].lvalue, *(constants[i].ptype));
         break;
       default:
         obj = 0;
@@ -13080,20 +13139,17 @@ extern "C" {
       }
       if (obj) {
         PyDict_SetItemString(d, constants[i].name, obj);
-        Py_DECREF(obj);
+        SWIG_Py_DECREF(obj);
       }
     }
   }
   
-  /* -----------------------------------------------------------------------------*/
-  /* Fix SwigMethods to carry the callback ptrs when needed */
-  /* -----------------------------------------------------------------------------*/
+  /* -----------------------------------------------------------------------------
+   * Patch %callback methods' docstrings to hold the callback ptrs
+   * -----------------------------------------------------------------------------*/
   
   SWIGINTERN void
-  SWIG_Python_FixMethods(PyMethodDef *methods,
-    swig_const_info *const_table,
-    swig_type_info **types,
-    swig_type_info **types_initial) {
+  SWIG_Python_FixMethods(PyMethodDef *methods, const swig_const_info *const_table, swig_type_info **types, swig_type_info **types_initial) {
     size_t i;
     for (i = 0; methods[i].ml_name; ++i) {
       const char *c = methods[i].ml_doc;
@@ -13101,7 +13157,7 @@ extern "C" {
       c = strstr(c, "swig_ptr: ");
       if (c) {
         int j;
-        swig_const_info *ci = 0;
+        const swig_const_info *ci = 0;
         const char *name = c + 10;
         for (j = 0; const_table[j].type; ++j) {
           if (strncmp(const_table[j].name, name, 
@@ -13113,16 +13169,16 @@ extern "C" {
         if (ci) {
           void *ptr = (ci->type == SWIG_PY_POINTER) ? ci->pvalue : 0;
           if (ptr) {
-            size_t shift = (ci->ptype) - types;
+            size_t shift = (size_t)((ci->ptype) - types);
             swig_type_info *ty = types_initial[shift];
-            size_t ldoc = (c - methods[i].ml_doc);
+            size_t ldoc = (size_t)(c - methods[i].ml_doc);
             size_t lptr = strlen(ty->name)+2*sizeof(void*)+2;
             char *ndoc = (char*)malloc(ldoc + lptr + 10);
             if (ndoc) {
               char *buff = ndoc;
-              strncpy(buff, methods[i].ml_doc, ldoc);
+              memcpy(buff, methods[i].ml_doc, ldoc);
               buff += ldoc;
-              strncpy(buff, "swig_ptr: ", 10);
+              memcpy(buff, "swig_ptr: ", 10);
               buff += 10;
               SWIG_PackVoidPtr(buff, ptr, ty->name, lptr);
               methods[i].ml_doc = ndoc;
@@ -13137,44 +13193,120 @@ extern "C" {
 }
 #endif
 
+
+
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+  
+  /* -----------------------------------------------------------------------------
+   * Method creation and docstring support functions
+   * ----------------------------------------------------------------------------- */
+  
+  /* -----------------------------------------------------------------------------
+   * Function to find the method definition with the correct docstring for the
+   * proxy module as opposed to the low-level API
+   * ----------------------------------------------------------------------------- */
+  
+  SWIGINTERN PyMethodDef *SWIG_PythonGetProxyDoc(const char *name) {
+    /* Find the function in the modified method table */
+    size_t offset = 0;
+    int found = 0;
+    while (SwigMethods_proxydocs[offset].ml_meth != NULL) {
+      if (strcmp(SwigMethods_proxydocs[offset].ml_name, name) == 0) {
+        found = 1;
+        break;
+      }
+      offset++;
+    }
+    /* Use the copy with the modified docstring if available */
+    return found ? &SwigMethods_proxydocs[offset] : NULL;
+  }
+  
+  /* -----------------------------------------------------------------------------
+   * Wrapper of PyInstanceMethod_New() used in Python 3
+   * It is exported to the generated module, used for -fastproxy
+   * ----------------------------------------------------------------------------- */
+  
+  SWIGINTERN PyObject *SWIG_PyInstanceMethod_New(PyObject *SWIGUNUSEDPARM(self), PyObject *func) {
+    if (PyCFunction_Check(func)) {
+      PyCFunctionObject *funcobj = (PyCFunctionObject *)func;
+      PyMethodDef *ml = SWIG_PythonGetProxyDoc(funcobj->m_ml->ml_name);
+      if (ml)
+      func = PyCFunction_NewEx(ml, funcobj->m_self, funcobj->m_module);
+    }
+    return PyInstanceMethod_New(func);
+  }
+  
+  /* -----------------------------------------------------------------------------
+   * Wrapper of PyStaticMethod_New()
+   * It is exported to the generated module, used for -fastproxy
+   * ----------------------------------------------------------------------------- */
+  
+  SWIGINTERN PyObject *SWIG_PyStaticMethod_New(PyObject *SWIGUNUSEDPARM(self), PyObject *func) {
+    if (PyCFunction_Check(func)) {
+      PyCFunctionObject *funcobj = (PyCFunctionObject *)func;
+      PyMethodDef *ml = SWIG_PythonGetProxyDoc(funcobj->m_ml->ml_name);
+      if (ml)
+      func = PyCFunction_NewEx(ml, funcobj->m_self, funcobj->m_module);
+    }
+    return PyStaticMethod_New(func);
+  }
+  
+#ifdef __cplusplus
+}
+#endif
+
+
+
+
 /* -----------------------------------------------------------------------------*
  *  Partial Init method
  * -----------------------------------------------------------------------------*/
 
+SWIGINTERN int SWIG_mod_exec(PyObject *module);
+
 #ifdef __cplusplus
 extern "C"
 #endif
 
 SWIGEXPORT 
-#if PY_VERSION_HEX >= 0x03000000
 PyObject*
-#else
-void
-#endif
 SWIG_init(void) {
-  PyObject *m, *d, *md;
-#if PY_VERSION_HEX >= 0x03000000
-  static struct PyModuleDef SWIG_module = {
-# if PY_VERSION_HEX >= 0x03020000
-    PyModuleDef_HEAD_INIT,
-# else
+  static PyModuleDef_Slot SwigSlots[] = {
     {
-      PyObject_HEAD_INIT(NULL)
-      NULL, /* m_init */
-      0,    /* m_index */
-      NULL, /* m_copy */
+      Py_mod_exec, (void *)SWIG_mod_exec 
     },
-# endif
-    (char *) SWIG_name,
+#ifdef SWIGPYTHON_NOGIL
+#ifdef Py_GIL_DISABLED
+    {
+      Py_mod_gil, Py_MOD_GIL_NOT_USED 
+    },
+#endif
+#endif
+    {
+      0, NULL 
+    }
+  };
+  
+  static struct PyModuleDef SWIG_module = {
+    PyModuleDef_HEAD_INIT,
+    SWIG_name,
     NULL,
-    -1,
+    0,
     SwigMethods,
-    NULL,
+    SwigSlots,
     NULL,
     NULL,
     NULL
   };
-#endif
+  
+  return PyModuleDef_Init(&SWIG_module);
+}
+
+SWIGINTERN int SWIG_mod_exec(PyObject *m) {
+  PyObject *d, *md, *globals;
   
 #if defined(SWIGPYTHON_BUILTIN)
   static SwigPyClientData SwigPyObject_clientdata = {
@@ -13184,8 +13316,8 @@ SWIG_init(void) {
     (char *)"this", &SwigPyBuiltin_ThisClosure, NULL, NULL, NULL
   };
   static SwigPyGetSet thisown_getset_closure = {
-    (PyCFunction) SwigPyObject_own,
-    (PyCFunction) SwigPyObject_own
+    SwigPyObject_own,
+    SwigPyObject_own
   };
   static PyGetSetDef thisown_getset_def = {
     (char *)"thisown", SwigPyBuiltin_GetterClosure, SwigPyBuiltin_SetterClosure, NULL, &thisown_getset_closure
@@ -13212,17 +13344,31 @@ SWIG_init(void) {
   (void)self;
   
   /* Metaclass is used to implement static member variables */
-  metatype = SwigPyObjectType();
+  metatype = SwigPyObjectType_Type();
   assert(metatype);
+  
+  SwigPyStaticVar_Type();
+#endif
+  
+  (void)globals;
+  
+  /* Create singletons now to avoid potential deadlocks with multi-threaded usage after module initialization */
+  SWIG_runtime_data_module();
+  SWIG_This();
+  SWIG_Python_TypeCache();
+  SwigPyPacked_Type();
+  SwigVarLink_Type();
+#ifndef SWIGPYTHON_BUILTIN
+  SwigPyObject_Type();
 #endif
   
   /* Fix SwigMethods to carry the callback ptrs when needed */
   SWIG_Python_FixMethods(SwigMethods, swig_const_table, swig_types, swig_type_initial);
   
-#if PY_VERSION_HEX >= 0x03000000
-  m = PyModule_Create(&SWIG_module);
-#else
-  m = Py_InitModule((char *) SWIG_name, SwigMethods);
+#ifdef SWIGPYTHON_NOGIL
+#ifdef Py_GIL_DISABLED
+  PyUnstable_Module_SetGIL(m, Py_MOD_GIL_NOT_USED);
+#endif
 #endif
   
   md = d = PyModule_GetDict(m);
@@ -13241,19 +13387,15 @@ SWIG_init(void) {
     SwigPyObject_clientdata.pytype = swigpyobject;
   } else if (swigpyobject->tp_basicsize != cd->pytype->tp_basicsize) {
     PyErr_SetString(PyExc_RuntimeError, "Import error: attempted to load two incompatible swig-generated modules.");
-# if PY_VERSION_HEX >= 0x03000000
-    return NULL;
-# else
-    return;
-# endif
+    return -1;
   }
   
   /* All objects have a 'this' attribute */
-  this_descr = PyDescr_NewGetSet(SwigPyObject_type(), &this_getset_def);
+  this_descr = PyDescr_NewGetSet(SwigPyObject_Type(), &this_getset_def);
   (void)this_descr;
   
   /* All objects have a 'thisown' attribute */
-  thisown_descr = PyDescr_NewGetSet(SwigPyObject_type(), &thisown_getset_def);
+  thisown_descr = PyDescr_NewGetSet(SwigPyObject_Type(), &thisown_getset_def);
   (void)thisown_descr;
   
   public_interface = PyList_New(0);
@@ -13261,7 +13403,7 @@ SWIG_init(void) {
   (void)public_symbol;
   
   PyDict_SetItemString(md, "__all__", public_interface);
-  Py_DECREF(public_interface);
+  SWIG_Py_DECREF(public_interface);
   for (i = 0; SwigMethods[i].ml_name != NULL; ++i)
   SwigPyBuiltin_AddPublicSymbol(public_interface, SwigMethods[i].ml_name);
   for (i = 0; swig_const_table[i].name != 0; ++i)
@@ -13270,12 +13412,18 @@ SWIG_init(void) {
   
   SWIG_InstallConstants(d,swig_const_table);
   
-  PyDict_SetItemString(md,(char *)"cvar", SWIG_globals());
-  SWIG_addvarlink(SWIG_globals(),(char *)"SOMcomponent_count",Swig_var_SOMcomponent_count_get, Swig_var_SOMcomponent_count_set);
-#if PY_VERSION_HEX >= 0x03000000
-  return m;
-#else
-  return;
-#endif
+  globals = SWIG_globals();
+  if (!globals) {
+    PyErr_SetString(PyExc_TypeError, "Failure to create SWIG globals.");
+    return -1;
+  }
+  PyDict_SetItemString(md, "cvar", globals);
+  
+  // thread safe initialization
+  swig::container_owner_attribute();
+  
+  SWIG_Python_SetConstant(d, "DECOMP_INLINE_POOLS",SWIG_From_int(static_cast< int >(8)));
+  SWIG_addvarlink(globals, "SOMcomponent_count", Swig_var_SOMcomponent_count_get, Swig_var_SOMcomponent_count_set);
+  return 0;
 }
 
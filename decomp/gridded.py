@@ -0,0 +1,171 @@
+# -*- coding: utf-8 -*-
+"""
+Runs over gridded forcing in xarray datasets, chunk parallel with dask
+
+The forcing (T, wetness, pH and litter inputs) are variables of a Dataset with
+a time dimension and any number of spatial dimensions. apply_decomp integrates
+each spatial chunk as one SOMBatch over the whole time series (space parallel,
+time sequential). For dask backed datasets the result is lazy and is computed
+by the dask scheduler, eg. on a distributed cluster:
+
+>>> import decomp.gridded
+>>> ds = xr.open_zarr('forcing.zarr').chunk(lat=100, lon=100)
+>>> result = ds.decomp.run(decomp.leave_litter() * 100, dt=1.0,
+...                        inputs={'litter': decomp.leave_litter()})
+>>> result.CO_2.mean('time').compute()
+
+The result has the stored pools and N after each time step, the outflow rates of
+the non stored components (eg. CO_2, DOC) and the N release ('N_release') in mass
+per day. A result can be used as initial state of a following run.
+
+requires: xarray, for chunked runs also dask
+"""
+from __future__ import division, print_function, absolute_import, unicode_literals
+
+import numpy as np
+import xarray as xr
+
+from .decomp import SOM
+from .batch import SOMBatch, Network
+
+
+def _integrate_block(C_pools, N, T, wetness, pH, *masses, **kwargs):
+    """
+    Integrates a spatial block over all time steps, called by xarray.apply_ufunc
+
+    The time is the last axis of the forcing, the component the last axis of the pools
+    """
+    network, templates = kwargs['network'], kwargs['templates']
+    dt, max_turnover = kwargs['dt'], kwargs['max_turnover']
+    steps = T.shape[-1]
+    forcing = [np.moveaxis(f, -1, 0) for f in (T, wetness, pH)]
+    masses = [np.moveaxis(m, -1, 0) for m in masses]
+    shape = np.broadcast(*([N, C_pools[..., 0]] + [f[0] for f in forcing + masses])).shape
+    ncomp = len(network)
+    batch = SOMBatch(np.broadcast_to(C_pools, shape + (ncomp,)).astype(np.float64),
+                     np.broadcast_to(N, shape).astype(np.float64), network)
+    pools = np.zeros((steps,) + shape + (ncomp,))
+    N_out = np.zeros((steps,) + shape)
+    flux_pools = np.zeros((steps,) + shape + (ncomp,))
+    flux_N = np.zeros((steps,) + shape)
+    for i in range(steps):
+        for template, mass in zip(templates, masses):
+            batch.add_scaled(template, mass[i])
+        if max_turnover is None:
+            flux = batch.integrate(dt, *(f[i] for f in forcing))
+        else:
+            flux = batch.integrate_multirate(dt, *(f[i] for f in forcing), max_turnover=max_turnover)
+        pools[i] = batch.C_pools
+        N_out[i] = batch.N
+        flux_pools[i] = flux.C_pools
+        flux_N[i] = flux.N
+    # apply_ufunc expects the core dimensions (time, component) at the end
+    return (np.moveaxis(pools, 0, -2), np.moveaxis(N_out, 0, -1),
+            np.moveaxis(flux_pools, 0, -2), np.moveaxis(flux_N, 0, -1))
+
+
+def initial_pools(initial_state, ds, dims, network, time_dim='time'):
+    """
+    Returns the initial state as DataArrays of the C pools (with a component dimension) and N
+
+    :param initial_state: A SOM (used for all cells), a SOMBatch with the shape of dims or
+        a Dataset with the pools and N, eg. the result of an earlier run (the last time step is used)
+    :param ds: The forcing dataset
+    :param dims: The spatial dimensions of the SOMBatch
+    :param network: The component network
+    :param time_dim: The time dimension of a result dataset
+    """
+    if isinstance(initial_state, SOM):
+        initial_state = SOMBatch.from_soms(initial_state, network)
+    if isinstance(initial_state, SOMBatch):
+        if initial_state.shape:
+            if initial_state.shape != tuple(ds.sizes[d] for d in dims):
+                raise ValueError('The initial state needs the shape of the dimensions {}'.format(dims))
+        else:
+            # A single state is used for all cells
+            dims = []
+        coords = dict((d, ds[d]) for d in dims if d in ds.coords)
+        C_pools = xr.DataArray(initial_state.C_pools, dims=tuple(dims) + ('component',), coords=coords)
+        N = xr.DataArray(initial_state.N, dims=tuple(dims), coords=coords)
+    elif isinstance(initial_state, xr.Dataset):
+        if time_dim in initial_state.dims:
+            initial_state = initial_state.isel({time_dim: -1}, drop=True)
+        template = initial_state['N']
+        # The non stored components of a result are fluxes, their pools are empty after a step
+        C_pools = xr.concat([initial_state[c.Name] if c.is_stored and c.Name in initial_state
+                             else xr.zeros_like(template)
+                             for c in network.components], dim='component')
+        C_pools = C_pools.transpose(..., 'component')
+        N = template
+    else:
+        raise TypeError('The initial state needs to be a SOM, a SOMBatch or a Dataset')
+    return C_pools.assign_coords(component=network.names), N
+
+
+def apply_decomp(ds, initial_state, dt=1.0, T='T', wetness='wetness', pH='pH', inputs=None,
+                 time_dim='time', max_turnover=None, network=None):
+    """
+    Integrates the SOM of each cell of a gridded dataset over the time series of the forcing
+
+    :param ds: xarray.Dataset with the forcing, optional with dask chunks in the spatial dimensions
+    :param initial_state: The initial SOM of the cells, see initial_pools
+    :param dt: Time step in days
+    :param T, wetness, pH: Name of the variable in ds or a constant value
+    :param inputs: dict of input variable name to input template (SOM), eg.
+        {'litter': decomp.leave_litter()}. The variable is the mass added before each time step
+    :param time_dim: The name of the time dimension
+    :param max_turnover: If given, integrate_multirate is used, otherwise integrate
+    :param network: The component network, default Network()
+    :return: xarray.Dataset of the pools, N and fluxes with the time dimension
+    """
+    network = network or Network()
+    inputs = inputs or {}
+
+    def variable(value):
+        return ds[value] if isinstance(value, str) else xr.DataArray(float(value))
+
+    forcing = [variable(x) for x in (T, wetness, pH)]
+    masses = [ds[name] for name in inputs]
+    templates = [SOMBatch.from_soms(template, network) for template in inputs.values()]
+    if not any(time_dim in f.dims for f in forcing + masses):
+        raise ValueError('The forcing or the inputs need the dimension {}'.format(time_dim))
+    # Every argument gets the time dimension, to have it as core dimension
+    time = ds[time_dim]
+    forcing = [f if time_dim in f.dims else f.expand_dims({time_dim: time}) for f in forcing]
+    dims = [d for d in xr.broadcast(*(forcing + masses))[0].dims if d != time_dim]
+    C_pools, N = initial_pools(initial_state, ds, dims, network, time_dim)
+    # Time sequential: only the spatial dimensions may be chunked
+    forcing = [f.chunk({time_dim: -1}) if f.chunks else f for f in forcing]
+    masses = [m.chunk({time_dim: -1}) if m.chunks else m for m in masses]
+    pools, N_out, flux_pools, flux_N = xr.apply_ufunc(
+        _integrate_block, C_pools, N, *(forcing + masses),
+        input_core_dims=[['component'], []] + [[time_dim]] * (len(forcing) + len(masses)),
+        output_core_dims=[[time_dim, 'component'], [time_dim], [time_dim, 'component'], [time_dim]],
+        kwargs=dict(network=network, templates=templates, dt=dt, max_turnover=max_turnover),
+        dask='parallelized', output_dtypes=[np.float64] * 4,
+        dask_gufunc_kwargs=dict(output_sizes={'component': len(network)}),
+    )
+    result = xr.Dataset()
+    for c in network.components:
+        if c.is_stored:
+            result[c.Name] = pools.isel(component=c.Id, drop=True)
+        else:
+            result[c.Name] = flux_pools.isel(component=c.Id, drop=True)
+    result['N'] = N_out
+    result['N_release'] = flux_N
+    result['C'] = sum(result[c.Name] for c in network.components if c.is_stored)
+    return result.transpose(time_dim, ...).assign_coords({time_dim: time})
+
+
+@xr.register_dataset_accessor('decomp')
+class DecompAccessor(object):
+    """The decomp accessor of xarray datasets, ds.decomp.run(...) calls apply_decomp"""
+
+    def __init__(self, ds):
+        self._ds = ds
+
+    def run(self, initial_state, dt=1.0, **kwargs):
+        """
+        Integrates the SOM of each cell over the forcing of the dataset, see apply_decomp
+        """
+        return apply_decomp(self._ds, initial_state, dt, **kwargs)
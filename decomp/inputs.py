@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+"""
+Litter input schedules
+
+An InputSchedule describes the input of organic matter as a sum of constant rates,
+periodic events (eg. leaf fall at a day of year) and sparse event tables. Each input
+is a mass times a template composition like leave_litter(), wood_litter() or root_litter().
+
+The schedule is compiled once for the time steps of a run into a SOMBatch with the
+time step as first axis, that is consumed by SOMBatch.run without any Python
+calls per time step:
+
+>>> schedule = InputSchedule()
+>>> schedule.add_periodic(decomp.leave_litter(), mass=1.0, day=270)
+>>> schedule.add_constant(decomp.root_litter(), rate=0.5 / 365)
+>>> dates = np.arange(np.datetime64('2000-01-01'), np.datetime64('2019-01-01'))
+>>> flux = som.run(1.0, T, wetness, pH, inputs=schedule.compile(dates))
+"""
+from __future__ import division, print_function, absolute_import, unicode_literals
+
+import numpy as np
+
+from .batch import SOMBatch, Network
+
+
+def as_days(times):
+    """
+    Converts times to days as float
+
+    :param times: Array of numpy.datetime64 values (days since 1970-01-01) or of float days
+    """
+    times = np.asarray(times)
+    if np.issubdtype(times.dtype, np.datetime64):
+        return (times - np.datetime64('1970-01-01')) / np.timedelta64(1, 'D')
+    return times.astype(float)
+
+
+class InputSchedule(object):
+    """A schedule of organic matter input, compiled to arrays for the integrators"""
+
+    def __init__(self, network=None):
+        """
+        :param network: The component network, default is Network()
+        """
+        self.network = network or Network()
+        self.constant = []
+        self.periodic = []
+        self.events = []
+
+    def _template(self, template):
+        """Converts a template SOM to a SOMBatch of shape ()"""
+        return SOMBatch.from_soms(template, self.network)
+
+    def add_constant(self, template, rate):
+        """
+        Adds a constant input rate
+
+        :param template: The composition of the input as SOM, eg. leave_litter()
+        :param rate: The input mass per day (scaling of the template)
+        """
+        self.constant.append((self._template(template), rate))
+        return self
+
+    def add_periodic(self, template, mass, day, period=365.0):
+        """
+        Adds an input event that repeats every year (or period)
+
+        :param template: The composition of the input as SOM, eg. leave_litter()
+        :param mass: The input mass per event (scaling of the template)
+        :param day: The day of the year (0 = Jan. 1st) for datetime64 time steps,
+            or the day in each period for float time steps
+        :param period: The length of the period in days for float time steps
+        """
+        self.periodic.append((self._template(template), mass, day, period))
+        return self
+
+    def add_events(self, template, times, masses):
+        """
+        Adds a table of single input events
+
+        :param template: The composition of the input as SOM, eg. wood_litter()
+        :param times: The times of the events, datetime64 or float days
+        :param masses: The input mass of each event (scaling of the template)
+        """
+        times = np.atleast_1d(times)
+        masses = np.broadcast_to(np.asarray(masses, dtype=float), times.shape)
+        self.events.append((self._template(template), times, masses))
+        return self
+
+    @staticmethod
+    def _periodic_times(times, dt, day, period):
+        """Returns all event times of a periodic input in the range of the time steps"""
+        if np.issubdtype(np.asarray(times).dtype, np.datetime64):
+            years = np.arange(np.min(times).astype('M8[Y]') - 1, np.max(times).astype('M8[Y]') + 2)
+            return as_days(years.astype('M8[D]')) + day
+        start, end = as_days(times).min(), as_days(times).max() + np.max(dt)
+        first = np.floor((start - day) / period)
+        last = np.ceil((end - day) / period)
+        return day + np.arange(first, last + 1) * period
+
+    def compile(self, times, dt=1.0):
+        """
+        Creates the input of each time step as SOMBatch
+
+        :param times: The start times of the time steps, as datetime64 or as float days.
+            The time steps must be sorted and must not overlap.
+        :param dt: The length of the time steps in days
+        :return: SOMBatch with the input mass of each time step, time step as first axis
+        """
+        starts = as_days(times)
+        steps = len(starts)
+        inputs = SOMBatch.zeros(steps, self.network)
+        for template, rate in self.constant:
+            inputs += template * (rate * np.broadcast_to(dt, (steps,)))
+        for template, mass, day, period in self.periodic:
+            inputs += template * self._per_step(starts, dt, self._periodic_times(times, dt, day, period), mass)
+        for template, event_times, masses in self.events:
+            inputs += template * self._per_step(starts, dt, event_times, masses)
+        return inputs
+
+    @staticmethod
+    def _per_step(starts, dt, event_times, masses):
+        """Sums the mass of events into the time steps they belong to"""
+        event_times = as_days(event_times)
+        masses = np.broadcast_to(masses, event_times.shape)
+        ends = starts + dt
+        index = np.searchsorted(starts, event_times, side='right') - 1
+        valid = (index >= 0) & (event_times < ends[np.clip(index, 0, len(starts) - 1)])
+        mass = np.zeros(len(starts))
+        np.add.at(mass, index[valid], masses[valid])
+        return mass
@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+"""
+Cumulative flux ledger and mass balance of a SOMBatch
+
+A FluxLedger attached to a SOMBatch accumulates the fluxes of every state
+inside the integrators, no per-step bookkeeping in Python is needed:
+
+>>> ledger = batch.attach_ledger()
+>>> batch.run(1.0, T, wetness, pH, inputs=inputs)
+>>> ledger.CO2            # respired C of each state since the last reset
+>>> ledger.check(batch)   # raises an error, if C or N are not conserved
+
+The ledger counts:
+
+- outflow: all mass of the non stored components (CO2, DOC) leaving the states.
+  This includes DOC put into a state before the step (eg. from the soil solution)
+- N_release and N_immobilisation: the N mineralisation (positive N flux of integrate)
+  and the N immobilisation (negative N flux)
+- C_input and N_input: mass added with SOMBatch.add_input and the inputs of
+  SOMBatch.run. In the profile mode, the DOC percolating from the layer above
+  is an input of the layer and the DOC percolating to the next layer an outflow.
+
+The values are mass (not rates) in float64, with the batch shape.
+"""
+from __future__ import division, print_function, absolute_import, unicode_literals
+
+import numpy as np
+
+
+class MassBalanceError(RuntimeError):
+    pass
+
+
+class FluxLedger(object):
+    """Cumulative fluxes of the states of a SOMBatch since the last reset"""
+
+    def __init__(self, batch):
+        """
+        Creates the ledger and takes the actual state of the batch as initial state
+
+        Use SOMBatch.attach_ledger to create a ledger that is filled by the integrators
+
+        :param batch: The SOMBatch to keep track of
+        """
+        self.network = batch.network
+        shape = batch.shape
+        self.outflow = np.zeros(shape + (len(self.network),))
+        self.N_release = np.zeros(shape)
+        self.N_immobilisation = np.zeros(shape)
+        self.C_input = np.zeros(shape)
+        self.N_input = np.zeros(shape)
+        self.C_initial = np.zeros(shape)
+        self.N_initial = np.zeros(shape)
+        self.dtype = batch.dtype
+        # Number of recorded integration steps, scales the default tolerance of check
+        self.steps = 0
+        self.reset(batch)
+
+    def reset(self, batch):
+        """
+        Sets all fluxes to zero and takes the actual state of the batch as initial state
+        """
+        for a in (self.outflow, self.N_release, self.N_immobilisation, self.C_input, self.N_input):
+            a[...] = 0.0
+        self.steps = 0
+        self.C_initial[...] = batch.C_pools.sum(axis=-1, dtype=np.float64)
+        self.N_initial[...] = batch.N
+
+    @property
+    def CO2(self):
+        """The respired C"""
+        return self.outflow[..., self.network.index('CO_2')]
+
+    @property
+    def DOC(self):
+        """The C released as DOC"""
+        return self.outflow[..., self.network.index('DOC')]
+
+    def record_step(self, outflow, N_release, dt):
+        """
+        Records the fluxes of an integration step, called by the integrators of SOMBatch
+
+        :param outflow: The mass of each component leaving the states
+        :param N_release: The N release rate (negative for immobilisation)
+        :param dt: The time step in days
+        """
+        self.outflow += outflow
+        self.steps += 1
+        self.N_release += np.maximum(N_release, 0.0) * dt
+        self.N_immobilisation += np.maximum(-N_release, 0.0) * dt
+
+    def record_input(self, C_pools, N):
+        """
+        Records added mass
+
+        :param C_pools: The added C pools, components as last axis
+        :param N: The added N
+        """
+        self.C_input += np.sum(C_pools, axis=-1, dtype=np.float64)
+        self.N_input += N
+
+    def read(self):
+        """
+        Returns a copy of the cumulative fluxes as dict of arrays
+        """
+        res = dict(C_input=self.C_input.copy(), N_input=self.N_input.copy(),
+                   N_release=self.N_release.copy(), N_immobilisation=self.N_immobilisation.copy())
+        for c in self.network.components:
+            if not c.is_stored:
+                res[c.Name] = self.outflow[..., c.Id].copy()
+        return res
+
+    def mass_balance(self, batch):
+        """
+        Returns the error of the C and N balance of each state since the last reset
+
+        error = actual mass - (initial mass + input - output)
+
+        :param batch: The SOMBatch of the ledger
+        :return: C_error, N_error as arrays
+        """
+        C = batch.C_pools.sum(axis=-1, dtype=np.float64)
+        C_error = C - (self.C_initial + self.C_input - self.outflow.sum(axis=-1))
+        N_error = batch.N - (self.N_initial + self.N_input - self.N_release + self.N_immobilisation)
+        return C_error, N_error
+
+    def tolerance(self):
+        """
+        The default relative tolerance of check: the machine epsilon of the batch dtype
+        times the number of recorded steps, the rounding errors add up with each step
+        """
+        return np.finfo(self.dtype).eps * max(self.steps, 1)
+
+    def check(self, batch, rtol=None, atol=1e-12):
+        """
+        Raises a MassBalanceError, if the C or N balance is not closed
+
+        :param batch: The SOMBatch of the ledger
+        :param rtol: Tolerated error relative to the total turnover (initial mass + inputs).
+            If None, the tolerance depends on the dtype of the batch and the number of steps
+        :param atol: Tolerated absolute error
+        """
+        if rtol is None:
+            rtol = self.tolerance()
+        C_error, N_error = self.mass_balance(batch)
+        C_scale = np.abs(self.C_initial) + np.abs(self.C_input)
+        N_scale = np.abs(self.N_initial) + np.abs(self.N_input)
+        for name, error, scale in (('C', C_error, C_scale), ('N', N_error, N_scale)):
+            failed = np.abs(error) > atol + rtol * scale
+            if np.any(failed):
+                raise MassBalanceError('{} balance not closed for {} states, max. error {:0.3g}'
+                                       .format(name, np.count_nonzero(failed), np.abs(error).max()))
@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+"""
+Mixing operators for soil profiles
+
+Mixing of organic matter between the layers of a profile (plowing,
+bioturbation, cryoturbation) is described by a mixing matrix M, where
+M[i, j] is the fraction of the content of layer j that ends up in layer i.
+The columns of M sum up to 1, hence the mixing conserves C and N.
+
+The matrices are applied with SOMBatch.mix to all pools and N of a single
+profile (batch shape (layers,)) or of many profiles (batch shape (cells, layers))
+in one call. For profiles with different layer geometry, stack the matrices
+of each cell to an array of the shape (cells, layers, layers).
+
+>>> profiles.mix(plow_matrix(thickness, upper_boundary, plowdepth=0.3))
+"""
+from __future__ import division, print_function, absolute_import, unicode_literals
+
+import numpy as np
+
+
+def plow_matrix(thickness, upper_boundary, plowdepth=0.3):
+    """
+    Creates the mixing matrix to homogenize all layers with an upper boundary above the plow depth
+
+    The content of the plowed layers is redistributed by layer thickness, like
+    CmfConnector.plow. Layers below the plow depth are not changed.
+
+    :param thickness: Array of the layer thickness in m, layers as last axis
+    :param upper_boundary: Array of the upper boundary of the layers in m
+    :param plowdepth: The depth of the plow in m
+    :return: The mixing matrix, shape (..., layers, layers)
+    """
+    thickness = np.asarray(thickness, dtype=float)
+    plowed = np.asarray(upper_boundary) < plowdepth - 0.01
+    plowed_thickness = np.where(plowed, thickness, 0.0)
+    sumdepth = plowed_thickness.sum(axis=-1, keepdims=True)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        share = np.where(plowed, plowed_thickness / sumdepth, 0.0)
+    # Plowed layers j give their content to the plowed layers i by thickness
+    matrix = share[..., :, np.newaxis] * plowed[..., np.newaxis, :]
+    # Other layers keep their content
+    n = thickness.shape[-1]
+    return matrix + np.eye(n) * ~plowed[..., np.newaxis, :]
+
+
+def diffusion_matrix(thickness, diffusivity, dt):
+    """
+    Creates the mixing matrix for diffusive mixing, eg. bioturbation or cryoturbation
+
+    The mixing follows the gradient of the concentration (content per m thickness)
+    between neighbouring layers. The matrix is calculated implicitly, it is stable
+    for any time step and keeps all pools positive.
+
+    :param thickness: Array of the layer thickness in m, layers as last axis
+    :param diffusivity: Mixing coefficient in m²/day, scalar or array of the interfaces
+        between the layers (shape (..., layers - 1)). Use zeros to confine the mixing,
+        eg. to the active layer for cryoturbation.
+    :param dt: The time step in days
+    :return: The mixing matrix, shape (..., layers, layers)
+    """
+    thickness = np.asarray(thickness, dtype=float)
+    n = thickness.shape[-1]
+    distance = 0.5 * (thickness[..., 1:] + thickness[..., :-1])
+    exchange = np.broadcast_to(diffusivity, distance.shape) / distance
+    # Flux over the interface k from layer k to k+1: exchange[k] * (x[k]/h[k] - x[k+1]/h[k+1])
+    shape = thickness.shape[:-1] + (n, n)
+    operator = np.zeros(shape)
+    k = np.arange(n - 1)
+    upper, lower = exchange / thickness[..., :-1], exchange / thickness[..., 1:]
+    operator[..., k, k] -= upper
+    operator[..., k + 1, k] += upper
+    operator[..., k + 1, k + 1] -= lower
+    operator[..., k, k + 1] += lower
+    return np.linalg.inv(np.eye(n) - dt * operator)
+
+
+def combine(*matrices):
+    """
+    Combines mixing matrices to one operator, the first matrix is applied first
+    """
+    result = matrices[0]
+    for matrix in matrices[1:]:
+        result = np.matmul(matrix, result)
+    return result
@@ -0,0 +1,396 @@
+# -*- coding: utf-8 -*-
+"""
+Step observers and phase timing of the SOMBatch integrators
+
+An Observer attached to a SOMBatch is updated by the integrators after each
+time step (integrate, integrate_multirate, integrate_profile and everything
+using them, like SOMBatch.run or the CouplingDriver). It tests conditions on
+all states at once and records the matching states as events into a ring
+buffer of fixed size, no Python code per state is needed (in integrate_profile,
+the observer sees the DOC before the percolation).
+
+Scope: decomp has no compiled time stepping, the time loop of SOMBatch.run and
+the other integrators is Python with numpy operations on the whole batch (the
+C++ core steps single SOM objects and provides the right hand side for external
+ODE solvers, see decomp.rhs). The observer is part of this loop. It needs no
+Python loop of the user and no Python code per state, but each step adds a
+few numpy operations per condition. For large batches this is small compared
+to the integration, for small batches with many steps the per-step overhead
+dominates.
+
+>>> observer = batch.attach_observer(observe.default_conditions(batch.network, DOC_spike=0.5),
+...                                  sampler=observe.Sampler(stride=24, index=np.s_[:, 0]))
+>>> batch.run(1 / 24, T, wetness, pH)
+>>> observer.events()               # structured array with time, step, condition, index and value
+>>> observer.sampler.states()       # times and the first layer of all cells every 24 steps
+
+A condition is a Threshold of a variable (the names of decomp.aggregate.select,
+eg. 'CN', 'C', 'DOC' or a function f(state, flux)) or a Predicate f(state, flux)
+returning a boolean array. With edge=True (default) a state is recorded, when
+the condition starts to hold, not for every step while it holds. With mask,
+only some states are watched, eg. the top layer of a batch of profiles.
+
+The events store the flat index of the state in the batch, use
+np.unravel_index(events['index'], batch.shape) for the position.
+
+PhaseTimer measures the time spent in the phases of the integrators:
+
+- rate: the decomposition rates from the forcing (Network.decomp)
+- dispatch: the distribution of the decomposed mass to the products (Network.dispatch)
+- N: the N mineralisation and immobilisation (SOMBatch._N_change)
+
+>>> with observe.PhaseTimer() as timer:
+...     batch.run(1 / 24, T, wetness, pH)
+>>> timer.seconds
+
+The phases are separate functions, a sampling profiler like py-spy attributes
+the time to them without a PhaseTimer (py-spy record -- python script.py).
+With perf=True the PhaseTimer activates the perf trampoline of Python >= 3.12,
+so that perf shows the Python functions.
+"""
+from __future__ import division, print_function, absolute_import, unicode_literals
+
+import collections
+import functools
+import sys
+import time
+
+import numpy as np
+
+from .aggregate import select
+
+
+class Condition(object):
+    """
+    Base class of the conditions
+
+    Subclasses implement test(state, flux) returning the boolean match and the value
+    """
+    def __init__(self, name, edge=True, mask=None):
+        """
+        :param name: The name of the condition in the events
+        :param edge: If True, a state is recorded when the condition starts to hold,
+            otherwise in each step the condition holds
+        :param mask: None or a boolean array (broadcastable to the batch shape) of the watched states
+        """
+        self.name = name
+        self.edge = edge
+        self.mask = mask
+        self.previous = None
+
+    def reset(self):
+        self.previous = None
+
+    def test(self, state, flux):
+        raise NotImplementedError
+
+    def match(self, state, flux):
+        """
+        Returns the states to record and the value of the tested variable
+
+        :return: boolean array and float array of the batch shape
+        """
+        hit, value = self.test(state, flux)
+        hit = np.broadcast_to(hit, state.shape)
+        if self.mask is not None:
+            hit = hit & self.mask
+        new = hit
+        if self.edge:
+            if self.previous is not None:
+                new = hit & ~self.previous
+            self.previous = hit.copy()
+        return new, np.broadcast_to(value, state.shape)
+
+
+class Threshold(Condition):
+    """Holds, where a variable is below or above a limit"""
+
+    def __init__(self, variable, below=None, above=None, name=None, edge=True, mask=None):
+        """
+        :param variable: The name of the variable or a function f(state, flux), see decomp.aggregate
+        :param below: The condition holds where the variable is below this value
+        :param above: The condition holds where the variable is above this value
+        :param name: The name of the condition, default from the variable and limits
+        :param edge: See Condition
+        :param mask: See Condition
+        """
+        if below is None and above is None:
+            raise ValueError('A Threshold needs a value for below or above')
+        if name is None:
+            variable_name = variable if not callable(variable) else variable.__name__
+            limits = ([] if below is None else ['<{:g}'.format(below)]) + \
+                     ([] if above is None else ['>{:g}'.format(above)])
+            name = variable_name + '|'.join(limits)
+        Condition.__init__(self, name, edge, mask)
+        self.select = select(variable)
+        self.below = below
+        self.above = above
+
+    def test(self, state, flux):
+        value = np.asarray(self.select(state, flux))
+        hit = np.zeros(value.shape, dtype=bool)
+        with np.errstate(invalid='ignore'):
+            if self.below is not None:
+                hit |= value < self.below
+            if self.above is not None:
+                hit |= value > self.above
+        return hit, value
+
+
+class Predicate(Condition):
+    """Holds, where a function f(state, flux) returns True"""
+
+    def __init__(self, function, value=None, name=None, edge=True, mask=None):
+        """
+        :param function: Function f(state, flux) returning a boolean array of the batch shape
+        :param value: Optional function f(state, flux) of the value stored with the events
+        :param name: The name of the condition, default the name of the function
+        :param edge: See Condition
+        :param mask: See Condition
+        """
+        Condition.__init__(self, name or function.__name__, edge, mask)
+        self.function = function
+        self.value = value
+
+    def test(self, state, flux):
+        value = np.nan if self.value is None else self.value(state, flux)
+        return np.asarray(self.function(state, flux), dtype=bool), value
+
+
+def _negative(state, flux):
+    return (state.C_pools < 0).any(axis=-1) | (state.N < 0)
+
+
+def _smallest(state, flux):
+    return np.minimum(state.C_pools.min(axis=-1), state.N)
+
+
+def default_conditions(network, DOC_spike=None, mask=None):
+    """
+    The conditions CN below CNmin, CN above CNmax, negative pools and optional DOC spikes
+
+    :param network: The Network of the batch, for CNmin and CNmax
+    :param DOC_spike: If given, the DOC flux (mass per day) above which a spike is recorded
+    :param mask: See Condition
+    """
+    conditions = [Threshold('CN', below=network.CNmin, name='CN<CNmin', mask=mask),
+                  Threshold('CN', above=network.CNmax, name='CN>CNmax', mask=mask),
+                  Predicate(_negative, value=_smallest, name='negative', mask=mask)]
+    if DOC_spike is not None:
+        conditions.append(Threshold('DOC', above=DOC_spike, name='DOC spike', mask=mask))
+    return conditions
+
+
+class EventBuffer(object):
+    """A ring buffer of events with a fixed capacity, the oldest events are overwritten"""
+    dtype = np.dtype([('time', np.float64), ('step', np.int64), ('condition', np.int32),
+                      ('index', np.int64), ('value', np.float64)])
+
+    def __init__(self, capacity=100000):
+        self.capacity = int(capacity)
+        self.data = np.zeros(self.capacity, dtype=self.dtype)
+        # Number of events ever recorded
+        self.count = 0
+
+    def __len__(self):
+        return min(self.count, self.capacity)
+
+    @property
+    def dropped(self):
+        """Number of overwritten events"""
+        return max(self.count - self.capacity, 0)
+
+    def clear(self):
+        self.count = 0
+
+    def append(self, time, step, condition, index, value):
+        """
+        Appends the events of one condition in one step
+
+        :param time: The time of the step
+        :param step: The number of the step
+        :param condition: The position of the condition
+        :param index: Array of the flat indices of the states
+        :param value: Array of the values
+        """
+        n = len(index)
+        if n == 0:
+            return
+        if n > self.capacity:
+            index, value = index[-self.capacity:], value[-self.capacity:]
+            self.count += n - self.capacity
+            n = self.capacity
+        position = (self.count + np.arange(n)) % self.capacity
+        events = self.data[position]
+        events['time'] = time
+        events['step'] = step
+        events['condition'] = condition
+        events['index'] = index
+        events['value'] = value
+        self.data[position] = events
+        self.count += n
+
+    def events(self):
+        """Returns a copy of the events in chronological order"""
+        if self.count <= self.capacity:
+            return self.data[:self.count].copy()
+        start = self.count % self.capacity
+        return np.concatenate([self.data[start:], self.data[:start]])
+
+
+class Sampler(object):
+    """Copies the state every stride steps"""
+
+    def __init__(self, stride, index=None, capacity=None):
+        """
+        :param stride: Number of steps between the samples
+        :param index: An index of the batch (eg. np.s_[:, 0]), only these states are sampled
+        :param capacity: Maximum number of kept samples, older samples are dropped. Default: no limit
+        """
+        if stride < 1:
+            raise ValueError('The stride needs to be at least 1')
+        self.stride = int(stride)
+        self.index = index
+        self.samples = collections.deque(maxlen=capacity)
+
+    def clear(self):
+        self.samples.clear()
+
+    def update(self, time, step, state):
+        if step % self.stride == 0:
+            sample = state if self.index is None else state[self.index]
+            self.samples.append((time, sample.copy()))
+
+    def states(self):
+        """
+        Returns the times and the sampled states as SOMBatch with the samples as first axis
+        """
+        from .batch import SOMBatch
+        if not self.samples:
+            return np.zeros(0), None
+        times = np.array([t for t, _ in self.samples])
+        first = self.samples[0][1]
+        return times, SOMBatch(np.stack([s.C_pools for _, s in self.samples]),
+                               np.stack([s.N for _, s in self.samples]), first.network, first.dtype)
+
+
+class Observer(object):
+    """Tests conditions after each step and records the matching states"""
+
+    def __init__(self, conditions=(), capacity=100000, sampler=None):
+        """
+        :param conditions: A sequence of Condition, eg. from default_conditions
+        :param capacity: The capacity of the event ring buffer
+        :param sampler: An optional Sampler for the full states
+        """
+        self.conditions = list(conditions)
+        self.buffer = EventBuffer(capacity)
+        self.sampler = sampler
+        self.time = 0.0
+        self.step = 0
+
+    @property
+    def names(self):
+        """The names of the conditions, the condition of the events is the position in this list"""
+        return [c.name for c in self.conditions]
+
+    def reset(self):
+        """Deletes all events and samples and sets the time to 0"""
+        self.time = 0.0
+        self.step = 0
+        self.buffer.clear()
+        for condition in self.conditions:
+            condition.reset()
+        if self.sampler is not None:
+            self.sampler.clear()
+
+    def update(self, state, flux, dt=1.0):
+        """
+        Tests the conditions after a time step, called by the integrators
+
+        :param state: The state after the step, a SOMBatch
+        :param flux: The fluxes of the step as returned by the integrators
+        :param dt: The length of the time step in days
+        """
+        self.time += dt
+        self.step += 1
+        for position, condition in enumerate(self.conditions):
+            hit, value = condition.match(state, flux)
+            index = np.flatnonzero(hit)
+            if index.size:
+                self.buffer.append(self.time, self.step, position, index, value.ravel()[index])
+        if self.sampler is not None:
+            self.sampler.update(self.time, self.step, state)
+
+    def events(self, condition=None):
+        """
+        Returns the recorded events as structured array (time, step, condition, index, value)
+
+        :param condition: If given, only the events of the condition with this name
+        """
+        events = self.buffer.events()
+        if condition is not None:
+            events = events[events['condition'] == self.names.index(condition)]
+        return events
+
+    def to_dataframe(self):
+        """Returns the events as pandas DataFrame with the name of the condition"""
+        import pandas as pd
+        df = pd.DataFrame(self.events())
+        df['condition'] = np.array(self.names, dtype=object)[df['condition'].values] if len(df) else []
+        return df
+
+    def __repr__(self):
+        return 'Observer({}, {} events)'.format(', '.join(self.names), len(self.buffer))
+
+
+class PhaseTimer(object):
+    """
+    Measures the time in the phases of the integrators, while used as context manager
+
+    The phase functions are wrapped on enter and restored on exit, without a
+    PhaseTimer the integrators have no overhead.
+    """
+
+    def __init__(self, perf=False):
+        """
+        :param perf: If True, the perf trampoline is activated (Python >= 3.12 on Linux)
+        """
+        self.perf = perf
+        self.seconds = dict(rate=0.0, dispatch=0.0, N=0.0)
+        self.calls = dict(rate=0, dispatch=0, N=0)
+        self._originals = []
+
+    def _phases(self):
+        from .batch import SOMBatch, Network
+        return [(Network, 'decomp', 'rate'), (Network, 'dispatch', 'dispatch'), (SOMBatch, '_N_change', 'N')]
+
+    def _wrap(self, function, phase):
+        @functools.wraps(function)
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                self.seconds[phase] += time.perf_counter() - start
+                self.calls[phase] += 1
+        return timed
+
+    def __enter__(self):
+        if self.perf and hasattr(sys, 'activate_stack_trampoline'):
+            sys.activate_stack_trampoline('perf')
+        for cls, attr, phase in self._phases():
+            function = cls.__dict__[attr]
+            self._originals.append((cls, attr, function))
+            setattr(cls, attr, self._wrap(function, phase))
+        return self
+
+    def __exit__(self, *exc):
+        for cls, attr, function in self._originals:
+            setattr(cls, attr, function)
+        self._originals = []
+        if self.perf and hasattr(sys, 'deactivate_stack_trampoline'):
+            sys.deactivate_stack_trampoline()
+
+    def __repr__(self):
+        return 'PhaseTimer({})'.format(', '.join('{}={:.3g}s'.format(k, v) for k, v in self.seconds.items()))
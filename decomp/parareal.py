@@ -0,0 +1,248 @@
+# -*- coding: utf-8 -*-
+"""
+Parallel in time integration of long runs with the parareal algorithm
+
+A long run of a single site or profile can not be split in space. Parareal
+(Lions, Maday and Turinici, 2001) splits the time axis into slices instead:
+
+- a cheap coarse propagator G runs sequentially over all slices. It takes
+  implicit (backward Euler) steps on a coarse time grid with the mean decomposition
+  rates of the fine steps. The rates and the matrices of the linear pool transfer
+  are prepared once, a coarse step is a matrix product per state, independent of
+  how fast the pools decompose. The N follows the net mineralisation of the step
+- the accurate fine propagator F (integrate or integrate_multirate with the
+  time step of the run) runs all slices at the same time, starting at the
+  actual estimate of the state at the start of each slice
+- the corrections U[n+1] = G(U[n]) + F(U_old[n]) - G(U_old[n]) are repeated until
+  the states at the slice boundaries change less than the tolerance
+
+The fine propagation of all slices is calculated as one SOMBatch with the slice
+as first axis, or split between worker processes. After k iterations the first k
+slices are equal to the fine solution, the iterations are bounded by the number of slices.
+
+>>> solver = Parareal(som, dt=1 / 24, T=T, wetness=wetness, pH=6.0, slices=64)
+>>> flux = solver.run()  # som has the final state, flux the outflow of each time step
+"""
+from __future__ import division, print_function, absolute_import, unicode_literals
+
+import multiprocessing
+
+import numpy as np
+
+from .batch import SOMBatch, time_series
+
+
+def _fine(task):
+    """
+    The fine propagator for a number of slices, also the function of the worker processes
+
+    :param task: tuple of the start states (SOMBatch with the slice as first axis), dt,
+        forcing (time step, slice, ...), inputs (SOMBatch or None, time step as first axis),
+        max_turnover and the length of the last slice (if it is part of the task, else None)
+    :return: The states at the end of the slices and the outflow of each step (time step, slice, ...)
+    """
+    state, dt, forcing, inputs, max_turnover, last_length = task
+    length = len(forcing[0])
+    flux = SOMBatch.zeros((length,) + state.shape, state.network)
+    final = None
+    for i in range(length):
+        if inputs is not None:
+            state += inputs[i]
+        if max_turnover is None:
+            flux[i] = state.integrate(dt, *(f[i] for f in forcing))
+        else:
+            flux[i] = state.integrate_multirate(dt, *(f[i] for f in forcing), max_turnover=max_turnover)
+        if i + 1 == last_length:
+            final = state[-1].copy()
+    if final is not None:
+        # The last slice is padded to the length of the other slices
+        state[-1] = final
+    return state, flux
+
+
+class Parareal(object):
+    """Parallel in time integration of a SOMBatch over a long series of time steps"""
+
+    def __init__(self, batch, dt, T, wetness, pH, inputs=None, slices=None, coarse_steps=None,
+                 max_turnover=None, processes=None):
+        """
+        :param batch: The initial state, a SOMBatch of any shape (eg. () for a single site or
+            (layers,) for a profile) or a SOM. The final state is written back by run
+        :param dt: Time step of the fine propagator in days
+        :param T, wetness, pH: The forcing, see SOMBatch.run
+        :param inputs: A SOMBatch with the input of each time step, see SOMBatch.run
+        :param slices: Number of time slices, default is the number of CPUs
+        :param coarse_steps: Number of fine time steps in a coarse time step, default is about
+            30 days. The last coarse step of a slice may be shorter
+        :param max_turnover: If given, the fine propagator is integrate_multirate, otherwise integrate
+        :param processes: If given, the fine propagation is split between worker processes.
+            Otherwise all slices are calculated in this process in one batch
+        """
+        if not isinstance(batch, SOMBatch):
+            batch = SOMBatch.from_soms(batch)
+        self.batch = batch
+        self.network = batch.network
+        self.dt = dt
+        self.max_turnover = max_turnover
+        self.processes = processes
+        self.steps, forcing = time_series(T, wetness, pH, inputs)
+        slices = min(slices or multiprocessing.cpu_count(), self.steps)
+        self.length = -(-self.steps // slices)
+        self.slices = -(-self.steps // self.length)
+        self.last_length = self.steps - (self.slices - 1) * self.length
+        self.coarse_steps = min(coarse_steps or max(int(round(30.0 / dt)), 1), self.length)
+        shape = batch.shape
+        self.forcing = [self._by_slice(self._broadcast(f, shape), edge=True) for f in forcing]
+        if inputs is None:
+            self.inputs = None
+        else:
+            ncomp = len(self.network)
+            self.inputs = SOMBatch(self._by_slice(self._broadcast(inputs.C_pools, shape + (ncomp,))),
+                                   self._by_slice(self._broadcast(inputs.N, shape)), self.network)
+        # The coarse propagators and inputs with the shape (coarse step, slice, ...)
+        begin = np.arange(0, self.length, self.coarse_steps)
+        length = np.diff(np.append(begin, self.length))
+        rate = np.add.reduceat(self.network.decomp(*self.forcing), begin, axis=0)
+        rate /= length.reshape((-1,) + (1,) * (rate.ndim - 1))
+        dt = self.dt * length.reshape((-1,) + (1,) * (rate.ndim - 2))
+        self.coarse_propagators = self.implicit_step(rate, dt[..., np.newaxis, np.newaxis])
+        if self.inputs is None:
+            self.coarse_inputs = None
+        else:
+            self.coarse_inputs = SOMBatch(np.add.reduceat(self.inputs.C_pools, begin, axis=0),
+                                          np.add.reduceat(self.inputs.N, begin, axis=0), self.network)
+        self.iterations = 0
+        self.changes = []
+
+    def _broadcast(self, x, shape):
+        """Broadcasts an array with the time step as first axis to (steps,) + shape"""
+        x = np.asarray(x)
+        x = x.reshape((self.steps,) + (1,) * (len(shape) - x.ndim + 1) + x.shape[1:])
+        return np.broadcast_to(x, (self.steps,) + shape)
+
+    def _by_slice(self, x, edge=False):
+        """
+        Rearranges an array with the time step as first axis to (time step in slice, slice, ...)
+
+        The last slice is padded with the last value (edge=True) or zeros
+        """
+        pad = self.slices * self.length - self.steps
+        if pad:
+            fill = np.repeat(x[-1:], pad, axis=0) if edge else np.zeros((pad,) + x.shape[1:])
+            x = np.concatenate([x, fill])
+        x = x.reshape((self.slices, self.length) + x.shape[1:])
+        return np.ascontiguousarray(np.swapaxes(x, 0, 1), dtype=np.float64)
+
+    def implicit_step(self, rate, dt):
+        """
+        The matrices M of backward Euler steps of the pools, C(t + dt) = C(t) M
+
+        The pools change with dC/dt = C B, B = diag(r) (products - I). The non stored
+        components do not decompose, they collect the outflow and are removed after the step.
+
+        :param rate: Decomposition rates with the components as last axis
+        :param dt: Length of the step in days, broadcasts against the matrices
+        :return: (I - dt B)^-1 with the shape of rate plus the components
+        """
+        net = self.network
+        rate = np.where(net.is_stored, rate, 0.0)
+        identity = np.eye(len(net))
+        B = rate[..., np.newaxis] * (net.products - identity)
+        return np.linalg.inv(identity - dt * B)
+
+    def coarse(self, state, n):
+        """
+        The coarse propagator, integrates the state over slice n in place
+        """
+        stored = self.network.is_stored
+        for j in range(len(self.coarse_propagators)):
+            if self.coarse_inputs is not None:
+                state += self.coarse_inputs[j, n]
+            C_before, CN = state.C, state.CN
+            state.C_pools[...] = np.einsum('...i,...ij->...j', state.C_pools, self.coarse_propagators[j, n])
+            state.N += state._N_change(C_before, CN, C_before - state.C)
+            state.C_pools[..., ~stored] = 0.0
+        return state
+
+    def fine(self, start, first):
+        """
+        The fine propagator of the slices first, first + 1, ...
+
+        :param start: The states at the start of the slices, slice as first axis
+        :param first: The index of the first slice
+        :return: The states at the end of the slices and the outflow, see _fine
+        """
+        def task(begin, end):
+            forcing = [f[:, begin:end] for f in self.forcing]
+            inputs = None if self.inputs is None else self.inputs[:, begin:end]
+            last_length = self.last_length if end == self.slices else None
+            return start[begin - first:end - first].copy(), self.dt, forcing, inputs, self.max_turnover, last_length
+
+        if not self.processes:
+            return _fine(task(first, self.slices))
+        bounds = np.linspace(first, self.slices, min(self.processes, self.slices - first) + 1).astype(int)
+        tasks = [task(b, e) for b, e in zip(bounds[:-1], bounds[1:]) if e > b]
+        pool = multiprocessing.Pool(len(tasks))
+        try:
+            results = pool.map(_fine, tasks)
+        finally:
+            pool.close()
+            pool.join()
+        end = SOMBatch.zeros(start.shape, self.network)
+        flux = SOMBatch.zeros((self.length,) + start.shape, self.network)
+        offset = 0
+        for state, f in results:
+            n = state.shape[0]
+            end[offset:offset + n] = state
+            flux[:, offset:offset + n] = f
+            offset += n
+        return end, flux
+
+    @staticmethod
+    def change(new, old):
+        """The maximum change of the C pools and N relative to the largest value"""
+        scale_C = max(np.abs(new.C_pools).max(), 1e-300)
+        scale_N = max(np.abs(new.N).max(), 1e-300)
+        return max(np.abs(new.C_pools - old.C_pools).max() / scale_C,
+                   np.abs(new.N - old.N).max() / scale_N)
+
+    def run(self, tolerance=1e-8, max_iterations=None):
+        """
+        Runs the parareal iterations until the states at the slice boundaries converge
+
+        :param tolerance: The tolerated relative change of the states between two iterations
+        :param max_iterations: The maximum number of iterations, default is the number of slices
+        :return: SOMBatch of the outflow rates of the last fine propagation (time as first axis).
+            The batch of the solver gets the final state
+        """
+        shape = self.batch.shape
+        max_iterations = max_iterations or self.slices
+        # U[n] is the state at the start of slice n, G[n] the coarse propagation of U[n]
+        U = SOMBatch.zeros((self.slices + 1,) + shape, self.network)
+        G = SOMBatch.zeros((self.slices,) + shape, self.network)
+        U[0] = self.batch
+        for n in range(self.slices):
+            G[n] = self.coarse(U[n].copy(), n)
+            U[n + 1] = G[n]
+        flux = SOMBatch.zeros((self.length, self.slices) + shape, self.network)
+        self.changes = []
+        for k in range(max_iterations):
+            end, flux[:, k:] = self.fine(U[k:self.slices], k)
+            change = 0.0
+            for n in range(k, self.slices):
+                g = self.coarse(U[n].copy(), n)
+                new = g + end[n - k] - G[n]
+                # Exhausted pools stay at zero, the correction must not make them negative
+                np.maximum(new.C_pools, np.minimum(end[n - k].C_pools, 0.0), out=new.C_pools)
+                G[n] = g
+                change = max(change, self.change(new, U[n + 1]))
+                U[n + 1] = new
+            self.iterations = k + 1
+            self.changes.append(change)
+            if change < tolerance:
+                break
+        self.batch[...] = U[self.slices]
+        # Back to the time axis of the run
+        C_pools = np.swapaxes(flux.C_pools, 0, 1).reshape((-1,) + shape + (len(self.network),))
+        N = np.swapaxes(flux.N, 0, 1).reshape((-1,) + shape)
+        return SOMBatch(C_pools[:self.steps], N[:self.steps], self.network)
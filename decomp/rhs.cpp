@@ -0,0 +1,60 @@
+#include "rhs.h"
+#define min(a,b) ((a)<(b) ? (a) : (b))
+
+int decomp_rhs(size_t n, const double* y, double* dydt, void* user_data)
+{
+    const decomp_rhs_context& ctx = *static_cast<const decomp_rhs_context*>(user_data);
+    const long nc = ctx.n_comp, stride = nc + 1;
+    if (n != static_cast<size_t>(ctx.n_som) * stride)
+        return -1;
+    for (long s = 0; s < ctx.n_som; ++s)
+    {
+        const double* C = y + s * stride;
+        const double* r = ctx.rate + s * nc;
+        double* dC = dydt + s * stride;
+        for (long i = 0; i < nc; ++i)
+            dC[i] = 0.0;
+        // Decomposition and dispatch to the products. The non stored components are
+        // the accumulated outflow, they leave the SOM before they decompose (like in SOM::integrate)
+        for (long i = 0; i < nc; ++i)
+        {
+            if (!ctx.is_stored[i])
+                continue;
+            double decomp_comp = C[i] > 0 ? C[i] * r[i] : 0.0;
+            if (decomp_comp == 0.0)
+                continue;
+            dC[i] -= decomp_comp;
+            const double* fraction = ctx.products + i * nc;
+            for (long j = 0; j < nc; ++j)
+                dC[j] += decomp_comp * fraction[j];
+        }
+        // N immobilisation, see SOM::dCdt
+        double C_pool = 0.0, net = 0.0;
+        for (long i = 0; i < nc; ++i)
+        {
+            if (ctx.is_stored[i])
+            {
+                C_pool += C[i];
+                net += dC[i];
+            }
+        }
+        double N = C[nc], dN = 0.0;
+        if (C_pool > 0 && N > 0)
+        {
+            double
+                net_min = -net,
+                CN = C_pool / N,
+                grossNmin = net_min / CN,
+                f_Nimmob = min(1, (CN - ctx.CNmin[s]) / (ctx.CNmax[s] - ctx.CNmin[s]));
+            dN = grossNmin * f_Nimmob - grossNmin;
+        }
+        dC[nc] = dN;
+    }
+    return 0;
+}
+
+void decomp_rhs_t(double t, const double* y, double* dydt, void* user_data)
+{
+    const decomp_rhs_context& ctx = *static_cast<const decomp_rhs_context*>(user_data);
+    decomp_rhs(static_cast<size_t>(ctx.n_som) * (ctx.n_comp + 1), y, dydt, user_data);
+}
@@ -0,0 +1,46 @@
+#ifndef RHS_h__
+#define RHS_h__
+
+#include <cstddef>
+
+// The RHS functions are looked up by name (ctypes), they need to be exported from the extension
+#ifdef _WIN32
+#define DECOMP_RHS_EXPORT __declspec(dllexport)
+#else
+#define DECOMP_RHS_EXPORT __attribute__((visibility("default")))
+#endif
+
+/// @brief The parameters of the flat state vector RHS (decomp_rhs), passed as user data
+///
+/// The state vector holds the C pools of all components and N of each SOM:
+/// y[s * (n_comp + 1) + i] is the pool of component i and y[s * (n_comp + 1) + n_comp] the N of SOM s.
+/// The decomposition rates depend only on the forcing and are calculated before the solver
+/// is called, eg. with SOMcomponent::decomp or decomp.batch.Network.decomp.
+struct decomp_rhs_context
+{
+    long n_som;                       ///< Number of SOM states
+    long n_comp;                      ///< Number of components
+    const double* rate;               ///< Decomposition rate in 1/day of each SOM and component (n_som x n_comp)
+    const double* products;           ///< Fraction of the decomposed component i that becomes j (n_comp x n_comp)
+    const unsigned char* is_stored;   ///< 1 for the stored components (n_comp)
+    const double* CNmin;              ///< Minimal natural C/N ratio of each SOM (n_som)
+    const double* CNmax;              ///< Maximum natural C/N ratio of each SOM (n_som)
+};
+
+extern "C" {
+    /// Calculates the change rate of a flat state vector of many SOM, like SOM::dCdt
+    ///
+    /// The non stored components (CO2, DOC) accumulate the outflow and do not decompose,
+    /// the N rate is the change of the N pool.
+    /// @param n Length of the state vector, n_som * (n_comp + 1)
+    /// @param y The state vector
+    /// @param dydt The change rate per day of the state vector (output)
+    /// @param user_data Pointer to a decomp_rhs_context
+    /// @returns 0 on success, -1 if n does not fit to the context
+    DECOMP_RHS_EXPORT int decomp_rhs(size_t n, const double* y, double* dydt, void* user_data);
+
+    /// decomp_rhs with the signature f(t, y, dydt, user_data) of ODE solvers, the length is taken from the context
+    DECOMP_RHS_EXPORT void decomp_rhs_t(double t, const double* y, double* dydt, void* user_data);
+}
+
+#endif // RHS_h__
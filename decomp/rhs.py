@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+"""
+The change rate of many SOM as flat state vector for external ODE solvers
+
+The state vector holds the C pools of all components and N of each SOM, the
+SOM of the batch shape are in C order:
+
+    y = [C_0 of SOM 0, ..., C_n-1 of SOM 0, N of SOM 0, C_0 of SOM 1, ...]
+
+FlatRHS evaluates the change rate with the native function decomp_rhs of the
+_decomp extension, without Python code per SOM. The decomposition rates depend
+only on the forcing and are calculated when the forcing is set:
+
+>>> rhs = FlatRHS(batch.shape, T, wetness, pH)
+>>> res = scipy.integrate.solve_ivp(rhs, (0, 365), rhs.pack(batch), method='LSODA')
+>>> state = rhs.unpack(res.y[:, -1])
+
+The non stored components (CO2, DOC) accumulate the outflow in the state vector.
+They leave the SOM before they decompose, as with SOMBatch.integrate in the limit
+of small time steps. Hence the rate differs from SOMBatch.dCdt for states with DOC.
+
+For solvers calling C functions, the function pointers and the user data are
+available as FlatRHS.address (int decomp_rhs(size_t n, double* y, double* dydt, void* user_data)),
+FlatRHS.address_t (void decomp_rhs_t(double t, double* y, double* dydt, void* user_data)),
+FlatRHS.user_data and as scipy.LowLevelCallable from FlatRHS.lowlevelcallable().
+"""
+from __future__ import division, print_function, absolute_import, unicode_literals
+
+import ctypes
+
+import numpy as np
+
+from . import _decomp
+from .batch import SOMBatch, Network
+
+
+class _Context(ctypes.Structure):
+    """The struct decomp_rhs_context of rhs.h"""
+    _fields_ = [('n_som', ctypes.c_long),
+                ('n_comp', ctypes.c_long),
+                ('rate', ctypes.POINTER(ctypes.c_double)),
+                ('products', ctypes.POINTER(ctypes.c_double)),
+                ('is_stored', ctypes.POINTER(ctypes.c_ubyte)),
+                ('CNmin', ctypes.POINTER(ctypes.c_double)),
+                ('CNmax', ctypes.POINTER(ctypes.c_double))]
+
+
+_double_p = ctypes.POINTER(ctypes.c_double)
+_library = ctypes.CDLL(_decomp.__file__)
+_rhs = _library.decomp_rhs
+_rhs.restype = ctypes.c_int
+_rhs.argtypes = [ctypes.c_size_t, _double_p, _double_p, ctypes.c_void_p]
+_rhs_t = _library.decomp_rhs_t
+_rhs_t.restype = None
+_rhs_t.argtypes = [ctypes.c_double, _double_p, _double_p, ctypes.c_void_p]
+
+
+class FlatRHS(object):
+    """The change rate of a flat state vector of many SOM with their own forcing"""
+
+    def __init__(self, shape, T, wetness, pH, network=None):
+        """
+        :param shape: The batch shape of the SOM, eg. (cells,) or (cells, layers)
+        :param T, wetness, pH: The forcing, scalars or arrays broadcastable to shape
+        :param network: The component network, default Network(). The parameter
+            arrays and CNmin / CNmax may have the batch shape for ensembles
+        """
+        self.network = network or Network()
+        self.shape = tuple(shape) if np.ndim(shape) else (shape,)
+        self.n_som = int(np.prod(self.shape))
+        ncomp = len(self.network)
+        self.size = self.n_som * (ncomp + 1)
+        self._products = np.ascontiguousarray(self.network.products, dtype=np.float64)
+        self._is_stored = np.ascontiguousarray(self.network.is_stored, dtype=np.uint8)
+        self._CNmin = np.ascontiguousarray(np.broadcast_to(self.network.CNmin, self.shape), dtype=np.float64)
+        self._CNmax = np.ascontiguousarray(np.broadcast_to(self.network.CNmax, self.shape), dtype=np.float64)
+        self._rate = np.zeros(self.shape + (ncomp,))
+        self._context = _Context(self.n_som, ncomp, self._pointer(self._rate), self._pointer(self._products),
+                                 self._is_stored.ctypes.data_as(ctypes.POINTER(ctypes.c_ubyte)),
+                                 self._pointer(self._CNmin), self._pointer(self._CNmax))
+        self.evaluations = 0
+        self.set_forcing(T, wetness, pH)
+
+    @staticmethod
+    def _pointer(a):
+        return a.ctypes.data_as(_double_p)
+
+    def set_forcing(self, T, wetness, pH):
+        """
+        Sets the forcing and calculates the decomposition rates, eg. before each solver step
+        """
+        self._rate[...] = self.network.decomp(T, wetness, pH)
+
+    @property
+    def user_data(self):
+        """The pointer to the decomp_rhs_context, valid as long as this object exists"""
+        return ctypes.cast(ctypes.pointer(self._context), ctypes.c_void_p)
+
+    @property
+    def address(self):
+        """The address of the C function decomp_rhs"""
+        return ctypes.cast(_rhs, ctypes.c_void_p).value
+
+    @property
+    def address_t(self):
+        """The address of the C function decomp_rhs_t"""
+        return ctypes.cast(_rhs_t, ctypes.c_void_p).value
+
+    def lowlevelcallable(self, with_time=False):
+        """
+        Returns decomp_rhs (or decomp_rhs_t) with the context as scipy.LowLevelCallable
+        """
+        from scipy import LowLevelCallable
+        return LowLevelCallable(_rhs_t if with_time else _rhs, self.user_data)
+
+    def pack(self, batch):
+        """Returns the state vector of a SOMBatch with the shape of the RHS"""
+        if batch.shape != self.shape:
+            raise ValueError('The batch has the shape {}, the RHS {}'.format(batch.shape, self.shape))
+        return np.concatenate([batch.C_pools, batch.N[..., np.newaxis]], axis=-1).astype(np.float64).ravel()
+
+    def unpack(self, y):
+        """Returns the state vector as SOMBatch"""
+        y = np.asarray(y, dtype=np.float64).reshape(self.shape + (len(self.network) + 1,))
+        return SOMBatch(y[..., :-1].copy(), y[..., -1].copy(), self.network)
+
+    def dydt(self, y, out=None):
+        """
+        Returns the change rate of the state vector y per day
+
+        :param y: The state vector
+        :param out: An optional array for the result
+        """
+        y = np.ascontiguousarray(y, dtype=np.float64)
+        if y.size != self.size:
+            raise ValueError('The state vector needs the length {}, got {}'.format(self.size, y.size))
+        if out is None:
+            out = np.empty(self.size)
+        _rhs(self.size, self._pointer(y), self._pointer(out), self.user_data)
+        self.evaluations += 1
+        return out
+
+    def __call__(self, t, y):
+        """The change rate with the signature f(t, y) of scipy.integrate.solve_ivp"""
+        return self.dydt(y)
+
+    def __repr__(self):
+        return 'FlatRHS(shape={}, size={})'.format(self.shape, self.size)
@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+"""
+Forward mode (tangent linear) parameter sensitivities
+
+The derivatives of the states and of the outflow rates with respect to model
+parameters are carried alongside the states through the explicit Euler
+integration of SOMBatch.integrate. All sensitivities come out of one run,
+instead of one extra run per parameter for finite differences.
+
+>>> tl = TangentLinear(batch, [('k_pot', decomp.EDC), ('E_a', decomp.LIGN), 'CNmin', 'CNmax'])
+>>> flux, dflux = tl.integrate(1.0, T, wetness, pH)
+>>> dflux.C_pools[0, ..., decomp.CO2.Id]  # d CO2 flux / d k_pot of EDC
+
+Sensitivities are SOMBatch objects with the parameters as first axis of the
+batch shape.
+"""
+from __future__ import division, print_function, absolute_import, unicode_literals
+
+import numpy as np
+
+from .batch import SOMBatch, Network, time_series
+
+
+class TangentLinear(object):
+    """Integrates a SOMBatch together with the derivatives of its states to parameters
+
+    Parameters are given as tuple (parameter name, component) for the component parameters
+    (k_pot, E_a, K_w, n_w, K_pH, m_pH) or as 'CNmin' and 'CNmax' for the N immobilisation.
+    """
+    network_parameters = ('CNmin', 'CNmax')
+
+    def __init__(self, batch, parameters):
+        """
+        :param batch: The SOMBatch to integrate. It is changed by the integration
+        :param parameters: Sequence of the parameters, eg. [('k_pot', decomp.EDC), 'CNmin']
+        """
+        self.batch = batch
+        self.parameters = []
+        for param in parameters:
+            if param in self.network_parameters:
+                self.parameters.append((param, None))
+            else:
+                name, component = param
+                if name not in Network.parameters:
+                    raise ValueError('{} is not a parameter of a SOM component'.format(name))
+                self.parameters.append((name, batch.network.index(component)))
+        P = len(self.parameters)
+        # The derivatives of the state, parameters as first axis
+        self.state = SOMBatch.zeros((P,) + batch.shape, batch.network)
+
+    @property
+    def labels(self):
+        """Names of the parameters, eg. k_pot[EDC]"""
+        names = self.batch.network.names
+        return [name if index is None else '{}[{}]'.format(name, names[index])
+                for name, index in self.parameters]
+
+    def reset(self):
+        """Sets the derivatives to zero, eg. after changing the state"""
+        self.state.C_pools[...] = 0.0
+        self.state.N[...] = 0.0
+
+    def _log_rate_derivative(self, name, index, T, wetness, pH):
+        """The derivative of the log of the decomposition rate to a component parameter"""
+        net = self.batch.network
+        p = dict((param, getattr(net, param)[..., index]) for param in Network.parameters)
+        T, wetness, pH = (np.asarray(x, dtype=float) for x in (T, wetness, pH))
+        if name == 'k_pot':
+            return 1 / p['k_pot']
+        elif name == 'E_a':
+            return 1 / (net.R * (net.T_R + 273.16)) - 1 / (net.R * (T + 273.16))
+        elif name in ('K_w', 'n_w'):
+            x = p['K_w'] * wetness ** p['n_w']
+            if name == 'K_w':
+                return 1 / (p['K_w'] * (1 + x))
+            with np.errstate(divide='ignore', invalid='ignore'):
+                return np.log(wetness) / (1 + x)
+        else:
+            H_m = (10.0 ** -pH) ** p['m_pH']
+            if name == 'K_pH':
+                return -H_m / (1 + p['K_pH'] * H_m)
+            return p['K_pH'] * H_m * np.log(10.0) * pH / (1 + p['K_pH'] * H_m)
+
+    def dCdt(self, T, wetness, pH):
+        """
+        The change rate of the batch and its derivatives
+
+        :return: rate, drate as SOMBatch. drate has the parameters as first axis
+        """
+        batch, state = self.batch, self.state
+        net = batch.network
+        stored = net.is_stored
+        r = np.broadcast_to(net.decomp(T, wetness, pH), batch.C_pools.shape)
+        positive = batch.C_pools > 0
+        # Derivative of the decomposed mass d_i = r_i * C_i
+        ddecomposed = np.where(positive, r * state.C_pools, 0.0)
+        for k, (name, index) in enumerate(self.parameters):
+            if index is not None:
+                dr = r[..., index] * self._log_rate_derivative(name, index, T, wetness, pH)
+                ddecomposed[k, ..., index] += np.where(positive[..., index], batch.C_pools[..., index] * dr, 0.0)
+        dC = net.dispatch(ddecomposed) - ddecomposed
+
+        rate = batch.dCdt(T, wetness, pH)
+        # Derivative of the N release, see SOMBatch._N_change. At CN >= CNmax the
+        # immobilisation factor is capped to 1 and its derivative is 0
+        N, dN = batch.N, state.N
+        C = batch.C
+        dCs = state.C_pools[..., stored].sum(axis=-1)
+        net_min = -rate.C_pools[..., stored].sum(axis=-1)
+        dnet_min = -dC[..., stored].sum(axis=-1)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            CN = C / N
+            dCN = (dCs - CN * dN) / N
+            gross = net_min / CN
+            dgross = (dnet_min * N + net_min * dN) / C - net_min * N * dCs / C ** 2
+            width = net.CNmax - net.CNmin
+            f_lin = (CN - net.CNmin) / width
+            dCNmin = np.array([float(name == 'CNmin') for name, _ in self.parameters])
+            dCNmax = np.array([float(name == 'CNmax') for name, _ in self.parameters])
+            dCNmin, dCNmax = (x.reshape((-1,) + (1,) * len(batch.shape)) for x in (dCNmin, dCNmax))
+            df = np.where(f_lin < 1, (dCN - dCNmin) / width - (CN - net.CNmin) * (dCNmax - dCNmin) / width ** 2, 0.0)
+            f = np.minimum(1, f_lin)
+            ddN = dgross * (f - 1) + gross * df
+        ddN = np.where((C > 0) & (N > 0), ddN, 0.0)
+        return rate, SOMBatch(dC, ddN, net)
+
+    def integrate(self, dt, T, wetness, pH):
+        """
+        Integrates the batch and the derivatives with an explicit Euler step, like SOMBatch.integrate
+
+        :param dt: Time step in days
+        :param T: Temperature in °C, scalar or array of the batch shape
+        :param wetness: Wetness in m3/m3, scalar or array of the batch shape
+        :param pH: pH-Value of the soil, scalar or array of the batch shape
+        :return: flux, dflux: The outflow rates as SOMBatch and its derivatives to the parameters
+        """
+        rate, drate = self.dCdt(T, wetness, pH)
+        batch, state = self.batch, self.state
+        stored = batch.network.is_stored
+        for target, change in ((batch, rate), (state, drate)):
+            target.C_pools += change.C_pools * dt
+            target.N += change.N * dt
+            target.C_pools[..., ~stored] = 0.0
+            change.C_pools[..., stored] = 0.0
+            change.N *= -1
+        return rate, drate
+
+    def run(self, dt, T, wetness, pH, inputs=None):
+        """
+        Integrates over a series of time steps, like SOMBatch.run
+
+        The inputs do not depend on the parameters and change only the states.
+
+        :return: flux, dflux: SOMBatch of the outflow rates and of their derivatives,
+            time as first axis (for dflux before the parameter axis)
+        """
+        steps, forcing = time_series(T, wetness, pH, inputs)
+        flux = SOMBatch.zeros((steps,) + self.batch.shape, self.batch.network)
+        dflux = SOMBatch.zeros((steps,) + self.state.shape, self.batch.network)
+        for i in range(steps):
+            if inputs is not None:
+                self.batch += inputs[i]
+            flux[i], dflux[i] = self.integrate(dt, *(f[i] for f in forcing))
+        return flux, dflux
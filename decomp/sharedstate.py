@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+"""
+Shared memory state store for multi-process simulations
+
+A SharedStateStore holds the pools and N of many SOM states, their forcing
+(T, wetness, pH) and the accumulated outflow in one block of shared memory
+(multiprocessing.shared_memory, Python >= 3.8). Worker processes attach to
+the store by its name and integrate disjoint slices in place, nothing is
+pickled or copied between the processes:
+
+>>> with SharedStateStore.create(100000) as store:
+...     store.batch().add_scaled(decomp.leave_litter(), 10.0)
+...     store.T[:] = 10.0; store.wetness[:] = 0.5; store.pH[:] = 6.0
+...     store.integrate_parallel(dt=1.0, steps=365, processes=8)
+...     C = store.batch().C
+
+The workers create the component network from SOM.get_pool_types(). If
+components are added with SOM.add_component, the workers need to add them
+in the same order before attaching.
+"""
+from __future__ import division, print_function, absolute_import, unicode_literals
+
+import multiprocessing
+
+from .batch import Network
+from .store import StateStore
+
+
+class SharedStateStore(StateStore):
+    """Pools, N, forcing and outflow of many SOM states in shared memory, see StateStore"""
+
+    def __init__(self, shm, network=None, owner=False):
+        """
+        Use SharedStateStore.create or SharedStateStore.attach
+        """
+        self.shm = shm
+        self.owner = owner
+        try:
+            StateStore.__init__(self, shm.buf, network)
+        except Exception:
+            # Do not leak the shared memory, eg. if the network does not fit the store
+            self.close()
+            raise
+
+    @classmethod
+    def create(cls, shape, network=None, name=None):
+        """
+        Creates a new store, initialized with zeros
+
+        :param shape: The batch shape, eg. (cells,) or (cells, layers)
+        :param network: The component network, default Network()
+        :param name: The name of the shared memory. If None, a unique name is created
+        """
+        from multiprocessing import shared_memory
+        network = network or Network()
+        shape = cls._check_shape(shape)
+        shm = shared_memory.SharedMemory(name=name, create=True, size=cls.nbytes(shape, len(network)))
+        cls.write_header(shm.buf, shape, len(network))
+        store = cls(shm, network, owner=True)
+        for a in store.arrays():
+            a[...] = 0.0
+        return store
+
+    @classmethod
+    def attach(cls, name, network=None):
+        """
+        Attaches to an existing store by name, eg. in a worker process
+
+        :param name: The name of the store (SharedStateStore.name)
+        :param network: The component network, default Network()
+        """
+        from multiprocessing import shared_memory
+        shm = shared_memory.SharedMemory(name=name)
+        return cls(shm, network)
+
+    @property
+    def name(self):
+        return self.shm.name
+
+    def integrate_parallel(self, dt, steps=1, processes=None, max_turnover=None):
+        """
+        Integrates the store with worker processes, each works on a slice of the first axis
+
+        :param dt: Time step in days
+        :param steps: Number of time steps with the actual forcing
+        :param processes: Number of worker processes, default is the number of CPUs
+        :param max_turnover: If given, integrate_multirate is used, otherwise integrate
+        """
+        processes = processes or multiprocessing.cpu_count()
+        tasks = [(self.name, s.start, s.stop, dt, steps, max_turnover) for s in self.slices(processes)]
+        pool = multiprocessing.Pool(len(tasks))
+        try:
+            pool.map(_integrate_slice, tasks)
+        finally:
+            pool.close()
+            pool.join()
+
+    def close(self):
+        """
+        Closes the access to the store, the owner also frees the shared memory
+
+        Views of the store (eg. from batch()) need to be deleted before.
+        """
+        self._release()
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
+            self.owner = False
+
+    def __repr__(self):
+        return 'SharedStateStore({}, shape={})'.format(self.name, self.shape)
+
+
+def _integrate_slice(task):
+    """Worker function of SharedStateStore.integrate_parallel"""
+    name, start, stop, dt, steps, max_turnover = task
+    store = SharedStateStore.attach(name)
+    try:
+        store.integrate(dt, steps, slice(start, stop), max_turnover)
+    finally:
+        store.close()
@@ -0,0 +1,235 @@
+# -*- coding: utf-8 -*-
+"""
+Spin-up of SOM states to equilibrium and a persistent cache of spin-up results
+
+A spin-up repeats a forcing cycle (eg. a climatological year with the litter
+inputs of that year) until the stored C of all states does not change any more.
+The SpinupCache keeps the equilibrated states on disk, keyed by a hash of
+everything that determines the result: the component network (all parameters
+and product fractions), the initial states, the forcing, the inputs and the
+spin-up settings. Repeated scenario launches load the states instead of
+integrating again:
+
+>>> cache = SpinupCache('~/.cache/decomp-spinup', max_bytes=2 ** 30)
+>>> inputs = schedule.compile(np.arange(365.))
+>>> state = cache.spinup(initial, 1.0, T_clim, wetness_clim, 6.0, inputs=inputs)
+
+The cache is bounded by max_bytes, the least recently used entries are deleted first.
+"""
+from __future__ import division, print_function, absolute_import, unicode_literals
+
+import hashlib
+import os
+import tempfile
+import warnings
+
+import numpy as np
+
+from . import __version__
+from .batch import SOMBatch, Network
+
+# The version of the cache entries, part of the key. Increase if the file content changes
+CACHE_FORMAT = 1
+
+
+class SpinupWarning(UserWarning):
+    pass
+
+
+def spinup(batch, dt, T, wetness, pH, inputs=None, tolerance=1e-4, max_cycles=1000, max_turnover=None):
+    """
+    Repeats a forcing cycle until the stored C of all states changes less than tolerance per cycle
+
+    The batch is changed in place. If the states do not converge in max_cycles, a
+    SpinupWarning is issued.
+
+    :param batch: The initial states as SOMBatch
+    :param dt: Time step in days
+    :param T, wetness, pH: The forcing of one cycle, see SOMBatch.run
+    :param inputs: The inputs of one cycle as SOMBatch (time as first axis), eg. from InputSchedule.compile
+    :param tolerance: The tolerated relative change of the stored C in a cycle
+    :param max_cycles: The maximum number of cycles
+    :param max_turnover: If given, integrate_multirate is used, see SOMBatch.run
+    :return: The number of cycles
+    """
+    cycles, converged = _spinup(batch, dt, T, wetness, pH, inputs, tolerance, max_cycles, max_turnover)
+    return cycles
+
+
+def _spinup(batch, dt, T, wetness, pH, inputs=None, tolerance=1e-4, max_cycles=1000, max_turnover=None):
+    """The spin-up of spinup, returns the number of cycles and if the states converged"""
+    for cycle in range(1, max_cycles + 1):
+        C_before = batch.C
+        # An empty aggregate list: the outflow of the steps is not needed
+        batch.run(dt, T, wetness, pH, inputs=inputs, max_turnover=max_turnover, aggregate=())
+        C_after = batch.C
+        with np.errstate(divide='ignore', invalid='ignore'):
+            change = np.abs(C_after - C_before) / np.abs(C_after)
+        if np.all((change < tolerance) | (C_after == C_before)):
+            return cycle, True
+    warnings.warn('The spin-up did not converge in {} cycles, the max. relative change of C is {:0.3g}'
+                  .format(max_cycles, np.nanmax(change)), SpinupWarning, stacklevel=3)
+    return max_cycles, False
+
+
+class SpinupCache(object):
+    """Spin-up results on disk, keyed by the hash of network, initial state, forcing and inputs"""
+
+    def __init__(self, directory, max_bytes=2 ** 30):
+        """
+        :param directory: The directory of the cache, created if missing
+        :param max_bytes: The maximum size of the cache files
+        """
+        self.directory = os.path.abspath(os.path.expanduser(directory))
+        if not os.path.isdir(self.directory):
+            os.makedirs(self.directory)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(batch, dt, T, wetness, pH, inputs=None, **settings):
+        """
+        Returns the hash of everything that determines the result of a spin-up
+
+        The version of decomp and the cache format are part of the hash, results of
+        other versions of the model are not used.
+
+        :param batch: The initial states, a SOMBatch with its network
+        :param dt, T, wetness, pH, inputs: The forcing and inputs of a cycle, see spinup
+        :param settings: The keyword arguments of spinup (tolerance, max_cycles, max_turnover)
+        :return: Hex digest of the hash
+        """
+        h = hashlib.sha256()
+        h.update('decomp {} format {}'.format(__version__, CACHE_FORMAT).encode())
+
+        def update(value):
+            value = np.ascontiguousarray(value, dtype=np.float64)
+            h.update(repr(value.shape).encode())
+            h.update(value.tobytes())
+
+        network = batch.network
+        h.update(repr(network.names).encode())
+        for param in Network.parameters:
+            update(getattr(network, param))
+        update(network.is_stored)
+        update(network.products)
+        update(network.CNmin)
+        update(network.CNmax)
+        update(batch.C_pools)
+        update(batch.N)
+        for x in (dt, T, wetness, pH):
+            update(x)
+        if inputs is None:
+            h.update(b'no inputs')
+        else:
+            update(inputs.C_pools)
+            update(inputs.N)
+        h.update(repr(sorted(settings.items())).encode())
+        return h.hexdigest()
+
+    def path(self, key):
+        return os.path.join(self.directory, key + '.npz')
+
+    def get(self, key, network=None):
+        """
+        Returns the cached states as SOMBatch or None
+
+        :param key: The key of the spin-up, see SpinupCache.key
+        :param network: The component network of the returned SOMBatch
+        """
+        path = self.path(key)
+        try:
+            with np.load(path) as data:
+                batch = SOMBatch(data['C_pools'], data['N'], network)
+        except (IOError, OSError, KeyError, ValueError):
+            return None
+        # The modification time marks the last use for the eviction
+        os.utime(path, None)
+        return batch
+
+    def put(self, key, batch):
+        """
+        Stores the states and deletes the least recently used entries, if the cache is too large
+
+        :param key: The key of the spin-up, see SpinupCache.key
+        :param batch: The equilibrated states
+        """
+        # Write to a temporary file first, concurrent readers never see half written entries
+        fd, tmp = tempfile.mkstemp(suffix='.tmp', dir=self.directory)
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                np.savez(f, C_pools=batch.C_pools, N=batch.N)
+            os.replace(tmp, self.path(key))
+        except BaseException:
+            os.remove(tmp)
+            raise
+        self.evict(keep=key)
+
+    def entries(self):
+        """Returns the cache files as list of (last use, size, path), the oldest first"""
+        entries = []
+        for name in os.listdir(self.directory):
+            if name.endswith('.npz'):
+                path = os.path.join(self.directory, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+        return sorted(entries)
+
+    @property
+    def nbytes(self):
+        """The size of the cache files"""
+        return sum(size for _, size, _ in self.entries())
+
+    def evict(self, keep=None):
+        """
+        Deletes the least recently used entries until the cache is not larger than max_bytes
+
+        :param keep: A key that is not deleted, eg. the entry just stored
+        """
+        entries = self.entries()
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            if keep is not None and path == self.path(keep):
+                continue
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            total -= size
+
+    def clear(self):
+        """Deletes all entries"""
+        for _, _, path in self.entries():
+            os.remove(path)
+
+    def spinup(self, batch, dt, T, wetness, pH, inputs=None, **settings):
+        """
+        Returns the equilibrated states from the cache or runs the spin-up and stores the result
+
+        States that did not converge are returned (with a SpinupWarning), but not stored.
+
+        :param batch: The initial states as SOMBatch, not changed
+        :param dt, T, wetness, pH, inputs: The forcing and inputs of a cycle, see spinup
+        :param settings: The keyword arguments of spinup (tolerance, max_cycles, max_turnover)
+        :return: The equilibrated states as SOMBatch
+        """
+        key = self.key(batch, dt, T, wetness, pH, inputs, **settings)
+        result = self.get(key, batch.network)
+        if result is not None and result.shape == batch.shape:
+            self.hits += 1
+            return result.astype(batch.dtype)
+        self.misses += 1
+        result = batch.copy()
+        cycles, converged = _spinup(result, dt, T, wetness, pH, inputs, **settings)
+        if converged:
+            self.put(key, result)
+        return result
+
+    def __repr__(self):
+        return 'SpinupCache({}, max_bytes={})'.format(self.directory, self.max_bytes)
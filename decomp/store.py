@@ -0,0 +1,230 @@
+# -*- coding: utf-8 -*-
+"""
+State stores: the pools, N, forcing and outflow of many SOM states in one buffer
+
+The StateStore defines the layout of the buffer, the subclasses define where
+the buffer lives:
+
+- decomp.sharedstate.SharedStateStore: shared memory for worker processes
+- MappedStateStore: a memory-mapped file, for grids larger than the memory
+
+The layout is a header (number of components, number of dimensions and the
+batch shape) followed by the arrays C_pools, N, T, wetness, pH, outflow
+C_pools and outflow N, all float64.
+"""
+from __future__ import division, print_function, absolute_import, unicode_literals
+
+import numpy as np
+
+from .batch import SOMBatch, Network
+
+
+class StateStore(object):
+    """Pools, N, forcing and outflow of many SOM states in a buffer"""
+    max_ndim = 6
+    header_size = 8 * (2 + max_ndim)
+
+    def __init__(self, buffer, network=None):
+        """
+        :param buffer: An object with the buffer protocol in the layout of a state store
+        :param network: The component network, default Network()
+        """
+        self.network = network or Network()
+        header = np.ndarray((2 + self.max_ndim,), dtype=np.int64, buffer=buffer)
+        ncomp, ndim = int(header[0]), int(header[1])
+        if ncomp != len(self.network):
+            raise ValueError('The store has {} components, the network {}'.format(ncomp, len(self.network)))
+        self.shape = tuple(int(n) for n in header[2:2 + ndim])
+        offset = self.header_size
+        arrays = []
+        for shape in self.layout(self.shape, ncomp):
+            arrays.append(np.ndarray(shape, dtype=np.float64, buffer=buffer, offset=offset))
+            offset += 8 * int(np.prod(shape))
+        self.C_pools, self.N, self.T, self.wetness, self.pH, self.outflow_C_pools, self.outflow_N = arrays
+
+    @staticmethod
+    def layout(shape, ncomp):
+        """The shapes of the arrays in the store"""
+        pools = shape + (ncomp,)
+        return [pools, shape, shape, shape, shape, pools, shape]
+
+    @classmethod
+    def nbytes(cls, shape, ncomp):
+        """The size of a store in bytes"""
+        return cls.header_size + 8 * sum(int(np.prod(s)) for s in cls.layout(shape, ncomp))
+
+    @classmethod
+    def _check_shape(cls, shape):
+        shape = tuple(shape) if np.ndim(shape) else (shape,)
+        if len(shape) > cls.max_ndim:
+            raise ValueError('A store has at most {} dimensions'.format(cls.max_ndim))
+        return shape
+
+    @classmethod
+    def write_header(cls, buffer, shape, ncomp):
+        """Writes the header of a new store to the buffer"""
+        header = np.ndarray((2 + cls.max_ndim,), dtype=np.int64, buffer=buffer)
+        header[:] = 0
+        header[0] = ncomp
+        header[1] = len(shape)
+        header[2:2 + len(shape)] = shape
+
+    def arrays(self):
+        return [self.C_pools, self.N, self.T, self.wetness, self.pH, self.outflow_C_pools, self.outflow_N]
+
+    def _release(self):
+        """Deletes the views of the buffer"""
+        self.C_pools = self.N = self.T = self.wetness = self.pH = None
+        self.outflow_C_pools = self.outflow_N = None
+
+    def batch(self, index=slice(None)):
+        """Returns a SOMBatch view of the states, changes apply to the store"""
+        return SOMBatch(self.C_pools[index], self.N[index], self.network)
+
+    def outflow(self, index=slice(None)):
+        """Returns a SOMBatch view of the accumulated outflow (mass) of the states"""
+        return SOMBatch(self.outflow_C_pools[index], self.outflow_N[index], self.network)
+
+    def forcing(self, index=slice(None)):
+        """Returns views of T, wetness and pH of the states"""
+        return self.T[index], self.wetness[index], self.pH[index]
+
+    def integrate(self, dt, steps=1, index=slice(None), max_turnover=None):
+        """
+        Integrates the states at index in place and accumulates their outflow
+
+        :param dt: Time step in days
+        :param steps: Number of time steps with the actual forcing
+        :param index: The part of the store to integrate, eg. a slice
+        :param max_turnover: If given, integrate_multirate is used, otherwise integrate
+        """
+        batch, outflow = self.batch(index), self.outflow(index)
+        forcing = self.forcing(index)
+        for _ in range(steps):
+            if max_turnover is None:
+                flux = batch.integrate(dt, *forcing)
+            else:
+                flux = batch.integrate_multirate(dt, *forcing, max_turnover=max_turnover)
+            outflow.add_scaled(flux, dt)
+
+    def slices(self, parts=None, size=None):
+        """
+        Splits the first axis of the store into disjoint slices
+
+        :param parts: Number of slices
+        :param size: Length of the slices, if parts is not given
+        """
+        if parts is not None:
+            bounds = np.linspace(0, self.shape[0], parts + 1).astype(int)
+        else:
+            bounds = np.r_[np.arange(0, self.shape[0], size), self.shape[0]]
+        return [slice(start, stop) for start, stop in zip(bounds[:-1], bounds[1:]) if stop > start]
+
+    def integrate_tiled(self, dt, steps=None, T=None, wetness=None, pH=None, tile_size=4096, max_turnover=None):
+        """
+        Integrates the store tile by tile over a series of time steps
+
+        Each tile (slice of the first axis) is copied to a compact array, integrated
+        over all time steps while it is in the cache and written back. Tiles
+        without organic matter are neither integrated nor written.
+
+        :param dt: Time step in days
+        :param steps: Number of time steps. Needed if no forcing series is given
+        :param T, wetness, pH: Forcing series with the shape (steps,) + store shape, eg. arrays
+            from numpy.load(..., mmap_mode='r'). If None, the forcing of the store is used.
+        :param tile_size: Number of entries of the first axis in a tile
+        :param max_turnover: If given, integrate_multirate is used, otherwise integrate
+        :return: Number of the tiles written back
+        """
+        series = [x for x in (T, wetness, pH) if x is not None]
+        if steps is None:
+            if not series:
+                raise ValueError('Either steps or a forcing series is needed')
+            steps = len(series[0])
+        written = 0
+        for tile in self.slices(size=tile_size):
+            if not (self.C_pools[tile].any() or self.N[tile].any()):
+                continue
+            state = self.batch(tile).copy()
+            outflow = self.outflow(tile).copy()
+            stored_forcing = self.forcing(tile)
+            series_tile = [None if f is None else f[:, tile] for f in (T, wetness, pH)]
+            for i in range(steps):
+                forcing_i = [stored if f is None else f[i] for stored, f in zip(stored_forcing, series_tile)]
+                if max_turnover is None:
+                    flux = state.integrate(dt, *forcing_i)
+                else:
+                    flux = state.integrate_multirate(dt, *forcing_i, max_turnover=max_turnover)
+                outflow.add_scaled(flux, dt)
+            self.batch(tile)[...] = state
+            self.outflow(tile)[...] = outflow
+            written += 1
+        self.flush()
+        return written
+
+    def flush(self):
+        """Writes changes to the underlying storage, if needed"""
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        self._release()
+
+
+class MappedStateStore(StateStore):
+    """A state store in a memory-mapped file
+
+    Only the pages of the file in use are held in memory, the operating system
+    writes the changed pages back to the file.
+
+    >>> with MappedStateStore.create('europe.som', (n_cells, 30)) as store:
+    ...     store.T[:] = T_avg
+    ...     store.integrate_tiled(1.0, T=np.load('T.npy', mmap_mode='r'))
+    """
+
+    def __init__(self, path, network=None, mode='r+'):
+        """
+        Opens an existing store file
+
+        :param path: The file name
+        :param network: The component network, default Network()
+        :param mode: 'r+' to read and write, 'r' read only, 'c' copy on write
+        """
+        self.path = path
+        self.mmap = np.memmap(path, dtype=np.uint8, mode=mode)
+        StateStore.__init__(self, self.mmap, network)
+
+    @classmethod
+    def create(cls, path, shape, network=None):
+        """
+        Creates a new store file, initialized with zeros
+
+        :param path: The file name
+        :param shape: The batch shape, eg. (cells, layers)
+        :param network: The component network, default Network()
+        """
+        network = network or Network()
+        shape = cls._check_shape(shape)
+        mmap = np.memmap(path, dtype=np.uint8, mode='w+', shape=(cls.nbytes(shape, len(network)),))
+        cls.write_header(mmap, shape, len(network))
+        mmap.flush()
+        del mmap
+        return cls(path, network)
+
+    def flush(self):
+        """Writes the changed pages to the file"""
+        if self.mmap is not None and self.mmap.mode != 'r':
+            self.mmap.flush()
+
+    def close(self):
+        self.flush()
+        self._release()
+        self.mmap = None
+
+    def __repr__(self):
+        return 'MappedStateStore({}, shape={})'.format(self.path, self.shape)
@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+"""
+Soil temperature profiles
+
+Calculates the temperature of the layers of one or many soil profiles from the
+air temperature. The profiles are arrays with the layers as last axis, like the
+batch shape of a SOMBatch of profiles, and can be handed to the integrators of
+SOMBatch directly:
+
+>>> soil_temperature = HeatConduction(thickness, diffusivity=0.05)
+>>> for T_air in air_temperature:
+...     soil_temperature(T_air, T_profile, dt=1.0)
+...     profiles.integrate(1.0, T_profile, wetness, pH)
+
+Two schemes are available, both update the profile in place:
+
+- DampedTemperature: The layer temperature relaxes to the air temperature, the
+  deeper the slower. This is the scheme of CmfConnector.
+- HeatConduction: An implicit solver of the heat conduction between the layers.
+"""
+from __future__ import division, print_function, absolute_import, unicode_literals
+
+import numpy as np
+
+
+def damped(T_air, T_profile, upper_boundary, T_depth=2.0):
+    """
+    Relaxes the temperature of each layer towards the air temperature
+
+    The damping factor of a layer is 365**(-upper_boundary / T_depth)
+
+    :param T_air: Air temperature in °C, scalar or array of the profiles
+    :param T_profile: Actual layer temperatures in °C, layers as last axis
+    :param upper_boundary: Upper boundary of the layers in m
+    :param T_depth: Damping depth in m
+    :return: The new layer temperatures
+    """
+    fT = 365.0 ** (-np.asarray(upper_boundary, dtype=float) / T_depth)
+    return fT * np.asarray(T_air, dtype=float)[..., np.newaxis] + (1 - fT) * T_profile
+
+
+class DampedTemperature(object):
+    """Soil temperature as damped air temperature, see damped"""
+
+    def __init__(self, upper_boundary, T_depth=2.0):
+        """
+        :param upper_boundary: Upper boundary of the layers in m, layers as last axis
+        :param T_depth: Damping depth in m
+        """
+        self.upper_boundary = np.asarray(upper_boundary, dtype=float)
+        self.T_depth = T_depth
+
+    def __call__(self, T_air, T_profile, dt=None):
+        """
+        Updates the layer temperatures in place
+
+        :param T_air: Air temperature in °C, scalar or array of the profiles
+        :param T_profile: Layer temperatures in °C, layers as last axis
+        :param dt: Not used, the damping is applied once per call
+        :return: T_profile
+        """
+        T_profile[...] = damped(T_air, T_profile, self.upper_boundary, self.T_depth)
+        return T_profile
+
+
+def solve_tridiagonal(lower, diag, upper, rhs):
+    """
+    Solves many tridiagonal systems at once with the Thomas algorithm
+
+    All arrays have the unknowns as last axis. lower[..., 0] and upper[..., -1] are not used.
+    The elimination loops over the unknowns (layers) in Python, each step works on
+    all systems at once.
+
+    :return: The solution with the shape of rhs
+    """
+    n = rhs.shape[-1]
+    shape = np.broadcast(lower, diag, upper, rhs).shape
+    c = np.zeros(shape)
+    d = np.zeros(shape)
+    lower, diag, upper, rhs = (np.broadcast_to(a, shape) for a in (lower, diag, upper, rhs))
+    c[..., 0] = upper[..., 0] / diag[..., 0]
+    d[..., 0] = rhs[..., 0] / diag[..., 0]
+    for i in range(1, n):
+        denom = diag[..., i] - lower[..., i] * c[..., i - 1]
+        c[..., i] = upper[..., i] / denom
+        d[..., i] = (rhs[..., i] - lower[..., i] * d[..., i - 1]) / denom
+    x = d
+    for i in range(n - 2, -1, -1):
+        x[..., i] -= c[..., i] * x[..., i + 1]
+    return x
+
+
+class HeatConduction(object):
+    """Implicit (backward Euler) heat conduction between the layers of soil profiles
+
+    The temperature of a layer is located at its centre. The upper boundary condition
+    is the air temperature at the soil surface, the lower boundary is either
+    insulated or a fixed temperature (eg. the yearly average) below the last layer.
+    The scheme is stable for any time step.
+    """
+
+    def __init__(self, thickness, diffusivity=0.05, T_bottom=None):
+        """
+        :param thickness: Thickness of the layers in m, layers as last axis
+        :param diffusivity: Thermal diffusivity of the soil in m²/day, scalar or per layer
+        :param T_bottom: Temperature in °C below the last layer. If None, the lower boundary is insulated
+        """
+        self.thickness = np.asarray(thickness, dtype=float)
+        self.diffusivity = diffusivity
+        self.T_bottom = T_bottom
+
+    def conductances(self):
+        """
+        The conductance (diffusivity / distance in m/day) above each layer and below the last layer
+        """
+        h = self.thickness
+        K = np.broadcast_to(np.asarray(self.diffusivity, dtype=float), h.shape)
+        distance = np.concatenate([0.5 * h[..., :1], 0.5 * (h[..., 1:] + h[..., :-1]), 0.5 * h[..., -1:]], axis=-1)
+        K_interface = np.concatenate([K[..., :1], 0.5 * (K[..., 1:] + K[..., :-1]), K[..., -1:]], axis=-1)
+        return K_interface / distance
+
+    def __call__(self, T_air, T_profile, dt):
+        """
+        Updates the layer temperatures in place for a time step
+
+        :param T_air: Air temperature in °C, scalar or array of the profiles
+        :param T_profile: Layer temperatures in °C, layers as last axis
+        :param dt: Time step in days
+        :return: T_profile
+        """
+        h = self.thickness
+        g = self.conductances() * dt
+        above, below = g[..., :-1], g[..., 1:].copy()
+        rhs = h * T_profile
+        rhs[..., 0] += above[..., 0] * np.asarray(T_air, dtype=float)
+        if self.T_bottom is None:
+            below[..., -1] = 0.0
+        else:
+            rhs[..., -1] += below[..., -1] * np.asarray(self.T_bottom, dtype=float)
+        diag = h + above + below
+        T_profile[...] = solve_tridiagonal(-above, diag, -below, rhs)
+        return T_profile
@@ -0,0 +1,397 @@
+# -*- coding: utf-8 -*-
+"""
+Differential validation of the integration paths against the reference SOM code
+
+The harness creates random states (including empty pools, N free states and
+DOC in the pools), a random forcing for each state and time step and runs
+them through the scalar reference (SOM.dCdt, SOM.integrate and
+SOM.integrate_multirate of the C++ core, one state at a time) and through every
+accelerated path. For each path the harness reports the maximum absolute and
+relative deviation from its reference, the C and N mass balance errors and the
+speedup:
+
+>>> harness = Harness(states=500, steps=20)
+>>> print(harness.table())
+>>> harness.check()  # raises a ValidationError, eg. in a regression test
+
+or from the command line:
+
+    python -m decomp.validation --states 1000 --random-network
+
+With random_network=True, the parameters and product fractions of the network
+are randomised. The C++ core can not use these parameters, hence the reference
+is a plain Python transcription of SOM::dCdt and SOM::integrate (reference_dCdt),
+which is validated against the C++ core with the default network. With
+add_component=True, a stored component is added with SOM.add_component while
+the harness creates the network and runs the paths, and removed afterwards (see
+component_added). The component has no products, its decomposed C leaves
+the system, which shows up in the C balance of all paths including the reference.
+"""
+from __future__ import division, print_function, absolute_import, unicode_literals
+
+import collections
+import contextlib
+import math
+import time
+
+import numpy as np
+
+from .decomp import SOM
+from .batch import SOMBatch, Network
+
+
+class ValidationError(AssertionError):
+    pass
+
+
+Result = collections.namedtuple('Result', 'path reference kind abs_error rel_error C_balance N_balance '
+                                          'seconds speedup rtol passed')
+
+
+def reference_dCdt(network, C, N, T, wetness, pH):
+    """
+    The change rate of a single state, a plain transcription of SOM::dCdt
+
+    :param network: The component network with one parameter set (parameters with one axis)
+    :param C: Sequence of the C pools
+    :param N: The N content
+    :param T, wetness, pH: The forcing as floats
+    :return: list of the change rates of the pools and the change rate of N
+    """
+    n = len(network)
+    rate = [0.0] * n
+    for i in range(n):
+        E_a = network.E_a[i]
+        f_T = math.exp(E_a / (network.R * (network.T_R + 273.16)) - E_a / (network.R * (T + 273.16)))
+        x_wet = network.K_w[i] * wetness ** network.n_w[i]
+        f_wet = x_wet / (1.0 + x_wet)
+        f_pH = 1.0 / (1.0 + network.K_pH[i] * (10.0 ** -pH) ** network.m_pH[i])
+        decomposed = C[i] * network.k_pot[i] / 365.25 * f_T * f_wet * f_pH if C[i] > 0 else 0.0
+        rate[i] -= decomposed
+        for j in range(n):
+            rate[j] += decomposed * network.products[i, j]
+    C_pool = sum(C[i] for i in range(n) if network.is_stored[i])
+    dN = 0.0
+    if C_pool > 0 and N > 0:
+        net_min = -sum(rate[i] for i in range(n) if network.is_stored[i])
+        CN = C_pool / N
+        gross = net_min / CN
+        dN = gross * min(1.0, (CN - network.CNmin) / (network.CNmax - network.CNmin)) - gross
+    return rate, dN
+
+
+def random_network(rng, network=None):
+    """
+    Returns a copy of the network with randomised parameters and product fractions
+
+    The potential rates vary by a factor of 3, the other parameters by 20%. The products
+    of each component keep their structure, but get random fractions with the sum of the
+    original fractions.
+    """
+    net = (network or Network()).copy()
+    size = len(net)
+    net.k_pot = net.k_pot * np.exp(rng.uniform(-np.log(3), np.log(3), size))
+    for param in ('E_a', 'K_w', 'n_w', 'K_pH', 'm_pH'):
+        setattr(net, param, getattr(net, param) * rng.uniform(0.8, 1.2, size))
+    weights = np.where(net.products > 0, rng.uniform(0.2, 1.0, net.products.shape), 0.0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        net.products = np.nan_to_num(weights / weights.sum(axis=1, keepdims=True)) * net.products.sum(axis=1,
+                                                                                                    keepdims=True)
+    net.CNmin = rng.uniform(10, 20)
+    net.CNmax = rng.uniform(30, 50)
+    return net
+
+
+@contextlib.contextmanager
+def component_added(name='TEST'):
+    """
+    Adds a stored test component with SOM.add_component and removes it on exit
+
+    If the component exists already, it is left untouched. SOM objects created in the
+    context do not fit the network afterwards.
+    """
+    added = name not in [c.Name for c in SOM.get_pool_types()]
+    if added:
+        SOM.add_component(name, True, 5.0, 30.0, 9.4, 3.4, 20500.0, 1.0)
+    try:
+        yield
+    finally:
+        if added:
+            SOM.remove_component(name)
+
+
+class Case(object):
+    """Random initial states and forcing of a validation run"""
+
+    def __init__(self, network, states, steps, dt, rng):
+        self.network = network
+        self.dt = dt
+        self.steps = steps
+        ncomp = len(network)
+        C_pools = rng.uniform(0, 100, (states, ncomp)) * (rng.uniform(size=(states, ncomp)) > 0.2)
+        C_pools[:, ~network.is_stored] = 0.0
+        DOC = network.names.index('DOC') if 'DOC' in network.names else None
+        if DOC is not None:
+            C_pools[:, DOC] = rng.uniform(0, 5, states) * (rng.uniform(size=states) > 0.5)
+        stored_C = C_pools[:, network.is_stored].sum(axis=1)
+        N = stored_C / rng.uniform(5, 80, states) * (rng.uniform(size=states) > 0.1)
+        self.initial = SOMBatch(C_pools, N, network)
+        self.T = rng.uniform(-10, 35, (steps, states))
+        self.wetness = rng.uniform(0, 1, (steps, states))
+        self.pH = rng.uniform(3, 8, (steps, states))
+
+
+class Harness(object):
+    """Runs the random cases through the reference and all registered paths"""
+
+    def __init__(self, states=200, steps=10, dt=1.0, max_turnover=0.1, seed=0,
+                 random_network=False, add_component=False):
+        """
+        :param states: Number of random states
+        :param steps: Number of time steps
+        :param dt: Time step in days
+        :param max_turnover: max_turnover of the multirate paths
+        :param seed: Seed of the random generator
+        :param random_network: If True, the parameters are randomised, see module documentation
+        :param add_component: If True, a test component is added with SOM.add_component
+        """
+        self.add_component = add_component
+        rng = np.random.default_rng(seed)
+        with self._components():
+            network = Network()
+        self.native = not random_network
+        if random_network:
+            network = globals()['random_network'](rng, network)
+        self.case = Case(network, states, steps, dt, rng)
+        self.max_turnover = max_turnover
+        # name -> (function(case), reference name, kind, rtol)
+        self.paths = collections.OrderedDict()
+        self._register_default_paths()
+        self.outputs = {}
+        self.seconds = {}
+
+    def _components(self):
+        """The context of the SOM components of the network"""
+        return component_added() if self.add_component else contextlib.nullcontext()
+
+    def add_path(self, name, function, reference, kind='integrate', rtol=1e-10):
+        """
+        Registers a path
+
+        :param name: Name of the path
+        :param function: Function f(case). Paths of the kind 'integrate' return the final
+            state and the sum of the outflow rate * dt as SOMBatch, paths of the kind 'rate'
+            return the change rate of the initial state (without the non stored pools) as SOMBatch
+        :param reference: The name of the path to compare with, None for a reference
+        :param kind: 'integrate' or 'rate'
+        :param rtol: The tolerated deviation relative to the largest reference value
+        """
+        self.paths[name] = (function, reference, kind, rtol)
+
+    def _register_default_paths(self):
+        add = self.add_path
+        mt = self.max_turnover
+        if self.native:
+            add('SOM.dCdt', self._som_dCdt, None, 'rate')
+            add('reference_dCdt', self._python_dCdt, 'SOM.dCdt', 'rate', 1e-12)
+            add('SOM.integrate', self._som_integrate, None)
+            add('reference integrate', self._python_integrate, 'SOM.integrate', rtol=1e-12)
+            add('SOM.integrate_multirate', lambda case: self._som_integrate(case, mt), None)
+            add('SOM.integrate_multirate(inf)', lambda case: self._som_integrate(case, 1e300), 'SOM.integrate')
+            rate, integrate, multirate = 'SOM.dCdt', 'SOM.integrate', 'SOM.integrate_multirate'
+        else:
+            add('reference_dCdt', self._python_dCdt, None, 'rate')
+            add('reference integrate', self._python_integrate, None)
+            rate, integrate, multirate = 'reference_dCdt', 'reference integrate', None
+        add('SOMBatch.dCdt', self._batch_dCdt, rate, 'rate')
+        add('FlatRHS', self._rhs_dCdt, rate, 'rate')
+        add('SOMBatch.integrate', self._batch_integrate, integrate)
+        add('SOMBatch.integrate float32', lambda case: self._batch_integrate(case, dtype=np.float32), integrate,
+            rtol=1e-4)
+        add('SOMBatch.run', self._batch_run, integrate)
+        if multirate:
+            add('SOMBatch.integrate_multirate', lambda case: self._batch_integrate(case, max_turnover=mt), multirate)
+        add('Parareal', self._parareal, integrate, rtol=1e-8)
+
+    # The paths
+    @staticmethod
+    def _rate_state(case):
+        """The initial state without the non stored pools, for the rate paths"""
+        state = case.initial.copy()
+        state.C_pools[..., ~case.network.is_stored] = 0.0
+        return state
+
+    def _som_dCdt(self, case):
+        state = self._rate_state(case)
+        soms = state.to_soms()
+        rates = [som.dCdt(T, w, pH) for som, T, w, pH in zip(soms, case.T[0], case.wetness[0], case.pH[0])]
+        return SOMBatch.from_soms(rates, case.network)
+
+    def _python_dCdt(self, case):
+        state = self._rate_state(case)
+        res = SOMBatch.zeros(state.shape, case.network)
+        for i in range(state.shape[0]):
+            rate, dN = reference_dCdt(case.network, state.C_pools[i], state.N[i],
+                                      case.T[0, i], case.wetness[0, i], case.pH[0, i])
+            res.C_pools[i] = rate
+            res.N[i] = dN
+        return res
+
+    def _batch_dCdt(self, case):
+        return self._rate_state(case).dCdt(case.T[0], case.wetness[0], case.pH[0])
+
+    def _rhs_dCdt(self, case):
+        from .rhs import FlatRHS
+        state = self._rate_state(case)
+        rhs = FlatRHS(state.shape, case.T[0], case.wetness[0], case.pH[0], case.network)
+        return rhs.unpack(rhs.dydt(rhs.pack(state)))
+
+    def _som_integrate(self, case, max_turnover=None):
+        soms = case.initial.to_soms()
+        outflow = SOMBatch.zeros(case.initial.shape, case.network)
+        for step in range(case.steps):
+            for i, som in enumerate(soms):
+                args = case.dt, case.T[step, i], case.wetness[step, i], case.pH[step, i]
+                if max_turnover is None:
+                    rate = som.integrate(*args)
+                else:
+                    rate = som.integrate_multirate(*args, max_turnover=max_turnover)
+                outflow.C_pools[i] += rate.to_array()[:-1] * case.dt
+                outflow.N[i] += rate.N * case.dt
+        return SOMBatch.from_soms(soms, case.network), outflow
+
+    def _python_integrate(self, case):
+        state = case.initial.copy()
+        outflow = SOMBatch.zeros(state.shape, case.network)
+        stored = case.network.is_stored
+        for step in range(case.steps):
+            for i in range(state.shape[0]):
+                rate, dN = reference_dCdt(case.network, state.C_pools[i], state.N[i],
+                                          case.T[step, i], case.wetness[step, i], case.pH[step, i])
+                rate = np.array(rate)
+                state.C_pools[i] += rate * case.dt
+                state.N[i] += dN * case.dt
+                state.C_pools[i, ~stored] = 0.0
+                outflow.C_pools[i, ~stored] += rate[~stored] * case.dt
+                outflow.N[i] -= dN * case.dt
+        return state, outflow
+
+    def _batch_integrate(self, case, dtype=np.float64, max_turnover=None):
+        state = case.initial.astype(dtype)
+        outflow = SOMBatch.zeros(state.shape, case.network)
+        for step in range(case.steps):
+            forcing = case.T[step], case.wetness[step], case.pH[step]
+            if max_turnover is None:
+                rate = state.integrate(case.dt, *forcing)
+            else:
+                rate = state.integrate_multirate(case.dt, *forcing, max_turnover=max_turnover)
+            outflow.add_scaled(rate, case.dt)
+        return state.astype(np.float64), outflow
+
+    def _batch_run(self, case):
+        state = case.initial.copy()
+        flux = state.run(case.dt, case.T, case.wetness, case.pH)
+        return state, SOMBatch(flux.C_pools.sum(axis=0) * case.dt, flux.N.sum(axis=0) * case.dt, case.network)
+
+    def _parareal(self, case):
+        from .parareal import Parareal
+        state = case.initial.copy()
+        solver = Parareal(state, case.dt, case.T, case.wetness, case.pH, slices=min(case.steps, 4), coarse_steps=1)
+        flux = solver.run(tolerance=1e-14)
+        return state, SOMBatch(flux.C_pools.sum(axis=0) * case.dt, flux.N.sum(axis=0) * case.dt, case.network)
+
+    # Evaluation
+    def _balance(self, name, kind, output):
+        """The C and N balance errors relative to the turnover"""
+        case = self.case
+        if kind == 'rate':
+            # The sum of all rates is 0, if the products of each component sum up to 1
+            C_scale = max(np.abs(output.C_pools).max(), 1e-300)
+            return np.abs(output.C_pools.sum(axis=-1)).max() / C_scale, 0.0
+        state, outflow = output
+        # The non stored pools of the initial state leave the SOM in the first step
+        C0 = case.initial.C_pools[..., case.network.is_stored].sum(axis=-1)
+        C_error = C0 - state.C_pools.sum(axis=-1) - outflow.C_pools.sum(axis=-1)
+        N_error = case.initial.N - state.N - outflow.N
+        scale_C = max(C0.max(), 1e-300)
+        scale_N = max(case.initial.N.max(), 1e-300)
+        return np.abs(C_error).max() / scale_C, np.abs(N_error).max() / scale_N
+
+    @staticmethod
+    def _values(kind, output):
+        """All compared values as one array"""
+        if kind == 'rate':
+            return output.to_array()
+        state, outflow = output
+        return np.concatenate([state.to_array(), outflow.to_array()], axis=-1)
+
+    def run(self):
+        """
+        Runs all paths, the references first
+
+        :return: list of Result
+        """
+        results = []
+        for name, (function, reference, kind, rtol) in self.paths.items():
+            start = time.time()
+            with self._components():
+                self.outputs[name] = function(self.case)
+            self.seconds[name] = time.time() - start
+            C_balance, N_balance = self._balance(name, kind, self.outputs[name])
+            if reference is None:
+                results.append(Result(name, '', kind, 0.0, 0.0, C_balance, N_balance,
+                                      self.seconds[name], 1.0, rtol, True))
+                continue
+            values = self._values(kind, self.outputs[name])
+            expected = self._values(kind, self.outputs[reference])
+            abs_error = np.abs(values - expected).max()
+            rel_error = abs_error / max(np.abs(expected).max(), 1e-300)
+            speedup = self.seconds[reference] / max(self.seconds[name], 1e-9)
+            results.append(Result(name, reference, kind, abs_error, rel_error, C_balance, N_balance,
+                                  self.seconds[name], speedup, rtol, bool(rel_error <= rtol)))
+        self.results = results
+        return results
+
+    def table(self, results=None):
+        """Returns the results as text table"""
+        results = results or self.run()
+        header = ('path', 'reference', 'max abs', 'max rel', 'C balance', 'N balance', 'time [s]', 'speedup', 'ok')
+        rows = [header]
+        for r in results:
+            rows.append((r.path, r.reference or '-', '{:.2e}'.format(r.abs_error), '{:.2e}'.format(r.rel_error),
+                         '{:.2e}'.format(r.C_balance), '{:.2e}'.format(r.N_balance), '{:.4f}'.format(r.seconds),
+                         '{:.1f}'.format(r.speedup), 'yes' if r.passed else 'NO'))
+        widths = [max(len(row[i]) for row in rows) for i in range(len(header))]
+        lines = ['  '.join(cell.ljust(w) for cell, w in zip(row, widths)) for row in rows]
+        lines.insert(1, '  '.join('-' * w for w in widths))
+        return '\n'.join(lines)
+
+    def check(self):
+        """Runs all paths and raises a ValidationError, if a path deviates more than its tolerance"""
+        results = self.run()
+        failed = [r for r in results if not r.passed]
+        if failed:
+            raise ValidationError('Paths deviating from the reference:\n' + self.table(results))
+        return results
+
+
+def main(argv=None):
+    import argparse
+    parser = argparse.ArgumentParser(description='Compares the integration paths of decomp with the reference')
+    parser.add_argument('--states', type=int, default=200, help='Number of random states')
+    parser.add_argument('--steps', type=int, default=10, help='Number of time steps')
+    parser.add_argument('--dt', type=float, default=1.0, help='Time step in days')
+    parser.add_argument('--seed', type=int, default=0, help='Seed of the random generator')
+    parser.add_argument('--random-network', action='store_true', help='Randomise the component parameters')
+    parser.add_argument('--add-component', action='store_true', help='Add a component with SOM.add_component')
+    args = parser.parse_args(argv)
+    harness = Harness(args.states, args.steps, args.dt, seed=args.seed,
+                      random_network=args.random_network, add_component=args.add_component)
+    results = harness.run()
+    print(harness.table(results))
+    return 0 if all(r.passed for r in results) else 1
+
+
+if __name__ == '__main__':
+    import sys
+    sys.exit(main())
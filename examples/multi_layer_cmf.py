@@ -6,6 +6,7 @@ requires: cmf
 
 import cmf
 from decomp.cmfconnector import CmfConnector
+from decomp import aggregate
 import datetime
 import numpy as np
 import xarray as xr
@@ -82,27 +83,41 @@ class MultiLayerDECOMPModel:
         return integ
 
 
-    def make_result_table(self, for_time):
+    def decomplayers(self):
         """
-        Creates a xarray.Dataset to store the results
-        :param for_time: duration of model run
+        The cmf layers with decomp pools
+        :return: list of cmf.SoilLayer
+        """
+        return list(self.decompcell.cmf_cell.layers)[:len(list(self.decompcell))]
+
+    def make_aggregators(self):
+        """
+        Creates the daily means of the layer variables, updated by the connector each time step.
+        All variables are restricted to the layers with decomp pools, like the state
+        :return: list of decomp.aggregate.Mean
+        """
+        N, DOC = self.project.solutes
+        layers = self.decomplayers()
+        variables = {
+            'N': lambda state, flux: [l[N].conc for l in layers],
+            'Corg': lambda state, flux: state.C,
+            'DOC': lambda state, flux: [l[DOC].conc for l in layers],
+            'Temp': lambda state, flux: self.decompcell.T_profile[:len(layers)],
+            'wetness': lambda state, flux: [l.wetness for l in layers],
+        }
+        return [aggregate.Mean(f, interval=1.0, name=name) for name, f in variables.items()]
+
+    def make_result_table(self, aggregators):
+        """
+        Creates a xarray.Dataset from the daily means
+        :param aggregators: The aggregators of the run
 
         :return:
         """
-        time = [t.AsPython()
-                for t in cmf.timerange(cmf.AsCMFtime(self.starttime),
-                                       cmf.AsCMFtime(self.starttime + for_time),
-                                       self.dt)]
-        depth = self.depth
-        layer_template = np.zeros((len(time), len(depth))) * np.NaN
+        time = [self.starttime + datetime.timedelta(days=end - 1) for end in aggregators[0].times]
         ds = xr.Dataset(
-            {'N': (('time', 'depth'), layer_template.copy()),
-             'Corg': (('time', 'depth'), layer_template.copy()),
-             'DOC': (('time', 'depth'), layer_template.copy()),
-             'Temp': (('time', 'depth'), layer_template.copy()),
-             'wetness': (('time', 'depth'), layer_template.copy()),
-             },
-            {'time': time, 'depth': list(depth)}
+            {a.name: (('time', 'depth'), a.result()) for a in aggregators},
+            {'time': time, 'depth': list(self.depth[:len(self.decomplayers())])}
         )
         return ds
 
@@ -111,20 +126,15 @@ class MultiLayerDECOMPModel:
         N, DOC = p.solutes
         integ = self.make_integrator()
 
-        result = self.make_result_table(for_time)
-        for i, t in enumerate(integ.run(self.starttime, self.starttime + for_time, self.dt)):
+        aggregators = self.make_aggregators()
+        self.decompcell.aggregators = aggregators
+        for t in integ.run(self.starttime, self.starttime + for_time, self.dt):
             T = p[0].get_weather(t).T
-            c = self.decompcell.cmf_cell
             self.decompcell.run(T, self.dt / cmf.day)
-            result.Temp[i] = self.decompcell.T_profile
-            result.N[i] = [l[N].conc for l in c.layers]
-            result.DOC[i] = [l[DOC].conc for l in c.layers]
-            result.wetness[i] = [l.wetness for l in c.layers]
-            result.Corg[i] = self.decompcell.Cpool
             print("%15s dt=%15s N=%g DOC=%g q=%g" %
                   (t, integ.dt, self.outlet.conc(t, N),
                    self.outlet.conc(t, DOC), self.outlet.waterbalance(t)))
-        return result
+        return self.make_result_table(aggregators)
 
     def plot_results(self, a):
         """
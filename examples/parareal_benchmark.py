@@ -0,0 +1,65 @@
+"""
+Compares the run time of a long single site run with SOMBatch.run and with the
+parareal solver, for a number of time slices
+"""
+
+import time
+import argparse
+
+import numpy as np
+
+import decomp
+from decomp.parareal import Parareal
+
+
+def forcing(years):
+    """Daily temperature and wetness with a yearly cycle and the yearly leave fall"""
+    days = np.arange(years * 365.0)
+    T = 8 - 10 * np.cos(days / 365 * 2 * np.pi)
+    wetness = 0.6 + 0.2 * np.sin(days / 365 * 2 * np.pi)
+    schedule = decomp.InputSchedule()
+    schedule.add_periodic(decomp.leave_litter(), 1.0, day=270)
+    schedule.add_constant(decomp.root_litter(), 0.5 / 365)
+    return T, wetness, 6.0, schedule.compile(days)
+
+
+def initial():
+    batch = decomp.SOMBatch.zeros(())
+    batch.add_scaled(decomp.leave_litter(), 5.0)
+    return batch
+
+
+def run(years, slices, coarse_steps=None, processes=None):
+    T, wetness, pH, inputs = forcing(years)
+    sequential = initial()
+    start = time.perf_counter()
+    sequential.run(1.0, T, wetness, pH, inputs=inputs)
+    t_seq = time.perf_counter() - start
+    print('sequential: {:.3f} s'.format(t_seq))
+    print('slices iterations time      speedup error')
+    for n in slices:
+        batch = initial()
+        start = time.perf_counter()
+        solver = Parareal(batch, 1.0, T, wetness, pH, inputs=inputs, slices=n,
+                          coarse_steps=coarse_steps, processes=processes)
+        solver.run()
+        t_par = time.perf_counter() - start
+        error = np.abs(batch.C_pools - sequential.C_pools).max() / np.abs(sequential.C_pools).max()
+        print('{:6d} {:10d} {:.3f} s {:7.1f} {:.0e}'.format(n, solver.iterations, t_par, t_seq / t_par, error))
+
+
+def cli():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--years', '-y', type=int, default=30, help='Length of the run')
+    parser.add_argument('--slices', '-s', type=int, nargs='*', default=[16, 32, 64, 73, 128],
+                        help='Number of time slices')
+    parser.add_argument('--coarse-steps', '-c', type=int, default=None,
+                        help='Days of a coarse step, default is about 30')
+    parser.add_argument('--processes', '-p', type=int, default=None,
+                        help='Worker processes for the fine propagation')
+    return parser.parse_args()
+
+
+if __name__ == '__main__':
+    args = cli()
+    run(args.years, args.slices, args.coarse_steps, args.processes)
@@ -5,7 +5,7 @@ together with the N enrichment over time
 
 
 import decomp
-from math import cos, pi
+from decomp import aggregate
 
 import numpy as np
 import argparse
@@ -17,52 +17,59 @@ class param:
 
 
 def date2doy(date):
-    return (date - np.datetime64(date, 'Y')).astype(int)
+    return (date - date.astype('M8[Y]')).astype(int)
 
 
 def temperature(date):
     """
     A proxy for the yearly changes of temperature and wetness
-    :param date: A datetime64 value
+    :param date: A datetime64 value or array
     :return: Temperature, wetness, pH
     """
     doy = date2doy(date)
     tavg = 0.5 * (param.TMAX + param.TMIN)
     tampl = 0.5 * (param.TMAX - param.TMIN)
-    T = tavg + tampl * cos(doy / 365 * 2 * pi)
+    T = tavg + tampl * np.cos(doy / 365 * 2 * np.pi)
     wetness = 1 - T / param.TMAX
     return T, wetness, param.pH
 
 
-def run(som, input_functions, doc_retention_time=0.0, verbose=False):
+def run(som, schedule, doc_retention_time=0.0, verbose=False):
     """
     Runs the model for 19 years with daily timesteps
+
+    The state and C/N ratio of each day are recorded after the litter input and
+    before the decomposition, the DOC flux is the DOC produced in the day (the
+    percolating DOC minus the change of the DOC retained in the layer).
+
     :param som: Initial soil organic matter conditions
-    :param input_functions: List of f(date) functions to generate input
-    :param doc_retention_time:
-    :return:
+    :param schedule: decomp.InputSchedule of the litter input
+    :param doc_retention_time: Mean residence time of the DOC in the layer in days
+    :return: dates, state, flux, C/N ratio and N flux of each day
     """
-    som = sum(som, decomp.SOM())
-    input_function = lambda date: sum((ifunc(date) for ifunc in input_functions), decomp.SOM())
+    # A profile with a single layer, the DOC percolates out of the layer
+    som = decomp.SOMBatch.from_soms([sum(som, decomp.SOM())])
+    initial = som.copy()
     dates = np.arange(np.datetime64('2000-01-01'), np.datetime64('2019-01-01'))
-    som_state = np.NaN * np.zeros((len(dates), 6))
-    som_flux = np.NaN * np.zeros((len(dates), 6))
-    N_flux = np.NaN * np.zeros(dates.shape)
-    CN = np.NaN * np.zeros(dates.shape)
+    inputs = schedule.compile(dates)
     doc_retention_rate = 1 - (1 / doc_retention_time) if doc_retention_time else 0.0
-    for i, d in enumerate(dates):
-        if verbose:
-            print('{i:4d}:{d} Ctot={som.C:0.5g}, CN={som.CN:0.4g}'.format(i=i, d=d, som=som))
-        som += input_function(d)
-        som_state[i] = [c for _, c in som]
-        CN[i] = som.CN
-        old_doc = som[decomp.DOC]
-        flux = som.integrate(1, *temperature(d))
-        som[decomp.DOC] = (old_doc + flux[decomp.DOC]) * doc_retention_rate
-        som_flux[i] = [c for _, c in flux]
-        N_flux[i] = flux.N
-
-    return dates, som_state, som_flux, CN, N_flux
+    # The state at the end and the flux of each day
+    daily = [aggregate.Last(lambda state, flux: state.C_pools[0], interval=1.0, name='state'),
+             aggregate.Last(lambda state, flux: state.N[0], interval=1.0, name='N'),
+             aggregate.Mean(lambda state, flux: flux.C_pools[0], interval=1.0, name='flux'),
+             aggregate.Mean(lambda state, flux: flux.N[0], interval=1.0, name='N_flux')]
+    result = som.run(1.0, *temperature(dates), inputs=inputs,
+                     percolation=1 - doc_retention_rate, aggregate=daily)
+    # The state at the start of each day and after the litter input
+    start = decomp.SOMBatch(np.concatenate([initial.C_pools, result['state'][:-1]]),
+                            np.concatenate([initial.N, result['N'][:-1]]))
+    state = start + inputs
+    flux = result['flux']
+    flux[:, decomp.DOC.Id] += result['state'][:, decomp.DOC.Id] - state.C_pools[:, decomp.DOC.Id]
+    if verbose:
+        for i in range(0, len(dates), 365):
+            print('{i:4d}:{d} Ctot={C:0.5g}, CN={CN:0.4g}'.format(i=i, d=dates[i], C=start.C[i], CN=start.CN[i]))
+    return dates, state.C_pools, flux, state.CN, result['N_flux']
 
 
 def state_plot(t, som_state, CN):
@@ -105,29 +112,30 @@ def cli():
         'doc': decomp.pure_DOC(),
     }
 
-    def yearly_function(somname):
-        return lambda date: som_dict[somname] if date2doy(date) == 270 else decomp.SOM()
-
-    def daily_function(somname):
-        return lambda date: som_dict[somname] / 365
-
     def initial_som(somname):
         return som_dict[somname]
 
     parser = argparse.ArgumentParser()
     parser.add_argument('--docretention', '-r', type=float, default=0.0)
-    parser.add_argument('--yearly', '-y', nargs='*', type=yearly_function, default=[])
-    parser.add_argument('--daily', '-d', nargs='*', type=daily_function, default=[])
+    parser.add_argument('--yearly', '-y', nargs='*', choices=som_dict, default=[])
+    parser.add_argument('--daily', '-d', nargs='*', choices=som_dict, default=[])
     parser.add_argument('initial', nargs='*', type=initial_som)
     parser.add_argument('--verbose', '-v', action='store_true')
     parser.add_argument('--plot', '-p', action='store_true')
     args = parser.parse_args()
+
+    # Leave fall at day of year 270 and constant input over the year
+    args.schedule = decomp.InputSchedule()
+    for somname in args.yearly:
+        args.schedule.add_periodic(som_dict[somname], 1.0, day=270)
+    for somname in args.daily:
+        args.schedule.add_constant(som_dict[somname], 1 / 365)
     return args
 
 
 if __name__ == '__main__':
     args = cli()
-    result = run(args.initial, args.daily + args.yearly, args.docretention, args.verbose)
+    result = run(args.initial, args.schedule, args.docretention, args.verbose)
     if args.plot:
         import pylab as plt
         plot(*result)
@@ -96,7 +96,7 @@ if __name__ == '__main__':
         wrapper = 'decomp/decomp_wrap.cpp'
     print('    ->', wrapper)
     ext = Extension('decomp._decomp',
-                    sources=['decomp/SOM.cpp', 'decomp/SOMcomponent.cpp', wrapper],
+                    sources=['decomp/SOM.cpp', 'decomp/SOMcomponent.cpp', 'decomp/rhs.cpp', wrapper],
                     swig_opts=['-c++', '-Wextra', '-w512', '-w511', '-O', '-keyword', '-castmode'],
                     )
 
@@ -118,6 +118,9 @@ if __name__ == '__main__':
           license='MIT',
           ext_modules=[ext],
           packages=['decomp'],
+          install_requires=['numpy'],
+          extras_require=dict(gridded=['xarray', 'dask[array]']),
+          entry_points=dict(console_scripts=['decomp = decomp.cli:main']),
           python_requires='>=3.5',
           keywords='decomposition soil litter',
           author='Philipp Kraft',
@@ -0,0 +1,64 @@
+import numpy as np
+
+import decomp
+from decomp import aggregate
+
+STEPS_PER_DAY, DAYS = 4, 10
+
+
+def initial():
+    batch = decomp.SOMBatch.zeros((5,))
+    batch.add_scaled(decomp.leave_litter(), np.linspace(1.0, 5.0, 5))
+    return batch
+
+
+def forcing():
+    t = np.arange(STEPS_PER_DAY * DAYS) / STEPS_PER_DAY
+    return 10 + 8 * np.sin(t), 0.5, 6.0
+
+
+def reference():
+    """The states and fluxes of each step"""
+    batch = initial()
+    states, fluxes = [], []
+    for T in forcing()[0]:
+        fluxes.append(batch.integrate(1.0 / STEPS_PER_DAY, T, 0.5, 6.0).copy())
+        states.append(batch.copy())
+    return states, fluxes
+
+
+def daily(values):
+    return np.asarray(values).reshape((DAYS, STEPS_PER_DAY) + np.shape(values)[1:])
+
+
+def test_aggregators_match_reference():
+    aggregators = [aggregate.Mean('CO_2', interval=1.0), aggregate.Sum('CO_2', interval=2.0),
+                   aggregate.Max('C', interval=1.0), aggregate.Min('N_release', interval=1.0),
+                   aggregate.Last('C', interval=1.0), aggregate.Mean('C', axis=0, name='C_mean')]
+    result = initial().run(1.0 / STEPS_PER_DAY, *forcing(), aggregate=aggregators)
+    states, fluxes = reference()
+    C = np.array([s.C for s in states])
+    CO2 = np.array([f.C_pools[:, f.network.index('CO_2')] for f in fluxes])
+    N_release = np.array([f.N for f in fluxes])
+    np.testing.assert_allclose(result['mean_CO_2'], daily(CO2).mean(axis=1))
+    np.testing.assert_allclose(result['sum_CO_2'], CO2.reshape(DAYS // 2, -1, 5).sum(axis=1) / STEPS_PER_DAY)
+    np.testing.assert_allclose(result['max_C'], daily(C).max(axis=1))
+    np.testing.assert_allclose(result['min_N_release'], daily(N_release).min(axis=1))
+    np.testing.assert_allclose(result['last_C'], daily(C)[:, -1])
+    np.testing.assert_allclose(result['C_mean'], [C.mean()])
+    assert aggregators[0].times == list(np.arange(1.0, DAYS + 1.0))
+
+
+def test_variance_over_time_and_ensemble():
+    variance = aggregate.Variance('C', interval=2.0, axis=0)
+    initial().run(1.0 / STEPS_PER_DAY, *forcing(), aggregate=[variance])
+    C = np.array([s.C for s in reference()[0]]).reshape(DAYS // 2, -1)
+    np.testing.assert_allclose(variance.result(), C.var(axis=1, ddof=1))
+
+
+def test_function_and_reset():
+    mean = aggregate.Mean(lambda state, flux: state.C_pools[..., :2].sum(axis=-1), interval=1.0, name='f')
+    initial().run(1.0 / STEPS_PER_DAY, *forcing(), aggregate=[mean])
+    assert mean.result().shape == (DAYS, 5)
+    mean.reset()
+    assert mean.result().shape == (0,) and mean.times == []
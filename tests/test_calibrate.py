@@ -0,0 +1,61 @@
+import numpy as np
+import pytest
+
+import decomp
+from decomp import calibrate
+
+STEPS = np.arange(9, 200, 10)
+
+
+def calibration(objectives=()):
+    days = np.arange(200)
+    T = 10 + 8 * np.sin(days / 30.0)
+    initial = [decomp.leave_litter(), decomp.wood_litter() * 2]
+    return calibrate.Calibration(initial, [('k_pot', decomp.EDC), ('k_pot', decomp.LIGN)],
+                                 dt=1.0, T=T, wetness=0.6, pH=6.0, objectives=objectives)
+
+
+def synthetic(truth):
+    """Observations of the mass remaining of both sites with the true parameters"""
+    record = calibration().simulate(truth)
+    steps = np.concatenate([STEPS, STEPS])
+    sites = np.repeat([0, 1], len(STEPS))
+    values = record['mass_remaining'][steps, 0, sites]
+    return calibrate.MassRemaining(steps, values, sites=sites, sigma=0.01)
+
+
+def test_empty_objectives():
+    with pytest.raises(ValueError):
+        calibration().cost([0.1, 0.01])
+
+
+def test_batched_cost_matches_loop():
+    net = decomp.Network()
+    truth = [net.k_pot[decomp.EDC.Id] * 1.5, net.k_pot[decomp.LIGN.Id] * 0.5]
+    calib = calibration([synthetic(truth)])
+    population = np.random.RandomState(0).uniform(0.5, 2, (6, 2)) * truth
+    cost = calib.cost(population)
+    assert cost.shape == (6,)
+    np.testing.assert_allclose(cost, [calib.cost(member) for member in population], rtol=1e-12)
+
+
+def test_recover_parameter():
+    net = decomp.Network()
+    truth = [net.k_pot[decomp.EDC.Id] * 1.5, net.k_pot[decomp.LIGN.Id] * 0.5]
+    calib = calibration([synthetic(truth)])
+    # A grid search over k_pot of LIGN, the population is evaluated in one batch
+    grid = truth[1] * np.linspace(0.5, 1.5, 21)
+    population = np.column_stack([np.full_like(grid, truth[0]), grid])
+    cost = calib.cost(population)
+    assert grid[np.argmin(cost)] == pytest.approx(truth[1])
+    assert calib.cost(truth) == pytest.approx(cost.min())
+
+
+def test_recover_parameters_with_optimizer():
+    optimize = pytest.importorskip('scipy.optimize')
+    net = decomp.Network()
+    truth = np.array([net.k_pot[decomp.EDC.Id] * 1.5, net.k_pot[decomp.LIGN.Id] * 0.5])
+    calib = calibration([synthetic(truth)])
+    res = optimize.minimize(lambda x: calib.cost(x * truth), [0.7, 1.3], method='Nelder-Mead',
+                            options=dict(xatol=1e-6, fatol=1e-8))
+    np.testing.assert_allclose(res.x, [1.0, 1.0], rtol=1e-3)
@@ -0,0 +1,51 @@
+import csv
+import json
+
+import numpy as np
+
+from decomp import cli
+
+
+def write_scenarios(directory, scenarios):
+    weather = directory / 'weather.csv'
+    days = np.arange(40)
+    np.savetxt(str(weather), np.c_[10 + 5 * np.sin(days / 6.0), np.full(40, 0.5)],
+               delimiter=',', header='T,wetness', comments='')
+    path = directory / 'scenarios.json'
+    defaults = {'start': '2000-01-01', 'steps': 40, 'dt': 1.0,
+                'forcing': {'file': 'weather.csv', 'T': 'T', 'wetness': 'wetness', 'pH': 5.5},
+                'initial': [{'template': 'leave_litter', 'mass': 1.0}, {'pools': {'RECALC': 5.0}, 'N': 0.2}],
+                'litter': [{'template': 'root_litter', 'rate': 0.01}]}
+    path.write_text(json.dumps({'defaults': defaults, 'scenarios': scenarios}))
+    return str(path)
+
+
+def read(path):
+    with open(str(path)) as f:
+        return list(csv.DictReader(f))
+
+
+def test_smoke_run(tmp_path):
+    scenarios = write_scenarios(tmp_path, [{'name': 'control'}, {'name': 'weekly', 'output_every': 7}])
+    output = tmp_path / 'out'
+    summary = tmp_path / 'summary.json'
+    status = cli.main([scenarios, '-o', str(output), '-j', '1', '--check', '-q', '--summary', str(summary)])
+    assert status == cli.EXIT_OK
+    rows = read(output / 'control.csv')
+    assert len(rows) == 40 * 2
+    assert rows[0]['time'].startswith('2000-01-02') and rows[0]['state'] == '0'
+    assert float(rows[-1]['CO_2']) > 0
+    assert len(read(output / 'weekly.csv')) == 2 * 6
+    assert [s['status'] for s in json.loads(summary.read_text())['scenarios']] == ['ok', 'ok']
+
+
+def test_failed_scenario(tmp_path):
+    scenarios = write_scenarios(tmp_path, [{'name': 'control'}, {'name': 'broken', 'forcing': {'T': 'missing'}}])
+    assert cli.main([scenarios, '-o', str(tmp_path), '-j', '1', '-q']) == cli.EXIT_FAILED
+    assert (tmp_path / 'control.csv').exists()
+
+
+def test_usage_errors(tmp_path):
+    assert cli.main([str(tmp_path / 'missing.json'), '-q']) == cli.EXIT_USAGE
+    scenarios = write_scenarios(tmp_path, [{'name': 'control'}])
+    assert cli.main([scenarios, '-s', 'other', '-q']) == cli.EXIT_USAGE
@@ -0,0 +1,36 @@
+import numpy as np
+import pytest
+
+import decomp
+from decomp.cmfconnector import CmfConnector
+
+from test_mixing import Cell
+
+
+def test_state_setter_changes_the_layers_in_place():
+    connector = CmfConnector(Cell([0.1, 0.1, 0.2]), 8.0)
+    layers = list(connector)
+    state = connector.state
+    state.add_scaled(decomp.leave_litter(), [1.0, 2.0, 3.0])
+    connector.state = state
+    assert all(a is b for a, b in zip(connector, layers))
+    np.testing.assert_allclose([som.C for som in layers], state.C)
+    connector.Cpool = [5.0, 4.0, 3.0]
+    assert all(a is b for a, b in zip(connector, layers))
+    np.testing.assert_allclose([som[decomp.RC] for som in layers], [5.0, 4.0, 3.0])
+
+
+def test_set_from_array():
+    som = decomp.SOM()
+    values = decomp.leave_litter().to_array()
+    som.set_from_array(values)
+    np.testing.assert_array_equal(som.to_array(), values)
+
+
+def test_depose_root():
+    connector = CmfConnector(Cell([0.1, 0.1, 0.2, 0.3]), 8.0, max_Corg_depth=0.3)
+    # Values of the cmf layers below the decomp layers are ignored
+    connector.depose_root([3.0, 2.0, 1.0, 0.5])
+    np.testing.assert_allclose(connector.state.C, np.array([3.0, 2.0, 1.0]) * decomp.root_litter().C)
+    with pytest.raises(ValueError):
+        connector.depose_root([1.0, 1.0])
@@ -0,0 +1,27 @@
+import numpy as np
+
+import decomp
+from decomp import aggregate
+
+
+def run(dtype, years=100):
+    days = np.arange(years * 365.0)
+    T = 8 - 10 * np.cos(days / 365 * 2 * np.pi)
+    wetness = 0.6 + 0.2 * np.sin(days / 365 * 2 * np.pi)
+    inputs = decomp.InputSchedule().add_periodic(decomp.leave_litter(), 1.0, day=270).compile(days)
+    batch = decomp.SOMBatch.zeros((4,), dtype=dtype)
+    batch.add_scaled(decomp.leave_litter(), [0.5, 1.0, 2.0, 5.0])
+    batch.add_scaled(decomp.wood_litter(), [0.0, 1.0, 0.0, 3.0])
+    CO2 = aggregate.Sum('CO_2')
+    batch.run(1.0, T, wetness, 6.0, inputs=inputs, aggregate=[CO2])
+    return batch.astype(np.float64), CO2.result()[0]
+
+
+def test_float32_deviation_of_a_century():
+    """The deviation stated in the documentation of SOMBatch"""
+    (state64, CO2_64), (state32, CO2_32) = run(np.float64), run(np.float32)
+    stored = state64.network.is_stored
+    pools = np.abs(state32.C_pools - state64.C_pools)[:, stored] / state64.C_pools[:, stored]
+    assert pools.max() < 1e-5
+    assert np.max(np.abs(state32.N - state64.N) / state64.N) < 1e-5
+    assert np.max(np.abs(CO2_32 - CO2_64) / CO2_64) < 3e-6
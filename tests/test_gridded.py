@@ -0,0 +1,48 @@
+import numpy as np
+import pytest
+
+import decomp
+from decomp import aggregate
+
+xr = pytest.importorskip('xarray')
+pytest.importorskip('dask')
+gridded = pytest.importorskip('decomp.gridded')
+
+STEPS, NY, NX = 30, 4, 3
+
+
+def forcing():
+    rng = np.random.RandomState(2)
+    time = np.arange(STEPS)
+    return xr.Dataset({'T': (('time', 'y', 'x'), rng.uniform(0, 25, (STEPS, NY, NX))),
+                       'wetness': (('y', 'x'), rng.uniform(0.3, 0.9, (NY, NX))),
+                       'litter': (('time', 'y', 'x'), np.where(time % 10 == 5, 1.0, 0.0)[:, None, None]
+                                  * rng.uniform(0.5, 2, (NY, NX)))},
+                      coords={'time': time, 'y': np.arange(NY), 'x': np.arange(NX)})
+
+
+def reference(ds, initial):
+    batch = decomp.SOMBatch.zeros((NY, NX))
+    batch.add_scaled(initial, 1.0)
+    inputs = decomp.SOMBatch.zeros((STEPS, NY, NX))
+    inputs.add_scaled(decomp.leave_litter(), ds.litter.values)
+    record = [aggregate.Last(lambda state, flux: state.C_pools, interval=1.0, name='pools'),
+              aggregate.Last(lambda state, flux: state.N, interval=1.0, name='N'),
+              aggregate.Last(lambda state, flux: flux.C_pools, interval=1.0, name='flux')]
+    wetness = np.broadcast_to(ds.wetness.values, (STEPS, NY, NX))
+    return batch.run(1.0, ds['T'].values, wetness, 6.0, inputs=inputs, aggregate=record)
+
+
+@pytest.mark.parametrize('chunks', [None, {'y': 2, 'x': 2}])
+def test_matches_batch_run(chunks):
+    ds = forcing()
+    if chunks:
+        ds = ds.chunk(chunks)
+    initial = decomp.leave_litter() * 5
+    result = ds.decomp.run(initial, dt=1.0, pH=6.0, inputs={'litter': decomp.leave_litter()})
+    result = result.transpose('time', 'y', 'x').compute()
+    expected = reference(forcing(), initial)
+    for c in decomp.SOM.get_pool_types():
+        values = expected['pools' if c.is_stored else 'flux'][..., c.Id]
+        np.testing.assert_allclose(result[c.Name].values, values, rtol=1e-12, atol=1e-15)
+    np.testing.assert_allclose(result['N'].values, expected['N'], rtol=1e-12)
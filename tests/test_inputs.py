@@ -0,0 +1,48 @@
+import numpy as np
+import pytest
+
+import decomp
+from decomp import InputSchedule
+
+DATES = np.arange(np.datetime64('2000-01-01'), np.datetime64('2003-01-01'))
+
+
+def test_constant_input():
+    inputs = InputSchedule().add_constant(decomp.root_litter(), 0.5).compile(np.arange(0.0, 10.0, 0.25), dt=0.25)
+    assert inputs.shape == (40,)
+    np.testing.assert_allclose(inputs.C, 0.125 * decomp.root_litter().C)
+    np.testing.assert_allclose(inputs.N, 0.125 * decomp.root_litter().N)
+
+
+def test_periodic_input_on_dates():
+    inputs = InputSchedule().add_periodic(decomp.leave_litter(), 2.0, day=270).compile(DATES)
+    days = np.flatnonzero(inputs.C)
+    doy = (DATES[days] - DATES[days].astype('M8[Y]')).astype(int)
+    np.testing.assert_array_equal(doy, [270, 270, 270])
+    np.testing.assert_allclose(inputs.C[days], 2.0 * decomp.leave_litter().C)
+
+
+def test_periodic_input_on_float_days():
+    times = np.arange(0.0, 100.0, 0.5)
+    inputs = InputSchedule().add_periodic(decomp.leave_litter(), 1.0, day=10.2, period=30.0).compile(times, dt=0.5)
+    np.testing.assert_array_equal(times[np.flatnonzero(inputs.C)], [10.0, 40.0, 70.0])
+
+
+def test_event_input():
+    schedule = InputSchedule().add_events(decomp.wood_litter(), np.array(['2001-03-01', '2001-03-01', '2005-01-01'],
+                                                                         dtype='M8[D]'), [1.0, 2.0, 5.0])
+    inputs = schedule.compile(DATES)
+    day = np.flatnonzero(inputs.C)
+    # Events on the same day are summed, events outside of the run are ignored
+    assert DATES[day] == np.datetime64('2001-03-01')
+    assert inputs.C[day] == pytest.approx(3.0 * decomp.wood_litter().C)
+
+
+def test_total_input_mass():
+    schedule = (InputSchedule()
+                .add_constant(decomp.root_litter(), 1 / 365)
+                .add_periodic(decomp.leave_litter(), 1.0, day=270)
+                .add_events(decomp.wood_litter(), [10.0], [2.0]))
+    inputs = schedule.compile(np.arange(365.0 * 2))
+    expected = 2 * decomp.root_litter().C + 2 * decomp.leave_litter().C + 2 * decomp.wood_litter().C
+    assert inputs.C.sum() == pytest.approx(expected)
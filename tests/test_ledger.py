@@ -0,0 +1,46 @@
+import numpy as np
+import pytest
+
+import decomp
+from decomp.ledger import MassBalanceError
+
+
+def run(dtype, steps=365):
+    batch = decomp.SOMBatch.zeros((50,), dtype=dtype)
+    batch.add_scaled(decomp.leave_litter(), np.linspace(1.0, 100.0, 50))
+    ledger = batch.attach_ledger()
+    days = np.arange(steps)
+    batch.run(1.0, 10 + 8 * np.sin(days / 50.0), 0.5, 6.0)
+    return batch, ledger
+
+
+@pytest.mark.parametrize('dtype', [np.float64, np.float32])
+def test_balance_closed(dtype):
+    batch, ledger = run(dtype)
+    assert ledger.steps == 365
+    assert ledger.tolerance() == np.finfo(dtype).eps * 365
+    ledger.check(batch)
+
+
+def test_input_recorded():
+    batch, ledger = run(np.float64, steps=10)
+    batch.add_input(decomp.leave_litter())
+    C_error, N_error = ledger.mass_balance(batch)
+    np.testing.assert_allclose(C_error, 0.0, atol=1e-10)
+    np.testing.assert_allclose(N_error, 0.0, atol=1e-10)
+    assert ledger.CO2.min() > 0
+
+
+def test_lost_mass_detected():
+    batch, ledger = run(np.float64, steps=10)
+    batch.C_pools[3, decomp.EDC.Id] *= 0.5
+    with pytest.raises(MassBalanceError):
+        ledger.check(batch)
+
+
+def test_reset():
+    batch, ledger = run(np.float64, steps=10)
+    ledger.reset(batch)
+    assert ledger.steps == 0
+    assert not ledger.outflow.any()
+    ledger.check(batch)
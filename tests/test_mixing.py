@@ -0,0 +1,42 @@
+import numpy as np
+
+import decomp
+from decomp import mixing
+from decomp.cmfconnector import CmfConnector
+
+
+class Layer(object):
+    def __init__(self, position, upper_boundary, thickness):
+        self.Position = position
+        self.upper_boundary = upper_boundary
+        self.thickness = thickness
+
+
+class Cell(object):
+    """The layer geometry of a cmf cell, enough for CmfConnector without cmf"""
+    def __init__(self, thickness):
+        upper_boundary = np.r_[0.0, np.cumsum(thickness)[:-1]]
+        self.layers = [Layer(i, ub, t) for i, (ub, t) in enumerate(zip(upper_boundary, thickness))]
+
+    def layer_count(self):
+        return len(self.layers)
+
+
+def test_plow_matrix_conserves_mass():
+    thickness = np.array([0.05, 0.1, 0.1, 0.2])
+    matrix = mixing.plow_matrix(thickness, np.r_[0, np.cumsum(thickness)[:-1]], 0.2)
+    np.testing.assert_allclose(matrix.sum(axis=0), 1.0)
+
+
+def test_connector_plow_by_thickness():
+    thickness = [0.05, 0.1, 0.1, 0.2, 0.3]
+    connector = CmfConnector(Cell(thickness), 8.0, max_Corg_depth=0.4)
+    for i, som in enumerate(connector):
+        som.add_scaled(decomp.leave_litter(), i + 1.0)
+    before = np.array([som.to_array() for som in connector])
+    connector.plow(0.2)
+    after = np.array([som.to_array() for som in connector])
+    plowed = np.array(thickness[:3])
+    expected = before[:3].sum(axis=0) * (plowed / plowed.sum())[:, np.newaxis]
+    np.testing.assert_allclose(after[:3], expected)
+    np.testing.assert_array_equal(after[3], before[3])
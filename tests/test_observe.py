@@ -0,0 +1,105 @@
+import numpy as np
+import pytest
+
+import decomp
+from decomp import observe
+
+
+def test_event_buffer_wraps_around():
+    buffer = observe.EventBuffer(capacity=5)
+    buffer.append(1.0, 1, 0, np.arange(3), np.arange(3.0))
+    buffer.append(2.0, 2, 1, np.arange(3, 7), np.arange(3.0, 7.0))
+    assert len(buffer) == 5
+    assert buffer.count == 7
+    assert buffer.dropped == 2
+    events = buffer.events()
+    # The oldest events are overwritten, the rest is in chronological order
+    np.testing.assert_array_equal(events['index'], [2, 3, 4, 5, 6])
+    np.testing.assert_array_equal(events['step'], [1, 2, 2, 2, 2])
+    np.testing.assert_array_equal(events['condition'], [0, 1, 1, 1, 1])
+    # More events than the capacity in one append keeps the last ones
+    buffer.append(3.0, 3, 0, np.arange(10, 22), np.zeros(12))
+    np.testing.assert_array_equal(buffer.events()['index'], np.arange(17, 22))
+    assert buffer.dropped == 14
+    buffer.clear()
+    assert len(buffer) == 0 and len(buffer.events()) == 0
+
+
+def states(CN):
+    """A batch with the C/N ratios CN"""
+    batch = decomp.SOMBatch.zeros((len(CN),))
+    batch.add_scaled(decomp.leave_litter(), 1.0)
+    batch.N[:] = batch.C / np.asarray(CN, dtype=float)
+    return batch
+
+
+@pytest.mark.parametrize('edge', [True, False])
+def test_threshold_records_rising_edges(edge):
+    observer = observe.Observer([observe.Threshold('CN', above=30.0, edge=edge)])
+    # State 0 rises above 30 in step 2, falls in step 4 and rises again in step 5,
+    # state 1 is above 30 from the start
+    series = [(20, 40), (35, 40), (35, 40), (25, 40), (32, 40)]
+    for CN in series:
+        batch = states(CN)
+        observer.update(batch, decomp.SOMBatch.zeros(batch.shape), dt=0.5)
+    events = observer.events('CN>30')
+    if edge:
+        expected = [(1, 1), (2, 0), (5, 0)]
+    else:
+        expected = [(s + 1, i) for s, CN in enumerate(series) for i in range(2) if CN[i] > 30]
+    assert [(e['step'], e['index']) for e in events] == expected
+    np.testing.assert_allclose(events['time'], 0.5 * events['step'])
+    np.testing.assert_allclose(events['value'], [series[s - 1][i] for s, i in expected])
+
+
+def test_threshold_below_and_mask():
+    condition = observe.Threshold('CN', below=15.0, mask=np.array([True, False]))
+    observer = observe.Observer([condition])
+    batch = states([10, 10])
+    observer.update(batch, decomp.SOMBatch.zeros(batch.shape))
+    assert list(observer.events()['index']) == [0]
+    assert condition.name == 'CN<15'
+    with pytest.raises(ValueError):
+        observe.Threshold('CN')
+
+
+def test_sampler_stride():
+    sampler = observe.Sampler(stride=3, index=np.s_[1:])
+    observer = observe.Observer(sampler=sampler)
+    batch = states([20, 25, 30])
+    for step in range(10):
+        batch.N *= 1.1
+        observer.update(batch, decomp.SOMBatch.zeros(batch.shape), dt=2.0)
+    times, samples = sampler.states()
+    np.testing.assert_allclose(times, [6.0, 12.0, 18.0])
+    assert samples.shape == (3, 2)
+    # The samples are copies of the state at the sampled steps
+    np.testing.assert_allclose(samples.N[:, 0], states([25])[0].N * 1.1 ** np.array([3, 6, 9]))
+    with pytest.raises(ValueError):
+        observe.Sampler(stride=0)
+
+
+def test_sampler_capacity():
+    sampler = observe.Sampler(stride=1, capacity=2)
+    for step in range(1, 5):
+        sampler.update(float(step), step, states([20]))
+    times, samples = sampler.states()
+    np.testing.assert_allclose(times, [3.0, 4.0])
+
+
+def test_observer_in_run():
+    batch = decomp.SOMBatch.zeros((4,))
+    batch.add_scaled(decomp.leave_litter(), [1.0, 2.0, 3.0, 4.0])
+    batch.N[:] = batch.C / 12.0
+    observer = batch.attach_observer(observe.default_conditions(batch.network),
+                                     sampler=observe.Sampler(stride=10))
+    batch.run(1.0, np.full(30, 15.0), 0.5, 6.0)
+    assert observer.step == 30
+    assert observer.time == pytest.approx(30.0)
+    # All states start below CNmin, each is recorded once on the first step
+    events = observer.events('CN<CNmin')
+    assert sorted(events['index']) == [0, 1, 2, 3]
+    assert set(events['step']) == {1}
+    assert len(observer.events('negative')) == 0
+    times, samples = observer.sampler.states()
+    np.testing.assert_allclose(times, [10.0, 20.0, 30.0])
@@ -0,0 +1,65 @@
+import numpy as np
+import pytest
+
+import decomp
+from decomp.parareal import Parareal
+
+YEARS = 10
+
+
+def forcing(inputs=True):
+    days = np.arange(YEARS * 365.0)
+    T = 8 - 10 * np.cos(days / 365 * 2 * np.pi)
+    wetness = 0.6 + 0.2 * np.sin(days / 365 * 2 * np.pi)
+    if not inputs:
+        return T, wetness, 6.0, None
+    schedule = decomp.InputSchedule()
+    schedule.add_periodic(decomp.leave_litter(), 1.0, day=270)
+    schedule.add_constant(decomp.root_litter(), 0.5 / 365)
+    return T, wetness, 6.0, schedule.compile(days)
+
+
+def initial():
+    batch = decomp.SOMBatch.zeros(())
+    batch.add_scaled(decomp.leave_litter(), 5.0)
+    return batch
+
+
+@pytest.mark.parametrize('inputs', [True, False])
+def test_parareal_matches_sequential_run(inputs):
+    T, wetness, pH, schedule = forcing(inputs)
+    sequential = initial()
+    expected = sequential.run(1.0, T, wetness, pH, inputs=schedule)
+    batch = initial()
+    solver = Parareal(batch, 1.0, T, wetness, pH, inputs=schedule, slices=20)
+    flux = solver.run()
+    # Converges in a few iterations, much less than the number of slices
+    assert solver.iterations <= 8
+    assert solver.changes[-1] < 1e-8
+    np.testing.assert_allclose(batch.C_pools, sequential.C_pools, rtol=1e-7, atol=1e-8)
+    np.testing.assert_allclose(batch.N, sequential.N, rtol=1e-7)
+    np.testing.assert_allclose(flux.C_pools, expected.C_pools, rtol=1e-6, atol=1e-10)
+
+
+def test_coarse_steps_do_not_need_to_divide_the_slices():
+    T, wetness, pH, schedule = forcing()
+    sequential = initial()
+    sequential.run(1.0, T, wetness, pH, inputs=schedule)
+    batch = initial()
+    solver = Parareal(batch, 1.0, T, wetness, pH, inputs=schedule, slices=20, coarse_steps=40)
+    assert solver.length % solver.coarse_steps
+    solver.run()
+    np.testing.assert_allclose(batch.C_pools, sequential.C_pools, rtol=1e-7, atol=1e-8)
+
+
+def test_coarse_propagator_conserves_carbon():
+    T, wetness, pH, schedule = forcing()
+    solver = Parareal(initial(), 1.0, T, wetness, pH, inputs=schedule, slices=10)
+    state = initial()
+    start = state.C + schedule[:solver.length].C.sum()
+    end = solver.coarse(state.copy(), 0)
+    # The decomposed C leaves the stored pools as DOC and CO2, which are removed
+    assert 0 < end.C < start
+    assert np.all(end.C_pools >= 0)
+    # Without decomposition nothing changes
+    assert np.allclose(solver.implicit_step(np.zeros(len(solver.network)), 30.0), np.eye(len(solver.network)))
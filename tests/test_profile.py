@@ -0,0 +1,54 @@
+import numpy as np
+
+import decomp
+
+DOC = decomp.DOC.Id
+
+
+def profiles():
+    batch = decomp.SOMBatch.zeros((2, 4))
+    batch.add_scaled(decomp.leave_litter(), np.array([[5.0, 2.0, 1.0, 0.5], [3.0, 3.0, 3.0, 3.0]]))
+    batch.add_scaled(decomp.pure_DOC(), 0.2)
+    return batch
+
+
+def run(batch, percolation, steps=50):
+    flux = []
+    for i in range(steps):
+        flux.append(batch.integrate_profile(1.0, 10 + 5 * np.sin(i / 5.0), 0.6, 6.0, percolation).copy())
+    return flux
+
+
+def test_leaching_closes_the_profile_balance():
+    batch = profiles()
+    total = batch.C_pools.sum(axis=(-2, -1))
+    flux = run(batch, np.array([0.3, 0.5, 0.2, 0.4]))
+    CO2 = sum(f.C_pools[..., decomp.CO2.Id].sum(axis=-1) for f in flux)
+    leached = sum(f.C_pools[..., -1, DOC] for f in flux)
+    assert np.all(leached > 0)
+    np.testing.assert_allclose(batch.C_pools.sum(axis=(-2, -1)), total - CO2 - leached, rtol=1e-12)
+
+
+def test_ledger_of_each_layer():
+    batch = profiles()
+    ledger = batch.attach_ledger()
+    flux = run(batch, 0.4)
+    ledger.check(batch)
+    # The percolation of a layer is the input of the layer below
+    percolated = sum(f.C_pools[..., DOC] for f in flux)
+    np.testing.assert_allclose(ledger.C_input[..., 1:], percolated[..., :-1], rtol=1e-12)
+    np.testing.assert_allclose(ledger.DOC, percolated, rtol=1e-12)
+    stock = batch.C_pools.sum(axis=-1) - ledger.C_initial
+    np.testing.assert_allclose(ledger.C_input, stock + ledger.CO2 + ledger.DOC, rtol=1e-10, atol=1e-12)
+
+
+def test_no_percolation_gives_independent_layers():
+    batch = profiles()
+    flux = run(batch, 0.0)
+    for f in flux:
+        assert not f.C_pools[..., DOC].any()
+    for position in np.ndindex(batch.shape):
+        layer = profiles()[position][np.newaxis]
+        run(layer, 0.0)
+        np.testing.assert_allclose(batch[position].C_pools, layer.C_pools[0], rtol=1e-12)
+        np.testing.assert_allclose(batch[position].N, layer.N[0], rtol=1e-12)
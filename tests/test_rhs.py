@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+
+import decomp
+from decomp.rhs import FlatRHS
+
+
+def states():
+    batch = decomp.SOMBatch.zeros((4, 2))
+    batch.add_scaled(decomp.leave_litter(), np.arange(1.0, 9.0).reshape(4, 2))
+    batch.add_scaled(decomp.wood_litter(), 2.0)
+    return batch
+
+
+def test_rate_matches_batch():
+    batch = states()
+    T = np.linspace(0, 20, 8).reshape(4, 2)
+    rhs = FlatRHS(batch.shape, T, 0.5, 6.0)
+    rate = rhs.unpack(rhs(0.0, rhs.pack(batch)))
+    expected = batch.dCdt(T, 0.5, 6.0)
+    np.testing.assert_allclose(rate.C_pools, expected.C_pools, rtol=1e-12, atol=1e-15)
+    np.testing.assert_allclose(rate.N, expected.N, rtol=1e-12, atol=1e-15)
+    assert rhs.evaluations == 1
+
+
+def test_pack_unpack():
+    batch = states()
+    rhs = FlatRHS(batch.shape, 10.0, 0.5, 6.0)
+    y = rhs.pack(batch)
+    assert y.shape == (rhs.size,)
+    np.testing.assert_array_equal(rhs.unpack(y).C_pools, batch.C_pools)
+    with pytest.raises(ValueError):
+        rhs.pack(decomp.SOMBatch.zeros((3,)))
+
+
+def test_length_checked():
+    rhs = FlatRHS((3,), 10.0, 0.5, 6.0)
+    with pytest.raises(ValueError):
+        rhs.dydt(np.zeros(rhs.size - 1))
+    from decomp import rhs as module
+    y = np.zeros(rhs.size + 1)
+    assert module._rhs(y.size, rhs._pointer(y), rhs._pointer(np.zeros(y.size)), rhs.user_data) == -1
+
+
+def test_solve_ivp_conserves_carbon():
+    integrate = pytest.importorskip('scipy.integrate')
+    batch = states()
+    rhs = FlatRHS(batch.shape, 15.0, 0.6, 6.0)
+    res = integrate.solve_ivp(rhs, (0, 100), rhs.pack(batch), rtol=1e-8, atol=1e-10)
+    # The outflow stays in the state vector
+    np.testing.assert_allclose(rhs.unpack(res.y[:, -1]).C_pools.sum(axis=-1), batch.C, rtol=1e-6)
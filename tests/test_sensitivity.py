@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+
+import decomp
+from decomp.sensitivity import TangentLinear
+
+PARAMETERS = [('k_pot', decomp.EDC), ('E_a', decomp.LIGN), ('K_w', decomp.CELL), ('m_pH', decomp.RC), 'CNmin']
+
+
+def initial():
+    batch = decomp.SOMBatch.zeros((3,))
+    batch.add_scaled(decomp.leave_litter(), [1.0, 2.0, 5.0])
+    # C/N ratios between CNmin and CNmax
+    batch.N[:] = batch.C / np.array([20.0, 25.0, 30.0])
+    return batch
+
+
+def forcing():
+    days = np.arange(60)
+    return 10 + 8 * np.sin(days / 10.0), 0.4 + 0.3 * np.cos(days / 7.0), 5.5
+
+
+def perturbed(parameter, h):
+    batch = initial()
+    net = batch.network.copy()
+    if parameter == 'CNmin':
+        net.CNmin *= 1 + h
+    else:
+        name, component = parameter
+        getattr(net, name)[component.Id] *= 1 + h
+    batch = decomp.SOMBatch(batch.C_pools, batch.N, net)
+    batch.run(1.0, *forcing())
+    return batch
+
+
+@pytest.mark.parametrize('position', range(len(PARAMETERS)))
+def test_state_derivative_matches_finite_differences(position):
+    tl = TangentLinear(initial(), PARAMETERS)
+    tl.run(1.0, *forcing())
+    parameter = PARAMETERS[position]
+    if parameter == 'CNmin':
+        value = tl.batch.network.CNmin
+    else:
+        value = getattr(tl.batch.network, parameter[0])[parameter[1].Id]
+    h = 1e-6
+    upper, lower = perturbed(parameter, h), perturbed(parameter, -h)
+    dvalue = 2 * h * value
+    np.testing.assert_allclose(tl.state.C_pools[position], (upper.C_pools - lower.C_pools) / dvalue,
+                               rtol=1e-5, atol=1e-9)
+    np.testing.assert_allclose(tl.state.N[position], (upper.N - lower.N) / dvalue, rtol=1e-5, atol=1e-9)
+
+
+def test_flux_matches_batch_run():
+    tl = TangentLinear(initial(), PARAMETERS)
+    flux, dflux = tl.run(1.0, *forcing())
+    reference = initial()
+    expected = reference.run(1.0, *forcing())
+    np.testing.assert_allclose(flux.C_pools, expected.C_pools, rtol=1e-12)
+    np.testing.assert_allclose(tl.batch.C_pools, reference.C_pools, rtol=1e-12)
+    assert dflux.shape == (60, len(PARAMETERS), 3)
@@ -0,0 +1,54 @@
+import numpy as np
+import pytest
+
+import decomp
+
+sharedstate = pytest.importorskip('decomp.sharedstate')
+pytest.importorskip('multiprocessing.shared_memory')
+
+
+class SmallNetwork(decomp.Network):
+    """A network that does not fit the stores"""
+    def __len__(self):
+        return decomp.Network.__len__(self) - 1
+
+
+def fill(batch, T, wetness, pH):
+    batch.add_scaled(decomp.leave_litter(), np.linspace(1.0, 10.0, batch.shape[0]))
+    T[:] = np.linspace(0.0, 20.0, len(T))
+    wetness[:] = 0.6
+    pH[:] = 6.0
+
+
+def test_integrate_parallel_matches_batch():
+    reference = decomp.SOMBatch.zeros((10,))
+    T, wetness, pH = np.zeros(10), np.zeros(10), np.zeros(10)
+    fill(reference, T, wetness, pH)
+    outflow = decomp.SOMBatch.zeros((10,))
+    for _ in range(5):
+        outflow.add_scaled(reference.integrate(1.0, T, wetness, pH), 1.0)
+    with sharedstate.SharedStateStore.create(10) as store:
+        fill(store.batch(), store.T, store.wetness, store.pH)
+        store.integrate_parallel(1.0, steps=5, processes=2)
+        np.testing.assert_allclose(store.C_pools, reference.C_pools, rtol=1e-12)
+        np.testing.assert_allclose(store.N, reference.N, rtol=1e-12)
+        np.testing.assert_allclose(store.outflow_C_pools, outflow.C_pools, rtol=1e-12)
+
+
+def test_failed_attach_keeps_the_store():
+    with sharedstate.SharedStateStore.create(4) as store:
+        with pytest.raises(ValueError):
+            sharedstate.SharedStateStore.attach(store.name, SmallNetwork())
+        other = sharedstate.SharedStateStore.attach(store.name)
+        other.close()
+
+
+def test_failed_owner_frees_the_memory():
+    from multiprocessing import shared_memory
+    store = sharedstate.SharedStateStore.create(4)
+    name, shm = store.name, store.shm
+    store._release()
+    with pytest.raises(ValueError):
+        sharedstate.SharedStateStore(shm, SmallNetwork(), owner=True)
+    with pytest.raises(FileNotFoundError):
+        shared_memory.SharedMemory(name=name)
@@ -0,0 +1,81 @@
+import pickle
+
+import numpy as np
+import pytest
+
+import decomp
+
+
+def test_CN_range_shared():
+    som, other = decomp.leave_litter(), decomp.SOM()
+    assert som.CNmin == decomp.SOM.get_CNmin()
+    try:
+        with pytest.warns(UserWarning):
+            som.CNmin = 12.0
+        with pytest.warns(UserWarning):
+            som.CNmax = 45.0
+        assert (other.CNmin, other.CNmax) == (12.0, 45.0)
+        with pytest.raises(RuntimeError):
+            decomp.SOM.set_CN_range(50.0, 45.0)
+    finally:
+        decomp.SOM.set_CN_range(15.0, 40.0)
+
+
+def test_network_follows_CN_range():
+    net, own = decomp.Network(), decomp.Network(CNmin=10.0)
+    batch = decomp.SOMBatch.zeros((1,), net)
+    batch.add_scaled(decomp.leave_litter(), 1.0)
+    batch.N[:] = batch.C / 30.0
+    try:
+        decomp.SOM.set_CN_range(12.0, 45.0)
+        assert (net.CNmin, net.CNmax) == (12.0, 45.0)
+        assert (own.CNmin, own.CNmax) == (10.0, 45.0)
+        som = batch.to_soms()[0]
+        som_flux = som.integrate(1.0, 15.0, 0.5, 6.0)
+        flux = batch.integrate(1.0, 15.0, 0.5, 6.0)
+        assert flux.N[0] == pytest.approx(som_flux.N, rel=1e-12)
+        # A copy follows the shared range, pickling (eg. for workers) keeps the actual values
+        copied, pickled = net.copy(), pickle.dumps(net)
+        decomp.SOM.set_CN_range(15.0, 40.0)
+        assert copied.CNmin == 15.0
+        assert pickle.loads(pickled).CNmin == 12.0
+        net.CNmax = 42.0
+        assert (net.CNmin, net.CNmax) == (15.0, 42.0)
+    finally:
+        decomp.SOM.set_CN_range(15.0, 40.0)
+
+
+def test_inline_pools():
+    som = decomp.leave_litter()
+    assert len(decomp.SOM.get_pool_types()) <= decomp.SOM.inline_capacity()
+    assert som.nbytes == decomp.SOM().nbytes
+    assert som.nbytes <= 8 * (decomp.SOM.inline_capacity() + 3)
+
+
+def test_integrate_multirate_matches_fine_steps():
+    coarse, fine = decomp.leave_litter() * 10, decomp.leave_litter() * 10
+    coarse.integrate_multirate(1.0, 20.0, 0.6, 6.0, max_turnover=0.001)
+    for _ in range(1000):
+        fine.integrate(1e-3, 20.0, 0.6, 6.0)
+    for pool in decomp.SOM.get_pool_types():
+        if pool.is_stored:
+            assert coarse[pool] == pytest.approx(fine[pool], rel=1e-3, abs=1e-9)
+    assert coarse.N == pytest.approx(fine.N, rel=1e-3)
+
+
+def test_integrate_multirate_without_substeps_is_integrate():
+    multirate, single = decomp.leave_litter() * 10, decomp.leave_litter() * 10
+    rate = multirate.integrate_multirate(1.0, 20.0, 0.6, 6.0, max_turnover=1e300)
+    expected = single.integrate(1.0, 20.0, 0.6, 6.0)
+    np.testing.assert_allclose(multirate.to_array(), single.to_array(), rtol=1e-12)
+    np.testing.assert_allclose(rate.to_array(), expected.to_array(), rtol=1e-12)
+
+
+@pytest.mark.parametrize('max_turnover, substeps', [(1.0, 1), (0.5, 2), (0.1, 8), (0.05, 16), (0.02, 32)])
+def test_multirate_substeps_are_powers_of_two(max_turnover, substeps):
+    # EDC at 20°C decomposes 57% per day, the products are other components
+    r = decomp.EDC.decomp(20.0, 0.6, 6.0)
+    assert decomp.SOMBatch.substeps(r, max_turnover) == substeps
+    som = decomp.SOM(0.05, 1.0)
+    som.integrate_multirate(1.0, 20.0, 0.6, 6.0, max_turnover=max_turnover)
+    assert som[decomp.EDC] == pytest.approx((1 - r / substeps) ** substeps, rel=1e-12)
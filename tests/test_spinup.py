@@ -0,0 +1,69 @@
+import warnings
+
+import numpy as np
+import pytest
+
+import decomp
+from decomp.spinup import spinup, SpinupCache, SpinupWarning
+
+
+SETTINGS = dict(tolerance=1e-3, max_turnover=0.1)
+
+
+def initial():
+    batch = decomp.SOMBatch.zeros((3,))
+    batch.add_scaled(decomp.leave_litter(), [1.0, 2.0, 3.0])
+    # A fast recalcitrant pool converges in a few cycles
+    batch.network = batch.network.copy()
+    batch.network.k_pot[decomp.RC.Id] *= 100
+    return batch
+
+
+def cycle():
+    days = np.arange(0.0, 365.0, 5.0)
+    inputs = decomp.SOMBatch.zeros((len(days), 3))
+    inputs.add_scaled(decomp.leave_litter(), np.where(days == 270.0, 1.0, 0.0)[:, np.newaxis])
+    return 5.0, 15 - 10 * np.cos(days / 365 * 2 * np.pi), 0.6, 6.0, inputs
+
+
+def test_spinup_converges():
+    batch = initial()
+    with warnings.catch_warnings():
+        warnings.simplefilter('error', SpinupWarning)
+        cycles = spinup(batch, *cycle(), **SETTINGS)
+    C = batch.C
+    batch.run(*cycle()[:-1], inputs=cycle()[-1], max_turnover=0.1)
+    assert cycles > 1
+    np.testing.assert_allclose(batch.C, C, rtol=1e-3)
+
+
+def test_spinup_warns_without_convergence():
+    with pytest.warns(SpinupWarning):
+        assert spinup(initial(), *cycle(), max_cycles=2, **SETTINGS) == 2
+
+
+def test_cache(tmp_path):
+    cache = SpinupCache(str(tmp_path))
+    first = cache.spinup(initial(), *cycle(), **SETTINGS)
+    second = cache.spinup(initial(), *cycle(), **SETTINGS)
+    assert (cache.hits, cache.misses) == (1, 1)
+    np.testing.assert_array_equal(first.C_pools, second.C_pools)
+    # Another parameter is another entry
+    batch = initial()
+    batch.network.k_pot[decomp.EDC.Id] *= 2
+    cache.spinup(batch, *cycle(), **SETTINGS)
+    assert cache.misses == 2 and len(cache.entries()) == 2
+
+
+def test_cache_skips_unconverged(tmp_path):
+    cache = SpinupCache(str(tmp_path))
+    with pytest.warns(SpinupWarning):
+        cache.spinup(initial(), *cycle(), max_cycles=2, **SETTINGS)
+    assert cache.entries() == []
+
+
+def test_key_depends_on_version(monkeypatch):
+    from decomp import spinup as module
+    key = SpinupCache.key(initial(), *cycle())
+    monkeypatch.setattr(module, '__version__', '0.0.1')
+    assert SpinupCache.key(initial(), *cycle()) != key
@@ -0,0 +1,49 @@
+import numpy as np
+
+import decomp
+from decomp.store import MappedStateStore
+
+
+def reference_run(C_pools, N, T, wetness, pH, dt=1.0):
+    batch = decomp.SOMBatch(C_pools.copy(), N.copy())
+    outflow = decomp.SOMBatch.zeros(batch.shape)
+    for i in range(len(T)):
+        outflow.add_scaled(batch.integrate(dt, T[i], wetness[i], pH[i]), dt)
+    return batch, outflow
+
+
+def test_integrate_tiled_matches_batch(tmp_path):
+    shape, steps = (6, 3), 8
+    rng = np.random.RandomState(1)
+    T = rng.uniform(0, 20, (steps,) + shape)
+    wetness = rng.uniform(0.2, 0.8, (steps,) + shape)
+    pH = np.full((steps,) + shape, 6.0)
+    path = str(tmp_path / 'test.som')
+    with MappedStateStore.create(path, shape) as store:
+        # The last two rows are empty and are skipped
+        store.batch(slice(0, 4)).add_scaled(decomp.leave_litter(), rng.uniform(1, 10, (4, 3)))
+        C_pools, N = store.C_pools.copy(), store.N.copy()
+        written = store.integrate_tiled(1.0, T=T, wetness=wetness, pH=pH, tile_size=2)
+    assert written == 2
+    expected, outflow = reference_run(C_pools, N, T, wetness, pH)
+    with MappedStateStore(path, mode='r') as store:
+        np.testing.assert_allclose(store.C_pools, expected.C_pools, rtol=1e-12)
+        np.testing.assert_allclose(store.N, expected.N, rtol=1e-12)
+        np.testing.assert_allclose(store.outflow_C_pools, outflow.C_pools, rtol=1e-12)
+        np.testing.assert_allclose(store.outflow_N, outflow.N, rtol=1e-12)
+        assert not store.C_pools[4:].any()
+
+
+def test_integrate_uses_stored_forcing(tmp_path):
+    path = str(tmp_path / 'test.som')
+    with MappedStateStore.create(path, 4) as store:
+        store.batch().add_scaled(decomp.leave_litter(), 5.0)
+        store.T[:] = [0, 5, 10, 15]
+        store.wetness[:] = 0.5
+        store.pH[:] = 6.5
+        C_pools, N = store.C_pools.copy(), store.N.copy()
+        forcing = [np.array([f.copy()] * 3) for f in store.forcing()]
+        store.integrate(1.0, steps=3)
+        expected, outflow = reference_run(C_pools, N, *forcing)
+        np.testing.assert_allclose(store.C_pools, expected.C_pools, rtol=1e-12)
+        np.testing.assert_allclose(store.outflow_N, outflow.N, rtol=1e-12)
@@ -0,0 +1,63 @@
+import numpy as np
+
+from decomp import temperature
+
+
+def test_solve_tridiagonal():
+    rng = np.random.RandomState(0)
+    lower, upper = rng.uniform(-1, 0, (2, 3, 6))
+    diag = 3 + rng.uniform(0, 1, (3, 6))
+    rhs = rng.uniform(-5, 5, (3, 6))
+    x = temperature.solve_tridiagonal(lower, diag, upper, rhs)
+    for i in range(3):
+        A = np.diag(diag[i]) + np.diag(lower[i, 1:], -1) + np.diag(upper[i, :-1], 1)
+        np.testing.assert_allclose(x[i], np.linalg.solve(A, rhs[i]))
+
+
+def test_heat_conduction_steady_state():
+    thickness = np.array([0.05, 0.1, 0.1, 0.25, 0.5])
+    model = temperature.HeatConduction(thickness, diffusivity=0.05, T_bottom=10.0)
+    T = np.zeros((2, 5))
+    for _ in range(200):
+        model(20.0, T, dt=10.0)
+    # Linear between the surface and the lower boundary
+    centre = np.cumsum(thickness) - 0.5 * thickness
+    np.testing.assert_allclose(T, np.broadcast_to(20 - 10 * centre / thickness.sum(), T.shape), rtol=1e-8)
+
+
+def test_heat_conduction_damped_wave():
+    # Daily temperature wave into a deep soil: A exp(-z/d) sin(w t - z/d), d = sqrt(2 K / w)
+    K, w, dt = 0.05, 2 * np.pi, 1 / 192
+    thickness = np.full(150, 0.01)
+    centre = np.cumsum(thickness) - 0.005
+    model = temperature.HeatConduction(thickness, diffusivity=K)
+    T = np.zeros(150)
+    times = np.arange(0, 6, dt)
+    for t in times:
+        model(10 * np.sin(w * (t + dt)), T, dt)
+    d = np.sqrt(2 * K / w)
+    t = times[-1] + dt
+    expected = 10 * np.exp(-centre / d) * np.sin(w * t - centre / d)
+    np.testing.assert_allclose(T[centre < 0.3], expected[centre < 0.3], atol=0.15)
+
+
+def test_damped_amplitude_and_lag():
+    upper_boundary = np.array([0.0, 0.1, 0.3, 0.6])
+    model = temperature.DampedTemperature(upper_boundary, T_depth=2.0)
+    T = np.zeros(4)
+    days = np.arange(3 * 365)
+    series = []
+    for day in days:
+        series.append(model(10 * np.sin(2 * np.pi * day / 365), T).copy())
+    last = np.array(series[-365:])
+    amplitude = 0.5 * (last.max(axis=0) - last.min(axis=0))
+    peak = last.argmax(axis=0)
+    # The top layer follows the air, deeper layers are damped and lag behind
+    assert amplitude[0] == np.max(amplitude) and abs(amplitude[0] - 10) < 1e-3
+    assert np.all(np.diff(amplitude) < 0)
+    assert np.all(np.diff(peak) > 0)
+
+
+def test_damped_factor():
+    T = temperature.damped(10.0, np.array([0.0, 0.0]), np.array([0.0, 1.0]), T_depth=2.0)
+    np.testing.assert_allclose(T, [10.0, 10 * 365 ** -0.5])
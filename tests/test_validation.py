@@ -0,0 +1,51 @@
+import pytest
+
+import decomp
+from decomp import validation
+
+
+def test_paths_agree():
+    results = validation.Harness(states=50, steps=5).check()
+    assert all(r.passed for r in results)
+
+
+def test_random_network():
+    validation.Harness(states=50, steps=5, seed=1, random_network=True).check()
+
+
+def test_deviating_path_detected():
+    harness = validation.Harness(states=20, steps=3)
+
+    def shifted(case):
+        state, outflow = harness.outputs['SOMBatch.integrate']
+        state = state.copy()
+        state.N *= 1.01
+        return state, outflow
+    harness.add_path('shifted', shifted, 'SOMBatch.integrate')
+    with pytest.raises(validation.ValidationError):
+        harness.check()
+
+
+def test_main(capsys):
+    assert validation.main(['--states', '10', '--steps', '2']) == 0
+    assert 'SOMBatch.run' in capsys.readouterr().out
+
+
+def test_add_component_restores_the_network():
+    names = decomp.Network().names
+    results = validation.Harness(states=20, steps=3, add_component=True).check()
+    assert all(r.passed for r in results)
+    assert decomp.Network().names == names
+    assert decomp.SOM().to_array().shape == (len(names) + 1,)
+
+
+def test_component_added_is_removed_after_an_error():
+    names = decomp.Network().names
+    with pytest.raises(ZeroDivisionError):
+        with validation.component_added('TEST'):
+            assert decomp.Network().names == names + ['TEST']
+            1 / 0
+    assert decomp.Network().names == names
+    # Only the last added component can be removed
+    with pytest.raises(RuntimeError):
+        decomp.SOM.remove_component('CO_2')